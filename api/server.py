@@ -26,6 +26,13 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
+# `python api/server.py`로 실행해도 src 패키지를 찾도록 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.storage.pool import ConnectionPool, get_pool, close_pools
+from src.storage.schema import ANALYZED_CONDITION, ensure_schema
+from src.storage.search import match_filter, search_strategies as fts_search
+
 import re
 
 # ============================================================
@@ -143,6 +150,19 @@ class StrategyItem(BaseModel):
     overfitting_score: Optional[float] = None
 
 
+class SearchResultItem(BaseModel):
+    """전문 검색 결과 아이템"""
+
+    script_id: str
+    title: str
+    author: str
+    likes: int
+    total_score: Optional[float] = None
+    grade: Optional[str] = None
+    rank: Optional[float] = None
+    snippet: Optional[str] = None
+
+
 class StrategyDetail(BaseModel):
     """전략 상세 정보"""
 
@@ -311,35 +331,12 @@ DATA_DIR = BASE_DIR / "data"
 
 
 def init_db():
-    """데이터베이스 초기화 (파일이 없는 경우)"""
+    """데이터베이스 초기화 및 마이그레이션 (StrategyDatabase와 같은 스키마)"""
     if not DB_PATH.exists():
         print(f"Initializing database at {DB_PATH}")
         DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(DB_PATH))
-        cur = conn.cursor()
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS strategies (
-                script_id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                author TEXT NOT NULL,
-                likes INTEGER DEFAULT 0,
-                views INTEGER DEFAULT 0,
-                pine_code TEXT,
-                pine_version INTEGER DEFAULT 5,
-                performance_json TEXT,
-                analysis_json TEXT,
-                script_url TEXT,
-                description TEXT,
-                is_open_source BOOLEAN DEFAULT 0,
-                category TEXT DEFAULT 'strategy',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_likes ON strategies(likes DESC)")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_author ON strategies(author)")
-        conn.commit()
-        conn.close()
+    with get_pool(DB_PATH).writer() as conn:
+        ensure_schema(conn)
 
 
 @app.on_event("startup")
@@ -348,15 +345,29 @@ async def startup_event():
     init_db()
 
 
-def get_db():
-    """데이터베이스 연결"""
-    if not DB_PATH.exists():
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 연결 풀 정리"""
+    close_pools()
+
+
+_schema_ready = False
+
+
+def get_db() -> ConnectionPool:
+    """
+    데이터베이스 연결 풀 (StrategyDatabase와 공유)
+
+    쿼리는 풀의 스레드에서 실행되므로 핸들러에서는
+    `await get_db().fetchall(...)` / `run_read(...)` 형태로 사용합니다.
+    """
+    global _schema_ready
+    if not _schema_ready or not DB_PATH.exists():
         init_db()
+        _schema_ready = True
 
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        conn.row_factory = sqlite3.Row
-        return conn
+        return get_pool(DB_PATH)
     except sqlite3.Error as e:
         raise HTTPException(
             status_code=500, detail=f"Database connection error: {str(e)}"
@@ -375,25 +386,6 @@ def parse_json_field(value: Any) -> Optional[dict]:
         return None
 
 
-def extract_analysis_data(analysis_json: str) -> dict:
-    """analysis_json에서 점수 및 등급 추출"""
-    analysis = parse_json_field(analysis_json)
-    if not analysis:
-        return {
-            "total_score": None,
-            "grade": None,
-            "repainting_score": None,
-            "overfitting_score": None,
-        }
-
-    return {
-        "total_score": analysis.get("total_score"),
-        "grade": analysis.get("grade"),
-        "repainting_score": analysis.get("repainting_score"),
-        "overfitting_score": analysis.get("overfitting_score"),
-    }
-
-
 # ============================================================
 # API Endpoints
 # ============================================================
@@ -415,52 +407,31 @@ async def health_check(request: Request):
 async def get_stats(request: Request):
     """통계 정보 조회"""
     try:
-        conn = get_db()
-        cur = conn.cursor()
+        return await get_db().run_read(_query_stats)
 
-        # 총 전략 수
-        cur.execute("SELECT COUNT(*) FROM strategies")
-        total = cur.fetchone()[0]
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
-        # analysis_json이 있는 항목 수 (분석 완료)
-        cur.execute(
-            "SELECT COUNT(*) FROM strategies WHERE analysis_json IS NOT NULL AND analysis_json != ''"
-        )
-        analyzed = cur.fetchone()[0]
 
-        # 모든 분석된 전략의 analysis_json 가져와서 통계 계산
-        cur.execute(
-            "SELECT analysis_json FROM strategies WHERE analysis_json IS NOT NULL AND analysis_json != ''"
-        )
-        rows = cur.fetchall()
-        conn.close()
-
-        passed = 0
-        total_score_sum = 0
-        score_count = 0
-
-        for row in rows:
-            data = extract_analysis_data(row[0])
-            grade = data.get("grade")
-            score = data.get("total_score")
-
-            if grade in ("A", "B"):
-                passed += 1
-            if score is not None:
-                total_score_sum += score
-                score_count += 1
-
-        avg_score = total_score_sum / score_count if score_count > 0 else 0
-
-        return StatsResponse(
-            total_strategies=total,
-            analyzed_count=analyzed,
-            passed_count=passed,
-            avg_score=round(avg_score, 1),
-        )
+def _query_stats(conn: sqlite3.Connection) -> StatsResponse:
+    """통계 계산 (연결 풀 스레드에서 실행, 구체화 컬럼 집계)"""
+    row = conn.execute(
+        f"""
+        SELECT
+            COUNT(*) as total,
+            SUM(CASE WHEN {ANALYZED_CONDITION} THEN 1 ELSE 0 END) as analyzed,
+            SUM(CASE WHEN grade IN ('A', 'B') AND {ANALYZED_CONDITION} THEN 1 ELSE 0 END) as passed,
+            AVG(CASE WHEN {ANALYZED_CONDITION} THEN total_score END) as avg_score
+        FROM strategies
+        """
+    ).fetchone()
 
-    except sqlite3.Error as e:
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    return StatsResponse(
+        total_strategies=row["total"] or 0,
+        analyzed_count=row["analyzed"] or 0,
+        passed_count=row["passed"] or 0,
+        avg_score=round(row["avg_score"] or 0, 1),
+    )
 
 
 @app.get("/api/strategies", response_model=List[StrategyItem])
@@ -472,74 +443,126 @@ async def get_strategies(
     min_score: float = Query(0, ge=0, le=100, description="최소 점수"),
     grade: Optional[str] = Query(None, description="등급 필터 (A, B, C, D, F)"),
     search: Optional[str] = Query(None, description="검색어 (제목, 작성자)"),
-    sort_by: str = Query("likes", description="정렬 기준 (likes, title)"),
+    sort_by: str = Query(
+        "likes", description="정렬 기준 (likes, title, created_at, score, backtest_return, backtest_sharpe)"
+    ),
     sort_order: str = Query("desc", description="정렬 순서 (asc, desc)"),
 ):
     """전략 목록 조회"""
     try:
-        conn = get_db()
-        cur = conn.cursor()
-
-        # 기본 쿼리 - analysis_json이 있는 전략만
-        query = """
-            SELECT script_id, title, author, likes, analysis_json
-            FROM strategies
-            WHERE analysis_json IS NOT NULL AND analysis_json != ''
-        """
-        params: List = []
-
-        # 검색 (입력값 sanitize 적용)
-        if search:
-            sanitized_search = sanitize_input(search, max_length=100)
-            if sanitized_search:
-                query += " AND (title LIKE ? OR author LIKE ?)"
-                params.extend([f"%{sanitized_search}%", f"%{sanitized_search}%"])
-
-        # 정렬 (DB 컬럼 기준)
-        valid_columns = ["likes", "title", "created_at"]
-        if sort_by not in valid_columns:
-            sort_by = "likes"
-        order = "DESC" if sort_order.lower() == "desc" else "ASC"
-        query += f" ORDER BY {sort_by} {order}"
-
-        cur.execute(query, params)
-        rows = cur.fetchall()
-        conn.close()
-
-        # 결과 가공 (JSON 파싱 + 필터링)
-        results = []
-        for row in rows:
-            data = extract_analysis_data(row["analysis_json"])
-            total_score = data.get("total_score") or 0
-            strategy_grade = data.get("grade")
-
-            # 필터 적용
-            if total_score < min_score:
-                continue
-            if grade and strategy_grade != grade:
-                continue
-
-            results.append(
-                StrategyItem(
-                    script_id=row["script_id"],
-                    title=row["title"] or "",
-                    author=row["author"] or "",
-                    likes=row["likes"] or 0,
-                    total_score=data.get("total_score"),
-                    grade=strategy_grade,
-                    repainting_score=data.get("repainting_score"),
-                    overfitting_score=data.get("overfitting_score"),
-                )
-            )
+        return await get_db().run_read(
+            _query_strategies, limit, offset, min_score, grade, search, sort_by, sort_order
+        )
+
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
+def _query_strategies(
+    conn: sqlite3.Connection,
+    limit: int,
+    offset: int,
+    min_score: float,
+    grade: Optional[str],
+    search: Optional[str],
+    sort_by: str,
+    sort_order: str,
+) -> List[StrategyItem]:
+    """전략 목록 조회 (연결 풀 스레드에서 실행, 필터/정렬/페이징 모두 SQL)"""
+    # 기본 쿼리 - analysis_json이 있는 전략만
+    query = f"""
+        SELECT script_id, title, author, likes, total_score, grade,
+               repainting_score, overfitting_score
+        FROM strategies
+        WHERE {ANALYZED_CONDITION}
+    """
+    params: List = []
+
+    # 검색 (입력값 sanitize 적용, 전문 검색 인덱스)
+    if search:
+        sanitized_search = sanitize_input(search, max_length=100)
+        if sanitized_search:
+            where, where_params = match_filter(conn, sanitized_search, ("title", "author"))
+            query += where
+            params.extend(where_params)
+
+    # 점수 / 등급 필터
+    if min_score > 0:
+        query += " AND total_score >= ?"
+        params.append(min_score)
+    if grade:
+        query += " AND grade = ?"
+        params.append(grade)
+
+    # 정렬 (점수 동률은 좋아요 순)
+    sort_columns = {
+        "likes": "likes",
+        "title": "title",
+        "created_at": "created_at",
+        "score": "total_score",
+        "total_score": "total_score",
+        "backtest_return": "backtest_return",
+        "backtest_sharpe": "backtest_sharpe",
+    }
+    column = sort_columns.get(sort_by, "likes")
+    order = "DESC" if sort_order.lower() == "desc" else "ASC"
+    query += f" ORDER BY {column} {order}"
+    if column != "likes":
+        query += f", likes {order}"
+
+    # 페이징
+    query += " LIMIT ? OFFSET ?"
+    params.extend([limit, offset])
+
+    return [
+        StrategyItem(
+            script_id=row["script_id"],
+            title=row["title"] or "",
+            author=row["author"] or "",
+            likes=row["likes"] or 0,
+            total_score=row["total_score"],
+            grade=row["grade"],
+            repainting_score=row["repainting_score"],
+            overfitting_score=row["overfitting_score"],
+        )
+        for row in conn.execute(query, params)
+    ]
 
-        # 점수 기준 정렬 (클라이언트 요청 시)
-        if sort_by == "score" or sort_by == "total_score":
-            results.sort(
-                key=lambda x: x.total_score or 0, reverse=(sort_order.lower() == "desc")
-            )
 
-        # 페이징
-        return results[offset : offset + limit]
+@app.get("/api/search", response_model=List[SearchResultItem])
+@limiter.limit("30/minute")
+async def search_strategies(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (접두어 검색)"),
+    limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+    offset: int = Query(0, ge=0, description="오프셋"),
+    include_code: bool = Query(False, description="Pine 코드 식별자까지 검색"),
+):
+    """
+    전략 전문 검색
+
+    제목/작성자/설명(선택적으로 Pine 코드)을 BM25 관련도 순으로 검색하고
+    일치 구간을 <mark>로 강조한 스니펫을 함께 반환합니다.
+    """
+    sanitized = sanitize_input(q, max_length=100)
+    if not sanitized:
+        return []
+
+    try:
+        rows = await get_db().run_read(fts_search, sanitized, limit, offset, include_code)
+        return [
+            SearchResultItem(
+                script_id=row["script_id"],
+                title=row["title"] or "",
+                author=row["author"] or "",
+                likes=row["likes"] or 0,
+                total_score=row["total_score"],
+                grade=row["grade"],
+                rank=row["rank"],
+                snippet=row["snippet"],
+            )
+            for row in rows
+        ]
 
     except sqlite3.Error as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -553,12 +576,9 @@ async def get_strategy_detail(request: Request, script_id: str):
     script_id = validate_script_id(script_id)
 
     try:
-        conn = get_db()
-        cur = conn.cursor()
-
-        cur.execute("SELECT * FROM strategies WHERE script_id = ?", [script_id])
-        row = cur.fetchone()
-        conn.close()
+        row = await get_db().fetchone(
+            "SELECT * FROM strategies WHERE script_id = ?", [script_id]
+        )
 
         if not row:
             raise HTTPException(status_code=404, detail="Strategy not found")
@@ -566,17 +586,16 @@ async def get_strategy_detail(request: Request, script_id: str):
         # JSON 필드 파싱
         performance = parse_json_field(row["performance_json"])
         analysis = parse_json_field(row["analysis_json"])
-        analysis_data = extract_analysis_data(row["analysis_json"])
 
         return StrategyDetail(
             script_id=row["script_id"],
             title=row["title"] or "",
             author=row["author"] or "",
             likes=row["likes"] or 0,
-            total_score=analysis_data.get("total_score"),
-            grade=analysis_data.get("grade"),
-            repainting_score=analysis_data.get("repainting_score"),
-            overfitting_score=analysis_data.get("overfitting_score"),
+            total_score=row["total_score"],
+            grade=row["grade"],
+            repainting_score=row["repainting_score"],
+            overfitting_score=row["overfitting_score"],
             pine_code=row["pine_code"],
             pine_version=row["pine_version"],
             performance=performance,
@@ -824,14 +843,9 @@ async def get_backtest_result(request: Request, script_id: str):
     script_id = validate_script_id(script_id)
 
     try:
-        conn = get_db()
-        cur = conn.cursor()
-
-        cur.execute(
+        row = await get_db().fetchone(
             "SELECT analysis_json FROM strategies WHERE script_id = ?", [script_id]
         )
-        row = cur.fetchone()
-        conn.close()
 
         if not row:
             raise HTTPException(status_code=404, detail="Strategy not found")
@@ -18,12 +18,13 @@ Usage:
 import argparse
 import sqlite3
 import json
-import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import sys
 
+from src.analyzer.rule_based.pattern_scanner import get_scanner
+
 # Paths
 DB_PATH = "/Users/mr.joo/Desktop/전략연구소/strategy-research-lab/data/strategies.db"
 ANALYSIS_RESULTS = "/Users/mr.joo/Desktop/전략연구소/c_grade_analysis_results.json"
@@ -50,6 +51,31 @@ BATCH_2_IDS = [
     "EtN6uzq9-Apex-Trend-Liquidity-Master-V2-1",
 ]
 
+# Indicator / signal patterns (compiled once in the shared rule-based scanner)
+INDICATOR_PATTERNS = {
+    'sma': r'ta\.sma\([^)]+\)',
+    'ema': r'ta\.ema\([^)]+\)',
+    'rsi': r'ta\.rsi\([^)]+\)',
+    'macd': r'ta\.macd\([^)]+\)',
+    'atr': r'ta\.atr\([^)]+\)',
+    'bollinger': r'ta\.bb[^(]*\([^)]+\)',
+    'vwap': r'ta\.vwap\([^)]+\)',
+    'vwma': r'ta\.vwma\([^)]+\)',
+    'stochastic': r'ta\.stoch\([^)]+\)',
+    'adx': r'ta\.adx\([^)]+\)',
+    'cci': r'ta\.cci\([^)]+\)',
+    'mfi': r'ta\.mfi\([^)]+\)',
+    'obv': r'ta\.obv\([^)]+\)',
+    'pivot': r'ta\.pivot(high|low)\([^)]+\)',
+}
+LONG_COMPARISON_PATTERNS = [r'close\s*>\s*', r'>\s*close']
+SHORT_COMPARISON_PATTERNS = [r'close\s*<\s*', r'<\s*close']
+
+for _indicator, _pattern in INDICATOR_PATTERNS.items():
+    get_scanner().register(f"indicator.{_indicator}", [_pattern])
+get_scanner().register("signal.long", LONG_COMPARISON_PATTERNS)
+get_scanner().register("signal.short", SHORT_COMPARISON_PATTERNS)
+
 
 class PineScriptAnalyzer:
     """Analyze Pine Script to extract indicators and logic"""
@@ -74,26 +100,9 @@ class PineScriptAnalyzer:
             'pivot': [],
         }
 
-        # Pattern matching for each indicator
-        patterns = {
-            'sma': r'ta\.sma\([^)]+\)',
-            'ema': r'ta\.ema\([^)]+\)',
-            'rsi': r'ta\.rsi\([^)]+\)',
-            'macd': r'ta\.macd\([^)]+\)',
-            'atr': r'ta\.atr\([^)]+\)',
-            'bollinger': r'ta\.bb[^(]*\([^)]+\)',
-            'vwap': r'ta\.vwap\([^)]+\)',
-            'vwma': r'ta\.vwma\([^)]+\)',
-            'stochastic': r'ta\.stoch\([^)]+\)',
-            'adx': r'ta\.adx\([^)]+\)',
-            'cci': r'ta\.cci\([^)]+\)',
-            'mfi': r'ta\.mfi\([^)]+\)',
-            'obv': r'ta\.obv\([^)]+\)',
-            'pivot': r'ta\.pivot(high|low)\([^)]+\)',
-        }
-
-        for indicator, pattern in patterns.items():
-            matches = re.findall(pattern, pine_code)
+        scan = get_scanner().scan(pine_code)
+        for indicator, pattern in INDICATOR_PATTERNS.items():
+            matches = scan.findall(f"indicator.{indicator}", pattern)
             if matches:
                 indicators[indicator] = matches
 
@@ -120,11 +129,12 @@ class PineScriptAnalyzer:
             signals['short_conditions'].append('crossunder detected')
 
         # Check for comparisons
-        if re.search(r'close\s*>\s*', pine_code) or re.search(r'>\s*close', pine_code):
+        scan = get_scanner().scan(pine_code)
+        if any(scan.has("signal.long", pattern) for pattern in LONG_COMPARISON_PATTERNS):
             signals['uses_comparison'] = True
             signals['long_conditions'].append('price comparison')
 
-        if re.search(r'close\s*<\s*', pine_code) or re.search(r'<\s*close', pine_code):
+        if any(scan.has("signal.short", pattern) for pattern in SHORT_COMPARISON_PATTERNS):
             signals['uses_comparison'] = True
             signals['short_conditions'].append('price comparison')
 
@@ -19,6 +19,8 @@ from typing import Dict, List, Optional
 import requests
 import numpy as np
 
+from src.trading.indicators import EMA, RSI, IndicatorSet, load_snapshots, save_snapshots
+
 try:
     import ccxt.async_support as ccxt
     CCXT_AVAILABLE = True
@@ -87,6 +89,7 @@ class Config:
     # 봇 설정
     CHECK_INTERVAL: int = 60
     CANDLE_LIMIT: int = 100
+    INDICATOR_STATE_FILE: str = ".indicator_state_multibot.json"  # 심볼별 증분 지표 상태
 
     # 텔레그램 알림
     TELEGRAM_BOT_TOKEN: str = field(default_factory=lambda: os.getenv('TELEGRAM_BOT_TOKEN', ''))
@@ -195,20 +198,41 @@ class TradingStrategy:
     def __init__(self, config: Config):
         self.config = config
         self.indicators = TechnicalIndicators()
+        # 심볼별 증분 지표 상태 - 매 틱 새로 확정된 봉만 반영
+        self.states: Dict[str, IndicatorSet] = {}
+        self._saved_states = load_snapshots(config.INDICATOR_STATE_FILE)
+
+    def _state(self, symbol: str) -> IndicatorSet:
+        if symbol not in self.states:
+            state = IndicatorSet(
+                ema_fast=EMA(self.config.EMA_FAST),
+                ema_slow=EMA(self.config.EMA_SLOW),
+                rsi=RSI(self.config.RSI_PERIOD, method="sma"),
+            )
+            if symbol in self._saved_states:
+                state.restore(self._saved_states[symbol])
+            self.states[symbol] = state
+        return self.states[symbol]
+
+    def save_states(self):
+        """심볼별 지표 상태 저장 (재시작 시 복원)"""
+        try:
+            save_snapshots(self.config.INDICATOR_STATE_FILE, self.states)
+        except OSError as e:
+            logger.warning(f"지표 상태 저장 실패: {e}")
 
-    def analyze(self, candles: List[Dict], current_position: Optional[Position] = None) -> Dict:
+    def analyze(self, candles: List[Dict], current_position: Optional[Position] = None,
+                symbol: str = "default") -> Dict:
         if len(candles) < self.config.EMA_SLOW + self.config.RSI_PERIOD:
             return {'action': 'hold', 'reason': '데이터 부족', 'confidence': 0}
 
-        closes = np.array([c['close'] for c in candles])
-        current_price = closes[-1]
+        current_price = candles[-1]['close']
 
-        ema_fast = self.indicators.ema(closes, self.config.EMA_FAST)
-        ema_slow = self.indicators.ema(closes, self.config.EMA_SLOW)
-        rsi = self.indicators.rsi(closes, self.config.RSI_PERIOD)
+        prev, now = self._state(symbol).evaluate(candles)
+        rsi = now['rsi']
 
-        ema_fast_now, ema_slow_now = ema_fast[-1], ema_slow[-1]
-        ema_fast_prev, ema_slow_prev = ema_fast[-2], ema_slow[-2]
+        ema_fast_now, ema_slow_now = now['ema_fast'], now['ema_slow']
+        ema_fast_prev, ema_slow_prev = prev['ema_fast'], prev['ema_slow']
         trend_strength = abs(ema_fast_now - ema_slow_now) / current_price * 100
 
         signal = {
@@ -489,7 +513,7 @@ class MultiBotSystem:
 
             candles = await self.exchange.get_candles(symbol, self.config.CANDLE_LIMIT)
             position = self.positions.get(symbol)
-            signal = self.strategy.analyze(candles, position)
+            signal = self.strategy.analyze(candles, position, symbol)
 
             action = signal.get('action', 'hold')
             reason = signal.get('reason', '')
@@ -580,6 +604,7 @@ class MultiBotSystem:
                 # 모든 심볼 동시 처리
                 tasks = [self.process_symbol(symbol) for symbol in self.config.SYMBOLS]
                 await asyncio.gather(*tasks)
+                self.strategy.save_states()
 
                 await asyncio.sleep(self.config.CHECK_INTERVAL)
 
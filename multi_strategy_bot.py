@@ -19,7 +19,6 @@ from decimal import Decimal, ROUND_DOWN
 from enum import Enum
 from typing import Dict, List, Optional, Callable
 import requests
-import numpy as np
 
 try:
     import ccxt.async_support as ccxt
@@ -51,6 +50,10 @@ except ImportError:
     SAFEGUARDS_AVAILABLE = False
     print("Warning: live_safeguards not available. Running without safeguards.")
 
+# 공유 캔들 캐시 (전략 수와 무관하게 심볼/타임프레임당 한 번만 조회)
+from src.trading.market_data import MarketDataHub, CandleView
+from src.trading.indicators import EMA, RSI, IndicatorSet, load_snapshots, save_snapshots
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -105,6 +108,8 @@ class Config:
     # 봇 설정
     CHECK_INTERVAL: int = 60
     CANDLE_LIMIT: int = 100
+    CANDLE_MAX_AGE: int = 30  # 같은 봉 안에서 캔들 재조회 간격 (초, 진행 중인 봉 현재가 갱신용)
+    INDICATOR_STATE_FILE: str = ".indicator_state.json"  # 증분 지표 상태 (재시작 시 복원)
 
     # 텔레그램
     TELEGRAM_BOT_TOKEN: str = field(default_factory=lambda: os.getenv('TELEGRAM_BOT_TOKEN', ''))
@@ -214,6 +219,9 @@ class StrategyManager:
         self.config = config
         self.base_url = config.STRATEGY_API_URL
         self.current_strategies: Dict[str, StrategyInfo] = {}
+        # 전략별 증분 지표 상태 (key: script_id)
+        self.indicator_sets: Dict[str, IndicatorSet] = {}
+        self._saved_indicator_states = load_snapshots(config.INDICATOR_STATE_FILE)
 
     def fetch_top_strategies(self) -> List[StrategyInfo]:
         """API에서 상위 N개 전략 조회"""
@@ -276,6 +284,7 @@ class StrategyManager:
         for strategy in updates['removed']:
             if strategy.script_id in self.current_strategies:
                 del self.current_strategies[strategy.script_id]
+                self.indicator_sets.pop(strategy.script_id, None)
                 logger.info(f"전략 제거: {strategy.title} ({strategy.score}점)")
 
         # 추가
@@ -284,6 +293,13 @@ class StrategyManager:
             self.current_strategies[strategy.script_id] = strategy
             logger.info(f"전략 추가: {strategy.title} ({strategy.score}점)")
 
+    def save_indicator_states(self):
+        """전략별 증분 지표 상태 저장"""
+        try:
+            save_snapshots(self.config.INDICATOR_STATE_FILE, self.indicator_sets)
+        except OSError as e:
+            logger.warning(f"지표 상태 저장 실패: {e}")
+
     def _create_signal_generator(self, strategy: StrategyInfo) -> Callable:
         """전략별 시그널 생성 함수 생성"""
         # TODO: Pine Script → Python 변환된 코드 로드
@@ -303,40 +319,27 @@ class StrategyManager:
             ema_fast, ema_slow = 7, 18
             rsi_ob, rsi_os = 75, 25
 
-        def generate_signal(candles: List[Dict], position: Optional[Position] = None) -> Dict:
+        # 증분 지표 - 새로 확정된 봉만 반영 (RSI는 기존과 같은 단순평균 방식)
+        indicators = IndicatorSet(
+            ema_fast=EMA(ema_fast), ema_slow=EMA(ema_slow), rsi=RSI(14, method="sma")
+        )
+        saved = self._saved_indicator_states.get(strategy.script_id)
+        if saved and indicators.restore(saved):
+            logger.info(f"[{strategy.title[:20]}] 지표 상태 복원")
+        self.indicator_sets[strategy.script_id] = indicators
+
+        def generate_signal(candles: CandleView, position: Optional[Position] = None) -> Dict:
             if len(candles) < ema_slow + 14:
                 return {'action': 'hold', 'reason': '데이터 부족', 'confidence': 0}
 
-            closes = np.array([c['close'] for c in candles])
-            current_price = closes[-1]
-
-            # EMA 계산
-            def ema(data, period):
-                mult = 2 / (period + 1)
-                result = np.zeros(len(data))
-                result[period-1] = np.mean(data[:period])
-                for i in range(period, len(data)):
-                    result[i] = (data[i] * mult) + (result[i-1] * (1 - mult))
-                return result
-
-            # RSI 계산
-            def rsi(data, period=14):
-                if len(data) < period + 1:
-                    return 50.0
-                deltas = np.diff(data[-(period+1):])
-                gains = np.where(deltas > 0, deltas, 0)
-                losses = np.where(deltas < 0, -deltas, 0)
-                avg_gain, avg_loss = np.mean(gains), np.mean(losses)
-                if avg_loss == 0:
-                    return 100.0
-                return 100 - (100 / (1 + avg_gain / avg_loss))
-
-            ema_f = ema(closes, ema_fast)
-            ema_s = ema(closes, ema_slow)
-            rsi_val = rsi(closes, 14)
-
-            ema_f_now, ema_s_now = ema_f[-1], ema_s[-1]
-            ema_f_prev, ema_s_prev = ema_f[-2], ema_s[-2]
+            current_price = float(candles.close[-1])
+
+            # 직전 확정 봉 / 진행 중인 봉 기준 지표
+            prev, now = indicators.evaluate(candles)
+            rsi_val = now['rsi']
+
+            ema_f_now, ema_s_now = now['ema_fast'], now['ema_slow']
+            ema_f_prev, ema_s_prev = prev['ema_fast'], prev['ema_slow']
 
             signal = {
                 'action': 'hold', 'reason': '시그널 없음', 'confidence': 0,
@@ -403,8 +406,11 @@ class ExchangeConnector:
 
         self.exchange = ccxt.binance(exchange_config)
 
+    async def fetch_ohlcv(self, symbol: str, timeframe: str, limit: int = 100) -> List[List[float]]:
+        return await self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+
     async def get_candles(self, symbol: str, limit: int = 100) -> List[Dict]:
-        ohlcv = await self.exchange.fetch_ohlcv(symbol, self.config.TIMEFRAME, limit=limit)
+        ohlcv = await self.fetch_ohlcv(symbol, self.config.TIMEFRAME, limit=limit)
         return [{'timestamp': c[0], 'open': float(c[1]), 'high': float(c[2]),
                  'low': float(c[3]), 'close': float(c[4]), 'volume': float(c[5])} for c in ohlcv]
 
@@ -458,6 +464,11 @@ class MultiStrategyBot:
         self.config = config or Config()
         self.strategy_manager = StrategyManager(self.config)
         self.exchange = ExchangeConnector(self.config)
+        self.market_data = MarketDataHub(
+            self.exchange.fetch_ohlcv,
+            capacity=self.config.CANDLE_LIMIT,
+            max_age=self.config.CANDLE_MAX_AGE,
+        )
         self.notifier = TelegramNotifier(self.config)
 
         self.positions: Dict[str, Position] = {}  # key: strategy_id
@@ -579,7 +590,7 @@ class MultiStrategyBot:
                     logger.warning(f"[{strategy.title[:20]}] 거래 불가: {reason}")
                     return
             
-            candles = await self.exchange.get_candles(self.config.SYMBOL, self.config.CANDLE_LIMIT)
+            candles = await self.market_data.get(self.config.SYMBOL, self.config.TIMEFRAME)
             position = self.positions.get(strategy.script_id)
 
             # 시그널 생성
@@ -726,6 +737,7 @@ class MultiStrategyBot:
                     for strategy in self.strategy_manager.current_strategies.values()
                 ]
                 await asyncio.gather(*tasks)
+                self.strategy_manager.save_indicator_states()
 
                 await asyncio.sleep(self.config.CHECK_INTERVAL)
 
@@ -753,6 +765,9 @@ class MultiStrategyBot:
             name = strategy.title if strategy else sid[:20]
             logger.info(f"{name}: {stats.wins}승 {stats.losses}패, PnL: {stats.total_pnl:+.2f}%")
 
+        md_stats = self.market_data.get_stats()
+        logger.info(f"캔들 요청 {md_stats['requests']}회 / 거래소 조회 {md_stats['fetches']}회")
+
         # 열린 포지션 알림
         if self.positions:
             msg = "⚠️ 열린 포지션:\n" + "\n".join([
@@ -8,8 +8,13 @@ Goal: Achieve Moon Dev Criteria
 - Profit Factor > 1.5
 - Max Drawdown < -30%
 
-This script uses Optuna for Bayesian optimization across 25+ datasets
+This script uses TPE-style Bayesian search (src.backtest.search) across 25+ datasets
 with multi-objective scoring focused on Sharpe Ratio and Win Rate improvement.
+Successive halving / Hyperband can be selected instead: candidates are scored on
+a couple of datasets first and only the best fraction is promoted to all datasets.
+Finished trials are stored in moondev_trials_{search}.jsonl so an interrupted
+study resumes where it stopped. The store is discarded when the datasets or the
+strategy source change.
 
 Author: Strategy Research Lab
 Date: 2026-01-04
@@ -17,22 +22,25 @@ Date: 2026-01-04
 
 import sys
 import os
+import argparse
 import pandas as pd
 import numpy as np
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
-import optuna
-from optuna.samplers import TPESampler
+from typing import Any, Dict, List, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
 # Add strategies directory to path
 sys.path.append('/Users/mr.joo/Desktop/전략연구소/trading-agent-system/strategies')
+sys.path.insert(0, str(Path(__file__).parent / "trading-agent-system"))
 
 from backtesting import Backtest
 from adaptive_ml_trailing_stop import AdaptiveMLTrailingStop
+from src.backtest.result_store import run_fingerprint
+from src.backtest.search import Study, Trial, TrialStore, make_searcher, params_key
 
 
 # Configuration
@@ -68,6 +76,29 @@ MOON_DEV_WEIGHTS = {
     'max_drawdown': 0.10,   # Maintain good performance
 }
 
+# Search space (same ranges/steps as the former Optuna suggest_* calls)
+SEARCH_SPACE = {
+    # KAMA parameters
+    'kama_length': [15, 20, 25, 30],
+    'fast_length': [10, 15, 20],
+    'slow_length': [40, 50, 60],
+
+    # ATR parameters
+    'atr_period': [21, 28, 35],
+    'base_multiplier': [2.0, 2.5, 3.0, 3.5],
+    'adaptive_strength': [0.5, 1.0, 1.5, 2.0],
+
+    # KNN parameters
+    'knn_enabled': [True, False],
+    'knn_k': [5, 6, 7, 8, 9, 10],
+    'knn_lookback': [50, 100, 150],
+    'knn_feature_length': [3, 5, 7],
+    'knn_weight': [0.0, 0.1, 0.2, 0.3],
+
+    # Risk management
+    'stop_loss_percent': [3.0, 4.0, 5.0, 6.0, 7.0],
+}
+
 # Moon Dev targets for normalization
 MOON_DEV_TARGETS = {
     'sharpe': 1.5,
@@ -79,21 +110,49 @@ MOON_DEV_TARGETS = {
 
 class MoonDevOptimizer:
     """
-    Advanced optimizer using Optuna for Bayesian parameter optimization
+    Advanced optimizer using a pluggable search strategy (TPE by default)
     with multi-objective scoring focused on Moon Dev criteria.
     """
 
-    def __init__(self, n_trials: int = 100, n_jobs: int = 1, n_datasets: int = None):
+    def __init__(
+        self,
+        n_trials: int = 100,
+        n_jobs: int = 1,
+        n_datasets: int = None,
+        search: str = 'tpe',
+        min_datasets: int = 2,
+        seed: int = 42,
+        resume: bool = True
+    ):
+        """
+        Args:
+            n_trials: Candidates to evaluate (random/tpe) or first-rung size (successive_halving)
+            n_jobs: Candidates evaluated concurrently
+            n_datasets: Use only the first N datasets
+            search: tpe | random | successive_halving | hyperband | grid
+            min_datasets: First-rung dataset count for successive_halving/hyperband
+            seed: Search seed (must match to resume a stored study)
+            resume: Replay finished trials from the trial store
+        """
         self.n_trials = n_trials
         self.n_jobs = n_jobs
         self.n_datasets = n_datasets if n_datasets else len(DATASETS)  # Use subset if specified
         self.datasets_to_use = DATASETS[:self.n_datasets]  # Take first N datasets
+        self.search = search
+        self.min_datasets = min_datasets
+        self.seed = seed
+        self.resume = resume
         self.trial_results = []
         self.best_params = None
         self.best_score = -float('inf')
+        self._data: Dict[str, pd.DataFrame] = {}
+        self._backtests: Dict[Tuple[str, str], Dict] = {}
 
     def load_dataset(self, dataset_name: str) -> pd.DataFrame:
-        """Load a parquet dataset and prepare for backtesting."""
+        """Load a parquet dataset and prepare for backtesting (cached per run)."""
+        if dataset_name in self._data:
+            return self._data[dataset_name]
+
         file_path = DATA_DIR / f"{dataset_name}.parquet"
         df = pd.read_parquet(file_path)
 
@@ -117,10 +176,32 @@ class MoonDevOptimizer:
             if col not in df.columns:
                 raise ValueError(f"Missing required column: {col} in {dataset_name}")
 
-        return df[required_cols]
+        self._data[dataset_name] = df[required_cols]
+        return self._data[dataset_name]
+
+    def run_fingerprint(self) -> str:
+        """Strategy source hash + fingerprints of the datasets in use (trial store header)."""
+        datasets = []
+        for dataset_name in self.datasets_to_use:
+            try:
+                datasets.append((dataset_name, self.load_dataset(dataset_name)))
+            except Exception:
+                datasets.append((dataset_name, pd.DataFrame()))  # missing file counts as empty
+        return run_fingerprint(AdaptiveMLTrailingStop, datasets)
 
     def run_backtest(self, dataset_name: str, params: Dict) -> Dict:
-        """Run backtest with given parameters on a specific dataset."""
+        """
+        Run backtest with given parameters on a specific dataset.
+
+        Results are memoised per (params, dataset), so a candidate promoted to a
+        larger dataset budget does not re-run the datasets it was already scored on.
+        """
+        key = (params_key(params), dataset_name)
+        if key not in self._backtests:
+            self._backtests[key] = self._run_backtest(dataset_name, params)
+        return self._backtests[key]
+
+    def _run_backtest(self, dataset_name: str, params: Dict) -> Dict:
         try:
             # Load data
             data = self.load_dataset(dataset_name)
@@ -227,58 +308,42 @@ class MoonDevOptimizer:
 
         return composite_score
 
-    def objective(self, trial: optuna.Trial) -> float:
+    def evaluate(self, params: Dict, budget: int) -> Tuple[float, Dict[str, Any]]:
         """
-        Optuna objective function.
+        Search objective.
 
-        Suggests parameters and runs backtests across all datasets,
-        returning the composite Moon Dev score.
+        Runs backtests for one candidate on the first `budget` datasets and
+        returns the composite Moon Dev score with the per-dataset results.
         """
-        # Suggest parameters
-        params = {
-            # KAMA parameters
-            'kama_length': trial.suggest_int('kama_length', 15, 30, step=5),
-            'fast_length': trial.suggest_int('fast_length', 10, 20, step=5),
-            'slow_length': trial.suggest_int('slow_length', 40, 60, step=10),
-
-            # ATR parameters
-            'atr_period': trial.suggest_int('atr_period', 21, 35, step=7),
-            'base_multiplier': trial.suggest_float('base_multiplier', 2.0, 3.5, step=0.5),
-            'adaptive_strength': trial.suggest_float('adaptive_strength', 0.5, 2.0, step=0.5),
-
-            # KNN parameters
-            'knn_enabled': trial.suggest_categorical('knn_enabled', [True, False]),
-            'knn_k': trial.suggest_int('knn_k', 5, 10, step=1),
-            'knn_lookback': trial.suggest_int('knn_lookback', 50, 150, step=50),
-            'knn_feature_length': trial.suggest_int('knn_feature_length', 3, 7, step=2),
-            'knn_weight': trial.suggest_float('knn_weight', 0.0, 0.3, step=0.1),
-
-            # Risk management
-            'stop_loss_percent': trial.suggest_float('stop_loss_percent', 3.0, 7.0, step=1.0),
-        }
-
         # Add constraint: fast_length < slow_length
         if params['fast_length'] >= params['slow_length']:
-            return 0.0
+            return 0.0, {'results': []}
 
-        # Run backtests on all datasets (or subset if n_datasets specified)
-        results = []
-        for dataset_name in self.datasets_to_use:
-            result = self.run_backtest(dataset_name, params)
-            results.append(result)
+        results = [
+            self.run_backtest(dataset_name, params)
+            for dataset_name in self.datasets_to_use[:budget]
+        ]
 
         # Calculate Moon Dev score
         score = self.calculate_moon_dev_score(results)
 
-        # Store trial results
-        trial_data = {
-            'trial_number': trial.number,
-            'params': params,
-            'score': score,
-            'results': results,
-            'timestamp': datetime.now().isoformat(),
-        }
-        self.trial_results.append(trial_data)
+        return score, {'results': results}
+
+    def evaluate_batch(self, proposals: List[Tuple[Dict, int]]) -> List[Tuple[float, Dict[str, Any]]]:
+        """Evaluate a batch of (params, budget) proposals, n_jobs at a time."""
+        if self.n_jobs <= 1:
+            return [self.evaluate(params, budget) for params, budget in proposals]
+
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            return list(executor.map(lambda proposal: self.evaluate(*proposal), proposals))
+
+    def on_trial(self, trial: Trial):
+        """Record a finished trial (evaluated or replayed from the trial store)."""
+        params = trial.params
+        # Failed candidates (no results or a NaN score) count as 0
+        score = trial.value if trial.value is not None and not np.isnan(trial.value) else 0.0
+        results = trial.attrs.get('results', [])
+        full_budget = trial.budget == len(self.datasets_to_use)
 
         # Calculate and display summary statistics
         successful_results = [r for r in results if r['success']]
@@ -287,26 +352,38 @@ class MoonDevOptimizer:
             avg_win_rate = np.mean([r['win_rate'] for r in successful_results])
             avg_return = np.mean([r['return'] for r in successful_results])
 
-            print(f"\nTrial {trial.number}: Score={score:.4f}")
+            print(f"\nTrial {trial.number} ({trial.budget} datasets): Score={score:.4f}")
             print(f"  Avg Sharpe: {avg_sharpe:.3f} | Avg Win Rate: {avg_win_rate:.1f}% | Avg Return: {avg_return:.2f}%")
             print(f"  Params: kama={params['kama_length']}, atr={params['atr_period']}, "
                   f"mult={params['base_multiplier']}, knn_w={params['knn_weight']}")
 
+        # Only candidates scored on every dataset compete for the best score
+        if not full_budget:
+            return
+
+        # Store trial results
+        self.trial_results.append({
+            'trial_number': trial.number,
+            'params': params,
+            'score': score,
+            'results': results,
+            'timestamp': datetime.now().isoformat(),
+        })
+
         # Update best score
         if score > self.best_score:
             self.best_score = score
             self.best_params = params
             print(f"  *** NEW BEST SCORE: {score:.4f} ***")
 
-        return score
-
-    def optimize(self) -> optuna.Study:
-        """Run Optuna optimization."""
+    def optimize(self) -> Study:
+        """Run the parameter search."""
         print("="*80)
         print("MOON DEV OPTIMIZATION - Adaptive ML Trailing Stop Strategy")
         print("="*80)
         print(f"\nOptimization Configuration:")
         print(f"  Datasets: {len(DATASETS)}")
+        print(f"  Search: {self.search}")
         print(f"  Trials: {self.n_trials}")
         print(f"  Parallel Jobs: {self.n_jobs}")
         print(f"\nMoon Dev Targets:")
@@ -322,25 +399,32 @@ class MoonDevOptimizer:
         print("\n" + "="*80)
         print("Starting optimization...\n")
 
-        # Create Optuna study
-        sampler = TPESampler(seed=42)
-        study = optuna.create_study(
-            direction='maximize',
-            sampler=sampler,
-            study_name='moon_dev_optimization'
-        )
-
-        # Run optimization
-        study.optimize(
-            self.objective,
+        searcher = make_searcher(
+            self.search,
+            SEARCH_SPACE,
+            max_budget=len(self.datasets_to_use),
             n_trials=self.n_trials,
-            n_jobs=self.n_jobs,
-            show_progress_bar=True,
+            min_budget=self.min_datasets,
+            batch_size=self.n_jobs,
+            seed=self.seed
         )
 
+        # Finished trials are appended here; a rerun with the same seed, datasets and
+        # strategy code replays them
+        store = TrialStore(RESULTS_DIR / f'moondev_trials_{self.search}.jsonl', self.run_fingerprint())
+        if not self.resume:
+            store.clear()
+
+        study = Study(searcher, store)
+        study.optimize(self.evaluate_batch, callback=self.on_trial)
+
+        print(f"\nSearch finished: {len(study.trials)} trials "
+              f"({study.n_replayed} replayed from {store.path.name})")
+        print(f"  Backtests run: {len(self._backtests)}")
+
         return study
 
-    def save_results(self, study: optuna.Study):
+    def save_results(self, study: Study):
         """Save optimization results to files."""
         print("\n" + "="*80)
         print("Saving results...")
@@ -389,7 +473,7 @@ class MoonDevOptimizer:
 
         print("="*80)
 
-    def generate_report(self, study: optuna.Study, trials_df: pd.DataFrame):
+    def generate_report(self, study: Study, trials_df: pd.DataFrame):
         """Generate comprehensive markdown report."""
 
         # Get best trial results
@@ -575,7 +659,7 @@ best_params = {{
    - Align signals across timeframes
 
 2. **Machine Learning Enhancements**
-   - Implement full KNN (currently simplified)
+   - Tune KNN normalisation (z-score vs min-max) per market
    - Add Random Forest for trend classification
    - Use XGBoost for pattern recognition
 
@@ -660,9 +744,25 @@ The strategy shows strong potential with proper parameter tuning. The next phase
         print(f"✓ Saved detailed report to: {report_path}")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Moon Dev optimization for Adaptive ML Trailing Stop")
+    parser.add_argument('--search', default='tpe',
+                        choices=['tpe', 'random', 'successive_halving', 'hyperband', 'grid'],
+                        help="Search strategy (default: tpe)")
+    parser.add_argument('--trials', type=int, default=100, help="Candidates to evaluate")
+    parser.add_argument('--jobs', type=int, default=1, help="Candidates evaluated concurrently")
+    parser.add_argument('--datasets', type=int, default=None, help="Use only the first N datasets")
+    parser.add_argument('--min-datasets', type=int, default=2,
+                        help="First-rung dataset count for successive_halving/hyperband")
+    parser.add_argument('--seed', type=int, default=42, help="Search seed")
+    parser.add_argument('--no-resume', action='store_true', help="Ignore stored trials and start over")
+    return parser.parse_args()
+
+
 def main():
     """Main optimization execution."""
     global DATASETS
+    args = parse_args()
 
     # Check if datasets exist
     print("Checking datasets...")
@@ -684,8 +784,13 @@ def main():
 
     # Create optimizer
     optimizer = MoonDevOptimizer(
-        n_trials=100,  # Adjust based on time available
-        n_jobs=1       # Parallel jobs (set to 1 for debugging)
+        n_trials=args.trials,  # Adjust based on time available
+        n_jobs=args.jobs,      # Parallel jobs (set to 1 for debugging)
+        n_datasets=args.datasets,
+        search=args.search,
+        min_datasets=args.min_datasets,
+        seed=args.seed,
+        resume=not args.no_resume
     )
 
     # Run optimization
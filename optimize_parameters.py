@@ -9,26 +9,55 @@ PARAMETER_OPTIMIZATION_GUIDE.md에 정의된 범위를 사용하여 실제 백
 - Win Rate > 40%
 - Profit Factor > 1.5
 
+병렬 실행:
+- (파라미터 조합 × 데이터셋) 작업을 프로세스 풀의 모든 코어로 분산
+- 데이터셋은 공유 메모리에 한 번만 적재 (작업마다 pickle하지 않음)
+- 조합별 결과는 완료되는 즉시 스트리밍
+- 체크포인트(JSONL)로 중단된 최적화를 이어서 실행
+  (첫 줄의 데이터셋 지문/전략 코드 해시가 다르면 버리고 처음부터)
+
+탐색 전략 (--search):
+- grid: 모든 조합 × 모든 데이터셋 (기본)
+- random / tpe: 일부 조합만 모든 데이터셋으로 평가
+- successive_halving / hyperband: 먼저 데이터셋 2개로 평가하고 상위 조합만 전체 데이터셋으로 승격
+- 완료된 trial은 search_trials_{strategy_name}_{search}.jsonl에 남아 중단 후 이어서 실행
+  (데이터셋 지문/전략 코드 해시가 바뀌면 기록을 버리고 다시 평가)
+
+결과 저장소:
+- 모든 (전략 코드, 파라미터, 데이터셋) 백테스트 결과를 backtest_results.db에 기록
+- 이미 결과가 있는 작업은 다시 실행하지 않음 (다른 실행/탐색 전략 간에도 재사용)
+
+지표 캐시:
+- 워커마다 (데이터셋 지문, 지표, 파라미터) -> 지표 결과를 메모리에 재사용
+- --indicator-cache DIR: 결과를 .npy로 저장하여 워커/실행 간에 공유
+
 출력:
 - optimization_results_{strategy_name}.csv: 모든 파라미터 조합의 성과
 - best_parameters_{strategy_name}.json: 최적 파라미터
+- backtest_results.db: 개별 백테스트 결과 (visualize_optimization.py가 조회)
 - optimization_summary.md: 최적화 전후 비교표
 """
 
+import os
 import sys
 import json
+import argparse
 import itertools
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 
 # 프로젝트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent / "trading-agent-system"))
 
 from src.backtest.engine import BacktestEngine, BacktestMetrics
+from src.backtest.result_store import run_fingerprint
+from src.backtest.search import Study, Trial, TrialStore, make_searcher, space_size
+from src.backtest.shared_data import SharedDataset, SharedDatasetHandle
 from strategies.adaptive_ml_trailing_stop import AdaptiveMLTrailingStop
 from strategies.pmax_asymmetric import PMaxAsymmetric
 from strategies.heikin_ashi_wick import HeikinAshiWick
@@ -52,6 +81,109 @@ class OptimizationResult:
         return asdict(self)
 
 
+class OptimizationCheckpoint:
+    """
+    (파라미터 조합, 데이터셋) 단위 진행 상황을 JSONL로 기록
+
+    작업이 끝날 때마다 한 줄씩 추가하므로 프로세스가 중단되어도
+    완료된 작업은 보존되고, 재실행 시 건너뛸 수 있습니다.
+
+    fingerprint(run_fingerprint: 데이터셋 지문 + 전략 코드 해시)가 주어지면
+    첫 줄에 기록하고, 다른 값으로 만들어진 체크포인트는 읽지 않고 지웁니다.
+    """
+
+    def __init__(self, path: Path, fingerprint: Optional[str] = None):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+
+    @staticmethod
+    def job_key(params: Dict[str, Any], symbol: str) -> str:
+        return json.dumps({"params": params, "symbol": symbol}, sort_keys=True, default=str)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """완료된 작업 {job_key: {"metrics": ..., "error": ...}}"""
+        completed = {}
+        if not self.path.exists():
+            return completed
+
+        header = None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시점에 잘린 마지막 줄
+                if "fingerprint" in record:
+                    header = record["fingerprint"]
+                    continue
+                key = self.job_key(record["params"], record["symbol"])
+                completed[key] = record
+
+        if self.fingerprint is not None and header != self.fingerprint:
+            print(f"Checkpoint {self.path.name} was made with other datasets or strategy code, "
+                  f"discarding {len(completed)} jobs")
+            self.clear()
+            return {}
+        return completed
+
+    def append(
+        self,
+        params: Dict[str, Any],
+        symbol: str,
+        metrics: Optional[Dict[str, Any]],
+        error: Optional[str] = None
+    ):
+        record = {"params": params, "symbol": symbol, "metrics": metrics, "error": error}
+        new_file = not self.path.exists()
+        with open(self.path, 'a', encoding='utf-8') as f:
+            if new_file and self.fingerprint is not None:
+                f.write(json.dumps({"fingerprint": self.fingerprint}) + "\n")
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+
+    def clear(self):
+        if self.path.exists():
+            self.path.unlink()
+
+
+# ============================================================
+# 프로세스 풀 워커
+# ============================================================
+
+_worker_datasets: List[Tuple[str, pd.DataFrame]] = []
+_worker_shared: List[SharedDataset] = []
+_worker_engine: Optional[BacktestEngine] = None
+
+
+def _init_worker(handles: List[SharedDatasetHandle], engine_config: Dict[str, Any]):
+    """워커 시작 시 공유 메모리 데이터셋에 한 번만 연결"""
+    global _worker_datasets, _worker_shared, _worker_engine
+
+    _worker_shared = [SharedDataset.attach(handle) for handle in handles]
+    _worker_datasets = [(ds.symbol, ds.to_frame()) for ds in _worker_shared]
+    _worker_engine = BacktestEngine(**engine_config)
+
+
+def _run_backtest_job(
+    strategy_class: type,
+    params: Dict[str, Any],
+    dataset_idx: int
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """(파라미터 조합, 데이터셋) 작업 하나 실행 -> (metrics dict, error)"""
+    symbol, data = _worker_datasets[dataset_idx]
+    try:
+        metrics = _worker_engine.run(
+            strategy_class=strategy_class,
+            data=data,
+            symbol=symbol,
+            interval='1h',
+            strategy_params=params
+        )
+        return asdict(metrics), None
+    except Exception as e:
+        return None, str(e)[:100]
+
+
 class ParameterOptimizer:
     """파라미터 최적화 엔진"""
 
@@ -92,24 +224,51 @@ class ParameterOptimizer:
         self,
         data_dir: str = "trading-agent-system/data/datasets",
         results_dir: str = "optimization_results",
-        num_datasets: int = 10
+        num_datasets: int = 10,
+        n_workers: Optional[int] = None,
+        resume: bool = True,
+        search: str = 'grid',
+        n_trials: Optional[int] = None,
+        min_budget: int = 2,
+        seed: Optional[int] = 42,
+        result_store: Optional[str] = None,
+        indicator_cache: Optional[str] = None
     ):
         """
         Args:
             data_dir: 데이터셋 디렉토리
             results_dir: 결과 저장 디렉토리
             num_datasets: 테스트할 데이터셋 개수
+            n_workers: 병렬 워커 수 (None: 모든 코어, 1: 현재 프로세스에서 순차 실행)
+            resume: 체크포인트에서 중단된 최적화 이어서 실행
+            search: 탐색 전략 (grid | random | tpe | successive_halving | hyperband)
+            n_trials: random/tpe 평가 조합 수, successive_halving 첫 단계 조합 수
+            min_budget: successive_halving/hyperband 첫 단계 데이터셋 수
+            seed: 탐색 난수 시드 (같은 시드여야 저장된 trial을 재생하며 이어서 실행)
+            result_store: 백테스트 결과 저장소 경로 (기본: {results_dir}/backtest_results.db)
+            indicator_cache: 지표 결과 .npy 저장 디렉토리 (None이면 워커 메모리에만 보관)
         """
         self.data_dir = Path(data_dir)
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
         self.num_datasets = num_datasets
-
-        self.engine = BacktestEngine(
-            initial_cash=100_000,
-            commission=0.0003,  # 0.03%
-            exclusive_orders=True
-        )
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.resume = resume
+        self.search = search
+        self.n_trials = n_trials
+        self.min_budget = min_budget
+        self.seed = seed
+        # 실제로 실행한 (조합, 데이터셋) 백테스트 수 (체크포인트에서 재사용한 작업 제외)
+        self.jobs_run = 0
+
+        self.engine_config = {
+            'initial_cash': 100_000,
+            'commission': 0.0003,  # 0.03%
+            'exclusive_orders': True,
+            'result_store': str(result_store or self.results_dir / "backtest_results.db"),
+            'indicator_cache': str(indicator_cache) if indicator_cache else None
+        }
+        self.engine = BacktestEngine(**self.engine_config)
 
     def load_datasets(self) -> List[tuple]:
         """데이터셋 로드 (10개 선택)"""
@@ -178,20 +337,13 @@ class ParameterOptimizer:
 
         for symbol, data in datasets:
             try:
-                # 동적으로 전략 클래스 생성 (파라미터 오버라이드)
-                class TempStrategy(strategy_class):
-                    pass
-
-                # 파라미터 설정
-                for key, value in params.items():
-                    setattr(TempStrategy, key, value)
-
-                # 백테스트 실행
+                # 파라미터는 Backtest.run(**params)로 전달 (서브클래스 생성 불필요)
                 metrics = self.engine.run(
-                    strategy_class=TempStrategy,
+                    strategy_class=strategy_class,
                     data=data,
                     symbol=symbol,
-                    interval='1h'
+                    interval='1h',
+                    strategy_params=params
                 )
 
                 results.append(metrics)
@@ -202,6 +354,163 @@ class ParameterOptimizer:
 
         return results
 
+    def checkpoint_for(
+        self,
+        strategy_name: str,
+        fingerprint: Optional[str] = None
+    ) -> OptimizationCheckpoint:
+        """전략별 체크포인트 파일 (fingerprint: run_fingerprint 결과)"""
+        return OptimizationCheckpoint(
+            self.results_dir / f"optimization_checkpoint_{strategy_name}.jsonl",
+            fingerprint
+        )
+
+    def iter_grid_results(
+        self,
+        strategy_name: str,
+        strategy_class: type,
+        param_combinations: List[Dict[str, Any]],
+        datasets: List[tuple],
+        fingerprint: Optional[str] = None
+    ) -> Iterator[Tuple[int, Optional[OptimizationResult]]]:
+        """
+        (파라미터 조합 × 데이터셋) 그리드를 실행하고 조합이 완료될 때마다 결과 반환
+
+        체크포인트에 이미 있는 작업은 건너뛰고, 나머지는 n_workers개의
+        프로세스로 분산합니다. 데이터셋은 공유 메모리에 한 번만 적재됩니다.
+        fingerprint가 다른 체크포인트는 재사용하지 않습니다 (기본: 전략 코드 + datasets).
+
+        Yields:
+            (조합 인덱스, OptimizationResult 또는 유효 결과가 없으면 None)
+        """
+        checkpoint = self.checkpoint_for(
+            strategy_name, fingerprint or run_fingerprint(strategy_class, datasets)
+        )
+        completed = checkpoint.load()
+
+        symbols = [symbol for symbol, _ in datasets]
+        outcomes: Dict[int, Dict[int, Optional[Dict[str, Any]]]] = {
+            idx: {} for idx in range(len(param_combinations))
+        }
+        pending = []
+
+        for combo_idx, params in enumerate(param_combinations):
+            for dataset_idx, symbol in enumerate(symbols):
+                record = completed.get(OptimizationCheckpoint.job_key(params, symbol))
+                if record is not None:
+                    outcomes[combo_idx][dataset_idx] = record["metrics"]
+                else:
+                    pending.append((combo_idx, dataset_idx))
+
+        if completed:
+            print(f"Resuming from checkpoint: {len(completed)} jobs already done, {len(pending)} remaining")
+
+        # 체크포인트만으로 완료된 조합
+        pending_combos = {combo_idx for combo_idx, _ in pending}
+        for combo_idx in range(len(param_combinations)):
+            if combo_idx not in pending_combos:
+                yield combo_idx, self._build_result(
+                    strategy_name, param_combinations[combo_idx], outcomes[combo_idx]
+                )
+
+        if not pending:
+            return
+
+        def record_outcome(combo_idx, dataset_idx, metrics, error):
+            self.jobs_run += 1
+            params = param_combinations[combo_idx]
+            checkpoint.append(params, symbols[dataset_idx], metrics, error)
+            if error:
+                print(f"  Error on {symbols[dataset_idx]} {params}: {error}")
+            outcomes[combo_idx][dataset_idx] = metrics
+            if len(outcomes[combo_idx]) == len(symbols):
+                return self._build_result(strategy_name, params, outcomes[combo_idx])
+            return False
+
+        if self.n_workers <= 1:
+            global _worker_datasets, _worker_engine
+            _worker_datasets, _worker_engine = list(datasets), self.engine
+            for combo_idx, dataset_idx in pending:
+                metrics, error = _run_backtest_job(
+                    strategy_class, param_combinations[combo_idx], dataset_idx
+                )
+                result = record_outcome(combo_idx, dataset_idx, metrics, error)
+                if result is not False:
+                    yield combo_idx, result
+            return
+
+        shared = [SharedDataset.create(symbol, data) for symbol, data in datasets]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_init_worker,
+                initargs=([ds.handle for ds in shared], self.engine_config)
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _run_backtest_job,
+                        strategy_class,
+                        param_combinations[combo_idx],
+                        dataset_idx
+                    ): (combo_idx, dataset_idx)
+                    for combo_idx, dataset_idx in pending
+                }
+
+                try:
+                    for future in as_completed(futures):
+                        combo_idx, dataset_idx = futures[future]
+                        try:
+                            metrics, error = future.result()
+                        except Exception as e:
+                            metrics, error = None, str(e)[:100]
+
+                        result = record_outcome(combo_idx, dataset_idx, metrics, error)
+                        if result is not False:
+                            yield combo_idx, result
+                finally:
+                    # 중단 시 대기 중인 작업 취소 (완료분은 체크포인트에 남음)
+                    for future in futures:
+                        future.cancel()
+        finally:
+            for ds in shared:
+                ds.close()
+                ds.unlink()
+
+    def _build_result(
+        self,
+        strategy_name: str,
+        params: Dict[str, Any],
+        outcomes: Dict[int, Optional[Dict[str, Any]]]
+    ) -> Optional[OptimizationResult]:
+        """데이터셋 순서대로 메트릭을 집계하여 OptimizationResult 생성"""
+        metrics_list = [
+            BacktestMetrics(**outcomes[idx])
+            for idx in sorted(outcomes)
+            if outcomes[idx] is not None
+        ]
+        if not metrics_list:
+            return None
+
+        aggregated = self.engine.aggregate_results(metrics_list)
+
+        result = OptimizationResult(
+            strategy_name=strategy_name,
+            parameters=params,
+            avg_return=aggregated['avg_return'],
+            avg_sharpe=aggregated['avg_sharpe'],
+            avg_win_rate=aggregated['avg_win_rate'],
+            avg_profit_factor=np.mean([m.profit_factor for m in metrics_list]),
+            avg_max_drawdown=aggregated['avg_max_drawdown'],
+            consistency_rate=aggregated['consistency_rate'],
+            total_tests=aggregated['total_tests'],
+            moon_dev_score=0  # 나중에 계산
+        )
+
+        # Moon Dev 점수 계산
+        result.moon_dev_score = self.calculate_moon_dev_score(result)
+
+        return result
+
     def calculate_moon_dev_score(self, result: OptimizationResult) -> int:
         """Moon Dev 기준 통과 항목 개수 계산"""
         score = 0
@@ -215,6 +524,17 @@ class ParameterOptimizer:
 
         return score
 
+    @staticmethod
+    def _print_best(best_result: OptimizationResult):
+        """최적 결과 출력 (그리드 / 탐색 공통)"""
+        print("\nBest parameters found:")
+        print(f"  Parameters: {best_result.parameters}")
+        print(f"  Avg Return: {best_result.avg_return:.2f}%")
+        print(f"  Avg Sharpe: {best_result.avg_sharpe:.2f}")
+        print(f"  Avg Win Rate: {best_result.avg_win_rate:.1f}%")
+        print(f"  Avg Profit Factor: {best_result.avg_profit_factor:.2f}")
+        print(f"  Moon Dev Score: {best_result.moon_dev_score}/3")
+
     def optimize_strategy(
         self,
         strategy_name: str,
@@ -231,46 +551,34 @@ class ParameterOptimizer:
         print(f"Optimizing: {strategy_name}")
         print(f"{'='*80}")
 
+        if not self.resume:
+            self.checkpoint_for(strategy_name).clear()
+
+        if self.search != 'grid':
+            return self.search_strategy(strategy_name, strategy_class, datasets)
+
         # 파라미터 조합 생성
         param_combinations = self.generate_param_combinations(strategy_name)
         total_combos = len(param_combinations)
 
         print(f"Total parameter combinations: {total_combos}")
-        print(f"Testing on {len(datasets)} datasets\n")
+        print(f"Testing on {len(datasets)} datasets with {self.n_workers} workers\n")
 
-        all_results = []
+        results_by_idx: Dict[int, OptimizationResult] = {}
+        finished = 0
 
-        for idx, params in enumerate(param_combinations, 1):
-            print(f"[{idx}/{total_combos}] Testing: {params}")
+        for combo_idx, result in self.iter_grid_results(
+            strategy_name, strategy_class, param_combinations, datasets
+        ):
+            finished += 1
+            params = param_combinations[combo_idx]
+            print(f"[{finished}/{total_combos}] Tested: {params}")
 
-            # 백테스트 실행
-            metrics_list = self.test_parameters(strategy_class, params, datasets)
-
-            if not metrics_list:
+            if result is None:
                 print("  No valid results, skipping...")
                 continue
 
-            # 집계
-            aggregated = self.engine.aggregate_results(metrics_list)
-
-            # 결과 생성
-            result = OptimizationResult(
-                strategy_name=strategy_name,
-                parameters=params,
-                avg_return=aggregated['avg_return'],
-                avg_sharpe=aggregated['avg_sharpe'],
-                avg_win_rate=aggregated['avg_win_rate'],
-                avg_profit_factor=np.mean([m.profit_factor for m in metrics_list]),
-                avg_max_drawdown=aggregated['avg_max_drawdown'],
-                consistency_rate=aggregated['consistency_rate'],
-                total_tests=aggregated['total_tests'],
-                moon_dev_score=0  # 나중에 계산
-            )
-
-            # Moon Dev 점수 계산
-            result.moon_dev_score = self.calculate_moon_dev_score(result)
-
-            all_results.append(result)
+            results_by_idx[combo_idx] = result
 
             # 간단한 출력
             print(f"  Return: {result.avg_return:.2f}% | "
@@ -279,6 +587,9 @@ class ParameterOptimizer:
                   f"PF: {result.avg_profit_factor:.2f} | "
                   f"Moon Dev: {result.moon_dev_score}/3")
 
+        # 완료 순서와 무관하게 조합 순서로 정렬 (동점 시 결과 결정성 유지)
+        all_results = [results_by_idx[idx] for idx in sorted(results_by_idx)]
+
         if not all_results:
             raise ValueError(f"No valid results for {strategy_name}")
 
@@ -288,13 +599,114 @@ class ParameterOptimizer:
             key=lambda x: (x.moon_dev_score, x.avg_sharpe, x.avg_return)
         )
 
-        print(f"\nBest parameters found:")
-        print(f"  Parameters: {best_result.parameters}")
-        print(f"  Avg Return: {best_result.avg_return:.2f}%")
-        print(f"  Avg Sharpe: {best_result.avg_sharpe:.2f}")
-        print(f"  Avg Win Rate: {best_result.avg_win_rate:.1f}%")
-        print(f"  Avg Profit Factor: {best_result.avg_profit_factor:.2f}")
-        print(f"  Moon Dev Score: {best_result.moon_dev_score}/3")
+        self._print_best(best_result)
+
+        # 전체 그리드 완료 - 다음 실행은 처음부터
+        self.checkpoint_for(strategy_name).clear()
+
+        return all_results, best_result
+
+    def search_strategy(
+        self,
+        strategy_name: str,
+        strategy_class: type,
+        datasets: List[tuple]
+    ) -> tuple[List[OptimizationResult], OptimizationResult]:
+        """
+        탐색 전략(self.search)으로 최적화 수행
+
+        budget은 평가에 사용할 데이터셋 수입니다 (datasets[:budget]).
+        데이터셋별 결과는 체크포인트에 남으므로 승격된 조합은
+        이미 실행한 데이터셋을 다시 백테스트하지 않습니다.
+
+        Returns:
+            (전체 데이터셋으로 평가한 결과 리스트, 최적 결과)
+        """
+        space = self.PARAM_GRIDS[strategy_name]
+        max_budget = len(datasets)
+        # budget마다 datasets[:budget]을 쓰므로 체크포인트 지문은 전체 데이터셋 기준
+        fingerprint = run_fingerprint(strategy_class, datasets)
+        searcher = make_searcher(
+            self.search,
+            space,
+            max_budget=max_budget,
+            n_trials=self.n_trials,
+            min_budget=self.min_budget,
+            batch_size=self.n_workers,
+            seed=self.seed
+        )
+
+        store = TrialStore(
+            self.results_dir / f"search_trials_{strategy_name}_{self.search}.jsonl",
+            fingerprint
+        )
+        if not self.resume:
+            store.clear()
+
+        total_combos = space_size(space)
+        print(f"Search: {self.search} over {total_combos} parameter combinations")
+        print(f"Testing on up to {max_budget} datasets with {self.n_workers} workers\n")
+
+        def evaluate(proposals: List[Tuple[Dict[str, Any], int]]) -> List[Tuple[Any, Dict[str, Any]]]:
+            results: Dict[int, Optional[OptimizationResult]] = {}
+            by_budget: Dict[int, List[int]] = {}
+            for idx, (_, budget) in enumerate(proposals):
+                by_budget.setdefault(budget, []).append(idx)
+
+            for budget, indices in sorted(by_budget.items()):
+                combos = [proposals[idx][0] for idx in indices]
+                for combo_idx, result in self.iter_grid_results(
+                    strategy_name, strategy_class, combos, datasets[:budget], fingerprint
+                ):
+                    results[indices[combo_idx]] = result
+
+            outcomes = []
+            for idx in range(len(proposals)):
+                result = results.get(idx)
+                if result is None:
+                    outcomes.append((None, {}))
+                else:
+                    # 그리드 탐색의 최적 결과 선택 기준과 같은 순서
+                    value = (
+                        int(result.moon_dev_score),
+                        float(result.avg_sharpe),
+                        float(result.avg_return)
+                    )
+                    outcomes.append((value, {'result': result.to_dict()}))
+            return outcomes
+
+        def report(trial: Trial):
+            if trial.value is None:
+                print(f"[trial {trial.number}] {trial.budget} datasets: no valid results "
+                      f"{trial.params}")
+                return
+            moon_dev, sharpe, avg_return = trial.value
+            print(f"[trial {trial.number}] {trial.budget} datasets: "
+                  f"Return: {avg_return:.2f}% | Sharpe: {sharpe:.2f} | "
+                  f"Moon Dev: {moon_dev}/3 | {trial.params}")
+
+        study = Study(searcher, store)
+        jobs_before = self.jobs_run
+        best_trial = study.optimize(evaluate, callback=report)
+
+        all_results = [
+            OptimizationResult(**trial.attrs['result'])
+            for trial in study.trials
+            if trial.budget == max_budget and trial.value is not None
+        ]
+        if best_trial is None:
+            raise ValueError(f"No valid results for {strategy_name}")
+        best_result = OptimizationResult(**best_trial.attrs['result'])
+
+        print(f"\nSearch finished: {len(study.trials)} trials "
+              f"({study.n_replayed} replayed from {store.path.name})")
+        print(f"  Backtests run: {self.jobs_run - jobs_before} "
+              f"(full grid: {total_combos * max_budget})")
+
+        self._print_best(best_result)
+
+        # 탐색 완료 - 데이터셋별 체크포인트는 정리하고 trial 기록은 유지
+        self.checkpoint_for(strategy_name).clear()
 
         return all_results, best_result
 
@@ -355,32 +767,37 @@ class ParameterOptimizer:
         # 백테스트 실행
         metrics_list = self.test_parameters(strategy_class, baseline_params, datasets)
 
-        if not metrics_list:
+        result = self._build_result(
+            strategy_name,
+            baseline_params,
+            {idx: asdict(m) for idx, m in enumerate(metrics_list)}
+        )
+        if result is None:
             raise ValueError(f"No baseline results for {strategy_name}")
 
-        # 집계
-        aggregated = self.engine.aggregate_results(metrics_list)
-
-        result = OptimizationResult(
-            strategy_name=strategy_name,
-            parameters=baseline_params,
-            avg_return=aggregated['avg_return'],
-            avg_sharpe=aggregated['avg_sharpe'],
-            avg_win_rate=aggregated['avg_win_rate'],
-            avg_profit_factor=np.mean([m.profit_factor for m in metrics_list]),
-            avg_max_drawdown=aggregated['avg_max_drawdown'],
-            consistency_rate=aggregated['consistency_rate'],
-            total_tests=aggregated['total_tests'],
-            moon_dev_score=0
-        )
+        return result
 
-        result.moon_dev_score = self.calculate_moon_dev_score(result)
 
-        return result
+def parse_args():
+    parser = argparse.ArgumentParser(description="파라미터 최적화 자동화")
+    parser.add_argument(
+        "--search",
+        default="grid",
+        choices=["grid", "random", "tpe", "successive_halving", "hyperband"],
+        help="탐색 전략 (기본: grid)"
+    )
+    parser.add_argument("--trials", type=int, default=None, help="random/tpe 평가 조합 수")
+    parser.add_argument("--min-datasets", type=int, default=2, help="successive_halving/hyperband 첫 단계 데이터셋 수")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 워커 수")
+    parser.add_argument("--seed", type=int, default=42, help="탐색 난수 시드")
+    parser.add_argument("--no-resume", action="store_true", help="체크포인트/trial 기록을 무시하고 처음부터 실행")
+    parser.add_argument("--indicator-cache", default=None, help="지표 결과 .npy 저장 디렉토리 (워커/실행 간 공유)")
+    return parser.parse_args()
 
 
 def main():
     """메인 실행 함수"""
+    args = parse_args()
 
     print("=" * 80)
     print("파라미터 최적화 자동화 시스템")
@@ -394,7 +811,14 @@ def main():
     optimizer = ParameterOptimizer(
         data_dir=script_dir / "trading-agent-system/data/datasets",
         results_dir=script_dir / "optimization_results",
-        num_datasets=10
+        num_datasets=10,
+        n_workers=args.workers,
+        resume=not args.no_resume,
+        search=args.search,
+        n_trials=args.trials,
+        min_budget=args.min_datasets,
+        seed=args.seed,
+        indicator_cache=args.indicator_cache
     )
 
     # 데이터셋 로드
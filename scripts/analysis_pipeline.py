@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+AI 분석 + 백테스트 단계형 비동기 파이프라인
+
+수집된 전략을 한 개씩 순서대로 처리하던 분석/백테스트 단계를 단계별 작업자로 분리합니다.
+
+    입력 ─▶ [분석 큐] ─▶ 분석 작업자 N개 ─▶ [백테스트 큐] ─▶ 백테스트 프로세스 M개
+                              │                                   │
+                              └──────────▶ [기록 큐] ◀────────────┘
+                                               │
+                                      DB 기록기 1개 (K건마다 한 트랜잭션)
+
+- 모든 큐는 크기 제한이 있어 느린 단계가 앞 단계를 자연스럽게 멈춤 (backpressure)
+- 분석 요청은 토큰 버킷으로 속도 제한 (고정 sleep 대신)
+- 백테스트: 변환/데이터 준비는 이벤트 루프, 컴파일+시뮬레이션은 프로세스 풀
+  (데이터셋은 작업자 초기화 때 한 번만 전달)
+- 기록기는 분석 결과를 먼저, 백테스트 결과를 나중에 병합하므로 같은 전략의
+  backtest_result가 분석 upsert에 덮어써지지 않음
+- dry_run: 브라우저/거래소 없이 저장된 코드 + 합성 데이터로 실행, DB 기록 생략
+
+사용법:
+    pipeline = AnalysisPipeline(db_path, PipelineConfig(analyzer_workers=4))
+    result = await pipeline.run(strategies)
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from scripts.analyze_strategies import StrategyAnalysis, StrategyAnalyzer
+from src.backtester.strategy_tester import (
+    BacktestJob, StrategyTester, init_backtest_worker, run_backtest_job
+)
+from src.collector.human_like_scraper import StrategyData
+from src.collector.session_manager import TokenBucket
+from src.notification.telegram_bot import BacktestResult
+from src.storage.database import StrategyDatabase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineConfig:
+    """파이프라인 단계별 설정"""
+    analyzer_workers: int = 3           # 동시 분석 수 (분석당 브라우저 1개)
+    analyze_rate_per_minute: int = 60   # 분석 요청 속도 (TradingView 접근)
+    backtest_workers: int = 2           # 백테스트 프로세스 수 (0이면 스레드 1개에서 실행)
+    write_batch_size: int = 20          # K건마다 한 트랜잭션으로 커밋
+    flush_interval: float = 5.0         # 배치가 덜 찼어도 이 시간(초) 동안 입력이 없으면 커밋
+    queue_size: int = 0                 # 단계 간 큐 크기 (0이면 다음 단계 작업자 수 x 2)
+    run_backtest: bool = True
+    symbol: str = "BTC/USDT"
+    timeframe: str = "1h"
+    backtest_days: int = 180
+    initial_capital: float = 10000.0
+    dry_run: bool = False
+
+
+@dataclass
+class PipelineResult:
+    """파이프라인 실행 결과"""
+    analyzed: int = 0
+    backtested: int = 0
+    failed: int = 0
+    written: int = 0
+    write_errors: int = 0
+    backtest_results: List[BacktestResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def grade_for(total_score: float) -> str:
+    """종합 점수 -> 등급 (A, B, C, D, F)"""
+    if total_score >= 80:
+        return 'A'
+    elif total_score >= 70:
+        return 'B'
+    elif total_score >= 60:
+        return 'C'
+    elif total_score >= 50:
+        return 'D'
+    return 'F'
+
+
+def build_analysis_json(analysis: StrategyAnalysis) -> Dict:
+    """DB analysis_json 생성"""
+    return {
+        'grade': grade_for(analysis.total_score),
+        'total_score': round(analysis.total_score, 1),
+        'code_score': round(analysis.code_score, 1),
+        'performance_score': round(analysis.performance_score, 1),
+        'quality_score': round(analysis.quality_score, 1),
+        'repainting_score': 100 - len(analysis.repainting_issues) * 10,
+        'overfitting_score': 100 - len(analysis.overfitting_issues) * 10,
+        'repainting_issues': analysis.repainting_issues,
+        'overfitting_issues': analysis.overfitting_issues,
+        'analyzed_at': datetime.now().isoformat()
+    }
+
+
+class AnalysisPipeline:
+    """분석 -> 백테스트 -> 배치 DB 기록 파이프라인"""
+
+    def __init__(
+        self,
+        db_path: str,
+        config: Optional[PipelineConfig] = None,
+        analyzer: Optional[StrategyAnalyzer] = None,
+        tester: Optional[StrategyTester] = None,
+    ):
+        self.db_path = db_path
+        self.config = config or PipelineConfig()
+        self.analyzer = analyzer or StrategyAnalyzer(headless=True)
+        self._tester = tester
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._dataset_key = ""
+
+    def _queue(self, consumers: int) -> asyncio.Queue:
+        return asyncio.Queue(maxsize=self.config.queue_size or max(1, consumers) * 2)
+
+    async def run(self, strategies: List[StrategyData]) -> PipelineResult:
+        """코드가 있는 전략을 분석하고 백테스트하여 DB에 기록"""
+        cfg = self.config
+        result = PipelineResult()
+        started = time.time()
+        targets = [s for s in strategies if getattr(s, 'pine_code', None)]
+        if len(targets) < len(strategies):
+            logger.info(f"   ⚠️ 코드 없는 전략 {len(strategies) - len(targets)}개 스킵")
+        if not targets:
+            return result
+
+        analyze_q = self._queue(cfg.analyzer_workers)
+        backtest_q = self._queue(cfg.backtest_workers)
+        write_q: asyncio.Queue = asyncio.Queue(maxsize=max(1, cfg.write_batch_size) * 2)
+        limiter = None if cfg.dry_run else TokenBucket(cfg.analyze_rate_per_minute / 60, cfg.analyzer_workers)
+
+        with tempfile.TemporaryDirectory() as scratch:
+            tester = self._tester or StrategyTester(
+                self.db_path,
+                offline=cfg.dry_run,
+                # dry-run은 결과 저장소도 임시 파일로
+                result_store=str(Path(scratch) / 'backtest_results.db') if cfg.dry_run else None,
+            )
+            end_date = datetime.now().strftime("%Y-%m-%d")
+            start_date = (datetime.now() - timedelta(days=cfg.backtest_days)).strftime("%Y-%m-%d")
+            dates = (start_date, end_date)
+
+            if cfg.run_backtest:
+                await self._start_backtest_pool(tester, *dates)
+
+            async with StrategyDatabase(self.db_path) as db:
+                tasks: List[asyncio.Task] = []
+                try:
+                    writer = asyncio.create_task(self._write_stage(db, write_q, result))
+                    tasks.append(writer)
+                    analyzers = [
+                        asyncio.create_task(self._analyze_stage(analyze_q, backtest_q, write_q, limiter, result, len(targets)))
+                        for _ in range(max(1, cfg.analyzer_workers))
+                    ]
+                    backtesters = [
+                        asyncio.create_task(self._backtest_stage(tester, dates, backtest_q, write_q, result))
+                        for _ in range(max(1, cfg.backtest_workers) if cfg.run_backtest else 0)
+                    ]
+                    tasks.extend(analyzers + backtesters)
+
+                    # 입력 -> 단계 순서로 종료 신호(None) 전달
+                    for strategy in targets:
+                        await analyze_q.put(strategy)
+                    for _ in analyzers:
+                        await analyze_q.put(None)
+                    await asyncio.gather(*analyzers)
+                    for _ in backtesters:
+                        await backtest_q.put(None)
+                    await asyncio.gather(*backtesters)
+                    await write_q.put(None)
+                    await writer
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    if self._pool:
+                        self._pool.shutdown(cancel_futures=True)
+                        self._pool = None
+
+        result.elapsed = time.time() - started
+        logger.info(
+            f"   파이프라인 완료: 분석 {result.analyzed}개, 백테스트 {result.backtested}개, "
+            f"기록 {result.written}건 ({result.elapsed:.1f}s)"
+        )
+        return result
+
+    async def _start_backtest_pool(self, tester: StrategyTester, start_date: str, end_date: str):
+        """시장 데이터를 한 번 받아 백테스트 프로세스 풀에 전달"""
+        cfg = self.config
+        candles = await tester.get_candles(cfg.symbol, cfg.timeframe, start_date, end_date)
+        self._dataset_key = f"{cfg.symbol}|{cfg.timeframe}|{start_date}|{end_date}"
+        if cfg.backtest_workers > 0:
+            self._pool = ProcessPoolExecutor(
+                max_workers=cfg.backtest_workers,
+                initializer=init_backtest_worker,
+                initargs=(tester.fees, tester.slippage, {self._dataset_key: candles}),
+            )
+
+    async def _analyze(self, strategy: StrategyData) -> StrategyAnalysis:
+        # StrategyAnalyzer에 필요한 형식으로 변환
+        strategy_dict = {
+            'scriptId': strategy.script_id,
+            'title': strategy.title,
+            'author': strategy.author,
+            'likes': strategy.boosts,
+            'href': strategy.script_url
+        }
+        if self.config.dry_run:
+            return self.analyzer.analyze_code(strategy_dict, strategy.pine_code)
+        return await self.analyzer.analyze_strategy(strategy_dict)
+
+    async def _analyze_stage(
+        self,
+        inbox: asyncio.Queue,
+        backtest_q: asyncio.Queue,
+        write_q: asyncio.Queue,
+        limiter: Optional[TokenBucket],
+        result: PipelineResult,
+        total: int,
+    ):
+        """분석 작업자: 분석 결과는 기록 큐로, 전략은 백테스트 큐로"""
+        while (strategy := await inbox.get()) is not None:
+            try:
+                if limiter:
+                    await limiter.acquire()
+                analysis = await self._analyze(strategy)
+                analysis_json = build_analysis_json(analysis)
+
+                await write_q.put(('strategy', {
+                    'script_id': strategy.script_id,
+                    'title': strategy.title,
+                    'author': strategy.author,
+                    'likes': strategy.boosts,
+                    'script_url': strategy.script_url,
+                    'analysis': analysis_json
+                }))
+                result.analyzed += 1
+                logger.info(
+                    f"   [분석 {result.analyzed}/{total}] {strategy.title[:35]}... "
+                    f"✅ 등급: {analysis_json['grade']} (점수: {analysis.total_score:.1f})"
+                )
+            except Exception as e:
+                result.failed += 1
+                logger.error(f"   ❌ 분석 실패 ({strategy.title[:35]}): {e}")
+
+            if self.config.run_backtest:
+                await backtest_q.put(strategy)
+
+    async def _compute(self, tester: StrategyTester, job: BacktestJob) -> Tuple[Optional[Dict], Optional[str]]:
+        """컴파일 + 백테스트 (프로세스 풀 또는 스레드)"""
+        if self._pool is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._pool, run_backtest_job, job.python_code, self._dataset_key, job.initial_capital
+            )
+
+        backtest = await asyncio.to_thread(tester.compute_backtest, job.python_code, job.candles, job.initial_capital)
+        return (backtest, None) if backtest is not None else (None, 'Failed to compile strategy')
+
+    async def _backtest_stage(
+        self,
+        tester: StrategyTester,
+        dates: Tuple[str, str],
+        inbox: asyncio.Queue,
+        write_q: asyncio.Queue,
+        result: PipelineResult,
+    ):
+        """백테스트 작업자: 준비(변환/저장소 조회) 후 CPU 작업은 풀로"""
+        cfg = self.config
+        while (strategy := await inbox.get()) is not None:
+            try:
+                job, error = await tester.prepare_backtest(
+                    strategy.script_id, strategy.pine_code, cfg.symbol, cfg.timeframe,
+                    dates[0], dates[1], cfg.initial_capital
+                )
+                backtest = job.cached_result if job else None
+                if job and backtest is None:
+                    backtest, error = await self._compute(tester, job)
+                if error:
+                    logger.warning(f"   ⚠️ 백테스트 실패 ({strategy.title[:35]}): {error}")
+                    continue
+
+                await write_q.put(('backtest', strategy.script_id, tester.complete_backtest(job, backtest)))
+
+                if backtest.get('success'):
+                    result.backtested += 1
+                    result.backtest_results.append(BacktestResult(
+                        strategy_name=strategy.title,
+                        total_return=backtest.get('total_return', 0),
+                        win_rate=backtest.get('win_rate', 0),
+                        max_drawdown=backtest.get('max_drawdown', 0),
+                        sharpe_ratio=backtest.get('sharpe_ratio', 0),
+                        trades=backtest.get('total_trades', 0)
+                    ))
+                    logger.info(
+                        f"   [백테스트] {strategy.title[:35]}... ✅ 수익률: {backtest.get('total_return', 0):.1f}%, "
+                        f"승률: {backtest.get('win_rate', 0):.1f}%, MDD: {backtest.get('max_drawdown', 0):.1f}%"
+                    )
+            except Exception as e:
+                logger.error(f"   ❌ 백테스트 오류 ({strategy.title[:35]}): {e}")
+
+    async def _write_stage(self, db: StrategyDatabase, inbox: asyncio.Queue, result: PipelineResult):
+        """DB 기록기: K건이 모이거나 입력이 끊기면 한 트랜잭션으로 커밋"""
+        cfg = self.config
+        strategies: List[Dict] = []
+        backtests: List[Tuple[str, Dict]] = []
+        done = False
+
+        while not done:
+            idle = False
+            try:
+                item = await asyncio.wait_for(inbox.get(), timeout=cfg.flush_interval)
+            except asyncio.TimeoutError:
+                item, idle = (), True
+
+            if item is None:
+                done = True
+            elif item and item[0] == 'strategy':
+                strategies.append(item[1])
+            elif item:
+                backtests.append((item[1], item[2]))
+
+            pending = len(strategies) + len(backtests)
+            if pending and (done or idle or pending >= cfg.write_batch_size):
+                await self._flush(db, strategies, backtests, result)
+                strategies, backtests = [], []
+
+    async def _flush(
+        self,
+        db: StrategyDatabase,
+        strategies: List[Dict],
+        backtests: List[Tuple[str, Dict]],
+        result: PipelineResult,
+    ):
+        count = len(strategies) + len(backtests)
+        if self.config.dry_run:
+            logger.info(f"   [dry-run] {count}건 기록 생략 (분석 {len(strategies)}, 백테스트 {len(backtests)})")
+            return
+        try:
+            result.written += await db.write_batch(strategies, backtests)
+            logger.debug(f"   💾 {count}건 커밋")
+        except Exception as e:
+            result.write_errors += count
+            logger.error(f"   ❌ DB 배치 저장 실패 ({count}건): {e}")
@@ -170,14 +170,7 @@ class StrategyAnalyzer:
 
                 await browser.close()
 
-            # 코드 분석 (Pine 코드가 있는 경우)
-            if analysis.pine_code:
-                analysis.pine_version = self._detect_version(analysis.pine_code)
-                analysis.repainting_issues = self._check_repainting(analysis.pine_code)
-                analysis.overfitting_issues = self._check_overfitting(analysis.pine_code, analysis.performance)
-
-            # 점수 계산
-            self._calculate_scores(analysis)
+            self._analyze_code(analysis)
 
         except Exception as e:
             analysis.error = str(e)
@@ -185,6 +178,31 @@ class StrategyAnalyzer:
 
         return analysis
 
+    def analyze_code(self, strategy: Dict, pine_code: str, performance: Optional[Dict] = None) -> StrategyAnalysis:
+        """이미 수집한 코드로 분석 (브라우저 없이, dry-run/재분석용)"""
+        analysis = StrategyAnalysis(
+            script_id=strategy.get('scriptId', ''),
+            title=strategy.get('title', ''),
+            author=strategy.get('author', ''),
+            likes=strategy.get('likes', 0),
+            script_url=strategy.get('href', ''),
+            pine_code=pine_code,
+            performance=performance or {}
+        )
+        self._analyze_code(analysis)
+        return analysis
+
+    def _analyze_code(self, analysis: StrategyAnalysis):
+        """코드 분석 + 점수 계산"""
+        # 코드 분석 (Pine 코드가 있는 경우)
+        if analysis.pine_code:
+            analysis.pine_version = self._detect_version(analysis.pine_code)
+            analysis.repainting_issues = self._check_repainting(analysis.pine_code)
+            analysis.overfitting_issues = self._check_overfitting(analysis.pine_code, analysis.performance)
+
+        # 점수 계산
+        self._calculate_scores(analysis)
+
     def _detect_version(self, code: str) -> int:
         """Pine Script 버전 감지"""
         import re
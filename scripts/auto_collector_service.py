@@ -19,18 +19,20 @@ import time
 import traceback
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 # 프로젝트 루트 설정
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.analyzer.sentiment_analyzer import get_sentiment_analyzer
 from src.collector.human_like_scraper import HumanLikeScraper, StrategyData
-from src.collector.pine_fetcher import PineCodeFetcher
+from src.collector.pine_fetcher import PineCodeData, PineFetcherPool
+from src.collector.session_manager import RateLimitConfig, SessionManager
 from src.storage.database import StrategyDatabase
-from src.backtester.strategy_tester import StrategyTester
+from src.storage.models import SearchFilters
 from src.notification.telegram_bot import TelegramNotifier, BacktestResult
-from scripts.analyze_strategies import StrategyAnalyzer
+from scripts.analysis_pipeline import AnalysisPipeline, PipelineConfig, PipelineResult
 
 # 로깅 설정
 LOG_DIR = project_root / "logs"
@@ -69,7 +71,13 @@ class AutoCollectorService:
         max_pages: int = 100,
         run_backtest: bool = True,
         backtest_symbol: str = "BTC/USDT",
-        backtest_timeframe: str = "1h"
+        backtest_timeframe: str = "1h",
+        fetch_concurrency: int = 4,
+        fetch_rate_per_minute: int = 120,
+        analyzer_workers: int = 3,
+        backtest_workers: int = 2,
+        write_batch_size: int = 20,
+        db_path: Optional[str] = None
     ):
         self.collect_interval = timedelta(hours=collect_interval_hours)
         self.target_count = target_count
@@ -78,6 +86,11 @@ class AutoCollectorService:
         self.run_backtest = run_backtest
         self.backtest_symbol = backtest_symbol
         self.backtest_timeframe = backtest_timeframe
+        self.fetch_concurrency = fetch_concurrency  # 동시 브라우저 컨텍스트 수
+        self.fetch_rate_per_minute = fetch_rate_per_minute  # 코드 추출 전체 요청 속도
+        self.analyzer_workers = analyzer_workers  # 동시 AI 분석 수
+        self.backtest_workers = backtest_workers  # 백테스트 프로세스 수
+        self.write_batch_size = write_batch_size  # 분석/백테스트 결과 커밋 단위
         self.running = True
         self.total_collected = 0
         self.total_backtested = 0
@@ -87,7 +100,7 @@ class AutoCollectorService:
         self.consecutive_errors = 0
 
         # 데이터베이스 경로
-        self.db_path = str(project_root / "data" / "strategies.db")
+        self.db_path = db_path or str(project_root / "data" / "strategies.db")
 
         # 텔레그램 알림 (환경변수 미설정 시 None으로 비활성화)
         self.telegram = TelegramNotifier(
@@ -115,6 +128,7 @@ class AutoCollectorService:
         collected = 0
         backtested = 0
         strategies_with_code = []
+        pending = []
         strategies = []
 
         try:
@@ -153,8 +167,8 @@ class AutoCollectorService:
             # 2단계: Pine Script 코드 추출
             logger.info(f"\n📜 2단계: Pine Script 코드 추출")
             try:
-                strategies_with_code = await self._extract_pine_codes(strategies)
-                logger.info(f"✅ 코드 추출 완료: {len(strategies_with_code)}개")
+                strategies_with_code, pending = await self._extract_pine_codes(strategies)
+                logger.info(f"✅ 코드 추출 완료: {len(strategies_with_code)}개 (분석 대상 {len(pending)}개)")
             except Exception as e:
                 error_msg = f"코드 추출 실패: {str(e)}"
                 logger.error(error_msg, exc_info=True)
@@ -171,31 +185,26 @@ class AutoCollectorService:
                 if self.telegram:
                     await self.telegram.notify_error("DB 저장 오류", error_msg)
 
-            # 4단계: AI 분석 (analysis_json 생성)
-            logger.info(f"\n🤖 4단계: AI 품질 분석")
-            analyzed_count = 0
+            # 4~5단계: AI 분석 + 백테스트 (단계형 파이프라인)
+            logger.info(f"\n🤖 4~5단계: AI 품질 분석 + 백테스트")
+            backtest_results = []
             try:
-                analyzed_count = await self._analyze_strategies(strategies_with_code)
-                logger.info(f"✅ AI 분석 완료: {analyzed_count}개")
+                pipeline_result = await self._analyze_and_backtest(pending)
+                backtested = pipeline_result.backtested
+                backtest_results = pipeline_result.backtest_results
+                self.total_backtested += backtested
+                logger.info(f"✅ AI 분석 완료: {pipeline_result.analyzed}개, 백테스트 완료: {backtested}개")
+                if pipeline_result.write_errors and self.telegram:
+                    await self.telegram.notify_error(
+                        "DB 저장 경고",
+                        f"분석/백테스트 결과 {pipeline_result.write_errors}건 저장 실패",
+                        f"성공: {pipeline_result.written}건"
+                    )
             except Exception as e:
-                error_msg = f"AI 분석 실패: {str(e)}"
+                error_msg = f"AI 분석/백테스트 실패: {str(e)}"
                 logger.error(error_msg, exc_info=True)
                 if self.telegram:
-                    await self.telegram.notify_error("AI 분석 오류", error_msg)
-
-            # 5단계: 백테스트 실행 (옵션)
-            backtest_results = []
-            if self.run_backtest and strategies_with_code:
-                logger.info(f"\n🧪 5단계: 백테스트 실행")
-                try:
-                    backtested, backtest_results = await self._run_backtests(strategies_with_code)
-                    self.total_backtested += backtested
-                    logger.info(f"✅ 백테스트 완료: {backtested}개")
-                except Exception as e:
-                    error_msg = f"백테스트 실패: {str(e)}"
-                    logger.error(error_msg, exc_info=True)
-                    if self.telegram:
-                        await self.telegram.notify_error("백테스트 오류", error_msg)
+                    await self.telegram.notify_error("AI 분석/백테스트 오류", error_msg)
 
             # 6단계: HTML 리포트 생성
             logger.info(f"\n📊 6단계: HTML 리포트 생성")
@@ -245,7 +254,7 @@ class AutoCollectorService:
                 top_performers = sorted_results[:5]
 
                 await self.telegram.notify_backtest_complete(
-                    total_tested=len(strategies_with_code),
+                    total_tested=len(pending),
                     successful=backtested,
                     top_performers=top_performers
                 )
@@ -287,43 +296,82 @@ class AutoCollectorService:
 
             return 0
 
-    async def _extract_pine_codes(self, strategies: List[StrategyData]) -> List[StrategyData]:
-        """Pine Script 코드 추출"""
-        fetcher = PineCodeFetcher()
-        strategies_with_code = []
-        failed_count = 0
-
-        for i, strategy in enumerate(strategies, 1):
-            try:
-                logger.info(f"   [{i}/{len(strategies)}] {strategy.title[:40]}...")
-
-                result = await fetcher.fetch_pine_code(strategy.script_url)
+    async def _extract_pine_codes(
+        self, strategies: List[StrategyData]
+    ) -> Tuple[List[StrategyData], List[StrategyData]]:
+        """
+        Pine Script 코드 추출 (컨텍스트 풀 병렬, 저장된 코드와 같으면 성과/설명 추출 생략)
 
-                if result.pine_code and not result.is_protected:
-                    strategy.pine_code = result.pine_code
-                    strategy.pine_version = result.pine_version
-                    strategies_with_code.append(strategy)
-                    logger.info(f"      ✅ 코드 추출 성공 ({len(result.pine_code)} bytes, v{result.pine_version})")
-                else:
-                    logger.warning(f"      ⚠️ 코드 없음 (비공개 또는 보호됨)")
-                    failed_count += 1
+        변경 여부는 페이지에서 추출한 코드의 해시로 판단하므로 페이지는 전략마다 로드합니다.
 
-                await asyncio.sleep(1)
+        Returns:
+            (저장할 전략, 분석/백테스트할 전략)
+            코드가 바뀌지 않은 전략도 목록 정보(좋아요/부스트, 제목)를 갱신하도록 저장 대상에 넣고,
+            저장된 분석 결과(백테스트 사용 시 백테스트 결과 포함)가 없을 때만 분석 대상에 넣습니다.
+        """
+        strategies_with_code = []
+        pending = []
+        failed_count = 0
+        unchanged_count = 0
 
-            except Exception as e:
-                logger.error(f"      ❌ 추출 실패: {e}")
+        # 저장된 코드 해시 (변경 없는 전략은 성과/설명 추출 생략)
+        async with StrategyDatabase(self.db_path) as db:
+            known_hashes = await db.get_code_hashes([s.script_id for s in strategies])
+            stored = await db.get_stored_code(list(known_hashes))
+
+        session = SessionManager(rate_limit=RateLimitConfig(
+            requests_per_minute=self.fetch_rate_per_minute,
+            burst=self.fetch_concurrency,
+        ))
+
+        def on_result(index: int, result: PineCodeData):
+            title = strategies[index].title[:40]
+            if result.unchanged:
+                logger.info(f"   [{index + 1}/{len(strategies)}] {title}... ⏭️ 변경 없음, 스킵")
+            elif result.pine_code and not result.is_protected:
+                logger.info(f"   [{index + 1}/{len(strategies)}] {title}... "
+                            f"✅ 코드 추출 성공 ({len(result.pine_code)} bytes, v{result.pine_version})")
+            elif result.error:
+                logger.error(f"   [{index + 1}/{len(strategies)}] {title}... ❌ 추출 실패: {result.error}")
+            else:
+                logger.warning(f"   [{index + 1}/{len(strategies)}] {title}... ⚠️ 코드 없음 (비공개 또는 보호됨)")
+
+        async with PineFetcherPool(concurrency=self.fetch_concurrency, session=session) as pool:
+            results = await pool.fetch_many(
+                [s.script_url for s in strategies], known_hashes, on_result=on_result
+            )
+
+        for strategy, result in zip(strategies, results):
+            if result.unchanged and strategy.script_id in stored:
+                unchanged_count += 1
+                saved = stored[strategy.script_id]
+                strategy.pine_code = saved["pine_code"]
+                strategy.pine_version = saved["pine_version"]
+                strategies_with_code.append(strategy)
+                if not saved["analyzed"] or (self.run_backtest and not saved["backtested"]):
+                    pending.append(strategy)
+            elif result.pine_code and not result.is_protected:
+                strategy.pine_code = result.pine_code
+                strategy.pine_version = result.pine_version
+                strategies_with_code.append(strategy)
+                pending.append(strategy)
+            else:
                 failed_count += 1
 
+        if unchanged_count:
+            logger.info(f"   변경 없는 전략 {unchanged_count}개 (목록 정보만 갱신, "
+                        f"재분석 {unchanged_count - (len(strategies_with_code) - len(pending))}개)")
+
         # 추출 실패율이 높으면 경고
         if len(strategies) > 0 and failed_count / len(strategies) > 0.5:
             if self.telegram:
                 await self.telegram.notify_error(
                     "코드 추출 경고",
-                    f"추출 성공률이 낮습니다: {len(strategies_with_code)}/{len(strategies)} ({100-failed_count/len(strategies)*100:.0f}%)",
+                    f"추출 성공률이 낮습니다: {len(strategies) - failed_count}/{len(strategies)} ({100-failed_count/len(strategies)*100:.0f}%)",
                     "TradingView API 접근에 문제가 있을 수 있습니다."
                 )
 
-        return strategies_with_code
+        return strategies_with_code, pending
 
     async def _save_to_database(self, strategies: List[StrategyData]):
         """데이터베이스에 저장 (컨텍스트 매니저 사용)"""
@@ -362,137 +410,51 @@ class AutoCollectorService:
             logger.error(f"❌ DB 저장 오류: {e}")
             raise
 
-    async def _analyze_strategies(self, strategies: List[StrategyData]) -> int:
-        """AI 품질 분석 및 analysis_json 생성 (컨텍스트 매니저 사용)"""
-        import json
-        from dataclasses import asdict
-
-        analyzer = StrategyAnalyzer(headless=True)
-        analyzed_count = 0
-
-        # 리소스 관리: 컨텍스트 매니저로 자동 정리
-        async with StrategyDatabase(self.db_path) as db:
-            for i, strategy in enumerate(strategies, 1):
-                if not hasattr(strategy, 'pine_code') or not strategy.pine_code:
-                    logger.info(f"   [{i}/{len(strategies)}] {strategy.title[:35]}... ⚠️ 코드 없음, 스킵")
-                    continue
-
-                try:
-                    logger.info(f"   [{i}/{len(strategies)}] {strategy.title[:35]}... 분석 중")
-
-                    # StrategyAnalyzer에 필요한 형식으로 변환
-                    strategy_dict = {
-                        'scriptId': strategy.script_id,
-                        'title': strategy.title,
-                        'author': strategy.author,
-                        'likes': strategy.boosts,
-                        'href': strategy.script_url
-                    }
-
-                    # AI 분석 실행
-                    analysis = await analyzer.analyze_strategy(strategy_dict)
-
-                    # 등급 계산 (A, B, C, D, F)
-                    total_score = analysis.total_score
-                    if total_score >= 80:
-                        grade = 'A'
-                    elif total_score >= 70:
-                        grade = 'B'
-                    elif total_score >= 60:
-                        grade = 'C'
-                    elif total_score >= 50:
-                        grade = 'D'
-                    else:
-                        grade = 'F'
-
-                    # analysis_json 생성
-                    analysis_json = {
-                        'grade': grade,
-                        'total_score': round(total_score, 1),
-                        'code_score': round(analysis.code_score, 1),
-                        'performance_score': round(analysis.performance_score, 1),
-                        'quality_score': round(analysis.quality_score, 1),
-                        'repainting_score': 100 - len(analysis.repainting_issues) * 10,
-                        'overfitting_score': 100 - len(analysis.overfitting_issues) * 10,
-                        'repainting_issues': analysis.repainting_issues,
-                        'overfitting_issues': analysis.overfitting_issues,
-                        'analyzed_at': datetime.now().isoformat()
-                    }
-
-                    # DB 업데이트: 필수 필드 포함, analysis는 딕셔너리로 전달 (json.dumps 제거)
-                    await db.upsert_strategy({
-                        'script_id': strategy.script_id,
-                        'title': strategy.title,
-                        'author': strategy.author,
-                        'likes': strategy.boosts,
-                        'script_url': strategy.script_url,
-                        'analysis': analysis_json  # json.dumps 제거 (DB 레이어에서 처리)
-                    })
-
-                    analyzed_count += 1
-                    logger.info(f"      ✅ 등급: {grade} (점수: {total_score:.1f})")
-
-                    await asyncio.sleep(0.5)  # Rate limiting
-
-                except Exception as e:
-                    logger.error(f"      ❌ 분석 실패: {e}")
-
-        return analyzed_count
-
-    async def _run_backtests(self, strategies: List[StrategyData]) -> tuple[int, List[BacktestResult]]:
-        """백테스트 실행"""
-        tester = StrategyTester(self.db_path)
-        backtested = 0
-        results = []
-
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=180)).strftime("%Y-%m-%d")
-
-        for i, strategy in enumerate(strategies, 1):
-            if not hasattr(strategy, 'pine_code') or not strategy.pine_code:
-                continue
-
-            try:
-                logger.info(f"   [{i}/{len(strategies)}] 백테스트: {strategy.title[:35]}...")
-
-                result = await tester.test_strategy(
-                    script_id=strategy.script_id,
-                    symbol=self.backtest_symbol,
-                    timeframe=self.backtest_timeframe,
-                    start_date=start_date,
-                    end_date=end_date
-                )
+    def _pipeline_config(self, dry_run: bool = False) -> PipelineConfig:
+        return PipelineConfig(
+            analyzer_workers=self.analyzer_workers,
+            backtest_workers=self.backtest_workers,
+            write_batch_size=self.write_batch_size,
+            run_backtest=self.run_backtest,
+            symbol=self.backtest_symbol,
+            timeframe=self.backtest_timeframe,
+            dry_run=dry_run,
+        )
 
-                if result.get('success'):
-                    backtest = result.get('backtest', {})
-                    total_return = backtest.get('total_return', 0)
-                    win_rate = backtest.get('win_rate', 0)
-                    max_drawdown = backtest.get('max_drawdown', 0)
-                    sharpe = backtest.get('sharpe_ratio', 0)
-                    trades = backtest.get('total_trades', 0)
-
-                    logger.info(f"      ✅ 수익률: {total_return:.1f}%, "
-                              f"승률: {win_rate:.1f}%, "
-                              f"MDD: {max_drawdown:.1f}%")
-
-                    results.append(BacktestResult(
-                        strategy_name=strategy.title,
-                        total_return=total_return,
-                        win_rate=win_rate,
-                        max_drawdown=max_drawdown,
-                        sharpe_ratio=sharpe,
-                        trades=trades
-                    ))
-                    backtested += 1
-                else:
-                    logger.warning(f"      ⚠️ 실패: {result.get('error', 'Unknown')}")
-
-                await asyncio.sleep(0.5)
+    async def _analyze_and_backtest(self, strategies: List[StrategyData]) -> PipelineResult:
+        """AI 품질 분석(analysis_json) + 백테스트 + 배치 DB 저장"""
+        pipeline = AnalysisPipeline(self.db_path, self._pipeline_config())
+        return await pipeline.run(strategies)
 
-            except Exception as e:
-                logger.error(f"      ❌ 백테스트 오류: {e}")
+    async def run_dry_run(self, limit: int = 50) -> PipelineResult:
+        """
+        DB에 저장된 코드로 파이프라인만 실행 (수집/브라우저/거래소/DB 기록/알림 없음)
 
-        return backtested, results
+        --db로 로컬 픽스처 DB를 지정해 단계별 설정과 처리 시간을 확인할 때 사용합니다.
+        """
+        async with StrategyDatabase(self.db_path) as db:
+            rows = await db.search_strategies(SearchFilters(
+                has_pine_code=True, limit=limit, order_by='likes', order_desc=True
+            ))
+
+        strategies = [
+            StrategyData(
+                script_id=row.script_id,
+                title=row.title,
+                author=row.author,
+                boosts=row.likes,
+                script_url=row.script_url or "",
+                pine_code=row.pine_code,
+                pine_version=row.pine_version or 5,
+            )
+            for row in rows
+        ]
+        logger.info(f"🧪 dry-run: {self.db_path}에서 {len(strategies)}개 전략 로드")
+
+        result = await AnalysisPipeline(self.db_path, self._pipeline_config(dry_run=True)).run(strategies)
+        logger.info(f"🧪 dry-run 완료: 분석 {result.analyzed}개, 백테스트 {result.backtested}개, "
+                    f"실패 {result.failed}개, {result.elapsed:.1f}s")
+        return result
 
     async def _generate_report(self):
         """HTML 리포트 생성"""
@@ -549,6 +511,12 @@ class AutoCollectorService:
             logger.info(f"   백테스트 설정: {self.backtest_symbol} / {self.backtest_timeframe}")
         logger.info("=" * 60)
 
+        # 감성 분석 모델은 요청 경로에서 로드하지 않으므로 시작 시 한 번 로드
+        if await asyncio.to_thread(get_sentiment_analyzer().warmup):
+            logger.info("✅ FinBERT 모델 로드 완료")
+        else:
+            logger.info("ℹ️ FinBERT 사용 불가 - 규칙 기반 감성 분석만 사용")
+
         # 서비스 시작 알림
         if self.telegram:
             await self.telegram.notify_service_start()
@@ -617,6 +585,14 @@ async def main():
     parser.add_argument('--no-backtest', action='store_true', help='백테스트 비활성화')
     parser.add_argument('--symbol', type=str, default='BTC/USDT', help='백테스트 심볼 (기본: BTC/USDT)')
     parser.add_argument('--timeframe', type=str, default='1h', help='백테스트 타임프레임 (기본: 1h)')
+    parser.add_argument('--fetch-concurrency', type=int, default=4, help='코드 추출 동시 컨텍스트 수 (기본: 4)')
+    parser.add_argument('--fetch-rpm', type=int, default=120, help='코드 추출 분당 요청 수 (기본: 120)')
+    parser.add_argument('--analyzer-workers', type=int, default=3, help='동시 AI 분석 수 (기본: 3)')
+    parser.add_argument('--backtest-workers', type=int, default=2, help='백테스트 프로세스 수 (기본: 2, 0이면 단일 스레드)')
+    parser.add_argument('--write-batch', type=int, default=20, help='결과 DB 커밋 단위 (기본: 20)')
+    parser.add_argument('--db', type=str, default=None, help='전략 DB 경로 (기본: data/strategies.db)')
+    parser.add_argument('--dry-run', action='store_true', help='DB에 저장된 코드로 분석/백테스트만 실행 (기록/알림 없음)')
+    parser.add_argument('--dry-run-limit', type=int, default=50, help='dry-run 전략 수 (기본: 50)')
     parser.add_argument('--test-telegram', action='store_true', help='텔레그램 연결 테스트')
     args = parser.parse_args()
 
@@ -642,10 +618,18 @@ async def main():
         max_pages=args.max_pages,
         run_backtest=not args.no_backtest,
         backtest_symbol=args.symbol,
-        backtest_timeframe=args.timeframe
+        backtest_timeframe=args.timeframe,
+        fetch_concurrency=args.fetch_concurrency,
+        fetch_rate_per_minute=args.fetch_rpm,
+        analyzer_workers=args.analyzer_workers,
+        backtest_workers=args.backtest_workers,
+        write_batch_size=args.write_batch,
+        db_path=args.db
     )
 
-    if args.once:
+    if args.dry_run:
+        await service.run_dry_run(limit=args.dry_run_limit)
+    elif args.once:
         # 1회 수집
         await service.run_collection()
     else:
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+전략 검색 벤치마크 (LIKE vs FTS5)
+
+합성 전략 N개(기본 100,000)를 임시 DB에 생성하고
+기존 LIKE 검색과 FTS5 전문 검색(BM25 + 스니펫)의 지연 시간을 비교
+
+사용법:
+    python scripts/benchmark_search.py --rows 100000 --repeat 20
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.storage.schema import ensure_schema
+from src.storage.schema import FTS_TABLE
+from src.storage.search import TEXT_COLUMNS, build_match_query, search_strategies
+
+
+INDICATORS = ["EMA", "SMA", "RSI", "MACD", "Bollinger", "Supertrend", "Ichimoku", "ATR",
+              "Stochastic", "VWAP", "Keltner", "Donchian", "Parabolic", "ADX", "CCI"]
+STYLES = ["Crossover", "Breakout", "Reversal", "Scalper", "Swing", "Trend", "Momentum",
+          "Divergence", "Squeeze", "Channel", "Grid", "Pullback"]
+WORDS = ["volatility", "filter", "entry", "exit", "stop", "loss", "profit", "target",
+         "signal", "confirmation", "higher", "timeframe", "volume", "trend", "range",
+         "market", "session", "risk", "position", "sizing", "adaptive", "smoothing"]
+
+QUERIES = ["supertrend", "ema cross", "diverg", "volatility breakout", "squeeze momentum", "author4242", "nomatch"]
+
+
+def build_corpus(db_path: Path, rows: int):
+    """합성 전략 생성 (트리거가 FTS 인덱스를 채움)"""
+    rng = random.Random(7)
+    conn = sqlite3.connect(str(db_path))
+    ensure_schema(conn)
+
+    def row(i):
+        a, b = rng.sample(INDICATORS, 2)
+        title = f"{a} {rng.choice(STYLES)} {b} v{rng.randint(1, 9)}"
+        description = " ".join(rng.choices(WORDS, k=40))
+        pine_code = "\n".join(
+            f"{rng.choice(WORDS)}_{j} = ta.{a.lower()}(close, {rng.randint(5, 50)})" for j in range(10)
+        )
+        return (f"SYN{i:07d}", title, f"author{i % 5000}", rng.randint(0, 10000), description, pine_code)
+
+    start = time.perf_counter()
+    conn.executemany(
+        "INSERT INTO strategies (script_id, title, author, likes, description, pine_code) VALUES (?, ?, ?, ?, ?, ?)",
+        (row(i) for i in range(rows)),
+    )
+    conn.commit()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def like_search(conn: sqlite3.Connection, text: str, limit: int = 20):
+    """기존 방식: 키워드별 title/author/description LIKE"""
+    conditions, params = [], []
+    for keyword in text.split():
+        conditions.append("(title LIKE ? OR author LIKE ? OR description LIKE ?)")
+        params += [f"%{keyword}%"] * 3
+    return conn.execute(
+        f"SELECT script_id, title FROM strategies WHERE {' AND '.join(conditions)} "
+        f"ORDER BY likes DESC LIMIT ?",
+        params + [limit],
+    ).fetchall()
+
+
+def measure(func, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), max(timings), len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LIKE vs FTS5 검색 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="합성 전략 수")
+    parser.add_argument("--repeat", type=int, default=20, help="쿼리당 반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        build_time = build_corpus(db_path, args.rows)
+
+        conn = sqlite3.connect(str(db_path))
+        conn.row_factory = sqlite3.Row
+
+        print("=" * 78)
+        print(f"합성 전략 {args.rows:,}개 생성 + 인덱싱: {build_time:.1f}s")
+        print("=" * 78)
+        print(f"{'query':<22} {'matches':>8} {'LIKE p50':>10} {'FTS p50':>10} {'FTS+code p50':>13} {'speedup':>9}")
+
+        for query in QUERIES:
+            matches = conn.execute(
+                f"SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?",
+                (build_match_query(query, TEXT_COLUMNS),),
+            ).fetchone()[0]
+            like_p50, _, _ = measure(lambda: like_search(conn, query), args.repeat)
+            fts_p50, _, _ = measure(lambda: search_strategies(conn, query), args.repeat)
+            code_p50, _, _ = measure(
+                lambda: search_strategies(conn, query, include_code=True), args.repeat
+            )
+            print(
+                f"{query:<22} {matches:>8,} {like_p50:>8.2f}ms {fts_p50:>8.2f}ms {code_p50:>11.2f}ms "
+                f"{like_p50 / fts_p50:>8.1f}x"
+            )
+
+        print("-" * 78)
+        print("LIKE는 좋아요 순 인덱스를 따라가다 20건을 채우면 멈추므로 흔한 단어는 빠르지만")
+        print("관련도 순위가 없고, 일치가 적거나 없으면 전체 스캔이 됩니다.")
+        print("FTS는 일치한 문서 수에 비례해 BM25를 계산합니다.")
+
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+FinBERT 추론 처리량 벤치마크 (CPU, sentences/sec)
+
+합성 전략 설명 문장 N개를 다음 경로로 분석해 처리량을 비교
+- 순차: 문장마다 한 번씩 추론 (batch_size=1, 기존 방식과 같은 비용)
+- 배치: 동적 배칭 + 길이 버킷 패딩
+- 배치 + int8 동적 양자화 (--quantize)
+- 배치 + ONNX Runtime (--onnx, onnxruntime 필요)
+
+캐시 효과를 빼기 위해 모든 문장은 서로 다르며 경로마다 새 분석기를 씁니다.
+
+사용법:
+    python scripts/benchmark_sentiment.py --sentences 512 --threads 4 --quantize --onnx
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.analyzer.sentiment_analyzer import (
+    ONNXRUNTIME_AVAILABLE,
+    TRANSFORMERS_AVAILABLE,
+    FinBERTAnalyzer,
+)
+
+
+SUBJECTS = ["This strategy", "The indicator", "Our system", "The backtest", "This setup", "The model"]
+VERBS = ["shows", "delivers", "reports", "produces", "suffers", "avoids"]
+OBJECTS = ["steady profit", "a large drawdown", "consistent returns", "heavy losses",
+           "a 55% win rate", "low volatility", "strong momentum", "false signals"]
+TAILS = ["on BTC/USDT", "in ranging markets", "during high volatility", "on the 4h timeframe",
+         "with tight stops", "since 2020", "across 300 trades", "with no leverage"]
+
+
+def build_sentences(count: int):
+    rng = random.Random(7)
+    sentences = []
+    for i in range(count):
+        words = [rng.choice(SUBJECTS), rng.choice(VERBS), rng.choice(OBJECTS), rng.choice(TAILS)]
+        if i % 4 == 0:  # 긴 문장 섞기 (버킷 분산)
+            words += ["and"] + [rng.choice(TAILS) for _ in range(rng.randint(2, 8))]
+        sentences.append(" ".join(words) + f" (#{i})")
+    return sentences
+
+
+def measure(analyzer: FinBERTAnalyzer, sentences, threads: int, per_sentence: bool):
+    """호출자 threads개가 문장을 나눠 분석 -> sentences/sec"""
+    chunks = [sentences[i::threads] for i in range(threads)]
+
+    def run(chunk):
+        if per_sentence:
+            return [analyzer.analyze_sentiment(s) for s in chunk]
+        return analyzer.analyze_sentences(chunk)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = [r for chunk in pool.map(run, chunks) for r in chunk]
+    elapsed = time.perf_counter() - start
+
+    errors = sum(1 for r in results if "error" in r.scores)
+    return len(sentences) / elapsed, elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FinBERT CPU 처리량 벤치마크")
+    parser.add_argument("--sentences", type=int, default=256, help="문장 수")
+    parser.add_argument("--threads", type=int, default=4, help="동시 호출자 수")
+    parser.add_argument("--batch-size", type=int, default=32, help="최대 배치 크기")
+    parser.add_argument("--torch-threads", type=int, default=0, help="torch intra-op 스레드 수 (0=기본)")
+    parser.add_argument("--quantize", action="store_true", help="int8 동적 양자화 경로 포함")
+    parser.add_argument("--onnx", action="store_true", help="ONNX Runtime 경로 포함")
+    args = parser.parse_args()
+
+    if not TRANSFORMERS_AVAILABLE:
+        print("transformers / torch가 필요합니다: pip install transformers torch")
+        return 1
+
+    if args.torch_threads:
+        import torch
+        torch.set_num_threads(args.torch_threads)
+
+    sentences = build_sentences(args.sentences)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        configs = [
+            ("sequential (batch=1)", dict(batch_size=1, max_wait_ms=0), True),
+            (f"batched (batch={args.batch_size})", dict(batch_size=args.batch_size), False),
+        ]
+        if args.quantize:
+            configs.append(("batched + int8", dict(batch_size=args.batch_size, quantize=True), False))
+        if args.onnx:
+            if ONNXRUNTIME_AVAILABLE:
+                onnx_path = str(Path(tmp) / "finbert.onnx")
+                FinBERTAnalyzer().export_onnx(onnx_path)
+                configs.append(("batched + onnx", dict(batch_size=args.batch_size, onnx_path=onnx_path), False))
+            else:
+                print("onnxruntime이 없어 ONNX 경로를 건너뜁니다.")
+
+        print("=" * 72)
+        print(f"문장 {len(sentences):,}개, 호출자 {args.threads}개 (CPU)")
+        print("=" * 72)
+        print(f"{'path':<26} {'warmup':>8} {'elapsed':>9} {'sent/s':>9} {'avg batch':>10} {'speedup':>8}")
+
+        baseline = None
+        for name, kwargs, per_sentence in configs:
+            analyzer = FinBERTAnalyzer(cache_size=0, **kwargs)
+            start = time.perf_counter()
+            if not analyzer.warmup():
+                print(f"{name:<26} 모델 로드 실패")
+                continue
+            warmup = time.perf_counter() - start
+
+            rate, elapsed, errors = measure(analyzer, sentences, args.threads, per_sentence)
+            stats = analyzer.get_stats()
+            analyzer.close()
+
+            baseline = baseline or rate
+            print(
+                f"{name:<26} {warmup:>7.1f}s {elapsed:>8.2f}s {rate:>9.1f} "
+                f"{stats['avg_batch_size']:>10.1f} {rate / baseline:>7.1f}x"
+                + (f"  (errors: {errors})" if errors else "")
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
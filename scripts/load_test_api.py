@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+API 부하 테스트
+
+동시 클라이언트 N개로 /api/strategies, /api/stats를 호출하여 p50/p99 지연 측정
+
+사용법:
+    # 합성 DB로 인프로세스 실행 (서버 불필요)
+    python scripts/load_test_api.py --clients 200 --requests 5 --strategies 5000
+
+    # 실행 중인 서버 대상
+    python scripts/load_test_api.py --url http://localhost:8080
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+ENDPOINTS = [
+    "/api/strategies?limit=50",
+    "/api/strategies?limit=50&sort_by=score",
+    "/api/strategies?limit=20&grade=A",
+    "/api/stats",
+]
+
+
+async def seed_database(db_path: Path, count: int):
+    """합성 전략 데이터 생성"""
+    from src.storage.database import StrategyDatabase
+
+    # 스키마 생성
+    async with StrategyDatabase(str(db_path)):
+        pass
+
+    rng = random.Random(42)
+    rows = []
+    for i in range(count):
+        score = round(rng.uniform(20, 95), 1)
+        grade = "A" if score >= 85 else "B" if score >= 70 else "C" if score >= 55 else "D" if score >= 40 else "F"
+        analysis = {
+            "total_score": score,
+            "grade": grade,
+            "repainting_score": round(rng.uniform(0, 100), 1),
+            "overfitting_score": round(rng.uniform(0, 100), 1),
+        }
+        rows.append((
+            f"LOAD{i:06d}",
+            f"Synthetic Strategy {i}",
+            f"author{i % 500}",
+            rng.randint(0, 5000),
+            json.dumps(analysis),
+        ))
+
+    conn = sqlite3.connect(str(db_path))
+    conn.executemany(
+        "INSERT OR REPLACE INTO strategies (script_id, title, author, likes, analysis_json) "
+        "VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_clients(client: httpx.AsyncClient, clients: int, requests: int) -> dict:
+    """클라이언트별로 엔드포인트를 순환 호출하고 지연 시간 수집"""
+    latencies = {endpoint: [] for endpoint in ENDPOINTS}
+    errors = 0
+
+    async def worker(worker_id: int):
+        nonlocal errors
+        for i in range(requests):
+            endpoint = ENDPOINTS[(worker_id + i) % len(ENDPOINTS)]
+            start = time.perf_counter()
+            response = await client.get(endpoint)
+            latencies[endpoint].append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(i) for i in range(clients)])
+    elapsed = time.perf_counter() - start
+
+    return {"latencies": latencies, "errors": errors, "elapsed": elapsed}
+
+
+def print_report(result: dict, clients: int):
+    total = sum(len(v) for v in result["latencies"].values())
+
+    print("=" * 60)
+    print(f"동시 클라이언트: {clients}  총 요청: {total}  오류: {result['errors']}")
+    print(f"소요 시간: {result['elapsed']:.2f}s  처리량: {total / result['elapsed']:.1f} req/s")
+    print("=" * 60)
+    print(f"{'endpoint':<45} {'p50(ms)':>8} {'p99(ms)':>8}")
+    for endpoint, values in result["latencies"].items():
+        if values:
+            print(f"{endpoint:<45} {statistics.median(values):>8.1f} {percentile(values, 99):>8.1f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="API 부하 테스트")
+    parser.add_argument("--url", help="대상 서버 URL (미지정 시 인프로세스 실행)")
+    parser.add_argument("--clients", type=int, default=200, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=5, help="클라이언트당 요청 수")
+    parser.add_argument("--strategies", type=int, default=5000, help="합성 전략 수 (인프로세스)")
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=args.clients)
+
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+            result = await run_clients(client, args.clients, args.requests)
+        print_report(result, args.clients)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        (base_dir / "data").mkdir()
+        await seed_database(base_dir / "data" / "strategies.db", args.strategies)
+
+        os.environ["APP_BASE_DIR"] = str(base_dir)
+        os.environ.setdefault("LOGS_DIR", str(base_dir / "logs"))
+
+        from api.server import app, limiter
+        from src.storage.pool import close_pools
+
+        # 클라이언트가 모두 같은 IP로 보이므로 Rate Limit 비활성화
+        limiter.enabled = False
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest", limits=limits, timeout=60
+        ) as client:
+            result = await run_clients(client, args.clients, args.requests)
+
+        close_pools()
+
+    print_report(result, args.clients)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,12 +1,19 @@
 # LLM-based analyzers
 from .deep_analyzer import LLMDeepAnalyzer, LLMAnalysisResult
-from .prompts import ANALYSIS_PROMPT_TEMPLATE, CONVERSION_PROMPT_TEMPLATE
+from .prompts import (
+    ANALYSIS_PROMPT_TEMPLATE,
+    ANALYSIS_SYSTEM_PROMPT,
+    ANALYSIS_USER_TEMPLATE,
+    CONVERSION_PROMPT_TEMPLATE,
+)
 from .cost_optimizer import CostOptimizer
 
 __all__ = [
     "LLMDeepAnalyzer",
     "LLMAnalysisResult",
     "ANALYSIS_PROMPT_TEMPLATE",
+    "ANALYSIS_SYSTEM_PROMPT",
+    "ANALYSIS_USER_TEMPLATE",
     "CONVERSION_PROMPT_TEMPLATE",
     "CostOptimizer",
 ]
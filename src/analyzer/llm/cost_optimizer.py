@@ -5,7 +5,8 @@ import hashlib
 import logging
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+
+from src.llm_cache import LLMCache, cache_namespace, get_llm_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,7 @@ class CostOptimizer:
     기능:
     1. 코드 압축 (불필요한 부분 제거)
     2. 토큰 추정
-    3. 캐싱
+    3. 캐싱 (공용 LLMCache, 네임스페이스 "analysis:<유형>:<모델 버전>")
     4. 배치 처리
     """
 
@@ -36,9 +37,21 @@ class CostOptimizer:
         "gpt-4-turbo": {"input": 10.00, "output": 30.00},
     }
 
-    def __init__(self, cache_ttl_hours: int = 24):
-        self._cache: Dict[str, Tuple[str, datetime]] = {}
-        self._cache_ttl = timedelta(hours=cache_ttl_hours)
+    def __init__(
+        self,
+        cache_ttl_hours: int = 24,
+        model_version: str = "default",
+        cache: Optional[LLMCache] = None,
+    ):
+        """
+        Args:
+            cache_ttl_hours: 캐시 유효 시간
+            model_version: 분석 모델/버전 (다른 버전의 결과는 재사용하지 않음)
+            cache: LLMCache (기본: 프로세스 공용 캐시)
+        """
+        self._cache = cache if cache is not None else get_llm_cache()
+        self._cache_ttl = cache_ttl_hours * 3600
+        self.model_version = model_version
 
     def compress_pine_code(self, code: str, max_chars: int = 6000) -> str:
         """
@@ -149,27 +162,27 @@ class CostOptimizer:
         code_hash = hashlib.md5(code.encode()).hexdigest()[:16]
         return f"{analysis_type}:{code_hash}"
 
+    def _namespace_and_key(self, cache_key: str) -> Tuple[str, str]:
+        """'유형:해시' 키 -> (네임스페이스, 해시)"""
+        analysis_type, _, code_hash = cache_key.rpartition(":")
+        return cache_namespace(f"analysis:{analysis_type or 'full'}", self.model_version), code_hash
+
     def get_cached(self, cache_key: str) -> Optional[str]:
-        """캐시된 결과 조회"""
-        if cache_key in self._cache:
-            result, cached_at = self._cache[cache_key]
-            if datetime.now() - cached_at < self._cache_ttl:
-                logger.debug(f"Cache hit: {cache_key}")
-                return result
-            else:
-                # 만료된 캐시 삭제
-                del self._cache[cache_key]
-        return None
+        """캐시된 결과 조회 (만료된 항목은 None)"""
+        result = self._cache.get(*self._namespace_and_key(cache_key))
+        if result is not None:
+            logger.debug(f"Cache hit: {cache_key}")
+        return result
 
     def set_cache(self, cache_key: str, result: str):
-        """결과 캐시"""
-        self._cache[cache_key] = (result, datetime.now())
+        """결과 캐시 (크기 제한/만료는 LLMCache가 처리)"""
+        namespace, code_hash = self._namespace_and_key(cache_key)
+        self._cache.set(namespace, code_hash, result, ttl=self._cache_ttl)
 
-        # 캐시 크기 제한 (100개)
-        if len(self._cache) > 100:
-            # 가장 오래된 항목 제거
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
+    def get_cache_stats(self) -> Dict:
+        """분석 네임스페이스별 적중률"""
+        namespaces = self._cache.get_stats()["namespaces"]
+        return {ns: stats for ns, stats in namespaces.items() if ns.startswith("analysis:")}
 
     def should_use_mini_model(self, code: str, analysis_type: str = "full") -> bool:
         """
@@ -222,6 +235,6 @@ class CostOptimizer:
         }
 
     def clear_cache(self):
-        """캐시 초기화"""
-        self._cache.clear()
+        """분석 캐시 초기화"""
+        self._cache.purge("analysis:")
         logger.info("Cache cleared")
@@ -2,11 +2,11 @@
 
 import json
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import dataclass
-import anthropic
 
-from .prompts import ANALYSIS_PROMPT_TEMPLATE, CONVERSION_PROMPT_TEMPLATE
+from src.llm_gateway import LLMGateway, LLMRequest, get_llm_gateway
+from .prompts import ANALYSIS_SYSTEM_PROMPT, ANALYSIS_USER_TEMPLATE, CONVERSION_PROMPT_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +34,20 @@ class LLMDeepAnalyzer:
     2. 리스크 관리 수준 평가
     3. 실거래 적합성 판단
     4. Python 변환 가능성 평가
+
+    모든 호출은 LLMGateway를 거친다 (동시 실행/분당 토큰 제한, 동일 요청 병합,
+    공통 평가 기준은 캐시되는 system 프리픽스로 전송).
     """
 
+    SUMMARY_MODEL = "claude-3-5-haiku-20241022"  # 요약은 저비용 모델
+
     def __init__(
         self,
-        api_key: str,
-        model: str = "claude-3-5-sonnet-20241022"
+        api_key: Optional[str] = None,
+        model: str = "claude-3-5-sonnet-20241022",
+        gateway: Optional[LLMGateway] = None,
     ):
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self.gateway = gateway or get_llm_gateway(api_key)
         self.model = model
 
     async def analyze_strategy(
@@ -57,7 +63,7 @@ class LLMDeepAnalyzer:
         # 코드 길이 제한 (토큰 절약)
         code_truncated = pine_code[:6000] if pine_code else ""
 
-        prompt = ANALYSIS_PROMPT_TEMPLATE.format(
+        prompt = ANALYSIS_USER_TEMPLATE.format(
             title=title,
             description=description[:1000],
             performance=json.dumps(performance, ensure_ascii=False),
@@ -66,11 +72,12 @@ class LLMDeepAnalyzer:
         )
 
         try:
-            response = await self.client.messages.create(
+            response = await self.gateway.complete(LLMRequest(
                 model=self.model,
+                system=ANALYSIS_SYSTEM_PROMPT,
+                prompt=prompt + "\n\nJSON 형식으로만 응답해주세요.",
                 max_tokens=1500,
-                messages=[{"role": "user", "content": prompt + "\n\nJSON 형식으로만 응답해주세요."}]
-            )
+            ))
 
             result = json.loads(response.content[0].text)
 
@@ -125,11 +132,11 @@ class LLMDeepAnalyzer:
         )
 
         try:
-            response = await self.client.messages.create(
+            response = await self.gateway.complete(LLMRequest(
                 model=self.model,
+                prompt=prompt,
                 max_tokens=4000,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            ))
 
             return response.content[0].text
 
@@ -155,11 +162,11 @@ class LLMDeepAnalyzer:
 한국어로 200자 이내로 작성해주세요."""
 
         try:
-            response = await self.client.messages.create(
-                model="claude-3-5-haiku-20241022",  # 요약은 저비용 모델
+            response = await self.gateway.complete(LLMRequest(
+                model=self.SUMMARY_MODEL,
+                prompt=prompt,
                 max_tokens=500,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            ))
 
             return response.content[0].text
 
@@ -62,6 +62,18 @@ JSON 형식으로만 응답 (다른 텍스트 없이):
 ```"""
 
 
+# 공통 부분(역할/평가 기준/응답 형식)과 전략별 부분(대상/사전 분석/코드) 분리.
+# 공통 부분은 캐시되는 system 프리픽스로 보내고 전략별 부분만 매번 과금된다.
+_analysis_head, _analysis_rest = ANALYSIS_PROMPT_TEMPLATE.split("## 분석 대상 전략", 1)
+_analysis_target, _analysis_request = _analysis_rest.split("## 분석 요청", 1)
+
+ANALYSIS_SYSTEM_PROMPT = (
+    _analysis_head + "## 분석 요청" + _analysis_request
+).replace("{{", "{").replace("}}", "}")
+
+ANALYSIS_USER_TEMPLATE = "## 분석 대상 전략" + _analysis_target.rstrip()
+
+
 CONVERSION_PROMPT_TEMPLATE = """당신은 Pine Script를 Python 트레이딩 전략으로 변환하는 전문가입니다.
 
 ## 원본 Pine Script
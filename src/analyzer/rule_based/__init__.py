@@ -2,6 +2,7 @@
 from .repainting_detector import RepaintingDetector, RepaintingRisk, RepaintingAnalysis
 from .overfitting_detector import OverfittingDetector, OverfittingAnalysis
 from .risk_checker import RiskChecker, RiskAnalysis
+from .pattern_scanner import PatternScanner, ScanResult, ScanMatch, get_scanner, score_scripts
 
 __all__ = [
     "RepaintingDetector",
@@ -11,4 +12,9 @@ __all__ = [
     "OverfittingAnalysis",
     "RiskChecker",
     "RiskAnalysis",
+    "PatternScanner",
+    "ScanResult",
+    "ScanMatch",
+    "get_scanner",
+    "score_scripts",
 ]
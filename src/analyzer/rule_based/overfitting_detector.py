@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional
 import logging
 
+from .pattern_scanner import ScanResult, get_scanner
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -17,6 +19,7 @@ class OverfittingAnalysis:
     hardcoded_dates: List[str]
     concerns: List[str]
     recommendations: List[str]
+    walk_forward: Optional[Dict] = None  # Walk-forward OOS 성과 저하 지표 (있는 경우)
 
 class OverfittingDetector:
     """
@@ -28,6 +31,7 @@ class OverfittingDetector:
     3. 특정 날짜 하드코딩 (특정 기간에 최적화)
     4. 비현실적인 성과 지표
     5. 거래 횟수 대비 파라미터 비율
+    6. Walk-forward out-of-sample 성과 저하 (WalkForwardResult.degradation())
     """
 
     # 파라미터 수 임계값
@@ -38,13 +42,49 @@ class OverfittingDetector:
         "critical": 20
     }
 
+    # input.int, input.float, input.bool 등 모든 input 패턴
+    INPUT_PATTERNS = [
+        r'input\s*\(',
+        r'input\.int\s*\(',
+        r'input\.float\s*\(',
+        r'input\.bool\s*\(',
+        r'input\.string\s*\(',
+        r'input\.source\s*\(',
+        r'input\.timeframe\s*\(',
+        r'input\.session\s*\(',
+    ]
+
+    # 3자리 이상 숫자 (소수/버전 표기 제외)
+    MAGIC_NUMBER_PATTERN = r'(?<![.\d@])\b(\d{3,})\b(?![.\d])'
+
+    # 날짜 패턴: YYYY-MM-DD, YYYY/MM/DD, timestamp(숫자)
+    DATE_PATTERNS = [
+        r'\d{4}[-/]\d{2}[-/]\d{2}',  # 2024-01-15
+        r'timestamp\s*\(\s*\d{4}\s*,',  # timestamp(2024,
+        r'year\s*==\s*\d{4}',  # year == 2024
+        r'month\s*==\s*\d{1,2}',  # month == 3
+    ]
+
+    # 복잡도 패턴
+    IF_PATTERN = r'\bif\b'
+    CONDITION_PATTERN = r'\b(and|or)\b'
+
     def analyze(
         self,
         pine_code: str,
         performance: Optional[Dict] = None,
-        inputs: Optional[List[Dict]] = None
+        inputs: Optional[List[Dict]] = None,
+        walk_forward: Optional[Dict] = None
     ) -> OverfittingAnalysis:
-        """과적합 위험 분석"""
+        """과적합 위험 분석
+
+        Args:
+            pine_code: Pine Script 코드
+            performance: 백테스트 성과 (profit_factor, win_rate, total_trades)
+            inputs: 파싱된 input 목록
+            walk_forward: WalkForwardResult.degradation() 결과
+                (폴드마다 파라미터 그리드를 최적화한 경우(combinations > 1)에만 점수에 반영)
+        """
 
         concerns = []
         recommendations = []
@@ -61,18 +101,20 @@ class OverfittingDetector:
                 recommendations=[]
             )
 
+        scan = get_scanner().scan(pine_code)
+
         # 1. 파라미터 수 분석
-        param_count, param_score, param_concerns = self._analyze_parameters(pine_code, inputs)
+        param_count, param_score, param_concerns = self._analyze_parameters(scan, inputs)
         score += param_score
         concerns.extend(param_concerns)
 
         # 2. 매직 넘버 탐지
-        magic_numbers, magic_score, magic_concerns = self._analyze_magic_numbers(pine_code)
+        magic_numbers, magic_score, magic_concerns = self._analyze_magic_numbers(scan)
         score += magic_score
         concerns.extend(magic_concerns)
 
         # 3. 하드코딩된 날짜 탐지
-        dates, date_score, date_concerns = self._analyze_hardcoded_dates(pine_code)
+        dates, date_score, date_concerns = self._analyze_hardcoded_dates(scan)
         score += date_score
         concerns.extend(date_concerns)
 
@@ -83,10 +125,17 @@ class OverfittingDetector:
             concerns.extend(perf_concerns)
 
         # 5. 코드 복잡도 분석
-        complexity_score, complexity_concerns = self._analyze_complexity(pine_code)
+        complexity_score, complexity_concerns = self._analyze_complexity(scan)
         score += complexity_score
         concerns.extend(complexity_concerns)
 
+        # 6. Walk-forward OOS 성과 저하 (학습 구간에서 파라미터를 고른 경우만)
+        #    조합이 하나면 구간별 수익 차이일 뿐 out-of-sample 검증이 아님
+        if walk_forward and walk_forward.get('folds') and walk_forward.get('combinations', 0) > 1:
+            wf_score, wf_concerns = self._analyze_walk_forward(walk_forward)
+            score += wf_score
+            concerns.extend(wf_concerns)
+
         # 점수 범위 제한
         score = min(100, score)
 
@@ -111,12 +160,13 @@ class OverfittingDetector:
             magic_numbers=magic_numbers[:10],  # 상위 10개만
             hardcoded_dates=dates,
             concerns=concerns,
-            recommendations=recommendations
+            recommendations=recommendations,
+            walk_forward=walk_forward
         )
 
     def _analyze_parameters(
         self,
-        code: str,
+        scan: ScanResult,
         inputs: Optional[List[Dict]]
     ) -> tuple[int, float, List[str]]:
         """파라미터 수 분석"""
@@ -126,21 +176,9 @@ class OverfittingDetector:
         if inputs:
             param_count = len(inputs)
         else:
-            # input.int, input.float, input.bool 등 모든 input 패턴
-            input_patterns = [
-                r'input\s*\(',
-                r'input\.int\s*\(',
-                r'input\.float\s*\(',
-                r'input\.bool\s*\(',
-                r'input\.string\s*\(',
-                r'input\.source\s*\(',
-                r'input\.timeframe\s*\(',
-                r'input\.session\s*\(',
-            ]
-
             param_count = 0
-            for pattern in input_patterns:
-                param_count += len(re.findall(pattern, code, re.IGNORECASE))
+            for pattern in self.INPUT_PATTERNS:
+                param_count += scan.count("overfitting.input", pattern)
 
         # 점수 계산
         score = 0
@@ -156,12 +194,12 @@ class OverfittingDetector:
 
         return param_count, score, concerns
 
-    def _analyze_magic_numbers(self, code: str) -> tuple[List[str], float, List[str]]:
+    def _analyze_magic_numbers(self, scan: ScanResult) -> tuple[List[str], float, List[str]]:
         """매직 넘버 탐지"""
         concerns = []
 
         # 3자리 이상 숫자 찾기 (단, 버전, 년도 제외)
-        all_numbers = re.findall(r'(?<![.\d@])\b(\d{3,})\b(?![.\d])', code)
+        all_numbers = scan.findall("overfitting.magic_number", self.MAGIC_NUMBER_PATTERN)
 
         # 필터링: 년도(2020-2030), 일반적인 값(100, 200 등) 제외
         suspicious = []
@@ -194,22 +232,13 @@ class OverfittingDetector:
 
         return magic_numbers, score, concerns
 
-    def _analyze_hardcoded_dates(self, code: str) -> tuple[List[str], float, List[str]]:
+    def _analyze_hardcoded_dates(self, scan: ScanResult) -> tuple[List[str], float, List[str]]:
         """하드코딩된 날짜 탐지"""
         concerns = []
 
-        # 날짜 패턴: YYYY-MM-DD, YYYY/MM/DD, timestamp(숫자)
-        date_patterns = [
-            r'\d{4}[-/]\d{2}[-/]\d{2}',  # 2024-01-15
-            r'timestamp\s*\(\s*\d{4}\s*,',  # timestamp(2024,
-            r'year\s*==\s*\d{4}',  # year == 2024
-            r'month\s*==\s*\d{1,2}',  # month == 3
-        ]
-
         dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, code)
-            dates.extend(matches)
+        for pattern in self.DATE_PATTERNS:
+            dates.extend(scan.findall("overfitting.date", pattern))
 
         # 점수 계산
         score = 0
@@ -252,16 +281,16 @@ class OverfittingDetector:
 
         return score, concerns
 
-    def _analyze_complexity(self, code: str) -> tuple[float, List[str]]:
+    def _analyze_complexity(self, scan: ScanResult) -> tuple[float, List[str]]:
         """코드 복잡도 분석"""
         concerns = []
         score = 0
 
         # if 문 개수
-        if_count = len(re.findall(r'\bif\b', code))
+        if_count = scan.count("overfitting.complexity", self.IF_PATTERN)
 
         # and/or 조건 개수
-        condition_count = len(re.findall(r'\b(and|or)\b', code))
+        condition_count = scan.count("overfitting.complexity", self.CONDITION_PATTERN)
 
         # 과도한 조건 분기
         if if_count > 30:
@@ -273,3 +302,47 @@ class OverfittingDetector:
             concerns.append(f"많은 조건 연결: {condition_count}개 and/or")
 
         return score, concerns
+
+    def _analyze_walk_forward(self, wf: Dict) -> tuple[float, List[str]]:
+        """Walk-forward out-of-sample 성과 저하 분석 (추정이 아닌 실측)"""
+        concerns = []
+        score = 0
+
+        efficiency = wf.get('efficiency', 0)
+        is_return = wf.get('is_return', 0)
+        profitable = wf.get('oos_profitable_ratio', 0)
+        sharpe_degradation = wf.get('sharpe_degradation', 0)
+        stability = wf.get('param_stability', 1)
+        folds = wf.get('folds', 0)
+
+        # 학습 구간 대비 검증 구간 수익 유지율
+        if is_return > 0 and efficiency < 0.25:
+            score += 30
+            concerns.append(f"OOS 효율 매우 낮음: {efficiency:.2f} (학습 구간 성과가 검증 구간에서 재현되지 않음)")
+        elif is_return > 0 and efficiency < 0.5:
+            score += 15
+            concerns.append(f"OOS 효율 낮음: {efficiency:.2f} (권장: 0.5 이상)")
+
+        if profitable < 0.5:
+            score += 15
+            concerns.append(f"OOS 수익 폴드 비율 낮음: {profitable * 100:.0f}% ({folds}개 폴드)")
+
+        if sharpe_degradation > 0.5:
+            score += 10
+            concerns.append(f"OOS Sharpe 저하: {sharpe_degradation * 100:.0f}%")
+
+        # 폴드마다 최적 파라미터가 바뀜 = 특정 구간에 맞춘 파라미터
+        if folds >= 3 and stability < 0.5:
+            score += 5
+            concerns.append(f"최적 파라미터 불안정: 최빈 조합 {stability * 100:.0f}% 폴드")
+
+        return score, concerns
+
+
+for _category, _patterns, _flags in (
+    ("overfitting.input", OverfittingDetector.INPUT_PATTERNS, re.IGNORECASE),
+    ("overfitting.magic_number", [OverfittingDetector.MAGIC_NUMBER_PATTERN], 0),
+    ("overfitting.date", OverfittingDetector.DATE_PATTERNS, 0),
+    ("overfitting.complexity", [OverfittingDetector.IF_PATTERN, OverfittingDetector.CONDITION_PATTERN], 0),
+):
+    get_scanner().register(_category, _patterns, _flags)
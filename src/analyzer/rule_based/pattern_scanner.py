@@ -0,0 +1,323 @@
+# src/analyzer/rule_based/pattern_scanner.py
+
+"""
+규칙 기반 탐지기 공용 패턴 스캐너
+
+RepaintingDetector / RiskChecker / OverfittingDetector가 등록한 정규식을
+등록 시 한 번 컴파일하고, 스크립트마다 한 번 스캔한 결과를 세 탐지기가 공유합니다.
+
+- 리터럴 사전 필터: 각 패턴이 매치되려면 반드시 있어야 하는 리터럴(들)을
+  정규식 파스 트리에서 추출해 두고, 스캔 시 리터럴마다 한 번씩 부분 문자열
+  검사 (IGNORECASE 패턴은 소문자로 바꾼 코드 기준) -> 리터럴이 없는 패턴은 정규식 생략
+- 남은 패턴만 컴파일된 정규식으로 검사 (필요할 때 한 번, 결과는 스캔 결과에 보관)
+- has / count / findall은 re.search / len(re.findall) / re.findall과 같은 결과
+- matches(): 모든 매치를 (카테고리, 패턴, 줄 번호)와 함께 위치 순으로 보고
+- score_scripts(): 수천 개 스크립트 일괄 채점 (선택적 프로세스 풀)
+"""
+
+import bisect
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import re._parser as sre_parse
+    from re._constants import (
+        ASSERT, ASSERT_NOT, AT, BRANCH, LITERAL, MAX_REPEAT, MIN_REPEAT, SUBPATTERN,
+    )
+except ImportError:  # Python < 3.11
+    import sre_parse
+    from sre_constants import (
+        ASSERT, ASSERT_NOT, AT, BRANCH, LITERAL, MAX_REPEAT, MIN_REPEAT, SUBPATTERN,
+    )
+
+PatternList = Sequence[Union[str, Tuple[str, str]]]
+
+# 매치 폭이 0인 노드 (리터럴 연속을 끊지만 필수 리터럴은 아님)
+_ZERO_WIDTH = (AT, ASSERT, ASSERT_NOT)
+
+# IGNORECASE에서 ASCII 문자와 같게 취급되지만 lower()로는 ASCII가 되지 않는 문자
+_ASCII_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def fold_case(text: str) -> str:
+    """IGNORECASE 사전 필터용 정규화 (정규식이 매치하면 리터럴이 반드시 포함됨)"""
+    return text.translate(_ASCII_FOLD).lower()
+
+
+def _required_literals(parsed) -> Optional[FrozenSet[str]]:
+    """
+    매치에 반드시 포함되는 리터럴 집합 (이 중 하나는 반드시 있음)
+
+    None이면 추출 불가 (항상 정규식 실행). 후보가 여럿이면 가장 짧은
+    원소가 가장 긴 후보를 고름.
+    """
+    candidates: List[FrozenSet[str]] = []
+    run: List[str] = []
+
+    def flush():
+        if run:
+            candidates.append(frozenset(["".join(run)]))
+            run.clear()
+
+    for op, av in parsed:
+        if op is LITERAL:
+            run.append(chr(av))
+            continue
+        flush()
+        if op is SUBPATTERN:
+            inner = _required_literals(av[-1])
+            if inner:
+                candidates.append(inner)
+        elif op is BRANCH:
+            branches = [_required_literals(branch) for branch in av[1]]
+            if all(branches):
+                candidates.append(frozenset().union(*branches))
+        elif op in (MAX_REPEAT, MIN_REPEAT) and av[0] >= 1:
+            inner = _required_literals(av[2])
+            if inner:
+                candidates.append(inner)
+        elif op in _ZERO_WIDTH:
+            continue
+    flush()
+
+    if not candidates:
+        return None
+    return max(candidates, key=lambda literals: min(len(literal) for literal in literals))
+
+
+@dataclass(frozen=True)
+class PatternSpec:
+    """등록된 패턴"""
+    category: str
+    pattern: str
+    description: str
+    flags: int
+    literals: Optional[FrozenSet[str]]  # 사전 필터 (IGNORECASE면 fold_case된 값)
+
+
+@dataclass(frozen=True)
+class ScanMatch:
+    """한 번의 매치"""
+    category: str
+    pattern: str
+    description: str
+    start: int
+    end: int
+    line: int  # 1부터
+    text: str
+
+
+class ScanResult:
+    """한 스크립트의 스캔 결과 (사전 필터 통과 패턴 + 필요 시 정규식 결과)"""
+
+    def __init__(self, scanner: "PatternScanner", code: str, candidates: FrozenSet[int]):
+        self._scanner = scanner
+        self.code = code
+        self.candidates = candidates
+        self._first: Dict[int, bool] = {}
+        self._spans: Dict[int, List[Tuple[int, int]]] = {}
+        self._line_starts: Optional[List[int]] = None
+
+    def _search(self, spec_id: int) -> bool:
+        found = self._first.get(spec_id)
+        if found is None:
+            found = spec_id in self.candidates and (
+                self._scanner.compiled(spec_id).search(self.code) is not None
+            )
+            self._first[spec_id] = found
+        return found
+
+    def _all_spans(self, spec_id: int) -> List[Tuple[int, int]]:
+        """겹치지 않는 매치 위치 (re.finditer 순서)"""
+        spans = self._spans.get(spec_id)
+        if spans is None:
+            spans = []
+            if spec_id in self.candidates and self._first.get(spec_id) is not False:
+                spans = [m.span() for m in self._scanner.compiled(spec_id).finditer(self.code)]
+            self._spans[spec_id] = spans
+            self._first[spec_id] = bool(spans)
+        return spans
+
+    def has(self, category: str, pattern: str) -> bool:
+        """re.search(pattern, code, flags) 결과가 있는지"""
+        return self._search(self._scanner.spec_id(category, pattern))
+
+    def count(self, category: str, pattern: str) -> int:
+        """len(re.findall(pattern, code, flags))"""
+        return len(self._all_spans(self._scanner.spec_id(category, pattern)))
+
+    def findall(self, category: str, pattern: str) -> List:
+        """re.findall(pattern, code, flags)"""
+        spec_id = self._scanner.spec_id(category, pattern)
+        if not self._all_spans(spec_id):
+            return []
+        # 그룹 값이 필요하므로 findall 그대로 (사전 필터 통과한 패턴만)
+        return self._scanner.compiled(spec_id).findall(self.code)
+
+    def line_of(self, offset: int) -> int:
+        """문자 위치 -> 줄 번호 (1부터)"""
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in re.finditer("\n", self.code)]
+        return bisect.bisect_right(self._line_starts, offset)
+
+    def matches(self, category: Optional[str] = None) -> List[ScanMatch]:
+        """모든 매치 (위치 순, category가 주어지면 해당 카테고리 또는 하위 카테고리만)"""
+        found = []
+        for spec_id in sorted(self.candidates):
+            spec = self._scanner.specs[spec_id]
+            if category is not None and not (
+                spec.category == category or spec.category.startswith(category + ".")
+            ):
+                continue
+            for start, end in self._all_spans(spec_id):
+                found.append(ScanMatch(
+                    spec.category, spec.pattern, spec.description,
+                    start, end, self.line_of(start), self.code[start:end]
+                ))
+        found.sort(key=lambda m: (m.start, m.category))
+        return found
+
+
+class PatternScanner:
+    """
+    패턴을 카테고리별로 등록하고 스크립트당 한 번 스캔
+
+    Example:
+        >>> scanner = get_scanner()
+        >>> result = scanner.scan(pine_code)
+        >>> result.has("repainting.critical", pattern)
+        >>> [(m.category, m.line) for m in result.matches("repainting")]
+    """
+
+    def __init__(self, cache_size: int = 64):
+        self.specs: List[PatternSpec] = []
+        self._ids: Dict[Tuple[str, str], int] = {}
+        self._compiled: List[re.Pattern] = []
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, ScanResult]" = OrderedDict()
+        self._cache_size = cache_size
+        # 리터럴 -> 해당 리터럴이 필요한 패턴 id (원문 / fold_case 기준)
+        self._literal_index: Tuple[Dict[str, List[int]], Dict[str, List[int]]] = ({}, {})
+        self._unfiltered: List[int] = []
+
+    def register(self, category: str, patterns: PatternList, flags: int = 0) -> None:
+        """
+        패턴 등록 및 컴파일 (같은 카테고리/패턴은 한 번만)
+
+        Args:
+            category: 보고용 카테고리 ("repainting.critical" 등)
+            patterns: 정규식 문자열 또는 (정규식, 설명) 목록
+            flags: re 플래그
+        """
+        with self._lock:
+            for item in patterns:
+                pattern, description = (item, "") if isinstance(item, str) else item
+                if (category, pattern) in self._ids:
+                    continue
+
+                compiled = re.compile(pattern, flags)
+                literals = _required_literals(sre_parse.parse(pattern, flags))
+                folded = bool(flags & re.IGNORECASE)
+                if literals and folded:
+                    literals = frozenset(fold_case(literal) for literal in literals)
+
+                spec_id = len(self.specs)
+                self._ids[(category, pattern)] = spec_id
+                self.specs.append(PatternSpec(category, pattern, description, flags, literals))
+                self._compiled.append(compiled)
+
+                if literals:
+                    index = self._literal_index[folded]
+                    for literal in literals:
+                        index.setdefault(literal, []).append(spec_id)
+                else:
+                    self._unfiltered.append(spec_id)
+            self._cache.clear()
+
+    def spec_id(self, category: str, pattern: str) -> int:
+        try:
+            return self._ids[(category, pattern)]
+        except KeyError:
+            raise KeyError(f"패턴이 등록되지 않음: [{category}] {pattern}") from None
+
+    def compiled(self, spec_id: int) -> re.Pattern:
+        return self._compiled[spec_id]
+
+    def _candidates(self, code: str) -> FrozenSet[int]:
+        """사전 필터: 필수 리터럴이 코드에 있는 패턴"""
+        candidates = set(self._unfiltered)
+        exact, folded = self._literal_index
+        for literal, spec_ids in exact.items():
+            if literal in code:
+                candidates.update(spec_ids)
+        if folded:
+            folded_code = fold_case(code)
+            for literal, spec_ids in folded.items():
+                if literal in folded_code:
+                    candidates.update(spec_ids)
+        return frozenset(candidates)
+
+    def scan(self, code: str) -> ScanResult:
+        """코드 스캔 (같은 코드의 최근 결과는 재사용)"""
+        with self._lock:
+            cached = self._cache.get(code)
+            if cached is not None:
+                self._cache.move_to_end(code)
+                return cached
+
+        result = ScanResult(self, code, self._candidates(code) if code else frozenset())
+
+        with self._lock:
+            self._cache[code] = result
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def scan_many(self, codes: Iterable[str]) -> List[ScanResult]:
+        return [self.scan(code) for code in codes]
+
+
+_scanner = PatternScanner()
+
+
+def get_scanner() -> PatternScanner:
+    """탐지기들이 공유하는 스캐너"""
+    return _scanner
+
+
+# ============================================================
+# 일괄 채점
+# ============================================================
+
+def _score_one(code: str) -> Dict:
+    from .overfitting_detector import OverfittingDetector
+    from .repainting_detector import RepaintingDetector
+    from .risk_checker import RiskChecker
+
+    return {
+        "repainting": RepaintingDetector().analyze(code),
+        "overfitting": OverfittingDetector().analyze(code),
+        "risk": RiskChecker().analyze(code),
+    }
+
+
+def score_scripts(codes: Sequence[str], processes: int = 0, chunksize: int = 32) -> List[Dict]:
+    """
+    여러 스크립트를 세 탐지기로 채점 (스크립트당 스캔 1회)
+
+    Args:
+        codes: Pine 코드 목록
+        processes: 0이면 현재 프로세스, 아니면 프로세스 풀 크기
+        chunksize: 프로세스 풀에 한 번에 넘길 스크립트 수
+
+    Returns:
+        스크립트 순서대로 {"repainting", "overfitting", "risk"} 분석 결과
+    """
+    if processes and len(codes) > chunksize:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            return list(pool.map(_score_one, codes, chunksize=chunksize))
+    return [_score_one(code) for code in codes]
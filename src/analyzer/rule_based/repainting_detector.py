@@ -6,8 +6,12 @@ from dataclasses import dataclass
 from typing import List, Tuple
 import logging
 
+from .pattern_scanner import get_scanner
+
 logger = logging.getLogger(__name__)
 
+FLAGS = re.IGNORECASE | re.MULTILINE
+
 class RepaintingRisk(Enum):
     """Repainting 위험 수준"""
     NONE = 0       # 위험 없음
@@ -88,10 +92,11 @@ class RepaintingDetector:
         issues = []
         safe_patterns = []
         risk_level = RepaintingRisk.NONE
+        scan = get_scanner().scan(pine_code)
 
         # 1. 치명적 패턴 검사
         for pattern, description in self.CRITICAL_PATTERNS:
-            if re.search(pattern, pine_code, re.IGNORECASE | re.MULTILINE):
+            if scan.has("repainting.critical", pattern):
                 issues.append(f"CRITICAL: {description}")
                 risk_level = RepaintingRisk.CRITICAL
 
@@ -108,21 +113,21 @@ class RepaintingDetector:
 
         # 2. 고위험 패턴 검사
         for pattern, description in self.HIGH_RISK_PATTERNS:
-            if re.search(pattern, pine_code, re.IGNORECASE | re.MULTILINE):
+            if scan.has("repainting.high", pattern):
                 issues.append(f"HIGH: {description}")
                 if risk_level.value < RepaintingRisk.HIGH.value:
                     risk_level = RepaintingRisk.HIGH
 
         # 3. 중간 위험 패턴 검사
         for pattern, description in self.MEDIUM_RISK_PATTERNS:
-            if re.search(pattern, pine_code, re.IGNORECASE | re.MULTILINE):
+            if scan.has("repainting.medium", pattern):
                 issues.append(f"MEDIUM: {description}")
                 if risk_level.value < RepaintingRisk.MEDIUM.value:
                     risk_level = RepaintingRisk.MEDIUM
 
         # 4. 안전한 패턴 검사 (감점 완화)
         for pattern, description in self.SAFE_PATTERNS:
-            if re.search(pattern, pine_code, re.IGNORECASE | re.MULTILINE):
+            if scan.has("repainting.safe", pattern):
                 safe_patterns.append(f"{description}")
 
         # 5. 점수 계산 (100점 만점)
@@ -167,3 +172,12 @@ class RepaintingDetector:
             confidence=confidence,
             details=details
         )
+
+
+for _category, _patterns in (
+    ("repainting.critical", RepaintingDetector.CRITICAL_PATTERNS),
+    ("repainting.high", RepaintingDetector.HIGH_RISK_PATTERNS),
+    ("repainting.medium", RepaintingDetector.MEDIUM_RISK_PATTERNS),
+    ("repainting.safe", RepaintingDetector.SAFE_PATTERNS),
+):
+    get_scanner().register(_category, _patterns, FLAGS)
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional
 import logging
 
+from .pattern_scanner import ScanResult, get_scanner
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,6 +84,18 @@ class RiskChecker:
         (r'margin\s*=\s*[1-9]\d{2,}', "높은 마진"),
     ]
 
+    # 추가 분석 패턴
+    ADDITIONAL_PATTERNS = {
+        "trailing_stop": r'trail',
+        "atr_stop": r'atr.*stop|stop.*atr',
+        "time_exit": r'time.*exit|exit.*time|bars.*since',
+        "position_check": r'strategy\.position_size',
+        "volatility_filter": r'atr|volatility|stddev',
+        "session_filter": r'session|hour|dayofweek',
+        "martingale": r'martingale|double.*loss|loss.*double',
+        "averaging_down": r'average.*down|down.*average',
+    }
+
     def analyze(self, pine_code: str) -> RiskAnalysis:
         """리스크 관리 수준 분석"""
 
@@ -102,9 +116,10 @@ class RiskChecker:
         positives = []
         recommendations = []
         score = 0
+        scan = get_scanner().scan(pine_code)
 
         # 1. Stop Loss 분석
-        has_stop_loss = self._check_patterns(pine_code, self.STOP_LOSS_PATTERNS)
+        has_stop_loss = self._check_patterns(scan, "risk.stop_loss", self.STOP_LOSS_PATTERNS)
         if has_stop_loss:
             score += 30
             positives.append("Stop Loss 구현됨")
@@ -113,7 +128,7 @@ class RiskChecker:
             recommendations.append("반드시 Stop Loss를 구현하세요.")
 
         # 2. Take Profit 분석
-        has_take_profit = self._check_patterns(pine_code, self.TAKE_PROFIT_PATTERNS)
+        has_take_profit = self._check_patterns(scan, "risk.take_profit", self.TAKE_PROFIT_PATTERNS)
         if has_take_profit:
             score += 20
             positives.append("Take Profit 구현됨")
@@ -122,7 +137,7 @@ class RiskChecker:
             recommendations.append("Take Profit 로직을 추가하는 것이 좋습니다.")
 
         # 3. Position Sizing 분석
-        has_position_sizing = self._check_patterns(pine_code, self.POSITION_SIZING_PATTERNS)
+        has_position_sizing = self._check_patterns(scan, "risk.position_sizing", self.POSITION_SIZING_PATTERNS)
         if has_position_sizing:
             score += 25
             positives.append("Position Sizing 로직 존재")
@@ -131,7 +146,7 @@ class RiskChecker:
             recommendations.append("자산 비율 기반 포지션 사이징을 고려하세요.")
 
         # 4. Max Drawdown 분석
-        has_max_drawdown = self._check_patterns(pine_code, self.MAX_DRAWDOWN_PATTERNS)
+        has_max_drawdown = self._check_patterns(scan, "risk.max_drawdown", self.MAX_DRAWDOWN_PATTERNS)
         if has_max_drawdown:
             score += 15
             positives.append("최대 손실폭 제한 구현")
@@ -139,12 +154,12 @@ class RiskChecker:
             recommendations.append("최대 손실폭 제한 로직을 추가하면 좋습니다.")
 
         # 5. 위험한 패턴 체크
-        dangerous_score, dangerous_concerns = self._check_dangerous_patterns(pine_code)
+        dangerous_score, dangerous_concerns = self._check_dangerous_patterns(scan)
         score -= dangerous_score
         concerns.extend(dangerous_concerns)
 
         # 6. 추가 분석
-        additional_score, additional_positives, additional_concerns = self._additional_checks(pine_code)
+        additional_score, additional_positives, additional_concerns = self._additional_checks(scan)
         score += additional_score
         positives.extend(additional_positives)
         concerns.extend(additional_concerns)
@@ -177,65 +192,79 @@ class RiskChecker:
             recommendations=recommendations
         )
 
-    def _check_patterns(self, code: str, patterns: List[tuple]) -> bool:
+    def _check_patterns(self, scan: ScanResult, category: str, patterns: List[tuple]) -> bool:
         """패턴 존재 여부 확인"""
         for pattern, _ in patterns:
-            if re.search(pattern, code, re.IGNORECASE):
+            if scan.has(category, pattern):
                 return True
         return False
 
-    def _check_dangerous_patterns(self, code: str) -> tuple[float, List[str]]:
+    def _check_dangerous_patterns(self, scan: ScanResult) -> tuple[float, List[str]]:
         """위험한 패턴 체크"""
         concerns = []
         penalty = 0
 
         for pattern, description in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, code, re.IGNORECASE):
+            if scan.has("risk.dangerous", pattern):
                 concerns.append(f"위험: {description}")
                 penalty += 15
 
         return penalty, concerns
 
-    def _additional_checks(self, code: str) -> tuple[float, List[str], List[str]]:
+    def _additional_checks(self, scan: ScanResult) -> tuple[float, List[str], List[str]]:
         """추가 분석"""
         positives = []
         concerns = []
         score = 0
 
+        def found(name: str) -> bool:
+            return scan.has("risk.additional", self.ADDITIONAL_PATTERNS[name])
+
         # 트레일링 스탑
-        if re.search(r'trail', code, re.IGNORECASE):
+        if found("trailing_stop"):
             score += 10
             positives.append("트레일링 스탑 사용")
 
         # ATR 기반 스탑
-        if re.search(r'atr.*stop|stop.*atr', code, re.IGNORECASE):
+        if found("atr_stop"):
             score += 5
             positives.append("ATR 기반 동적 스탑")
 
         # 시간 기반 청산
-        if re.search(r'time.*exit|exit.*time|bars.*since', code, re.IGNORECASE):
+        if found("time_exit"):
             positives.append("시간 기반 청산 로직")
 
         # 복수 포지션 관리
-        if re.search(r'strategy\.position_size', code, re.IGNORECASE):
+        if found("position_check"):
             positives.append("포지션 상태 확인 로직")
 
         # 변동성 필터
-        if re.search(r'atr|volatility|stddev', code, re.IGNORECASE):
+        if found("volatility_filter"):
             positives.append("변동성 기반 필터")
 
         # 거래 시간 필터
-        if re.search(r'session|hour|dayofweek', code, re.IGNORECASE):
+        if found("session_filter"):
             positives.append("거래 시간 필터")
 
         # 위험 신호: 마틴게일
-        if re.search(r'martingale|double.*loss|loss.*double', code, re.IGNORECASE):
+        if found("martingale"):
             concerns.append("마틴게일 전략 의심 (매우 위험)")
             score -= 30
 
         # 위험 신호: 평균 단가
-        if re.search(r'average.*down|down.*average', code, re.IGNORECASE):
+        if found("averaging_down"):
             concerns.append("물타기 전략 의심")
             score -= 15
 
         return score, positives, concerns
+
+
+for _category, _patterns in (
+    ("risk.stop_loss", RiskChecker.STOP_LOSS_PATTERNS),
+    ("risk.take_profit", RiskChecker.TAKE_PROFIT_PATTERNS),
+    ("risk.position_sizing", RiskChecker.POSITION_SIZING_PATTERNS),
+    ("risk.max_drawdown", RiskChecker.MAX_DRAWDOWN_PATTERNS),
+    ("risk.dangerous", RiskChecker.DANGEROUS_PATTERNS),
+    ("risk.additional", list(RiskChecker.ADDITIONAL_PATTERNS.values())),
+):
+    get_scanner().register(_category, _patterns, re.IGNORECASE)
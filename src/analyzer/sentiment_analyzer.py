@@ -6,13 +6,29 @@ FinBERT 금융 감성 분석기
 Hugging Face의 ProsusAI/finbert 모델을 사용합니다.
 
 Model: https://huggingface.co/ProsusAI/finbert
+
+추론 경로 (CPU 기준):
+- 동적 배칭: 여러 호출자(스레드)의 문장을 워커 하나가 모아 한 번에 추론
+- 길이 버킷 패딩: 배치를 토큰 길이별 버킷(16, 32, ... 512)으로 나눠 버킷 길이까지만 패딩
+- torch.inference_mode, 선택적 int8 동적 양자화 / ONNX Runtime
+- 문장 해시 기준 LRU 캐시
+- 모델 로드는 warmup()에서 명시적으로 (서비스 시작 시 한 번, 요청 경로에서는 로드하지 않음)
 """
 
+import hashlib
+import os
+import queue
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
 # Transformers 임포트 시도
 try:
     from transformers import AutoTokenizer, AutoModelForSequenceClassification
@@ -22,6 +38,20 @@ except ImportError:
     TRANSFORMERS_AVAILABLE = False
     torch = None
 
+# ONNX Runtime 임포트 시도 (선택)
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+    ort = None
+
+# 모델 출력 순서 (ProsusAI/finbert)
+LABELS = ["positive", "negative", "neutral"]
+
+# 패딩 버킷 (토큰 수)
+LENGTH_BUCKETS = (16, 32, 64, 128, 256, 512)
+
 
 class SentimentLabel(Enum):
     """감성 레이블"""
@@ -85,6 +115,104 @@ class HypeAnalysisResult:
         }
 
 
+class SentenceBatcher:
+    """
+    동적 배칭 워커
+
+    여러 스레드가 제출한 문장을 큐에 모아, max_batch_size개가 차거나
+    첫 문장 이후 max_wait_ms가 지나면 infer_fn으로 한 번에 넘깁니다.
+    infer_fn은 워커 스레드에서만 호출됩니다 (토크나이저/모델 공유 불필요).
+
+    Example:
+        >>> batcher = SentenceBatcher(infer_fn, max_batch_size=32)
+        >>> futures = batcher.submit_many(sentences)
+        >>> scores = [f.result() for f in futures]
+    """
+
+    def __init__(
+        self,
+        infer_fn: Callable[[List[str]], List[Dict[str, float]]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        self.infer_fn = infer_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue[Optional[Tuple[str, Future]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+        self.batches = 0
+        self.items = 0
+
+    def submit(self, text: str) -> Future:
+        """문장 하나 제출 (결과: 레이블별 확률 dict)"""
+        return self.submit_many([text])[0]
+
+    def submit_many(self, texts: List[str]) -> List[Future]:
+        """문장 여러 개 제출 (같은 배치에 들어가도록 연속으로 큐에 넣음)"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SentenceBatcher가 종료되었습니다.")
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="finbert-batcher", daemon=True)
+                self._worker.start()
+
+        futures = []
+        for text in texts:
+            future: Future = Future()
+            self._queue.put((text, future))
+            futures.append(future)
+        return futures
+
+    def close(self):
+        """워커 종료 (대기 중인 문장은 처리 후 종료)"""
+        with self._lock:
+            self._closed = True
+            worker = self._worker
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[Tuple[str, Future]]):
+        try:
+            results = self.infer_fn([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.items += len(batch)
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
 class FinBERTAnalyzer:
     """
     FinBERT 기반 금융 감성 분석기
@@ -158,90 +286,284 @@ class FinBERTAnalyzer:
     
     MODEL_NAME = "ProsusAI/finbert"
     
-    def __init__(self, use_gpu: bool = False):
+    MAX_LENGTH = 512
+    
+    def __init__(
+        self,
+        use_gpu: bool = False,
+        batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        cache_size: int = 4096,
+        quantize: bool = False,
+        onnx_path: Optional[str] = None,
+    ):
         """
         Args:
             use_gpu: GPU 사용 여부
+            batch_size: 한 번에 추론할 최대 문장 수
+            max_wait_ms: 배치를 채우기 위해 기다리는 최대 시간
+            cache_size: 문장 결과 LRU 캐시 크기 (0이면 캐시 안 함)
+            quantize: CPU에서 Linear 레이어 int8 동적 양자화
+            onnx_path: ONNX 모델 경로 (주어지면 ONNX Runtime으로 추론, export_onnx()로 생성)
         """
         self.model = None
         self.tokenizer = None
         self.device = "cuda" if use_gpu and torch and torch.cuda.is_available() else "cpu"
+        self.quantize = quantize
+        self.onnx_path = onnx_path
+        self._session = None
         self._model_loaded = False
+        self._load_lock = threading.Lock()
         
-    def _load_model(self):
-        """모델 로드 (지연 로딩)"""
-        if self._model_loaded or not TRANSFORMERS_AVAILABLE:
-            return
+        self._batcher = SentenceBatcher(self._infer, max_batch_size=batch_size, max_wait_ms=max_wait_ms)
+        
+        self._cache: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+    def warmup(self) -> bool:
+        """
+        모델 로드 + 버킷별 더미 추론 (서비스 시작 시 한 번 호출)
+        
+        요청 경로에서는 모델을 로드하지 않으므로, 호출 전에는
+        analyze_sentiment가 "model not loaded" 결과를 반환합니다.
+        
+        Returns:
+            모델 사용 가능 여부
+        """
+        if not TRANSFORMERS_AVAILABLE:
+            return False
             
-        try:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.MODEL_NAME)
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.MODEL_NAME)
-            self.model.to(self.device)
-            self.model.eval()
-            self._model_loaded = True
-        except Exception as e:
-            print(f"FinBERT 모델 로드 실패: {e}")
+        with self._load_lock:
+            if self._model_loaded:
+                return True
+            try:
+                self.tokenizer = AutoTokenizer.from_pretrained(self.MODEL_NAME)
+                
+                if self.onnx_path:
+                    if not ONNXRUNTIME_AVAILABLE:
+                        raise RuntimeError("onnxruntime not installed")
+                    self._session = ort.InferenceSession(
+                        self.onnx_path, providers=["CPUExecutionProvider"]
+                    )
+                else:
+                    model = AutoModelForSequenceClassification.from_pretrained(self.MODEL_NAME)
+                    model.to(self.device)
+                    model.eval()
+                    if self.quantize and self.device == "cpu":
+                        model = torch.quantization.quantize_dynamic(
+                            model, {torch.nn.Linear}, dtype=torch.qint8
+                        )
+                    self.model = model
+                
+                # 버킷 길이별 첫 추론 비용을 미리 지불
+                for bucket in LENGTH_BUCKETS:
+                    self._infer(["warm up " * (bucket // 2 - 1)])
+                self._model_loaded = True
+            except Exception as e:
+                self.model = None
+                self._session = None
+                print(f"FinBERT 모델 로드 실패: {e}")
+        return self._model_loaded
     
-    def analyze_sentiment(self, text: str) -> SentimentResult:
+    def export_onnx(self, path: str, opset: int = 14) -> str:
         """
-        텍스트 감성 분석
+        ONNX 모델 내보내기 (batch / sequence 동적 축)
+        
+        quantize=True면 ONNX Runtime으로 int8 동적 양자화한 모델을 저장합니다.
         
         Args:
-            text: 분석할 텍스트
+            path: 저장 경로
+            opset: ONNX opset 버전
             
         Returns:
-            SentimentResult: 감성 분석 결과
+            저장된 경로
         """
         if not TRANSFORMERS_AVAILABLE:
-            return SentimentResult(
-                label=SentimentLabel.NEUTRAL,
-                confidence=0.0,
-                scores={"error": "transformers not installed"},
+            raise RuntimeError("transformers not installed")
+            
+        tokenizer = self.tokenizer or AutoTokenizer.from_pretrained(self.MODEL_NAME)
+        model = AutoModelForSequenceClassification.from_pretrained(self.MODEL_NAME)
+        model.eval()
+        
+        names = ["input_ids", "attention_mask", "token_type_ids"]
+        dummy = tokenizer(["warm up"], return_tensors="pt", padding="max_length", max_length=LENGTH_BUCKETS[0])
+        target = f"{path}.fp32" if self.quantize else path
+        
+        with torch.inference_mode():
+            torch.onnx.export(
+                model,
+                tuple(dummy[name] for name in names),
+                target,
+                input_names=names,
+                output_names=["logits"],
+                dynamic_axes={**{name: {0: "batch", 1: "sequence"} for name in names}, "logits": {0: "batch"}},
+                opset_version=opset,
             )
         
-        self._load_model()
+        if self.quantize:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            
+            quantize_dynamic(target, path, weight_type=QuantType.QInt8)
+            os.remove(target)
         
-        if not self._model_loaded:
+        return path
+    
+    @staticmethod
+    def _bucket_for(length: int) -> int:
+        """토큰 수 -> 패딩 길이"""
+        for bucket in LENGTH_BUCKETS:
+            if length <= bucket:
+                return bucket
+        return LENGTH_BUCKETS[-1]
+    
+    def _infer(self, texts: List[str]) -> List[Dict[str, float]]:
+        """배치 추론 (배칭 워커 스레드에서 호출)"""
+        encoded = self.tokenizer(texts, truncation=True, max_length=self.MAX_LENGTH)
+        
+        # 길이 버킷별로 묶어 버킷 길이까지만 패딩
+        groups: Dict[int, List[int]] = {}
+        for i, input_ids in enumerate(encoded["input_ids"]):
+            groups.setdefault(self._bucket_for(len(input_ids)), []).append(i)
+        
+        results: List[Dict[str, float]] = [{} for _ in texts]
+        for bucket, indices in groups.items():
+            features = [{key: encoded[key][i] for key in encoded.keys()} for i in indices]
+            probs = self._forward(features, bucket)
+            for i, row in zip(indices, probs):
+                results[i] = {label: float(score) for label, score in zip(LABELS, row)}
+        return results
+    
+    def _forward(self, features: List[Dict[str, List[int]]], length: int) -> np.ndarray:
+        """패딩 + 모델 실행 -> (batch, 3) 확률"""
+        if self._session is not None:
+            inputs = self.tokenizer.pad(features, padding="max_length", max_length=length, return_tensors="np")
+            feed = {
+                node.name: inputs[node.name].astype(np.int64)
+                for node in self._session.get_inputs()
+            }
+            logits = self._session.run(["logits"], feed)[0]
+            exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            return exp / exp.sum(axis=-1, keepdims=True)
+        
+        inputs = self.tokenizer.pad(features, padding="max_length", max_length=length, return_tensors="pt")
+        with torch.inference_mode():
+            outputs = self.model(**inputs.to(self.device))
+            return torch.softmax(outputs.logits, dim=-1).cpu().numpy()
+    
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, float]]:
+        with self._cache_lock:
+            scores = self._cache.get(key)
+            if scores is None:
+                self._cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+            return scores
+    
+    def _cache_put(self, key: str, scores: Dict[str, float]):
+        if self._cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = scores
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+    
+    @staticmethod
+    def _to_result(scores: Dict[str, float]) -> SentimentResult:
+        if "error" in scores:
             return SentimentResult(
                 label=SentimentLabel.NEUTRAL,
                 confidence=0.0,
-                scores={"error": "model not loaded"},
+                scores=dict(scores),
             )
+        label = max(LABELS, key=lambda name: scores[name])
+        return SentimentResult(
+            label=SentimentLabel(label),
+            confidence=scores[label],
+            scores=dict(scores),
+        )
+    
+    def analyze_sentences(self, texts: List[str]) -> List[SentimentResult]:
+        """
+        여러 문장 감성 분석 (캐시 조회 후 나머지는 배칭 워커로)
         
-        try:
-            # 토큰화
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512,
-                padding=True,
-            ).to(self.device)
-            
-            # 추론
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                probs = torch.softmax(outputs.logits, dim=-1)
-            
-            # 결과 추출
-            scores = probs[0].cpu().numpy()
-            labels = ["positive", "negative", "neutral"]
-            
-            score_dict = {label: float(score) for label, score in zip(labels, scores)}
-            max_idx = scores.argmax()
+        Args:
+            texts: 분석할 문장 목록
             
-            return SentimentResult(
-                label=SentimentLabel(labels[max_idx]),
-                confidence=float(scores[max_idx]),
-                scores=score_dict,
-            )
+        Returns:
+            입력 순서대로 SentimentResult 목록
+        """
+        if not TRANSFORMERS_AVAILABLE:
+            return [self._to_result({"error": "transformers not installed"}) for _ in texts]
+        
+        if not self._model_loaded:
+            return [self._to_result({"error": "model not loaded"}) for _ in texts]
+        
+        keys = [self._cache_key(text) for text in texts]
+        scores: Dict[str, Dict[str, float]] = {}
+        missing: Dict[str, str] = {}
+        for text, key in zip(texts, keys):
+            if key in scores or key in missing:
+                continue
+            cached = self._cache_get(key)
+            if cached is not None:
+                scores[key] = cached
+            else:
+                missing[key] = text
+        
+        if missing:
+            futures = self._batcher.submit_many(list(missing.values()))
+            for key, future in zip(missing, futures):
+                try:
+                    scores[key] = future.result()
+                    self._cache_put(key, scores[key])
+                except Exception as e:
+                    scores[key] = {"error": str(e)}
+        
+        return [self._to_result(scores[key]) for key in keys]
+    
+    def analyze_sentiment(self, text: str) -> SentimentResult:
+        """
+        텍스트 감성 분석
+        
+        Args:
+            text: 분석할 텍스트
             
-        except Exception as e:
-            return SentimentResult(
-                label=SentimentLabel.NEUTRAL,
-                confidence=0.0,
-                scores={"error": str(e)},
-            )
+        Returns:
+            SentimentResult: 감성 분석 결과
+        """
+        return self.analyze_sentences([text])[0]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 / 배칭 통계"""
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            cache = {
+                "entries": len(self._cache),
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+            }
+        batches = self._batcher.batches
+        return {
+            "model_loaded": self._model_loaded,
+            "backend": "onnx" if self._session is not None else ("torch-int8" if self.quantize else "torch"),
+            "cache": cache,
+            "batches": batches,
+            "avg_batch_size": self._batcher.items / batches if batches else 0.0,
+        }
+    
+    def close(self):
+        """배칭 워커 종료"""
+        self._batcher.close()
     
     def analyze_hype(self, text: str) -> HypeAnalysisResult:
         """
@@ -288,12 +610,11 @@ class FinBERTAnalyzer:
         neutral_count = 0
         total_confidence = 0
         
-        for sentence in sentences[:20]:  # 최대 20문장
-            if len(sentence.strip()) < 10:
-                continue
-                
-            sentiment = self.analyze_sentiment(sentence)
-            
+        # 최대 20문장을 한 번에 제출 (배칭 워커가 한 배치로 추론)
+        candidates = [s for s in sentences[:20] if len(s.strip()) >= 10]
+        sentiments = self.analyze_sentences(candidates)
+        
+        for sentence, sentiment in zip(candidates, sentiments):
             result.sentence_analysis.append({
                 "text": sentence[:100],
                 "sentiment": sentiment.label.value,
@@ -395,13 +716,21 @@ class FinBERTAnalyzer:
 
 # 싱글톤 인스턴스
 _analyzer: Optional[FinBERTAnalyzer] = None
+_analyzer_lock = threading.Lock()
 
 
 def get_sentiment_analyzer() -> FinBERTAnalyzer:
-    """FinBERT 분석기 싱글톤 인스턴스"""
+    """
+    FinBERT 분석기 싱글톤 인스턴스
+    
+    모델은 로드하지 않습니다. 서비스 시작 시 warmup()을 호출해야 하며
+    (AutoCollectorService.run_forever), 그 전에는 규칙 기반 결과만 반환합니다.
+    """
     global _analyzer
     if _analyzer is None:
-        _analyzer = FinBERTAnalyzer()
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = FinBERTAnalyzer()
     return _analyzer
 
 
@@ -524,6 +853,7 @@ if __name__ == "__main__":
         print("2. FinBERT 분석 (정확함)")
         
         analyzer = get_sentiment_analyzer()
+        analyzer.warmup()
         for i, text in enumerate(test_texts, 1):
             result = analyzer.analyze_hype(text)
             print(f"\n테스트 {i}:")
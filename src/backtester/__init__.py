@@ -5,14 +5,30 @@ Pine Script 전략 변환 및 백테스트 통합 서비스
 """
 
 from .data_collector import BinanceDataCollector, SyncBinanceDataCollector
+from .ohlcv_store import OHLCVStore
 from .backtest_engine import BacktestEngine, BacktestResult, quick_backtest
+from .event_simulator import BarData, CandleWindow, EventSimulator, LegacySignalAdapter
+from .result_store import DatasetFingerprint, ResultKey, ResultStore
 from .strategy_tester import StrategyTester
+from .walk_forward import WalkForwardEngine, WalkForwardResult, purged_kfold_folds, walk_forward_folds
 
 __all__ = [
     'BinanceDataCollector',
     'SyncBinanceDataCollector',
+    'OHLCVStore',
     'BacktestEngine',
     'BacktestResult',
     'quick_backtest',
+    'BarData',
+    'CandleWindow',
+    'EventSimulator',
+    'LegacySignalAdapter',
+    'DatasetFingerprint',
+    'ResultKey',
+    'ResultStore',
     'StrategyTester',
+    'WalkForwardEngine',
+    'WalkForwardResult',
+    'purged_kfold_folds',
+    'walk_forward_folds',
 ]
@@ -6,17 +6,18 @@ Binance OHLCV data collector for backtesting.
 import ccxt
 import pandas as pd
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import logging
-import json
+
+from .ohlcv_store import OHLCVStore, timeframe_to_ms
 
 logger = logging.getLogger(__name__)
 
 
 class BinanceDataCollector:
-    """Collects and caches OHLCV data from Binance exchange."""
+    """Collects OHLCV data from Binance into a shared columnar store."""
 
     SUPPORTED_TIMEFRAMES = ["1m", "5m", "15m", "30m", "1h", "4h", "1d", "1w"]
     MAX_CANDLES_PER_REQUEST = 1000
@@ -25,6 +26,7 @@ class BinanceDataCollector:
         """Initialize Binance data collector."""
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.store = OHLCVStore(self.cache_dir)
 
         self.exchange = ccxt.binance({
             'enableRateLimit': True,
@@ -41,25 +43,50 @@ class BinanceDataCollector:
         end_date: str,
         force_refresh: bool = False
     ) -> pd.DataFrame:
-        """Fetch OHLCV data for a symbol and timeframe within a date range."""
+        """
+        Fetch OHLCV data for a symbol and timeframe within a date range.
+
+        Only ranges missing from the store are downloaded; everything else is
+        served from memory-mapped partitions.
+        """
         if timeframe not in self.SUPPORTED_TIMEFRAMES:
             raise ValueError(f"Timeframe {timeframe} not supported.")
 
-        if not force_refresh:
-            cached_data = self.get_cached_data(symbol, timeframe, start_date, end_date)
-            if cached_data is not None:
-                logger.info(f"Using cached data for {symbol} {timeframe}")
-                return cached_data
-
-        logger.info(f"Fetching {symbol} {timeframe} data from {start_date} to {end_date}")
-
         start_ts = self._date_to_timestamp(start_date)
         end_ts = self._date_to_timestamp(end_date)
 
+        if force_refresh:
+            missing = [(start_ts, end_ts)]
+        else:
+            missing = self.store.missing_ranges(symbol, timeframe, start_ts, end_ts)
+
+        if not missing:
+            logger.info(f"Using cached data for {symbol} {timeframe}")
+
+        for range_start, range_end in missing:
+            logger.info(
+                f"Fetching {symbol} {timeframe} data from "
+                f"{self._timestamp_to_date(range_start)} to {self._timestamp_to_date(range_end)}"
+            )
+            candles = await self._fetch_range(symbol, timeframe, range_start, range_end)
+            self.store.append(
+                symbol, timeframe, candles,
+                covered=self._closed_range(timeframe, range_start, range_end)
+            )
+
+        df = self._read_store(symbol, timeframe, start_ts, end_ts)
+
+        logger.info(f"Fetched {len(df)} candles for {symbol} {timeframe}")
+        return df
+
+    async def _fetch_range(
+        self, symbol: str, timeframe: str, start_ts: int, end_ts: int
+    ) -> List[list]:
+        """Download candles in [start_ts, end_ts] page by page."""
         all_candles = []
         current_ts = start_ts
 
-        while current_ts < end_ts:
+        while current_ts <= end_ts:
             try:
                 candles = await asyncio.to_thread(
                     self.exchange.fetch_ohlcv,
@@ -69,7 +96,7 @@ class BinanceDataCollector:
                 if not candles:
                     break
 
-                all_candles.extend(candles)
+                all_candles.extend(c for c in candles if c[0] <= end_ts)
                 current_ts = candles[-1][0] + 1
 
                 if candles[-1][0] >= end_ts:
@@ -84,34 +111,19 @@ class BinanceDataCollector:
                 logger.error(f"Exchange error: {e}")
                 raise
 
-        df = self._candles_to_dataframe(all_candles)
-
-        df = df[
-            (df['timestamp'] >= pd.to_datetime(start_date)) &
-            (df['timestamp'] <= pd.to_datetime(end_date))
-        ]
-
-        self.save_to_cache(df, symbol, timeframe, start_date, end_date)
-
-        logger.info(f"Fetched {len(df)} candles for {symbol} {timeframe}")
-        return df
+        return all_candles
 
     def get_cached_data(
         self, symbol: str, timeframe: str, start_date: str, end_date: str
     ) -> Optional[pd.DataFrame]:
-        """Retrieve cached data if available and valid."""
-        cache_file = self._get_cache_filepath(symbol, timeframe, start_date, end_date)
-
-        if not cache_file.exists():
-            return None
+        """Return stored data if the whole range has already been fetched."""
+        start_ts = self._date_to_timestamp(start_date)
+        end_ts = self._date_to_timestamp(end_date)
 
         try:
-            cache_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if cache_age > timedelta(days=1):
+            if self.store.missing_ranges(symbol, timeframe, start_ts, end_ts):
                 return None
-
-            df = pd.read_parquet(cache_file)
-            return df
+            return self._read_store(symbol, timeframe, start_ts, end_ts)
         except Exception as e:
             logger.warning(f"Error reading cache: {e}")
             return None
@@ -119,53 +131,45 @@ class BinanceDataCollector:
     def save_to_cache(
         self, df: pd.DataFrame, symbol: str, timeframe: str, start_date: str, end_date: str
     ) -> None:
-        """Save DataFrame to cache."""
-        cache_file = self._get_cache_filepath(symbol, timeframe, start_date, end_date)
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        """Append a DataFrame to the store and mark its range as fetched."""
+        start_ts = self._date_to_timestamp(start_date)
+        end_ts = self._date_to_timestamp(end_date)
 
         try:
-            df.to_parquet(cache_file, index=False)
-
-            metadata = {
-                'symbol': symbol, 'timeframe': timeframe,
-                'start_date': start_date, 'end_date': end_date,
-                'rows': len(df), 'cached_at': datetime.now().isoformat()
-            }
-
-            with open(cache_file.with_suffix('.json'), 'w') as f:
-                json.dump(metadata, f, indent=2)
-
+            self.store.append(
+                symbol, timeframe, df,
+                covered=self._closed_range(timeframe, start_ts, end_ts)
+            )
         except Exception as e:
             logger.error(f"Error saving to cache: {e}")
 
     def list_cached_data(self) -> List[dict]:
         """List all cached datasets."""
-        cached = []
-        for f in self.cache_dir.rglob("*.json"):
-            try:
-                with open(f, 'r') as file:
-                    cached.append(json.load(file))
-            except Exception:
-                pass
-        return cached
+        return [
+            {
+                'symbol': p['symbol'], 'timeframe': p['timeframe'],
+                'start_date': self._timestamp_to_date(p['start_ts']),
+                'end_date': self._timestamp_to_date(p['end_ts']),
+                'rows': p['rows'], 'months': p['months'], 'path': p['path']
+            }
+            for p in self.store.list_partitions()
+        ]
+
+    def find_gaps(
+        self, symbol: str, timeframe: str,
+        start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> List[Tuple[str, str]]:
+        """Missing bars between stored candles, as (first, last) timestamps."""
+        start_ts = self._date_to_timestamp(start_date) if start_date else None
+        end_ts = self._date_to_timestamp(end_date) if end_date else None
+        return [
+            (self._timestamp_to_date(s), self._timestamp_to_date(e))
+            for s, e in self.store.find_gaps(symbol, timeframe, start_ts, end_ts)
+        ]
 
     def clear_cache(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> int:
         """Clear cached data."""
-        deleted = 0
-        for f in self.cache_dir.rglob("*.parquet"):
-            should_delete = True
-            if symbol and symbol.replace('/', '_') not in f.name:
-                should_delete = False
-            if timeframe and timeframe not in f.name:
-                should_delete = False
-            if should_delete:
-                try:
-                    f.unlink()
-                    f.with_suffix('.json').unlink(missing_ok=True)
-                    deleted += 1
-                except Exception:
-                    pass
-        return deleted
+        return self.store.delete(symbol, timeframe)
 
     async def get_available_symbols(self) -> List[str]:
         """Get list of available trading symbols from Binance."""
@@ -176,19 +180,25 @@ class BinanceDataCollector:
             logger.error(f"Error fetching symbols: {e}")
             return []
 
-    def _get_cache_filepath(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> Path:
-        safe_symbol = symbol.replace('/', '_')
-        return self.cache_dir / safe_symbol / f"{safe_symbol}_{timeframe}_{start_date}_{end_date}.parquet"
+    def _read_store(self, symbol: str, timeframe: str, start_ts: int, end_ts: int) -> pd.DataFrame:
+        columns = self.store.read_arrays(symbol, timeframe, start_ts, end_ts)
+        df = pd.DataFrame({
+            'timestamp': pd.to_datetime(columns['timestamp'], unit='ms'),
+            **{col: columns[col] for col in OHLCVStore.COLUMNS}
+        })
+        return df
+
+    def _closed_range(self, timeframe: str, start_ts: int, end_ts: int) -> Tuple[int, int]:
+        """Clamp a fetched range to bars that have already closed."""
+        now_ts = int(datetime.now(timezone.utc).timestamp() * 1000)
+        return start_ts, min(end_ts, now_ts - timeframe_to_ms(timeframe))
 
     def _date_to_timestamp(self, date_str: str) -> int:
-        return int(datetime.strptime(date_str, '%Y-%m-%d').timestamp() * 1000)
-
-    def _candles_to_dataframe(self, candles: List[list]) -> pd.DataFrame:
-        df = pd.DataFrame(candles, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = df[col].astype(float)
-        return df.sort_values('timestamp').reset_index(drop=True)
+        dt = datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        return int(dt.timestamp() * 1000)
+
+    def _timestamp_to_date(self, ts: int) -> str:
+        return datetime.fromtimestamp(ts / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M')
 
     async def close(self):
         """Close exchange connection if supported."""
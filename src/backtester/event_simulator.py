@@ -0,0 +1,380 @@
+"""
+이벤트 기반 백테스트 시뮬레이터 (numpy 컬럼 기반)
+
+StrategyTester의 봉 단위 시뮬레이션 코어
+- OHLCV는 연속된 numpy 컬럼으로 한 번만 변환 (BarData)
+- 전략에는 복사 없는 읽기 전용 윈도우 뷰(CandleWindow) 전달
+- 자산/포지션/거래 상태는 미리 할당한 배열에 기록
+- 수수료/슬리피지는 BacktestEngine과 동일한 방식
+  (진입/청산 체결가에 슬리피지, 진입/청산마다 자산에 수수료)
+- 기존 generate_signal(current_price, candles, params, current_position) 계약은
+  LegacySignalAdapter로 그대로 지원 (candles는 기존처럼 dict 행 리스트)
+"""
+
+import inspect
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+FLAT, LONG, SHORT = 0, 1, -1
+SIDE_NAMES = {LONG: "long", SHORT: "short"}
+
+
+class BarData:
+    """연속 numpy 컬럼 OHLCV (읽기 전용)"""
+
+    def __init__(self, timestamp, open, high, low, close, volume=None):
+        n = len(close)
+        self.timestamp = np.ascontiguousarray(timestamp, dtype=np.int64)
+        self.open = np.ascontiguousarray(open, dtype=np.float64)
+        self.high = np.ascontiguousarray(high, dtype=np.float64)
+        self.low = np.ascontiguousarray(low, dtype=np.float64)
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        self.volume = np.ascontiguousarray(
+            np.zeros(n) if volume is None else volume, dtype=np.float64
+        )
+        for name in COLUMNS:
+            getattr(self, name).flags.writeable = False
+        self._rows: Optional[List[Dict[str, Any]]] = None
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_candles(cls, candles: List[Dict[str, Any]]) -> "BarData":
+        """List[Dict] 캔들에서 생성"""
+        data = cls(*(
+            np.array([c.get(name) or 0 for c in candles], dtype=np.float64) for name in COLUMNS
+        ))
+        # 기존 dict를 그대로 재사용 (레거시 전략이 보는 행과 동일)
+        data._rows = list(candles)
+        return data
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "BarData":
+        """open/high/low/close(/volume) 컬럼 DataFrame에서 생성 (timestamp는 컬럼 또는 인덱스)"""
+        if "timestamp" in df.columns:
+            ts = df["timestamp"].to_numpy()
+        elif isinstance(df.index, pd.DatetimeIndex):
+            ts = df.index.asi8 // 1_000_000
+        else:
+            ts = np.arange(len(df))
+        volume = df["volume"].to_numpy() if "volume" in df.columns else None
+        return cls(ts, df["open"].to_numpy(), df["high"].to_numpy(),
+                   df["low"].to_numpy(), df["close"].to_numpy(), volume)
+
+    @property
+    def rows(self) -> List[Dict[str, Any]]:
+        """행 dict 목록 (레거시 전략용, 최초 접근 시 한 번만 생성)"""
+        if self._rows is None:
+            self._rows = [
+                {"timestamp": int(t), "open": o, "high": h, "low": l, "close": c, "volume": v}
+                for t, o, h, l, c, v in zip(
+                    self.timestamp.tolist(), self.open.tolist(), self.high.tolist(),
+                    self.low.tolist(), self.close.tolist(), self.volume.tolist(),
+                )
+            ]
+        return self._rows
+
+    def window(self, start: int, end: int) -> "CandleWindow":
+        return CandleWindow(self, start, end)
+
+
+class CandleWindow(Sequence):
+    """
+    BarData의 [start, end) 구간 읽기 전용 뷰
+
+    - `window.close` 등 컬럼은 복사 없는 numpy 뷰
+    - 정수 인덱스/반복은 dict 행을 반환하므로 `[c['close'] for c in candles]` 같은
+      기존 코드도 그대로 동작 (행 dict는 데이터셋당 한 번만 생성)
+    - list가 아니므로 `window + [...]`, `json.dumps(window)`, `isinstance(window, list)`는
+      동작하지 않음 - 리스트가 필요하면 to_list() (기존 generate_signal에는 리스트를 전달)
+    """
+
+    __slots__ = ("_data", "_start", "_end")
+
+    def __init__(self, data: BarData, start: int, end: int):
+        self._data = data
+        self._start = start
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self._data.rows[self._start + start:self._start + stop:step]
+            return CandleWindow(self._data, self._start + start, self._start + max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("candle index out of range")
+        return self._data.rows[self._start + index]
+
+    def __iter__(self):
+        return iter(self._data.rows[self._start:self._end])
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """dict 행 리스트 (행 dict는 공유하는 얕은 복사)"""
+        return self._data.rows[self._start:self._end]
+
+    def _column(self, name: str) -> np.ndarray:
+        return getattr(self._data, name)[self._start:self._end]
+
+    timestamp = property(lambda self: self._column("timestamp"))
+    open = property(lambda self: self._column("open"))
+    high = property(lambda self: self._column("high"))
+    low = property(lambda self: self._column("low"))
+    close = property(lambda self: self._column("close"))
+    volume = property(lambda self: self._column("volume"))
+
+
+class PositionState:
+    """전략에 전달하는 현재 포지션"""
+
+    __slots__ = ("side", "entry_price", "pnl_percent")
+
+    def __init__(self, side: str, entry_price: float, pnl_percent: float):
+        self.side = side
+        self.entry_price = entry_price
+        self.pnl_percent = pnl_percent
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"side": self.side, "entry_price": self.entry_price, "pnl_percent": self.pnl_percent}
+
+
+# 전략 호출 규약: (윈도우, 포지션) -> 'buy' | 'sell' | 'close' | 'hold' 또는 {'action': ...}
+SignalFunc = Callable[[CandleWindow, Optional[PositionState]], Union[str, Mapping[str, Any]]]
+
+
+class LegacySignalAdapter:
+    """
+    기존 generate_signal(current_price, candles, params, current_position) 함수 어댑터
+
+    함수 시그니처를 한 번 검사하여 받는 인자만 전달합니다.
+    (params를 받지 않는 변환 전략 클래스의 generate_signal도 그대로 동작)
+    candles는 CandleWindow 대신 기존과 같은 dict 행 리스트로 전달하므로
+    리스트 연산(+, json.dumps, isinstance)을 쓰는 기존 전략도 그대로 동작합니다.
+    """
+
+    def __init__(self, func: Callable, params: Optional[Dict[str, Any]] = None):
+        self.func = func
+        self.params = params or {}
+        try:
+            signature = inspect.signature(func)
+            accepts = set(signature.parameters)
+            var_kw = any(p.kind is p.VAR_KEYWORD for p in signature.parameters.values())
+        except (TypeError, ValueError):
+            accepts, var_kw = set(), True
+        self._pass_params = var_kw or "params" in accepts
+
+    def __call__(self, window: CandleWindow, position: Optional[PositionState]):
+        candles = window.to_list()
+        kwargs = {
+            "current_price": candles[-1]["close"],
+            "candles": candles,
+            "current_position": position.to_dict() if position else None,
+        }
+        if self._pass_params:
+            kwargs["params"] = self.params
+        return self.func(**kwargs)
+
+
+@dataclass
+class SimulationResult:
+    """시뮬레이션 결과 (배열 기반)"""
+    timestamps: np.ndarray       # 평가한 봉의 타임스탬프
+    equity: np.ndarray           # 봉 종가 기준 평가 자산
+    position: np.ndarray         # 봉 마감 시점 포지션 (1/-1/0)
+    trade_side: np.ndarray       # 거래 방향 (1/-1)
+    trade_entry_idx: np.ndarray  # 진입 봉 인덱스 (BarData 기준)
+    trade_exit_idx: np.ndarray   # 청산 봉 인덱스
+    trade_entry_price: np.ndarray
+    trade_exit_price: np.ndarray
+    trade_return: np.ndarray     # 체결가 기준 수익률 (비율)
+    trade_pnl: np.ndarray        # 수익금 (수수료 전 자산 기준, BacktestEngine과 동일)
+    initial_capital: float
+    final_capital: float
+    signal_errors: int = 0
+
+    @property
+    def total_trades(self) -> int:
+        return len(self.trade_return)
+
+    def trades(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "side": SIDE_NAMES[int(side)],
+                "entry_price": float(entry),
+                "exit_price": float(exit_),
+                "pnl_percent": float(ret * 100),
+            }
+            for side, entry, exit_, ret in zip(
+                self.trade_side, self.trade_entry_price, self.trade_exit_price, self.trade_return
+            )
+        ]
+
+    def max_drawdown(self) -> float:
+        """최대 낙폭 (%)"""
+        if not len(self.equity):
+            return 0.0
+        peak = np.maximum.accumulate(self.equity)
+        return float(np.max((peak - self.equity) / peak) * 100)
+
+
+class EventSimulator:
+    """봉 단위 이벤트 시뮬레이터"""
+
+    def __init__(
+        self,
+        initial_capital: float = 10000.0,
+        fees: float = 0.001,
+        slippage: float = 0.0005,
+        lookback: int = 100,
+    ):
+        """
+        Args:
+            initial_capital: 초기 자본
+            fees: 진입/청산 수수료 (비율)
+            slippage: 체결 슬리피지 (비율)
+            lookback: 전략에 전달할 과거 봉 수 (윈도우 = 과거 lookback개 + 현재 봉)
+        """
+        self.initial_capital = initial_capital
+        self.fees = fees
+        self.slippage = slippage
+        self.lookback = lookback
+
+    def _entry_price(self, price: float, side: int) -> float:
+        return price * (1 + self.slippage if side == LONG else 1 - self.slippage)
+
+    def _exit_price(self, price: float, side: int) -> float:
+        return price * (1 - self.slippage if side == LONG else 1 + self.slippage)
+
+    @staticmethod
+    def _action(signal) -> str:
+        if isinstance(signal, dict):
+            return signal.get("action", "hold")
+        if isinstance(signal, str):
+            return signal
+        if isinstance(signal, Mapping):
+            return signal.get("action", "hold")
+        return "hold"
+
+    def run(self, data: BarData, strategy: SignalFunc) -> SimulationResult:
+        """
+        시뮬레이션 실행
+
+        lookback번째 봉부터 매 봉 종가에서 전략을 호출하고 같은 봉 종가로 체결합니다.
+        마지막 봉에 남은 포지션은 종가로 청산합니다.
+        """
+        n = len(data)
+        start = min(self.lookback, n)
+        steps = n - start
+
+        equity = np.empty(steps, dtype=np.float64)
+        position = np.zeros(steps, dtype=np.int8)
+
+        # 진입 후 다음 봉 이후에만 청산되므로 거래 수는 steps/2 + 1 이하
+        max_trades = steps // 2 + 1
+        t_side = np.zeros(max_trades, dtype=np.int8)
+        t_entry_idx = np.zeros(max_trades, dtype=np.int64)
+        t_exit_idx = np.zeros(max_trades, dtype=np.int64)
+        t_entry = np.zeros(max_trades, dtype=np.float64)
+        t_exit = np.zeros(max_trades, dtype=np.float64)
+        t_ret = np.zeros(max_trades, dtype=np.float64)
+        t_pnl = np.zeros(max_trades, dtype=np.float64)
+        n_trades = 0
+
+        closes = data.close.tolist()
+        lookback = self.lookback
+        capital = self.initial_capital
+        side = FLAT
+        entry_price = 0.0
+        entry_idx = 0
+        errors = 0
+
+        def close_trade(i: int, price: float):
+            nonlocal capital, side, n_trades
+            exit_price = self._exit_price(price, side)
+            ret = (exit_price - entry_price) / entry_price * side
+            t_side[n_trades] = side
+            t_entry_idx[n_trades] = entry_idx
+            t_exit_idx[n_trades] = i
+            t_entry[n_trades] = entry_price
+            t_exit[n_trades] = exit_price
+            t_ret[n_trades] = ret
+            t_pnl[n_trades] = capital * ret
+            n_trades += 1
+            capital = capital * (1 + ret) * (1 - self.fees)
+            side = FLAT
+
+        for step in range(steps):
+            i = start + step
+            price = closes[i]
+
+            pos_state = None
+            if side != FLAT:
+                pos_state = PositionState(
+                    SIDE_NAMES[side], entry_price, (price - entry_price) / entry_price * side * 100
+                )
+
+            try:
+                window = CandleWindow(data, i - lookback if i > lookback else 0, i + 1)
+                action = self._action(strategy(window, pos_state))
+            except Exception as e:
+                errors += 1
+                if errors == 1:
+                    logger.debug(f"Strategy error at bar {i}: {e}")
+                action = "hold"
+
+            if side == FLAT and action in ("buy", "sell"):
+                side = LONG if action == "buy" else SHORT
+                entry_price = self._entry_price(price, side)
+                entry_idx = i
+                capital *= (1 - self.fees)
+            elif side != FLAT and action == "close":
+                close_trade(i, price)
+
+            position[step] = side
+            equity[step] = capital if side == FLAT else capital * (1 + (price - entry_price) / entry_price * side)
+
+        if side != FLAT:
+            close_trade(n - 1, closes[-1])
+            if steps:
+                equity[-1] = capital
+
+        return SimulationResult(
+            timestamps=data.timestamp[start:],
+            equity=equity,
+            position=position,
+            trade_side=t_side[:n_trades],
+            trade_entry_idx=t_entry_idx[:n_trades],
+            trade_exit_idx=t_exit_idx[:n_trades],
+            trade_entry_price=t_entry[:n_trades],
+            trade_exit_price=t_exit[:n_trades],
+            trade_return=t_ret[:n_trades],
+            trade_pnl=t_pnl[:n_trades],
+            initial_capital=self.initial_capital,
+            final_capital=capital,
+            signal_errors=errors,
+        )
+
+    def run_legacy(
+        self,
+        candles: Union[List[Dict[str, Any]], BarData],
+        generate_signal: Callable,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> SimulationResult:
+        """기존 generate_signal 함수로 실행"""
+        data = candles if isinstance(candles, BarData) else BarData.from_candles(candles)
+        return self.run(data, LegacySignalAdapter(generate_signal, params))
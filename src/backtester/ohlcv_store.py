@@ -0,0 +1,412 @@
+"""
+Columnar OHLCV store shared by the data collectors.
+
+Layout (one partition set per symbol/timeframe):
+
+    {root}/{SYMBOL}/{timeframe}/_manifest.json
+    {root}/{SYMBOL}/{timeframe}/2024-01.arrow
+    {root}/{SYMBOL}/{timeframe}/2024-02.arrow
+    ...
+
+Each monthly partition is an uncompressed Arrow IPC file holding a single
+record batch: ``timestamp`` (int64 epoch milliseconds, sorted, unique) and
+``open``/``high``/``low``/``close``/``volume`` (float64). Partitions are
+memory-mapped on read, so range reads slice the mapped buffers instead of
+re-parsing files.
+
+Updates are append-only at partition granularity: new candles only rewrite
+the months they fall into (usually just the last one). The manifest records
+which timestamp ranges have already been fetched ("coverage"), so callers can
+ask for the missing ranges and download nothing else.
+
+Appending candles invalidates that dataset in the process-wide indicator
+cache (src/converter/indicator_cache.py) when the converter is loaded.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+TIMEFRAME_MS = {
+    "1m": 60_000,
+    "3m": 180_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "2h": 7_200_000,
+    "4h": 14_400_000,
+    "6h": 21_600_000,
+    "8h": 28_800_000,
+    "12h": 43_200_000,
+    "1d": 86_400_000,
+    "3d": 259_200_000,
+    "1w": 604_800_000,
+}
+
+Range = Tuple[int, int]
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """Bar length of a timeframe in milliseconds."""
+    try:
+        return TIMEFRAME_MS[timeframe]
+    except KeyError:
+        raise ValueError(f"Timeframe {timeframe} not supported by OHLCVStore.")
+
+
+def merge_ranges(ranges: List[Range], step: int = 1) -> List[Range]:
+    """Merge inclusive ranges that overlap or are at most `step` apart."""
+    merged: List[List[int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + step:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+class OHLCVStore:
+    """Partitioned, append-only columnar OHLCV store."""
+
+    COLUMNS = ("open", "high", "low", "close", "volume")
+    MANIFEST = "_manifest.json"
+    SCHEMA = pa.schema(
+        [("timestamp", pa.int64())] + [(col, pa.float64()) for col in COLUMNS]
+    )
+
+    def __init__(self, root: Union[str, Path] = "data/market_data"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Paths and manifest
+    # ------------------------------------------------------------------
+
+    def partition_dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / symbol.replace('/', '_') / timeframe
+
+    def _month_path(self, symbol: str, timeframe: str, month: str) -> Path:
+        return self.partition_dir(symbol, timeframe) / f"{month}.arrow"
+
+    def load_manifest(self, symbol: str, timeframe: str) -> dict:
+        path = self.partition_dir(symbol, timeframe) / self.MANIFEST
+        if not path.exists():
+            return {
+                'symbol': symbol,
+                'timeframe': timeframe,
+                'interval_ms': timeframe_to_ms(timeframe),
+                'months': {},
+                'coverage': [],
+            }
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _save_manifest(self, symbol: str, timeframe: str, manifest: dict) -> None:
+        path = self.partition_dir(symbol, timeframe) / self.MANIFEST
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(
+        self,
+        symbol: str,
+        timeframe: str,
+        candles: Union[pd.DataFrame, np.ndarray, List[list]],
+        covered: Optional[Range] = None,
+    ) -> int:
+        """
+        Merge candles into the store.
+
+        Args:
+            candles: ccxt-style rows ``[ts_ms, open, high, low, close, volume]``
+                or a DataFrame with a ``timestamp`` column / DatetimeIndex and
+                open/high/low/close/volume columns (any capitalisation).
+            covered: Inclusive ``(start_ms, end_ms)`` range that the candles
+                fully describe. It is added to the manifest coverage even when
+                the exchange returned no rows for part of it.
+
+        Returns:
+            Number of rows written.
+        """
+        timestamps, values = self._to_arrays(candles)
+        manifest = self.load_manifest(symbol, timeframe)
+        part_dir = self.partition_dir(symbol, timeframe)
+        part_dir.mkdir(parents=True, exist_ok=True)
+
+        if len(timestamps):
+            # Sort and drop duplicates, keeping the last occurrence
+            order = np.argsort(timestamps, kind='stable')
+            timestamps, values = timestamps[order], values[order]
+            keep = np.append(timestamps[1:] != timestamps[:-1], True)
+            timestamps, values = timestamps[keep], values[keep]
+
+            months = timestamps.astype('datetime64[ms]').astype('datetime64[M]')
+            bounds = np.flatnonzero(months[1:] != months[:-1]) + 1
+            for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(timestamps)]):
+                month = str(months[start])
+                self._write_month(
+                    symbol, timeframe, month, manifest,
+                    timestamps[start:end], values[start:end]
+                )
+
+        if covered is not None and covered[0] <= covered[1]:
+            coverage = [tuple(r) for r in manifest['coverage']] + [tuple(covered)]
+            manifest['coverage'] = [
+                list(r) for r in merge_ranges(coverage, manifest['interval_ms'])
+            ]
+
+        self._save_manifest(symbol, timeframe, manifest)
+        if len(timestamps):
+            # Only loaded caches can hold results for this dataset
+            indicator_cache = sys.modules.get("src.converter.indicator_cache")
+            if indicator_cache is not None:
+                indicator_cache.invalidate_dataset(symbol, timeframe)
+        return len(timestamps)
+
+    def _write_month(
+        self,
+        symbol: str,
+        timeframe: str,
+        month: str,
+        manifest: dict,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+    ) -> None:
+        path = self._month_path(symbol, timeframe, month)
+
+        if path.exists():
+            old_ts, old_values = self._read_month(path)
+            # Incoming rows replace stored rows with the same timestamp
+            stale = np.isin(old_ts, timestamps)
+            if not stale.any() and old_ts[-1] < timestamps[0]:
+                timestamps = np.concatenate([old_ts, timestamps])
+                values = np.concatenate([old_values, values])
+            else:
+                timestamps = np.concatenate([old_ts[~stale], timestamps])
+                values = np.concatenate([old_values[~stale], values])
+                order = np.argsort(timestamps, kind='stable')
+                timestamps, values = timestamps[order], values[order]
+
+        arrays = [pa.array(timestamps, type=pa.int64())]
+        arrays += [pa.array(np.ascontiguousarray(values[:, i])) for i in range(len(self.COLUMNS))]
+        batch = pa.record_batch(arrays, schema=self.SCHEMA)
+
+        tmp = path.with_suffix('.tmp')
+        with pa.OSFile(str(tmp), 'wb') as sink:
+            with pa.ipc.new_file(sink, self.SCHEMA) as writer:
+                writer.write_batch(batch)
+        os.replace(tmp, path)
+
+        manifest['months'][month] = {
+            'rows': int(len(timestamps)),
+            'first': int(timestamps[0]),
+            'last': int(timestamps[-1]),
+        }
+        manifest['months'] = dict(sorted(manifest['months'].items()))
+
+    def _to_arrays(self, candles) -> Tuple[np.ndarray, np.ndarray]:
+        if isinstance(candles, pd.DataFrame):
+            df = candles.rename(columns=str.lower)
+            if 'timestamp' in df.columns:
+                ts = df['timestamp']
+            else:
+                ts = df.index.to_series()
+            if pd.api.types.is_datetime64_any_dtype(ts):
+                ts = pd.DatetimeIndex(ts).as_unit('ms').asi8
+            timestamps = np.asarray(ts, dtype=np.int64)
+            values = df[list(self.COLUMNS)].to_numpy(dtype=np.float64)
+        else:
+            rows = np.asarray(candles, dtype=np.float64).reshape(-1, len(self.COLUMNS) + 1)
+            timestamps = rows[:, 0].astype(np.int64)
+            values = rows[:, 1:]
+        return timestamps, np.ascontiguousarray(values)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _read_month(self, path: Path) -> Tuple[np.ndarray, np.ndarray]:
+        """Read a partition into memory (used for rewrites)."""
+        with pa.memory_map(str(path), 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        timestamps = table.column('timestamp').to_numpy().copy()
+        values = np.column_stack([table.column(col).to_numpy() for col in self.COLUMNS])
+        return timestamps, values
+
+    def _map_month(self, path: Path) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy numpy views over a memory-mapped partition.
+
+        The file handle is closed on return; the mapped region stays alive
+        for as long as the returned arrays reference it.
+        """
+        with pa.memory_map(str(path), 'r') as source:
+            batch = pa.ipc.open_file(source).get_batch(0)
+            return {
+                name: batch.column(i).to_numpy(zero_copy_only=True)
+                for i, name in enumerate(batch.schema.names)
+            }
+
+    def read_arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Read an inclusive timestamp range as numpy arrays.
+
+        Only partitions overlapping the range are mapped. When the range lies
+        inside one month the arrays are read-only views of the mapped file.
+        """
+        manifest = self.load_manifest(symbol, timeframe)
+        lo = -np.inf if start_ms is None else start_ms
+        hi = np.inf if end_ms is None else end_ms
+
+        pieces = []
+        for month, info in manifest['months'].items():
+            if info['last'] < lo or info['first'] > hi:
+                continue
+            columns = self._map_month(self._month_path(symbol, timeframe, month))
+            ts = columns['timestamp']
+            left = 0 if start_ms is None else np.searchsorted(ts, start_ms, side='left')
+            right = len(ts) if end_ms is None else np.searchsorted(ts, end_ms, side='right')
+            pieces.append({name: col[left:right] for name, col in columns.items()})
+
+        names = ('timestamp',) + self.COLUMNS
+        if not pieces:
+            return {
+                name: np.empty(0, dtype=np.int64 if name == 'timestamp' else np.float64)
+                for name in names
+            }
+        if len(pieces) == 1:
+            return pieces[0]
+        return {name: np.concatenate([p[name] for p in pieces]) for name in names}
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Read a range as a DataFrame with an int64 ``timestamp`` column."""
+        return pd.DataFrame(self.read_arrays(symbol, timeframe, start_ms, end_ms))
+
+    # ------------------------------------------------------------------
+    # Coverage and gaps
+    # ------------------------------------------------------------------
+
+    def coverage(self, symbol: str, timeframe: str) -> List[Range]:
+        return [tuple(r) for r in self.load_manifest(symbol, timeframe)['coverage']]
+
+    def missing_ranges(
+        self, symbol: str, timeframe: str, start_ms: int, end_ms: int
+    ) -> List[Range]:
+        """Parts of ``[start_ms, end_ms]`` that have not been fetched yet."""
+        missing = []
+        cursor = start_ms
+        for cov_start, cov_end in self.coverage(symbol, timeframe):
+            if cov_end < cursor:
+                continue
+            if cov_start > end_ms:
+                break
+            if cov_start > cursor:
+                missing.append((cursor, cov_start - 1))
+            cursor = max(cursor, cov_end + 1)
+            if cursor > end_ms:
+                break
+        if cursor <= end_ms:
+            missing.append((cursor, end_ms))
+        return missing
+
+    def find_gaps(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+    ) -> List[Range]:
+        """
+        Missing bars between stored candles.
+
+        Returns inclusive ``(first_missing_ts, last_missing_ts)`` ranges where
+        consecutive stored timestamps are more than one bar apart.
+        """
+        step = timeframe_to_ms(timeframe)
+        ts = self.read_arrays(symbol, timeframe, start_ms, end_ms)['timestamp']
+        if len(ts) < 2:
+            return []
+        holes = np.flatnonzero(np.diff(ts) > step)
+        return [(int(ts[i] + step), int(ts[i + 1] - step)) for i in holes]
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def summary(self, symbol: str, timeframe: str) -> Optional[dict]:
+        """Summary of one symbol/timeframe, built from the manifest only."""
+        return self._summarize(self.load_manifest(symbol, timeframe),
+                               self.partition_dir(symbol, timeframe))
+
+    def last_timestamp(self, symbol: str, timeframe: str) -> Optional[int]:
+        """Timestamp of the newest stored candle, or None."""
+        summary = self.summary(symbol, timeframe)
+        return summary['end_ts'] if summary else None
+
+    def list_partitions(self) -> List[dict]:
+        """Summary of every stored symbol/timeframe."""
+        summaries = []
+        for manifest_path in sorted(self.root.glob(f"*/*/{self.MANIFEST}")):
+            with open(manifest_path, 'r') as f:
+                summary = self._summarize(json.load(f), manifest_path.parent)
+            if summary:
+                summaries.append(summary)
+        return summaries
+
+    @staticmethod
+    def _summarize(manifest: dict, part_dir: Path) -> Optional[dict]:
+        months = manifest['months']
+        if not months:
+            return None
+        return {
+            'symbol': manifest['symbol'],
+            'timeframe': manifest['timeframe'],
+            'rows': sum(m['rows'] for m in months.values()),
+            'months': len(months),
+            'start_ts': min(m['first'] for m in months.values()),
+            'end_ts': max(m['last'] for m in months.values()),
+            'path': str(part_dir),
+        }
+
+    def delete(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> int:
+        """Delete partition sets matching the filters; returns files removed."""
+        deleted = 0
+        for manifest_path in list(self.root.glob(f"*/*/{self.MANIFEST}")):
+            part_dir = manifest_path.parent
+            if symbol and part_dir.parent.name != symbol.replace('/', '_'):
+                continue
+            if timeframe and part_dir.name != timeframe:
+                continue
+            for f in part_dir.glob("*.arrow"):
+                f.unlink()
+                deleted += 1
+            manifest_path.unlink()
+            try:
+                part_dir.rmdir()
+            except OSError:
+                pass
+        return deleted
@@ -15,6 +15,17 @@ import sqlite3
 
 logger = logging.getLogger(__name__)
 
+# 생성 코드에 그대로 포함하는 증분 지표 모듈 (테스트된 구현과 동일하게 유지)
+INDICATORS_MODULE = Path(__file__).resolve().parent.parent / "trading" / "indicators.py"
+
+
+def _incremental_indicators_source() -> str:
+    """src/trading/indicators.py 본문 (모듈 docstring 제외)"""
+    source = INDICATORS_MODULE.read_text(encoding="utf-8")
+    if source.startswith('"""'):
+        source = source[source.index('"""', 3) + 3:]
+    return source.strip()
+
 
 def generate_production_trading_bot(
     strategy_name: str,
@@ -157,6 +168,7 @@ class Config:
     # 봇 설정
     CHECK_INTERVAL: int = 60         # 시그널 확인 간격 (초)
     CANDLE_LIMIT: int = 100          # 분석용 캔들 개수
+    INDICATOR_STATE_FILE: str = "indicator_state.json"  # 증분 지표 상태 (재시작 시 복원)
 
 
 @dataclass
@@ -274,6 +286,13 @@ class TechnicalIndicators:
         return upper, sma, lower
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# 증분 지표 (확정 봉마다 O(1) 갱신, 상태 저장/복원)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+{_incremental_indicators_source()}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 전략 엔진
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -292,6 +311,26 @@ class TradingStrategy:
         self.config = config
         self.indicators = TechnicalIndicators()
 
+        # 증분 지표 상태 - 매 사이클 새로 확정된 봉만 반영
+        # (RSI/ATR은 TechnicalIndicators와 같은 단순평균 방식)
+        self.state = IndicatorSet(
+            ema_fast=EMA(config.EMA_FAST),
+            ema_slow=EMA(config.EMA_SLOW),
+            rsi=RSI(config.RSI_PERIOD, method="sma"),
+            atr=ATR(14, method="sma"),
+            bb=Bollinger(20, 2.0),
+        )
+        saved = load_snapshots(config.INDICATOR_STATE_FILE).get(config.SYMBOL)
+        if saved and self.state.restore(saved):
+            logger.info("📂 지표 상태 복원")
+
+    def save_state(self):
+        """지표 상태 저장"""
+        try:
+            save_snapshots(self.config.INDICATOR_STATE_FILE, {{self.config.SYMBOL: self.state}})
+        except OSError as e:
+            logger.warning(f"지표 상태 저장 실패: {{e}}")
+
     def analyze(
         self,
         candles: List[Dict],
@@ -306,24 +345,19 @@ class TradingStrategy:
         if len(candles) < self.config.EMA_SLOW + self.config.RSI_PERIOD:
             return {{'action': 'hold', 'reason': '데이터 부족', 'confidence': 0}}
 
-        # 가격 데이터 추출
-        closes = np.array([c['close'] for c in candles])
-        highs = np.array([c['high'] for c in candles])
-        lows = np.array([c['low'] for c in candles])
-        current_price = closes[-1]
+        current_price = candles[-1]['close']
 
-        # 지표 계산
-        ema_fast = self.indicators.ema(closes, self.config.EMA_FAST)
-        ema_slow = self.indicators.ema(closes, self.config.EMA_SLOW)
-        rsi = self.indicators.rsi(closes, self.config.RSI_PERIOD)
-        atr = self.indicators.atr(highs, lows, closes)
-        bb_upper, bb_mid, bb_lower = self.indicators.bollinger_bands(closes)
+        # 지표 계산 (직전 확정 봉 / 진행 중인 봉 기준)
+        prev, now = self.state.evaluate(candles)
+        rsi = now['rsi']
+        atr = now['atr']
+        bb_upper, bb_mid, bb_lower = now['bb']
 
         # 현재 EMA 값
-        ema_fast_now = ema_fast[-1]
-        ema_slow_now = ema_slow[-1]
-        ema_fast_prev = ema_fast[-2]
-        ema_slow_prev = ema_slow[-2]
+        ema_fast_now = now['ema_fast']
+        ema_slow_now = now['ema_slow']
+        ema_fast_prev = prev['ema_fast']
+        ema_slow_prev = prev['ema_slow']
 
         # 트렌드 강도
         trend_strength = abs(ema_fast_now - ema_slow_now) / current_price * 100
@@ -647,6 +681,7 @@ class TradingBot:
 
             # 시그널 분석
             signal = self.strategy.analyze(candles, self.position)
+            self.strategy.save_state()
             action = signal.get('action', 'hold')
             reason = signal.get('reason', '')
             confidence = signal.get('confidence', 0)
@@ -0,0 +1,138 @@
+"""
+컴파일된 전략 캐시 (내용 주소 기반)
+
+StrategyTester가 같은 변환 코드를 반복해서 exec하지 않도록
+코드 SHA-256 -> 실행된 네임스페이스를 LRU로 보관합니다.
+
+- preset(전역 변수 사전 주입)이 다른 호출자는 tag로 항목을 구분
+- 선택적 디스크 바이트코드 저장소: {bytecode_dir}/{sha256}.bin
+  (importlib MAGIC_NUMBER + marshal 코드 객체)
+  trading-agent-system/src/backtest/strategy_cache.py와 같은 형식이므로
+  두 쪽이 같은 디렉토리를 공유할 수 있습니다.
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import threading
+import types
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+
+def code_hash(code: str) -> str:
+    """전략 코드의 내용 주소 (SHA-256 hex)"""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+class StrategyCache:
+    """전략 코드 컴파일 캐시 (스레드 안전)"""
+
+    def __init__(self, maxsize: int = 128, bytecode_dir: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            maxsize: 메모리에 유지할 네임스페이스 수
+            bytecode_dir: 바이트코드 저장 디렉토리 (None이면 디스크 저장 안 함)
+        """
+        self.maxsize = maxsize
+        self.bytecode_dir = Path(bytecode_dir) if bytecode_dir else None
+        if self.bytecode_dir:
+            self.bytecode_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def load(
+        self,
+        code: str,
+        preset: Optional[Mapping[str, Any]] = None,
+        tag: str = ""
+    ) -> Dict[str, Any]:
+        """
+        코드를 실행한 네임스페이스 반환 (캐시에 있으면 실행하지 않음)
+
+        Args:
+            code: Python 전략 코드
+            preset: 실행 전에 네임스페이스에 넣을 전역 변수
+            tag: preset이 다른 호출자끼리 항목을 구분하는 값
+
+        Returns:
+            전역 네임스페이스 dict (호출자끼리 공유되므로 수정하지 말 것)
+        """
+        key = code_hash(code)
+        with self._lock:
+            namespace = self._entries.get((key, tag))
+            if namespace is not None:
+                self._entries.move_to_end((key, tag))
+                self.hits += 1
+                return namespace
+
+        code_obj = self._compile(key, code)
+        namespace = dict(preset or {})
+        namespace.setdefault('__name__', f"strategy_{key[:12]}")
+        exec(code_obj, namespace)
+
+        with self._lock:
+            self.misses += 1
+            namespace = self._entries.setdefault((key, tag), namespace)
+            self._entries.move_to_end((key, tag))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return namespace
+
+    def _compile(self, key: str, code: str) -> types.CodeType:
+        """코드 객체 (디스크 저장소에 있으면 재사용)"""
+        path = self.bytecode_dir / f"{key}.bin" if self.bytecode_dir else None
+
+        if path is not None and path.exists():
+            try:
+                raw = path.read_bytes()
+                magic = importlib.util.MAGIC_NUMBER
+                if raw[:len(magic)] == magic:
+                    code_obj = marshal.loads(raw[len(magic):])
+                    with self._lock:
+                        self.disk_hits += 1
+                    return code_obj
+            except (OSError, ValueError, EOFError, TypeError):
+                pass
+
+        code_obj = compile(code, f"<strategy {key[:12]}>", 'exec')
+
+        if path is not None:
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            try:
+                tmp.write_bytes(importlib.util.MAGIC_NUMBER + marshal.dumps(code_obj))
+                os.replace(tmp, path)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+
+        return code_obj
+
+    def clear(self):
+        """메모리 캐시 비우기 (디스크 바이트코드는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_hits,
+        }
+
+
+_shared_cache = StrategyCache()
+
+
+def get_strategy_cache() -> StrategyCache:
+    """프로세스 공용 캐시"""
+    return _shared_cache
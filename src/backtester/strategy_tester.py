@@ -2,6 +2,8 @@
 Pine Script 변환 및 백테스트 통합 서비스
 
 Pine Script 전략을 자동으로 Python으로 변환하고 백테스트를 수행합니다.
+같은 (변환 코드, 데이터셋, 시뮬레이터 설정)의 결과는 결과 저장소에서 재사용합니다.
+백테스트 결과에는 walk-forward 폴드별 성과 지표(walk_forward)가 포함됩니다 (참고용).
 """
 
 import json
@@ -9,7 +11,8 @@ import logging
 import asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple, Union
 import sys
 
 import numpy as np
@@ -21,17 +24,91 @@ sys.path.insert(0, str(project_root))
 
 from src.converter.pine_to_python import PineScriptConverter, ConversionResult
 from src.storage.database import StrategyDatabase
+from src.backtester.backtest_engine import BacktestEngine
+from src.backtester.event_simulator import LONG, BarData, EventSimulator, SimulationResult
+from src.backtester.result_store import DatasetFingerprint, ResultKey, ResultStore
+from src.backtester.strategy_cache import StrategyCache, code_hash, get_strategy_cache
+from src.backtester.walk_forward import WalkForwardEngine, walk_forward_folds
 
 logger = logging.getLogger(__name__)
 
+# 시뮬레이션/메트릭 계산 방식이 바뀌면 올려서 저장된 결과를 무효화
+ENGINE_REVISION = 2
+
+# Walk-forward 검증 폴드 수 (학습 구간 = 검증 구간 x 2, 롤링)
+WALK_FORWARD_FOLDS = 4
+
+
+@dataclass
+class BacktestJob:
+    """변환과 데이터 준비가 끝난 백테스트 작업 (CPU 단계로 전달)"""
+    script_id: str
+    symbol: str
+    timeframe: str
+    start_date: str
+    end_date: str
+    initial_capital: float
+    conversion: ConversionResult
+    result_key: ResultKey
+    candles: List[Dict] = field(repr=False)
+    cached_result: Optional[Dict] = None
+
+    @property
+    def python_code(self) -> str:
+        return self.conversion.python_code
+
 
 class StrategyTester:
     """Pine Script 전략 변환 및 백테스트 통합 서비스"""
 
-    def __init__(self, db_path: str = "data/strategies.db"):
+    # 변환된 전략 코드에 미리 주입하는 전역 변수
+    STRATEGY_GLOBALS = {'__builtins__': __builtins__, 'np': np, 'numpy': np, 'List': List, 'Dict': Dict, 'Optional': Optional}
+
+    def __init__(
+        self,
+        db_path: str = "data/strategies.db",
+        fees: float = 0.001,
+        slippage: float = 0.0005,
+        strategy_cache: Optional[StrategyCache] = None,
+        result_store: Optional[Union[ResultStore, str]] = None,
+        offline: bool = False
+    ):
+        """
+        Args:
+            db_path: 전략 DB 경로
+            fees: 수수료 비율
+            slippage: 슬리피지 비율
+            strategy_cache: 전략 코드 컴파일 캐시 (기본: 프로세스 공용 캐시)
+            result_store: 결과 저장소 또는 경로 (기본: db_path와 같은 디렉토리의 backtest_results.db)
+            offline: True면 거래소 대신 합성 데이터 사용 (dry-run/테스트)
+        """
         self.db_path = db_path
+        self.fees = fees
+        self.slippage = slippage
+        self.strategy_cache = strategy_cache if strategy_cache is not None else get_strategy_cache()
+        if result_store is None:
+            result_store = Path(db_path).with_name('backtest_results.db')
+        if not isinstance(result_store, ResultStore):
+            result_store = ResultStore(result_store)
+        self.result_store = result_store
         self.converter = PineScriptConverter()
         self.db = StrategyDatabase(db_path)
+        self.offline = offline
+        self._candles: Dict[tuple, List[Dict]] = {}
+
+    @classmethod
+    def compute_only(
+        cls,
+        fees: float = 0.001,
+        slippage: float = 0.0005,
+        strategy_cache: Optional[StrategyCache] = None
+    ) -> 'StrategyTester':
+        """DB/결과 저장소 없이 컴파일과 백테스트만 하는 인스턴스 (프로세스 풀 작업자용)"""
+        tester = cls.__new__(cls)
+        tester.fees = fees
+        tester.slippage = slippage
+        tester.strategy_cache = strategy_cache if strategy_cache is not None else get_strategy_cache()
+        return tester
 
     async def test_strategy(
         self,
@@ -55,47 +132,20 @@ class StrategyTester:
             if not strategy.pine_code:
                 return {'success': False, 'error': 'No Pine Script code available'}
 
-            # Pine Script → Python 변환
-            conversion_result = self.converter.convert(strategy.pine_code)
-
-            if not conversion_result.success:
-                logger.warning("Conversion failed, using default strategy")
-                python_code = self._get_default_strategy()
-                conversion_result = ConversionResult(
-                    success=True, python_code=python_code,
-                    indicators_used=['EMA', 'RSI'],
-                    warnings=['Used default strategy'],
-                    errors=conversion_result.errors
-                )
-
-            # 시장 데이터 가져오기
-            candles = await self._fetch_market_data(symbol, timeframe, start_date, end_date)
-
-            if len(candles) < 100:
-                return {'success': False, 'error': 'Insufficient market data'}
-
-            # 전략 컴파일 및 백테스트
-            strategy_func = self._compile_strategy(conversion_result.python_code)
-            if not strategy_func:
-                return {'success': False, 'error': 'Failed to compile strategy'}
-
-            backtest_result = self._run_backtest(strategy_func, candles, initial_capital)
-
-            result = {
-                'script_id': script_id,
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'start_date': start_date,
-                'end_date': end_date,
-                'conversion': {
-                    'success': conversion_result.success,
-                    'indicators_used': conversion_result.indicators_used,
-                    'warnings': conversion_result.warnings
-                },
-                'backtest': backtest_result,
-                'tested_at': datetime.now().isoformat()
-            }
+            job, error = await self.prepare_backtest(
+                script_id, strategy.pine_code, symbol, timeframe, start_date, end_date, initial_capital
+            )
+            if error:
+                return {'success': False, 'error': error}
 
+            # 같은 코드/데이터/설정의 결과가 저장소에 있으면 컴파일과 백테스트 생략
+            backtest_result = job.cached_result
+            if backtest_result is None:
+                backtest_result = self.compute_backtest(job.python_code, job.candles, initial_capital)
+                if backtest_result is None:
+                    return {'success': False, 'error': 'Failed to compile strategy'}
+
+            result = self.complete_backtest(job, backtest_result)
             await self._save_backtest_result(script_id, result)
 
             return result
@@ -104,6 +154,99 @@ class StrategyTester:
             logger.error(f"Error testing strategy {script_id}: {e}", exc_info=True)
             return {'success': False, 'error': str(e)}
 
+    async def prepare_backtest(
+        self,
+        script_id: str,
+        pine_code: str,
+        symbol: str,
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+        initial_capital: float = 10000.0
+    ) -> Tuple[Optional['BacktestJob'], Optional[str]]:
+        """
+        변환 + 시장 데이터 + 결과 저장소 조회 (I/O 단계)
+
+        Returns:
+            (작업, None) 또는 (None, 오류 메시지)
+        """
+        # Pine Script → Python 변환
+        conversion_result = self.converter.convert(pine_code)
+
+        if not conversion_result.success:
+            logger.warning("Conversion failed, using default strategy")
+            python_code = self._get_default_strategy()
+            conversion_result = ConversionResult(
+                success=True, python_code=python_code,
+                indicators_used=['EMA', 'RSI'],
+                warnings=['Used default strategy'],
+                errors=conversion_result.errors
+            )
+
+        # 시장 데이터 가져오기 (같은 구간은 한 번만)
+        candles = await self.get_candles(symbol, timeframe, start_date, end_date)
+
+        if len(candles) < 100:
+            return None, 'Insufficient market data'
+
+        result_key = ResultKey.make(
+            code_hash(conversion_result.python_code),
+            {},
+            DatasetFingerprint.of_candles(candles, symbol, timeframe),
+            self.engine_version(initial_capital)
+        )
+        return BacktestJob(
+            script_id=script_id,
+            symbol=symbol,
+            timeframe=timeframe,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=initial_capital,
+            conversion=conversion_result,
+            result_key=result_key,
+            candles=candles,
+            cached_result=self.result_store.get(result_key),
+        ), None
+
+    def compute_backtest(self, python_code: str, candles: List[Dict], initial_capital: float) -> Optional[Dict]:
+        """전략 컴파일 + 백테스트 (CPU 단계, 컴파일 실패 시 None)"""
+        strategy_func = self._compile_strategy(python_code)
+        if not strategy_func:
+            return None
+        return self._run_backtest(strategy_func, candles, initial_capital)
+
+    def complete_backtest(self, job: 'BacktestJob', backtest_result: Dict) -> Dict:
+        """결과 저장소에 기록하고 DB 저장용 결과 생성"""
+        if job.cached_result is None:
+            self.result_store.put(job.result_key, backtest_result, strategy_name=job.script_id)
+
+        return {
+            'script_id': job.script_id,
+            'symbol': job.symbol,
+            'timeframe': job.timeframe,
+            'start_date': job.start_date,
+            'end_date': job.end_date,
+            'conversion': {
+                'success': job.conversion.success,
+                'indicators_used': job.conversion.indicators_used,
+                'warnings': job.conversion.warnings
+            },
+            'backtest': backtest_result,
+            'tested_at': datetime.now().isoformat()
+        }
+
+    async def get_candles(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> List[Dict]:
+        """시장 데이터 (인스턴스 내 메모이제이션 - 배치 백테스트에서 재다운로드 방지)"""
+        key = (symbol, timeframe, start_date, end_date)
+        candles = self._candles.get(key)
+        if candles is None:
+            if self.offline:
+                candles = self._generate_synthetic_data(start_date, end_date, timeframe)
+            else:
+                candles = await self._fetch_market_data(symbol, timeframe, start_date, end_date)
+            self._candles[key] = candles
+        return candles
+
     async def test_all_strategies(self, limit: int = 10, **kwargs) -> List[Dict]:
         """모든 전략 백테스트"""
         await self.db.init_db()
@@ -185,99 +328,96 @@ class StrategyTester:
 
         return candles
 
+    def engine_version(self, initial_capital: float) -> str:
+        """결과에 영향을 주는 시뮬레이터 설정 (결과 저장소 키)"""
+        return (
+            f"event_simulator/rev{ENGINE_REVISION};capital={initial_capital};"
+            f"fees={self.fees};slippage={self.slippage};lookback=100"
+        )
+
     def _run_backtest(self, strategy_func, candles: List[Dict], initial_capital: float) -> Dict:
-        """백테스트 실행"""
-        capital = initial_capital
-        position = None
-        trades = []
-        equity_curve = []
-        lookback = 100
-
-        for i in range(lookback, len(candles)):
-            current = candles[i]
-            price = current['close']
-            historical = candles[max(0, i - lookback):i + 1]
-
-            current_pos = None
-            if position:
-                pnl = price - position['entry_price']
-                pnl_pct = (pnl / position['entry_price']) * 100
-                current_pos = {'side': position['side'], 'entry_price': position['entry_price'], 'pnl_percent': pnl_pct}
+        """백테스트 실행 (EventSimulator + 기존 generate_signal 어댑터)"""
+        simulator = EventSimulator(
+            initial_capital=initial_capital, fees=self.fees, slippage=self.slippage, lookback=100
+        )
+        data = BarData.from_candles(candles)
+        sim = simulator.run_legacy(data, strategy_func, params={})
 
-            try:
-                signal = strategy_func(current_price=price, candles=historical, params={}, current_position=current_pos)
-            except Exception:
-                signal = {'action': 'hold'}
-
-            action = signal.get('action', 'hold')
-
-            if action == 'buy' and not position:
-                position = {'side': 'long', 'entry_price': price, 'entry_time': current.get('timestamp')}
-            elif action == 'sell' and not position:
-                position = {'side': 'short', 'entry_price': price, 'entry_time': current.get('timestamp')}
-            elif action == 'close' and position:
-                pnl = (price - position['entry_price']) if position['side'] == 'long' else (position['entry_price'] - price)
-                pnl_pct = (pnl / position['entry_price']) * 100
-                trades.append({'side': position['side'], 'entry_price': position['entry_price'], 'exit_price': price, 'pnl_percent': pnl_pct})
-                capital *= (1 + pnl_pct / 100)
-                position = None
-
-            equity = capital if not position else capital * (1 + ((price - position['entry_price']) / position['entry_price']) * 100 / 100) if position['side'] == 'long' else capital * (1 + ((position['entry_price'] - price) / position['entry_price']) * 100 / 100)
-            equity_curve.append({'timestamp': current.get('timestamp'), 'equity': equity})
-
-        if position:
-            price = candles[-1]['close']
-            pnl = (price - position['entry_price']) if position['side'] == 'long' else (position['entry_price'] - price)
-            pnl_pct = (pnl / position['entry_price']) * 100
-            trades.append({'side': position['side'], 'entry_price': position['entry_price'], 'exit_price': price, 'pnl_percent': pnl_pct})
-            capital *= (1 + pnl_pct / 100)
+        if sim.signal_errors:
+            logger.debug(f"Strategy raised on {sim.signal_errors} bars (treated as hold)")
 
-        if not trades:
+        if not sim.total_trades:
             return {'success': True, 'total_trades': 0, 'total_return': 0, 'win_rate': 0, 'message': 'No trades'}
 
-        total_trades = len(trades)
-        winning = [t for t in trades if t['pnl_percent'] > 0]
-        win_rate = len(winning) / total_trades * 100 if total_trades else 0
-        total_return = ((capital - initial_capital) / initial_capital) * 100
-
-        avg_win = np.mean([t['pnl_percent'] for t in winning]) if winning else 0
-        avg_loss = np.mean([t['pnl_percent'] for t in trades if t['pnl_percent'] <= 0]) or 0
+        returns = sim.trade_return * 100
+        total_trades = sim.total_trades
+        wins = returns > 0
+        capital = sim.final_capital
 
-        equity_values = [e['equity'] for e in equity_curve]
-        peak = equity_values[0]
-        max_dd = 0
-        for v in equity_values:
-            if v > peak:
-                peak = v
-            dd = ((peak - v) / peak) * 100
-            if dd > max_dd:
-                max_dd = dd
+        win_rate = wins.sum() / total_trades * 100
+        total_return = ((capital - initial_capital) / initial_capital) * 100
+        avg_win = returns[wins].mean() if wins.any() else 0
+        avg_loss = returns[~wins].mean() if (~wins).any() else 0
+        sharpe = (returns.mean() / returns.std()) if total_trades > 1 and returns.std() > 0 else 0
 
-        returns = [t['pnl_percent'] for t in trades]
-        sharpe = (np.mean(returns) / np.std(returns)) if len(returns) > 1 and np.std(returns) > 0 else 0
+        tail = slice(max(0, len(sim.equity) - 100), None)
+        equity_curve = [
+            {'timestamp': int(ts), 'equity': float(eq)}
+            for ts, eq in zip(sim.timestamps[tail], sim.equity[tail])
+        ]
 
         return {
             'success': True,
             'total_trades': total_trades,
-            'winning_trades': len(winning),
-            'losing_trades': total_trades - len(winning),
-            'win_rate': round(win_rate, 2),
-            'total_return': round(total_return, 2),
-            'sharpe_ratio': round(sharpe, 2),
-            'max_drawdown': round(max_dd, 2),
-            'avg_win': round(avg_win, 2),
-            'avg_loss': round(avg_loss, 2),
+            'winning_trades': int(wins.sum()),
+            'losing_trades': int(total_trades - wins.sum()),
+            'win_rate': round(float(win_rate), 2),
+            'total_return': round(float(total_return), 2),
+            'sharpe_ratio': round(float(sharpe), 2),
+            'max_drawdown': round(sim.max_drawdown(), 2),
+            'avg_win': round(float(avg_win), 2),
+            'avg_loss': round(float(avg_loss), 2),
             'initial_capital': initial_capital,
-            'final_capital': round(capital, 2),
-            'equity_curve': equity_curve[-100:],
-            'trades': trades[:20]
+            'final_capital': round(float(capital), 2),
+            'equity_curve': equity_curve,
+            'trades': sim.trades()[:20],
+            'walk_forward': self._walk_forward(data, sim, initial_capital)
         }
 
+    def _walk_forward(self, data: BarData, sim: SimulationResult, initial_capital: float) -> Dict:
+        """
+        시뮬레이션 포지션으로 walk-forward 폴드 평가 -> WalkForwardResult.degradation()
+
+        변환된 전략은 파라미터 그리드가 없으므로 같은 신호를 학습/검증 구간에서 비교합니다.
+        (구간별 성과 차이일 뿐 out-of-sample 검증이 아니므로 과적합 점수에는 반영하지 않음)
+        롱 포지션만 신호로 옮기며, 봉이 부족하면 {'folds': 0}을 반환합니다.
+        """
+        n = len(sim.position)
+        test_size = n // (WALK_FORWARD_FOLDS + 2)
+        if test_size < 20:
+            return {'folds': 0}
+
+        long = sim.position == LONG
+        held = np.concatenate(([False], long[:-1]))
+        frame = pd.DataFrame(
+            {'close': data.close[len(data) - n:]},
+            index=pd.to_datetime(sim.timestamps, unit='ms')
+        )
+        entries = pd.Series(long & ~held, index=frame.index)
+        exits = pd.Series(~long & held, index=frame.index)
+
+        engine = WalkForwardEngine(
+            BacktestEngine(initial_capital, self.fees, self.slippage, use_vectorbt=False), n_jobs=1
+        )
+        folds = walk_forward_folds(n, train_size=test_size * 2, test_size=test_size)
+        return engine.run(frame, lambda df, params: (entries, exits), folds).degradation()
+
     def _compile_strategy(self, python_code: str):
-        """Python 코드를 동적으로 컴파일"""
+        """Python 코드를 동적으로 컴파일 (같은 코드는 캐시된 네임스페이스 재사용)"""
         try:
-            safe_globals = {'__builtins__': __builtins__, 'np': np, 'numpy': np, 'List': List, 'Dict': Dict, 'Optional': Optional}
-            exec(python_code, safe_globals)
+            safe_globals = self.strategy_cache.load(
+                python_code, preset=self.STRATEGY_GLOBALS, tag='strategy_tester'
+            )
 
             if 'generate_signal' in safe_globals:
                 return safe_globals['generate_signal']
@@ -323,7 +463,7 @@ def generate_signal(current_price: float, candles: List[Dict], params: Dict = No
     if len(candles) < slow_period + 14:
         return {'action': 'hold', 'confidence': 0.5, 'reason': 'Insufficient data'}
 
-    closes = np.array([c['close'] for c in candles])
+    closes = candles.close if hasattr(candles, 'close') else np.array([c['close'] for c in candles])
 
     def ema(data, period):
         mult = 2 / (period + 1)
@@ -368,6 +508,36 @@ def generate_signal(current_price: float, candles: List[Dict], params: Dict = No
 '''
 
 
+# ============================================================
+# 프로세스 풀 작업자 (컴파일 + 백테스트만, DB 접근 없음)
+# ============================================================
+
+_worker_tester: Optional[StrategyTester] = None
+_worker_datasets: Dict[str, List[Dict]] = {}
+
+
+def init_backtest_worker(fees: float, slippage: float, datasets: Dict[str, List[Dict]]):
+    """작업자 초기화: 데이터셋은 작업마다 보내지 않고 프로세스당 한 번만 전달"""
+    global _worker_tester, _worker_datasets
+    _worker_tester = StrategyTester.compute_only(fees, slippage)
+    _worker_datasets = datasets
+
+
+def run_backtest_job(
+    python_code: str,
+    dataset_key: str,
+    initial_capital: float
+) -> Tuple[Optional[Dict], Optional[str]]:
+    """작업 하나 실행 -> (백테스트 결과, error)"""
+    try:
+        result = _worker_tester.compute_backtest(python_code, _worker_datasets[dataset_key], initial_capital)
+        if result is None:
+            return None, 'Failed to compile strategy'
+        return result, None
+    except Exception as e:
+        return None, str(e)[:200]
+
+
 async def main():
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     tester = StrategyTester()
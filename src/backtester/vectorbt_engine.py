@@ -8,6 +8,10 @@ VectorBT 고속 백테스팅 엔진
 GitHub: https://github.com/polakowo/vectorbt
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple, Callable
@@ -152,6 +156,60 @@ class OptimizationResult:
         }
 
 
+class IndicatorCache:
+    """
+    스윕 내 지표 결과 공유 캐시
+    
+    (지표 이름, lookback) 단위로 결과를 한 번만 계산하고 재사용합니다.
+    같은 기간을 쓰는 파라미터 조합들은 동일한 배열을 공유합니다.
+    
+    Example:
+        cache = IndicatorCache(data)
+        sma_20 = cache.get("sma", 20, lambda: data['close'].rolling(20).mean().values)
+    """
+    
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self.hits = 0
+        self.misses = 0
+        self._values: Dict[Tuple[str, Any], np.ndarray] = {}
+    
+    def get(self, name: str, key: Any, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """캐시된 지표 반환 (없으면 compute() 결과를 저장)"""
+        cache_key = (name, key)
+        if cache_key in self._values:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._values[cache_key] = np.asarray(compute(), dtype=float)
+        return self._values[cache_key]
+    
+    def sma(self, period: int) -> np.ndarray:
+        return self.get("sma", period, lambda: self.data['close'].rolling(period).mean().values)
+    
+    def std(self, period: int) -> np.ndarray:
+        return self.get("std", period, lambda: self.data['close'].rolling(period).std().values)
+    
+    def rsi(self, period: int) -> np.ndarray:
+        def compute():
+            close = self.data['close']
+            delta = close.diff()
+            gain = delta.where(delta > 0, 0).rolling(period).mean()
+            loss = (-delta.where(delta < 0, 0)).rolling(period).mean()
+            rs = gain / loss
+            return (100 - (100 / (1 + rs))).values
+        return self.get("rsi", period, compute)
+    
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+# 브로드캐스트 스윕 함수: (data, 파라미터 조합 리스트, 지표 캐시) -> (entries, exits)
+# entries/exits는 조합 순서대로 컬럼이 하나씩 있는 boolean DataFrame
+SweepFunc = Callable[[pd.DataFrame, List[Dict[str, Any]], IndicatorCache],
+                     Tuple[pd.DataFrame, pd.DataFrame]]
+
+
 class VectorBTEngine:
     """
     VectorBT 기반 고속 백테스팅 엔진
@@ -274,16 +332,25 @@ class VectorBTEngine:
         param_ranges: Dict[str, List[Any]],
         metric: str = "sharpe_ratio",
         n_jobs: int = -1,
+        sweep_func: Optional[SweepFunc] = None,
+        chunk_size: int = 500,
     ) -> OptimizationResult:
         """
         파라미터 최적화
         
+        스윕 함수가 있으면 (직접 전달하거나 SWEEP_FUNCTIONS에 등록된 내장 전략)
+        모든 조합을 다중 컬럼 포트폴리오 한 번으로 시뮬레이션하는 브로드캐스트
+        모드로 실행하고, 없거나 브로드캐스트가 실패하면 조합별로 run_strategy를 반복합니다.
+        
         Args:
             data: OHLCV 데이터
             strategy_func: 전략 함수
             param_ranges: 파라미터 범위 {"param_name": [values]}
             metric: 최적화 기준 ("sharpe_ratio", "total_return", "calmar_ratio")
-            n_jobs: 병렬 처리 수 (-1: 모든 코어)
+            n_jobs: 동시 시뮬레이션 스레드 수 (-1: 모든 코어, 1: 순차)
+                브로드캐스트 모드는 청크 단위, 반복 모드는 조합 단위로 나눕니다.
+            sweep_func: 브로드캐스트 스윕 함수 (data, combos, cache) -> (entries_df, exits_df)
+            chunk_size: 브로드캐스트 모드에서 한 번에 시뮬레이션할 조합 수 (메모리 제한)
             
         Returns:
             OptimizationResult: 최적화 결과
@@ -296,32 +363,56 @@ class VectorBTEngine:
         # 모든 파라미터 조합 생성
         param_names = list(param_ranges.keys())
         param_values = list(param_ranges.values())
-        combinations = list(itertools.product(*param_values))
+        combos = [dict(zip(param_names, combo)) for combo in itertools.product(*param_values)]
+        workers = (os.cpu_count() or 1) if n_jobs is None or n_jobs < 0 else max(1, n_jobs)
         
-        results = []
+        if sweep_func is None:
+            sweep_func = SWEEP_FUNCTIONS.get(strategy_func)
         
-        for combo in combinations:
-            params = dict(zip(param_names, combo))
-            
+        if sweep_func is not None and VECTORBT_AVAILABLE:
+            try:
+                results = self._run_broadcast_sweep(data, sweep_func, combos, metric, chunk_size, workers)
+                return self._build_optimization_result(
+                    results, len(combos), time.time() - start_time
+                )
+            except Exception as e:
+                warnings.warn(f"Broadcast sweep failed, falling back to per-combination loop: {e}")
+        
+        def evaluate(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             try:
                 bt_result = self.run_strategy(data, strategy_func, params)
-                
-                if bt_result.success:
-                    metric_value = getattr(bt_result, metric, 0)
-                    results.append({
-                        "params": params,
-                        "metric": metric_value,
-                        "total_return": bt_result.total_return,
-                        "sharpe_ratio": bt_result.sharpe_ratio,
-                        "max_drawdown": bt_result.max_drawdown,
-                        "win_rate": bt_result.win_rate,
-                        "total_trades": bt_result.total_trades,
-                    })
             except Exception:
-                continue
+                return None
+            if not bt_result.success:
+                return None
+            return {
+                "params": params,
+                "metric": getattr(bt_result, metric, 0),
+                "total_return": bt_result.total_return,
+                "sharpe_ratio": bt_result.sharpe_ratio,
+                "max_drawdown": bt_result.max_drawdown,
+                "win_rate": bt_result.win_rate,
+                "total_trades": bt_result.total_trades,
+            }
+        
+        if workers > 1 and len(combos) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(combos))) as executor:
+                rows = list(executor.map(evaluate, combos))
+        else:
+            rows = [evaluate(params) for params in combos]
+        results = [row for row in rows if row is not None]
         
         elapsed = time.time() - start_time
         
+        return self._build_optimization_result(results, len(combos), elapsed)
+    
+    def _build_optimization_result(
+        self,
+        results: List[Dict[str, Any]],
+        total_combinations: int,
+        elapsed: float,
+    ) -> OptimizationResult:
+        """조합별 결과를 정렬하여 OptimizationResult 생성"""
         if not results:
             return OptimizationResult(
                 success=False,
@@ -339,10 +430,95 @@ class VectorBTEngine:
             best_sharpe=best["sharpe_ratio"],
             best_return=best["total_return"],
             all_results=results,
-            total_combinations=len(combinations),
+            total_combinations=total_combinations,
             elapsed_seconds=elapsed,
         )
     
+    def _run_broadcast_sweep(
+        self,
+        data: pd.DataFrame,
+        sweep_func: SweepFunc,
+        combos: List[Dict[str, Any]],
+        metric: str,
+        chunk_size: int,
+        workers: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        브로드캐스트 스윕 실행
+        
+        조합을 chunk_size 단위로 나눠 각 청크를 다중 컬럼 포트폴리오 한 번으로
+        시뮬레이션합니다. 지표 캐시는 모든 청크가 공유하며 (신호 생성은 한 번에 하나씩),
+        청크는 workers개 스레드에서 동시에 시뮬레이션합니다.
+        """
+        cache = IndicatorCache(data)
+        cache_lock = threading.Lock()
+        chunk_size = max(1, chunk_size)
+        chunks = [combos[offset:offset + chunk_size] for offset in range(0, len(combos), chunk_size)]
+        
+        def simulate(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            with cache_lock:
+                entries, exits = sweep_func(data, chunk, cache)
+            
+            pf = vbt.Portfolio.from_signals(
+                close=data['close'],
+                entries=entries,
+                exits=exits,
+                init_cash=self.config.initial_capital,
+                fees=self.config.commission,
+                slippage=self.config.slippage,
+                freq=self.config.freq,
+            )
+            metrics = self._extract_sweep_metrics(pf, data)
+            
+            rows = []
+            for i, params in enumerate(chunk):
+                row = metrics.iloc[i]
+                rows.append({
+                    "params": params,
+                    "metric": float(row[metric]) if metric in row.index else 0,
+                    "total_return": float(row["total_return"]),
+                    "sharpe_ratio": float(row["sharpe_ratio"]),
+                    "max_drawdown": float(row["max_drawdown"]),
+                    "win_rate": float(row["win_rate"]),
+                    "total_trades": int(row["total_trades"]),
+                })
+            return rows
+        
+        if workers > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                return [row for rows in executor.map(simulate, chunks) for row in rows]
+        return [row for chunk in chunks for row in simulate(chunk)]
+    
+    def _extract_sweep_metrics(self, pf, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        다중 컬럼 포트폴리오에서 컬럼별 지표 추출
+        
+        _extract_results와 같은 정의를 사용합니다 (승률/Profit Factor는 청산된 거래 기준).
+        """
+        def clean(values) -> np.ndarray:
+            arr = np.asarray(values, dtype=float)
+            return np.where(np.isfinite(arr), arr, 0.0)
+        
+        total_trades = np.asarray(pf.trades.count(), dtype=int)
+        has_trades = total_trades > 0
+        closed = pf.trades.closed
+        total_return = clean(pf.total_return())
+        
+        duration = (data.index[-1] - data.index[0]).days if hasattr(data.index[-1] - data.index[0], 'days') else 0
+        annual_return = total_return * (365 / max(duration, 1)) if duration > 0 else np.zeros_like(total_return)
+        
+        return pd.DataFrame({
+            "total_return": total_return,
+            "annual_return": annual_return,
+            "sharpe_ratio": clean(pf.sharpe_ratio()),
+            "sortino_ratio": clean(pf.sortino_ratio()),
+            "calmar_ratio": clean(pf.calmar_ratio()),
+            "max_drawdown": np.abs(clean(pf.max_drawdown())),
+            "total_trades": total_trades,
+            "win_rate": np.where(has_trades, clean(closed.win_rate()), 0.0),
+            "profit_factor": clean(closed.profit_factor()),
+        })
+    
     def _extract_results(self, pf, data: pd.DataFrame) -> BacktestResult:
         """포트폴리오에서 결과 추출"""
         try:
@@ -509,6 +685,92 @@ def bollinger_bands_strategy(
     return entries, exits
 
 
+# ============================================================
+# 브로드캐스트 스윕 함수들 (조합별 컬럼을 가진 2-D 신호 행렬)
+# ============================================================
+
+def _shift_rows(values: np.ndarray) -> np.ndarray:
+    """행 방향으로 한 칸 이동 (pandas shift(1)과 동일, 첫 행은 NaN)"""
+    shifted = np.empty_like(values)
+    if len(values) == 0:
+        return shifted
+    shifted[0] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _signal_frames(
+    data: pd.DataFrame,
+    entries: np.ndarray,
+    exits: np.ndarray,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """신호 행렬을 데이터 인덱스를 가진 DataFrame으로 변환"""
+    columns = pd.RangeIndex(entries.shape[1])
+    return (
+        pd.DataFrame(entries, index=data.index, columns=columns),
+        pd.DataFrame(exits, index=data.index, columns=columns),
+    )
+
+
+def sma_crossover_sweep(
+    data: pd.DataFrame,
+    combos: List[Dict[str, Any]],
+    cache: IndicatorCache,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """SMA 크로스오버 전략의 브로드캐스트 버전 (sma_crossover_strategy와 동일한 신호)"""
+    fast = np.column_stack([cache.sma(c.get("fast_period", 10)) for c in combos])
+    slow = np.column_stack([cache.sma(c.get("slow_period", 30)) for c in combos])
+    fast_prev = _shift_rows(fast)
+    slow_prev = _shift_rows(slow)
+    
+    entries = (fast > slow) & (fast_prev <= slow_prev)
+    exits = (fast < slow) & (fast_prev >= slow_prev)
+    
+    return _signal_frames(data, entries, exits)
+
+
+def rsi_sweep(
+    data: pd.DataFrame,
+    combos: List[Dict[str, Any]],
+    cache: IndicatorCache,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """RSI 전략의 브로드캐스트 버전 (rsi_strategy와 동일한 신호)"""
+    rsi = np.column_stack([cache.rsi(c.get("period", 14)) for c in combos])
+    rsi_prev = _shift_rows(rsi)
+    oversold = np.array([c.get("oversold", 30) for c in combos], dtype=float)
+    overbought = np.array([c.get("overbought", 70) for c in combos], dtype=float)
+    
+    entries = (rsi < oversold) & (rsi_prev >= oversold)
+    exits = (rsi > overbought) & (rsi_prev <= overbought)
+    
+    return _signal_frames(data, entries, exits)
+
+
+def bollinger_bands_sweep(
+    data: pd.DataFrame,
+    combos: List[Dict[str, Any]],
+    cache: IndicatorCache,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """볼린저 밴드 전략의 브로드캐스트 버전 (bollinger_bands_strategy와 동일한 신호)"""
+    sma = np.column_stack([cache.sma(c.get("period", 20)) for c in combos])
+    std = np.column_stack([cache.std(c.get("period", 20)) for c in combos])
+    std_dev = np.array([c.get("std_dev", 2.0) for c in combos], dtype=float)
+    close = data['close'].values[:, None]
+    
+    entries = close < sma - (std * std_dev)
+    exits = close > sma + (std * std_dev)
+    
+    return _signal_frames(data, entries, exits)
+
+
+# 단일 조합 전략 함수 -> 브로드캐스트 스윕 함수
+SWEEP_FUNCTIONS: Dict[Callable, SweepFunc] = {
+    sma_crossover_strategy: sma_crossover_sweep,
+    rsi_strategy: rsi_sweep,
+    bollinger_bands_strategy: bollinger_bands_sweep,
+}
+
+
 # ============================================================
 # 편의 함수
 # ============================================================
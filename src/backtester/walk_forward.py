@@ -0,0 +1,376 @@
+"""
+Walk-forward / Purged K-Fold 검증 하네스
+
+학습 구간에서 고른 파라미터를 검증(out-of-sample) 구간에서 평가하여
+성과가 얼마나 떨어지는지(degradation)를 측정합니다.
+
+- 폴드: 롤링/앵커드 walk-forward, purged k-fold (학습-검증 사이 embargo 간격)
+- 지표/신호는 전체 시계열에서 파라미터 조합마다 한 번만 계산하고 폴드별로 슬라이스
+  (SWEEP_FUNCTIONS에 등록된 전략은 IndicatorCache로 같은 기간 지표도 공유)
+- 폴드는 프로세스 풀에서 병렬 실행 (신호 행렬은 워커 시작 시 한 번만 전달)
+- degradation() 결과는 OverfittingDetector.analyze(walk_forward=...)에 그대로 전달
+"""
+
+import itertools
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.backtester.backtest_engine import BacktestEngine
+from src.backtester.vectorbt_engine import SWEEP_FUNCTIONS, IndicatorCache, SweepFunc
+
+Segment = Tuple[int, int]  # [start, end) 봉 인덱스
+
+StrategyFunc = Callable[[pd.DataFrame, Dict[str, Any]], Tuple[pd.Series, pd.Series]]
+
+
+# ============================================================
+# 폴드 생성
+# ============================================================
+
+@dataclass(frozen=True)
+class Fold:
+    """학습 구간(연속 구간 목록)과 검증 구간"""
+    index: int
+    train: Tuple[Segment, ...]
+    test: Segment
+
+    @property
+    def train_bars(self) -> int:
+        return sum(end - start for start, end in self.train)
+
+
+def walk_forward_folds(
+    n_bars: int,
+    train_size: int,
+    test_size: int,
+    step: Optional[int] = None,
+    anchored: bool = False,
+    embargo: int = 0,
+) -> List[Fold]:
+    """
+    Walk-forward 폴드
+
+    Args:
+        n_bars: 전체 봉 수
+        train_size: 학습 구간 길이 (anchored면 첫 학습 구간 길이)
+        test_size: 검증 구간 길이
+        step: 폴드 간 이동 봉 수 (기본: test_size)
+        anchored: True면 학습 구간 시작을 0에 고정하고 끝만 늘림
+        embargo: 학습 끝과 검증 시작 사이에 버리는 봉 수
+    """
+    if train_size <= 0 or test_size <= 0:
+        raise ValueError("train_size와 test_size는 0보다 커야 합니다")
+
+    step = step or test_size
+    folds = []
+    train_start, train_end = 0, train_size
+
+    while train_end + embargo + test_size <= n_bars:
+        test_start = train_end + embargo
+        folds.append(Fold(
+            index=len(folds),
+            train=((train_start, train_end),),
+            test=(test_start, test_start + test_size),
+        ))
+        train_end += step
+        if not anchored:
+            train_start += step
+
+    return folds
+
+
+def purged_kfold_folds(
+    n_bars: int,
+    n_splits: int = 5,
+    embargo: int = 0,
+    purge: int = 0,
+) -> List[Fold]:
+    """
+    Purged k-fold 폴드
+
+    검증 블록 앞 purge개 봉과 뒤 embargo개 봉을 학습 구간에서 제외합니다.
+    (신호/라벨이 검증 구간과 겹치는 봉으로 학습하지 않도록)
+    """
+    if n_splits < 2:
+        raise ValueError("n_splits는 2 이상이어야 합니다")
+
+    bounds = np.linspace(0, n_bars, n_splits + 1).astype(int)
+    folds = []
+
+    for k in range(n_splits):
+        test_start, test_end = int(bounds[k]), int(bounds[k + 1])
+        train = []
+        if test_start - purge > 0:
+            train.append((0, test_start - purge))
+        if test_end + embargo < n_bars:
+            train.append((test_end + embargo, n_bars))
+        folds.append(Fold(index=k, train=tuple(train), test=(test_start, test_end)))
+
+    return folds
+
+
+# ============================================================
+# 결과
+# ============================================================
+
+@dataclass
+class FoldResult:
+    """폴드 하나의 결과 (학습 구간 최적 파라미터와 양쪽 성과)"""
+    fold: Fold
+    params: Dict[str, Any]
+    train: Dict[str, float]
+    test: Dict[str, float]
+
+
+@dataclass
+class WalkForwardResult:
+    """전체 폴드 결과와 out-of-sample 성과 저하 지표"""
+    folds: List[FoldResult]
+    metric: str = "sharpe_ratio"
+    combinations: int = 1
+    signal_evaluations: int = 0  # 전략 신호 계산 횟수 (폴드 수와 무관)
+
+    def degradation(self) -> Dict[str, float]:
+        """
+        Out-of-sample 성과 저하 지표
+
+        - efficiency: 봉당 로그 수익률 기준 OOS / IS 비율 (walk-forward efficiency)
+        - sharpe_degradation: 1 - OOS Sharpe / IS Sharpe
+        - oos_profitable_ratio: OOS 수익이 양수인 폴드 비율
+        - param_stability: 가장 많이 선택된 파라미터의 폴드 비율
+        - combinations: 폴드마다 비교한 파라미터 조합 수 (1이면 학습 구간에서 고른 것이 없음)
+        """
+        if not self.folds:
+            return {'folds': 0, 'combinations': self.combinations}
+
+        def rate(metrics: Dict[str, float]) -> float:
+            bars = max(metrics['bars'], 1)
+            return float(np.log1p(max(metrics['total_return'], -99.99) / 100) / bars)
+
+        is_rate = np.mean([rate(f.train) for f in self.folds])
+        oos_rate = np.mean([rate(f.test) for f in self.folds])
+        is_sharpe = np.mean([f.train['sharpe_ratio'] for f in self.folds])
+        oos_sharpe = np.mean([f.test['sharpe_ratio'] for f in self.folds])
+        chosen = Counter(tuple(sorted(f.params.items())) for f in self.folds)
+
+        return {
+            'folds': len(self.folds),
+            'is_return': float(np.mean([f.train['total_return'] for f in self.folds])),
+            'oos_return': float(np.mean([f.test['total_return'] for f in self.folds])),
+            'is_sharpe': float(is_sharpe),
+            'oos_sharpe': float(oos_sharpe),
+            'efficiency': float(oos_rate / is_rate) if is_rate > 0 else 0.0,
+            'sharpe_degradation': float(1 - oos_sharpe / is_sharpe) if is_sharpe > 0 else 0.0,
+            'oos_profitable_ratio': float(np.mean([f.test['total_return'] > 0 for f in self.folds])),
+            'param_stability': chosen.most_common(1)[0][1] / len(self.folds),
+            'combinations': self.combinations,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'metric': self.metric,
+            'combinations': self.combinations,
+            'degradation': self.degradation(),
+            'folds': [
+                {
+                    'index': f.fold.index,
+                    'train': [list(s) for s in f.fold.train],
+                    'test': list(f.fold.test),
+                    'params': f.params,
+                    'train_metrics': f.train,
+                    'test_metrics': f.test,
+                }
+                for f in self.folds
+            ],
+        }
+
+
+# ============================================================
+# 폴드 워커
+# ============================================================
+
+_wf_frame: Optional[pd.DataFrame] = None
+_wf_entries: Optional[np.ndarray] = None
+_wf_exits: Optional[np.ndarray] = None
+_wf_engine: Optional[BacktestEngine] = None
+_wf_metric: str = "sharpe_ratio"
+
+
+def _init_worker(
+    frame: pd.DataFrame,
+    entries: np.ndarray,
+    exits: np.ndarray,
+    engine_config: Dict[str, Any],
+    metric: str,
+):
+    """워커 시작 시 가격/신호 행렬을 한 번만 받음"""
+    global _wf_frame, _wf_entries, _wf_exits, _wf_engine, _wf_metric
+    _wf_frame, _wf_entries, _wf_exits = frame, entries, exits
+    _wf_engine = BacktestEngine(**engine_config)
+    _wf_metric = metric
+
+
+def _evaluate(segments: Tuple[Segment, ...], combo: int) -> Dict[str, float]:
+    """
+    연속 구간마다 백테스트하고 합산 (구간 시작마다 포지션 없음)
+
+    Sharpe는 구간별 봉 수익률을 이어 붙여 numpy BacktestEngine과 같은 정의로 계산합니다.
+    """
+    growth, trades, wins, max_dd = 1.0, 0, 0.0, 0.0
+    bar_returns = []
+    bars = 0
+
+    for start, end in segments:
+        if end - start < 2:
+            continue
+        frame = _wf_frame.iloc[start:end]
+        result = _wf_engine.run_backtest(
+            frame,
+            pd.Series(_wf_entries[start:end, combo], index=frame.index),
+            pd.Series(_wf_exits[start:end, combo], index=frame.index),
+        )
+        growth *= 1 + result.total_return / 100
+        trades += result.total_trades
+        wins += result.win_rate / 100 * result.total_trades
+        max_dd = max(max_dd, float(result.max_drawdown))
+        bar_returns.append(result.equity_curve.pct_change().dropna().to_numpy())
+        bars += end - start
+
+    returns = np.concatenate(bar_returns) if bar_returns else np.array([])
+    std = returns.std(ddof=1) if len(returns) > 1 else 0.0
+    sharpe = float(returns.mean() / std * np.sqrt(252)) if std > 0 else 0.0
+
+    return {
+        'total_return': (growth - 1) * 100,
+        'sharpe_ratio': sharpe,
+        'max_drawdown': max_dd,
+        'win_rate': wins / trades * 100 if trades else 0.0,
+        'total_trades': trades,
+        'bars': bars,
+    }
+
+
+def _run_fold(fold: Fold) -> Tuple[int, Dict[str, float], Dict[str, float]]:
+    """학습 구간에서 최적 조합 선택 후 검증 구간 평가 -> (조합, 학습 성과, 검증 성과)"""
+    best_combo, best_train = 0, None
+    for combo in range(_wf_entries.shape[1]):
+        train = _evaluate(fold.train, combo)
+        if best_train is None or train[_wf_metric] > best_train[_wf_metric]:
+            best_combo, best_train = combo, train
+
+    return best_combo, best_train, _evaluate((fold.test,), best_combo)
+
+
+# ============================================================
+# 엔진
+# ============================================================
+
+class WalkForwardEngine:
+    """Walk-forward / purged k-fold 평가 엔진"""
+
+    def __init__(
+        self,
+        engine: Optional[BacktestEngine] = None,
+        metric: str = "sharpe_ratio",
+        n_jobs: Optional[int] = None,
+    ):
+        """
+        Args:
+            engine: 폴드 평가에 사용할 BacktestEngine (수수료/슬리피지 설정)
+            metric: 학습 구간 파라미터 선택 기준 (total_return, sharpe_ratio, win_rate)
+            n_jobs: 병렬 워커 수 (None: 모든 코어, 1: 현재 프로세스에서 순차 실행)
+        """
+        self.engine = engine or BacktestEngine()
+        self.metric = metric
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+
+    def run(
+        self,
+        data: pd.DataFrame,
+        strategy_func: StrategyFunc,
+        folds: List[Fold],
+        param_grid: Optional[Dict[str, List[Any]]] = None,
+        sweep_func: Optional[SweepFunc] = None,
+    ) -> WalkForwardResult:
+        """
+        폴드별 학습 구간 최적화 -> 검증 구간 평가
+
+        Args:
+            data: OHLCV 데이터 (close 컬럼 필수)
+            strategy_func: 전략 함수 (data, params) -> (entries, exits)
+                (프로세스 풀에는 신호만 전달되므로 함수는 pickle할 필요 없음)
+            folds: walk_forward_folds / purged_kfold_folds 결과
+            param_grid: 파라미터 범위 {"name": [values]} (None이면 기본 파라미터 하나)
+            sweep_func: 브로드캐스트 스윕 함수 (기본: SWEEP_FUNCTIONS 등록 함수)
+
+        Returns:
+            WalkForwardResult
+        """
+        param_grid = param_grid or {}
+        names = list(param_grid)
+        combos = [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+
+        entries, exits, evaluations = self._signals(data, strategy_func, combos, sweep_func)
+        frame = data[['close']]
+        engine_config = {
+            'initial_capital': self.engine.initial_capital,
+            'fees': self.engine.fees,
+            'slippage': self.engine.slippage,
+            'use_vectorbt': self.engine.use_vectorbt,
+        }
+
+        if self.n_jobs <= 1 or len(folds) <= 1:
+            global _wf_frame, _wf_entries, _wf_exits, _wf_engine, _wf_metric
+            _wf_frame, _wf_entries, _wf_exits = frame, entries, exits
+            _wf_engine, _wf_metric = self.engine, self.metric
+            try:
+                outcomes = [_run_fold(fold) for fold in folds]
+            finally:
+                _wf_frame = _wf_entries = _wf_exits = _wf_engine = None
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.n_jobs, len(folds)),
+                initializer=_init_worker,
+                initargs=(frame, entries, exits, engine_config, self.metric),
+            ) as executor:
+                outcomes = list(executor.map(_run_fold, folds))
+
+        return WalkForwardResult(
+            folds=[
+                FoldResult(fold=fold, params=combos[combo], train=train, test=test)
+                for fold, (combo, train, test) in zip(folds, outcomes)
+            ],
+            metric=self.metric,
+            combinations=len(combos),
+            signal_evaluations=evaluations,
+        )
+
+    def _signals(
+        self,
+        data: pd.DataFrame,
+        strategy_func: StrategyFunc,
+        combos: List[Dict[str, Any]],
+        sweep_func: Optional[SweepFunc],
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """전체 시계열에서 조합별 신호를 한 번씩 계산 -> (entries[봉, 조합], exits[봉, 조합], 계산 횟수)"""
+        sweep_func = sweep_func or SWEEP_FUNCTIONS.get(strategy_func)
+        if sweep_func is not None:
+            entries, exits = sweep_func(data, combos, IndicatorCache(data))
+            return (np.asarray(entries, dtype=bool), np.asarray(exits, dtype=bool), 1)
+
+        columns = [strategy_func(data, params) for params in combos]
+        entries = np.column_stack([
+            pd.Series(e).reindex(data.index, fill_value=False).fillna(False).to_numpy(dtype=bool)
+            for e, _ in columns
+        ])
+        exits = np.column_stack([
+            pd.Series(x).reindex(data.index, fill_value=False).fillna(False).to_numpy(dtype=bool)
+            for _, x in columns
+        ])
+        return entries, exits, len(combos)
@@ -2,8 +2,8 @@
 # TradingView Scripts page scraping and Pine code extraction
 
 from .scripts_scraper import TVScriptsScraper, StrategyMeta
-from .pine_fetcher import PineCodeFetcher, PineCodeData
-from .session_manager import SessionManager
+from .pine_fetcher import PineCodeFetcher, PineCodeData, PineFetcherPool
+from .session_manager import SessionManager, TokenBucket
 from .performance_parser import PerformanceParser
 
 __all__ = [
@@ -11,6 +11,8 @@ __all__ = [
     "StrategyMeta",
     "PineCodeFetcher",
     "PineCodeData",
+    "PineFetcherPool",
     "SessionManager",
+    "TokenBucket",
     "PerformanceParser",
 ]
@@ -1,11 +1,14 @@
 # src/collector/pine_fetcher.py
 
 import asyncio
+import hashlib
 import re
 import logging
 from dataclasses import dataclass
-from typing import Optional, Dict, List
-from playwright.async_api import async_playwright, Page
+from typing import Callable, Optional, Dict, List
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+from .session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +23,21 @@ class PineCodeData:
     inputs: List[Dict]  # input 파라미터 목록
     is_protected: bool
     error: Optional[str] = None
+    unchanged: bool = False  # 저장된 코드 해시와 동일 (재처리 불필요)
+
+
+def pine_code_hash(code: str) -> str:
+    """저장/비교용 Pine 코드 해시"""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
 
 class PineCodeFetcher:
     """개별 스크립트 페이지에서 Pine 코드 추출"""
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, settle_delay: float = 2.0, timeout_ms: int = 30000):
         self.headless = headless
+        self.settle_delay = settle_delay  # 페이지 로드/클릭 후 대기 (초)
+        self.timeout_ms = timeout_ms
 
     async def fetch_pine_code(self, script_url: str) -> PineCodeData:
         """
@@ -39,52 +51,82 @@ class PineCodeFetcher:
             page = await context.new_page()
 
             try:
-                await page.goto(script_url, wait_until="networkidle", timeout=30000)
-                await asyncio.sleep(2)
-
-                # 스크립트 ID 추출
-                script_id = self._extract_script_id(script_url)
-
-                # 1. Pine 코드 추출 시도
-                pine_code, is_protected = await self._extract_pine_code(page)
-
-                # 2. Pine 버전 감지
-                pine_version = self._detect_pine_version(pine_code) if pine_code else 5
-
-                # 3. 성과 지표 추출
-                performance = await self._extract_performance(page)
-
-                # 4. 상세 설명 추출
-                description = await self._extract_description(page)
-
-                # 5. Input 파라미터 파싱
-                inputs = self._parse_inputs(pine_code) if pine_code else []
-
-                return PineCodeData(
-                    script_id=script_id,
-                    pine_code=pine_code,
-                    pine_version=pine_version,
-                    performance=performance,
-                    detailed_description=description,
-                    inputs=inputs,
-                    is_protected=is_protected,
-                )
-
+                return await self.fetch_from_page(page, script_url)
             except Exception as e:
                 logger.error(f"Error fetching {script_url}: {e}")
-                return PineCodeData(
-                    script_id=self._extract_script_id(script_url),
-                    pine_code=None,
-                    pine_version=5,
-                    performance={},
-                    detailed_description="",
-                    inputs=[],
-                    is_protected=True,
-                    error=str(e)
-                )
+                return self._error_result(script_url, e)
             finally:
                 await browser.close()
 
+    async def fetch_from_page(
+        self, page: Page, script_url: str, known_hash: Optional[str] = None
+    ) -> PineCodeData:
+        """
+        열린 페이지로 스크립트를 불러와 추출 (실패 시 예외)
+
+        known_hash가 추출한 코드의 해시와 같으면 성과/설명 추출을 건너뛰고
+        unchanged=True로 반환합니다.
+        """
+        response = await page.goto(script_url, wait_until="networkidle", timeout=self.timeout_ms)
+        # 429/5xx는 재시도 대상 (오류 페이지를 파싱하지 않음)
+        if response is not None and (response.status == 429 or response.status >= 500):
+            raise RuntimeError(f"HTTP {response.status}")
+        await asyncio.sleep(self.settle_delay)
+
+        # 스크립트 ID 추출
+        script_id = self._extract_script_id(script_url)
+
+        # 1. Pine 코드 추출 시도
+        pine_code, is_protected = await self._extract_pine_code(page)
+
+        # 2. Pine 버전 감지
+        pine_version = self._detect_pine_version(pine_code) if pine_code else 5
+
+        # 저장된 코드와 같으면 나머지 추출 생략
+        if pine_code and known_hash and pine_code_hash(pine_code) == known_hash:
+            return PineCodeData(
+                script_id=script_id,
+                pine_code=pine_code,
+                pine_version=pine_version,
+                performance={},
+                detailed_description="",
+                inputs=self._parse_inputs(pine_code),
+                is_protected=False,
+                unchanged=True,
+            )
+
+        # 3. 성과 지표 추출
+        performance = await self._extract_performance(page)
+
+        # 4. 상세 설명 추출
+        description = await self._extract_description(page)
+
+        # 5. Input 파라미터 파싱
+        inputs = self._parse_inputs(pine_code) if pine_code else []
+
+        return PineCodeData(
+            script_id=script_id,
+            pine_code=pine_code,
+            pine_version=pine_version,
+            performance=performance,
+            detailed_description=description,
+            inputs=inputs,
+            is_protected=is_protected,
+        )
+
+    def _error_result(self, script_url: str, error: Exception) -> PineCodeData:
+        """추출 실패 결과"""
+        return PineCodeData(
+            script_id=self._extract_script_id(script_url),
+            pine_code=None,
+            pine_version=5,
+            performance={},
+            detailed_description="",
+            inputs=[],
+            is_protected=True,
+            error=str(error)
+        )
+
     async def _extract_pine_code(self, page: Page) -> tuple[Optional[str], bool]:
         """Pine Script 코드 추출"""
 
@@ -93,7 +135,7 @@ class PineCodeFetcher:
             source_btn = await page.query_selector('text="Source code"')
             if source_btn:
                 await source_btn.click()
-                await asyncio.sleep(2)
+                await asyncio.sleep(self.settle_delay)
         except Exception:
             pass
 
@@ -166,7 +208,7 @@ class PineCodeFetcher:
             tester_tab = await page.query_selector('[data-name="backtesting"]')
             if tester_tab:
                 await tester_tab.click()
-                await asyncio.sleep(1)
+                await asyncio.sleep(self.settle_delay / 2)
 
             # 성과 지표 추출
             metrics = await page.evaluate("""
@@ -268,3 +310,157 @@ class PineCodeFetcher:
             return float(cleaned) if cleaned else None
         except ValueError:
             return None
+
+
+@dataclass
+class _ContextSlot:
+    """풀에서 재사용하는 브라우저 컨텍스트 + 페이지"""
+    index: int
+    context: BrowserContext
+    page: Page
+
+
+class PineFetcherPool:
+    """
+    브라우저 컨텍스트 풀 기반 병렬 Pine 코드 추출
+
+    - 브라우저 1개에 컨텍스트 N개를 띄워두고 재사용 (호출마다 브라우저 실행 X)
+    - 모든 컨텍스트가 SessionManager의 토큰 버킷을 공유 (전체 요청 속도 제한)
+    - 컨텍스트별 재시도: 실패하면 지수 백오프 후 새 컨텍스트로 교체하여 재시도
+    - known_hashes(script_id -> 저장된 코드 해시)와 같으면 unchanged=True
+
+    사용법:
+        async with PineFetcherPool(concurrency=4) as pool:
+            results = await pool.fetch_many(urls, known_hashes)
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        headless: bool = True,
+        session: Optional[SessionManager] = None,
+        max_retries: int = 3,
+        settle_delay: float = 2.0,
+        timeout_ms: int = 30000,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.headless = headless
+        self.session = session or SessionManager()
+        self.max_retries = max_retries
+        self.fetcher = PineCodeFetcher(headless=headless, settle_delay=settle_delay, timeout_ms=timeout_ms)
+
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._slots: List[_ContextSlot] = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def start(self):
+        """브라우저 실행 및 컨텍스트 생성"""
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        self._idle = asyncio.Queue()
+        for i in range(self.concurrency):
+            slot = await self._open_slot(i)
+            self._slots.append(slot)
+            self._idle.put_nowait(slot)
+        logger.info(f"Pine fetcher pool started ({self.concurrency} contexts)")
+
+    async def close(self):
+        """모든 컨텍스트와 브라우저 종료"""
+        for slot in self._slots:
+            try:
+                await slot.context.close()
+            except Exception:
+                pass
+        self._slots = []
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _open_slot(self, index: int) -> _ContextSlot:
+        """새 컨텍스트 (세션 관리자의 UA/뷰포트/프록시 적용)"""
+        context = await self._browser.new_context(**self.session.get_browser_context_options())
+        for script in self.session.get_stealth_scripts():
+            await context.add_init_script(script)
+        page = await context.new_page()
+        return _ContextSlot(index=index, context=context, page=page)
+
+    async def _replace_slot(self, slot: _ContextSlot) -> _ContextSlot:
+        """실패한 컨텍스트를 닫고 새로 생성"""
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+        fresh = await self._open_slot(slot.index)
+        self._slots[self._slots.index(slot)] = fresh
+        return fresh
+
+    async def fetch(self, script_url: str, known_hash: Optional[str] = None) -> PineCodeData:
+        """유휴 컨텍스트 하나로 추출 (재시도 포함, 실패 시 error가 채워진 결과)"""
+        if self._idle is None:
+            raise RuntimeError("PineFetcherPool is not started")
+
+        slot = await self._idle.get()
+        try:
+            last_error: Optional[Exception] = None
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    await self.session.exponential_backoff(attempt)
+
+                await self.session.acquire_slot()
+                try:
+                    if attempt:
+                        slot = await self._replace_slot(slot)
+                    result = await self.fetcher.fetch_from_page(slot.page, script_url, known_hash)
+                    self.session.record_success()
+                    return result
+                except Exception as e:
+                    last_error = e
+                    self.session.record_error()
+                    logger.warning(
+                        f"[ctx {slot.index}] {script_url} failed "
+                        f"(attempt {attempt + 1}/{self.max_retries + 1}): {e}"
+                    )
+
+            logger.error(f"Error fetching {script_url}: {last_error}")
+            return self.fetcher._error_result(script_url, last_error)
+        finally:
+            self._idle.put_nowait(slot)
+
+    async def fetch_many(
+        self,
+        script_urls: List[str],
+        known_hashes: Optional[Dict[str, str]] = None,
+        on_result: Optional[Callable[[int, PineCodeData], None]] = None,
+    ) -> List[PineCodeData]:
+        """
+        여러 스크립트를 컨텍스트 풀에 분배하여 추출
+
+        Args:
+            script_urls: 스크립트 URL 목록
+            known_hashes: script_id -> 저장된 Pine 코드 해시
+            on_result: 결과가 나올 때마다 (입력 순번, 결과)로 호출
+
+        Returns:
+            입력 순서와 같은 PineCodeData 목록
+        """
+        known_hashes = known_hashes or {}
+
+        async def run(index: int, url: str) -> PineCodeData:
+            script_id = self.fetcher._extract_script_id(url)
+            result = await self.fetch(url, known_hashes.get(script_id))
+            if on_result:
+                on_result(index, result)
+            return result
+
+        return list(await asyncio.gather(*(run(i, url) for i, url in enumerate(script_urls))))
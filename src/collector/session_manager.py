@@ -3,6 +3,7 @@
 import asyncio
 import random
 import logging
+import time
 from typing import Optional, List, Dict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -42,6 +43,45 @@ class RateLimitConfig:
     max_delay: float = 8.0
     backoff_base: float = 2.0
     max_backoff: float = 300.0
+    burst: int = 3  # 토큰 버킷 최대 연속 요청 수
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷
+
+    여러 작업자(브라우저 컨텍스트)가 공유하는 요청 속도 제한.
+    rate(초당 토큰)만큼 채워지고 capacity까지 몰아서 쓸 수 있습니다.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 얻을 때까지 대기, 대기한 시간(초) 반환"""
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        # 락을 잡은 채로 대기해 먼저 온 작업자가 먼저 토큰을 받음
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= tokens
+        return waited
 
 
 class SessionManager:
@@ -50,7 +90,7 @@ class SessionManager:
 
     기능:
     - 프록시 로테이션
-    - Rate Limiting
+    - Rate Limiting (공유 토큰 버킷 포함)
     - 지수 백오프
     - User-Agent 로테이션
     - 쿠키 관리
@@ -85,6 +125,10 @@ class SessionManager:
         self._request_times: List[datetime] = []
         self._consecutive_errors = 0
         self._cookies: Dict[str, str] = {}
+        self.token_bucket = TokenBucket(
+            rate=self.rate_limit.requests_per_minute / 60,
+            capacity=self.rate_limit.burst,
+        )
 
     def get_random_user_agent(self) -> str:
         """랜덤 User-Agent 반환"""
@@ -150,6 +194,10 @@ class SessionManager:
         delay = random.uniform(self.rate_limit.min_delay, self.rate_limit.max_delay)
         await asyncio.sleep(delay)
 
+    async def acquire_slot(self) -> float:
+        """공유 토큰 버킷에서 요청 슬롯 획득 (동시 작업자용, 랜덤 딜레이 없음)"""
+        return await self.token_bucket.acquire()
+
     async def exponential_backoff(self, attempt: Optional[int] = None) -> float:
         """지수 백오프"""
         if attempt is None:
@@ -6,6 +6,7 @@ from .pine_to_python import PineScriptConverter
 from .strategy_generator import StrategyGenerator
 from .pine_lexer import PineLexer, Token, TokenType, tokenize_pine_script
 from .indicator_mapper import IndicatorMapper, IndicatorMapping
+from .indicator_cache import IndicatorCache
 
 # Phase 2: Parser and AST
 from .pine_parser import (
@@ -80,6 +81,7 @@ __all__ = [
     "tokenize_pine_script",
     "IndicatorMapper",
     "IndicatorMapping",
+    "IndicatorCache",
     # Phase 2
     "PineParser",
     "PineAST",
@@ -0,0 +1,476 @@
+"""
+Indicator Cache
+
+Memoises indicator results keyed by (dataset fingerprint, indicator, params),
+so identical calculations (e.g. EMA(20) on BTCUSDT_1h) across optimizer runs
+and pipeline backtests are computed once.
+
+- Keys: SHA-256 over the indicator name, a BLAKE2b content hash of every input
+  series (values, dtype, index and name) and the JSON-encoded parameters.
+- In-memory LRU bounded by entry count and total bytes.
+- Optional spill to ``{spill_dir}/{dataset}/{key}.json`` + ``{key}.{i}.npy``;
+  spilled arrays are memory-mapped when read back. The layout matches
+  trading-agent-system/src/indicators/cache.py, so both can share a directory.
+- Entries are tagged with a dataset (e.g. ``BTCUSDT_1h``) and can be
+  invalidated per dataset; OHLCVStore.append does this when new candles land.
+
+Cached results are read-only; callers always receive a copy.
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+SCALAR_TYPES = (bool, int, float, str, type(None))
+
+# (cache, dataset tag) activated for the current context
+_active: contextvars.ContextVar[Optional[Tuple["IndicatorCache", Optional[str]]]] = \
+    contextvars.ContextVar("indicator_cache", default=None)
+
+
+class Uncacheable(Exception):
+    """Input that cannot be keyed (or a result that cannot be spilled)"""
+
+
+def dataset_tag(symbol: str, interval: str) -> str:
+    """Dataset tag used for invalidation (BTC/USDT, 1h -> BTCUSDT_1h)"""
+    return f"{symbol.replace('/', '').upper()}_{interval}"
+
+
+# === FINGERPRINTS / KEYS ===
+
+def _update_array(h: Any, values: np.ndarray) -> None:
+    if values.dtype == object:
+        try:
+            values = pd.util.hash_array(values)
+        except TypeError:
+            raise Uncacheable("Unhashable object array")
+    h.update(f"{values.dtype.str}{values.shape}".encode())
+    h.update(np.ascontiguousarray(values).data)
+
+
+def _update_index(h: Any, index: pd.Index) -> None:
+    if isinstance(index, pd.RangeIndex):
+        h.update(f"range{index.start},{index.stop},{index.step}".encode())
+        return
+    if isinstance(index, pd.DatetimeIndex):
+        h.update(f"datetime{index.dtype}{index.freqstr}".encode())
+        _update_array(h, index.asi8)
+        return
+    _update_array(h, index.to_numpy())
+
+
+def fingerprint(values: Any) -> str:
+    """Content hash of an array, Series or DataFrame (including index and name)"""
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(values, pd.DataFrame):
+        h.update(b"frame" + repr(list(values.columns)).encode())
+        for i in range(values.shape[1]):
+            _update_array(h, values.iloc[:, i].to_numpy())
+        _update_index(h, values.index)
+    elif isinstance(values, pd.Series):
+        h.update(b"series" + repr(values.name).encode())
+        _update_array(h, values.to_numpy())
+        _update_index(h, values.index)
+    else:
+        _update_array(h, np.asarray(values))
+    return h.hexdigest()
+
+
+def value_token(value: Any) -> Any:
+    """JSON-serialisable key component (arrays are replaced by their fingerprint)"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, SCALAR_TYPES):
+        return value
+    if isinstance(value, (np.ndarray, pd.Series, pd.DataFrame)):
+        return {"data": fingerprint(value)}
+    if isinstance(value, (tuple, list)):
+        return [value_token(v) for v in value]
+    if isinstance(value, Mapping):
+        return {"dict": sorted([str(k), value_token(v)] for k, v in value.items())}
+    raise Uncacheable(f"Cannot key on {type(value).__name__}")
+
+
+def make_key(name: str, args: tuple = (), params: Optional[Mapping[str, Any]] = None,
+             extra: Any = None) -> str:
+    """Cache key (SHA-256 hex)"""
+    payload = json.dumps(
+        [name, value_token(args), value_token(dict(params or {})), value_token(extra)],
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# === RESULT ENCODING (SPILL FORMAT) ===
+
+def _check_array(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype == object:
+        raise Uncacheable("Object arrays are not spilled to .npy")
+    return values
+
+
+def _check_label(label: Any) -> Any:
+    if isinstance(label, np.generic):
+        label = label.item()
+    if not isinstance(label, SCALAR_TYPES):
+        raise Uncacheable(f"Label is not JSON-serialisable: {label!r}")
+    return label
+
+
+def _encode_index(index: pd.Index) -> Tuple[np.ndarray, Dict[str, Any]]:
+    meta = {"name": _check_label(index.name)}
+    if isinstance(index, pd.DatetimeIndex):
+        # tz-aware indexes are stored as naive UTC
+        naive = index.tz_convert(None) if index.tz is not None else index
+        meta.update(
+            kind="datetime",
+            tz=str(index.tz) if index.tz is not None else None,
+            freq=index.freqstr
+        )
+        return naive.to_numpy(), meta
+    meta["kind"] = "plain"
+    return _check_array(index.to_numpy()), meta
+
+
+def _decode_index(values: np.ndarray, meta: Dict[str, Any]) -> pd.Index:
+    if meta["kind"] == "datetime":
+        index = pd.DatetimeIndex(np.asarray(values), name=meta["name"], freq=meta["freq"])
+        if meta["tz"]:
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+        return index
+    return pd.Index(values, name=meta["name"])
+
+
+def encode_result(result: Any) -> Tuple[List[np.ndarray], Dict[str, Any]]:
+    """Result -> (arrays, metadata)"""
+    if isinstance(result, np.ndarray):
+        return [_check_array(result)], {"kind": "array"}
+    if isinstance(result, pd.Series):
+        index, index_meta = _encode_index(result.index)
+        return [_check_array(result.to_numpy()), index], {
+            "kind": "series", "name": _check_label(result.name), "index": index_meta
+        }
+    if isinstance(result, pd.DataFrame):
+        index, index_meta = _encode_index(result.index)
+        columns = [_check_array(result.iloc[:, i].to_numpy()) for i in range(result.shape[1])]
+        return columns + [index], {
+            "kind": "frame",
+            "columns": [_check_label(c) for c in result.columns],
+            "index": index_meta,
+        }
+    if isinstance(result, tuple):
+        arrays, parts = [], []
+        for item in result:
+            item_arrays, item_meta = encode_result(item)
+            arrays.extend(item_arrays)
+            parts.append((len(item_arrays), item_meta))
+        return arrays, {"kind": "tuple", "parts": parts}
+    raise Uncacheable(f"Cannot spill {type(result).__name__}")
+
+
+def decode_result(arrays: List[np.ndarray], meta: Dict[str, Any]) -> Any:
+    """(arrays, metadata) -> result"""
+    kind = meta["kind"]
+    if kind == "array":
+        return arrays[0]
+    if kind == "series":
+        return pd.Series(arrays[0], index=_decode_index(arrays[1], meta["index"]), name=meta["name"])
+    if kind == "frame":
+        frame = pd.DataFrame(
+            {i: values for i, values in enumerate(arrays[:-1])},
+            index=_decode_index(arrays[-1], meta["index"])
+        )
+        frame.columns = meta["columns"]
+        return frame
+    items, offset = [], 0
+    for count, item_meta in meta["parts"]:
+        items.append(decode_result(arrays[offset:offset + count], item_meta))
+        offset += count
+    return tuple(items)
+
+
+def _is_cacheable_result(result: Any) -> bool:
+    if isinstance(result, tuple):
+        return all(_is_cacheable_result(item) for item in result)
+    return isinstance(result, (np.ndarray, pd.Series, pd.DataFrame))
+
+
+def _freeze(result: Any) -> Any:
+    """Private read-only copy kept by the cache"""
+    if isinstance(result, np.ndarray):
+        result = result.copy()
+        result.flags.writeable = False
+        return result
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_freeze(item) for item in result)
+    return result
+
+
+def _thaw(result: Any) -> Any:
+    """Copy handed to the caller"""
+    if isinstance(result, np.ndarray):
+        return np.array(result)
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_thaw(item) for item in result)
+    return result
+
+
+def _nbytes(result: Any) -> int:
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        return int(np.sum(result.memory_usage(index=True)))
+    return sum(_nbytes(item) for item in result)
+
+
+# === CACHE ===
+
+class _Entry:
+    __slots__ = ("value", "dataset", "nbytes")
+
+    def __init__(self, value: Any, dataset: Optional[str], nbytes: int):
+        self.value = value
+        self.dataset = dataset
+        self.nbytes = nbytes
+
+
+class IndicatorCache:
+    """
+    Thread-safe indicator result cache
+
+    Example:
+        cache = IndicatorCache(spill_dir='data/indicator_cache')
+        mapper = IndicatorMapper(cache=cache)
+        with cache.activate('BTCUSDT_1h'):
+            ema = mapper.calculate('ta.ema', df['close'], length=20)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        max_bytes: int = 512 * 1024 * 1024,
+        spill_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            maxsize: Maximum number of results kept in memory
+            max_bytes: Maximum total size of results kept in memory
+            spill_dir: Directory for .npy spill files (None disables spilling)
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.bypassed = 0
+        self.evictions = 0
+
+    def get_or_compute(
+        self,
+        name: str,
+        args: tuple,
+        params: Optional[Mapping[str, Any]],
+        compute: Callable[[], Any],
+        dataset: Optional[str] = None,
+        extra: Any = None
+    ) -> Any:
+        """
+        Return the cached result, computing and storing it on a miss
+
+        Args:
+            name: Indicator identifier (e.g. 'ta.ema')
+            args: Positional inputs (arrays are keyed by content fingerprint)
+            params: Indicator parameters
+            compute: Called on a miss
+            dataset: Dataset tag used for invalidation
+            extra: Additional key component
+        """
+        try:
+            key = make_key(name, args, params, [dataset, extra])
+        except Uncacheable:
+            return self.bypass(compute)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _thaw(entry.value)
+
+        value = self._load(key, dataset)
+        if value is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._store(key, value, dataset)
+            return _thaw(value)
+
+        result = compute()
+        if not _is_cacheable_result(result):
+            with self._lock:
+                self.bypassed += 1
+            return result
+
+        value = _freeze(result)
+        with self._lock:
+            self.misses += 1
+        self._store(key, value, dataset)
+        self._spill(key, value, dataset)
+        return _thaw(value)
+
+    def bypass(self, compute: Callable[[], Any]) -> Any:
+        """Compute without caching (for calls that cannot be keyed)"""
+        with self._lock:
+            self.bypassed += 1
+        return compute()
+
+    def _store(self, key: str, value: Any, dataset: Optional[str]) -> None:
+        nbytes = _nbytes(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._entries[key] = _Entry(value, dataset, nbytes)
+            self._bytes += nbytes
+            while self._entries and (
+                len(self._entries) > self.maxsize or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def _spill_path(self, key: str, dataset: Optional[str]) -> Path:
+        return self.spill_dir / (dataset or "_") / key
+
+    def _spill(self, key: str, value: Any, dataset: Optional[str]) -> None:
+        if self.spill_dir is None:
+            return
+        try:
+            arrays, meta = encode_result(value)
+        except Uncacheable:
+            return
+
+        base = self._spill_path(key, dataset)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f"{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            for i, values in enumerate(arrays):
+                tmp = base.with_name(f"{key}.{i}.npy.{suffix}")
+                with open(tmp, "wb") as f:
+                    np.save(f, values, allow_pickle=False)
+                os.replace(tmp, base.with_name(f"{key}.{i}.npy"))
+            # The metadata file is written last, so its presence means the arrays are complete
+            tmp = base.with_name(f"{key}.json.{suffix}")
+            tmp.write_text(json.dumps({"arrays": len(arrays), "meta": meta}))
+            os.replace(tmp, base.with_name(f"{key}.json"))
+        except OSError:
+            for leftover in base.parent.glob(f"{key}.*.{suffix}"):
+                leftover.unlink(missing_ok=True)
+
+    def _load(self, key: str, dataset: Optional[str]) -> Any:
+        if self.spill_dir is None:
+            return None
+        base = self._spill_path(key, dataset)
+        try:
+            header = json.loads(base.with_name(f"{key}.json").read_text())
+            arrays = [
+                np.asarray(np.load(base.with_name(f"{key}.{i}.npy"), mmap_mode="r", allow_pickle=False))
+                for i in range(header["arrays"])
+            ]
+            # Kept memory-mapped (mmap_mode="r" is already read-only)
+            return decode_result(arrays, header["meta"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @contextmanager
+    def activate(self, dataset: Optional[str] = None) -> Iterator["IndicatorCache"]:
+        """Use this cache (tagged with dataset) for mappers without their own cache"""
+        token = _active.set((self, dataset))
+        try:
+            yield self
+        finally:
+            _active.reset(token)
+
+    def invalidate(self, dataset: Optional[str] = None) -> int:
+        """
+        Drop results tagged with dataset (all results when None)
+
+        Returns:
+            Number of in-memory entries removed
+        """
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if dataset is None or entry.dataset == dataset
+            ]
+            for key in keys:
+                self._bytes -= self._entries.pop(key).nbytes
+
+        if self.spill_dir is not None:
+            target = self.spill_dir if dataset is None else self.spill_dir / dataset
+            if target.is_dir():
+                shutil.rmtree(target, ignore_errors=True)
+                self.spill_dir.mkdir(parents=True, exist_ok=True)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Empty the in-memory cache (spill files are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+def active_cache() -> Optional[Tuple[IndicatorCache, Optional[str]]]:
+    """(cache, dataset tag) activated for the current context, if any"""
+    return _active.get()
+
+
+_shared_cache = IndicatorCache()
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """Process-wide cache"""
+    return _shared_cache
+
+
+def invalidate_dataset(symbol: str, interval: str) -> int:
+    """Drop a dataset's results from the process-wide cache (called by OHLCVStore.append)"""
+    return _shared_cache.invalidate(dataset_tag(symbol, interval))
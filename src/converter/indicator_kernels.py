@@ -0,0 +1,105 @@
+"""
+Indicator Kernels
+
+Array-based kernels for the path-dependent indicators in IndicatorMapper.
+Kernels take contiguous float64 ndarrays and return ndarrays; they are
+JIT-compiled with numba when it is installed and run as plain Python loops
+otherwise. Results are bit-for-bit identical to the original pandas loops.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator used when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def as_float_array(values) -> np.ndarray:
+    """Convert a Series/array to a contiguous float64 ndarray"""
+    return np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+
+
+@njit
+def supertrend_kernel(close: np.ndarray, upper_band: np.ndarray,
+                      lower_band: np.ndarray):
+    """
+    Supertrend recursion (Pine ta.supertrend semantics)
+
+    Returns:
+        (supertrend, direction) where direction is 1 (up) or -1 (down)
+    """
+    n = len(close)
+    supertrend = np.full(n, np.nan)
+    direction = np.ones(n, dtype=np.int64)
+
+    for i in range(1, n):
+        if close[i] > upper_band[i - 1]:
+            direction[i] = 1
+        elif close[i] < lower_band[i - 1]:
+            direction[i] = -1
+        else:
+            direction[i] = direction[i - 1]
+
+        if direction[i] == 1:
+            supertrend[i] = lower_band[i]
+        else:
+            supertrend[i] = upper_band[i]
+
+    return supertrend, direction
+
+
+@njit
+def sar_kernel(high: np.ndarray, low: np.ndarray, start: float,
+               increment: float, maximum: float) -> np.ndarray:
+    """
+    Parabolic SAR recursion (Pine ta.sar semantics)
+
+    Returns:
+        SAR values
+    """
+    n = len(high)
+    sar = np.full(n, np.nan)
+    if n == 0:
+        return sar
+
+    af = start
+    trend = 1  # 1 for uptrend, -1 for downtrend
+
+    sar[0] = low[0]
+    ep = high[0]
+
+    for i in range(1, n):
+        sar[i] = sar[i - 1] + af * (ep - sar[i - 1])
+
+        if trend == 1:
+            if low[i] < sar[i]:
+                trend = -1
+                sar[i] = ep
+                ep = low[i]
+                af = start
+            elif high[i] > ep:
+                ep = high[i]
+                af = af + increment
+                if maximum < af:
+                    af = maximum
+        else:
+            if high[i] > sar[i]:
+                trend = 1
+                sar[i] = ep
+                ep = high[i]
+                af = start
+            elif low[i] < ep:
+                ep = low[i]
+                af = af + increment
+                if maximum < af:
+                    af = maximum
+
+    return sar
@@ -11,6 +11,9 @@ from typing import Dict, List, Tuple, Optional, Callable, Any
 from dataclasses import dataclass
 import logging
 
+from .indicator_cache import IndicatorCache, active_cache
+from .indicator_kernels import as_float_array, supertrend_kernel, sar_kernel
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +37,9 @@ class IndicatorMapper:
     Provides implementations for 50+ technical indicators commonly used in
     Pine Script, with proper parameter handling and pandas/numpy operations.
 
+    Results are memoised when the mapper has an IndicatorCache, or when one
+    is activated for the current context (``with cache.activate('BTCUSDT_1h')``).
+
     Example:
         mapper = IndicatorMapper()
         df = pd.DataFrame({'close': [...], 'high': [...], 'low': [...]})
@@ -41,9 +47,15 @@ class IndicatorMapper:
         rsi_14 = mapper.calculate('ta.rsi', df['close'], length=14)
     """
 
-    def __init__(self):
-        """Initialize indicator mapper with all mappings"""
+    def __init__(self, cache: Optional[IndicatorCache] = None):
+        """
+        Initialize indicator mapper with all mappings
+
+        Args:
+            cache: Indicator result cache (None: use the activated cache, if any)
+        """
         self.mappings = self._build_mappings()
+        self.cache = cache
 
     def _build_mappings(self) -> Dict[str, IndicatorMapping]:
         """Build comprehensive indicator mapping dictionary"""
@@ -799,59 +811,26 @@ class IndicatorMapper:
         upper_band = hl_avg + factor * atr
         lower_band = hl_avg - factor * atr
 
-        supertrend = pd.Series(np.nan, index=close.index)
-        direction = pd.Series(1, index=close.index)  # 1 = uptrend, -1 = downtrend
-
-        for i in range(1, len(close)):
-            if close.iloc[i] > upper_band.iloc[i - 1]:
-                direction.iloc[i] = 1
-            elif close.iloc[i] < lower_band.iloc[i - 1]:
-                direction.iloc[i] = -1
-            else:
-                direction.iloc[i] = direction.iloc[i - 1]
-
-            if direction.iloc[i] == 1:
-                supertrend.iloc[i] = lower_band.iloc[i]
-            else:
-                supertrend.iloc[i] = upper_band.iloc[i]
+        supertrend, direction = supertrend_kernel(
+            as_float_array(close),
+            as_float_array(upper_band),
+            as_float_array(lower_band)
+        )
 
-        return supertrend, direction
+        return pd.Series(supertrend, index=close.index), pd.Series(direction, index=close.index)
 
     def _sar(self, high: pd.Series, low: pd.Series, start: float,
              increment: float, maximum: float) -> pd.Series:
         """Parabolic SAR"""
-        sar = pd.Series(np.nan, index=high.index)
-        af = start
-        trend = 1  # 1 for uptrend, -1 for downtrend
-
-        sar.iloc[0] = low.iloc[0]
-        ep = high.iloc[0]
-
-        for i in range(1, len(high)):
-            sar.iloc[i] = sar.iloc[i - 1] + af * (ep - sar.iloc[i - 1])
-
-            if trend == 1:
-                if low.iloc[i] < sar.iloc[i]:
-                    trend = -1
-                    sar.iloc[i] = ep
-                    ep = low.iloc[i]
-                    af = start
-                else:
-                    if high.iloc[i] > ep:
-                        ep = high.iloc[i]
-                        af = min(af + increment, maximum)
-            else:
-                if high.iloc[i] > sar.iloc[i]:
-                    trend = 1
-                    sar.iloc[i] = ep
-                    ep = high.iloc[i]
-                    af = start
-                else:
-                    if low.iloc[i] < ep:
-                        ep = low.iloc[i]
-                        af = min(af + increment, maximum)
-
-        return sar
+        sar = sar_kernel(
+            as_float_array(high),
+            as_float_array(low),
+            float(start),
+            float(increment),
+            float(maximum)
+        )
+
+        return pd.Series(sar, index=high.index)
 
     # === PUBLIC INTERFACE ===
 
@@ -882,8 +861,18 @@ class IndicatorMapper:
         # Get the implementation method
         method = getattr(self, mapping.python_func)
 
-        # Call with args and params
-        return method(*args, **params)
+        # Memoise through the mapper's cache or the activated one
+        cache, dataset = self.cache, None
+        active = active_cache()
+        if active is not None:
+            cache = cache or active[0]
+            dataset = active[1]
+        if cache is None:
+            return method(*args, **params)
+
+        return cache.get_or_compute(
+            indicator_name, args, params, lambda: method(*args, **params), dataset
+        )
 
     def get_mapping(self, indicator_name: str) -> Optional[IndicatorMapping]:
         """Get mapping information for an indicator"""
@@ -3,6 +3,9 @@ Conversion Cache
 
 Caches conversion results to avoid redundant LLM API calls.
 Uses SHA256 hashing of Pine Script code for cache keys.
+
+Entries live in the shared two-tier LLMCache (memory LRU + single SQLite
+file) under a "conversion:<model_version>" namespace.
 """
 
 import logging
@@ -10,8 +13,10 @@ import hashlib
 import json
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.llm_cache import LLMCache, cache_namespace
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +34,12 @@ class CacheEntry:
 
 class ConversionCache:
     """
-    File-based cache for conversion results.
+    Cache for conversion results.
 
     Benefits:
     - Avoid redundant LLM API calls
-    - Instant results for re-conversions
+    - Instant results for re-conversions (memory tier)
+    - One index file instead of one JSON file per script
     - Cost savings
 
     Example:
@@ -44,17 +50,34 @@ class ConversionCache:
         ...     cache.set(pine_code, result)
     """
 
-    def __init__(self, cache_dir: str = ".cache/conversions"):
+    DB_NAME = "llm_cache.db"
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache/conversions",
+        ttl_days: int = 30,
+        model_version: str = "default",
+        cache: Optional[LLMCache] = None,
+    ):
         """
         Initialize cache.
 
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory holding the cache database
+            ttl_days: Entry lifetime
+            model_version: Converter model/version; results of other versions are not served
+            cache: Shared LLMCache (default: one at {cache_dir}/llm_cache.db)
         """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_days = ttl_days
+        self.namespace = cache_namespace("conversion", model_version)
+        if cache is None:
+            cache = LLMCache(self.cache_dir / self.DB_NAME, default_ttl=ttl_days * 86400)
+        self.cache = cache
 
-        logger.debug(f"Initialized ConversionCache at {self.cache_dir}")
+        self._import_legacy_files()
+
+        logger.debug(f"Initialized ConversionCache at {self.cache_dir} ({self.namespace})")
 
     def get(self, pine_code: str) -> Optional[dict]:
         """
@@ -67,28 +90,11 @@ class ConversionCache:
             Cached result dict or None
         """
         cache_key = self._compute_cache_key(pine_code)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
-        if not cache_file.exists():
-            return None
-
-        # Load and validate
-        try:
-            with open(cache_file, 'r') as f:
-                entry = json.load(f)
-
-            # Check TTL
-            if self._is_expired(entry):
-                logger.debug(f"Cache entry expired: {cache_key}")
-                cache_file.unlink()  # Delete expired
-                return None
+        entry = self.cache.get(self.namespace, cache_key)
 
+        if entry is not None:
             logger.debug(f"Cache hit: {cache_key}")
-            return entry
-
-        except Exception as e:
-            logger.warning(f"Cache read error: {e}")
-            return None
+        return entry
 
     def set(self, pine_code: str, result: dict):
         """
@@ -99,7 +105,6 @@ class ConversionCache:
             result: Conversion result to cache
         """
         cache_key = self._compute_cache_key(pine_code)
-        cache_file = self.cache_dir / f"{cache_key}.json"
 
         entry = {
             "pine_code_hash": cache_key,
@@ -107,13 +112,11 @@ class ConversionCache:
             "strategy_used": result.get("strategy_used", "unknown"),
             "cost_usd": result.get("cost_usd", 0.0),
             "timestamp": datetime.utcnow().isoformat(),
-            "ttl_days": 30,
+            "ttl_days": self.ttl_days,
         }
 
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(entry, f, indent=2)
-
+            self.cache.set(self.namespace, cache_key, entry, ttl=self.ttl_days * 86400)
             logger.debug(f"Cached result: {cache_key}")
 
         except Exception as e:
@@ -126,34 +129,40 @@ class ConversionCache:
         Args:
             older_than_days: Delete entries older than this
         """
-        count = 0
+        count = self.cache.purge(self.namespace, older_than=older_than_days * 86400)
+        count += self.cache.purge(self.namespace, expired_only=True)
+
+        logger.info(f"Cleared {count} expired cache entries")
+
+    def get_stats(self) -> dict:
+        """Hit-rate metrics of this namespace"""
+        stats = self.cache.get_stats()
+        return {"namespace": self.namespace, **stats["namespaces"].get(self.namespace, {})}
+
+    def _import_legacy_files(self):
+        """Move entries of the old one-JSON-file-per-hash layout into the store"""
+        imported = 0
 
         for cache_file in self.cache_dir.glob("*.json"):
             try:
                 with open(cache_file, 'r') as f:
                     entry = json.load(f)
 
-                if self._is_expired(entry, older_than_days):
-                    cache_file.unlink()
-                    count += 1
+                timestamp = datetime.fromisoformat(entry["timestamp"])
+                remaining = entry.get("ttl_days", self.ttl_days) * 86400 - (
+                    datetime.utcnow() - timestamp
+                ).total_seconds()
+                if remaining > 0:
+                    self.cache.set(self.namespace, entry["pine_code_hash"], entry, ttl=remaining)
+                    imported += 1
+                cache_file.unlink()
 
-            except Exception:
-                pass
+            except Exception as e:
+                logger.warning(f"Skipping legacy cache file {cache_file.name}: {e}")
 
-        logger.info(f"Cleared {count} expired cache entries")
+        if imported:
+            logger.info(f"Imported {imported} legacy conversion cache entries")
 
     def _compute_cache_key(self, pine_code: str) -> str:
         """Compute SHA256 hash of Pine code"""
         return hashlib.sha256(pine_code.encode()).hexdigest()
-
-    def _is_expired(self, entry: dict, ttl_days: int = None) -> bool:
-        """Check if cache entry is expired"""
-        ttl = ttl_days or entry.get("ttl_days", 30)
-
-        timestamp_str = entry.get("timestamp", "")
-        try:
-            timestamp = datetime.fromisoformat(timestamp_str)
-            age = datetime.utcnow() - timestamp
-            return age > timedelta(days=ttl)
-        except:
-            return True  # Assume expired if can't parse
@@ -10,11 +10,9 @@ import os
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 from datetime import datetime
-import asyncio
 
 # Import Anthropic SDK
 try:
-    from anthropic import Anthropic, AsyncAnthropic
     from anthropic.types import Message
 except ImportError:
     raise ImportError(
@@ -23,6 +21,7 @@ except ImportError:
 
 from ..pine_parser import PineAST
 from ..ast_code_generator import GeneratedCode
+from src.llm_gateway import LLMGateway, LLMRequest, get_llm_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +79,9 @@ class LLMConverter:
     conversion fails or is insufficient.
 
     Features:
-    - Async API calls with retries
+    - Async API calls with retries (through the shared LLMGateway: global
+      concurrency limit, tokens-per-minute budget, in-flight dedup)
+    - Cached system prefix (instructions/examples shared by all strategies)
     - Token usage tracking
     - Cost estimation
     - Response caching
@@ -122,6 +123,8 @@ class LLMConverter:
         temperature: float = 0.0,
         timeout: int = 120,
         max_retries: int = 3,
+        gateway: Optional[LLMGateway] = None,
+        include_examples: bool = False,
     ):
         """
         Initialize LLM converter.
@@ -133,9 +136,12 @@ class LLMConverter:
             temperature: Sampling temperature (0 = deterministic)
             timeout: API timeout in seconds
             max_retries: Number of retry attempts
+            gateway: LLMGateway to send requests through (default: shared
+                gateway for the API key; pass one with a FakeBackend offline)
+            include_examples: Put the example conversion in the cached prefix
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        if not self.api_key:
+        if not self.api_key and gateway is None:
             raise ValueError(
                 "API key required. Set ANTHROPIC_API_KEY environment variable "
                 "or pass api_key parameter."
@@ -146,10 +152,8 @@ class LLMConverter:
         self.temperature = temperature
         self.timeout = timeout
         self.max_retries = max_retries
-
-        # Initialize Anthropic clients
-        self.client = Anthropic(api_key=self.api_key)
-        self.async_client = AsyncAnthropic(api_key=self.api_key)
+        self.include_examples = include_examples
+        self.gateway = gateway or get_llm_gateway(self.api_key)
 
         # Import dependencies (lazy to avoid circular imports)
         from .llm_prompt_builder import LLMPromptBuilder
@@ -199,11 +203,13 @@ class LLMConverter:
         try:
             # Step 1: Build prompt
             logger.debug("Building conversion prompt")
-            prompt = self.prompt_builder.build_conversion_prompt(ast)
+            prefix, prompt = self.prompt_builder.build_conversion_parts(
+                ast, include_examples=self.include_examples
+            )
 
             # Step 2: Call Claude API
             logger.debug(f"Calling Claude API (model: {self.model})")
-            response = await self._call_claude_api(prompt)
+            response = await self._call_claude_api(prompt, system=prefix)
 
             # Step 3: Parse response
             logger.debug("Parsing Claude response")
@@ -272,12 +278,13 @@ class LLMConverter:
             logger.error(f"Unexpected error during LLM conversion: {e}", exc_info=True)
             raise LLMConversionError(f"Conversion failed: {e}") from e
 
-    async def _call_claude_api(self, prompt: str) -> Message:
+    async def _call_claude_api(self, prompt: str, system: Optional[str] = None) -> Message:
         """
-        Call Claude API with retries and error handling.
+        Call Claude API through the gateway (retries, rate limits, dedup).
 
         Args:
             prompt: User prompt to send
+            system: Shared prefix sent as a cached system block
 
         Returns:
             Claude API response message
@@ -285,50 +292,29 @@ class LLMConverter:
         Raises:
             LLMAPIError: If API call fails after retries
         """
-        last_error = None
-
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                logger.debug(f"API call attempt {attempt}/{self.max_retries}")
-
-                response = await asyncio.wait_for(
-                    self.async_client.messages.create(
-                        model=self.model,
-                        max_tokens=self.max_tokens,
-                        temperature=self.temperature,
-                        messages=[{
-                            "role": "user",
-                            "content": prompt
-                        }]
-                    ),
-                    timeout=self.timeout
-                )
-
-                logger.debug(
-                    f"API call successful (tokens: {response.usage.input_tokens} + "
-                    f"{response.usage.output_tokens})"
-                )
-
-                return response
+        request = LLMRequest(
+            model=self.model,
+            prompt=prompt,
+            system=system,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+        )
 
-            except asyncio.TimeoutError as e:
-                last_error = e
-                logger.warning(f"API call timed out (attempt {attempt}/{self.max_retries})")
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+        try:
+            response = await self.gateway.complete(
+                request, timeout=self.timeout, max_retries=self.max_retries
+            )
+        except Exception as e:
+            error_msg = f"API call failed after {self.max_retries} attempts: {e!r}"
+            logger.error(error_msg)
+            raise LLMAPIError(error_msg) from e
 
-            except Exception as e:
-                last_error = e
-                logger.warning(
-                    f"API call failed: {e} (attempt {attempt}/{self.max_retries})"
-                )
-                if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)
+        logger.debug(
+            f"API call successful (tokens: {response.usage.input_tokens} + "
+            f"{response.usage.output_tokens})"
+        )
 
-        # All retries failed
-        error_msg = f"API call failed after {self.max_retries} attempts: {last_error}"
-        logger.error(error_msg)
-        raise LLMAPIError(error_msg) from last_error
+        return response
 
     async def _retry_with_refinement(
         self,
@@ -350,14 +336,14 @@ class LLMConverter:
         logger.info("Attempting refinement with validation feedback")
 
         # Build refined prompt
-        refined_prompt = self.prompt_builder.build_refinement_prompt(
+        prefix, refined_prompt = self.prompt_builder.build_refinement_parts(
             ast,
             previous_code,
             errors
         )
 
         # Call API
-        response = await self._call_claude_api(refined_prompt)
+        response = await self._call_claude_api(refined_prompt, system=prefix)
 
         # Parse
         parse_result = self.response_parser.parse_python_code(
@@ -406,7 +392,12 @@ class LLMConverter:
         input_cost = usage.input_tokens * pricing.get("input", 0)
         output_cost = usage.output_tokens * pricing.get("output", 0)
 
-        return input_cost + output_cost
+        # Prompt caching: writes cost 1.25x, reads 0.1x the input rate
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_cost = (cache_write * 1.25 + cache_read * 0.1) * pricing.get("input", 0)
+
+        return input_cost + output_cost + cache_cost
 
     def estimate_cost(self, ast: PineAST) -> float:
         """
@@ -6,7 +6,7 @@ with high accuracy and minimal token usage.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -91,10 +91,62 @@ Output ONLY valid Python code without explanations."""
         """
         logger.debug(f"Building conversion prompt for '{ast.script_name}'")
 
-        # Build prompt sections
+        sections = [self.SYSTEM_INSTRUCTIONS, ""] + self._build_conversion_sections(ast)
+
+        # Optionally add examples
+        if include_examples:
+            sections.extend(self._build_examples_section())
+
+        # Join all sections
+        prompt = "\n".join(sections)
+
+        logger.debug(f"Built prompt ({len(prompt)} chars, ~{len(prompt)//4} tokens)")
+
+        return prompt
+
+    def build_conversion_parts(
+        self,
+        ast: PineAST,
+        include_examples: bool = False,
+    ) -> Tuple[str, str]:
+        """
+        Build conversion prompt split into a shared prefix and a per-strategy body.
+
+        The prefix (system instructions + optional examples) is identical for
+        every strategy, so it can be sent as a cached system block and only the
+        body is billed at the full input rate.
+
+        Args:
+            ast: Parsed Pine Script AST
+            include_examples: Include code examples in the shared prefix
+
+        Returns:
+            (prefix, body)
+        """
+        body = "\n".join(self._build_conversion_sections(ast))
+        return self.shared_prefix(include_examples), body
+
+    def shared_prefix(self, include_examples: bool = False) -> str:
+        """
+        Shared system prefix (memoized).
+
+        Args:
+            include_examples: Append the example conversion
+
+        Returns:
+            Prefix text
+        """
+        key = f"prefix:{int(include_examples)}"
+        if key not in self.template_cache:
+            sections = [self.SYSTEM_INSTRUCTIONS]
+            if include_examples:
+                sections.extend(self._build_examples_section())
+            self.template_cache[key] = "\n".join(sections)
+        return self.template_cache[key]
+
+    def _build_conversion_sections(self, ast: PineAST) -> List[str]:
+        """Build the strategy-specific sections of the conversion prompt"""
         sections = [
-            self.SYSTEM_INSTRUCTIONS,
-            "",
             "# Task",
             f"Convert the following Pine Script **{ast.script_type}** to Python for backtesting.",
             "",
@@ -126,16 +178,7 @@ Output ONLY valid Python code without explanations."""
         # Add output requirements
         sections.extend(self._build_output_requirements(ast))
 
-        # Optionally add examples
-        if include_examples:
-            sections.extend(self._build_examples_section())
-
-        # Join all sections
-        prompt = "\n".join(sections)
-
-        logger.debug(f"Built prompt ({len(prompt)} chars, ~{len(prompt)//4} tokens)")
-
-        return prompt
+        return sections
 
     def build_refinement_prompt(
         self,
@@ -161,9 +204,37 @@ Output ONLY valid Python code without explanations."""
         """
         logger.debug(f"Building refinement prompt with {len(errors)} errors")
 
+        prompt = "\n".join(
+            [self.SYSTEM_INSTRUCTIONS, ""] + self._build_refinement_sections(ast, previous_code, errors)
+        )
+
+        logger.debug(f"Built refinement prompt ({len(prompt)} chars)")
+
+        return prompt
+
+    def build_refinement_parts(
+        self,
+        ast: PineAST,
+        previous_code: str,
+        errors: List[str],
+    ) -> Tuple[str, str]:
+        """
+        Build refinement prompt split into shared prefix and body.
+
+        Returns:
+            (prefix, body) - see build_conversion_parts()
+        """
+        body = "\n".join(self._build_refinement_sections(ast, previous_code, errors))
+        return self.shared_prefix(), body
+
+    def _build_refinement_sections(
+        self,
+        ast: PineAST,
+        previous_code: str,
+        errors: List[str],
+    ) -> List[str]:
+        """Build the strategy-specific sections of the refinement prompt"""
         sections = [
-            self.SYSTEM_INSTRUCTIONS,
-            "",
             "# Task: Fix Validation Errors",
             f"The previous conversion attempt for **{ast.script_name}** failed validation.",
             "Please fix the errors listed below and regenerate the complete Python code.",
@@ -193,11 +264,7 @@ Output ONLY valid Python code without explanations."""
             "- Do NOT include explanations or comments about the fixes",
         ])
 
-        prompt = "\n".join(sections)
-
-        logger.debug(f"Built refinement prompt ({len(prompt)} chars)")
-
-        return prompt
+        return sections
 
     def build_verification_prompt(
         self,
@@ -335,11 +335,16 @@ class {class_name}:
         if len(candles) < 50:
             return self._hold("Insufficient data")
 
-        closes = np.array([c["close"] for c in candles])
-        opens = np.array([c["open"] for c in candles])
-        highs = np.array([c["high"] for c in candles])
-        lows = np.array([c["low"] for c in candles])
-        volumes = np.array([c.get("volume", 0) for c in candles])
+        if hasattr(candles, "close"):
+            # Columnar window (backtest simulator)
+            closes, opens, highs = candles.close, candles.open, candles.high
+            lows, volumes = candles.low, candles.volume
+        else:
+            closes = np.array([c["close"] for c in candles])
+            opens = np.array([c["open"] for c in candles])
+            highs = np.array([c["high"] for c in candles])
+            lows = np.array([c["low"] for c in candles])
+            volumes = np.array([c.get("volume", 0) for c in candles])
 
         # Check exit conditions first
         if current_position:
@@ -0,0 +1,413 @@
+"""
+LLM Result Cache
+
+Two-tier cache shared by conversion (ConversionCache) and analysis
+(CostOptimizer) results:
+
+- Memory tier: LRU of encoded values (OrderedDict, O(1) hit / eviction);
+  every hit decodes a fresh copy, so callers may mutate what they get back
+- Disk tier: one SQLite file (WAL) indexed by (namespace, key), expiry and
+  last access, so TTL cleanup and size-bounded eviction are index range
+  deletes instead of opening every entry; memory hits are written back to
+  accessed_at in batches, so eviction sees them as recently used
+- Namespaces separate result kinds and model versions, e.g.
+  "conversion:claude-sonnet-4-5" or "analysis:full:gpt-4o"; bumping the model
+  version never serves results produced by an older model
+- Hit/miss counters per namespace
+
+Example:
+    >>> cache = LLMCache("data/llm_cache.db", max_entries=50_000)
+    >>> ns = cache_namespace("conversion", "claude-sonnet-4-5")
+    >>> cache.get(ns, code_hash) or cache.set(ns, code_hash, result)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LLM_CACHE = "data/llm_cache.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value_json TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_cache(expires_at);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at);
+"""
+
+# Fraction of max_entries / max_bytes freed beyond the bound on eviction,
+# so a full cache does not run an eviction query on every insert
+EVICTION_SLACK = 0.1
+
+# Memory hits recorded before their accessed_at updates are written to disk
+TOUCH_BATCH = 64
+
+
+def cache_namespace(kind: str, model_version: str = "default") -> str:
+    """Namespace for a result kind ("conversion", "analysis:full", ...) and model version"""
+    return f"{kind}:{model_version}"
+
+
+class LLMCache:
+    """
+    Memory LRU in front of a single SQLite store (thread- and process-safe:
+    per-thread connections, WAL).
+
+    Args:
+        db_path: SQLite file (None = memory tier only)
+        memory_size: entries kept (JSON-encoded) in memory
+        max_entries: disk entry bound (None = unbounded)
+        max_bytes: disk payload bound in bytes (None = unbounded)
+        default_ttl: seconds until an entry expires (None = never)
+        busy_timeout: seconds to wait while another process writes
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = DEFAULT_LLM_CACHE,
+        memory_size: int = 256,
+        max_entries: Optional[int] = 50_000,
+        max_bytes: Optional[int] = None,
+        default_ttl: Optional[float] = 30 * 86400,
+        busy_timeout: float = 30.0,
+    ):
+        self.db_path = Path(db_path) if db_path else None
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.busy_timeout = busy_timeout
+
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[str, Optional[float]]]" = OrderedDict()
+        self._touched: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self.evictions = 0
+
+        self._disk_entries = 0
+        self._disk_bytes = 0
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._conn()
+            conn.executescript(SCHEMA)
+            conn.commit()
+            self._disk_entries, self._disk_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Connection for the current thread (new one after fork)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self) -> None:
+        if self.db_path:
+            self._flush_touches()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and getattr(self._local, "pid", None) == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+    # ------------------------------------------------------------
+    # Get / set
+    # ------------------------------------------------------------
+
+    def _count(self, namespace: str, name: str) -> None:
+        counters = self._stats.setdefault(namespace, {"memory_hits": 0, "disk_hits": 0, "misses": 0})
+        counters[name] += 1
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Cached value or None (expired entries are dropped)"""
+        now = time.time()
+        item = (namespace, key)
+
+        raw = None
+        with self._lock:
+            cached = self._memory.get(item)
+            if cached is not None:
+                if cached[1] is None or cached[1] > now:
+                    raw = cached[0]
+                    self._memory.move_to_end(item)
+                    self._count(namespace, "memory_hits")
+                    if self.db_path:
+                        self._touched[item] = now
+                else:
+                    del self._memory[item]
+        if raw is not None:
+            if len(self._touched) >= TOUCH_BATCH:
+                self._flush_touches()
+            return json.loads(raw)
+
+        if self.db_path:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT value_json, expires_at FROM llm_cache WHERE namespace = ? AND key = ?", item
+            ).fetchone()
+            if row is not None:
+                raw, expires_at = row
+                if expires_at is None or expires_at > now:
+                    conn.execute(
+                        "UPDATE llm_cache SET accessed_at = ? WHERE namespace = ? AND key = ?", (now, *item)
+                    )
+                    conn.commit()
+                    with self._lock:
+                        self._remember(item, raw, expires_at)
+                        self._count(namespace, "disk_hits")
+                    return json.loads(raw)
+                self.delete(namespace, key)
+
+        with self._lock:
+            self._count(namespace, "misses")
+        return None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a JSON-serialisable value.
+
+        Args:
+            ttl: seconds until expiry (None = default_ttl)
+        """
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = now + ttl if ttl is not None else None
+        item = (namespace, key)
+        raw = json.dumps(value, ensure_ascii=False, default=str)
+
+        with self._lock:
+            self._remember(item, raw, expires_at)
+            self._touched.pop(item, None)
+
+        if not self.db_path:
+            return
+
+        size = len(raw.encode("utf-8"))
+        conn = self._conn()
+        previous = conn.execute(
+            "SELECT size FROM llm_cache WHERE namespace = ? AND key = ?", item
+        ).fetchone()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_cache "
+            "(namespace, key, value_json, size, created_at, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (namespace, key, raw, size, now, expires_at, now),
+        )
+        conn.commit()
+
+        with self._lock:
+            if previous is None:
+                self._disk_entries += 1
+                self._disk_bytes += size
+            else:
+                self._disk_bytes += size - previous[0]
+            over = self._over_bounds()
+        if over:
+            self._evict()
+
+    def _remember(self, item: Tuple[str, str], raw: str, expires_at: Optional[float]) -> None:
+        """Memory tier insert of an encoded value (caller holds the lock)"""
+        self._memory[item] = (raw, expires_at)
+        self._memory.move_to_end(item)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _flush_touches(self) -> None:
+        """Write the access times of memory hits to disk"""
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            conn = self._conn()
+            conn.executemany(
+                "UPDATE llm_cache SET accessed_at = MAX(accessed_at, ?) WHERE namespace = ? AND key = ?",
+                [(at, namespace, key) for (namespace, key), at in touched.items()],
+            )
+            conn.commit()
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._memory.pop((namespace, key), None)
+            self._touched.pop((namespace, key), None)
+        if self.db_path:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT size FROM llm_cache WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM llm_cache WHERE namespace = ? AND key = ?", (namespace, key))
+                conn.commit()
+                with self._lock:
+                    self._disk_entries -= 1
+                    self._disk_bytes -= row[0]
+
+    # ------------------------------------------------------------
+    # Eviction / cleanup
+    # ------------------------------------------------------------
+
+    def _over_bounds(self) -> bool:
+        return (
+            (self.max_entries is not None and self._disk_entries > self.max_entries)
+            or (self.max_bytes is not None and self._disk_bytes > self.max_bytes)
+        )
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently accessed ones until under bounds (with slack)"""
+        self._flush_touches()
+        removed = self.purge(expired_only=True)
+        if not self._over_bounds():
+            return
+
+        target_entries = int(self.max_entries * (1 - EVICTION_SLACK)) if self.max_entries is not None else None
+        target_bytes = int(self.max_bytes * (1 - EVICTION_SLACK)) if self.max_bytes is not None else None
+
+        conn = self._conn()
+        entries, total = self._disk_entries, self._disk_bytes
+        victims = []
+        for rowid, size in conn.execute("SELECT rowid, size FROM llm_cache ORDER BY accessed_at"):
+            if (target_entries is None or entries <= target_entries) and (target_bytes is None or total <= target_bytes):
+                break
+            victims.append((rowid,))
+            entries -= 1
+            total -= size
+
+        conn.executemany("DELETE FROM llm_cache WHERE rowid = ?", victims)
+        conn.commit()
+        self._sync_counts()
+        with self._lock:
+            self.evictions += removed + len(victims)
+        logger.debug(f"LLM cache evicted {removed} expired + {len(victims)} least recently used entries")
+
+    def purge(
+        self,
+        namespace: Optional[str] = None,
+        older_than: Optional[float] = None,
+        expired_only: bool = False,
+    ) -> int:
+        """
+        Delete entries.
+
+        Args:
+            namespace: restrict to a namespace, or a prefix ending in ":" ("analysis:")
+            older_than: only entries created more than this many seconds ago
+            expired_only: only entries past their TTL
+
+        Returns:
+            Number of disk entries deleted
+        """
+        now = time.time()
+        with self._lock:
+            # creation time is only kept on disk, so an age purge drops every
+            # matching memory copy (survivors are reloaded on the next get)
+            for item in [i for i in self._memory if self._matches(i[0], namespace)]:
+                expires_at = self._memory[item][1]
+                if expired_only and older_than is None and (expires_at is None or expires_at > now):
+                    continue
+                del self._memory[item]
+
+        if not self.db_path:
+            return 0
+
+        clauses, params = [], []
+        if namespace is not None:
+            if namespace.endswith(":"):
+                clauses.append("namespace LIKE ? ESCAPE '\\'")
+                params.append(namespace.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+            else:
+                clauses.append("namespace = ?")
+                params.append(namespace)
+        if older_than is not None:
+            clauses.append("created_at < ?")
+            params.append(now - older_than)
+        if expired_only:
+            clauses.append("expires_at <= ?")
+            params.append(now)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        conn = self._conn()
+        deleted = conn.execute(f"DELETE FROM llm_cache{where}", params).rowcount
+        conn.commit()
+        self._sync_counts()
+        return deleted
+
+    @staticmethod
+    def _matches(item_namespace: str, namespace: Optional[str]) -> bool:
+        if namespace is None:
+            return True
+        if namespace.endswith(":"):
+            return item_namespace.startswith(namespace)
+        return item_namespace == namespace
+
+    def _sync_counts(self) -> None:
+        entries, total = self._conn().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        with self._lock:
+            self._disk_entries, self._disk_bytes = entries, total
+
+    def clear(self) -> None:
+        """Remove everything (memory and disk)"""
+        self.purge()
+
+    # ------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._disk_entries if self.db_path else len(self._memory)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry counts, eviction count and hit rates (overall and per namespace)"""
+        with self._lock:
+            namespaces = {}
+            totals = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+            for namespace, counters in self._stats.items():
+                lookups = sum(counters.values())
+                hits = counters["memory_hits"] + counters["disk_hits"]
+                namespaces[namespace] = {**counters, "hit_rate": hits / lookups if lookups else 0.0}
+                for name, count in counters.items():
+                    totals[name] += count
+
+            lookups = sum(totals.values())
+            hits = totals["memory_hits"] + totals["disk_hits"]
+            return {
+                "memory_entries": len(self._memory),
+                "disk_entries": self._disk_entries,
+                "disk_bytes": self._disk_bytes,
+                "evictions": self.evictions,
+                **totals,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "namespaces": namespaces,
+            }
+
+
+_shared_cache: Optional[LLMCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache:
+    """Process-wide cache (path from LLM_CACHE_PATH, default data/llm_cache.db)"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMCache(os.getenv("LLM_CACHE_PATH", DEFAULT_LLM_CACHE))
+        return _shared_cache
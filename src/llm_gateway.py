@@ -0,0 +1,453 @@
+"""
+LLM Gateway
+
+Single entry point for Claude calls made by the converter (LLMConverter) and the
+deep analyzer (LLMDeepAnalyzer), so that hundreds of strategies can be processed
+concurrently without 429 storms.
+
+- Global concurrency limit (one semaphore per gateway / API key)
+- Per-model tokens-per-minute budget, reconciled with the usage reported by the API
+- Single-flight: identical in-flight requests share one backend call
+- Prompt-prefix caching: the shared system/examples prefix is sent as a cached
+  system block, so only the strategy-specific part is billed at full price
+- Pluggable backend: AnthropicBackend for the real API, FakeBackend for offline
+  load tests
+
+Example:
+    >>> gateway = LLMGateway(FakeBackend(), max_concurrency=16, tokens_per_minute=400_000)
+    >>> response = await gateway.complete(LLMRequest(model="claude-sonnet-4-5", prompt="..."))
+    >>> response.content[0].text
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Protocol, Union
+
+logger = logging.getLogger(__name__)
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (1 token ~ 4 characters)"""
+    return len(text) // 4 + 1 if text else 0
+
+
+# ============================================================================
+# Request / Response
+# ============================================================================
+
+@dataclass
+class LLMRequest:
+    """A single completion request"""
+    model: str
+    prompt: str
+    system: Optional[str] = None      # shared prefix (system instructions / examples)
+    max_tokens: int = 4096
+    temperature: Optional[float] = None  # None = API default
+    cache_prefix: bool = True         # mark `system` as a cacheable prefix
+
+    def key(self) -> str:
+        """Identity used for single-flight dedup"""
+        payload = json.dumps(
+            [self.model, self.system, self.prompt, self.max_tokens, self.temperature],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def estimated_tokens(self) -> int:
+        """Budget reserved before the call (prompt + worst-case output)"""
+        return estimate_tokens(self.system or "") + estimate_tokens(self.prompt) + self.max_tokens
+
+
+class RateLimitedError(Exception):
+    """Backend rejected the call with 429/529"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMBackend(Protocol):
+    """Backend interface: returns an object shaped like anthropic's Message
+    (`content[0].text`, `usage.input_tokens`, `usage.output_tokens`)."""
+
+    async def create(self, request: LLMRequest) -> Any:
+        ...
+
+
+def _usage_value(usage: Any, name: str) -> int:
+    return int(getattr(usage, name, 0) or 0)
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+class AnthropicBackend:
+    """Claude Messages API backend"""
+
+    def __init__(self, api_key: Optional[str] = None, client: Any = None):
+        if client is None:
+            from anthropic import AsyncAnthropic
+
+            # Retries belong to the gateway (budget / backoff); the SDK must not add its own
+            client = AsyncAnthropic(api_key=api_key or os.getenv("ANTHROPIC_API_KEY"), max_retries=0)
+        self.client = client
+
+    def _system_blocks(self, request: LLMRequest) -> Any:
+        # Prefixes below the model's cache minimum are accepted but not cached
+        block: Dict[str, Any] = {"type": "text", "text": request.system}
+        if request.cache_prefix:
+            block["cache_control"] = {"type": "ephemeral"}
+        return [block]
+
+    async def create(self, request: LLMRequest) -> Any:
+        kwargs: Dict[str, Any] = {
+            "model": request.model,
+            "max_tokens": request.max_tokens,
+            "messages": [{"role": "user", "content": request.prompt}],
+        }
+        if request.temperature is not None:
+            kwargs["temperature"] = request.temperature
+        if request.system:
+            kwargs["system"] = self._system_blocks(request)
+
+        try:
+            return await self.client.messages.create(**kwargs)
+        except Exception as e:
+            status = getattr(e, "status_code", None)
+            if status in (429, 529):
+                retry_after = None
+                response = getattr(e, "response", None)
+                if response is not None:
+                    try:
+                        retry_after = float(response.headers.get("retry-after"))
+                    except (TypeError, ValueError):
+                        pass
+                raise RateLimitedError(str(e), retry_after) from e
+            raise
+
+
+class FakeBackend:
+    """
+    Offline backend for tests and load tests.
+
+    - `responder(request) -> str` produces the response text (default: echo)
+    - `latency` simulates round-trip time
+    - `rate_limit_first` rejects the first N calls with RateLimitedError
+    - Prompt-prefix caching is simulated: a repeated `system` prefix is reported
+      as cache_read_input_tokens instead of input_tokens
+    """
+
+    def __init__(
+        self,
+        responder: Optional[Callable[[LLMRequest], str]] = None,
+        latency: float = 0.0,
+        rate_limit_first: int = 0,
+        retry_after: float = 0.0,
+    ):
+        self.responder = responder or (lambda request: f"echo: {request.prompt[:200]}")
+        self.latency = latency
+        self.rate_limit_first = rate_limit_first
+        self.retry_after = retry_after
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._cached_prefixes: set = set()
+
+    async def create(self, request: LLMRequest) -> Any:
+        self.calls += 1
+        if self.calls <= self.rate_limit_first:
+            raise RateLimitedError("fake 429", self.retry_after)
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            text = self.responder(request)
+        finally:
+            self.in_flight -= 1
+
+        prefix_tokens = estimate_tokens(request.system or "")
+        cache_read = cache_write = 0
+        if prefix_tokens and request.cache_prefix:
+            if request.system in self._cached_prefixes:
+                cache_read = prefix_tokens
+            else:
+                self._cached_prefixes.add(request.system)
+                cache_write = prefix_tokens
+            prefix_tokens = 0
+
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)],
+            model=request.model,
+            usage=SimpleNamespace(
+                input_tokens=prefix_tokens + estimate_tokens(request.prompt),
+                output_tokens=estimate_tokens(text),
+                cache_creation_input_tokens=cache_write,
+                cache_read_input_tokens=cache_read,
+            ),
+        )
+
+
+# ============================================================================
+# Token budget
+# ============================================================================
+
+class TokenBudget:
+    """
+    Tokens-per-minute budget for one model (token bucket refilled continuously).
+
+    `acquire` reserves an estimate before the call; `settle` corrects the
+    balance once the real usage is known.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self._available = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self._available = min(self.capacity, self._available + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int) -> float:
+        """Wait until `tokens` are available; returns seconds waited"""
+        tokens = min(float(tokens), self.capacity)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self._available < tokens:
+                delay = (tokens - self._available) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._available -= tokens
+        return waited
+
+    def settle(self, reserved: int, actual: int):
+        """Return unused reservation (or charge the overrun)"""
+        self._refill()
+        self._available = min(self.capacity, self._available + min(reserved, self.capacity) - actual)
+
+
+# ============================================================================
+# Gateway
+# ============================================================================
+
+@dataclass
+class GatewayStats:
+    """Gateway counters"""
+    requests: int = 0
+    coalesced: int = 0
+    backend_calls: int = 0
+    rate_limited: int = 0
+    failures: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    budget_wait_seconds: float = 0.0
+    peak_concurrency: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+
+class LLMGateway:
+    """
+    Concurrency-, budget- and dedup-aware front for an LLM backend.
+
+    Args:
+        backend: LLMBackend implementation (AnthropicBackend / FakeBackend)
+        max_concurrency: maximum in-flight backend calls across all callers
+        tokens_per_minute: per-model budget; an int applies to every model,
+            a dict maps model -> budget (missing models are unbudgeted)
+        max_retries: attempts per request on rate limits / timeouts / errors
+        backoff_base: exponential backoff base in seconds (when no retry-after)
+    """
+
+    def __init__(
+        self,
+        backend: LLMBackend,
+        max_concurrency: int = 8,
+        tokens_per_minute: Union[int, Dict[str, int], None] = None,
+        max_retries: int = 3,
+        backoff_base: float = 2.0,
+    ):
+        self.backend = backend
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.stats = GatewayStats()
+
+        self._budgets: Dict[str, TokenBudget] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._active = 0
+
+    def _bind_loop(self):
+        """(Re)create loop-bound primitives when used from a new event loop"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._inflight = {}
+            for budget in self._budgets.values():
+                budget._lock = None
+
+    def budget_for(self, model: str) -> Optional[TokenBudget]:
+        """Token budget for `model` (None = unbudgeted)"""
+        if model not in self._budgets:
+            tpm = self.tokens_per_minute
+            if isinstance(tpm, dict):
+                tpm = tpm.get(model)
+            if not tpm:
+                return None
+            self._budgets[model] = TokenBudget(tpm)
+        return self._budgets[model]
+
+    async def complete(
+        self,
+        request: LLMRequest,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ) -> Any:
+        """
+        Send a request (identical in-flight requests share one call).
+
+        If the caller that owns the shared call is cancelled, waiters that were
+        not cancelled themselves retry; the first of them dispatches again.
+
+        Raises:
+            The last backend error after all retries failed
+        """
+        self._bind_loop()
+        self.stats.requests += 1
+        key = request.key()
+
+        while (pending := self._inflight.get(key)) is not None:
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                self.stats.coalesced -= 1
+
+        future = self._loop.create_future()
+        self._inflight[key] = future
+        try:
+            response = await self._dispatch(request, timeout, max_retries)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _dispatch(self, request: LLMRequest, timeout: Optional[float], max_retries: Optional[int]) -> Any:
+        attempts = max(1, self.max_retries if max_retries is None else max_retries)
+        budget = self.budget_for(request.model)
+        last_error: Optional[BaseException] = None
+
+        for attempt in range(1, attempts + 1):
+            reserved = request.estimated_tokens()
+            if budget:
+                self.stats.budget_wait_seconds += await budget.acquire(reserved)
+
+            retry_after = None
+            async with self._semaphore:
+                self._active += 1
+                self.stats.peak_concurrency = max(self.stats.peak_concurrency, self._active)
+                self.stats.backend_calls += 1
+                try:
+                    call = self.backend.create(request)
+                    response = await (asyncio.wait_for(call, timeout) if timeout else call)
+                except RateLimitedError as e:
+                    last_error, retry_after = e, e.retry_after
+                    self.stats.rate_limited += 1
+                    response = None
+                except (asyncio.TimeoutError, Exception) as e:
+                    last_error = e
+                    response = None
+                finally:
+                    self._active -= 1
+
+            if response is not None:
+                self._record_usage(response, budget, reserved)
+                return response
+
+            if budget:
+                budget.settle(reserved, 0)
+            logger.warning(f"LLM call failed ({request.model}, attempt {attempt}/{attempts}): {last_error!r}")
+            if attempt < attempts:
+                await asyncio.sleep(retry_after if retry_after is not None else self.backoff_base ** attempt)
+
+        self.stats.failures += 1
+        raise last_error
+
+    def _record_usage(self, response: Any, budget: Optional[TokenBudget], reserved: int):
+        usage = getattr(response, "usage", None)
+        input_tokens = _usage_value(usage, "input_tokens")
+        output_tokens = _usage_value(usage, "output_tokens")
+        cache_write = _usage_value(usage, "cache_creation_input_tokens")
+        cache_read = _usage_value(usage, "cache_read_input_tokens")
+
+        self.stats.input_tokens += input_tokens
+        self.stats.output_tokens += output_tokens
+        self.stats.cache_write_tokens += cache_write
+        self.stats.cache_read_tokens += cache_read
+        if budget:
+            # cache reads do not count toward the input-tokens-per-minute limit
+            budget.settle(reserved, input_tokens + cache_write + output_tokens)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters (+ prefix cache hit rate over prompt tokens)"""
+        stats = self.stats.to_dict()
+        prompt_tokens = self.stats.input_tokens + self.stats.cache_read_tokens + self.stats.cache_write_tokens
+        stats["prefix_cache_rate"] = self.stats.cache_read_tokens / prompt_tokens if prompt_tokens else 0.0
+        return stats
+
+
+# ============================================================================
+# Shared gateways
+# ============================================================================
+
+_gateways: Dict[Optional[str], LLMGateway] = {}
+
+
+def get_llm_gateway(api_key: Optional[str] = None, **kwargs) -> LLMGateway:
+    """
+    Process-wide gateway per API key (rate limits are per key/organisation).
+
+    Limits come from LLM_MAX_CONCURRENCY / LLM_TOKENS_PER_MINUTE when not given.
+    """
+    api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+    gateway = _gateways.get(api_key)
+    if gateway is None:
+        kwargs.setdefault("max_concurrency", int(os.getenv("LLM_MAX_CONCURRENCY", "8")))
+        tpm = os.getenv("LLM_TOKENS_PER_MINUTE")
+        if tpm:
+            kwargs.setdefault("tokens_per_minute", int(tpm))
+        gateway = _gateways[api_key] = LLMGateway(AnthropicBackend(api_key), **kwargs)
+    return gateway
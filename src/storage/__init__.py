@@ -2,12 +2,13 @@
 Storage 모듈
 
 TradingView 전략 데이터 저장 및 관리
-- SQLite 데이터베이스 (aiosqlite)
+- SQLite 데이터베이스 (공유 연결 풀, WAL)
 - Pydantic 데이터 모델
 - JSON/CSV 내보내기
 """
 
 from .database import StrategyDatabase
+from .pool import ConnectionPool, get_pool, close_pools
 from .models import (
     StrategyModel,
     AnalysisResultModel,
@@ -19,6 +20,9 @@ from .exporter import DataExporter
 
 __all__ = [
     "StrategyDatabase",
+    "ConnectionPool",
+    "get_pool",
+    "close_pools",
     "StrategyModel",
     "AnalysisResultModel",
     "ConvertedStrategyModel",
@@ -1,14 +1,18 @@
 """
 SQLite 비동기 데이터베이스 관리
 
-aiosqlite를 사용한 전략 데이터 저장 및 조회
+공유 연결 풀(ConnectionPool)을 사용한 전략 데이터 저장 및 조회
+- 같은 DB 파일을 쓰는 API 서버와 연결 풀을 공유
+- 쿼리는 풀의 스레드에서 실행되어 이벤트 루프를 막지 않음
 """
 
+import hashlib
 import json
 import logging
+import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from dataclasses import asdict, is_dataclass
 
 
@@ -22,11 +26,9 @@ def json_serializer(obj):
         return obj.__dict__
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
-if TYPE_CHECKING:
-    from typing import Any
-
-import aiosqlite
-
+from .pool import ConnectionPool, get_pool
+from .schema import ensure_schema, rebuild_search_index
+from .search import match_filter, search_strategies as fts_search
 from .models import (
     StrategyModel,
     AnalysisResultModel,
@@ -48,6 +50,7 @@ class StrategyDatabase:
     def __init__(self, db_path: str = "data/strategies.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool: ConnectionPool = get_pool(self.db_path)
 
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
@@ -59,51 +62,66 @@ class StrategyDatabase:
         pass
 
     async def init_db(self):
-        """데이터베이스 초기화 및 테이블 생성"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS strategies (
-                    script_id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    author TEXT NOT NULL,
-                    likes INTEGER DEFAULT 0,
-                    views INTEGER DEFAULT 0,
-
-                    -- Pine Script
-                    pine_code TEXT,
-                    pine_version INTEGER DEFAULT 5,
-
-                    -- 성과 및 분석 (JSON)
-                    performance_json TEXT,
-                    analysis_json TEXT,
-
-                    -- 메타데이터
-                    script_url TEXT,
-                    description TEXT,
-                    is_open_source BOOLEAN DEFAULT 0,
-                    category TEXT DEFAULT 'strategy',
-
-                    -- 타임스탬프
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
+        """데이터베이스 초기화 및 테이블 생성 (구체화 컬럼 마이그레이션 포함)"""
+        await self.pool.run_write(ensure_schema)
+        logger.info(f"Database initialized: {self.db_path}")
+
+    UPSERT_SQL = """
+        INSERT INTO strategies (
+            script_id, title, author, likes, views,
+            pine_code, pine_version,
+            performance_json, analysis_json,
+            script_url, description, is_open_source, category,
+            created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(script_id) DO UPDATE SET
+            title = excluded.title,
+            author = excluded.author,
+            likes = excluded.likes,
+            views = excluded.views,
+            pine_code = COALESCE(excluded.pine_code, pine_code),
+            pine_version = excluded.pine_version,
+            performance_json = COALESCE(excluded.performance_json, performance_json),
+            analysis_json = COALESCE(excluded.analysis_json, analysis_json),
+            script_url = excluded.script_url,
+            description = excluded.description,
+            is_open_source = excluded.is_open_source,
+            category = excluded.category,
+            updated_at = excluded.updated_at
+    """
 
-            # 인덱스 생성
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_likes ON strategies(likes DESC)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_author ON strategies(author)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_created_at ON strategies(created_at DESC)"
-            )
+    @staticmethod
+    def _upsert_params(strategy: Dict[str, Any]) -> tuple:
+        """upsert_strategy 딕셔너리 -> UPSERT_SQL 파라미터"""
+        # performance와 analysis를 JSON 문자열로 변환
+        performance_json = (
+            json.dumps(strategy.get("performance"), ensure_ascii=False, default=json_serializer)
+            if strategy.get("performance")
+            else None
+        )
+        analysis_json = (
+            json.dumps(strategy.get("analysis"), ensure_ascii=False, default=json_serializer)
+            if strategy.get("analysis")
+            else None
+        )
 
-            await db.commit()
-            logger.info(f"Database initialized: {self.db_path}")
+        return (
+            strategy["script_id"],
+            strategy["title"],
+            strategy["author"],
+            strategy.get("likes", 0),
+            strategy.get("views", 0),
+            strategy.get("pine_code"),
+            strategy.get("pine_version", 5),
+            performance_json,
+            analysis_json,
+            strategy.get("script_url", ""),
+            strategy.get("description", ""),
+            strategy.get("is_open_source", False),
+            strategy.get("category", "strategy"),
+            strategy.get("created_at", datetime.now().isoformat()),
+            datetime.now().isoformat(),
+        )
 
     async def upsert_strategy(self, strategy: Dict[str, Any]) -> bool:
         """
@@ -116,70 +134,60 @@ class StrategyDatabase:
             성공 여부
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # performance와 analysis를 JSON 문자열로 변환
-                performance_json = (
-                    json.dumps(strategy.get("performance"), ensure_ascii=False, default=json_serializer)
-                    if strategy.get("performance")
-                    else None
-                )
-                analysis_json = (
-                    json.dumps(strategy.get("analysis"), ensure_ascii=False, default=json_serializer)
-                    if strategy.get("analysis")
-                    else None
-                )
+            await self.pool.execute(self.UPSERT_SQL, self._upsert_params(strategy))
 
-                await db.execute(
-                    """
-                    INSERT INTO strategies (
-                        script_id, title, author, likes, views,
-                        pine_code, pine_version,
-                        performance_json, analysis_json,
-                        script_url, description, is_open_source, category,
-                        created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(script_id) DO UPDATE SET
-                        title = excluded.title,
-                        author = excluded.author,
-                        likes = excluded.likes,
-                        views = excluded.views,
-                        pine_code = COALESCE(excluded.pine_code, pine_code),
-                        pine_version = excluded.pine_version,
-                        performance_json = COALESCE(excluded.performance_json, performance_json),
-                        analysis_json = COALESCE(excluded.analysis_json, analysis_json),
-                        script_url = excluded.script_url,
-                        description = excluded.description,
-                        is_open_source = excluded.is_open_source,
-                        category = excluded.category,
-                        updated_at = excluded.updated_at
-                    """,
-                    (
-                        strategy["script_id"],
-                        strategy["title"],
-                        strategy["author"],
-                        strategy.get("likes", 0),
-                        strategy.get("views", 0),
-                        strategy.get("pine_code"),
-                        strategy.get("pine_version", 5),
-                        performance_json,
-                        analysis_json,
-                        strategy.get("script_url", ""),
-                        strategy.get("description", ""),
-                        strategy.get("is_open_source", False),
-                        strategy.get("category", "strategy"),
-                        strategy.get("created_at", datetime.now().isoformat()),
-                        datetime.now().isoformat(),
-                    ),
-                )
-
-                await db.commit()
-                logger.debug(f"Upserted strategy: {strategy['script_id']}")
-                return True
+            logger.debug(f"Upserted strategy: {strategy['script_id']}")
+            return True
 
         except Exception as e:
             logger.error(f"Error upserting strategy {strategy.get('script_id')}: {e}")
             return False
 
+    async def write_batch(
+        self,
+        strategies: Sequence[Dict[str, Any]] = (),
+        backtest_results: Sequence[Tuple[str, Dict[str, Any]]] = ()
+    ) -> int:
+        """
+        전략 upsert + 백테스트 결과 병합을 한 트랜잭션으로 기록
+
+        upsert가 analysis_json을 통째로 바꾸므로 upsert를 먼저 적용한 뒤
+        backtest_result를 analysis_json에 병합합니다 (같은 배치 안의 같은 전략 포함).
+
+        Args:
+            strategies: upsert_strategy와 같은 형식의 딕셔너리 목록
+            backtest_results: (script_id, 결과) 목록
+
+        Returns:
+            기록한 항목 수 (실패 시 예외 - 배치 전체 롤백)
+        """
+        params = [self._upsert_params(s) for s in strategies]
+        now = datetime.now().isoformat()
+
+        def write(db: sqlite3.Connection) -> int:
+            if params:
+                db.executemany(self.UPSERT_SQL, params)
+            for script_id, result in backtest_results:
+                row = db.execute(
+                    "SELECT analysis_json FROM strategies WHERE script_id = ?", (script_id,)
+                ).fetchone()
+                analysis = {}
+                if row and row[0]:
+                    try:
+                        analysis = json.loads(row[0])
+                    except Exception:
+                        pass
+                analysis["backtest_result"] = result
+                db.execute(
+                    "UPDATE strategies SET analysis_json = ?, updated_at = ? WHERE script_id = ?",
+                    (json.dumps(analysis, ensure_ascii=False, default=json_serializer), now, script_id)
+                )
+            return len(params) + len(backtest_results)
+
+        written = await self.pool.run_write(write)
+        logger.debug(f"Wrote batch: {len(params)} strategies, {len(backtest_results)} backtest results")
+        return written
+
     async def save_analysis(self, script_id: str, analysis: Dict[str, Any]) -> bool:
         """
         분석 결과 저장
@@ -192,21 +200,19 @@ class StrategyDatabase:
             성공 여부
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                analysis_json = json.dumps(analysis, ensure_ascii=False, default=json_serializer)
-
-                await db.execute(
-                    """
-                    UPDATE strategies
-                    SET analysis_json = ?, updated_at = ?
-                    WHERE script_id = ?
-                    """,
-                    (analysis_json, datetime.now().isoformat(), script_id),
-                )
+            analysis_json = json.dumps(analysis, ensure_ascii=False, default=json_serializer)
+
+            await self.pool.execute(
+                """
+                UPDATE strategies
+                SET analysis_json = ?, updated_at = ?
+                WHERE script_id = ?
+                """,
+                (analysis_json, datetime.now().isoformat(), script_id),
+            )
 
-                await db.commit()
-                logger.debug(f"Saved analysis for: {script_id}")
-                return True
+            logger.debug(f"Saved analysis for: {script_id}")
+            return True
 
         except Exception as e:
             logger.error(f"Error saving analysis for {script_id}: {e}")
@@ -223,18 +229,14 @@ class StrategyDatabase:
             StrategyModel 또는 None
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-
-                async with db.execute(
-                    "SELECT * FROM strategies WHERE script_id = ?", (script_id,)
-                ) as cursor:
-                    row = await cursor.fetchone()
+            row = await self.pool.fetchone(
+                "SELECT * FROM strategies WHERE script_id = ?", (script_id,)
+            )
 
-                    if not row:
-                        return None
+            if not row:
+                return None
 
-                    return self._row_to_model(row)
+            return self._row_to_model(row)
 
         except Exception as e:
             logger.error(f"Error getting strategy {script_id}: {e}")
@@ -256,110 +258,123 @@ class StrategyDatabase:
             filters = SearchFilters()
 
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-
-                # 쿼리 빌드
-                query = "SELECT * FROM strategies WHERE 1=1"
-                params = []
-
-                # 좋아요 필터
-                if filters.min_likes is not None:
-                    query += " AND likes >= ?"
-                    params.append(filters.min_likes)
-
-                if filters.max_likes is not None:
-                    query += " AND likes <= ?"
-                    params.append(filters.max_likes)
-
-                # Pine 코드 존재 여부
-                if filters.has_pine_code is not None:
-                    if filters.has_pine_code:
-                        query += " AND pine_code IS NOT NULL AND pine_code != ''"
-                    else:
-                        query += " AND (pine_code IS NULL OR pine_code = '')"
-
-                # 분석 완료 여부
-                if filters.has_analysis is not None:
-                    if filters.has_analysis:
-                        query += " AND analysis_json IS NOT NULL"
-                    else:
-                        query += " AND analysis_json IS NULL"
-
-                # 작성자 필터
-                if filters.author:
-                    query += " AND author = ?"
-                    params.append(filters.author)
-
-                # 키워드 검색
-                if filters.keywords:
-                    keyword_conditions = []
-                    for keyword in filters.keywords:
-                        keyword_conditions.append(
-                            "(title LIKE ? OR description LIKE ?)"
-                        )
-                        params.append(f"%{keyword}%")
-                        params.append(f"%{keyword}%")
-                    query += f" AND ({' OR '.join(keyword_conditions)})"
-
-                # 정렬
-                order_by_map = {
-                    "likes": "likes",
-                    "score": "likes",  # score는 analysis_json 파싱 필요, 임시로 likes
-                    "created_at": "created_at",
-                }
-                order_col = order_by_map.get(filters.order_by, "likes")
-                order_dir = "DESC" if filters.order_desc else "ASC"
-                query += f" ORDER BY {order_col} {order_dir}"
-
-                # 페이징
-                query += " LIMIT ? OFFSET ?"
-                params.append(filters.limit)
-                params.append(filters.offset)
-
-                # 실행
-                async with db.execute(query, params) as cursor:
-                    rows = await cursor.fetchall()
-
-                    results = []
-                    for row in rows:
-                        model = self._row_to_model(row)
-
-                        # 추가 필터 (분석 결과 기반)
-                        if filters.min_score or filters.max_score or filters.grade or filters.status:
-                            if not model.analysis:
-                                continue
-
-                            analysis = model.analysis
-
-                            # 점수 필터
-                            total_score = analysis.get("total_score", 0)
-                            if filters.min_score and total_score < filters.min_score:
-                                continue
-                            if filters.max_score and total_score > filters.max_score:
-                                continue
-
-                            # 등급 필터
-                            if filters.grade:
-                                grade = analysis.get("grade", "")
-                                if grade not in filters.grade:
-                                    continue
-
-                            # 상태 필터
-                            if filters.status:
-                                status = analysis.get("status", "")
-                                if status not in filters.status:
-                                    continue
-
-                        results.append(model)
-
-                    logger.debug(f"Search returned {len(results)} strategies")
-                    return results
+            results = await self.pool.run_read(self._search, filters)
+            logger.debug(f"Search returned {len(results)} strategies")
+            return results
 
         except Exception as e:
             logger.error(f"Error searching strategies: {e}")
             return []
 
+    def _search(self, db: sqlite3.Connection, filters: SearchFilters) -> List[StrategyModel]:
+        """검색 쿼리 빌드 및 실행 (풀의 읽기 연결 스레드에서 실행)"""
+        # 쿼리 빌드
+        query = "SELECT * FROM strategies WHERE 1=1"
+        params = []
+
+        # 좋아요 필터
+        if filters.min_likes is not None:
+            query += " AND likes >= ?"
+            params.append(filters.min_likes)
+
+        if filters.max_likes is not None:
+            query += " AND likes <= ?"
+            params.append(filters.max_likes)
+
+        # Pine 코드 존재 여부
+        if filters.has_pine_code is not None:
+            if filters.has_pine_code:
+                query += " AND pine_code IS NOT NULL AND pine_code != ''"
+            else:
+                query += " AND (pine_code IS NULL OR pine_code = '')"
+
+        # 분석 완료 여부
+        if filters.has_analysis is not None:
+            if filters.has_analysis:
+                query += " AND analysis_json IS NOT NULL"
+            else:
+                query += " AND analysis_json IS NULL"
+
+        # 작성자 필터
+        if filters.author:
+            query += " AND author = ?"
+            params.append(filters.author)
+
+        # 키워드 검색 (전문 검색 인덱스, 키워드 중 하나라도 포함)
+        if filters.keywords:
+            where, where_params = match_filter(
+                db, " ".join(filters.keywords), ("title", "description"), any_term=True
+            )
+            query += where
+            params.extend(where_params)
+
+        # 분석 결과 필터 (구체화 컬럼)
+        if filters.min_score or filters.max_score or filters.grade or filters.status:
+            query += " AND analysis_json IS NOT NULL"
+
+        if filters.min_score:
+            query += " AND total_score >= ?"
+            params.append(filters.min_score)
+
+        if filters.max_score:
+            query += " AND COALESCE(total_score, 0) <= ?"
+            params.append(filters.max_score)
+
+        if filters.grade:
+            query += f" AND grade IN ({','.join('?' * len(filters.grade))})"
+            params.extend(filters.grade)
+
+        if filters.status:
+            query += f" AND status IN ({','.join('?' * len(filters.status))})"
+            params.extend(filters.status)
+
+        # 정렬
+        order_by_map = {
+            "likes": "likes",
+            "score": "total_score",
+            "created_at": "created_at",
+        }
+        order_col = order_by_map.get(filters.order_by, "likes")
+        order_dir = "DESC" if filters.order_desc else "ASC"
+        query += f" ORDER BY {order_col} {order_dir}"
+
+        # 페이징
+        query += " LIMIT ? OFFSET ?"
+        params.append(filters.limit)
+        params.append(filters.offset)
+
+        return [self._row_to_model(row) for row in db.execute(query, params)]
+
+    async def full_text_search(
+        self,
+        text: str,
+        limit: int = 20,
+        offset: int = 0,
+        include_code: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        BM25 순위 전문 검색 (제목, 작성자, 설명, 선택적으로 Pine 코드)
+
+        Args:
+            text: 검색어 (토큰별 접두어 검색)
+            limit: 최대 결과 수
+            offset: 오프셋
+            include_code: Pine 코드 식별자까지 검색
+
+        Returns:
+            script_id, title, author, likes, total_score, grade, rank, snippet 딕셔너리 리스트
+        """
+        try:
+            return await self.pool.run_read(fts_search, text, limit, offset, include_code)
+
+        except Exception as e:
+            logger.error(f"Error in full-text search: {e}")
+            return []
+
+    async def rebuild_search_index(self):
+        """전문 검색 인덱스 재생성 (VACUUM 후 또는 인덱스 손상 시)"""
+        await self.pool.run_write(rebuild_search_index)
+
     async def get_stats(self) -> DatabaseStats:
         """
         데이터베이스 통계 조회
@@ -368,107 +383,106 @@ class StrategyDatabase:
             DatabaseStats
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-
-                # 기본 통계
-                async with db.execute(
-                    """
-                    SELECT
-                        COUNT(*) as total,
-                        SUM(CASE WHEN pine_code IS NOT NULL AND pine_code != '' THEN 1 ELSE 0 END) as with_code,
-                        SUM(CASE WHEN is_open_source = 1 THEN 1 ELSE 0 END) as open_source,
-                        SUM(CASE WHEN analysis_json IS NOT NULL THEN 1 ELSE 0 END) as analyzed,
-                        AVG(likes) as avg_likes
-                    FROM strategies
-                    """
-                ) as cursor:
-                    row = await cursor.fetchone()
-
-                    total = row["total"] or 0
-                    with_code = row["with_code"] or 0
-                    open_source = row["open_source"] or 0
-                    analyzed = row["analyzed"] or 0
-                    avg_likes = row["avg_likes"] or 0
-
-                # 분석 상태 통계
-                passed = 0
-                review = 0
-                rejected = 0
-                grade_dist = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
-                total_score_sum = 0
-                score_count = 0
-                top_strategy = None
-                top_score = 0
-
-                async with db.execute(
-                    "SELECT script_id, title, author, likes, analysis_json FROM strategies WHERE analysis_json IS NOT NULL"
-                ) as cursor:
-                    async for row in cursor:
-                        try:
-                            analysis = json.loads(row["analysis_json"])
-
-                            # 상태 카운트
-                            status = analysis.get("status", "")
-                            if status == "passed":
-                                passed += 1
-                            elif status == "review":
-                                review += 1
-                            elif status == "rejected":
-                                rejected += 1
-
-                            # 등급 분포
-                            grade = analysis.get("grade", "F")
-                            if grade in grade_dist:
-                                grade_dist[grade] += 1
-
-                            # 점수 평균
-                            total_score = analysis.get("total_score", 0)
-                            total_score_sum += total_score
-                            score_count += 1
-
-                            # 최고 점수 전략
-                            if total_score > top_score:
-                                top_score = total_score
-                                top_strategy = {
-                                    "script_id": row["script_id"],
-                                    "title": row["title"],
-                                    "author": row["author"],
-                                    "likes": row["likes"],
-                                    "score": total_score,
-                                    "grade": grade,
-                                }
-
-                        except Exception:
-                            continue
-
-                avg_score = total_score_sum / score_count if score_count > 0 else 0
-
-                return DatabaseStats(
-                    total_strategies=total,
-                    with_pine_code=with_code,
-                    open_source_count=open_source,
-                    analyzed_count=analyzed,
-                    passed_count=passed,
-                    review_count=review,
-                    rejected_count=rejected,
-                    grade_distribution=grade_dist,
-                    avg_likes=round(avg_likes, 1),
-                    avg_score=round(avg_score, 1),
-                    top_strategy=top_strategy,
-                    generated_at=datetime.now(),
-                )
+            return await self.pool.run_read(self._compute_stats)
 
         except Exception as e:
             logger.error(f"Error getting stats: {e}")
             return DatabaseStats()
 
-    def _row_to_model(self, row: aiosqlite.Row) -> StrategyModel:
+    def _compute_stats(self, db: sqlite3.Connection) -> DatabaseStats:
+        """통계 계산 (풀의 읽기 연결 스레드에서 실행)"""
+        # 기본 통계
+        row = db.execute(
+            """
+            SELECT
+                COUNT(*) as total,
+                SUM(CASE WHEN pine_code IS NOT NULL AND pine_code != '' THEN 1 ELSE 0 END) as with_code,
+                SUM(CASE WHEN is_open_source = 1 THEN 1 ELSE 0 END) as open_source,
+                SUM(CASE WHEN analysis_json IS NOT NULL THEN 1 ELSE 0 END) as analyzed,
+                AVG(likes) as avg_likes
+            FROM strategies
+            """
+        ).fetchone()
+
+        total = row["total"] or 0
+        with_code = row["with_code"] or 0
+        open_source = row["open_source"] or 0
+        analyzed = row["analyzed"] or 0
+        avg_likes = row["avg_likes"] or 0
+
+        # 분석 상태 / 점수 통계 (구체화 컬럼)
+        row = db.execute(
+            """
+            SELECT
+                SUM(CASE WHEN status = 'passed' THEN 1 ELSE 0 END) as passed,
+                SUM(CASE WHEN status = 'review' THEN 1 ELSE 0 END) as review,
+                SUM(CASE WHEN status = 'rejected' THEN 1 ELSE 0 END) as rejected,
+                AVG(COALESCE(total_score, 0)) as avg_score
+            FROM strategies
+            WHERE analysis_json IS NOT NULL
+            """
+        ).fetchone()
+
+        passed = row["passed"] or 0
+        review = row["review"] or 0
+        rejected = row["rejected"] or 0
+        avg_score = row["avg_score"] or 0
+
+        # 등급 분포 (등급 없는 분석은 F)
+        grade_dist = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
+        for grade, count in db.execute(
+            """
+            SELECT COALESCE(grade, 'F'), COUNT(*)
+            FROM strategies
+            WHERE analysis_json IS NOT NULL
+            GROUP BY 1
+            """
+        ):
+            if grade in grade_dist:
+                grade_dist[grade] += count
+
+        # 최고 점수 전략
+        top_strategy = None
+        top = db.execute(
+            """
+            SELECT script_id, title, author, likes, total_score, COALESCE(grade, 'F') as grade
+            FROM strategies
+            WHERE total_score > 0 AND analysis_json IS NOT NULL
+            ORDER BY total_score DESC, rowid
+            LIMIT 1
+            """
+        ).fetchone()
+        if top:
+            top_strategy = {
+                "script_id": top["script_id"],
+                "title": top["title"],
+                "author": top["author"],
+                "likes": top["likes"],
+                "score": top["total_score"],
+                "grade": top["grade"],
+            }
+
+        return DatabaseStats(
+            total_strategies=total,
+            with_pine_code=with_code,
+            open_source_count=open_source,
+            analyzed_count=analyzed,
+            passed_count=passed,
+            review_count=review,
+            rejected_count=rejected,
+            grade_distribution=grade_dist,
+            avg_likes=round(avg_likes, 1),
+            avg_score=round(avg_score, 1),
+            top_strategy=top_strategy,
+            generated_at=datetime.now(),
+        )
+
+    def _row_to_model(self, row: sqlite3.Row) -> StrategyModel:
         """
         DB Row를 StrategyModel로 변환
 
         Args:
-            row: aiosqlite Row
+            row: sqlite3 Row
 
         Returns:
             StrategyModel
@@ -521,13 +535,11 @@ class StrategyDatabase:
             성공 여부
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    "DELETE FROM strategies WHERE script_id = ?", (script_id,)
-                )
-                await db.commit()
-                logger.info(f"Deleted strategy: {script_id}")
-                return True
+            await self.pool.execute(
+                "DELETE FROM strategies WHERE script_id = ?", (script_id,)
+            )
+            logger.info(f"Deleted strategy: {script_id}")
+            return True
 
         except Exception as e:
             logger.error(f"Error deleting strategy {script_id}: {e}")
@@ -541,15 +553,95 @@ class StrategyDatabase:
             스크립트 ID 리스트
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute("SELECT script_id FROM strategies") as cursor:
-                    rows = await cursor.fetchall()
-                    return [row[0] for row in rows]
+            rows = await self.pool.fetchall("SELECT script_id FROM strategies")
+            return [row[0] for row in rows]
 
         except Exception as e:
             logger.error(f"Error getting all script IDs: {e}")
             return []
 
+    async def get_code_hashes(self, script_ids: List[str]) -> Dict[str, str]:
+        """
+        저장된 Pine 코드의 SHA-256 해시 조회 (코드가 있는 전략만)
+
+        Args:
+            script_ids: 스크립트 ID 리스트
+
+        Returns:
+            script_id -> 코드 해시 (collector.pine_fetcher.pine_code_hash와 동일)
+        """
+        if not script_ids:
+            return {}
+
+        def query(db: sqlite3.Connection) -> Dict[str, str]:
+            hashes = {}
+            # SQLite 바인딩 변수 제한을 피해 나눠서 조회
+            for start in range(0, len(script_ids), 500):
+                chunk = script_ids[start:start + 500]
+                rows = db.execute(
+                    f"SELECT script_id, pine_code FROM strategies "
+                    f"WHERE script_id IN ({','.join('?' * len(chunk))}) "
+                    f"AND pine_code IS NOT NULL AND pine_code != ''",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    hashes[row[0]] = hashlib.sha256(row[1].encode("utf-8")).hexdigest()
+            return hashes
+
+        try:
+            return await self.pool.run_read(query)
+
+        except Exception as e:
+            logger.error(f"Error getting code hashes: {e}")
+            return {}
+
+    async def get_stored_code(self, script_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        저장된 Pine 코드와 분석/백테스트 완료 여부 조회 (코드가 있는 전략만)
+
+        코드가 바뀌지 않은 전략(페이지의 코드 해시가 같음)을 다시 추출/분석하지 않고 저장/처리할 때 사용합니다.
+
+        Args:
+            script_ids: 스크립트 ID 리스트
+
+        Returns:
+            script_id -> {"pine_code", "pine_version", "analyzed", "backtested"}
+        """
+        if not script_ids:
+            return {}
+
+        def query(db: sqlite3.Connection) -> Dict[str, Dict[str, Any]]:
+            stored = {}
+            for start in range(0, len(script_ids), 500):
+                chunk = script_ids[start:start + 500]
+                rows = db.execute(
+                    f"SELECT script_id, pine_code, pine_version, analysis_json FROM strategies "
+                    f"WHERE script_id IN ({','.join('?' * len(chunk))}) "
+                    f"AND pine_code IS NOT NULL AND pine_code != ''",
+                    chunk,
+                ).fetchall()
+                for script_id, pine_code, pine_version, analysis_json in rows:
+                    analysis = {}
+                    if analysis_json:
+                        try:
+                            analysis = json.loads(analysis_json)
+                        except Exception:
+                            pass
+                    stored[script_id] = {
+                        "pine_code": pine_code,
+                        "pine_version": pine_version or 5,
+                        "analyzed": bool(analysis.get("grade")),
+                        "backtested": bool(analysis.get("backtest_result")),
+                    }
+            return stored
+
+        try:
+            return await self.pool.run_read(query)
+
+        except Exception as e:
+            logger.error(f"Error getting stored code: {e}")
+            return {}
+
     async def save_strategy(
         self,
         meta: Any,
@@ -614,46 +706,45 @@ class StrategyDatabase:
         Returns:
             성공 여부
         """
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # analysis_json에 converted_path 추가
-                async with db.execute(
-                    "SELECT analysis_json FROM strategies WHERE script_id = ?",
-                    (script_id,)
-                ) as cursor:
-                    row = await cursor.fetchone()
-
-                    analysis = {}
-                    if row and row[0]:
-                        try:
-                            analysis = json.loads(row[0])
-                        except Exception:
-                            pass
-
-                    analysis["converted_path"] = converted_path
-                    analysis["converted_at"] = datetime.now().isoformat()
-
-                await db.execute(
-                    """
-                    UPDATE strategies
-                    SET analysis_json = ?, updated_at = ?
-                    WHERE script_id = ?
-                    """,
-                    (json.dumps(analysis, ensure_ascii=False, default=json_serializer),
-                     datetime.now().isoformat(),
-                     script_id)
-                )
+        def update(db: sqlite3.Connection):
+            # analysis_json에 converted_path 추가 (읽기-수정-쓰기를 한 트랜잭션에서)
+            row = db.execute(
+                "SELECT analysis_json FROM strategies WHERE script_id = ?",
+                (script_id,)
+            ).fetchone()
+
+            analysis = {}
+            if row and row[0]:
+                try:
+                    analysis = json.loads(row[0])
+                except Exception:
+                    pass
+
+            analysis["converted_path"] = converted_path
+            analysis["converted_at"] = datetime.now().isoformat()
+
+            db.execute(
+                """
+                UPDATE strategies
+                SET analysis_json = ?, updated_at = ?
+                WHERE script_id = ?
+                """,
+                (json.dumps(analysis, ensure_ascii=False, default=json_serializer),
+                 datetime.now().isoformat(),
+                 script_id)
+            )
 
-                await db.commit()
-                logger.debug(f"Updated converted path for: {script_id}")
-                return True
+        try:
+            await self.pool.run_write(update)
+            logger.debug(f"Updated converted path for: {script_id}")
+            return True
 
         except Exception as e:
             logger.error(f"Error updating converted path for {script_id}: {e}")
             return False
 
     async def close(self):
-        """데이터베이스 연결 정리 (placeholder)"""
-        # aiosqlite는 각 작업마다 연결을 열고 닫으므로
-        # 별도의 close 작업이 필요 없음
+        """데이터베이스 연결 정리"""
+        # 연결 풀은 같은 DB를 쓰는 다른 인스턴스(API 서버 등)와 공유되므로
+        # 여기서 닫지 않음 - 프로세스 종료 시 close_pools()로 정리
         pass
@@ -0,0 +1,225 @@
+"""
+SQLite 연결 풀
+
+API 서버와 StrategyDatabase가 공유하는 데이터 접근 계층
+- WAL 모드: 읽기와 쓰기가 서로를 막지 않음
+- 영구 연결: 연결별 statement 캐시로 같은 SQL은 한 번만 prepare
+- 읽기 연결 N개 + 쓰기 연결 1개 (SQLite는 writer가 하나)
+- 비동기 API는 전용 스레드 풀에서 실행하여 이벤트 루프를 막지 않음
+"""
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ConnectionPool:
+    """
+    SQLite 연결 풀
+
+    사용 예:
+        pool = get_pool("data/strategies.db")
+        rows = await pool.fetchall("SELECT * FROM strategies WHERE likes > ?", (100,))
+        await pool.execute("UPDATE strategies SET likes = ? WHERE script_id = ?", (1, "abc"))
+
+        # 여러 쿼리를 한 연결에서 실행
+        def load(conn):
+            ...
+        result = await pool.run_read(load)
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        readers: int = 4,
+        busy_timeout: float = 5.0,
+        cached_statements: int = 256,
+    ):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            readers: 최대 읽기 연결 수
+            busy_timeout: 잠금 대기 시간 (초)
+            cached_statements: 연결별 prepared statement 캐시 크기
+        """
+        self.db_path = Path(db_path)
+        self.readers = readers
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all_readers: List[sqlite3.Connection] = []
+        self._reader_lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=readers + 1, thread_name_prefix="sqlite-pool"
+        )
+        self._closed = False
+
+    # ============================================================
+    # 연결 관리
+    # ============================================================
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.busy_timeout,
+            check_same_thread=False,  # 풀이 한 번에 한 스레드만 사용하도록 보장
+            cached_statements=self.cached_statements,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._reader_lock:
+            if len(self._all_readers) < self.readers:
+                conn = self._connect(read_only=True)
+                self._all_readers.append(conn)
+                return conn
+
+        return self._idle.get()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """읽기 전용 연결 대여 (동기)"""
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 연결 대여 (동기) - 블록이 끝나면 commit, 예외 시 rollback"""
+        with self._write_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool is closed")
+            if self._writer is None:
+                self._writer = self._connect(read_only=False)
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    # ============================================================
+    # 비동기 API (전용 스레드 풀에서 실행)
+    # ============================================================
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(*args))
+
+    async def run_read(self, func: Callable[..., T], *args: Any) -> T:
+        """func(conn, *args)를 읽기 연결로 실행"""
+        def job():
+            with self.reader() as conn:
+                return func(conn, *args)
+        return await self._run(job)
+
+    async def run_write(self, func: Callable[..., T], *args: Any) -> T:
+        """func(conn, *args)를 쓰기 연결로 실행 (하나의 트랜잭션)"""
+        def job():
+            with self.writer() as conn:
+                return func(conn, *args)
+        return await self._run(job)
+
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        return await self.run_read(lambda conn: conn.execute(sql, params).fetchall())
+
+    async def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        return await self.run_read(lambda conn: conn.execute(sql, params).fetchone())
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """쓰기 쿼리 실행 후 commit (변경된 행 수 반환)"""
+        return await self.run_write(lambda conn: conn.execute(sql, params).rowcount)
+
+    async def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any]]) -> int:
+        return await self.run_write(lambda conn: conn.executemany(sql, seq_of_params).rowcount)
+
+    async def executescript(self, script: str) -> None:
+        await self.run_write(lambda conn: conn.executescript(script))
+
+    # ============================================================
+    # 종료
+    # ============================================================
+
+    def close(self) -> None:
+        """모든 연결과 스레드 풀 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        with self._reader_lock:
+            for conn in self._all_readers:
+                conn.close()
+            self._all_readers.clear()
+
+        logger.debug(f"Closed connection pool: {self.db_path}")
+
+
+# ============================================================
+# 프로세스 전역 풀 레지스트리
+# ============================================================
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Union[str, Path], **kwargs: Any) -> ConnectionPool:
+    """
+    DB 파일별 공유 연결 풀 반환
+
+    같은 파일을 여는 API 서버와 StrategyDatabase 인스턴스들이
+    하나의 풀(하나의 writer)을 공유합니다.
+    """
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            Path(key).parent.mkdir(parents=True, exist_ok=True)
+            pool = ConnectionPool(key, **kwargs)
+            _pools[key] = pool
+        return pool
+
+
+def close_pools() -> None:
+    """모든 공유 풀 종료 (서버 종료 시)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
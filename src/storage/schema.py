@@ -0,0 +1,201 @@
+"""
+strategies 테이블 스키마 및 마이그레이션
+
+StrategyDatabase와 API 서버가 같은 스키마를 사용하도록 한 곳에서 정의
+- 분석 결과(analysis_json)의 점수/등급/백테스트 지표를 인덱스 컬럼으로 구체화
+- 컬럼은 트리거가 analysis_json 쓰기 시점에 채움 (save_analysis, upsert_strategy,
+  그리고 DB 레이어를 거치지 않는 스크립트의 직접 UPDATE 포함)
+- 제목/작성자/설명/Pine 코드 FTS5 전문 검색 인덱스 (트리거로 동기화)
+- 버전은 PRAGMA user_version으로 관리
+"""
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+
+# 구체화 컬럼 -> (SQL 타입, analysis_json 경로)
+METRIC_COLUMNS = {
+    "total_score": ("REAL", "$.total_score"),
+    "grade": ("TEXT", "$.grade"),
+    "status": ("TEXT", "$.status"),
+    "repainting_score": ("REAL", "$.repainting_score"),
+    "overfitting_score": ("REAL", "$.overfitting_score"),
+    # 백테스트 주요 지표 (StrategyTester가 저장하는 backtest_result.backtest)
+    "backtest_return": ("REAL", "$.backtest_result.backtest.total_return"),
+    "backtest_sharpe": ("REAL", "$.backtest_result.backtest.sharpe_ratio"),
+    "backtest_max_drawdown": ("REAL", "$.backtest_result.backtest.max_drawdown"),
+    "backtest_win_rate": ("REAL", "$.backtest_result.backtest.win_rate"),
+    "backtest_trades": ("INTEGER", "$.backtest_result.backtest.total_trades"),
+}
+
+# 분석 완료 조건 (API 서버 기준)
+ANALYZED_CONDITION = "analysis_json IS NOT NULL AND analysis_json != ''"
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS strategies (
+    script_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    likes INTEGER DEFAULT 0,
+    views INTEGER DEFAULT 0,
+
+    -- Pine Script
+    pine_code TEXT,
+    pine_version INTEGER DEFAULT 5,
+
+    -- 성과 및 분석 (JSON)
+    performance_json TEXT,
+    analysis_json TEXT,
+
+    -- 메타데이터
+    script_url TEXT,
+    description TEXT,
+    is_open_source BOOLEAN DEFAULT 0,
+    category TEXT DEFAULT 'strategy',
+
+    -- 타임스탬프
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 인덱스 생성
+CREATE INDEX IF NOT EXISTS idx_likes ON strategies(likes DESC);
+CREATE INDEX IF NOT EXISTS idx_author ON strategies(author);
+CREATE INDEX IF NOT EXISTS idx_created_at ON strategies(created_at DESC);
+"""
+
+METRIC_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_total_score ON strategies(total_score DESC);
+CREATE INDEX IF NOT EXISTS idx_grade_score ON strategies(grade, total_score DESC);
+CREATE INDEX IF NOT EXISTS idx_status ON strategies(status);
+CREATE INDEX IF NOT EXISTS idx_backtest_return ON strategies(backtest_return DESC);
+"""
+
+
+def _metric_assignments(source: str) -> str:
+    """`col = json_extract(...)` 목록 (잘못된 JSON은 NULL)"""
+    return ",\n    ".join(
+        f"{col} = CASE WHEN json_valid({source}) THEN json_extract({source}, '{path}') END"
+        for col, (_, path) in METRIC_COLUMNS.items()
+    )
+
+
+TRIGGER_SQL = f"""
+CREATE TRIGGER IF NOT EXISTS trg_strategies_metrics_insert
+AFTER INSERT ON strategies
+WHEN NEW.analysis_json IS NOT NULL
+BEGIN
+    UPDATE strategies SET
+    {_metric_assignments("NEW.analysis_json")}
+    WHERE rowid = NEW.rowid;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_strategies_metrics_update
+AFTER UPDATE OF analysis_json ON strategies
+BEGIN
+    UPDATE strategies SET
+    {_metric_assignments("NEW.analysis_json")}
+    WHERE rowid = NEW.rowid;
+END;
+"""
+
+BACKFILL_SQL = f"""
+UPDATE strategies SET
+    {_metric_assignments("analysis_json")}
+WHERE analysis_json IS NOT NULL
+"""
+
+
+# 전문 검색 인덱스 (strategies를 content 테이블로 사용하여 텍스트 중복 저장 없음)
+# - tokenchars '_': Pine 식별자(fast_ma 등)를 하나의 토큰으로 유지
+# - prefix='2 3': 2~3글자 접두어 검색용 인덱스
+FTS_TABLE = "strategies_fts"
+FTS_COLUMNS = ("title", "author", "description", "pine_code")
+
+FTS_SQL = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+    {", ".join(FTS_COLUMNS)},
+    content='strategies',
+    content_rowid='rowid',
+    tokenize="unicode61 remove_diacritics 2 tokenchars '_'",
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_strategies_fts_insert
+AFTER INSERT ON strategies
+BEGIN
+    INSERT INTO {FTS_TABLE}(rowid, {", ".join(FTS_COLUMNS)})
+    VALUES (NEW.rowid, {", ".join("NEW." + c for c in FTS_COLUMNS)});
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_strategies_fts_delete
+AFTER DELETE ON strategies
+BEGIN
+    INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {", ".join(FTS_COLUMNS)})
+    VALUES ('delete', OLD.rowid, {", ".join("OLD." + c for c in FTS_COLUMNS)});
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_strategies_fts_update
+AFTER UPDATE OF {", ".join(FTS_COLUMNS)} ON strategies
+WHEN {" OR ".join(f"OLD.{c} IS NOT NEW.{c}" for c in FTS_COLUMNS)}
+BEGIN
+    INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {", ".join(FTS_COLUMNS)})
+    VALUES ('delete', OLD.rowid, {", ".join("OLD." + c for c in FTS_COLUMNS)});
+    INSERT INTO {FTS_TABLE}(rowid, {", ".join(FTS_COLUMNS)})
+    VALUES (NEW.rowid, {", ".join("NEW." + c for c in FTS_COLUMNS)});
+END;
+"""
+
+
+def fts_available(conn: sqlite3.Connection) -> bool:
+    """전문 검색 인덱스 존재 여부 (SQLite가 FTS5 없이 빌드된 경우 False)"""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)
+    ).fetchone() is not None
+
+
+def rebuild_search_index(conn: sqlite3.Connection) -> None:
+    """
+    전문 검색 인덱스를 strategies에서 다시 생성
+
+    인덱스는 rowid로 연결되므로 VACUUM 후에도 실행합니다.
+    """
+    if fts_available(conn):
+        conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    테이블/인덱스/트리거 생성 및 마이그레이션 (쓰기 연결에서 호출)
+
+    기존 DB는 구체화 컬럼을 추가한 뒤 analysis_json에서 한 번 백필하고,
+    전문 검색 인덱스를 한 번 생성합니다.
+    """
+    conn.executescript(CREATE_TABLE_SQL)
+
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(strategies)")}
+    for col, (sql_type, _) in METRIC_COLUMNS.items():
+        if col not in existing:
+            conn.execute(f"ALTER TABLE strategies ADD COLUMN {col} {sql_type}")
+
+    conn.executescript(METRIC_INDEX_SQL)
+    conn.executescript(TRIGGER_SQL)
+
+    try:
+        conn.executescript(FTS_SQL)
+    except sqlite3.OperationalError as e:
+        # FTS5가 없는 SQLite 빌드 - 검색은 LIKE로 대체
+        logger.warning(f"Full-text search disabled: {e}")
+
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < 1:
+        updated = conn.execute(BACKFILL_SQL).rowcount
+        logger.info(f"Backfilled metric columns for {updated} strategies")
+    if version < 2:
+        rebuild_search_index(conn)
+        logger.info("Built full-text search index")
+    if version < SCHEMA_VERSION:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
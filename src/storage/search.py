@@ -0,0 +1,207 @@
+"""
+전략 전문 검색 (FTS5)
+
+strategies_fts 인덱스를 사용한 BM25 순위 검색
+- 입력어는 토큰 단위 접두어 검색으로 변환 ("ema cro" -> "ema"* "cro"*)
+- 제목 > 작성자 > 설명 > Pine 코드 순으로 가중치
+- 일치 구간을 <mark>로 강조한 스니펫 (반환되는 페이지에 대해서만 생성)
+- FTS5가 없는 SQLite에서는 LIKE 검색으로 대체
+"""
+
+import html
+import re
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .schema import FTS_COLUMNS, FTS_TABLE, fts_available
+
+# BM25 컬럼 가중치 (FTS_COLUMNS 순서)
+BM25_WEIGHTS = {"title": 10.0, "author": 5.0, "description": 2.0, "pine_code": 0.5}
+
+TEXT_COLUMNS = ("title", "author", "description")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(
+    text: str,
+    columns: Optional[Sequence[str]] = None,
+    any_term: bool = False,
+    prefix: bool = True,
+) -> Optional[str]:
+    """
+    사용자 입력을 FTS5 MATCH 식으로 변환
+
+    FTS5 연산자/따옴표는 토큰화 과정에서 제거되므로 입력을 그대로 넘겨도 안전합니다.
+
+    Args:
+        text: 검색어
+        columns: 검색 대상 컬럼 (None이면 전체)
+        any_term: True면 OR, False면 모든 토큰 포함(AND)
+        prefix: 토큰 접두어 일치 허용
+
+    Returns:
+        MATCH 식 (검색 가능한 토큰이 없으면 None)
+    """
+    tokens = _TOKEN_RE.findall(text or "")
+    if not tokens:
+        return None
+
+    star = "*" if prefix else ""
+    terms = [f'"{token}"{star}' for token in tokens]
+    query = (" OR " if any_term else " ").join(terms)
+
+    if columns:
+        query = f"{{{' '.join(columns)}}} : ({query})"
+    return query
+
+
+def match_filter(
+    conn: sqlite3.Connection,
+    text: str,
+    columns: Sequence[str],
+    any_term: bool = False,
+) -> Tuple[str, List[Any]]:
+    """
+    WHERE 절에 붙일 검색 조건 (strategies 테이블 기준)
+
+    Returns:
+        (" AND ..." SQL 조각, 파라미터) - 검색어가 비어 있으면 ("", [])
+    """
+    if fts_available(conn):
+        query = build_match_query(text, columns, any_term=any_term)
+        if not query:
+            return "", []
+        return (
+            f" AND strategies.rowid IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?)",
+            [query],
+        )
+
+    # FTS5 미지원 - 토큰별 부분 문자열 검색
+    tokens = _TOKEN_RE.findall(text or "")
+    if not tokens:
+        return "", []
+    per_token = "(" + " OR ".join(f"{col} LIKE ?" for col in columns) + ")"
+    joiner = " OR " if any_term else " AND "
+    sql = " AND (" + joiner.join([per_token] * len(tokens)) + ")"
+    params = [f"%{token}%" for token in tokens for _ in columns]
+    return sql, params
+
+
+def make_snippet(text: Optional[str], terms: Sequence[str], size: int = 16) -> Optional[str]:
+    """
+    검색어 접두어와 일치하는 토큰을 <mark>로 강조한 HTML 스니펫
+
+    첫 일치 토큰 주변 `size`개 토큰을 잘라내며, 원문은 HTML 이스케이프됩니다.
+    일치가 없으면 None.
+    """
+    if not text:
+        return None
+
+    prefixes = tuple(term.casefold() for term in terms)
+    tokens = list(_TOKEN_RE.finditer(text))
+    hits = [i for i, m in enumerate(tokens) if m.group().casefold().startswith(prefixes)]
+    if not hits:
+        return None
+
+    first = max(0, min(hits[0] - size // 4, len(tokens) - size))
+    last = min(len(tokens), first + size) - 1
+    start = 0 if first == 0 else tokens[first].start()
+    end = len(text) if last == len(tokens) - 1 else tokens[last].end()
+
+    parts = []
+    cursor = start
+    for i in hits:
+        if i < first or i > last:
+            continue
+        m = tokens[i]
+        parts.append(html.escape(text[cursor:m.start()]))
+        parts.append(f"<mark>{html.escape(m.group())}</mark>")
+        cursor = m.end()
+    parts.append(html.escape(text[cursor:end]))
+
+    snippet = "".join(parts).strip()
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(text):
+        snippet += "…"
+    return snippet
+
+
+def search_strategies(
+    conn: sqlite3.Connection,
+    text: str,
+    limit: int = 20,
+    offset: int = 0,
+    include_code: bool = False,
+    snippet_tokens: int = 16,
+) -> List[Dict[str, Any]]:
+    """
+    BM25 순위 전문 검색
+
+    Args:
+        conn: strategies 테이블이 있는 연결
+        text: 검색어 (토큰별 접두어 AND 검색)
+        limit / offset: 페이징
+        include_code: Pine 코드 식별자까지 검색
+        snippet_tokens: 스니펫 길이 (토큰 수)
+
+    Returns:
+        script_id, title, author, likes, total_score, grade, rank, snippet 딕셔너리 목록
+        (rank는 BM25 점수, 낮을수록 관련도 높음)
+    """
+    columns = FTS_COLUMNS if include_code else TEXT_COLUMNS
+
+    if not fts_available(conn):
+        where, params = match_filter(conn, text, columns)
+        if not where:
+            return []
+        rows = conn.execute(
+            f"""
+            SELECT script_id, title, author, likes, total_score, grade,
+                   NULL AS rank, NULL AS snippet
+            FROM strategies
+            WHERE 1=1{where}
+            ORDER BY likes DESC
+            LIMIT ? OFFSET ?
+            """,
+            params + [limit, offset],
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    query = build_match_query(text, columns)
+    if not query:
+        return []
+
+    # 순위는 FTS 인덱스만으로 계산하고, 페이지에 든 행만 본문 조회
+    weights = ", ".join(str(BM25_WEIGHTS[col]) for col in FTS_COLUMNS)
+    rows = conn.execute(
+        f"""
+        SELECT s.script_id, s.title, s.author, s.likes, s.total_score, s.grade,
+               s.description, s.pine_code, top.rank
+        FROM (
+            SELECT rowid, bm25({FTS_TABLE}, {weights}) AS rank
+            FROM {FTS_TABLE}
+            WHERE {FTS_TABLE} MATCH ?
+            ORDER BY rank
+            LIMIT ? OFFSET ?
+        ) AS top
+        JOIN strategies s ON s.rowid = top.rowid
+        ORDER BY top.rank
+        """,
+        (query, limit, offset),
+    ).fetchall()
+
+    terms = _TOKEN_RE.findall(text)
+    results = []
+    for row in rows:
+        item = dict(row)
+        # 가중치 높은 컬럼부터 일치 구간을 찾아 스니펫 생성
+        item["snippet"] = None
+        for col in columns:
+            item["snippet"] = make_snippet(item[col], terms, snippet_tokens)
+            if item["snippet"]:
+                break
+        del item["description"], item["pine_code"]
+        results.append(item)
+    return results
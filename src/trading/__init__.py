@@ -7,6 +7,20 @@ from .live_safeguards import (
     TradingMetrics,
     get_safeguards,
 )
+from .indicators import (
+    ATR,
+    EMA,
+    RSI,
+    Bollinger,
+    IndicatorSet,
+    RollingMax,
+    RollingMin,
+)
+from .market_data import (
+    CandleRingBuffer,
+    CandleView,
+    MarketDataHub,
+)
 
 __all__ = [
     "LiveTradingSafeguards",
@@ -14,4 +28,14 @@ __all__ = [
     "TradingState",
     "TradingMetrics",
     "get_safeguards",
+    "ATR",
+    "EMA",
+    "RSI",
+    "Bollinger",
+    "IndicatorSet",
+    "RollingMax",
+    "RollingMin",
+    "CandleRingBuffer",
+    "CandleView",
+    "MarketDataHub",
 ]
@@ -0,0 +1,576 @@
+"""
+증분(스트리밍) 기술적 지표
+
+확정된 봉이 하나 들어올 때마다 O(1)로 상태를 갱신합니다.
+- EMA, RSI (Wilder / 단순평균), ATR (Wilder / 단순평균), 볼린저 밴드, 롤링 최소/최대(단조 덱)
+- update(): 확정 봉 반영, peek(): 진행 중인 봉을 반영했을 때의 값 (상태 변경 없음)
+- snapshot()/restore(): JSON 직렬화 가능한 상태 저장 (재시작 후 이어서 계산)
+- 배치 버전(*_batch)은 같은 정의를 배열 전체에 적용한 기준 구현
+
+생성된 실전 봇 코드에 그대로 포함되므로 numpy 외 외부 의존성이 없어야 합니다.
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+
+
+# ============================================================
+# 증분 지표
+# ============================================================
+
+class StreamingIndicator:
+    """증분 지표 기본 클래스"""
+
+    # 스냅샷 복원 시 deque로 되돌릴 속성
+    _deques: Tuple[str, ...] = ()
+
+    # 롤링 합계의 누적 오차 방지를 위해 주기적으로 합계를 다시 계산
+    _RESUM_EVERY = 1000
+
+    def __init__(self, **params):
+        self._params = params
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        return dict(self._params)
+
+    def update_bar(self, bar: Mapping[str, float]):
+        """확정 봉 반영 (source 컬럼 사용)"""
+        return self.update(float(bar[self._params.get("source", "close")]))
+
+    def peek_bar(self, bar: Mapping[str, float]):
+        """진행 중인 봉을 반영한 값 (상태 변경 없음)"""
+        return self.peek(float(bar[self._params.get("source", "close")]))
+
+    def reset(self):
+        self.__init__(**self._params)
+
+    def snapshot(self) -> Dict[str, Any]:
+        state = {
+            k: list(v) if isinstance(v, deque) else v
+            for k, v in vars(self).items() if k != "_params"
+        }
+        return {"type": type(self).__name__, "params": self.params, "state": state}
+
+    def restore(self, snapshot: Mapping[str, Any]):
+        """snapshot()으로 저장한 상태 복원 (타입/파라미터가 다르면 ValueError)"""
+        if snapshot.get("type") != type(self).__name__ or snapshot.get("params") != self._params:
+            raise ValueError(f"Snapshot does not match {type(self).__name__}({self._params})")
+        for key, value in snapshot["state"].items():
+            if key in self._deques:
+                value = deque((tuple(v) if isinstance(v, list) else v for v in value),
+                              maxlen=getattr(self, key).maxlen)
+            setattr(self, key, value)
+
+
+class EMA(StreamingIndicator):
+    """지수이동평균 (첫 period개 단순평균으로 시작)"""
+
+    def __init__(self, period: int, source: str = "close"):
+        super().__init__(period=period, source=source)
+        self.alpha = 2 / (period + 1)
+        self.value: Optional[float] = None
+        self.count = 0
+        self.seed_sum = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    def update(self, x: float) -> Optional[float]:
+        self.value = self.peek(x)
+        self.count += 1
+        if self.count <= self._params["period"]:
+            self.seed_sum += x
+        return self.value
+
+    def peek(self, x: float) -> Optional[float]:
+        period = self._params["period"]
+        if self.value is not None:
+            return self.value + self.alpha * (x - self.value)
+        if self.count + 1 == period:
+            return (self.seed_sum + x) / period
+        return None
+
+
+class RSI(StreamingIndicator):
+    """
+    상대강도지수
+
+    method:
+        "wilder": Wilder 평활 (첫 period개 변화량 평균으로 시작)
+        "sma": 최근 period개 변화량 단순평균 (기존 봇의 rsi()와 동일)
+    """
+
+    _deques = ("gains", "losses")
+
+    def __init__(self, period: int = 14, method: str = "wilder", source: str = "close"):
+        if method not in ("wilder", "sma"):
+            raise ValueError(f"Unknown RSI method: {method}")
+        super().__init__(period=period, method=method, source=source)
+        self.prev: Optional[float] = None
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+        self.gains = deque(maxlen=period)
+        self.losses = deque(maxlen=period)
+        self.sum_gain = 0.0
+        self.sum_loss = 0.0
+        self.updates = 0
+        self.value: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        if avg_loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def _next(self, x: float):
+        """x 반영 후 (avg_gain, avg_loss) - 값이 아직 없으면 None"""
+        if self.prev is None:
+            return None
+        period = self._params["period"]
+        delta = x - self.prev
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+
+        if self._params["method"] == "wilder" and self.avg_gain is not None:
+            return ((self.avg_gain * (period - 1) + gain) / period,
+                    (self.avg_loss * (period - 1) + loss) / period)
+
+        if len(self.gains) + 1 < period:
+            return None
+        full = len(self.gains) == period
+        sum_gain = self.sum_gain + gain - (self.gains[0] if full else 0.0)
+        sum_loss = self.sum_loss + loss - (self.losses[0] if full else 0.0)
+        return sum_gain / period, sum_loss / period
+
+    def update(self, x: float) -> Optional[float]:
+        result = self._next(x)
+        if self.prev is not None:
+            delta = x - self.prev
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            if len(self.gains) == self.gains.maxlen:
+                self.sum_gain -= self.gains[0]
+                self.sum_loss -= self.losses[0]
+            self.gains.append(gain)
+            self.losses.append(loss)
+            self.sum_gain += gain
+            self.sum_loss += loss
+            self.updates += 1
+            if self.updates % self._RESUM_EVERY == 0:
+                self.sum_gain, self.sum_loss = float(sum(self.gains)), float(sum(self.losses))
+        self.prev = x
+        if result is not None:
+            self.avg_gain, self.avg_loss = result
+            self.value = self._rsi(*result)
+        return self.value
+
+    def peek(self, x: float) -> Optional[float]:
+        result = self._next(x)
+        return None if result is None else self._rsi(*result)
+
+
+class ATR(StreamingIndicator):
+    """
+    평균진폭 (True Range는 직전 종가가 있는 봉부터 계산)
+
+    method:
+        "wilder": Wilder 평활 (첫 period개 TR 평균으로 시작)
+        "sma": 최근 period개 TR 단순평균 (생성된 실전 봇의 atr()와 동일)
+    """
+
+    _deques = ("trs",)
+
+    def __init__(self, period: int = 14, method: str = "wilder"):
+        if method not in ("wilder", "sma"):
+            raise ValueError(f"Unknown ATR method: {method}")
+        super().__init__(period=period, method=method)
+        self.prev_close: Optional[float] = None
+        self.trs = deque(maxlen=period)
+        self.tr_sum = 0.0
+        self.updates = 0
+        self.value: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    def _tr(self, high: float, low: float) -> float:
+        return max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+
+    def _next(self, tr: float) -> Optional[float]:
+        period = self._params["period"]
+        if self._params["method"] == "wilder" and self.value is not None:
+            return (self.value * (period - 1) + tr) / period
+        if len(self.trs) + 1 < period:
+            return None
+        full = len(self.trs) == period
+        return (self.tr_sum + tr - (self.trs[0] if full else 0.0)) / period
+
+    def update_bar(self, bar: Mapping[str, float]) -> Optional[float]:
+        high, low, close = float(bar["high"]), float(bar["low"]), float(bar["close"])
+        if self.prev_close is not None:
+            tr = self._tr(high, low)
+            result = self._next(tr)
+            if len(self.trs) == self.trs.maxlen:
+                self.tr_sum -= self.trs[0]
+            self.trs.append(tr)
+            self.tr_sum += tr
+            self.updates += 1
+            if self.updates % self._RESUM_EVERY == 0:
+                self.tr_sum = float(sum(self.trs))
+            if result is not None:
+                self.value = result
+        self.prev_close = close
+        return self.value
+
+    def peek_bar(self, bar: Mapping[str, float]) -> Optional[float]:
+        if self.prev_close is None:
+            return None
+        return self._next(self._tr(float(bar["high"]), float(bar["low"])))
+
+    def update(self, x: float):
+        raise TypeError("ATR needs high/low/close - use update_bar()")
+
+    def peek(self, x: float):
+        raise TypeError("ATR needs high/low/close - use peek_bar()")
+
+
+class Bollinger(StreamingIndicator):
+    """볼린저 밴드 (모표준편차) - (상단, 중간, 하단)"""
+
+    _deques = ("window",)
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0, source: str = "close"):
+        super().__init__(period=period, std_dev=std_dev, source=source)
+        self.window = deque(maxlen=period)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.updates = 0
+        self.value: Optional[Tuple[float, float, float]] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    def _bands(self, total: float, total_sq: float) -> Tuple[float, float, float]:
+        period = self._params["period"]
+        mean = total / period
+        std = max(total_sq / period - mean * mean, 0.0) ** 0.5
+        width = std * self._params["std_dev"]
+        return (mean + width, mean, mean - width)
+
+    def update(self, x: float) -> Optional[Tuple[float, float, float]]:
+        if len(self.window) == self.window.maxlen:
+            old = self.window[0]
+            self.total -= old
+            self.total_sq -= old * old
+        self.window.append(x)
+        self.total += x
+        self.total_sq += x * x
+        self.updates += 1
+        if self.updates % self._RESUM_EVERY == 0:
+            self.total = float(sum(self.window))
+            self.total_sq = float(sum(v * v for v in self.window))
+        if len(self.window) == self.window.maxlen:
+            self.value = self._bands(self.total, self.total_sq)
+        return self.value
+
+    def peek(self, x: float) -> Optional[Tuple[float, float, float]]:
+        if len(self.window) + 1 < self.window.maxlen:
+            return None
+        old = self.window[0] if len(self.window) == self.window.maxlen else 0.0
+        return self._bands(self.total - old + x, self.total_sq - old * old + x * x)
+
+
+class RollingExtreme(StreamingIndicator):
+    """최근 period개 최대/최소 (단조 덱, 갱신당 분할상환 O(1))"""
+
+    _deques = ("candidates",)
+
+    def __init__(self, period: int, mode: str = "max", source: str = "close"):
+        if mode not in ("max", "min"):
+            raise ValueError(f"Unknown mode: {mode}")
+        super().__init__(period=period, mode=mode, source=source)
+        self.candidates = deque()   # (index, value), 값이 단조
+        self.count = 0
+
+    def _dominates(self, a: float, b: float) -> bool:
+        return a >= b if self._params["mode"] == "max" else a <= b
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self._params["period"]
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.candidates[0][1] if self.ready else None
+
+    def update(self, x: float) -> Optional[float]:
+        while self.candidates and self._dominates(x, self.candidates[-1][1]):
+            self.candidates.pop()
+        self.candidates.append((self.count, x))
+        self.count += 1
+        if self.candidates[0][0] <= self.count - 1 - self._params["period"]:
+            self.candidates.popleft()
+        return self.value
+
+    def peek(self, x: float) -> Optional[float]:
+        if self.count + 1 < self._params["period"]:
+            return None
+        # 새 봉이 들어오면 빠지는 인덱스는 최대 하나
+        expired = self.count - self._params["period"]
+        for index, value in self.candidates:
+            if index > expired:
+                return value if self._dominates(value, x) else x
+        return x
+
+
+def RollingMax(period: int, source: str = "high") -> RollingExtreme:
+    return RollingExtreme(period, "max", source)
+
+
+def RollingMin(period: int, source: str = "low") -> RollingExtreme:
+    return RollingExtreme(period, "min", source)
+
+
+INDICATOR_TYPES = {cls.__name__: cls for cls in (EMA, RSI, ATR, Bollinger, RollingExtreme)}
+
+
+# ============================================================
+# 지표 묶음 (캔들 동기화 + 저장/복원)
+# ============================================================
+
+class IndicatorSet:
+    """
+    이름별 증분 지표 묶음
+
+    매 틱마다 캔들 윈도우(List[Dict] 또는 CandleView)를 넘기면
+    아직 반영하지 않은 확정 봉만 update하고, 마지막(진행 중인) 봉은 peek로 계산합니다.
+
+    사용 예:
+        ind = IndicatorSet(fast=EMA(9), slow=EMA(21), rsi=RSI(14))
+        prev, now = ind.evaluate(candles)   # 직전 확정 봉 값, 현재 봉 반영 값
+    """
+
+    def __init__(self, **indicators: StreamingIndicator):
+        self.indicators = indicators
+        self.last_timestamp: Optional[int] = None
+
+    def __getitem__(self, name: str) -> StreamingIndicator:
+        return self.indicators[name]
+
+    @property
+    def ready(self) -> bool:
+        return all(ind.ready for ind in self.indicators.values())
+
+    def reset(self):
+        for ind in self.indicators.values():
+            ind.reset()
+        self.last_timestamp = None
+
+    def update(self, bar: Mapping[str, float]):
+        """확정 봉 하나 반영 (bar에 timestamp가 있으면 기록)"""
+        for ind in self.indicators.values():
+            ind.update_bar(bar)
+        if "timestamp" in bar:
+            self.last_timestamp = int(bar["timestamp"])
+
+    def values(self) -> Dict[str, Any]:
+        """마지막 확정 봉 기준 값"""
+        return {name: ind.value for name, ind in self.indicators.items()}
+
+    def peek(self, bar: Mapping[str, float]) -> Dict[str, Any]:
+        """bar를 다음 봉으로 반영했을 때의 값 (상태 변경 없음)"""
+        return {name: ind.peek_bar(bar) for name, ind in self.indicators.items()}
+
+    def sync(self, candles, include_last: bool = False) -> int:
+        """
+        캔들 윈도우의 확정 봉 중 아직 반영하지 않은 봉만 update
+
+        Args:
+            candles: 시간순 캔들 (List[Dict] 또는 CandleView)
+            include_last: 마지막 봉도 확정 봉으로 처리
+
+        Returns:
+            반영한 봉 수
+        """
+        rows = _Rows(candles)
+        closed = len(rows) if include_last else len(rows) - 1
+        if closed <= 0:
+            return 0
+
+        start = 0
+        if self.last_timestamp is not None:
+            if rows.timestamp(0) > self.last_timestamp:
+                # 저장된 상태와 윈도우 사이에 빈 구간 - 윈도우로 다시 워밍업
+                self.reset()
+            else:
+                start = closed
+                while start > 0 and rows.timestamp(start - 1) > self.last_timestamp:
+                    start -= 1
+
+        for i in range(start, closed):
+            self.update(rows[i])
+        return closed - start
+
+    def evaluate(self, candles) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """sync 후 (직전 확정 봉 값, 진행 중인 봉 반영 값)"""
+        self.sync(candles)
+        rows = _Rows(candles)
+        return self.values(), self.peek(rows[len(rows) - 1])
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "last_timestamp": self.last_timestamp,
+            "indicators": {name: ind.snapshot() for name, ind in self.indicators.items()},
+        }
+
+    def restore(self, snapshot: Mapping[str, Any]) -> bool:
+        """
+        저장된 상태 복원
+
+        지표 구성이 바뀌었으면 복원하지 않고 False (다음 sync에서 워밍업)
+        """
+        saved = snapshot.get("indicators", {})
+        if set(saved) != set(self.indicators):
+            return False
+        try:
+            for name, ind in self.indicators.items():
+                ind.restore(saved[name])
+        except (ValueError, KeyError):
+            self.reset()
+            return False
+        self.last_timestamp = snapshot.get("last_timestamp")
+        return True
+
+
+def save_snapshots(path, sets: Mapping[str, IndicatorSet]):
+    """여러 IndicatorSet 상태를 JSON 파일로 저장"""
+    data = {key: ind.snapshot() for key, ind in sets.items()}
+    tmp = Path(str(path) + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    tmp.replace(path)
+
+
+def load_snapshots(path) -> Dict[str, Dict[str, Any]]:
+    """save_snapshots로 저장한 파일 읽기 (없거나 손상되면 빈 dict)"""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class _Rows:
+    """List[Dict] / CandleView 공통 행 접근"""
+
+    def __init__(self, candles):
+        self.candles = candles
+        self.columnar = hasattr(candles, "timestamp") and not isinstance(candles, (list, tuple))
+
+    def __len__(self):
+        return len(self.candles)
+
+    def timestamp(self, i: int) -> int:
+        if self.columnar:
+            return int(self.candles.timestamp[i])
+        return int(self.candles[i]["timestamp"])
+
+    def __getitem__(self, i: int) -> Mapping[str, float]:
+        if not self.columnar:
+            return self.candles[i]
+        c = self.candles
+        return {"timestamp": int(c.timestamp[i]), "open": c.open[i], "high": c.high[i],
+                "low": c.low[i], "close": c.close[i], "volume": c.volume[i]}
+
+
+# ============================================================
+# 배치 기준 구현
+# ============================================================
+
+def ema_batch(data: Iterable[float], period: int) -> np.ndarray:
+    """EMA 전체 배열 (첫 period-1개는 nan)"""
+    data = np.asarray(data, dtype=float)
+    out = np.full(len(data), np.nan)
+    if len(data) < period:
+        return out
+    alpha = 2 / (period + 1)
+    out[period - 1] = np.mean(data[:period])
+    for i in range(period, len(data)):
+        out[i] = data[i] * alpha + out[i - 1] * (1 - alpha)
+    return out
+
+
+def rsi_batch(data: Iterable[float], period: int = 14, method: str = "wilder") -> np.ndarray:
+    """RSI 전체 배열 (값이 없는 구간은 nan)"""
+    data = np.asarray(data, dtype=float)
+    out = np.full(len(data), np.nan)
+    deltas = np.diff(data)
+    gains, losses = np.clip(deltas, 0, None), np.clip(-deltas, 0, None)
+    if len(deltas) < period:
+        return out
+
+    def rsi(g, l):
+        return 100.0 if l == 0 else 100 - 100 / (1 + g / l)
+
+    if method == "sma":
+        for i in range(period, len(data)):
+            out[i] = rsi(np.mean(gains[i - period:i]), np.mean(losses[i - period:i]))
+        return out
+
+    avg_gain, avg_loss = np.mean(gains[:period]), np.mean(losses[:period])
+    out[period] = rsi(avg_gain, avg_loss)
+    for i in range(period + 1, len(data)):
+        avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+        out[i] = rsi(avg_gain, avg_loss)
+    return out
+
+
+def atr_batch(high, low, close, period: int = 14, method: str = "wilder") -> np.ndarray:
+    """ATR 전체 배열 (값이 없는 구간은 nan)"""
+    high, low, close = (np.asarray(a, dtype=float) for a in (high, low, close))
+    out = np.full(len(close), np.nan)
+    if len(close) < period + 1:
+        return out
+    tr = np.maximum(high[1:] - low[1:],
+                    np.maximum(np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1])))
+    if method == "sma":
+        for i in range(period, len(close)):
+            out[i] = np.mean(tr[i - period:i])
+        return out
+    out[period] = np.mean(tr[:period])
+    for i in range(period + 1, len(close)):
+        out[i] = (out[i - 1] * (period - 1) + tr[i - 1]) / period
+    return out
+
+
+def bollinger_batch(data, period: int = 20, std_dev: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """볼린저 밴드 전체 배열 (상단, 중간, 하단)"""
+    data = np.asarray(data, dtype=float)
+    mid = np.full(len(data), np.nan)
+    std = np.full(len(data), np.nan)
+    if len(data) >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(data, period)
+        mid[period - 1:] = windows.mean(axis=1)
+        std[period - 1:] = windows.std(axis=1)
+    return mid + std * std_dev, mid, mid - std * std_dev
+
+
+def rolling_extreme_batch(data, period: int, mode: str = "max") -> np.ndarray:
+    """최근 period개 최대/최소 전체 배열"""
+    data = np.asarray(data, dtype=float)
+    out = np.full(len(data), np.nan)
+    if len(data) >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(data, period)
+        out[period - 1:] = windows.max(axis=1) if mode == "max" else windows.min(axis=1)
+    return out
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Market Data Hub - 심볼/타임프레임별 공유 캔들 캐시
+
+여러 전략이 같은 (심볼, 타임프레임) 캔들을 요청해도 거래소 호출은 한 번만 합니다.
+- numpy 링 버퍼에 최근 N개 캔들 보관 (미러링 버퍼로 항상 연속 메모리)
+- 전략에는 복사 없는 읽기 전용 뷰(CandleView) 전달
+- 동시에 들어온 같은 요청은 진행 중인 fetch 하나를 공유 (in-flight dedupe)
+- 최초 1회만 전체 로드, 이후에는 마지막 봉 이후 몇 개만 증분 요청
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (symbol, timeframe, limit) -> ccxt 형식 [[ts, open, high, low, close, volume], ...]
+OHLCVFetcher = Callable[[str, str, int], Awaitable[List[Sequence[float]]]]
+
+FIELDS = ("open", "high", "low", "close", "volume")
+
+_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """'1m', '4h', '1d' 형식의 타임프레임을 밀리초로 변환"""
+    try:
+        return int(timeframe[:-1]) * _UNIT_MS[timeframe[-1]]
+    except (KeyError, ValueError):
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+
+class CandleView:
+    """
+    캔들 버퍼의 복사 없는 읽기 전용 뷰
+
+    `view.close`처럼 컬럼을 numpy 배열로 바로 사용합니다.
+    뷰는 링 버퍼 메모리를 그대로 가리키므로 다음 갱신 전까지(같은 틱 안에서) 사용하고,
+    보관이 필요하면 `copy()`를 사용하세요.
+
+    기존 List[Dict] 기반 코드를 위해 반복 시 dict 행을 반환합니다.
+    """
+
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume")
+
+    def __init__(self, timestamp: np.ndarray, values: np.ndarray):
+        self.timestamp = timestamp
+        self.open, self.high, self.low, self.close, self.volume = values
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __iter__(self) -> Iterator[Dict[str, float]]:
+        for i in range(len(self)):
+            yield {
+                'timestamp': int(self.timestamp[i]),
+                'open': float(self.open[i]),
+                'high': float(self.high[i]),
+                'low': float(self.low[i]),
+                'close': float(self.close[i]),
+                'volume': float(self.volume[i]),
+            }
+
+    def to_dicts(self) -> List[Dict[str, float]]:
+        """List[Dict] 형식으로 변환 (복사)"""
+        return list(self)
+
+    def copy(self) -> "CandleView":
+        """버퍼와 분리된 복사본"""
+        return CandleView(
+            self.timestamp.copy(),
+            np.array([self.open, self.high, self.low, self.close, self.volume]),
+        )
+
+
+class CandleRingBuffer:
+    """
+    고정 크기 캔들 링 버퍼
+
+    길이 2*capacity 배열에 각 캔들을 두 번(i, i+capacity) 기록하여
+    최근 N개가 항상 연속 구간 [start, start+N)에 놓이도록 합니다.
+    덕분에 뷰를 만들 때 복사나 재정렬이 필요 없습니다.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._ts = np.zeros(2 * capacity, dtype=np.int64)
+        self._values = np.zeros((len(FIELDS), 2 * capacity), dtype=np.float64)
+        self._head = 0   # 다음 기록 위치 (0..capacity-1)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if not self._count:
+            return None
+        return int(self._ts[(self._head - 1) % self.capacity])
+
+    def _write(self, pos: int, row: Sequence[float]):
+        for p in (pos, pos + self.capacity):
+            self._ts[p] = int(row[0])
+            self._values[:, p] = row[1:6]
+
+    def update(self, rows: Sequence[Sequence[float]]) -> int:
+        """
+        ccxt 형식 캔들 병합
+
+        - 마지막 캔들과 같은 시각: 덮어쓰기 (진행 중인 봉 갱신)
+        - 더 최근 시각: 추가 (가장 오래된 캔들은 밀려남)
+        - 더 과거 시각: 무시
+
+        Returns:
+            새로 추가된 캔들 수
+        """
+        added = 0
+        for row in rows:
+            ts = int(row[0])
+            last = self.last_timestamp
+            if last is not None and ts < last:
+                continue
+            if last is not None and ts == last:
+                self._write((self._head - 1) % self.capacity, row)
+                continue
+            self._write(self._head, row)
+            self._head = (self._head + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            added += 1
+        return added
+
+    def view(self, limit: Optional[int] = None) -> CandleView:
+        """최근 `limit`개(기본 전체) 캔들의 읽기 전용 뷰"""
+        n = self._count if limit is None else min(limit, self._count)
+        end = self._head + self.capacity if self._count == self.capacity else self._head
+        start = end - n
+        ts = self._ts[start:end]
+        values = self._values[:, start:end]
+        ts.flags.writeable = False
+        values.flags.writeable = False
+        return CandleView(ts, values)
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+
+@dataclass
+class _Feed:
+    """(심볼, 타임프레임)별 상태"""
+    buffer: CandleRingBuffer
+    fetched_at: float = 0.0          # 마지막 fetch 시각 (초)
+    fetched_bar: Optional[int] = None  # 마지막 fetch 시점의 봉 시작 시각 (ms)
+
+
+class MarketDataHub:
+    """
+    공유 캔들 캐시 + fan-out
+
+    사용 예:
+        hub = MarketDataHub(exchange.fetch_ohlcv, capacity=100, max_age=30)
+        candles = await hub.get("BTC/USDT", "1h")   # 모든 전략이 같은 버퍼를 공유
+        closes = candles.close                       # 복사 없는 numpy 뷰
+    """
+
+    def __init__(
+        self,
+        fetcher: OHLCVFetcher,
+        capacity: int = 100,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            fetcher: async (symbol, timeframe, limit) -> ccxt OHLCV 목록
+            capacity: 심볼/타임프레임별 보관 캔들 수
+            max_age: 같은 봉 안에서 재조회 간격 (초). None이면 봉마다 한 번만 조회
+                     (진행 중인 봉의 현재가가 필요한 전략은 체크 주기 정도로 설정)
+            clock: 현재 시각 (초) - 테스트용
+        """
+        self.fetcher = fetcher
+        self.capacity = capacity
+        self.max_age = max_age
+        self.clock = clock
+
+        self._feeds: Dict[Tuple[str, str], _Feed] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        self.fetch_count = 0
+        self.request_count = 0
+
+    def _current_bar(self, timeframe: str) -> int:
+        tf_ms = timeframe_to_ms(timeframe)
+        return int(self.clock() * 1000) // tf_ms * tf_ms
+
+    def _is_fresh(self, feed: _Feed, timeframe: str) -> bool:
+        if not len(feed.buffer) or feed.fetched_bar is None:
+            return False
+        if feed.fetched_bar != self._current_bar(timeframe):
+            return False
+        return self.max_age is None or self.clock() - feed.fetched_at < self.max_age
+
+    async def get(self, symbol: str, timeframe: str, limit: Optional[int] = None) -> CandleView:
+        """
+        최근 캔들 뷰 반환 (필요할 때만 거래소 조회)
+
+        Args:
+            symbol: 거래쌍
+            timeframe: 타임프레임
+            limit: 반환할 캔들 수 (기본: capacity)
+        """
+        key = (symbol, timeframe)
+        self.request_count += 1
+
+        feed = self._feeds.get(key)
+        if feed is None:
+            feed = self._feeds[key] = _Feed(CandleRingBuffer(self.capacity))
+
+        if not self._is_fresh(feed, timeframe):
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._refresh(key, feed))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            await asyncio.shield(task)
+
+        return feed.buffer.view(limit)
+
+    async def _refresh(self, key: Tuple[str, str], feed: _Feed):
+        symbol, timeframe = key
+        tf_ms = timeframe_to_ms(timeframe)
+        now_bar = self._current_bar(timeframe)
+
+        # 증분 조회: 마지막 봉(확정 갱신) + 이후 새 봉들만
+        last = feed.buffer.last_timestamp
+        if last is None:
+            limit = self.capacity
+        else:
+            limit = min(self.capacity, max(0, (now_bar - last) // tf_ms) + 2)
+
+        rows = await self.fetcher(symbol, timeframe, limit)
+        self.fetch_count += 1
+
+        if last is not None and rows and int(rows[0][0]) > last + tf_ms:
+            # 조회 범위보다 오래 비어 있었음 - 전체 재로드
+            feed.buffer.clear()
+        feed.buffer.update(rows)
+        feed.fetched_at = self.clock()
+        feed.fetched_bar = now_bar
+
+        logger.debug(f"[MarketData] {symbol} {timeframe}: {len(rows)}개 조회 (limit={limit})")
+
+    def invalidate(self, symbol: Optional[str] = None, timeframe: Optional[str] = None):
+        """캐시 무효화 (다음 get에서 재조회)"""
+        for (s, tf), feed in self._feeds.items():
+            if (symbol is None or s == symbol) and (timeframe is None or tf == timeframe):
+                feed.fetched_bar = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """요청/조회 통계"""
+        return {
+            'requests': self.request_count,
+            'fetches': self.fetch_count,
+            'feeds': len(self._feeds),
+        }
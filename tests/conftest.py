@@ -4,13 +4,26 @@ Pytest Configuration and Fixtures
 TradingView Strategy Research Lab 테스트를 위한 공통 설정과 픽스처
 """
 
+import os
 import pytest
 import sys
+import tempfile
 from pathlib import Path
 
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# 실행 중 생기는 로그/상태 파일은 저장소가 아닌 임시 디렉토리에
+# (api.server는 import 시점에 LOGS_DIR로 파일 핸들러를 만듦)
+RUNTIME_DIR = Path(tempfile.mkdtemp(prefix="tv-lab-tests-"))
+os.environ.setdefault("LOGS_DIR", str(RUNTIME_DIR / "logs"))
+
+
+@pytest.fixture(autouse=True)
+def runtime_cwd(tmp_path, monkeypatch):
+    """상대 경로 기본값(logs/, .trading_state.json)이 임시 디렉토리를 가리키도록"""
+    monkeypatch.chdir(tmp_path)
+
 
 # ============================================================
 # Sample Pine Script Fixtures
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+분석/백테스트 파이프라인 테스트
+
+- 로컬 픽스처 DB 대상 dry-run (기록 없음, 스레드/프로세스 풀)
+- 배치 기록: K건마다 한 트랜잭션, 분석 -> backtest_result 병합 순서
+- 단계별 동시 실행 제한
+"""
+
+import asyncio
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.analysis_pipeline import AnalysisPipeline, PipelineConfig, grade_for
+from src.backtester.strategy_tester import StrategyTester
+from src.collector.human_like_scraper import StrategyData
+from src.storage import StrategyDatabase, close_pools
+
+
+PINE_CODE = """//@version=5
+strategy("EMA Cross", overlay=true)
+fast = ta.ema(close, 9)
+slow = ta.ema(close, 21)
+if ta.crossover(fast, slow)
+    strategy.entry("Long", strategy.long)
+if ta.crossunder(fast, slow)
+    strategy.close("Long")
+"""
+
+
+@pytest.fixture
+def fixture_db(tmp_path):
+    """코드가 저장된 전략 6개 + 코드 없는 전략 1개"""
+    db_path = str(tmp_path / "strategies.db")
+
+    async def seed():
+        async with StrategyDatabase(db_path) as db:
+            for i in range(6):
+                await db.upsert_strategy({
+                    "script_id": f"S{i}", "title": f"Strategy {i}", "author": "tester",
+                    "likes": 100 * i, "pine_code": PINE_CODE,
+                    "script_url": f"https://www.tradingview.com/script/S{i}/",
+                })
+            await db.upsert_strategy({"script_id": "NOCODE", "title": "No code", "author": "tester"})
+
+    try:
+        asyncio.run(seed())
+    finally:
+        close_pools()
+    yield db_path
+    close_pools()
+
+
+def _strategies(n=6):
+    return [
+        StrategyData(
+            script_id=f"S{i}", title=f"Strategy {i}", author="tester", boosts=100 * i,
+            script_url=f"https://www.tradingview.com/script/S{i}/", pine_code=PINE_CODE,
+        )
+        for i in range(n)
+    ] + [StrategyData(script_id="NOCODE", title="No code", author="tester", boosts=0, script_url="")]
+
+
+def _analysis_json(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT script_id, analysis_json FROM strategies ORDER BY script_id").fetchall()
+    finally:
+        conn.close()
+    return {sid: json.loads(raw) if raw else None for sid, raw in rows}
+
+
+class OfflineAnalyzer:
+    """브라우저 대신 저장된 코드로 분석하고 동시 실행 수를 기록"""
+
+    def __init__(self):
+        from scripts.analyze_strategies import StrategyAnalyzer
+
+        self.inner = StrategyAnalyzer()
+        self.in_flight = 0
+        self.peak = 0
+        self.code = {}
+
+    async def analyze_strategy(self, strategy):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return self.inner.analyze_code(strategy, self.code[strategy["scriptId"]])
+        finally:
+            self.in_flight -= 1
+
+
+def _config(**overrides):
+    defaults = dict(backtest_days=20, write_batch_size=4, flush_interval=0.5, analyze_rate_per_minute=60_000)
+    defaults.update(overrides)
+    return PipelineConfig(**defaults)
+
+
+class TestDryRun:
+    """로컬 픽스처 DB 대상 dry-run"""
+
+    @pytest.mark.parametrize("backtest_workers", [0, 2])
+    def test_dry_run_does_not_write(self, fixture_db, backtest_workers):
+        before = _analysis_json(fixture_db)
+        pipeline = AnalysisPipeline(fixture_db, _config(dry_run=True, backtest_workers=backtest_workers))
+
+        result = asyncio.run(pipeline.run(_strategies()))
+
+        assert result.analyzed == 6 and result.failed == 0
+        assert result.backtested == 6
+        assert result.written == 0
+        assert {r.strategy_name for r in result.backtest_results} == {f"Strategy {i}" for i in range(6)}
+        assert _analysis_json(fixture_db) == before
+        assert not (Path(fixture_db).parent / "backtest_results.db").exists()
+
+
+class TestBatchedWriter:
+    """배치 기록 및 단계별 동시 실행 제한"""
+
+    def test_writes_analysis_then_backtest_in_batches(self, fixture_db, tmp_path, monkeypatch):
+        analyzer = OfflineAnalyzer()
+        analyzer.code = {f"S{i}": PINE_CODE for i in range(6)}
+        tester = StrategyTester(fixture_db, offline=True, result_store=str(tmp_path / "results.db"))
+        pipeline = AnalysisPipeline(
+            fixture_db, _config(analyzer_workers=2, backtest_workers=0), analyzer=analyzer, tester=tester
+        )
+
+        batches = []
+        original = StrategyDatabase.write_batch
+
+        async def spy(self, strategies=(), backtest_results=()):
+            batches.append((len(strategies), len(backtest_results)))
+            return await original(self, strategies, backtest_results)
+
+        monkeypatch.setattr(StrategyDatabase, "write_batch", spy)
+        result = asyncio.run(pipeline.run(_strategies()))
+
+        assert analyzer.peak == 2
+        assert result.analyzed == 6 and result.backtested == 6
+        # 분석 6 + 백테스트 6 = 12건을 4건씩 커밋
+        assert result.written == 12 and result.write_errors == 0
+        assert all(sum(batch) <= 4 for batch in batches)
+        assert sum(sum(batch) for batch in batches) == 12
+
+        stored = _analysis_json(fixture_db)
+        assert stored["NOCODE"] is None
+        for i in range(6):
+            analysis = stored[f"S{i}"]
+            assert analysis["grade"] == grade_for(analysis["total_score"])
+            assert analysis["backtest_result"]["backtest"]["success"]
+            assert analysis["backtest_result"]["script_id"] == f"S{i}"
+            # 파라미터 그리드 없는 폴드 지표는 저장만 하고 과적합 점수에는 반영하지 않음
+            assert analysis["backtest_result"]["backtest"]["walk_forward"]["folds"] == 4
+            assert analysis["overfitting_score"] == 100 - len(analysis["overfitting_issues"]) * 10
+            assert "walk_forward" not in analysis
+
+    def test_grade_boundaries(self):
+        assert [grade_for(s) for s in (80, 79.9, 70, 60, 50, 49.9)] == ["A", "B", "B", "C", "D", "F"]
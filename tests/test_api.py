@@ -22,14 +22,16 @@ from fastapi.testclient import TestClient
 
 
 @pytest.fixture
-def client():
-    """테스트 클라이언트 생성"""
+def client(tmp_path, monkeypatch):
+    """테스트 클라이언트 생성 (DB는 임시 경로)"""
     # 테스트용 환경변수 설정
     os.environ["APP_BASE_DIR"] = str(Path(__file__).parent.parent)
     os.environ["API_SECRET_KEY"] = "test_secret_key"
     
-    from api.server import app
-    return TestClient(app)
+    from api import server
+    monkeypatch.setattr(server, "DB_PATH", tmp_path / "data" / "strategies.db")
+    monkeypatch.setattr(server, "_schema_ready", False)
+    return TestClient(server.app)
 
 
 class TestHealthEndpoint:
@@ -176,6 +176,289 @@ class TestPineCodeFetcher:
         assert hasattr(fetcher, 'fetch_pine_code')
 
 
+class TestTokenBucket:
+    """공유 토큰 버킷 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_throttle(self):
+        """capacity만큼 즉시, 이후에는 rate에 맞춰 대기"""
+        from src.collector import TokenBucket
+
+        bucket = TokenBucket(rate=50, capacity=2)
+        waits = [await bucket.acquire() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert sum(waits) == pytest.approx(0.04, abs=0.02)
+
+    def test_session_manager_bucket_from_config(self):
+        """SessionManager가 RateLimitConfig로 버킷 생성"""
+        from src.collector import SessionManager
+        from src.collector.session_manager import RateLimitConfig
+
+        session = SessionManager(rate_limit=RateLimitConfig(requests_per_minute=120, burst=4))
+        assert session.token_bucket.rate == 2
+        assert session.token_bucket.capacity == 4
+
+
+FIXTURE_PINE = """//@version=5
+strategy("Fixture Strategy", overlay=true)
+length = input.int(14, "Length")
+plot(ta.sma(close, length))"""
+
+
+def _fake_page(code=FIXTURE_PINE, status=200):
+    """pre/code 블록에 Pine 코드가 있는 페이지 흉내"""
+    block = MagicMock()
+    block.inner_text = AsyncMock(return_value=code)
+    page = MagicMock()
+    page.goto = AsyncMock(return_value=MagicMock(status=status))
+    page.query_selector = AsyncMock(return_value=None)
+    page.query_selector_all = AsyncMock(return_value=[block])
+    page.evaluate = AsyncMock(return_value={})
+    return page
+
+
+def _fast_session():
+    from src.collector import SessionManager
+    from src.collector.session_manager import RateLimitConfig
+
+    return SessionManager(rate_limit=RateLimitConfig(
+        requests_per_minute=60_000, burst=10, backoff_base=0.001, max_backoff=0.001
+    ))
+
+
+class TestPineFetcherPool:
+    """브라우저 컨텍스트 풀 테스트 (브라우저 없이 컨텍스트를 흉내)"""
+
+    async def _start(self, pool):
+        """브라우저 대신 가짜 컨텍스트로 풀 시작"""
+        import asyncio
+        from src.collector.pine_fetcher import _ContextSlot
+
+        opened = []
+
+        async def open_slot(index):
+            slot = _ContextSlot(index=index, context=AsyncMock(), page=_fake_page())
+            opened.append(slot)
+            return slot
+
+        pool._open_slot = open_slot
+        pool._idle = asyncio.Queue()
+        for i in range(pool.concurrency):
+            slot = await open_slot(i)
+            pool._slots.append(slot)
+            pool._idle.put_nowait(slot)
+        return opened
+
+    @pytest.mark.asyncio
+    async def test_fetch_from_page_skips_unchanged(self):
+        """저장된 해시와 같으면 성과/설명 추출 생략"""
+        from src.collector.pine_fetcher import PineCodeFetcher, pine_code_hash
+
+        fetcher = PineCodeFetcher(settle_delay=0)
+        url = "https://www.tradingview.com/script/abc123-fixture/"
+
+        page = _fake_page()
+        changed = await fetcher.fetch_from_page(page, url, known_hash="stale")
+        assert not changed.unchanged
+        assert changed.pine_code == FIXTURE_PINE
+        page.evaluate.assert_awaited()
+
+        page = _fake_page()
+        same = await fetcher.fetch_from_page(page, url, known_hash=pine_code_hash(FIXTURE_PINE))
+        assert same.unchanged
+        assert same.script_id == "abc123-fixture"
+        assert same.inputs[0]["name"] == "length"
+        page.evaluate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_server_error_raises(self):
+        """429/5xx 응답은 예외 (재시도 대상)"""
+        from src.collector.pine_fetcher import PineCodeFetcher
+
+        with pytest.raises(RuntimeError, match="HTTP 503"):
+            await PineCodeFetcher(settle_delay=0).fetch_from_page(
+                _fake_page(status=503), "https://www.tradingview.com/script/x/"
+            )
+
+    @pytest.mark.asyncio
+    async def test_dispatch_retry_and_order(self):
+        """컨텍스트 수만큼 동시 실행, 실패 시 새 컨텍스트로 재시도, 입력 순서 유지"""
+        import asyncio
+        from src.collector import PineFetcherPool
+        from src.collector.pine_fetcher import PineCodeFetcher
+
+        pool = PineFetcherPool(concurrency=3, session=_fast_session(), max_retries=2, settle_delay=0)
+        opened = await self._start(pool)
+
+        in_flight = 0
+        peak = 0
+        flaky_calls = 0
+        real_fetch = PineCodeFetcher.fetch_from_page
+
+        async def fetch_from_page(page, url, known_hash=None):
+            nonlocal in_flight, peak, flaky_calls
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                if "flaky" in url:
+                    flaky_calls += 1
+                    if flaky_calls == 1:
+                        raise TimeoutError("navigation timeout")
+                if "broken" in url:
+                    raise TimeoutError("navigation timeout")
+                return await real_fetch(pool.fetcher, page, url, known_hash)
+            finally:
+                in_flight -= 1
+
+        pool.fetcher.fetch_from_page = fetch_from_page
+        urls = [f"https://www.tradingview.com/script/s{i}/" for i in range(8)]
+        urls[2] = "https://www.tradingview.com/script/flaky/"
+        urls[5] = "https://www.tradingview.com/script/broken/"
+        seen = []
+
+        results = await pool.fetch_many(urls, on_result=lambda i, r: seen.append(i))
+
+        assert [r.script_id for r in results] == [pool.fetcher._extract_script_id(u) for u in urls]
+        assert peak == 3
+        assert sorted(seen) == list(range(8))
+        assert results[2].pine_code == FIXTURE_PINE and results[2].error is None
+        assert results[5].error == "navigation timeout" and results[5].pine_code is None
+        # flaky 1회 + broken 2회 실패 -> 컨텍스트 3개 교체, 풀 크기는 그대로
+        assert len(opened) == 3 + 3
+        assert pool._idle.qsize() == 3
+        for slot in opened[:3]:
+            if slot not in pool._slots:
+                slot.context.close.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_known_hashes_from_database(self, tmp_path):
+        """DB에 저장된 코드 해시로 unchanged 판정"""
+        from src.collector import PineFetcherPool
+        from src.storage import StrategyDatabase, close_pools
+
+        try:
+            async with StrategyDatabase(str(tmp_path / "strategies.db")) as db:
+                await db.upsert_strategy({
+                    "script_id": "same", "title": "Same", "author": "a", "pine_code": FIXTURE_PINE,
+                })
+                await db.upsert_strategy({
+                    "script_id": "edited", "title": "Edited", "author": "a", "pine_code": "// old",
+                })
+                await db.upsert_strategy({"script_id": "nocode", "title": "No code", "author": "a"})
+                known = await db.get_code_hashes(["same", "edited", "nocode", "new"])
+        finally:
+            close_pools()
+
+        assert set(known) == {"same", "edited"}
+
+        pool = PineFetcherPool(concurrency=2, session=_fast_session(), settle_delay=0)
+        await self._start(pool)
+        results = await pool.fetch_many(
+            [f"https://www.tradingview.com/script/{sid}/" for sid in ("same", "edited", "new")], known
+        )
+        assert [r.unchanged for r in results] == [True, False, False]
+
+    @pytest.mark.asyncio
+    async def test_stored_code_reports_missing_results(self, tmp_path):
+        """변경 없는 전략: 저장된 코드 + 분석/백테스트 결과 유무 (재시도 판정)"""
+        from src.storage import StrategyDatabase, close_pools
+
+        try:
+            async with StrategyDatabase(str(tmp_path / "strategies.db")) as db:
+                for sid in ("done", "analyzed", "fresh"):
+                    await db.upsert_strategy({
+                        "script_id": sid, "title": sid, "author": "a",
+                        "pine_code": FIXTURE_PINE, "pine_version": 6,
+                    })
+                await db.write_batch(
+                    [
+                        {"script_id": "done", "title": "done", "author": "a", "analysis": {"grade": "A"}},
+                        {"script_id": "analyzed", "title": "analyzed", "author": "a", "analysis": {"grade": "B"}},
+                    ],
+                    [("done", {"total_return": 12.5})],
+                )
+                await db.upsert_strategy({"script_id": "nocode", "title": "No code", "author": "a"})
+                stored = await db.get_stored_code(["done", "analyzed", "fresh", "nocode", "new"])
+        finally:
+            close_pools()
+
+        assert set(stored) == {"done", "analyzed", "fresh"}
+        assert stored["done"]["pine_code"] == FIXTURE_PINE
+        assert stored["fresh"]["pine_version"] == 6
+        assert {sid: (s["analyzed"], s["backtested"]) for sid, s in stored.items()} == {
+            "done": (True, True),
+            "analyzed": (True, False),
+            "fresh": (False, False),
+        }
+
+
+@pytest.fixture
+def fixture_server():
+    """스크립트 페이지를 흉내내는 로컬 HTML 서버 (flaky 경로는 첫 요청에 503)"""
+    import html
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    hits = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits[self.path] = hits.get(self.path, 0) + 1
+            if "flaky" in self.path and hits[self.path] == 1:
+                self.send_response(503)
+                self.end_headers()
+                return
+            if "protected" in self.path:
+                body = "<html><body><p>Invite-only script</p></body></html>"
+            else:
+                body = f"<html><body><pre><code>{html.escape(FIXTURE_PINE)}</code></pre></body></html>"
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", hits
+    server.shutdown()
+
+
+class TestPineFetcherPoolBrowser:
+    """로컬 HTML 서버 대상 실제 브라우저 테스트 (Chromium 미설치 시 스킵)"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_against_fixture_server(self, fixture_server):
+        from src.collector import PineFetcherPool
+        from src.collector.pine_fetcher import pine_code_hash
+
+        base_url, hits = fixture_server
+        pool = PineFetcherPool(concurrency=2, session=_fast_session(), max_retries=2, settle_delay=0)
+        try:
+            await pool.start()
+        except Exception as e:
+            await pool.close()
+            pytest.skip(f"Chromium not available: {e}")
+
+        try:
+            urls = [f"{base_url}/script/{sid}/" for sid in ("s1", "flaky", "protected", "known")]
+            results = await pool.fetch_many(urls, {"known": pine_code_hash(FIXTURE_PINE)})
+        finally:
+            await pool.close()
+
+        assert results[0].pine_code == FIXTURE_PINE and results[0].pine_version == 5
+        assert results[1].pine_code == FIXTURE_PINE and hits["/script/flaky/"] == 2
+        assert results[2].is_protected and results[2].pine_code is None
+        assert results[3].unchanged
+
+
 class TestCollectorIntegration:
     """Collector 통합 테스트"""
     
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+이벤트 기반 시뮬레이터 테스트
+
+- 윈도우 뷰 (복사 없음 / 레거시 dict 접근)
+- 수수료/슬리피지 == BacktestEngine numpy 구현
+- 레거시 generate_signal 어댑터, StrategyTester 결과 형식
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.backtester.backtest_engine import BacktestEngine
+from src.backtester.event_simulator import BarData, EventSimulator, LegacySignalAdapter
+from src.backtester.strategy_cache import StrategyCache
+from src.backtester.strategy_tester import StrategyTester
+
+
+@pytest.fixture
+def candles():
+    rng = np.random.default_rng(3)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 400)))
+    return [
+        {"timestamp": i * 3_600_000, "open": c, "high": c * 1.01, "low": c * 0.99, "close": c, "volume": 5.0}
+        for i, c in enumerate(close)
+    ]
+
+
+class TestCandleWindow:
+
+    def test_columns_are_read_only_views(self, candles):
+        data = BarData.from_candles(candles)
+        window = data.window(10, 20)
+        assert len(window) == 10
+        assert np.shares_memory(window.close, data.close)
+        with pytest.raises(ValueError):
+            window.close[0] = 1.0
+
+    def test_legacy_sequence_access(self, candles):
+        window = BarData.from_candles(candles).window(10, 20)
+        assert window[-1] is candles[19]
+        assert [c["close"] for c in window] == [c["close"] for c in candles[10:20]]
+        assert window[-3:].close.tolist() == [c["close"] for c in candles[17:20]]
+        assert window[0].get("volume", 0) == 5.0
+        with pytest.raises(IndexError):
+            window[10]
+
+    def test_rows_built_from_columns(self):
+        data = BarData.from_dataframe(pd.DataFrame({
+            "timestamp": [1, 2], "open": [1.0, 2.0], "high": [1.5, 2.5], "low": [0.5, 1.5], "close": [1.2, 2.2],
+        }))
+        assert data.window(0, 2)[1] == {
+            "timestamp": 2, "open": 2.0, "high": 2.5, "low": 1.5, "close": 2.2, "volume": 0.0
+        }
+
+
+class TestCostModel:
+    """수수료/슬리피지는 BacktestEngine과 동일"""
+
+    def test_matches_backtest_engine_numpy(self, candles):
+        n = len(candles)
+        entries = np.zeros(n, dtype=bool)
+        exits = np.zeros(n, dtype=bool)
+        entries[[5, 60, 200]] = True
+        exits[[40, 150, 390]] = True
+
+        def strategy(window, position):
+            i = int(window.timestamp[-1]) // 3_600_000
+            if position is None and entries[i]:
+                return "buy"
+            if position is not None and exits[i]:
+                return "close"
+            return "hold"
+
+        data = BarData.from_candles(candles)
+        result = EventSimulator(10000, fees=0.001, slippage=0.0005, lookback=0).run(data, strategy)
+
+        df = pd.DataFrame({"close": data.close})
+        engine = BacktestEngine(initial_capital=10000, fees=0.001, slippage=0.0005, use_vectorbt=False)
+        expected = engine.run_backtest(df, pd.Series(entries), pd.Series(exits))
+
+        assert result.total_trades == expected.total_trades == 3
+        assert result.final_capital == pytest.approx(expected.equity_curve.iloc[-1], rel=1e-12)
+        assert result.trade_return.mean() * 100 == pytest.approx(expected.avg_trade_return, rel=1e-12)
+        assert result.trade_entry_idx.tolist() == [5, 60, 200]
+
+    def test_short_pnl_and_forced_close(self, candles):
+        data = BarData.from_candles(candles)
+        seen = []
+
+        def strategy(window, position):
+            if position is not None:
+                seen.append(position.pnl_percent)
+            return "sell" if position is None else "hold"
+
+        result = EventSimulator(fees=0, slippage=0, lookback=10).run(data, strategy)
+        entry, last = candles[10]["close"], candles[-1]["close"]
+        assert result.total_trades == 1
+        assert result.trade_return[0] == pytest.approx((entry - last) / entry)
+        assert seen[-1] == pytest.approx((entry - last) / entry * 100)
+        assert result.equity[-1] == pytest.approx(result.final_capital)
+        assert set(result.position.tolist()) == {-1}
+
+
+class TestLegacyAdapter:
+
+    def test_params_passed_only_when_accepted(self, candles):
+        calls = []
+
+        def with_params(current_price, candles, params=None, current_position=None):
+            calls.append(params)
+            return {"action": "hold"}
+
+        def without_params(current_price, candles, current_position=None):
+            calls.append("ok")
+            return {"action": "hold"}
+
+        window = BarData.from_candles(candles).window(0, 5)
+        LegacySignalAdapter(with_params, {"fast": 9})(window, None)
+        LegacySignalAdapter(without_params, {"fast": 9})(window, None)
+        assert calls == [{"fast": 9}, "ok"]
+
+    def test_candles_are_a_list(self, candles):
+        seen = []
+
+        def list_strategy(current_price, candles, params=None, current_position=None):
+            assert isinstance(candles, list)
+            extended = candles + [{"close": current_price}]
+            seen.append(json.loads(json.dumps(extended))[-2]["close"])
+            return {"action": "hold"}
+
+        window = BarData.from_candles(candles).window(3, 8)
+        LegacySignalAdapter(list_strategy)(window, None)
+        assert seen == [candles[7]["close"]]
+        assert window.to_list()[0] is candles[3]
+
+    def test_errors_count_as_hold(self, candles):
+        def broken(current_price, candles, params=None, current_position=None):
+            raise RuntimeError("boom")
+
+        result = EventSimulator(lookback=100).run_legacy(candles, broken)
+        assert result.total_trades == 0
+        assert result.signal_errors == len(candles) - 100
+
+
+class TestStrategyTester:
+
+    def test_run_backtest_result_format(self, candles):
+        tester = StrategyTester.__new__(StrategyTester)
+        tester.fees, tester.slippage = 0.0, 0.0
+
+        def strategy(current_price, candles, params=None, current_position=None):
+            if current_position is None and len(candles) == 101 and candles[-1]["timestamp"] % (20 * 3_600_000) == 0:
+                return {"action": "buy"}
+            if current_position and abs(current_position["pnl_percent"]) > 1:
+                return {"action": "close"}
+            return {"action": "hold"}
+
+        result = tester._run_backtest(strategy, candles, 10000.0)
+
+        # 수수료 없이 수익률 곱 == 최종 자본
+        growth = np.prod([1 + t["pnl_percent"] / 100 for t in result["trades"]])
+        assert result["success"] and result["total_trades"] == len(result["trades"])
+        assert result["final_capital"] == pytest.approx(10000 * growth, abs=0.01)
+        assert len(result["equity_curve"]) == 100
+        assert result["equity_curve"][-1]["timestamp"] == candles[-1]["timestamp"]
+        assert result["winning_trades"] + result["losing_trades"] == result["total_trades"]
+
+    def test_default_strategy_runs_on_columns(self, candles):
+        tester = StrategyTester.__new__(StrategyTester)
+        tester.fees, tester.slippage = 0.001, 0.0005
+        tester.strategy_cache = StrategyCache()
+        strategy = tester._compile_strategy(tester._get_default_strategy())
+        result = tester._run_backtest(strategy, candles, 10000.0)
+        assert result["success"]
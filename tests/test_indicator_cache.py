@@ -0,0 +1,76 @@
+"""
+지표 캐시 테스트
+
+- IndicatorMapper.calculate 결과 재사용 (매퍼 캐시 / activate 구간)
+- .npy 저장 후 새 캐시에서 memory-map으로 읽기
+- OHLCVStore.append 시 데이터셋 무효화
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.ohlcv_store import OHLCVStore
+from src.converter.indicator_cache import IndicatorCache, dataset_tag, get_indicator_cache
+from src.converter.indicator_mapper import IndicatorMapper
+
+
+@pytest.fixture
+def ohlc():
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, 300))
+    index = pd.date_range("2024-01-01", periods=len(close), freq="1h", name="timestamp")
+    return pd.DataFrame({
+        "close": close,
+        "high": close + rng.uniform(0, 1, len(close)),
+        "low": close - rng.uniform(0, 1, len(close)),
+    }, index=index)
+
+
+def test_mapper_reuses_results(ohlc):
+    cache = IndicatorCache()
+    mapper = IndicatorMapper(cache=cache)
+    plain = IndicatorMapper()
+
+    first = mapper.calculate("ta.ema", ohlc["close"], length=20)
+    second = mapper.calculate("ta.ema", ohlc["close"], length=20)
+    mapper.calculate("ta.ema", ohlc["close"], length=21)
+    macd = mapper.calculate("ta.macd", ohlc["close"])
+    assert mapper.calculate("ta.macd", ohlc["close"])[0] is not macd[0]
+
+    pd.testing.assert_series_equal(first, plain.calculate("ta.ema", ohlc["close"], length=20))
+    pd.testing.assert_series_equal(first, second)
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (2, 3)
+
+    # 복사본을 돌려주므로 호출자가 바꿔도 캐시는 그대로
+    second.iloc[:] = 0.0
+    pd.testing.assert_series_equal(mapper.calculate("ta.ema", ohlc["close"], length=20), first)
+
+
+def test_activated_cache_and_spill(ohlc, tmp_path):
+    cache = IndicatorCache(spill_dir=str(tmp_path))
+    mapper = IndicatorMapper()
+    with cache.activate("BTCUSDT_1h"):
+        st = mapper.calculate("ta.supertrend", ohlc["high"], ohlc["low"], ohlc["close"])
+        rsi = mapper.calculate("ta.rsi", ohlc["close"], length=14)
+
+    reloaded = IndicatorCache(spill_dir=str(tmp_path))
+    with reloaded.activate("BTCUSDT_1h"):
+        for got, want in zip(mapper.calculate("ta.supertrend", ohlc["high"], ohlc["low"], ohlc["close"]), st):
+            pd.testing.assert_series_equal(got, want)
+        pd.testing.assert_series_equal(mapper.calculate("ta.rsi", ohlc["close"], length=14), rsi)
+    assert reloaded.get_stats()["disk_hits"] == 2
+
+    assert reloaded.invalidate("BTCUSDT_1h") == 2
+    assert not (tmp_path / "BTCUSDT_1h").exists()
+
+
+def test_append_invalidates_dataset(ohlc, tmp_path):
+    shared = get_indicator_cache()
+    with shared.activate(dataset_tag("ETH/USDT", "1h")):
+        IndicatorMapper().calculate("ta.sma", ohlc["close"], length=9)
+    assert any(entry.dataset == "ETHUSDT_1h" for entry in shared._entries.values())
+
+    OHLCVStore(tmp_path).append("ETH/USDT", "1h", [[1_704_067_200_000, 1.0, 2.0, 0.5, 1.5, 10.0]])
+    assert not any(entry.dataset == "ETHUSDT_1h" for entry in shared._entries.values())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+증분 지표 테스트
+
+- 증분 update/peek 결과 == 배치 계산 결과
+- 기존 봇 지표(rsi/atr/bollinger_bands 최신값)와 동일
+- 스냅샷 저장/복원 후 이어서 계산
+- IndicatorSet 캔들 윈도우 동기화
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.trading.indicators import (
+    ATR, EMA, RSI, Bollinger, IndicatorSet, RollingMax, RollingMin,
+    atr_batch, bollinger_batch, ema_batch, load_snapshots, rolling_extreme_batch,
+    rsi_batch, save_snapshots,
+)
+from src.trading.market_data import CandleRingBuffer
+
+HOUR = 3_600_000
+
+
+@pytest.fixture
+def ohlc():
+    rng = np.random.default_rng(42)
+    close = 30000 + np.cumsum(rng.normal(0, 150, 600))
+    close[200:210] = close[199]   # 변화 없는 구간 (avg_loss == 0)
+    high = close + rng.uniform(0, 120, len(close))
+    low = close - rng.uniform(0, 120, len(close))
+    return high, low, close
+
+
+def bars(high, low, close):
+    return [{"timestamp": i * HOUR, "open": c, "high": h, "low": l, "close": c, "volume": 1.0}
+            for i, (h, l, c) in enumerate(zip(high, low, close))]
+
+
+def stream(indicator, values, bar_input=False):
+    out = []
+    for v in values:
+        result = indicator.update_bar(v) if bar_input else indicator.update(v)
+        out.append(np.nan if result is None else result)
+    return np.array(out, dtype=float)
+
+
+class TestMatchesBatch:
+
+    @pytest.mark.parametrize("period", [1, 9, 21])
+    def test_ema(self, ohlc, period):
+        close = ohlc[2]
+        np.testing.assert_allclose(stream(EMA(period), close), ema_batch(close, period), rtol=1e-12)
+
+    @pytest.mark.parametrize("method", ["wilder", "sma"])
+    def test_rsi(self, ohlc, method):
+        close = ohlc[2]
+        np.testing.assert_allclose(
+            stream(RSI(14, method=method), close), rsi_batch(close, 14, method), rtol=1e-9
+        )
+
+    @pytest.mark.parametrize("method", ["wilder", "sma"])
+    def test_atr(self, ohlc, method):
+        high, low, close = ohlc
+        np.testing.assert_allclose(
+            stream(ATR(14, method=method), bars(*ohlc), bar_input=True),
+            atr_batch(high, low, close, 14, method), rtol=1e-9,
+        )
+
+    def test_bollinger(self, ohlc):
+        close = ohlc[2]
+        bb = Bollinger(20, 2.0)
+        out = np.array([v if v else (np.nan,) * 3 for v in (bb.update(x) for x in close)])
+        for column, expected in zip(out.T, bollinger_batch(close, 20, 2.0)):
+            np.testing.assert_allclose(column, expected, rtol=1e-9)
+
+    @pytest.mark.parametrize("factory,mode", [(RollingMax, "max"), (RollingMin, "min")])
+    def test_rolling_extremes(self, ohlc, factory, mode):
+        close = ohlc[2]
+        np.testing.assert_array_equal(
+            stream(factory(20, source="close"), close), rolling_extreme_batch(close, 20, mode)
+        )
+
+    def test_peek_equals_update_without_mutating(self, ohlc):
+        high, low, close = ohlc
+        rows = bars(*ohlc)
+        indicators = [EMA(9), RSI(14), RSI(14, method="sma"), ATR(14), Bollinger(20),
+                      RollingMax(20), RollingMin(20)]
+        for row in rows[:-1]:
+            for ind in indicators:
+                ind.update_bar(row)
+        for ind in indicators:
+            before = json.dumps(ind.snapshot())
+            peeked = ind.peek_bar(rows[-1])
+            assert json.dumps(ind.snapshot()) == before
+            np.testing.assert_allclose(peeked, ind.update_bar(rows[-1]), rtol=1e-12)
+
+
+class TestLegacyIndicators:
+    """기존 봇 TechnicalIndicators의 최신값과 동일"""
+
+    def test_sma_rsi_matches_last_window_average(self, ohlc):
+        close = ohlc[2][:300]
+        deltas = np.diff(close[-15:])
+        avg_gain = np.mean(np.where(deltas > 0, deltas, 0))
+        avg_loss = np.mean(np.where(deltas < 0, -deltas, 0))
+        legacy = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        rsi = RSI(14, method="sma")
+        for x in close[:-1]:
+            rsi.update(x)
+        assert rsi.peek(close[-1]) == pytest.approx(legacy, rel=1e-12)
+
+    def test_sma_atr_and_bollinger_match_production_bot(self, ohlc):
+        high, low, close = (a[:300] for a in ohlc)
+        tr = np.maximum(high[-14:] - low[-14:],
+                        np.maximum(np.abs(high[-14:] - close[-15:-1]), np.abs(low[-14:] - close[-15:-1])))
+        upper = np.mean(close[-20:]) + 2 * np.std(close[-20:])
+
+        ind = IndicatorSet(atr=ATR(14, method="sma"), bb=Bollinger(20, 2.0))
+        rows = bars(high, low, close)
+        for row in rows[:-1]:
+            ind.update(row)
+        now = ind.peek(rows[-1])
+        assert now["atr"] == pytest.approx(np.mean(tr), rel=1e-12)
+        assert now["bb"][0] == pytest.approx(upper, rel=1e-12)
+
+
+class TestSnapshot:
+
+    def test_restore_continues_identically(self, ohlc, tmp_path):
+        rows = bars(*ohlc)
+
+        def make():
+            return IndicatorSet(fast=EMA(9), rsi=RSI(14), atr=ATR(14), bb=Bollinger(20),
+                                hi=RollingMax(20), lo=RollingMin(20))
+
+        reference = make()
+        for row in rows:
+            reference.update(row)
+
+        first = make()
+        for row in rows[:250]:
+            first.update(row)
+        save_snapshots(tmp_path / "state.json", {"BTC/USDT": first})
+
+        resumed = make()
+        assert resumed.restore(load_snapshots(tmp_path / "state.json")["BTC/USDT"])
+        assert resumed.last_timestamp == 249 * HOUR
+        for row in rows[250:]:
+            resumed.update(row)
+        assert resumed.values() == reference.values()
+
+    def test_mismatched_snapshot_is_rejected(self, ohlc):
+        saved = IndicatorSet(fast=EMA(9))
+        saved.update(bars(*ohlc)[0])
+        assert not IndicatorSet(fast=EMA(12)).restore(saved.snapshot())
+        assert not IndicatorSet(slow=EMA(9)).restore(saved.snapshot())
+        assert load_snapshots("/nonexistent/state.json") == {}
+
+
+class TestSync:
+
+    def test_sliding_windows_update_only_new_closed_bars(self, ohlc):
+        rows = bars(*ohlc)
+        ind = IndicatorSet(fast=EMA(9), rsi=RSI(14, method="sma"))
+
+        assert ind.sync(rows[0:100]) == 99
+        assert ind.sync(rows[0:100]) == 0
+        assert ind.sync(rows[2:102]) == 2
+
+        prev, now = ind.evaluate(rows[3:103])
+        close = ohlc[2][:103]
+        assert prev["fast"] == pytest.approx(ema_batch(close[:-1], 9)[-1], rel=1e-12)
+        assert now["fast"] == pytest.approx(ema_batch(close, 9)[-1], rel=1e-12)
+        assert now["rsi"] == pytest.approx(rsi_batch(close, 14, "sma")[-1], rel=1e-12)
+
+    def test_candle_view_and_gap_reset(self, ohlc):
+        buffer = CandleRingBuffer(100)
+        buffer.update([[r["timestamp"], r["open"], r["high"], r["low"], r["close"], 1.0]
+                       for r in bars(*ohlc)[:100]])
+        ind = IndicatorSet(fast=EMA(9))
+        assert ind.sync(buffer.view()) == 99
+        assert ind.last_timestamp == 98 * HOUR
+
+        # 윈도우가 마지막 반영 봉 이후에서 시작 - 처음부터 다시 워밍업
+        later = bars(*ohlc)[300:400]
+        assert ind.sync(later) == 99
+        close = ohlc[2][300:399]
+        assert ind["fast"].value == pytest.approx(ema_batch(close, 9)[-1], rel=1e-12)
+
+
+class TestGeneratedBot:
+    """생성된 실전 봇 코드에 증분 지표가 포함되는지"""
+
+    def test_generated_bot_uses_incremental_state(self, ohlc, tmp_path, monkeypatch):
+        from src.backtester.production_generator import generate_production_trading_bot
+
+        code = generate_production_trading_bot("EMA Test", 12.0, 55.0, 8.0, 1.2, 40, 2.5, -1.5)
+        assert "class IndicatorSet" in code
+
+        monkeypatch.chdir(tmp_path)
+        namespace = {"__name__": "generated_bot"}
+        exec(compile(code, "generated_bot.py", "exec"), namespace)
+
+        strategy = namespace["TradingStrategy"](namespace["Config"]())
+        rows = bars(*ohlc)
+        signal = strategy.analyze(rows[:100])
+        strategy.analyze(rows[1:101])
+        assert strategy.state.last_timestamp == 99 * HOUR
+        assert signal["rsi"] == pytest.approx(rsi_batch(ohlc[2][:100], 14, "sma")[-1], rel=1e-12)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+LLM 결과 캐시 테스트
+
+- 메모리 LRU / SQLite 2단계 조회, 네임스페이스 분리
+- TTL 만료, 항목 수/바이트 기준 제거
+- ConversionCache / CostOptimizer 경유 (기존 JSON 파일 이관 포함)
+"""
+
+import hashlib
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzer.llm.cost_optimizer import CostOptimizer
+from src.converter.llm.conversion_cache import ConversionCache
+from src.llm_cache import LLMCache, cache_namespace
+
+NS = cache_namespace("conversion", "claude-sonnet-4-5")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(tmp_path / "llm_cache.db", memory_size=4, max_entries=None)
+    yield cache
+    cache.close()
+
+
+class TestTwoTier:
+    """메모리 / 디스크 조회"""
+
+    def test_memory_then_disk(self, cache, tmp_path):
+        cache.set(NS, "a", {"python_code": "x = 1"})
+
+        assert cache.get(NS, "a") == {"python_code": "x = 1"}
+        assert cache.get_stats()["memory_hits"] == 1
+
+        reopened = LLMCache(tmp_path / "llm_cache.db")
+        assert reopened.get(NS, "a") == {"python_code": "x = 1"}
+        assert reopened.get(NS, "a") == {"python_code": "x = 1"}
+        stats = reopened.get_stats()
+        assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+        reopened.close()
+
+    def test_memory_lru_is_bounded(self, cache):
+        for i in range(10):
+            cache.set(NS, str(i), i)
+
+        stats = cache.get_stats()
+        assert stats["memory_entries"] == 4
+        assert stats["disk_entries"] == 10
+        assert cache.get(NS, "0") == 0  # 디스크에서 다시 읽음
+        assert cache.get_stats()["disk_hits"] == 1
+
+    def test_namespaces_are_isolated(self, cache):
+        other = cache_namespace("conversion", "claude-opus-4-5")
+        cache.set(NS, "a", "sonnet")
+        cache.set(other, "a", "opus")
+
+        assert cache.get(NS, "a") == "sonnet"
+        assert cache.get(other, "a") == "opus"
+        assert cache.get(cache_namespace("analysis:full", "claude-sonnet-4-5"), "a") is None
+
+    def test_hit_rate_per_namespace(self, cache):
+        cache.set(NS, "a", 1)
+        cache.get(NS, "a")
+        cache.get(NS, "missing")
+
+        stats = cache.get_stats()
+        assert stats["hit_rate"] == pytest.approx(0.5)
+        assert stats["namespaces"][NS]["misses"] == 1
+
+    def test_hits_return_copies(self, cache):
+        cache.set(NS, "a", {"issues": ["x"]})
+
+        cache.get(NS, "a")["issues"].append("mutated")
+
+        assert cache.get(NS, "a") == {"issues": ["x"]}
+
+    def test_memory_only(self):
+        cache = LLMCache(None, memory_size=2)
+        cache.set(NS, "a", 1)
+        assert cache.get(NS, "a") == 1
+        assert len(cache) == 1
+
+
+class TestExpiryAndEviction:
+    """TTL / 크기 제한"""
+
+    def test_expired_entries_are_dropped(self, cache):
+        cache.set(NS, "a", 1, ttl=0.05)
+        assert cache.get(NS, "a") == 1
+
+        time.sleep(0.06)
+        assert cache.get(NS, "a") is None
+        assert len(cache) == 0
+
+    def test_entry_bound_evicts_least_recently_used(self, tmp_path):
+        cache = LLMCache(tmp_path / "c.db", memory_size=1, max_entries=10)
+        for i in range(10):
+            cache.set(NS, str(i), i)
+            time.sleep(0.001)
+        cache.get(NS, "0")  # 0번을 최근 사용으로
+        cache.set(NS, "new", -1)
+
+        assert len(cache) <= 10
+        assert cache.get(NS, "0") == 0
+        assert cache.get(NS, "1") is None
+        assert cache.get_stats()["evictions"] >= 1
+        cache.close()
+
+    def test_memory_hits_keep_entries_from_eviction(self, tmp_path):
+        cache = LLMCache(tmp_path / "c.db", memory_size=16, max_entries=10)
+        for i in range(10):
+            cache.set(NS, str(i), i)
+            time.sleep(0.001)
+        cache.get(NS, "0")  # 메모리 적중 (디스크 조회 없음)
+        cache.set(NS, "new", -1)
+        assert cache.get_stats()["evictions"] >= 1
+        cache.close()
+
+        on_disk = LLMCache(tmp_path / "c.db", memory_size=0, max_entries=None)
+        assert on_disk.get(NS, "0") == 0
+        assert on_disk.get(NS, "1") is None
+        on_disk.close()
+
+    def test_byte_bound(self, tmp_path):
+        cache = LLMCache(tmp_path / "c.db", max_entries=None, max_bytes=2000)
+        for i in range(20):
+            cache.set(NS, str(i), "x" * 198)
+
+        assert cache.get_stats()["disk_bytes"] <= 2000
+        cache.close()
+
+    def test_purge_by_namespace_prefix(self, cache):
+        cache.set(cache_namespace("analysis:full", "m"), "a", 1)
+        cache.set(cache_namespace("analysis:quick", "m"), "a", 1)
+        cache.set(NS, "a", 1)
+
+        assert cache.purge("analysis:") == 2
+        assert cache.get(NS, "a") == 1
+        assert cache.get(cache_namespace("analysis:full", "m"), "a") is None
+
+
+class TestClients:
+    """ConversionCache / CostOptimizer"""
+
+    def test_conversion_cache_roundtrip(self, tmp_path):
+        cache = ConversionCache(cache_dir=str(tmp_path), model_version="v2")
+        cache.set("//@version=5", {"python_code": "x = 1", "strategy_used": "llm", "cost_usd": 0.01})
+
+        entry = cache.get("//@version=5")
+        assert entry["python_code"] == "x = 1"
+        assert ConversionCache(cache_dir=str(tmp_path), model_version="v1").get("//@version=5") is None
+        assert list(tmp_path.glob("*.json")) == []
+        assert cache.get_stats()["memory_hits"] == 1
+
+    def test_conversion_cache_imports_legacy_files(self, tmp_path):
+        code = "//@version=5\nstrategy('x')"
+        key = hashlib.sha256(code.encode()).hexdigest()
+        fresh = {"pine_code_hash": key, "python_code": "y = 2", "strategy_used": "llm",
+                 "cost_usd": 0.0, "timestamp": datetime.utcnow().isoformat(), "ttl_days": 30}
+        stale = dict(fresh, pine_code_hash="old",
+                     timestamp=(datetime.utcnow() - timedelta(days=40)).isoformat())
+        (tmp_path / f"{key}.json").write_text(json.dumps(fresh))
+        (tmp_path / "old.json").write_text(json.dumps(stale))
+
+        cache = ConversionCache(cache_dir=str(tmp_path))
+
+        assert cache.get(code)["python_code"] == "y = 2"
+        assert len(cache.cache) == 1
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_cost_optimizer_cache(self, tmp_path):
+        shared = LLMCache(tmp_path / "c.db")
+        optimizer = CostOptimizer(cache=shared, model_version="gpt-4o")
+        key = optimizer.get_cache_key("strategy('x')", "full")
+
+        assert optimizer.get_cached(key) is None
+        optimizer.set_cache(key, "분석 결과")
+        assert optimizer.get_cached(key) == "분석 결과"
+        assert CostOptimizer(cache=shared, model_version="gpt-4o-mini").get_cached(key) is None
+
+        stats = optimizer.get_cache_stats()
+        assert stats["analysis:full:gpt-4o"]["hit_rate"] == pytest.approx(0.5)
+
+        optimizer.clear_cache()
+        assert optimizer.get_cached(key) is None
+        shared.close()
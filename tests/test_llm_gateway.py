@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+LLM 게이트웨이 테스트 (FakeBackend, 오프라인)
+
+- 동일 요청 병합 (single-flight)
+- 전역 동시 실행 제한 / 분당 토큰 예산
+- 429 재시도, 공통 프리픽스 캐시
+- LLMConverter / LLMDeepAnalyzer 경유 호출
+- 부하 테스트: 전략 수백 개 동시 변환
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzer.llm.deep_analyzer import LLMDeepAnalyzer
+from src.analyzer.llm.prompts import ANALYSIS_PROMPT_TEMPLATE, ANALYSIS_SYSTEM_PROMPT, ANALYSIS_USER_TEMPLATE
+from src.converter.llm.llm_converter import LLMAPIError, LLMConverter
+from src.converter.llm.llm_prompt_builder import LLMPromptBuilder
+from src.converter.pine_parser import parse_pine_script
+from src.llm_gateway import FakeBackend, LLMGateway, LLMRequest, RateLimitedError, TokenBudget
+
+PINE_CODE = """//@version=5
+strategy("EMA Cross {n}", overlay=true)
+fast = input.int(9, "Fast")
+slow = input.int(21, "Slow")
+f = ta.ema(close, fast)
+s = ta.ema(close, slow)
+if ta.crossover(f, s)
+    strategy.entry("Long", strategy.long)
+if ta.crossunder(f, s)
+    strategy.close("Long")
+"""
+
+PYTHON_RESPONSE = '''```python
+from backtesting import Strategy
+import pandas_ta as ta
+
+
+class EmaCrossStrategy(Strategy):
+    """EMA Cross"""
+    fast = 9
+    slow = 21
+
+    def init(self):
+        close = self.data.Close
+        self.f = self.I(ta.ema, close, self.fast)
+        self.s = self.I(ta.ema, close, self.slow)
+
+    def next(self):
+        if self.f[-1] > self.s[-1] and self.f[-2] <= self.s[-2]:
+            self.buy()
+        elif self.f[-1] < self.s[-1] and self.f[-2] >= self.s[-2]:
+            self.position.close()
+```'''
+
+ANALYSIS_RESPONSE = json.dumps({
+    "logic_score": 8, "risk_score": 6, "practical_score": 7, "code_quality_score": 7,
+    "overall_recommendation": "PASS", "key_strengths": ["추세 추종"], "key_weaknesses": [],
+    "summary_kr": "EMA 교차", "conversion_notes": "",
+}, ensure_ascii=False)
+
+
+def _request(prompt="hello", **kwargs):
+    return LLMRequest(model="claude-sonnet-4-5", prompt=prompt, **kwargs)
+
+
+class TestSingleFlight:
+    """동일 요청 병합"""
+
+    def test_identical_requests_share_one_call(self):
+        backend = FakeBackend(latency=0.05)
+        gateway = LLMGateway(backend, max_concurrency=8)
+
+        async def run():
+            return await asyncio.gather(*[gateway.complete(_request("same")) for _ in range(10)])
+
+        responses = asyncio.run(run())
+
+        assert backend.calls == 1
+        assert len({id(r) for r in responses}) == 1
+        assert gateway.get_stats()["coalesced"] == 9
+
+    def test_finished_request_is_not_reused(self):
+        backend = FakeBackend()
+        gateway = LLMGateway(backend)
+
+        async def run():
+            await gateway.complete(_request("same"))
+            await gateway.complete(_request("same"))
+
+        asyncio.run(run())
+        assert backend.calls == 2
+
+    def test_error_is_shared_by_waiters(self):
+        backend = FakeBackend(responder=lambda r: 1 / 0, latency=0.01)
+        gateway = LLMGateway(backend, max_retries=1)
+
+        async def run():
+            return await asyncio.gather(
+                *[gateway.complete(_request("boom")) for _ in range(3)], return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, ZeroDivisionError) for r in results)
+        assert backend.calls == 1
+
+    def test_cancelled_leader_does_not_cancel_waiters(self):
+        backend = FakeBackend(latency=0.05)
+        gateway = LLMGateway(backend, max_concurrency=8)
+
+        async def run():
+            leader = asyncio.create_task(gateway.complete(_request("same")))
+            await asyncio.sleep(0.01)
+            waiters = [asyncio.create_task(gateway.complete(_request("same"))) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            results = await asyncio.gather(*waiters)
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return results
+
+        results = asyncio.run(run())
+
+        # 첫 대기자가 다시 호출하고 나머지는 그 호출을 공유
+        assert len({id(r) for r in results}) == 1
+        assert backend.calls == 2
+        assert gateway.get_stats()["coalesced"] == 2
+
+    def test_cancelled_waiter_stays_cancelled(self):
+        backend = FakeBackend(latency=0.05)
+        gateway = LLMGateway(backend)
+
+        async def run():
+            leader = asyncio.create_task(gateway.complete(_request("same")))
+            await asyncio.sleep(0.01)
+            waiter = asyncio.create_task(gateway.complete(_request("same")))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            return await leader
+
+        assert asyncio.run(run()) is not None
+        assert backend.calls == 1
+
+
+class TestLimits:
+    """동시 실행 / 토큰 예산 / 재시도"""
+
+    def test_concurrency_cap(self):
+        backend = FakeBackend(latency=0.02)
+        gateway = LLMGateway(backend, max_concurrency=3)
+
+        async def run():
+            await asyncio.gather(*[gateway.complete(_request(f"p{i}")) for i in range(20)])
+
+        asyncio.run(run())
+        assert backend.peak_in_flight == 3
+        assert gateway.get_stats()["peak_concurrency"] == 3
+
+    def test_token_budget_throttles(self):
+        budget = TokenBudget(tokens_per_minute=6000)  # 100 tokens/s
+
+        async def run():
+            start = time.monotonic()
+            await budget.acquire(6000)
+            await budget.acquire(20)
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.18
+
+    def test_budget_settles_actual_usage(self):
+        budget = TokenBudget(tokens_per_minute=6000)
+
+        async def run():
+            await budget.acquire(5000)
+            budget.settle(reserved=5000, actual=100)
+
+        asyncio.run(run())
+        assert budget._available == pytest.approx(5900, abs=5)
+
+    def test_rate_limit_retries_with_retry_after(self):
+        backend = FakeBackend(rate_limit_first=2, retry_after=0.01)
+        gateway = LLMGateway(backend, max_retries=3)
+
+        response = asyncio.run(gateway.complete(_request()))
+
+        assert response.content[0].text.startswith("echo")
+        assert backend.calls == 3
+        assert gateway.get_stats()["rate_limited"] == 2
+
+    def test_gives_up_after_max_retries(self):
+        backend = FakeBackend(rate_limit_first=5, retry_after=0.0)
+        gateway = LLMGateway(backend, max_retries=2)
+
+        with pytest.raises(RateLimitedError):
+            asyncio.run(gateway.complete(_request()))
+        assert gateway.get_stats()["failures"] == 1
+
+    def test_gateway_survives_new_event_loop(self):
+        gateway = LLMGateway(FakeBackend(), max_concurrency=2, tokens_per_minute=100_000)
+        for _ in range(2):
+            asyncio.run(gateway.complete(_request()))
+        assert gateway.get_stats()["backend_calls"] == 2
+
+
+class TestPrefixCache:
+    """공통 프리픽스 분리 및 캐시"""
+
+    def test_conversion_parts_match_full_prompt(self):
+        builder = LLMPromptBuilder()
+        ast = parse_pine_script(PINE_CODE.format(n=1))
+
+        prefix, body = builder.build_conversion_parts(ast)
+        assert builder.build_conversion_prompt(ast) == prefix + "\n\n" + body
+
+        prefix, body = builder.build_refinement_parts(ast, "x = 1", ["error"])
+        assert builder.build_refinement_prompt(ast, "x = 1", ["error"]) == prefix + "\n\n" + body
+
+    def test_prefix_is_shared_across_strategies(self):
+        builder = LLMPromptBuilder()
+        p1, b1 = builder.build_conversion_parts(parse_pine_script(PINE_CODE.format(n=1)), include_examples=True)
+        p2, b2 = builder.build_conversion_parts(parse_pine_script(PINE_CODE.format(n=2)), include_examples=True)
+
+        assert p1 is p2
+        assert "# Example Conversion" in p1
+        assert b1 != b2
+
+    def test_analysis_template_split(self):
+        assert "{title}" in ANALYSIS_USER_TEMPLATE and "{pine_code}" in ANALYSIS_USER_TEMPLATE
+        assert '"logic_score": 7' in ANALYSIS_SYSTEM_PROMPT
+        assert set(ANALYSIS_PROMPT_TEMPLATE.splitlines()) == set(
+            (ANALYSIS_SYSTEM_PROMPT + "\n" + ANALYSIS_USER_TEMPLATE).replace("{\n", "{{\n").replace("\n}", "\n}}").splitlines()
+        )
+
+    def test_repeated_prefix_is_read_from_cache(self):
+        backend = FakeBackend()
+        gateway = LLMGateway(backend)
+        system = "shared instructions " * 100
+
+        async def run():
+            for i in range(5):
+                await gateway.complete(_request(f"strategy {i}", system=system))
+
+        asyncio.run(run())
+        stats = gateway.get_stats()
+        assert stats["cache_write_tokens"] > 0
+        assert stats["cache_read_tokens"] == 4 * stats["cache_write_tokens"]
+        assert stats["prefix_cache_rate"] > 0.5
+
+
+class TestClients:
+    """변환기 / 심층 분석기 경유 호출"""
+
+    def test_converter_uses_gateway(self, monkeypatch):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        backend = FakeBackend(responder=lambda r: PYTHON_RESPONSE)
+        converter = LLMConverter(gateway=LLMGateway(backend))
+
+        result = asyncio.run(converter.convert(parse_pine_script(PINE_CODE.format(n=1)), validate=False))
+
+        assert "class EmaCrossStrategy" in result.full_code
+        assert result.prompt_tokens > 0
+
+    def test_converter_wraps_gateway_errors(self, monkeypatch):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        converter = LLMConverter(
+            gateway=LLMGateway(FakeBackend(rate_limit_first=10), backoff_base=0.0), max_retries=2
+        )
+
+        with pytest.raises(LLMAPIError):
+            asyncio.run(converter.convert(parse_pine_script(PINE_CODE.format(n=1)), validate=False))
+
+    def test_deep_analyzer_uses_gateway(self):
+        seen = []
+
+        def responder(request):
+            seen.append(request)
+            return ANALYSIS_RESPONSE
+
+        analyzer = LLMDeepAnalyzer(gateway=LLMGateway(FakeBackend(responder=responder)))
+        result = asyncio.run(analyzer.analyze_strategy(PINE_CODE.format(n=1), "EMA", "desc", {}, {}))
+
+        assert result.recommendation == "PASS"
+        assert result.total_score == 70
+        assert seen[0].system == ANALYSIS_SYSTEM_PROMPT
+        assert "EMA Cross 1" in seen[0].prompt
+
+
+class TestLoad:
+    """오프라인 부하 테스트"""
+
+    def test_hundreds_of_strategies(self, monkeypatch):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        backend = FakeBackend(responder=lambda r: PYTHON_RESPONSE, latency=0.01)
+        gateway = LLMGateway(backend, max_concurrency=16, tokens_per_minute=50_000_000)
+        converter = LLMConverter(gateway=gateway)
+        # 300건 중 100건은 중복 (같은 스크립트 재수집)
+        asts = [parse_pine_script(PINE_CODE.format(n=i % 200)) for i in range(300)]
+
+        async def run():
+            return await asyncio.gather(*[converter.convert(ast, validate=False) for ast in asts])
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        stats = gateway.get_stats()
+        assert len(results) == 300
+        assert backend.calls + stats["coalesced"] == 300
+        assert backend.calls >= 200
+        assert backend.peak_in_flight <= 16
+        # 200 calls / 16 slots * 10ms ~ 0.13s
+        assert elapsed < 5.0
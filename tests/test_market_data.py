@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+공유 캔들 캐시(MarketDataHub) 테스트
+
+- 링 버퍼 병합 / 순환 / 복사 없는 뷰
+- 동시 요청 dedupe, 봉 단위 캐시, 증분 조회
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.trading.market_data import CandleRingBuffer, MarketDataHub, timeframe_to_ms
+
+HOUR = 3_600_000
+
+
+def candle(i, close=None):
+    close = float(100 + i) if close is None else close
+    return [i * HOUR, close - 1, close + 1, close - 2, close, 10.0]
+
+
+class FakeExchange:
+    """fetch_ohlcv 호출 수를 세는 거래소 대역"""
+
+    def __init__(self, bars):
+        self.bars = bars          # 현재까지 열린 봉 수
+        self.calls = []
+
+    async def fetch_ohlcv(self, symbol, timeframe, limit):
+        self.calls.append((symbol, timeframe, limit))
+        await asyncio.sleep(0.01)
+        return [candle(i) for i in range(max(0, self.bars - limit), self.bars)]
+
+
+class Clock:
+    def __init__(self, bars):
+        self.now = (bars - 1) * HOUR / 1000 + 60
+
+    def __call__(self):
+        return self.now
+
+
+class TestCandleRingBuffer:
+
+    def test_append_overwrite_and_ignore_old(self):
+        buf = CandleRingBuffer(5)
+        assert buf.update([candle(0), candle(1)]) == 2
+        assert buf.update([candle(1, close=50.0), candle(0, close=1.0)]) == 0
+        view = buf.view()
+        assert list(view.close) == [100.0, 50.0]
+        assert buf.last_timestamp == HOUR
+
+    def test_wraparound_keeps_latest_contiguous(self):
+        buf = CandleRingBuffer(4)
+        buf.update([candle(i) for i in range(11)])
+        view = buf.view()
+        assert list(view.timestamp // HOUR) == [7, 8, 9, 10]
+        assert list(buf.view(2).close) == [109.0, 110.0]
+        assert view.close.flags.c_contiguous
+
+    def test_view_is_zero_copy_and_read_only(self):
+        buf = CandleRingBuffer(4)
+        buf.update([candle(i) for i in range(6)])
+        view = buf.view()
+        assert np.shares_memory(view.close, buf._values)
+        with pytest.raises(ValueError):
+            view.close[0] = 0.0
+
+        snapshot = view.copy()
+        buf.update([candle(6)])
+        assert list(snapshot.close) == [102.0, 103.0, 104.0, 105.0]
+
+    def test_legacy_dict_rows(self):
+        buf = CandleRingBuffer(3)
+        buf.update([candle(0)])
+        assert buf.view().to_dicts() == [
+            {'timestamp': 0, 'open': 99.0, 'high': 101.0, 'low': 98.0, 'close': 100.0, 'volume': 10.0}
+        ]
+
+
+class TestMarketDataHub:
+
+    def test_timeframe_to_ms(self):
+        assert timeframe_to_ms("15m") == 900_000
+        assert timeframe_to_ms("4h") == 4 * HOUR
+        with pytest.raises(ValueError):
+            timeframe_to_ms("1x")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self):
+        exchange = FakeExchange(bars=200)
+        hub = MarketDataHub(exchange.fetch_ohlcv, capacity=100, clock=Clock(200))
+
+        views = await asyncio.gather(*[hub.get("BTC/USDT", "1h") for _ in range(20)])
+
+        assert exchange.calls == [("BTC/USDT", "1h", 100)]
+        assert all(len(v) == 100 and v.close[-1] == 299.0 for v in views)
+        assert hub.get_stats() == {'requests': 20, 'fetches': 1, 'feeds': 1}
+
+    @pytest.mark.asyncio
+    async def test_fetches_once_per_bar_then_incrementally(self):
+        exchange = FakeExchange(bars=200)
+        clock = Clock(200)
+        hub = MarketDataHub(exchange.fetch_ohlcv, capacity=100, clock=clock)
+
+        await hub.get("BTC/USDT", "1h")
+        clock.now += 600
+        await hub.get("BTC/USDT", "1h")
+        assert len(exchange.calls) == 1
+
+        # 새 봉 2개 - 마지막 봉 + 새 봉만 조회
+        exchange.bars += 2
+        clock.now += 2 * 3600
+        view = await hub.get("BTC/USDT", "1h")
+        assert exchange.calls[-1] == ("BTC/USDT", "1h", 4)
+        assert len(view) == 100
+        assert list(view.timestamp[-3:] // HOUR) == [199, 200, 201]
+
+    @pytest.mark.asyncio
+    async def test_max_age_refreshes_forming_bar(self):
+        exchange = FakeExchange(bars=200)
+        clock = Clock(200)
+        hub = MarketDataHub(exchange.fetch_ohlcv, capacity=50, max_age=30, clock=clock)
+
+        await hub.get("BTC/USDT", "1h")
+        clock.now += 10
+        await hub.get("BTC/USDT", "1h")
+        clock.now += 30
+        await hub.get("BTC/USDT", "1h")
+        assert [c[2] for c in exchange.calls] == [50, 2]
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_is_shared_and_not_cached(self):
+        calls = []
+
+        async def failing(symbol, timeframe, limit):
+            calls.append(limit)
+            await asyncio.sleep(0.01)
+            raise ConnectionError("down")
+
+        hub = MarketDataHub(failing, capacity=10, clock=Clock(20))
+        results = await asyncio.gather(*[hub.get("ETH/USDT", "1h") for _ in range(3)], return_exceptions=True)
+        assert len(calls) == 1
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+        with pytest.raises(ConnectionError):
+            await hub.get("ETH/USDT", "1h")
+        assert len(calls) == 2
@@ -0,0 +1,197 @@
+"""
+OHLCVStore 테스트
+
+- 월별 파티션 append / 중복 처리
+- 범위 읽기 (memory-map)
+- 커버리지 기반 누락 구간 / 캔들 갭 탐지
+- BinanceDataCollector가 이미 받은 구간을 다시 요청하지 않는지 확인
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.ohlcv_store import OHLCVStore, merge_ranges
+
+HOUR = 3_600_000
+JAN_1 = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+
+
+def make_candles(start_ts: int, count: int, step: int = HOUR) -> list:
+    """ccxt 형식 캔들 생성"""
+    rows = []
+    for i in range(count):
+        price = 100.0 + i
+        rows.append([start_ts + i * step, price, price + 1, price - 1, price + 0.5, 10.0 + i])
+    return rows
+
+
+class FakeExchange:
+    """ccxt.binance.fetch_ohlcv 대체 (요청 기록)"""
+
+    def __init__(self, candles: list):
+        self.candles = candles
+        self.calls = []
+
+    def fetch_ohlcv(self, symbol, timeframe, since, limit):
+        self.calls.append(since)
+        return [c for c in self.candles if c[0] >= since][:limit]
+
+
+class TestOHLCVStore:
+    """OHLCVStore 기본 동작"""
+
+    def test_append_and_read_across_months(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        # 1월 말 ~ 2월 초에 걸친 데이터
+        start = JAN_1 + 30 * 24 * HOUR
+        candles = make_candles(start, 48)
+
+        assert store.append("BTC/USDT", "1h", candles) == 48
+
+        manifest = store.load_manifest("BTC/USDT", "1h")
+        assert list(manifest['months']) == ["2024-01", "2024-02"]
+
+        df = store.read("BTC/USDT", "1h")
+        assert df['timestamp'].dtype == np.int64
+        assert df['close'].dtype == np.float64
+        assert df['timestamp'].tolist() == [c[0] for c in candles]
+        assert df['close'].tolist() == [c[4] for c in candles]
+
+        ranged = store.read("BTC/USDT", "1h", start + 10 * HOUR, start + 19 * HOUR)
+        assert len(ranged) == 10
+        assert ranged['timestamp'].iloc[0] == start + 10 * HOUR
+
+    def test_single_month_read_is_memory_mapped(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.append("ETHUSDT", "1h", make_candles(JAN_1, 24))
+
+        columns = store.read_arrays("ETHUSDT", "1h", JAN_1, JAN_1 + 5 * HOUR)
+
+        assert len(columns['close']) == 6
+        assert not columns['close'].flags.writeable
+        assert not columns['close'].flags.owndata
+
+    def test_memory_maps_are_closed(self, tmp_path, monkeypatch):
+        import pyarrow as pa
+
+        store = OHLCVStore(tmp_path)
+        store.append("ETHUSDT", "1h", make_candles(JAN_1 + 30 * 24 * HOUR, 48))
+        opened = []
+        original = pa.memory_map
+
+        def tracking_map(*args, **kwargs):
+            opened.append(original(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(pa, "memory_map", tracking_map)
+        whole = store.read_arrays("ETHUSDT", "1h")
+        single = store.read_arrays("ETHUSDT", "1h", JAN_1 + 30 * 24 * HOUR, JAN_1 + 30 * 24 * HOUR + 5 * HOUR)
+
+        assert len(opened) == 3 and all(source.closed for source in opened)
+        # 파일 핸들을 닫아도 zero-copy 뷰는 유효
+        assert single['close'].tolist() == [100.5 + i for i in range(6)]
+        assert len(whole['close']) == 48
+
+    def test_append_replaces_duplicates(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.append("BTCUSDT", "1h", make_candles(JAN_1, 10))
+
+        updated = make_candles(JAN_1 + 8 * HOUR, 4)
+        updated[0][4] = 999.0
+        store.append("BTCUSDT", "1h", updated)
+
+        df = store.read("BTCUSDT", "1h")
+        assert len(df) == 12
+        assert df['timestamp'].is_monotonic_increasing
+        assert df.loc[df['timestamp'] == JAN_1 + 8 * HOUR, 'close'].item() == 999.0
+
+    def test_append_dataframe(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        index = pd.date_range("2024-01-01", periods=5, freq="h", name="timestamp")
+        df = pd.DataFrame({
+            "Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 3.0
+        }, index=index)
+
+        store.append("SOLUSDT", "1h", df)
+
+        stored = store.read("SOLUSDT", "1h")
+        assert stored['timestamp'].tolist() == list(range(JAN_1, JAN_1 + 5 * HOUR, HOUR))
+        assert (stored['close'] == 1.5).all()
+
+    def test_missing_ranges(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.append("BTCUSDT", "1h", make_candles(JAN_1, 10),
+                     covered=(JAN_1, JAN_1 + 9 * HOUR))
+
+        assert store.missing_ranges("BTCUSDT", "1h", JAN_1, JAN_1 + 9 * HOUR) == []
+        assert store.missing_ranges("BTCUSDT", "1h", JAN_1, JAN_1 + 20 * HOUR) == [
+            (JAN_1 + 9 * HOUR + 1, JAN_1 + 20 * HOUR)
+        ]
+        assert store.missing_ranges("BTCUSDT", "1h", JAN_1 - HOUR, JAN_1 + 5 * HOUR) == [
+            (JAN_1 - HOUR, JAN_1 - 1)
+        ]
+
+    def test_find_gaps(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        candles = make_candles(JAN_1, 10)
+        del candles[3:6]
+        store.append("BTCUSDT", "1h", candles)
+
+        assert store.find_gaps("BTCUSDT", "1h") == [(JAN_1 + 3 * HOUR, JAN_1 + 5 * HOUR)]
+
+    def test_list_and_delete(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.append("BTCUSDT", "1h", make_candles(JAN_1, 10))
+        store.append("BTCUSDT", "4h", make_candles(JAN_1, 10, 4 * HOUR))
+
+        partitions = store.list_partitions()
+        assert {(p['symbol'], p['timeframe']) for p in partitions} == {
+            ("BTCUSDT", "1h"), ("BTCUSDT", "4h")
+        }
+
+        assert store.delete(timeframe="4h") == 1
+        assert [p['timeframe'] for p in store.list_partitions()] == ["1h"]
+
+    def test_merge_ranges(self):
+        assert merge_ranges([(10, 20), (0, 5), (6, 8), (30, 40)], step=1) == [
+            (0, 8), (10, 20), (30, 40)
+        ]
+
+
+class TestCollectorStore:
+    """BinanceDataCollector + OHLCVStore 통합"""
+
+    @pytest.fixture
+    def collector(self, tmp_path):
+        pytest.importorskip("ccxt")
+        from src.backtester.data_collector import BinanceDataCollector
+
+        collector = BinanceDataCollector(cache_dir=str(tmp_path))
+        collector.exchange = FakeExchange(make_candles(JAN_1, 24 * 10))
+        return collector
+
+    def test_overlapping_ranges_are_not_refetched(self, collector):
+        first = asyncio.run(collector.fetch_ohlcv("BTC/USDT", "1h", "2024-01-01", "2024-01-05"))
+        calls_after_first = len(collector.exchange.calls)
+
+        assert len(first) == 4 * 24 + 1
+        assert first['timestamp'].iloc[0] == pd.Timestamp("2024-01-01")
+
+        # 겹치는 구간은 저장소에서, 새 구간만 다운로드
+        second = asyncio.run(collector.fetch_ohlcv("BTC/USDT", "1h", "2024-01-03", "2024-01-08"))
+        new_calls = collector.exchange.calls[calls_after_first:]
+
+        assert len(second) == 5 * 24 + 1
+        assert new_calls and min(new_calls) > collector._date_to_timestamp("2024-01-05")
+
+        # 전체 구간이 이미 있으면 요청 없음
+        calls_before = len(collector.exchange.calls)
+        cached = collector.get_cached_data("BTC/USDT", "1h", "2024-01-02", "2024-01-07")
+        again = asyncio.run(collector.fetch_ohlcv("BTC/USDT", "1h", "2024-01-02", "2024-01-07"))
+
+        assert cached is not None
+        assert len(collector.exchange.calls) == calls_before
+        pd.testing.assert_frame_equal(cached, again)
@@ -242,6 +242,144 @@ class TestVectorBTEngine:
         assert result["success"] is True
         assert "returns" in result
 
+    def test_sweep_signals_match_single_strategies(self):
+        """브로드캐스트 스윕 신호 == 조합별 전략 함수 신호"""
+        from src.backtester.vectorbt_engine import (
+            IndicatorCache,
+            SWEEP_FUNCTIONS,
+            sma_crossover_strategy,
+            rsi_strategy,
+            bollinger_bands_strategy,
+        )
+        import pandas as pd
+        import numpy as np
+        
+        np.random.seed(7)
+        dates = pd.date_range('2023-01-01', periods=300, freq='1h')
+        data = pd.DataFrame({
+            'close': np.random.randn(300).cumsum() + 100,
+        }, index=dates)
+        
+        cases = [
+            (sma_crossover_strategy, [{"fast_period": f, "slow_period": s} for f in (5, 10) for s in (20, 30)]),
+            (rsi_strategy, [{"period": p, "oversold": 30, "overbought": 70} for p in (7, 14)]),
+            (bollinger_bands_strategy, [{"period": p, "std_dev": d} for p in (10, 20) for d in (1.5, 2.0)]),
+        ]
+        
+        for strategy_func, combos in cases:
+            cache = IndicatorCache(data)
+            entries, exits = SWEEP_FUNCTIONS[strategy_func](data, combos, cache)
+            assert entries.shape == (len(data), len(combos))
+            
+            for i, params in enumerate(combos):
+                expected_entries, expected_exits = strategy_func(data, params)
+                assert np.array_equal(entries[i].values, expected_entries.values)
+                assert np.array_equal(exits[i].values, expected_exits.values)
+    
+    def test_indicator_cache_shares_lookbacks(self):
+        """같은 lookback의 지표는 한 번만 계산"""
+        from src.backtester.vectorbt_engine import IndicatorCache, sma_crossover_sweep
+        import pandas as pd
+        import numpy as np
+        
+        data = pd.DataFrame({'close': np.random.randn(100).cumsum() + 100})
+        combos = [{"fast_period": f, "slow_period": s} for f in (5, 10, 15) for s in (20, 30)]
+        
+        cache = IndicatorCache(data)
+        sma_crossover_sweep(data, combos, cache)
+        
+        # 5개의 고유 기간 (5, 10, 15, 20, 30)만 계산
+        assert cache.misses == 5
+        assert len(cache) == 5
+        assert cache.hits == 2 * len(combos) - 5
+    
+    @pytest.mark.skipif(
+        not __import__('src.backtester.vectorbt_engine', fromlist=['VECTORBT_AVAILABLE']).VECTORBT_AVAILABLE,
+        reason="VectorBT not installed"
+    )
+    def test_broadcast_optimization_matches_loop(self):
+        """브로드캐스트 최적화 결과 == 조합별 루프 결과 (VectorBT 필요)"""
+        from src.backtester.vectorbt_engine import VectorBTEngine, sma_crossover_strategy
+        import pandas as pd
+        import numpy as np
+        
+        np.random.seed(3)
+        dates = pd.date_range('2023-01-01', periods=500, freq='1h')
+        data = pd.DataFrame({
+            'close': np.random.randn(500).cumsum() + 100,
+        }, index=dates)
+        param_ranges = {"fast_period": [5, 10], "slow_period": [20, 30]}
+        
+        engine = VectorBTEngine()
+        broadcast = engine.optimize_parameters(data, sma_crossover_strategy, param_ranges)
+        # 람다로 감싸면 SWEEP_FUNCTIONS에 등록되지 않아 조합별 루프로 실행
+        loop = engine.optimize_parameters(
+            data, lambda d, p: sma_crossover_strategy(d, p), param_ranges
+        )
+        
+        assert broadcast.success and loop.success
+        assert broadcast.total_combinations == 4
+        assert broadcast.best_params == loop.best_params
+        
+        loop_by_params = {str(r["params"]): r for r in loop.all_results}
+        for row in broadcast.all_results:
+            expected = loop_by_params[str(row["params"])]
+            assert row["total_trades"] == expected["total_trades"]
+            assert row["total_return"] == pytest.approx(expected["total_return"])
+            assert row["sharpe_ratio"] == pytest.approx(expected["sharpe_ratio"])
+
+    def test_sweep_on_empty_frame(self):
+        """빈 데이터에서도 스윕 신호 생성 (0행)"""
+        from src.backtester.vectorbt_engine import IndicatorCache, SWEEP_FUNCTIONS, rsi_strategy, sma_crossover_strategy
+        import pandas as pd
+
+        data = pd.DataFrame({'close': []}, index=pd.DatetimeIndex([]))
+        for strategy_func, combos in (
+            (sma_crossover_strategy, [{"fast_period": 5, "slow_period": 20}]),
+            (rsi_strategy, [{"period": 14, "oversold": 30, "overbought": 70}]),
+        ):
+            entries, exits = SWEEP_FUNCTIONS[strategy_func](data, combos, IndicatorCache(data))
+            assert entries.shape == exits.shape == (0, 1)
+
+    def test_broadcast_failure_falls_back_to_loop(self, monkeypatch):
+        """브로드캐스트가 실패하면 조합별 루프로 실행, n_jobs만큼 스레드 사용"""
+        import threading
+        import warnings
+        from src.backtester import vectorbt_engine
+        from src.backtester.vectorbt_engine import BacktestResult, VectorBTEngine
+        import pandas as pd
+
+        monkeypatch.setattr(vectorbt_engine, "VECTORBT_AVAILABLE", True)
+        threads = set()
+
+        def fake_run_strategy(data, strategy_func, params):
+            threads.add(threading.get_ident())
+            return BacktestResult(success=True, sharpe_ratio=params["fast_period"] / 10)
+
+        def broken_sweep(data, combos, cache):
+            raise MemoryError("too many columns")
+
+        engine = VectorBTEngine.__new__(VectorBTEngine)
+        monkeypatch.setattr(engine, "run_strategy", fake_run_strategy, raising=False)
+        data = pd.DataFrame({'close': [1.0, 2.0, 3.0]})
+        param_ranges = {"fast_period": [5, 10, 15, 20], "slow_period": [30]}
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = engine.optimize_parameters(
+                data, None, param_ranges, sweep_func=broken_sweep, n_jobs=1
+            )
+
+        assert result.success and result.total_combinations == 4
+        assert result.best_params == {"fast_period": 20, "slow_period": 30}
+        assert any("falling back" in str(w.message) for w in caught)
+        assert threads == {threading.get_ident()}
+
+        threads.clear()
+        result = engine.optimize_parameters(data, None, param_ranges, sweep_func=broken_sweep, n_jobs=2)
+        assert result.success and len(result.all_results) == 4
+        assert threading.get_ident() not in threads
+
 
 # ============================================================
 # 7.3 FinBERT Tests
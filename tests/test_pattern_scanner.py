@@ -0,0 +1,147 @@
+"""
+PatternScanner 테스트
+
+- 사전 필터 + 정규식 결과가 re.search / re.findall과 같은지
+- 카테고리 / 줄 번호 보고
+- 일괄 채점 API
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzer.rule_based import (
+    OverfittingDetector,
+    PatternScanner,
+    RepaintingDetector,
+    RiskChecker,
+    get_scanner,
+    score_scripts,
+)
+from src.analyzer.rule_based.pattern_scanner import fold_case
+
+EDGE_CASES = [
+    "",
+    "REQUEST.SECURITY(syminfo.tickerid, 'D', CLOSE, LOOKAHEAD=BARMERGE.LOOKAHEAD_ON)",
+    "Strategy.Exit('x', STOP=low - ATR * 2)\nSTRATEGY.entry('L', strategy.long, QTY=10)",
+    "x = request.securİty(a, b, c)\ny = ta.pıvothigh(5, 5)",
+    "timenow\nvarip a = 0\nbarstate.isrealtime and calc_on_every_tick=true",
+    "if a and b and c and d and e\n    strategy.entry('L', strategy.long)\n" * 3,
+    "length = input.int(14, 'Len')\nmult = input.float(2.5)\nif time > timestamp(2021, 1, 1, 0, 0)",
+]
+
+
+@pytest.fixture
+def scripts(
+    sample_pine_script_safe,
+    sample_pine_script_repainting,
+    sample_pine_script_overfitting,
+    sample_pine_script_no_risk_management,
+    sample_pine_script_good_risk,
+    sample_pine_script_simple,
+):
+    return [
+        sample_pine_script_safe,
+        sample_pine_script_repainting,
+        sample_pine_script_overfitting,
+        sample_pine_script_no_risk_management,
+        sample_pine_script_good_risk,
+        sample_pine_script_simple,
+        *EDGE_CASES,
+    ]
+
+
+class TestEquivalence:
+    """등록된 모든 패턴이 re 직접 호출과 같은 결과"""
+
+    def test_registered_patterns_match_re(self, scripts):
+        scanner = get_scanner()
+        assert len(scanner.specs) > 50
+
+        for code in scripts:
+            scan = scanner.scan(code)
+            for spec in scanner.specs:
+                expected = re.findall(spec.pattern, code, spec.flags)
+                assert scan.has(spec.category, spec.pattern) == bool(
+                    re.search(spec.pattern, code, spec.flags)
+                ), (spec.pattern, code)
+                assert scan.count(spec.category, spec.pattern) == len(expected)
+                assert scan.findall(spec.category, spec.pattern) == expected
+
+    def test_prefilter_skips_absent_literals(self):
+        scanner = PatternScanner()
+        scanner.register("t", [r"request\.security\s*\(", r"\d+"], re.IGNORECASE)
+
+        scan = scanner.scan("plot(close)")
+        assert scan.candidates == frozenset({1})  # \d+는 리터럴이 없어 항상 후보
+
+    def test_branch_literals(self):
+        scanner = PatternScanner()
+        scanner.register("t", [r"(?:stop|limit)\s*="])
+
+        assert scanner.specs[0].literals == frozenset({"stop", "limit"})
+        assert scanner.scan("limit = 1").has("t", r"(?:stop|limit)\s*=")
+
+    def test_fold_case(self):
+        assert fold_case("SECURİTY") == "security"
+        assert "pivot" in fold_case("PıVOT")
+        assert re.search("pivot", "PıVOT", re.IGNORECASE)
+
+    def test_unregistered_pattern(self):
+        with pytest.raises(KeyError):
+            get_scanner().scan("x").has("repainting.critical", "not registered")
+
+
+class TestMatches:
+    """카테고리 / 줄 번호 보고"""
+
+    def test_matches_report_category_and_line(self, sample_pine_script_repainting):
+        matches = get_scanner().scan(sample_pine_script_repainting).matches("repainting")
+        lines = sample_pine_script_repainting.splitlines()
+
+        assert matches
+        assert [m.start for m in matches] == sorted(m.start for m in matches)
+        for m in matches:
+            assert m.category.startswith("repainting.")
+            assert m.text in lines[m.line - 1]
+
+        assert any(m.category == "repainting.critical" and "lookahead" in m.text.lower() for m in matches)
+
+    def test_category_filter(self, sample_pine_script_good_risk):
+        scan = get_scanner().scan(sample_pine_script_good_risk)
+
+        assert {m.category for m in scan.matches("risk.stop_loss")} == {"risk.stop_loss"}
+        assert not scan.matches("risk.stop")  # 접두어가 아닌 카테고리 단위
+
+    def test_scan_is_cached(self, sample_pine_script_simple):
+        scanner = get_scanner()
+        assert scanner.scan(sample_pine_script_simple) is scanner.scan(sample_pine_script_simple)
+
+
+class TestBatch:
+    """일괄 채점"""
+
+    def test_score_scripts_matches_detectors(self, scripts):
+        results = score_scripts(scripts)
+
+        assert len(results) == len(scripts)
+        for code, result in zip(scripts, results):
+            assert result["repainting"] == RepaintingDetector().analyze(code)
+            assert result["overfitting"] == OverfittingDetector().analyze(code)
+            assert result["risk"] == RiskChecker().analyze(code)
+
+    def test_score_scripts_process_pool(self, scripts):
+        codes = scripts * 3
+        pooled = score_scripts(codes, processes=2, chunksize=4)
+        local = score_scripts(codes)
+
+        for a, b in zip(pooled, local):
+            assert a["repainting"] == b["repainting"]
+            assert a["risk"] == b["risk"]
+            # 매직 넘버 순서는 set 순회 순서 (프로세스마다 해시 시드가 다를 수 있음)
+            assert a["overfitting"].score == b["overfitting"].score
+            assert sorted(a["overfitting"].magic_numbers) == sorted(b["overfitting"].magic_numbers)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+백테스트 결과 저장소 테스트
+
+- 키 구성 (코드 해시, 파라미터, 데이터셋 지문, 엔진 버전)
+- 캔들 dict / DataFrame 지문이 같은 형식 (trading-agent-system과 공유)
+- StrategyTester.test_strategy가 저장된 결과를 재사용
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.backtester.result_store import DatasetFingerprint, ResultKey, ResultStore
+from src.backtester.strategy_cache import StrategyCache
+from src.backtester.strategy_tester import StrategyTester
+
+
+@pytest.fixture
+def candles():
+    rng = np.random.default_rng(5)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 300)))
+    start = int(pd.Timestamp("2024-01-01").value // 1_000_000)
+    return [
+        {"timestamp": start + i * 3_600_000, "open": c, "high": c * 1.01, "low": c * 0.99, "close": c, "volume": 1.0}
+        for i, c in enumerate(close)
+    ]
+
+
+def test_candle_fingerprint_matches_frame(candles):
+    frame = pd.DataFrame(candles, index=pd.to_datetime([c["timestamp"] for c in candles], unit="ms"))
+    assert DatasetFingerprint.of_candles(candles, "BTC/USDT", "1h") == DatasetFingerprint.of(frame, "BTC/USDT", "1h")
+
+
+def test_put_get_and_aggregate(tmp_path, candles):
+    store = ResultStore(tmp_path / "results.db")
+    fingerprint = DatasetFingerprint.of_candles(candles, "BTC/USDT", "1h")
+    key = ResultKey.make("abc", {"n": 1}, fingerprint, "v1")
+
+    assert store.get(key) is None
+    store.put(key, {"total_return": np.float64(2.5), "total_trades": np.int64(4)}, "sma")
+    assert store.get(key) == {"total_return": 2.5, "total_trades": 4}
+    assert store.get(ResultKey.make("abc", {"n": 1}, fingerprint, "v2")) is None
+
+    summary = store.aggregate("sma")
+    assert summary.loc[0, "avg_return"] == 2.5 and summary.loc[0, "n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_strategy_tester_reuses_stored_result(tmp_path, candles):
+    tester = StrategyTester(
+        db_path=str(tmp_path / "strategies.db"),
+        strategy_cache=StrategyCache()
+    )
+    assert tester.result_store.db_path == tmp_path / "backtest_results.db"
+
+    async def fetch(*args):
+        return candles
+
+    async def get_strategy(script_id):
+        return SimpleNamespace(pine_code="//@version=5\nstrategy('x')")
+
+    async def noop(*args):
+        return None
+
+    tester._fetch_market_data = fetch
+    tester._save_backtest_result = noop
+    tester.db = SimpleNamespace(init_db=noop, get_strategy=get_strategy)
+
+    first = await tester.test_strategy("abc")
+    assert first["backtest"]["success"] and len(tester.result_store) == 1
+
+    compiled = tester.strategy_cache.get_stats()["misses"]
+    second = await tester.test_strategy("abc")
+    assert second["backtest"] == first["backtest"]
+    assert tester.strategy_cache.get_stats()["misses"] == compiled
+    assert tester.result_store.hits == 1
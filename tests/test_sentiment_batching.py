@@ -0,0 +1,215 @@
+"""
+FinBERT 배치 추론 테스트 (모델 없이 추론 함수 주입)
+
+- 동적 배칭: 여러 스레드의 문장을 한 배치로
+- 문장 해시 LRU 캐시
+- analyze_hype는 문장들을 한 번에 제출
+- warmup 전에는 모델을 로드하지 않음
+- 싱글톤 생성은 모델을 로드하지 않음 (동시 호출에도 인스턴스 1개)
+- warmup 후 analyze_strategy_description이 배처까지 도달
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzer import sentiment_analyzer
+from src.analyzer.sentiment_analyzer import (
+    LENGTH_BUCKETS,
+    FinBERTAnalyzer,
+    SentenceBatcher,
+    SentimentLabel,
+)
+
+
+def fake_scores(text):
+    """'loss'가 있으면 부정, 'profit'이 있으면 긍정, 나머지는 중립"""
+    if "loss" in text:
+        return {"positive": 0.1, "negative": 0.8, "neutral": 0.1}
+    if "profit" in text:
+        return {"positive": 0.9, "negative": 0.05, "neutral": 0.05}
+    return {"positive": 0.2, "negative": 0.2, "neutral": 0.6}
+
+
+class RecordingInfer:
+    """배치 크기를 기록하는 추론 함수"""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self.lock:
+            self.batches.append(list(texts))
+        return [fake_scores(text) for text in texts]
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setattr(sentiment_analyzer, "TRANSFORMERS_AVAILABLE", True)
+    infer = RecordingInfer()
+    analyzer = FinBERTAnalyzer(cache_size=8)
+    analyzer._batcher = SentenceBatcher(infer, max_batch_size=16, max_wait_ms=20)
+    analyzer._model_loaded = True
+    analyzer.infer = infer
+    yield analyzer
+    analyzer.close()
+
+
+class TestSentenceBatcher:
+    """동적 배칭 워커"""
+
+    def test_concurrent_callers_share_batches(self):
+        infer = RecordingInfer()
+        batcher = SentenceBatcher(infer, max_batch_size=32, max_wait_ms=50)
+
+        def caller(n):
+            futures = batcher.submit_many([f"caller {n} sentence {i} profit" for i in range(4)])
+            return [f.result(timeout=5) for f in futures]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(caller, range(8)))
+        batcher.close()
+
+        assert all(r["positive"] == 0.9 for rs in results for r in rs)
+        assert sum(len(b) for b in infer.batches) == 32
+        assert len(infer.batches) < 8  # 호출자별 배치가 아닌 공유 배치
+        assert max(len(b) for b in infer.batches) <= 32
+
+    def test_batch_size_cap(self):
+        infer = RecordingInfer()
+        batcher = SentenceBatcher(infer, max_batch_size=4, max_wait_ms=20)
+
+        futures = batcher.submit_many([f"s{i}" for i in range(10)])
+        [f.result(timeout=5) for f in futures]
+        batcher.close()
+
+        assert [len(b) for b in infer.batches] == [4, 4, 2]
+
+    def test_errors_reach_every_caller(self):
+        batcher = SentenceBatcher(lambda texts: 1 / 0, max_wait_ms=1)
+
+        futures = batcher.submit_many(["a", "b"])
+        for future in futures:
+            with pytest.raises(ZeroDivisionError):
+                future.result(timeout=5)
+        batcher.close()
+
+    def test_closed_batcher_rejects(self):
+        batcher = SentenceBatcher(RecordingInfer())
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            batcher.submit("x")
+
+
+class TestFinBERTAnalyzer:
+    """분석기 (캐시 / 배치 제출)"""
+
+    def test_sentences_results_in_order(self, analyzer):
+        results = analyzer.analyze_sentences(["big profit", "heavy loss", "plain text"])
+
+        assert [r.label for r in results] == [
+            SentimentLabel.POSITIVE, SentimentLabel.NEGATIVE, SentimentLabel.NEUTRAL
+        ]
+        assert results[0].confidence == 0.9
+        assert len(analyzer.infer.batches) == 1
+
+    def test_cache_skips_repeated_sentences(self, analyzer):
+        analyzer.analyze_sentences(["big profit", "big profit", "heavy loss"])
+        analyzer.analyze_sentiment("big profit")
+
+        assert analyzer.infer.batches == [["big profit", "heavy loss"]]
+        assert analyzer.get_stats()["cache"]["hits"] == 1
+
+    def test_cache_is_bounded(self, analyzer):
+        analyzer.analyze_sentences([f"sentence {i}" for i in range(20)])
+        assert analyzer.get_stats()["cache"]["entries"] == 8
+
+    def test_inference_error_is_not_cached(self, analyzer):
+        analyzer._batcher = SentenceBatcher(lambda texts: 1 / 0, max_wait_ms=1)
+
+        result = analyzer.analyze_sentiment("boom")
+        assert result.label == SentimentLabel.NEUTRAL
+        assert "error" in result.scores
+        assert analyzer.get_stats()["cache"]["entries"] == 0
+
+    def test_hype_submits_one_batch(self, analyzer):
+        text = ". ".join(f"Sentence number {i} shows profit" for i in range(12)) + ". ok"
+
+        result = analyzer.analyze_hype(text)
+
+        assert len(analyzer.infer.batches) == 1
+        assert len(analyzer.infer.batches[0]) == 12  # 10자 미만 문장 제외
+        assert result.overall_sentiment == SentimentLabel.POSITIVE
+        assert len(result.sentence_analysis) == 12
+
+    def test_no_model_load_on_request_path(self, monkeypatch):
+        monkeypatch.setattr(sentiment_analyzer, "TRANSFORMERS_AVAILABLE", True)
+        analyzer = FinBERTAnalyzer()
+
+        result = analyzer.analyze_sentiment("This strategy makes a profit")
+
+        assert result.scores == {"error": "model not loaded"}
+        assert analyzer.model is None and analyzer.tokenizer is None
+
+    def test_bucket_for(self):
+        assert FinBERTAnalyzer._bucket_for(3) == LENGTH_BUCKETS[0]
+        assert FinBERTAnalyzer._bucket_for(17) == 32
+        assert FinBERTAnalyzer._bucket_for(512) == 512
+        assert FinBERTAnalyzer._bucket_for(900) == 512
+
+
+class TestSingleton:
+    """get_sentiment_analyzer / analyze_strategy_description"""
+
+    def test_description_reaches_batcher(self, monkeypatch):
+        monkeypatch.setattr(sentiment_analyzer, "TRANSFORMERS_AVAILABLE", True)
+        monkeypatch.setattr(sentiment_analyzer, "_analyzer", None)
+        infer = RecordingInfer()
+        warmups = []
+
+        def fake_warmup(self):
+            warmups.append(self)
+            self._batcher = SentenceBatcher(infer, max_wait_ms=1)
+            self._model_loaded = True
+            return True
+
+        monkeypatch.setattr(FinBERTAnalyzer, "warmup", fake_warmup)
+
+        text = "This strategy shows steady profit on BTC. It avoids a heavy loss in ranging markets."
+        sentiment_analyzer.analyze_strategy_description(text)
+        assert warmups == [] and infer.batches == []
+
+        sentiment_analyzer.get_sentiment_analyzer().warmup()
+        result = sentiment_analyzer.analyze_strategy_description(text)
+        sentiment_analyzer.analyze_strategy_description(text + " More profit")
+
+        assert len(warmups) == 1
+        assert infer.batches and infer.batches[0][0].startswith("This strategy shows steady profit")
+        assert len(result["sentence_analysis"]) == 2
+        sentiment_analyzer.get_sentiment_analyzer().close()
+
+    def test_concurrent_first_calls_share_one_instance(self, monkeypatch):
+        monkeypatch.setattr(sentiment_analyzer, "_analyzer", None)
+        created = []
+        original_init = FinBERTAnalyzer.__init__
+
+        def slow_init(self, *args, **kwargs):
+            created.append(self)
+            time.sleep(0.05)
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(FinBERTAnalyzer, "__init__", slow_init)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            analyzers = list(pool.map(lambda _: sentiment_analyzer.get_sentiment_analyzer(), range(8)))
+
+        assert len(created) == 1
+        assert all(a is created[0] for a in analyzers)
+        analyzers[0].close()
@@ -0,0 +1,181 @@
+"""
+src/와 trading-agent-system/src/ 저장 형식 호환성 테스트
+
+두 트리가 같은 디렉토리 / DB 파일을 공유할 수 있도록 복제된 저장소들의
+디스크 형식이 같은지 확인합니다. 두 트리 모두 패키지 이름이 src이므로
+trading-agent-system 쪽은 별도 프로세스에서 실행합니다.
+
+- OHLCVStore: 월별 Arrow 파티션 / 매니페스트
+- ResultStore: SQLite 스키마 / 결과 키
+- StrategyCache: 바이트코드 파일
+- IndicatorCache: 캐시 키 / .json + .npy 저장 형식
+"""
+
+import json
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).parent.parent
+AGENT_ROOT = ROOT / "trading-agent-system"
+sys.path.insert(0, str(ROOT))
+
+from src.backtester.ohlcv_store import OHLCVStore
+from src.backtester.result_store import DatasetFingerprint, ResultKey, ResultStore
+from src.backtester.strategy_cache import StrategyCache, code_hash
+from src.converter.indicator_cache import IndicatorCache, make_key
+
+STRATEGY_CODE = "LENGTH = 14\n\ndef signal(x):\n    return x * LENGTH\n"
+FINGERPRINT = ["BTCUSDT", "1h", "2024-01-01 00:00:00", "2024-01-03 01:00:00", 50]
+
+# 각 트리가 같은 입력으로 저장소를 채우는 코드 (저장소 클래스만 트리별로 다름)
+WRITE_SCRIPT = """
+import numpy as np
+import pandas as pd
+
+HOUR = 3_600_000
+JAN_31 = 1_706_659_200_000  # 2024-01-31 00:00 UTC (2월에 걸치는 구간)
+INDEX = pd.date_range("2024-01-01", periods=50, freq="h")
+close = pd.Series(np.linspace(100.0, 150.0, 50), index=INDEX, name="close")
+
+
+def write_all(out, strategy_code, fingerprint):
+    candles = [[JAN_31 + i * HOUR, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10.0 * i] for i in range(48)]
+    OHLCVStore(out / "ohlcv").append("BTC/USDT", "1h", candles, covered=(JAN_31, JAN_31 + 47 * HOUR))
+
+    store = ResultStore(out / "results.db")
+    key = ResultKey.make("c0de", {"length": 14, "mult": 2.0}, DatasetFingerprint(*fingerprint), "v1")
+    store.put(key, {"total_return": 12.5, "sharpe_ratio": 1.25, "total_trades": 7}, strategy_name="EMA")
+    store.close()
+
+    StrategyCache(bytecode_dir=out / "bytecode").load(strategy_code)
+
+    IndicatorCache(spill_dir=out / "indicators").get_or_compute(
+        "ta.ema", (close,), {"length": 20}, lambda: close.ewm(span=20, adjust=False).mean(),
+        dataset="BTCUSDT_1h"
+    )
+"""
+
+AGENT_SCRIPT = WRITE_SCRIPT + """
+import json
+import sys
+from pathlib import Path
+
+from src.backtest.result_store import DatasetFingerprint, ResultKey, ResultStore
+from src.backtest.strategy_cache import StrategyCache
+from src.data.ohlcv_store import OHLCVStore
+from src.indicators.cache import IndicatorCache, make_key
+
+root_out, agent_out, strategy_code, fingerprint = Path(sys.argv[1]), Path(sys.argv[2]), sys.argv[3], json.loads(sys.argv[4])
+write_all(agent_out, strategy_code, fingerprint)
+
+# 루트 트리가 쓴 파일 읽기
+key = ResultKey.make("c0de", {"length": 14, "mult": 2.0}, DatasetFingerprint(*fingerprint), "v1")
+strategies = StrategyCache(bytecode_dir=root_out / "bytecode")
+strategies.load(strategy_code)
+indicators = IndicatorCache(spill_dir=root_out / "indicators")
+ema = indicators.get_or_compute("ta.ema", (close,), {"length": 20}, lambda: None, dataset="BTCUSDT_1h")
+
+print(json.dumps({
+    "ohlcv_close": OHLCVStore(root_out / "ohlcv").read("BTC/USDT", "1h")["close"].tolist(),
+    "result": ResultStore(root_out / "results.db").get(key),
+    "result_digest": key.digest,
+    "bytecode_disk_hits": strategies.disk_hits,
+    "indicator_key": make_key("ta.ema", (close,), {"length": 20}, ["BTCUSDT_1h", None]),
+    "indicator_disk_hits": indicators.disk_hits,
+    "ema": ema.tolist(),
+}, default=str))
+"""
+
+_writer = {"OHLCVStore": OHLCVStore, "ResultStore": ResultStore, "ResultKey": ResultKey,
+           "DatasetFingerprint": DatasetFingerprint, "StrategyCache": StrategyCache,
+           "IndicatorCache": IndicatorCache}
+exec(WRITE_SCRIPT, _writer)
+write_all, close = _writer["write_all"], _writer["close"]
+
+
+@pytest.fixture(scope="module")
+def stores(tmp_path_factory):
+    """(루트 출력, trading-agent-system 출력, trading-agent-system이 루트 출력을 읽은 결과)"""
+    if not (AGENT_ROOT / "src" / "backtest" / "result_store.py").exists():
+        pytest.skip("trading-agent-system 없음")
+
+    base = tmp_path_factory.mktemp("shared-formats")
+    root_out, agent_out = base / "root", base / "agent"
+    write_all(root_out, STRATEGY_CODE, FINGERPRINT)
+
+    proc = subprocess.run(
+        [sys.executable, "-c", AGENT_SCRIPT, str(root_out), str(agent_out), STRATEGY_CODE, json.dumps(FINGERPRINT)],
+        cwd=AGENT_ROOT, capture_output=True, text=True, timeout=120
+    )
+    assert proc.returncode == 0, proc.stderr
+    return root_out, agent_out, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _files(root: Path) -> dict:
+    return {p.relative_to(root).as_posix(): p for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def test_ohlcv_partitions_are_identical(stores):
+    root_out, agent_out, seen = stores
+    root_files, agent_files = _files(root_out / "ohlcv"), _files(agent_out / "ohlcv")
+
+    assert list(root_files) == list(agent_files) == [
+        "BTC_USDT/1h/2024-01.arrow", "BTC_USDT/1h/2024-02.arrow", "BTC_USDT/1h/_manifest.json"
+    ]
+    for name, path in root_files.items():
+        assert path.read_bytes() == agent_files[name].read_bytes(), name
+
+    expected = [1.5 + i for i in range(48)]
+    assert seen["ohlcv_close"] == expected
+    assert OHLCVStore(agent_out / "ohlcv").read("BTC/USDT", "1h")["close"].tolist() == expected
+
+
+def test_result_store_schema_and_keys_match(stores):
+    root_out, agent_out, seen = stores
+
+    def schema(path):
+        with sqlite3.connect(path) as conn:
+            return conn.execute("SELECT type, name, sql FROM sqlite_master ORDER BY name").fetchall()
+
+    assert schema(root_out / "results.db") == schema(agent_out / "results.db")
+
+    key = ResultKey.make("c0de", {"length": 14, "mult": 2.0}, DatasetFingerprint(*FINGERPRINT), "v1")
+    assert seen["result_digest"] == key.digest
+    assert seen["result"]["total_return"] == 12.5
+    assert ResultStore(agent_out / "results.db").get(key)["sharpe_ratio"] == 1.25
+
+
+def test_bytecode_is_shared(stores):
+    root_out, agent_out, seen = stores
+    name = f"{code_hash(STRATEGY_CODE)}.bin"
+
+    assert list(_files(root_out / "bytecode")) == list(_files(agent_out / "bytecode")) == [name]
+    assert seen["bytecode_disk_hits"] == 1
+
+    strategies = StrategyCache(bytecode_dir=agent_out / "bytecode")
+    assert strategies.load(STRATEGY_CODE)["signal"](2) == 28
+    assert strategies.disk_hits == 1
+
+
+def test_indicator_spill_is_shared(stores):
+    root_out, agent_out, seen = stores
+    key = make_key("ta.ema", (close,), {"length": 20}, ["BTCUSDT_1h", None])
+    expected = close.ewm(span=20, adjust=False).mean()
+
+    assert seen["indicator_key"] == key
+    assert list(_files(root_out / "indicators")) == list(_files(agent_out / "indicators")) == [
+        f"BTCUSDT_1h/{key}.0.npy", f"BTCUSDT_1h/{key}.1.npy", f"BTCUSDT_1h/{key}.json"
+    ]
+    assert seen["indicator_disk_hits"] == 1
+    assert np.allclose(seen["ema"], expected.to_numpy())
+
+    indicators = IndicatorCache(spill_dir=agent_out / "indicators")
+    cached = indicators.get_or_compute("ta.ema", (close,), {"length": 20}, lambda: None, dataset="BTCUSDT_1h")
+    assert indicators.disk_hits == 1
+    pd.testing.assert_series_equal(cached, expected)
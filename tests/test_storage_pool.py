@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+SQLite 연결 풀 테스트
+
+- WAL / 읽기 전용 연결
+- 동시 읽기, 쓰기 트랜잭션 commit/rollback
+- StrategyDatabase와 API 서버의 풀 공유
+"""
+
+import asyncio
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage import StrategyDatabase
+from src.storage.pool import ConnectionPool, get_pool, close_pools
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(tmp_path / "test.db", readers=2)
+    with pool.writer() as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield pool
+    pool.close()
+
+
+class TestConnectionPool:
+    """연결 풀 기본 동작"""
+
+    def test_wal_mode(self, pool):
+        with pool.reader() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_reader_is_read_only(self, pool):
+        with pool.reader() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO items (name) VALUES ('x')")
+
+    def test_writer_commit_and_rollback(self, pool):
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+
+        with pytest.raises(RuntimeError):
+            with pool.writer() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('b')")
+                raise RuntimeError("abort")
+
+        with pool.reader() as conn:
+            names = [row["name"] for row in conn.execute("SELECT name FROM items")]
+        assert names == ["a"]
+
+    def test_readers_are_reused(self, pool):
+        for _ in range(10):
+            with pool.reader():
+                pass
+        assert len(pool._all_readers) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads(self, pool):
+        await pool.executemany(
+            "INSERT INTO items (name) VALUES (?)", [(f"item{i}",) for i in range(100)]
+        )
+
+        counts = await asyncio.gather(
+            *[pool.fetchone("SELECT COUNT(*) FROM items") for _ in range(50)]
+        )
+
+        assert all(row[0] == 100 for row in counts)
+        assert len(pool._all_readers) <= pool.readers
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_rowcount(self, pool):
+        await pool.executemany("INSERT INTO items (name) VALUES (?)", [("a",), ("b",)])
+        assert await pool.execute("DELETE FROM items WHERE name = ?", ("a",)) == 1
+
+    def test_closed_pool(self, pool):
+        pool.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            with pool.reader():
+                pass
+
+
+class TestSharedPool:
+    """프로세스 전역 풀 공유"""
+
+    def test_same_path_same_pool(self, tmp_path):
+        try:
+            assert get_pool(tmp_path / "a.db") is get_pool(str(tmp_path / "a.db"))
+            assert get_pool(tmp_path / "a.db") is not get_pool(tmp_path / "b.db")
+        finally:
+            close_pools()
+
+    @pytest.mark.asyncio
+    async def test_strategy_database_uses_shared_pool(self, tmp_path):
+        db_path = tmp_path / "strategies.db"
+        try:
+            async with StrategyDatabase(str(db_path)) as db:
+                await db.upsert_strategy({
+                    "script_id": "POOL_TEST",
+                    "title": "Pool Test",
+                    "author": "tester",
+                    "likes": 10,
+                })
+                assert db.pool is get_pool(db_path)
+
+            # 다른 인스턴스도 같은 풀에서 데이터를 읽음
+            async with StrategyDatabase(str(db_path)) as db:
+                strategy = await db.get_strategy("POOL_TEST")
+                assert strategy.title == "Pool Test"
+        finally:
+            close_pools()
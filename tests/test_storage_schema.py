@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+구체화 컬럼(점수/등급/백테스트 지표) 테스트
+
+- 기존 DB 마이그레이션 백필
+- save_analysis / upsert_strategy / 직접 UPDATE 시 컬럼 동기화
+- SQL 필터/정렬/페이징 및 통계
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage import StrategyDatabase, SearchFilters, close_pools
+from src.storage.schema import SCHEMA_VERSION, ensure_schema
+
+
+LEGACY_SCHEMA = """
+CREATE TABLE strategies (
+    script_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    likes INTEGER DEFAULT 0,
+    views INTEGER DEFAULT 0,
+    pine_code TEXT,
+    pine_version INTEGER DEFAULT 5,
+    performance_json TEXT,
+    analysis_json TEXT,
+    script_url TEXT,
+    description TEXT,
+    is_open_source BOOLEAN DEFAULT 0,
+    category TEXT DEFAULT 'strategy',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def make_analysis(score, grade, status="passed", backtest_return=None):
+    analysis = {
+        "total_score": score,
+        "grade": grade,
+        "status": status,
+        "repainting_score": 90.0,
+        "overfitting_score": 20.0,
+    }
+    if backtest_return is not None:
+        analysis["backtest_result"] = {
+            "backtest": {"total_return": backtest_return, "sharpe_ratio": 1.5, "total_trades": 12}
+        }
+    return analysis
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    async with StrategyDatabase(str(tmp_path / "strategies.db")) as database:
+        for i, (score, grade, status) in enumerate([
+            (92.0, "A", "passed"),
+            (75.0, "B", "passed"),
+            (61.0, "C", "review"),
+            (35.0, "F", "rejected"),
+        ]):
+            await database.upsert_strategy({
+                "script_id": f"S{i}",
+                "title": f"Strategy {i}",
+                "author": "tester",
+                "likes": 100 - i,
+                "analysis": make_analysis(score, grade, status),
+            })
+        await database.upsert_strategy({
+            "script_id": "RAW", "title": "Not analyzed", "author": "tester", "likes": 500
+        })
+        yield database
+    close_pools()
+
+
+class TestMigration:
+    """기존 DB 백필"""
+
+    def test_backfill_legacy_rows(self, tmp_path):
+        conn = sqlite3.connect(str(tmp_path / "legacy.db"))
+        conn.execute(LEGACY_SCHEMA)
+        conn.execute(
+            "INSERT INTO strategies (script_id, title, author, analysis_json) VALUES (?, ?, ?, ?)",
+            ("L1", "Legacy", "old", json.dumps(make_analysis(80.5, "B", backtest_return=12.3))),
+        )
+        conn.execute(
+            "INSERT INTO strategies (script_id, title, author, analysis_json) VALUES (?, ?, ?, ?)",
+            ("L2", "Broken", "old", "{not json"),
+        )
+        conn.commit()
+
+        ensure_schema(conn)
+        conn.commit()
+
+        rows = {
+            row[0]: row[1:]
+            for row in conn.execute(
+                "SELECT script_id, total_score, grade, backtest_return, backtest_trades FROM strategies"
+            )
+        }
+        assert rows["L1"] == (80.5, "B", 12.3, 12)
+        assert rows["L2"] == (None, None, None, None)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        conn.close()
+
+    def test_direct_update_syncs_columns(self, tmp_path):
+        conn = sqlite3.connect(str(tmp_path / "direct.db"))
+        ensure_schema(conn)
+        conn.execute(
+            "INSERT INTO strategies (script_id, title, author) VALUES ('D1', 'Direct', 'script')"
+        )
+        conn.execute(
+            "UPDATE strategies SET analysis_json = ? WHERE script_id = 'D1'",
+            (json.dumps(make_analysis(70.0, "B", "review")),),
+        )
+        conn.commit()
+
+        row = conn.execute("SELECT total_score, grade, status FROM strategies").fetchone()
+        assert row == (70.0, "B", "review")
+        conn.close()
+
+
+class TestMaterialisedQueries:
+    """SQL 필터/정렬/통계"""
+
+    @pytest.mark.asyncio
+    async def test_save_analysis_updates_columns(self, db):
+        await db.save_analysis("RAW", make_analysis(88.0, "A", backtest_return=-4.2))
+
+        row = await db.pool.fetchone(
+            "SELECT total_score, grade, backtest_return FROM strategies WHERE script_id = 'RAW'"
+        )
+        assert tuple(row) == (88.0, "A", -4.2)
+
+    @pytest.mark.asyncio
+    async def test_search_filters_in_sql(self, db):
+        results = await db.search_strategies(SearchFilters(min_score=60, order_by="score"))
+        assert [s.script_id for s in results] == ["S0", "S1", "S2"]
+
+        results = await db.search_strategies(SearchFilters(grade=["A", "F"], order_by="score", order_desc=False))
+        assert [s.script_id for s in results] == ["S3", "S0"]
+
+        results = await db.search_strategies(SearchFilters(status=["passed"], order_by="score", limit=1, offset=1))
+        assert [s.script_id for s in results] == ["S1"]
+
+    @pytest.mark.asyncio
+    async def test_stats(self, db):
+        stats = await db.get_stats()
+
+        assert stats.total_strategies == 5
+        assert stats.analyzed_count == 4
+        assert (stats.passed_count, stats.review_count, stats.rejected_count) == (2, 1, 1)
+        assert stats.grade_distribution == {"A": 1, "B": 1, "C": 1, "D": 0, "F": 1}
+        assert stats.avg_score == round((92 + 75 + 61 + 35) / 4, 1)
+        assert stats.top_strategy["script_id"] == "S0"
+
+
+class TestApiQueries:
+    """API 목록/통계가 구체화 컬럼을 사용하는지 확인"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        import os
+        from fastapi.testclient import TestClient
+
+        os.environ.setdefault("APP_BASE_DIR", str(Path(__file__).parent.parent))
+        import api.server as server
+
+        db_path = tmp_path / "api.db"
+        conn = sqlite3.connect(str(db_path))
+        ensure_schema(conn)
+        for i, score in enumerate([55.0, 91.0, 78.0]):
+            conn.execute(
+                "INSERT INTO strategies (script_id, title, author, likes, analysis_json) VALUES (?, ?, ?, ?, ?)",
+                (f"API{i}", f"Api {i}", "tester", i, json.dumps(make_analysis(score, "A" if score > 90 else "B"))),
+            )
+        conn.commit()
+        conn.close()
+
+        monkeypatch.setattr(server, "DB_PATH", db_path)
+        monkeypatch.setattr(server.limiter, "enabled", False)
+        yield TestClient(server.app)
+        close_pools()
+
+    def test_score_sort_and_paging(self, client):
+        response = client.get("/api/strategies", params={"sort_by": "score", "limit": 2, "offset": 0})
+        assert [s["script_id"] for s in response.json()] == ["API1", "API2"]
+
+        response = client.get("/api/strategies", params={"min_score": 60, "grade": "B"})
+        assert [s["script_id"] for s in response.json()] == ["API2"]
+
+    def test_stats(self, client):
+        data = client.get("/api/stats").json()
+        assert data["total_strategies"] == 3
+        assert data["passed_count"] == 3
+        assert data["avg_score"] == round((55 + 91 + 78) / 3, 1)
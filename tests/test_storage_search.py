@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+전문 검색(FTS5) 테스트
+
+- MATCH 식 변환
+- 트리거 동기화 (INSERT / UPDATE / DELETE)
+- BM25 순위, 접두어 검색, 스니펫 강조, Pine 식별자 검색
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage import StrategyDatabase, SearchFilters, close_pools
+from src.storage.schema import ensure_schema
+from src.storage.search import build_match_query, search_strategies
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "search.db"))
+    conn.row_factory = sqlite3.Row
+    ensure_schema(conn)
+    conn.executemany(
+        "INSERT INTO strategies (script_id, title, author, likes, description, pine_code) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("T1", "EMA Crossover Pro", "alice", 10, "Trend following with two moving averages",
+             "fast_ma = ta.ema(close, 9)\nslow_ma = ta.ema(close, 21)"),
+            ("T2", "RSI Divergence", "bob", 50, "Uses EMA as a trend filter <b>bold</b>",
+             "rsi_value = ta.rsi(close, 14)"),
+            ("T3", "Bollinger Squeeze", "emanuel", 30, "Volatility breakout", "basis = ta.sma(close, 20)"),
+        ],
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+class TestMatchQuery:
+    """사용자 입력 -> MATCH 식"""
+
+    def test_prefix_and_terms(self):
+        assert build_match_query("ema cross") == '"ema"* "cross"*'
+
+    def test_operators_are_stripped(self):
+        assert build_match_query('ema" OR title:x -') == '"ema"* "OR"* "title"* "x"*'
+
+    def test_columns_and_any_term(self):
+        query = build_match_query("ema rsi", columns=("title", "author"), any_term=True, prefix=False)
+        assert query == '{title author} : ("ema" OR "rsi")'
+
+    def test_empty(self):
+        assert build_match_query("  ;; ") is None
+
+
+class TestFullTextSearch:
+    """BM25 검색"""
+
+    def test_title_match_ranks_first(self, conn):
+        results = search_strategies(conn, "ema")
+        # 제목 일치(T1) > 작성자 접두어(emanuel) > 설명 일치(T2)
+        assert [r["script_id"] for r in results] == ["T1", "T3", "T2"]
+
+    def test_prefix_query(self, conn):
+        assert [r["script_id"] for r in search_strategies(conn, "diverg")] == ["T2"]
+
+    def test_snippet_is_highlighted_and_escaped(self, conn):
+        result = search_strategies(conn, "trend filter")[0]
+        assert result["script_id"] == "T2"
+        assert "<mark>filter</mark>" in result["snippet"]
+        assert "&lt;b&gt;" in result["snippet"]
+
+    def test_pine_identifiers_only_with_include_code(self, conn):
+        assert search_strategies(conn, "fast_ma") == []
+        results = search_strategies(conn, "fast_ma", include_code=True)
+        assert [r["script_id"] for r in results] == ["T1"]
+
+    def test_triggers_keep_index_in_sync(self, conn):
+        conn.execute("UPDATE strategies SET title = 'MACD Histogram' WHERE script_id = 'T1'")
+        conn.execute("DELETE FROM strategies WHERE script_id = 'T3'")
+        conn.commit()
+
+        assert [r["script_id"] for r in search_strategies(conn, "ema")] == ["T2"]
+        assert [r["script_id"] for r in search_strategies(conn, "macd")] == ["T1"]
+
+    def test_paging(self, conn):
+        assert [r["script_id"] for r in search_strategies(conn, "ema", limit=1, offset=1)] == ["T3"]
+
+
+class TestDatabaseSearch:
+    """StrategyDatabase 키워드 검색 / 전문 검색"""
+
+    @pytest.mark.asyncio
+    async def test_keywords_and_full_text_search(self, tmp_path):
+        try:
+            async with StrategyDatabase(str(tmp_path / "strategies.db")) as db:
+                for i, title in enumerate(["Supertrend Scalper", "Ichimoku Cloud", "Super Smoother"]):
+                    await db.upsert_strategy({
+                        "script_id": f"K{i}", "title": title, "author": "tester", "likes": i,
+                    })
+
+                results = await db.search_strategies(SearchFilters(keywords=["super", "ichimoku"]))
+                assert [s.script_id for s in results] == ["K2", "K1", "K0"]
+
+                hits = await db.full_text_search("smooth")
+                assert [h["script_id"] for h in hits] == ["K2"]
+        finally:
+            close_pools()
+
+
+class TestSearchEndpoint:
+    """/api/search"""
+
+    def test_search_endpoint(self, conn, tmp_path, monkeypatch):
+        import os
+        from fastapi.testclient import TestClient
+
+        os.environ.setdefault("APP_BASE_DIR", str(Path(__file__).parent.parent))
+        import api.server as server
+
+        monkeypatch.setattr(server, "DB_PATH", tmp_path / "search.db")
+        monkeypatch.setattr(server.limiter, "enabled", False)
+        try:
+            client = TestClient(server.app)
+            data = client.get("/api/search", params={"q": "bolling"}).json()
+            assert [r["script_id"] for r in data] == ["T3"]
+            assert data[0]["snippet"] == "<mark>Bollinger</mark> Squeeze"
+
+            response = client.get("/api/strategies", params={"search": "alic"})
+            assert response.status_code == 200
+        finally:
+            close_pools()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+전략 컴파일 캐시 테스트
+
+- 같은 코드는 한 번만 실행, LRU 제거
+- 디스크 바이트코드 재사용
+- StrategyTester._compile_strategy 캐시 경유
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.backtester.strategy_cache import StrategyCache, code_hash
+from src.backtester.strategy_tester import StrategyTester
+
+CODE = '''
+calls.append(1)
+
+def generate_signal(current_price, candles, params=None, current_position=None):
+    return {"action": "hold", "price": current_price}
+'''
+
+
+def test_same_code_executes_once_and_lru_evicts():
+    cache = StrategyCache(maxsize=2)
+    calls = []
+
+    first = cache.load(CODE, preset={'calls': calls})
+    assert cache.load(CODE, preset={'calls': calls}) is first
+    assert calls == [1]
+
+    cache.load("x = 1")
+    cache.load("x = 2")            # CODE가 가장 오래됨 -> 제거
+    cache.load(CODE, preset={'calls': calls})
+    assert calls == [1, 1]
+    assert len(cache) == 2
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_tag_separates_presets():
+    cache = StrategyCache()
+    a = cache.load("y = value", preset={'value': 1}, tag='a')
+    b = cache.load("y = value", preset={'value': 2}, tag='b')
+    assert (a['y'], b['y']) == (1, 2)
+
+
+def test_bytecode_store_reused_across_caches(tmp_path):
+    StrategyCache(bytecode_dir=tmp_path).load(CODE, preset={'calls': []})
+    assert (tmp_path / f"{code_hash(CODE)}.bin").exists()
+
+    fresh = StrategyCache(bytecode_dir=tmp_path)
+    namespace = fresh.load(CODE, preset={'calls': []})
+    assert fresh.disk_hits == 1
+    assert namespace['generate_signal'](1.0, [])['price'] == 1.0
+
+
+def test_syntax_error_is_not_cached():
+    cache = StrategyCache()
+    with pytest.raises(SyntaxError):
+        cache.load("def broken(:")
+    assert len(cache) == 0
+
+
+def test_strategy_tester_uses_cache():
+    tester = StrategyTester.__new__(StrategyTester)
+    tester.strategy_cache = StrategyCache()
+    code = tester._get_default_strategy()
+
+    first = tester._compile_strategy(code)
+    second = tester._compile_strategy(code)
+    assert first is second
+    assert tester.strategy_cache.get_stats() == {'entries': 1, 'hits': 1, 'misses': 1, 'disk_hits': 0}
+    assert tester._compile_strategy("raise RuntimeError('boom')") is None
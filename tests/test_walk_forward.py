@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Walk-forward / purged k-fold 하네스 테스트
+
+- 폴드 경계 (롤링/앵커드/embargo/purge)
+- 신호는 조합마다 한 번만 계산, 병렬 == 순차
+- 단일 구간 평가 == BacktestEngine 직접 실행
+- OOS 성과 저하가 OverfittingDetector 점수에 반영
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzer.rule_based.overfitting_detector import OverfittingDetector
+from src.backtester.backtest_engine import BacktestEngine
+from src.backtester.vectorbt_engine import sma_crossover_strategy
+from src.backtester.walk_forward import (
+    FoldResult, WalkForwardEngine, WalkForwardResult, purged_kfold_folds, walk_forward_folds,
+)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(11)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 1200)))
+    return pd.DataFrame({'close': close}, index=pd.date_range('2023-01-01', periods=1200, freq='1h'))
+
+
+def counting_strategy(calls):
+    def strategy(data, params):
+        calls.append(params)
+        return sma_crossover_strategy(data, params)
+    return strategy
+
+
+class TestFolds:
+
+    def test_rolling_with_embargo(self):
+        folds = walk_forward_folds(100, train_size=40, test_size=20, embargo=5)
+        assert [(f.train, f.test) for f in folds] == [
+            (((0, 40),), (45, 65)),
+            (((20, 60),), (65, 85)),
+        ]
+
+    def test_anchored(self):
+        folds = walk_forward_folds(100, train_size=40, test_size=20, anchored=True)
+        assert [f.train[0] for f in folds] == [(0, 40), (0, 60), (0, 80)]
+
+    def test_purged_kfold(self):
+        folds = purged_kfold_folds(100, n_splits=4, embargo=3, purge=2)
+        assert folds[0].train == ((28, 100),) and folds[0].test == (0, 25)
+        assert folds[1].train == ((0, 23), (53, 100))
+        assert folds[3].train == ((0, 73),)
+
+
+class TestWalkForwardEngine:
+
+    GRID = {'fast_period': [5, 10], 'slow_period': [20, 40]}
+
+    def test_signals_computed_once_and_parallel_matches(self, data):
+        engine = BacktestEngine(use_vectorbt=False)
+        folds = walk_forward_folds(len(data), train_size=400, test_size=200, embargo=10)
+        calls = []
+
+        sequential = WalkForwardEngine(engine, n_jobs=1).run(data, counting_strategy(calls), folds, self.GRID)
+        assert len(calls) == 4                      # 폴드 수와 무관하게 조합당 1회
+        assert sequential.signal_evaluations == 4
+
+        parallel = WalkForwardEngine(engine, n_jobs=2).run(data, counting_strategy([]), folds, self.GRID)
+        assert parallel.to_dict() == sequential.to_dict()
+
+    def test_single_segment_matches_direct_backtest(self, data):
+        engine = BacktestEngine(use_vectorbt=False)
+        folds = walk_forward_folds(len(data), train_size=600, test_size=300)
+        params = {'fast_period': 10, 'slow_period': 40}
+        result = WalkForwardEngine(engine, n_jobs=1).run(
+            data, sma_crossover_strategy, folds, {k: [v] for k, v in params.items()}
+        )
+
+        # 전체 시계열 신호를 슬라이스 == 워밍업된 지표로 검증 구간만 백테스트
+        entries, exits = sma_crossover_strategy(data, params)
+        start, end = folds[0].test
+        direct = engine.run_backtest(data.iloc[start:end], entries.iloc[start:end], exits.iloc[start:end])
+        test = result.folds[0].test
+        assert test['total_return'] == pytest.approx(direct.total_return)
+        assert test['total_trades'] == direct.total_trades
+        assert test['sharpe_ratio'] == pytest.approx(direct.sharpe_ratio)
+
+    def test_registered_sweep_shares_indicators(self, data):
+        folds = purged_kfold_folds(len(data), n_splits=3, embargo=12)
+        result = WalkForwardEngine(BacktestEngine(use_vectorbt=False), n_jobs=1).run(
+            data, sma_crossover_strategy, folds, self.GRID
+        )
+        assert result.signal_evaluations == 1
+        assert result.combinations == 4
+        assert set(result.degradation()) >= {'efficiency', 'oos_profitable_ratio', 'param_stability'}
+
+
+class TestOverfittingScore:
+
+    def test_oos_degradation_raises_score(self):
+        code = 'length = input.int(14, "Length")\nma = ta.sma(close, length)'
+        fold = walk_forward_folds(100, 40, 20)[0]
+
+        def result(test_return, combinations=4):
+            train = {'total_return': 20.0, 'sharpe_ratio': 2.0, 'bars': 40}
+            test = {'total_return': test_return, 'sharpe_ratio': test_return / 10, 'bars': 20}
+            return WalkForwardResult(
+                [FoldResult(fold, {'n': 1}, train, test) for _ in range(4)], combinations=combinations
+            )
+
+        detector = OverfittingDetector()
+        baseline = detector.analyze(code)
+        robust = detector.analyze(code, walk_forward=result(10.0).degradation())
+        degraded = detector.analyze(code, walk_forward=result(-5.0).degradation())
+
+        assert robust.score == baseline.score
+        assert degraded.score >= baseline.score + 50
+        assert degraded.walk_forward['oos_profitable_ratio'] == 0.0
+        assert any('OOS' in c for c in degraded.concerns)
+
+        # 파라미터 그리드 없이 같은 신호를 나눠 본 결과는 점수에 반영하지 않음
+        fixed = detector.analyze(code, walk_forward=result(-5.0, combinations=1).degradation())
+        assert fixed.score == baseline.score
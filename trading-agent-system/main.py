@@ -68,7 +68,7 @@ async def run_strategy_architect(pine_file: str) -> None:
 
 async def run_backtest(strategy_file: str, symbol: str = "BTCUSDT") -> None:
     """백테스트 실행"""
-    from src.backtest import BacktestEngine
+    from src.backtest import DEFAULT_RESULT_STORE, BacktestEngine
     from src.data import BinanceDataCollector
 
     strategy_path = Path(strategy_file)
@@ -96,7 +96,7 @@ async def run_backtest(strategy_file: str, symbol: str = "BTCUSDT") -> None:
             return
 
     print(f"백테스트 실행 중: {strategy_file}")
-    engine = BacktestEngine()
+    engine = BacktestEngine(result_store=DEFAULT_RESULT_STORE)
 
     try:
         metrics = engine.run_from_file(
@@ -0,0 +1,230 @@
+"""
+재귀 지표 커널 벤치마크
+
+기존 pandas `.iloc` 루프 구현과 배열 커널(kernels.py)을 비교하여
+지표별 속도 향상과 결과 동일성(비트 단위)을 출력
+
+사용법:
+    python scripts/benchmark_indicators.py --bars 50000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from indicators import ADX, KAMA, ParabolicSAR, Supertrend
+from indicators.kernels import NUMBA_AVAILABLE
+
+
+# ============================================================
+# 기존 구현 (비교 기준)
+# ============================================================
+
+def legacy_supertrend(high, low, close, period=10, multiplier=3.0):
+    tr = pd.concat([
+        high - low,
+        abs(high - close.shift(1)),
+        abs(low - close.shift(1))
+    ], axis=1).max(axis=1)
+    atr = tr.ewm(span=period, adjust=False).mean()
+
+    hl2 = (high + low) / 2
+    upper_band = hl2 + (multiplier * atr)
+    lower_band = hl2 - (multiplier * atr)
+
+    supertrend = pd.Series(index=close.index, dtype=float)
+    direction = pd.Series(index=close.index, dtype=int)
+
+    supertrend.iloc[0] = upper_band.iloc[0]
+    direction.iloc[0] = -1
+
+    for i in range(1, len(close)):
+        if close.iloc[i] > supertrend.iloc[i-1]:
+            supertrend.iloc[i] = lower_band.iloc[i]
+            direction.iloc[i] = 1
+        elif close.iloc[i] < supertrend.iloc[i-1]:
+            supertrend.iloc[i] = upper_band.iloc[i]
+            direction.iloc[i] = -1
+        else:
+            supertrend.iloc[i] = supertrend.iloc[i-1]
+            direction.iloc[i] = direction.iloc[i-1]
+
+            if direction.iloc[i] == 1 and lower_band.iloc[i] > supertrend.iloc[i]:
+                supertrend.iloc[i] = lower_band.iloc[i]
+            elif direction.iloc[i] == -1 and upper_band.iloc[i] < supertrend.iloc[i]:
+                supertrend.iloc[i] = upper_band.iloc[i]
+
+    return pd.DataFrame({"Supertrend": supertrend, "Direction": direction})
+
+
+def legacy_parabolic_sar(high, low, af_start=0.02, af_increment=0.02, af_max=0.2):
+    sar = pd.Series(index=high.index, dtype=float)
+    trend = pd.Series(index=high.index, dtype=int)
+    af = af_start
+    ep = low.iloc[0]
+
+    sar.iloc[0] = high.iloc[0]
+    trend.iloc[0] = -1
+
+    for i in range(1, len(high)):
+        if trend.iloc[i-1] == 1:
+            sar.iloc[i] = sar.iloc[i-1] + af * (ep - sar.iloc[i-1])
+            sar.iloc[i] = min(sar.iloc[i], low.iloc[i-1], low.iloc[i-2] if i > 1 else low.iloc[i-1])
+
+            if low.iloc[i] < sar.iloc[i]:
+                trend.iloc[i] = -1
+                sar.iloc[i] = ep
+                ep = low.iloc[i]
+                af = af_start
+            else:
+                trend.iloc[i] = 1
+                if high.iloc[i] > ep:
+                    ep = high.iloc[i]
+                    af = min(af + af_increment, af_max)
+        else:
+            sar.iloc[i] = sar.iloc[i-1] + af * (ep - sar.iloc[i-1])
+            sar.iloc[i] = max(sar.iloc[i], high.iloc[i-1], high.iloc[i-2] if i > 1 else high.iloc[i-1])
+
+            if high.iloc[i] > sar.iloc[i]:
+                trend.iloc[i] = 1
+                sar.iloc[i] = ep
+                ep = high.iloc[i]
+                af = af_start
+            else:
+                trend.iloc[i] = -1
+                if low.iloc[i] < ep:
+                    ep = low.iloc[i]
+                    af = min(af + af_increment, af_max)
+
+    return pd.DataFrame({"SAR": sar, "Trend": trend})
+
+
+def legacy_adx(high, low, close, period=14):
+    tr1 = high - low
+    tr2 = abs(high - close.shift(1))
+    tr3 = abs(low - close.shift(1))
+    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+    up_move = high - high.shift(1)
+    down_move = low.shift(1) - low
+
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
+
+    atr = pd.Series(tr).ewm(span=period, adjust=False).mean()
+    plus_di = 100 * pd.Series(plus_dm).ewm(span=period, adjust=False).mean() / atr
+    minus_di = 100 * pd.Series(minus_dm).ewm(span=period, adjust=False).mean() / atr
+
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+    adx = dx.ewm(span=period, adjust=False).mean()
+
+    return pd.DataFrame({"ADX": adx, "+DI": plus_di, "-DI": minus_di})
+
+
+def legacy_kama(close, length=20, fast_length=15, slow_length=50):
+    values = close.values
+    n = len(values)
+    kama = np.zeros(n)
+    kama[0] = values[0]
+    fast_sc = 2.0 / (fast_length + 1)
+    slow_sc = 2.0 / (slow_length + 1)
+
+    for i in range(1, n):
+        if i >= length:
+            change = abs(values[i] - values[i - length])
+            volatility = np.sum(np.abs(np.diff(values[i - length:i + 1])))
+            er = change / volatility if volatility != 0 else 0
+        else:
+            er = 0
+        sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
+        kama[i] = kama[i - 1] + sc * (values[i] - kama[i - 1])
+
+    return pd.Series(kama, index=close.index)
+
+
+# ============================================================
+# 벤치마크
+# ============================================================
+
+def make_ohlcv(bars: int, seed: int = 42) -> pd.DataFrame:
+    """랜덤 워크 OHLCV 생성"""
+    rng = np.random.default_rng(seed)
+    close = 30000 + np.cumsum(rng.standard_normal(bars) * 25)
+    high = close + np.abs(rng.standard_normal(bars) * 15)
+    low = close - np.abs(rng.standard_normal(bars) * 15)
+    index = pd.date_range("2020-01-01", periods=bars, freq="min")
+    return pd.DataFrame({"High": high, "Low": low, "Close": close}, index=index)
+
+
+def best_of(func, repeat: int) -> float:
+    """repeat회 실행 중 최단 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재귀 지표 커널 벤치마크")
+    parser.add_argument("--bars", type=int, default=50_000, help="봉 개수")
+    parser.add_argument("--repeat", type=int, default=3, help="커널 반복 측정 횟수")
+    args = parser.parse_args()
+
+    df = make_ohlcv(args.bars)
+    high, low, close = df["High"], df["Low"], df["Close"]
+
+    cases = [
+        ("Supertrend",
+         lambda: legacy_supertrend(high, low, close),
+         lambda: Supertrend(high, low, close)),
+        ("ParabolicSAR",
+         lambda: legacy_parabolic_sar(high, low),
+         lambda: ParabolicSAR(high, low)),
+        ("ADX",
+         lambda: legacy_adx(high, low, close),
+         lambda: ADX(high, low, close)),
+        ("KAMA",
+         lambda: legacy_kama(close),
+         lambda: KAMA(close)),
+    ]
+
+    print("=" * 72)
+    print(f"재귀 지표 커널 벤치마크 - {args.bars:,} bars (numba: {NUMBA_AVAILABLE})")
+    print("=" * 72)
+    print(f"{'Indicator':<14}{'legacy (s)':>12}{'kernel (s)':>12}{'speedup':>10}{'identical':>12}")
+    print("-" * 72)
+
+    for name, legacy, kernel in cases:
+        kernel()  # JIT 컴파일 워밍업
+
+        start = time.perf_counter()
+        expected = legacy()
+        legacy_time = time.perf_counter() - start
+
+        kernel_time = best_of(kernel, args.repeat)
+        result = kernel()
+
+        identical = np.array_equal(
+            np.asarray(expected, dtype=np.float64),
+            np.asarray(result, dtype=np.float64),
+            equal_nan=True
+        )
+        speedup = legacy_time / kernel_time if kernel_time > 0 else float("inf")
+
+        print(f"{name:<14}{legacy_time:>12.4f}{kernel_time:>12.4f}{speedup:>9.1f}x{str(identical):>12}")
+
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
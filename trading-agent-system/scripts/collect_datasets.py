@@ -2,8 +2,14 @@
 Binance 데이터셋 수집 스크립트
 
 25개 이상의 데이터셋을 수집하여 백테스트 인프라 완성
+이미 수집한 데이터셋은 마지막 저장 시각 이후(tail)만 받는 증분 갱신
+
+사용법:
+    python scripts/collect_datasets.py --concurrency 16
+    python scripts/collect_datasets.py --replay-store /path/to/store  # 오프라인 리허설
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -13,9 +19,11 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 from data.binance_collector import BinanceDataCollector
+from data.ohlcv_store import OHLCVStore
+from data.replay_exchange import ReplayExchange
 
 
-async def main():
+async def main(args: argparse.Namespace):
     """메인 실행 함수"""
 
     print("=" * 80)
@@ -24,8 +32,11 @@ async def main():
     print()
 
     # 데이터 수집기 초기화 (API 키 불필요 - 공개 데이터)
+    exchange = ReplayExchange(OHLCVStore(args.replay_store)) if args.replay_store else None
     collector = BinanceDataCollector(
-        data_dir=str(project_root / "data" / "datasets")
+        data_dir=str(project_root / "data" / "datasets"),
+        exchange=exchange,
+        max_concurrency=args.concurrency
     )
 
     # 수집할 심볼 목록 (25개 이상)
@@ -70,7 +81,8 @@ async def main():
         symbols=symbols,
         intervals=intervals,
         start_date=start_date,
-        end_date=None  # 현재까지
+        end_date=None,  # 현재까지
+        save_format="parquet"  # 최적화/백테스트 스크립트가 읽는 스냅샷 갱신
     )
 
     print()
@@ -128,4 +140,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Binance 데이터셋 수집")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 수집 데이터셋 수")
+    parser.add_argument("--replay-store", default=None, help="거래소 대신 재생할 OHLCVStore 경로")
+    asyncio.run(main(parser.parse_args()))
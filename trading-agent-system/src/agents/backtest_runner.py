@@ -9,9 +9,12 @@ Backtest Runner Agent
 """
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from claude_agent_sdk import AgentDefinition
 
+if TYPE_CHECKING:
+    from ..backtest.matrix import ResultsTable
+
 
 @dataclass
 class BacktestConfig:
@@ -205,21 +208,22 @@ class BacktestRunnerAgent:
 총 {len(config.symbols) * len(config.timeframes)}개의 백테스트를 실행합니다."""
 
     @staticmethod
-    def aggregate_results(results: list[BacktestResult]) -> AggregatedResults:
-        """백테스트 결과 집계"""
+    def aggregate_results(
+        results: "list[BacktestResult] | ResultsTable",
+        strategy_name: str | None = None
+    ) -> AggregatedResults:
+        """
+        백테스트 결과 집계
+
+        Args:
+            results: BacktestResult 목록 또는 MatrixBacktestExecutor의 ResultsTable
+            strategy_name: ResultsTable에서 집계할 전략 (None이면 첫 번째 전략)
+        """
+        if not isinstance(results, list):
+            return BacktestRunnerAgent._aggregate_table(results, strategy_name)
+
         if not results:
-            return AggregatedResults(
-                strategy_name="Unknown",
-                total_tests=0,
-                avg_return=0,
-                avg_sharpe=0,
-                avg_max_drawdown=0,
-                avg_win_rate=0,
-                avg_profit_factor=0,
-                best_result=None,
-                worst_result=None,
-                consistency_score=0,
-            )
+            return BacktestRunnerAgent._empty_aggregate(strategy_name or "Unknown")
 
         strategy_name = results[0].strategy_name
         total_tests = len(results)
@@ -253,6 +257,66 @@ class BacktestRunnerAgent:
             results=results,
         )
 
+    @staticmethod
+    def _empty_aggregate(strategy_name: str) -> AggregatedResults:
+        return AggregatedResults(
+            strategy_name=strategy_name,
+            total_tests=0,
+            avg_return=0,
+            avg_sharpe=0,
+            avg_max_drawdown=0,
+            avg_win_rate=0,
+            avg_profit_factor=0,
+            best_result=None,
+            worst_result=None,
+            consistency_score=0,
+        )
+
+    @staticmethod
+    def _aggregate_table(table: "ResultsTable", strategy_name: str | None) -> AggregatedResults:
+        """ResultsTable의 전략 행 하나를 컬럼 단위로 집계"""
+        strategy_name = strategy_name or (table.strategies[0] if table.strategies else "Unknown")
+        if strategy_name not in table.strategies:
+            return BacktestRunnerAgent._empty_aggregate(strategy_name)
+
+        row = table.strategies.index(strategy_name)
+        ok = table.succeeded[row]
+        if not ok.any():
+            return BacktestRunnerAgent._empty_aggregate(strategy_name)
+
+        returns = table.metric("total_return")[row, ok]
+        results = [
+            BacktestResult(
+                strategy_name=strategy_name,
+                symbol=m.symbol,
+                timeframe=m.interval,
+                total_return_pct=m.total_return,
+                sharpe_ratio=m.sharpe_ratio,
+                max_drawdown_pct=m.max_drawdown,
+                win_rate_pct=m.win_rate,
+                profit_factor=m.profit_factor,
+                total_trades=m.total_trades,
+                avg_trade_pct=m.avg_trade_return,
+                final_equity=m.equity_final,
+                data_path=f"{m.symbol}_{m.interval}",
+            )
+            for m in table.strategy_metrics(strategy_name)
+        ]
+
+        return AggregatedResults(
+            strategy_name=strategy_name,
+            total_tests=len(results),
+            avg_return=float(returns.mean()),
+            avg_sharpe=float(table.metric("sharpe_ratio")[row, ok].mean()),
+            avg_max_drawdown=float(table.metric("max_drawdown")[row, ok].mean()),
+            avg_win_rate=float(table.metric("win_rate")[row, ok].mean()),
+            avg_profit_factor=float(table.metric("profit_factor")[row, ok].mean()),
+            best_result=results[int(returns.argmax())],
+            worst_result=results[int(returns.argmin())],
+            consistency_score=float((returns > 0).mean() * 100),
+            results=results,
+        )
+
     @staticmethod
     def check_pass_criteria(aggregated: AggregatedResults) -> tuple[bool, list[str]]:
         """Moon Dev 기준 통과 여부 확인"""
@@ -276,7 +340,11 @@ class BacktestRunnerAgent:
         return len(issues) == 0, issues
 
     def get_default_test_matrix(self) -> list[tuple[str, str]]:
-        """기본 테스트 매트릭스 반환 (심볼, 타임프레임)"""
+        """
+        기본 테스트 매트릭스 반환 (심볼, 타임프레임)
+
+        MatrixBacktestExecutor.run의 datasets 키 형식과 같습니다.
+        """
         symbols = [
             "BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT",
             "ADAUSDT", "DOGEUSDT", "DOTUSDT", "MATICUSDT", "AVAXUSDT"
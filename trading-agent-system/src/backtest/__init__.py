@@ -5,5 +5,31 @@ Backtesting.py 래퍼 및 유틸리티
 """
 
 from .engine import BacktestEngine, BacktestMetrics
+from .indicator_cache import CachedIndicatorsMixin, cached_strategy
+from .matrix import MatrixBacktestExecutor, ResultsTable
+from .result_store import DEFAULT_RESULT_STORE, DatasetFingerprint, ResultKey, ResultStore, run_fingerprint
+from .search import SearchStrategy, Study, TrialStore, make_searcher
+from .shared_data import SharedDataset, SharedDatasetHandle
+from .strategy_cache import StrategyCache, get_strategy_cache
 
-__all__ = ["BacktestEngine", "BacktestMetrics"]
+__all__ = [
+    "DEFAULT_RESULT_STORE",
+    "BacktestEngine",
+    "BacktestMetrics",
+    "CachedIndicatorsMixin",
+    "DatasetFingerprint",
+    "MatrixBacktestExecutor",
+    "ResultKey",
+    "ResultStore",
+    "ResultsTable",
+    "SearchStrategy",
+    "SharedDataset",
+    "SharedDatasetHandle",
+    "StrategyCache",
+    "Study",
+    "TrialStore",
+    "cached_strategy",
+    "get_strategy_cache",
+    "make_searcher",
+    "run_fingerprint",
+]
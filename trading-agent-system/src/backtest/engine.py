@@ -2,21 +2,31 @@
 Backtest Engine
 
 backtesting.py 래퍼 - 전략 실행 및 결과 수집
-임시 파일 기반 동적 전략 로딩 지원
+코드 해시 기반 컴파일 캐시로 동적 전략 로딩 지원
+결과 저장소가 있으면 (코드, 파라미터, 데이터셋, 엔진 버전)이 같은 실행은 건너뜀
+Strategy.I 지표는 (데이터셋 지문, 지표, 파라미터) 캐시에서 재사용
 """
 
 import json
-import importlib.util
-import tempfile
-import uuid
+from contextlib import nullcontext
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import backtesting
 import pandas as pd
 from backtesting import Backtest
 
+from src.indicators.cache import IndicatorCache, dataset_tag, get_indicator_cache
+
+from .indicator_cache import cached_strategy
+from .result_store import DatasetFingerprint, ResultKey, ResultStore, strategy_code_hash
+from .strategy_cache import StrategyCache, get_strategy_cache
+
+# 메트릭 계산 방식이 바뀌면 올려서 저장된 결과를 무효화
+ENGINE_REVISION = 1
+
 
 @dataclass
 class BacktestMetrics:
@@ -48,7 +58,11 @@ class BacktestEngine:
         initial_cash: float = 100_000,
         commission: float = 0.001,
         exclusive_orders: bool = True,
-        results_dir: str = "results"
+        results_dir: str = "results",
+        strategy_cache: StrategyCache | None = None,
+        result_store: ResultStore | str | Path | None = None,
+        indicator_cache: IndicatorCache | str | Path | None = None,
+        cache_indicators: bool = True
     ):
         """
         Args:
@@ -56,12 +70,35 @@ class BacktestEngine:
             commission: 수수료 비율 (0.001 = 0.1%)
             exclusive_orders: 동시 주문 비허용
             results_dir: 결과 저장 디렉토리
+            strategy_cache: 전략 코드 컴파일 캐시 (기본: 프로세스 공용 캐시)
+            result_store: 결과 저장소 또는 SQLite 경로 (None이면 매번 실행)
+            indicator_cache: Strategy.I 지표 캐시 또는 .npy 저장 디렉토리 (기본: 프로세스 공용 캐시)
+            cache_indicators: False면 지표 캐시를 사용하지 않음
         """
         self.initial_cash = initial_cash
         self.commission = commission
         self.exclusive_orders = exclusive_orders
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.strategy_cache = strategy_cache if strategy_cache is not None else get_strategy_cache()
+        if result_store is not None and not isinstance(result_store, ResultStore):
+            result_store = ResultStore(result_store)
+        self.result_store = result_store
+        if indicator_cache is None:
+            indicator_cache = get_indicator_cache()
+        elif not isinstance(indicator_cache, IndicatorCache):
+            indicator_cache = IndicatorCache(spill_dir=indicator_cache)
+        self.indicator_cache = indicator_cache
+        self.cache_indicators = cache_indicators
+
+    @property
+    def engine_version(self) -> str:
+        """결과에 영향을 주는 엔진 식별 정보 (라이브러리 버전 + 설정)"""
+        return (
+            f"backtesting.py/{backtesting.__version__};rev{ENGINE_REVISION};"
+            f"cash={self.initial_cash};commission={self.commission};"
+            f"exclusive={self.exclusive_orders}"
+        )
 
     def run(
         self,
@@ -70,6 +107,7 @@ class BacktestEngine:
         symbol: str = "UNKNOWN",
         interval: str = "1h",
         optimize: bool = False,
+        strategy_params: dict[str, Any] | None = None,
         **optimize_params
     ) -> BacktestMetrics:
         """
@@ -81,6 +119,7 @@ class BacktestEngine:
             symbol: 심볼명
             interval: 타임프레임
             optimize: 최적화 실행 여부
+            strategy_params: 전략 파라미터 오버라이드 (서브클래스 생성 없이 적용)
             **optimize_params: 최적화 파라미터
 
         Returns:
@@ -92,10 +131,33 @@ class BacktestEngine:
             if col not in data.columns:
                 raise ValueError(f"Missing required column: {col}")
 
+        # 저장소에 같은 실행 결과가 있으면 재사용 (최적화 실행은 제외)
+        result_key = None
+        if self.result_store is not None and not optimize:
+            source_hash = strategy_code_hash(strategy_class)
+            if source_hash is not None:
+                result_key = ResultKey.make(
+                    source_hash,
+                    strategy_params,
+                    DatasetFingerprint.of(data, symbol, interval),
+                    self.engine_version
+                )
+                stored = self.result_store.get(result_key)
+                if stored is not None:
+                    stored.update(
+                        strategy_name=strategy_class.__name__,
+                        symbol=symbol,
+                        interval=interval
+                    )
+                    return BacktestMetrics(**stored)
+
+        # 지표 캐시는 단일 실행에만 사용 (최적화는 워커 프로세스로 클래스를 피클링)
+        use_cache = self.cache_indicators and not (optimize and optimize_params)
+
         # Backtest 인스턴스 생성
         bt = Backtest(
             data,
-            strategy_class,
+            cached_strategy(strategy_class) if use_cache else strategy_class,
             cash=self.initial_cash,
             commission=self.commission,
             exclusive_orders=self.exclusive_orders
@@ -105,7 +167,12 @@ class BacktestEngine:
         if optimize and optimize_params:
             stats = bt.optimize(**optimize_params)
         else:
-            stats = bt.run()
+            cache_context = (
+                self.indicator_cache.activate(dataset_tag(symbol, interval))
+                if use_cache else nullcontext()
+            )
+            with cache_context:
+                stats = bt.run(**(strategy_params or {}))
 
         # 메트릭 추출
         metrics = self._extract_metrics(
@@ -116,6 +183,9 @@ class BacktestEngine:
             data=data
         )
 
+        if result_key is not None:
+            self.result_store.put(result_key, asdict(metrics), strategy_class.__name__)
+
         return metrics
 
     def run_from_file(
@@ -143,19 +213,12 @@ class BacktestEngine:
         if not strategy_path.exists():
             raise FileNotFoundError(f"Strategy file not found: {strategy_file}")
 
-        # 모듈 로드
-        spec = importlib.util.spec_from_file_location(
-            f"strategy_{strategy_path.stem}",
-            strategy_path
+        strategy_class = self.load_strategy_class(
+            strategy_path.read_text(encoding="utf-8"),
+            strategy_class_name,
+            module_name=f"strategy_{strategy_path.stem}",
+            filename=str(strategy_path)
         )
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Cannot load strategy from: {strategy_file}")
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        # Strategy 클래스 찾기
-        strategy_class = self._find_strategy_class(module, strategy_class_name)
 
         return self.run(
             strategy_class=strategy_class,
@@ -174,7 +237,7 @@ class BacktestEngine:
     ) -> BacktestMetrics:
         """
         코드 문자열에서 전략 로드 후 백테스트 실행
-        임시 파일을 생성하여 안전하게 모듈 로드
+        같은 코드는 캐시된 Strategy 클래스를 재사용 (임포트 생략)
 
         Args:
             strategy_code: Python 전략 코드 문자열
@@ -186,26 +249,39 @@ class BacktestEngine:
         Returns:
             BacktestMetrics
         """
-        # 임시 파일에 코드 저장
-        temp_dir = Path(tempfile.gettempdir())
-        temp_file = temp_dir / f"strategy_{uuid.uuid4().hex}.py"
-
-        try:
-            # 코드를 임시 파일로 저장
-            temp_file.write_text(strategy_code, encoding="utf-8")
-
-            # 파일 기반 로드 사용
-            return self.run_from_file(
-                strategy_file=str(temp_file),
-                data=data,
-                symbol=symbol,
-                interval=interval,
-                strategy_class_name=strategy_class_name
-            )
-        finally:
-            # 임시 파일 정리
-            if temp_file.exists():
-                temp_file.unlink()
+        strategy_class = self.load_strategy_class(strategy_code, strategy_class_name)
+
+        return self.run(
+            strategy_class=strategy_class,
+            data=data,
+            symbol=symbol,
+            interval=interval
+        )
+
+    def load_strategy_class(
+        self,
+        strategy_code: str,
+        strategy_class_name: str | None = None,
+        module_name: str | None = None,
+        filename: str | None = None
+    ) -> type:
+        """
+        코드 문자열의 Strategy 클래스 (코드 해시 기준 캐시)
+
+        Args:
+            strategy_code: Python 전략 코드 문자열
+            strategy_class_name: Strategy 클래스 이름 (None이면 자동 탐지)
+            module_name: 모듈 이름 (처음 컴파일할 때만 사용)
+            filename: 트레이스백에 표시할 파일명 (처음 컴파일할 때만 사용)
+
+        Returns:
+            Strategy 서브클래스
+        """
+        entry = self.strategy_cache.load(strategy_code, name=module_name, filename=filename)
+        return entry.resolve(
+            ("strategy_class", strategy_class_name),
+            lambda module: self._find_strategy_class(module, strategy_class_name)
+        )
 
     def _find_strategy_class(
         self,
@@ -0,0 +1,89 @@
+"""
+Strategy Indicator Cache
+
+backtesting.py Strategy.I 호출을 IndicatorCache로 메모이제이션
+
+- cached_strategy(cls): I()를 캐시 조회로 감싼 서브클래스 (클래스 이름/모듈은 그대로)
+- 캐시는 IndicatorCache.activate() 구간에서만 사용 (BacktestEngine.run이 활성화)
+- 키: 지표 함수 토큰 + 인자 지문 + 전략 데이터(OHLCV) 지문
+  전략 메서드나 전략 모듈에 정의된 함수(init의 lambda 등)는 전략 코드 해시와
+  인스턴스 파라미터도 키에 포함하므로, 같은 EMA(20)은 전략이 달라도 공유되지만
+  전략 고유 계산은 그 전략 코드/파라미터 안에서만 재사용됩니다.
+"""
+
+import json
+import weakref
+from functools import wraps
+from typing import Any, Callable
+
+from src.indicators.cache import Uncacheable, active_cache, fingerprint, function_token
+
+from .result_store import strategy_code_hash
+
+_data_fingerprints: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+
+def _strategy_extra(strategy: Any, func: Callable) -> dict[str, Any]:
+    """데이터 지문 (+ 전략 고유 함수면 전략 코드 해시)"""
+    data_fp = _data_fingerprints.get(strategy)
+    if data_fp is None:
+        data_fp = _data_fingerprints[strategy] = fingerprint(strategy.data.df)
+
+    extra: dict[str, Any] = {"data": data_fp}
+    owner = getattr(func, "__self__", None)
+    module = getattr(getattr(func, "__func__", func), "__module__", None)
+    if owner is strategy or module == type(strategy).__module__:
+        code = strategy_code_hash(getattr(type(strategy), "__original_strategy__", type(strategy)))
+        if code is None:
+            raise Uncacheable("전략 코드 해시 없음")
+        extra["code"] = code
+    return extra
+
+
+class CachedIndicatorsMixin:
+    """Strategy.I 결과를 활성 IndicatorCache에서 재사용"""
+
+    def I(self, func: Callable, *args, name=None, plot=True, overlay=None,  # noqa: E743
+          color=None, scatter=False, **kwargs):
+        active = active_cache()
+        if active is None:
+            return super().I(func, *args, name=name, plot=plot, overlay=overlay,
+                             color=color, scatter=scatter, **kwargs)
+        cache, dataset = active
+
+        try:
+            name_token = json.dumps(function_token(func, owner=self))
+            extra = _strategy_extra(self, func)
+        except Uncacheable:
+            name_token = None
+
+        # 이름을 유지하도록 wraps (backtesting.py가 func.__name__으로 범례 이름을 만듦)
+        @wraps(func)
+        def cached(*call_args, **call_kwargs):
+            compute = lambda: func(*call_args, **call_kwargs)  # noqa: E731
+            if name_token is None:
+                return cache.bypass(compute)
+            return cache.get_or_compute(
+                name_token, call_args, call_kwargs, compute, dataset=dataset, extra=extra
+            )
+
+        return super().I(cached, *args, name=name, plot=plot, overlay=overlay,
+                         color=color, scatter=scatter, **kwargs)
+
+
+def cached_strategy(strategy_class: type) -> type:
+    """I()가 활성 IndicatorCache를 거치는 서브클래스 (클래스별로 1개)"""
+    if issubclass(strategy_class, CachedIndicatorsMixin):
+        return strategy_class
+
+    # 원본 클래스에 보관 (약한 참조 사전은 서브클래스가 원본을 참조하므로 해제되지 않음)
+    subclass = vars(strategy_class).get("__cached_strategy__")
+    if subclass is None:
+        subclass = type(strategy_class.__name__, (CachedIndicatorsMixin, strategy_class), {
+            "__module__": strategy_class.__module__,
+            "__qualname__": strategy_class.__qualname__,
+            "__doc__": strategy_class.__doc__,
+            "__original_strategy__": strategy_class,
+        })
+        strategy_class.__cached_strategy__ = subclass
+    return subclass
@@ -0,0 +1,329 @@
+"""
+Matrix Backtest Executor
+
+전략 × (심볼, 타임프레임) 매트릭스의 모든 셀을 한 번에 백테스트
+
+- 데이터셋은 공유 메모리에 한 번만 적재하고 모든 전략이 읽기 전용으로 공유
+- 셀마다 BacktestEngine.run 실행 (프로세스 풀, max_workers로 제한)
+- 결과는 (전략, 데이터셋, 메트릭) 3차원 배열 하나로 반환 (ResultsTable)
+- 엔진에 결과 저장소가 있으면 이미 결과가 있는 셀은 실행하지 않음
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .engine import BacktestEngine, BacktestMetrics
+from .result_store import DatasetFingerprint, ResultKey, strategy_code_hash
+from .shared_data import SharedDataset, SharedDatasetHandle
+from .strategy_cache import code_hash
+
+# BacktestMetrics의 숫자 필드 (ResultsTable 메트릭 축 순서)
+METRIC_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(BacktestMetrics) if f.type in (float, int, "float", "int")
+)
+
+Dataset = tuple[str, str]  # (symbol, interval)
+
+
+@dataclass
+class ResultsTable:
+    """
+    매트릭스 백테스트 결과 (컬럼형)
+
+    values[s, d, m] = strategies[s]를 datasets[d]에서 실행한 metrics[m] 값
+    실패한 셀은 NaN이며 사유는 errors[(s, d)]에 기록됩니다.
+    """
+    strategies: list[str]
+    datasets: list[Dataset]
+    values: np.ndarray
+    periods: list[tuple[str, str]] = field(default_factory=list)  # 데이터셋별 (시작, 종료)
+    errors: dict[tuple[int, int], str] = field(default_factory=dict)
+    metrics: tuple[str, ...] = METRIC_FIELDS
+
+    @property
+    def succeeded(self) -> np.ndarray:
+        """(전략, 데이터셋) 성공 여부 마스크"""
+        return ~np.isnan(self.values[:, :, 0])
+
+    def metric(self, name: str) -> np.ndarray:
+        """메트릭 하나의 (전략, 데이터셋) 행렬 (뷰)"""
+        return self.values[:, :, self.metrics.index(name)]
+
+    def get(self, strategy: str, symbol: str, interval: str) -> BacktestMetrics | None:
+        """셀 하나의 BacktestMetrics (실패 시 None)"""
+        return self._cell(self.strategies.index(strategy), self.datasets.index((symbol, interval)))
+
+    def strategy_metrics(self, strategy: str) -> list[BacktestMetrics]:
+        """전략의 성공한 셀 목록 (데이터셋 순서) - BacktestEngine.aggregate_results 입력용"""
+        s = self.strategies.index(strategy)
+        return [self._cell(s, d) for d in np.flatnonzero(self.succeeded[s])]
+
+    def _cell(self, s: int, d: int) -> BacktestMetrics | None:
+        row = self.values[s, d]
+        if np.isnan(row[0]):
+            return None
+
+        symbol, interval = self.datasets[d]
+        start, end = self.periods[d] if self.periods else ("", "")
+        values = {
+            name: int(value) if name == "total_trades" else float(value)
+            for name, value in zip(self.metrics, row)
+        }
+        return BacktestMetrics(
+            strategy_name=self.strategies[s],
+            symbol=symbol,
+            interval=interval,
+            start_date=start,
+            end_date=end,
+            **values
+        )
+
+    def top_cells(self, metric: str = "sharpe_ratio", n: int = 10) -> list[dict[str, Any]]:
+        """메트릭 기준 상위 n개 셀 (실패 셀 제외)"""
+        scores = self.metric(metric)
+        s_idx, d_idx = np.nonzero(self.succeeded)
+        order = np.argsort(-scores[s_idx, d_idx], kind="stable")[:n]
+
+        return [
+            {
+                "strategy": self.strategies[s_idx[i]],
+                "symbol": self.datasets[d_idx[i]][0],
+                "interval": self.datasets[d_idx[i]][1],
+                "metrics": asdict(self._cell(s_idx[i], d_idx[i])),
+            }
+            for i in order
+        ]
+
+    def to_frame(self) -> pd.DataFrame:
+        """성공한 셀의 long-format DataFrame (strategy, symbol, interval, 메트릭...)"""
+        s_idx, d_idx = np.nonzero(self.succeeded)
+        frame = pd.DataFrame(self.values[s_idx, d_idx], columns=list(self.metrics))
+        frame.insert(0, "strategy", [self.strategies[s] for s in s_idx])
+        frame.insert(1, "symbol", [self.datasets[d][0] for d in d_idx])
+        frame.insert(2, "interval", [self.datasets[d][1] for d in d_idx])
+        return frame
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 (NaN은 None)"""
+        values = self.values.astype(object)
+        values[np.isnan(self.values)] = None
+        return {
+            "strategies": self.strategies,
+            "datasets": [list(d) for d in self.datasets],
+            "metrics": list(self.metrics),
+            "values": values.tolist(),
+            "errors": [
+                {
+                    "strategy": self.strategies[s],
+                    "symbol": self.datasets[d][0],
+                    "interval": self.datasets[d][1],
+                    "error": error,
+                }
+                for (s, d), error in sorted(self.errors.items())
+            ],
+        }
+
+
+# ============================================================
+# 프로세스 풀 워커
+# ============================================================
+
+_worker_frames: list[pd.DataFrame] = []
+_worker_shared: list[SharedDataset] = []
+_worker_sources: list[type | str] = []
+_worker_labels: list[Dataset] = []
+_worker_classes: dict[int, type | Exception] = {}
+_worker_engine: BacktestEngine | None = None
+
+
+def _init_worker(
+    handles: list[SharedDatasetHandle],
+    labels: list[Dataset],
+    sources: list[type | str],
+    engine_config: dict[str, Any]
+) -> None:
+    """워커 시작 시 공유 메모리 데이터셋에 한 번만 연결"""
+    global _worker_frames, _worker_shared, _worker_sources, _worker_labels
+    global _worker_classes, _worker_engine
+
+    _worker_shared = [SharedDataset.attach(handle) for handle in handles]
+    _worker_frames = [ds.to_frame() for ds in _worker_shared]
+    _worker_labels = labels
+    _worker_sources = sources
+    _worker_classes = {}
+    _worker_engine = BacktestEngine(**engine_config)
+
+
+def _strategy_class(strategy_idx: int) -> type:
+    """전략 클래스 (코드 문자열은 워커의 StrategyCache로 한 번만 컴파일)"""
+    if strategy_idx not in _worker_classes:
+        source = _worker_sources[strategy_idx]
+        try:
+            if isinstance(source, str):
+                source = _worker_engine.load_strategy_class(source)
+            _worker_classes[strategy_idx] = source
+        except Exception as e:
+            _worker_classes[strategy_idx] = e
+
+    cls = _worker_classes[strategy_idx]
+    if isinstance(cls, Exception):
+        raise cls
+    return cls
+
+
+def _run_cell(strategy_idx: int, dataset_idx: int) -> tuple[list[float] | None, str | None]:
+    """(전략, 데이터셋) 셀 하나 실행 -> (메트릭 값 목록, error)"""
+    symbol, interval = _worker_labels[dataset_idx]
+    try:
+        metrics = _worker_engine.run(
+            strategy_class=_strategy_class(strategy_idx),
+            data=_worker_frames[dataset_idx],
+            symbol=symbol,
+            interval=interval
+        )
+        return [float(getattr(metrics, name)) for name in METRIC_FIELDS], None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"[:200]
+
+
+class MatrixBacktestExecutor:
+    """전략 × 데이터셋 매트릭스 백테스트 실행기"""
+
+    def __init__(
+        self,
+        engine: BacktestEngine | None = None,
+        max_workers: int | None = None
+    ):
+        """
+        Args:
+            engine: 수수료/초기 자본 설정을 가져올 엔진 (기본: BacktestEngine())
+            max_workers: 병렬 워커 수 (None: 모든 코어, 1: 현재 프로세스에서 순차 실행)
+        """
+        self.engine = engine or BacktestEngine()
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    @property
+    def engine_config(self) -> dict[str, Any]:
+        return {
+            "initial_cash": self.engine.initial_cash,
+            "commission": self.engine.commission,
+            "exclusive_orders": self.engine.exclusive_orders,
+            "results_dir": str(self.engine.results_dir),
+            "result_store": str(self.engine.result_store.db_path) if self.engine.result_store is not None else None,
+            "indicator_cache": (
+                str(self.engine.indicator_cache.spill_dir)
+                if self.engine.indicator_cache.spill_dir is not None else None
+            ),
+            "cache_indicators": self.engine.cache_indicators,
+        }
+
+    def run(
+        self,
+        strategies: Mapping[str, type | str],
+        datasets: Mapping[Dataset, pd.DataFrame]
+    ) -> ResultsTable:
+        """
+        모든 (전략, 데이터셋) 셀 백테스트
+
+        Args:
+            strategies: {이름: Strategy 클래스 또는 전략 코드 문자열}
+                (프로세스 풀에서는 클래스가 모듈 최상위에 정의되어 있어야 함)
+            datasets: {(symbol, interval): OHLCV DataFrame}
+
+        Returns:
+            ResultsTable
+        """
+        names = list(strategies)
+        sources = [strategies[name] for name in names]
+        labels = list(datasets)
+        frames = [datasets[label] for label in labels]
+
+        table = ResultsTable(
+            strategies=names,
+            datasets=labels,
+            values=np.full((len(names), len(labels), len(METRIC_FIELDS)), np.nan),
+            periods=[(str(df.index.min()), str(df.index.max())) for df in frames],
+        )
+        cells = [(s, d) for s in range(len(names)) for d in range(len(labels))]
+        cells = self._fill_from_store(table, sources, frames, cells)
+        if not cells:
+            return table
+
+        def record(s: int, d: int, values: list[float] | None, error: str | None) -> None:
+            if values is None:
+                table.errors[(s, d)] = error or "unknown error"
+            else:
+                table.values[s, d] = values
+
+        if self.max_workers <= 1 or len(cells) == 1:
+            global _worker_frames, _worker_sources, _worker_labels, _worker_classes, _worker_engine
+            _worker_frames, _worker_sources, _worker_labels = frames, sources, labels
+            _worker_classes, _worker_engine = {}, self.engine
+            try:
+                for s, d in cells:
+                    record(s, d, *_run_cell(s, d))
+            finally:
+                _worker_frames, _worker_sources, _worker_classes = [], [], {}
+            return table
+
+        shared = [SharedDataset.create(symbol, df) for (symbol, _), df in zip(labels, frames)]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(cells)),
+                initializer=_init_worker,
+                initargs=([ds.handle for ds in shared], labels, sources, self.engine_config)
+            ) as executor:
+                futures = {executor.submit(_run_cell, s, d): (s, d) for s, d in cells}
+                for future in as_completed(futures):
+                    s, d = futures[future]
+                    try:
+                        record(s, d, *future.result())
+                    except Exception as e:
+                        record(s, d, None, f"{type(e).__name__}: {e}"[:200])
+        finally:
+            for ds in shared:
+                ds.close()
+                ds.unlink()
+
+        return table
+
+    def _fill_from_store(
+        self,
+        table: ResultsTable,
+        sources: list[type | str],
+        frames: list[pd.DataFrame],
+        cells: list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """결과 저장소에 있는 셀은 표에 채우고 실행할 셀만 반환"""
+        store = self.engine.result_store
+        if store is None or not cells:
+            return cells
+
+        hashes = [
+            code_hash(source) if isinstance(source, str) else strategy_code_hash(source)
+            for source in sources
+        ]
+        fingerprints = [
+            DatasetFingerprint.of(df, symbol, interval)
+            for (symbol, interval), df in zip(table.datasets, frames)
+        ]
+        keys = {
+            (s, d): ResultKey.make(hashes[s], None, fingerprints[d], self.engine.engine_version)
+            for s, d in cells
+            if hashes[s] is not None
+        }
+        found = store.get_many(keys.values())
+
+        remaining = []
+        for cell in cells:
+            metrics = found.get(keys.get(cell))
+            if metrics is None:
+                remaining.append(cell)
+            else:
+                table.values[cell] = [float(metrics[name]) for name in METRIC_FIELDS]
+        return remaining
@@ -0,0 +1,423 @@
+"""
+Backtest Result Store
+
+백테스트 결과를 하나의 SQLite 테이블에 인덱스와 함께 저장하고 재사용
+
+- 키: (전략 코드 해시, 파라미터, 데이터셋 지문, 엔진 버전)의 SHA-256
+- 데이터셋 지문: 심볼, 타임프레임, 첫/마지막 타임스탬프, 행 수
+- 실행 전에 키로 조회하여 이미 결과가 있으면 백테스트를 건너뜀
+- 주요 메트릭은 컬럼으로 저장하여 랭킹/차트 쿼리에 JSON 파싱이 필요 없음
+
+src/backtester/result_store.py와 같은 스키마이므로 두 쪽이 같은 DB 파일을 공유할 수 있습니다.
+"""
+
+import hashlib
+import inspect
+import json
+import math
+import os
+import sqlite3
+import sys
+import threading
+import types
+import weakref
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+import pandas as pd
+
+from .strategy_cache import code_hash
+
+DEFAULT_RESULT_STORE = "data/backtest_results.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS backtest_results (
+    result_key TEXT PRIMARY KEY,
+    code_hash TEXT NOT NULL,
+    strategy_name TEXT,
+    params_json TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    data_start TEXT NOT NULL,
+    data_end TEXT NOT NULL,
+    data_rows INTEGER NOT NULL,
+    engine_version TEXT NOT NULL,
+    total_return REAL,
+    sharpe_ratio REAL,
+    max_drawdown REAL,
+    win_rate REAL,
+    profit_factor REAL,
+    total_trades INTEGER,
+    metrics_json TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_strategy ON backtest_results(strategy_name, code_hash);
+CREATE INDEX IF NOT EXISTS idx_results_dataset ON backtest_results(symbol, interval);
+CREATE INDEX IF NOT EXISTS idx_results_sharpe ON backtest_results(sharpe_ratio DESC);
+"""
+
+# 컬럼으로 구체화하는 메트릭 (metrics dict 키)
+METRIC_COLUMNS = (
+    "total_return",
+    "sharpe_ratio",
+    "max_drawdown",
+    "win_rate",
+    "profit_factor",
+    "total_trades",
+)
+
+
+def _timestamp_str(value: Any) -> str:
+    """타임스탬프를 ISO 문자열로 (정수는 epoch ms로 간주)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return pd.Timestamp(int(value), unit="ms").isoformat()
+    try:
+        return pd.Timestamp(value).isoformat()
+    except (TypeError, ValueError):
+        return str(value)
+
+
+@dataclass(frozen=True)
+class DatasetFingerprint:
+    """데이터셋 식별 정보 (내용 전체 해시 대신 범위와 크기)"""
+    symbol: str
+    interval: str
+    start: str
+    end: str
+    rows: int
+
+    @classmethod
+    def of(cls, data: pd.DataFrame, symbol: str, interval: str) -> "DatasetFingerprint":
+        """DataFrame 인덱스 기준 지문"""
+        if len(data) == 0:
+            return cls(symbol, interval, "", "", 0)
+        return cls(symbol, interval, _timestamp_str(data.index[0]), _timestamp_str(data.index[-1]), len(data))
+
+
+@dataclass(frozen=True)
+class ResultKey:
+    """결과 저장소 키"""
+    code_hash: str
+    params: str  # 정렬된 JSON
+    dataset: DatasetFingerprint
+    engine_version: str
+
+    @classmethod
+    def make(
+        cls,
+        code_hash: str,
+        params: Mapping[str, Any] | None,
+        dataset: DatasetFingerprint,
+        engine_version: str
+    ) -> "ResultKey":
+        return cls(code_hash, json.dumps(dict(params or {}), sort_keys=True, default=str), dataset, engine_version)
+
+    @property
+    def digest(self) -> str:
+        payload = json.dumps(
+            [
+                self.code_hash,
+                self.params,
+                self.dataset.symbol,
+                self.dataset.interval,
+                self.dataset.start,
+                self.dataset.end,
+                self.dataset.rows,
+                self.engine_version,
+            ],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+_class_hashes: "weakref.WeakKeyDictionary[type, str | None]" = weakref.WeakKeyDictionary()
+
+
+def strategy_code_hash(strategy_class: type) -> str | None:
+    """
+    Strategy 클래스의 코드 해시
+
+    StrategyCache로 로드한 클래스는 모듈의 __code_hash__를, 파일에서 임포트한 클래스는
+    모듈 소스의 해시를 사용합니다. 소스를 찾을 수 없으면 None (저장소를 사용하지 않음).
+    """
+    if strategy_class in _class_hashes:
+        return _class_hashes[strategy_class]
+
+    # 동적으로 실행된 모듈은 sys.modules에 없으므로 메서드의 전역 네임스페이스에서 찾음
+    module = sys.modules.get(strategy_class.__module__)
+    result = getattr(module, "__code_hash__", None)
+    for attr in vars(strategy_class).values():
+        if result is not None:
+            break
+        if isinstance(attr, types.FunctionType):
+            result = attr.__globals__.get("__code_hash__")
+    if result is None:
+        try:
+            result = code_hash(inspect.getsource(module))
+        except (TypeError, OSError):
+            try:
+                result = code_hash(inspect.getsource(strategy_class))
+            except (TypeError, OSError):
+                result = None
+
+    _class_hashes[strategy_class] = result
+    return result
+
+
+def run_fingerprint(
+    strategy_class: type,
+    datasets: Iterable[tuple[str, pd.DataFrame]],
+    interval: str = ""
+) -> str:
+    """
+    (전략 코드 해시, 데이터셋 지문 목록)의 해시
+
+    중단 후 이어서 실행하는 기록(체크포인트, trial 기록)이 같은 코드와 데이터로
+    만들어졌는지 확인하는 데 사용합니다.
+    """
+    payload = json.dumps(
+        [
+            strategy_code_hash(strategy_class),
+            [asdict(DatasetFingerprint.of(data, symbol, interval)) for symbol, data in datasets],
+        ],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _json_default(value: Any) -> Any:
+    """numpy 스칼라 등 JSON 기본 타입이 아닌 값"""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _metric_value(value: Any) -> Any:
+    """NaN/inf는 NULL로 저장 (numpy 스칼라는 Python 값으로)"""
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class ResultStore:
+    """백테스트 결과 저장소 (스레드/프로세스 안전 - 스레드별 연결, WAL)"""
+
+    def __init__(self, db_path: str | Path, busy_timeout: float = 30.0):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            busy_timeout: 다른 프로세스가 쓰는 동안 대기할 시간 (초)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        """현재 스레드(포크된 프로세스면 새로)의 연결"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and getattr(self._local, "pid", None) == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+    # ------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------
+
+    def get(self, key: ResultKey) -> dict[str, Any] | None:
+        """키의 메트릭 dict (없으면 None)"""
+        row = self._conn().execute(
+            "SELECT metrics_json FROM backtest_results WHERE result_key = ?",
+            (key.digest,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row["metrics_json"])
+
+    def get_many(self, keys: Iterable[ResultKey]) -> dict[ResultKey, dict[str, Any]]:
+        """여러 키를 한 번에 조회 (결과가 있는 키만 반환)"""
+        by_digest = {key.digest: key for key in keys}
+        digests = list(by_digest)
+        found: dict[ResultKey, dict[str, Any]] = {}
+
+        conn = self._conn()
+        for i in range(0, len(digests), 500):
+            chunk = digests[i:i + 500]
+            rows = conn.execute(
+                f"SELECT result_key, metrics_json FROM backtest_results "
+                f"WHERE result_key IN ({','.join('?' * len(chunk))})",
+                chunk
+            ).fetchall()
+            for row in rows:
+                found[by_digest[row["result_key"]]] = json.loads(row["metrics_json"])
+
+        self.hits += len(found)
+        self.misses += len(digests) - len(found)
+        return found
+
+    def put(
+        self,
+        key: ResultKey,
+        metrics: Mapping[str, Any],
+        strategy_name: str | None = None
+    ) -> None:
+        """결과 저장 (같은 키는 덮어씀)"""
+        conn = self._conn()
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO backtest_results (
+                result_key, code_hash, strategy_name, params_json,
+                symbol, interval, data_start, data_end, data_rows, engine_version,
+                {', '.join(METRIC_COLUMNS)}, metrics_json, created_at
+            ) VALUES ({', '.join('?' * (12 + len(METRIC_COLUMNS)))})
+            """,
+            (
+                key.digest, key.code_hash, strategy_name, key.params,
+                key.dataset.symbol, key.dataset.interval, key.dataset.start,
+                key.dataset.end, key.dataset.rows, key.engine_version,
+                *(_metric_value(metrics.get(name)) for name in METRIC_COLUMNS),
+                json.dumps(dict(metrics), ensure_ascii=False, default=_json_default),
+                datetime.now().isoformat(),
+            )
+        )
+        conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM backtest_results").fetchone()[0]
+
+    # ------------------------------------------------------------
+    # 쿼리
+    # ------------------------------------------------------------
+
+    def latest_code_hash(self, strategy_name: str) -> str | None:
+        """전략 이름으로 가장 최근에 저장된 코드 해시"""
+        row = self._conn().execute(
+            "SELECT code_hash FROM backtest_results WHERE strategy_name = ? "
+            "ORDER BY created_at DESC LIMIT 1",
+            (strategy_name,)
+        ).fetchone()
+        return row["code_hash"] if row else None
+
+    def _where(
+        self,
+        strategy_name: str | None,
+        code_hash: str | None,
+        symbols: Iterable[str] | None,
+        interval: str | None,
+        engine_version: str | None
+    ) -> tuple[str, list[Any]]:
+        clauses, args = [], []
+        for column, value in (
+            ("strategy_name", strategy_name),
+            ("code_hash", code_hash),
+            ("interval", interval),
+            ("engine_version", engine_version),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                args.append(value)
+        if symbols is not None:
+            symbols = list(symbols)
+            clauses.append(f"symbol IN ({','.join('?' * len(symbols))})")
+            args.extend(symbols)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def query(
+        self,
+        strategy_name: str | None = None,
+        code_hash: str | None = None,
+        symbols: Iterable[str] | None = None,
+        interval: str | None = None,
+        engine_version: str | None = None,
+        order_by: str = "sharpe_ratio",
+        limit: int | None = None
+    ) -> pd.DataFrame:
+        """
+        개별 결과 (행 = 코드 × 파라미터 × 데이터셋)
+
+        Returns:
+            DataFrame (strategy_name, code_hash, symbol, interval, params, 메트릭 컬럼 ...)
+        """
+        if order_by not in METRIC_COLUMNS + ("created_at",):
+            raise ValueError(f"Cannot order by {order_by}")
+
+        where, args = self._where(strategy_name, code_hash, symbols, interval, engine_version)
+        sql = (
+            f"SELECT strategy_name, code_hash, symbol, interval, data_start, data_end, data_rows, "
+            f"engine_version, params_json, {', '.join(METRIC_COLUMNS)}, created_at "
+            f"FROM backtest_results{where} ORDER BY {order_by} DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+
+        frame = pd.read_sql_query(sql, self._conn(), params=args)
+        frame.insert(4, "params", [json.loads(p) for p in frame.pop("params_json")])
+        return frame
+
+    def aggregate(
+        self,
+        strategy_name: str,
+        code_hash: str | None = None,
+        symbols: Iterable[str] | None = None,
+        interval: str | None = None,
+        engine_version: str | None = None
+    ) -> pd.DataFrame:
+        """
+        파라미터 조합별 데이터셋 평균 (optimization_results_{strategy}.csv와 같은 컬럼)
+
+        Args:
+            code_hash: 코드 버전 (기본: 가장 최근에 저장된 버전)
+
+        Returns:
+            DataFrame (avg_return, avg_sharpe, avg_win_rate, avg_profit_factor,
+                avg_max_drawdown, consistency_rate, total_tests, 파라미터 컬럼 ...)
+        """
+        code_hash = code_hash or self.latest_code_hash(strategy_name)
+        where, args = self._where(strategy_name, code_hash, symbols, interval, engine_version)
+        rows = self._conn().execute(
+            f"""
+            SELECT params_json,
+                   AVG(total_return) AS avg_return,
+                   AVG(sharpe_ratio) AS avg_sharpe,
+                   AVG(win_rate) AS avg_win_rate,
+                   AVG(profit_factor) AS avg_profit_factor,
+                   AVG(max_drawdown) AS avg_max_drawdown,
+                   100.0 * SUM(total_return > 0) / COUNT(*) AS consistency_rate,
+                   COUNT(*) AS total_tests
+            FROM backtest_results{where}
+            GROUP BY params_json
+            ORDER BY avg_sharpe DESC
+            """,
+            args
+        ).fetchall()
+
+        records = []
+        for row in rows:
+            record = {name: row[name] for name in row.keys() if name != "params_json"}
+            record.update(json.loads(row["params_json"]))
+            records.append(record)
+        return pd.DataFrame(records)
@@ -0,0 +1,636 @@
+"""
+Parameter Search
+
+전체 그리드(itertools.product) 대신 일부 조합 / 일부 데이터셋만 평가하는 탐색 전략
+
+- GridSearch: 모든 조합을 최대 budget으로 평가 (기존 방식)
+- RandomSearch: 공간에서 중복 없이 무작위 추출
+- TPESearch: 상위 trial의 값 분포 l(x)와 나머지 분포 g(x)의 비율 l/g가 큰 조합 우선 (Parzen 추정)
+- SuccessiveHalving: 적은 budget(데이터셋 수)으로 먼저 평가하고 상위 1/eta만 다음 단계로 승격
+- Hyperband: 시작 budget이 다른 SuccessiveHalving 괄호(bracket)를 차례로 실행
+
+공간은 PARAM_GRIDS와 같은 형식 {파라미터: [후보 값, ...]}이고,
+점수는 클수록 좋은 값입니다 (float 또는 튜플 - 정렬만 가능하면 됨, 실패는 None 또는 NaN).
+
+Study는 탐색 전략의 ask/tell 루프를 실행하며, TrialStore(JSONL)에 완료된 trial을 기록합니다.
+같은 시드로 다시 실행하면 탐색 전략이 같은 제안을 반복하므로 저장된 trial은 평가 없이 재생되고
+중단된 지점부터 이어서 진행됩니다. 저장소에 fingerprint(데이터셋 지문 + 전략 코드 해시)를
+주면 다른 데이터/코드로 만든 trial 기록은 재생하지 않고 지웁니다.
+"""
+
+import json
+import math
+import random
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+Params = dict[str, Any]
+Proposal = tuple[Params, int]  # (파라미터, budget)
+Outcome = tuple[Any, dict[str, Any]]  # (점수, 부가 정보)
+
+
+def space_size(space: Mapping[str, Sequence[Any]]) -> int:
+    """공간의 전체 조합 수"""
+    return math.prod(len(values) for values in space.values())
+
+
+def params_key(params: Mapping[str, Any], budget: int | None = None) -> str:
+    """파라미터 (+ budget) 식별 키"""
+    payload: dict[str, Any] = {"params": dict(params)}
+    if budget is not None:
+        payload["budget"] = budget
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
+def budget_rungs(min_budget: int, max_budget: int, eta: int = 3) -> list[int]:
+    """min_budget부터 eta배씩 늘린 budget 단계 (마지막은 항상 max_budget)"""
+    if not 1 <= min_budget <= max_budget:
+        raise ValueError(f"Invalid budget range: {min_budget}..{max_budget}")
+    if eta < 2:
+        raise ValueError("eta must be >= 2")
+
+    rungs = []
+    budget = min_budget
+    while budget < max_budget:
+        rungs.append(budget)
+        budget *= eta
+    rungs.append(max_budget)
+    return rungs
+
+
+def _json_default(value: Any) -> Any:
+    """numpy 스칼라 등 JSON 기본 타입이 아닌 값"""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+@dataclass
+class Trial:
+    """평가 한 번 (파라미터 조합 × budget)"""
+    number: int
+    params: Params
+    budget: int
+    value: Any = None  # None/NaN이면 실패
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return params_key(self.params, self.budget)
+
+
+def _succeeded(value: Any) -> bool:
+    """None과 NaN 점수는 실패로 취급"""
+    return value is not None and not (isinstance(value, float) and math.isnan(value))
+
+
+def _ranked(trials: Sequence[Trial]) -> list[Trial]:
+    """성공한 trial을 점수 내림차순으로 (동점은 먼저 평가한 순서)"""
+    return sorted(
+        (t for t in trials if _succeeded(t.value)),
+        key=lambda t: t.value,
+        reverse=True
+    )
+
+
+# ============================================================
+# 탐색 전략
+# ============================================================
+
+class SearchStrategy:
+    """
+    탐색 전략 기본 클래스 (ask/tell)
+
+    ask()는 다음에 평가할 (파라미터, budget) 목록을 반환하고 (빈 목록이면 종료),
+    tell()로 그 결과를 받습니다. 같은 시드와 같은 결과가 주어지면 제안은 항상 같습니다.
+    """
+
+    name = ""
+
+    def __init__(
+        self,
+        space: Mapping[str, Sequence[Any]],
+        max_budget: int = 1,
+        seed: int | None = None,
+        constraint: Callable[[Params], bool] | None = None
+    ):
+        """
+        Args:
+            space: {파라미터: [후보 값, ...]}
+            max_budget: 최종 평가 budget (데이터셋 수)
+            seed: 난수 시드
+            constraint: False를 반환하는 조합은 제안하지 않음 (예: fast < slow)
+        """
+        if not space or any(len(values) == 0 for values in space.values()):
+            raise ValueError("Search space must have at least one value per parameter")
+
+        self.space = {name: list(values) for name, values in space.items()}
+        self.size = space_size(self.space)
+        self.max_budget = max_budget
+        self.constraint = constraint
+        self.rng = random.Random(seed)
+        self.trials: list[Trial] = []
+        self._seen: set[str] = set()
+
+    def ask(self) -> list[Proposal]:
+        raise NotImplementedError
+
+    def tell(self, trials: Sequence[Trial]) -> None:
+        self.trials.extend(trials)
+
+    def _decode(self, index: int) -> Params:
+        """조합 번호 -> 파라미터 (itertools.product 순서)"""
+        params = {}
+        for name, values in reversed(self.space.items()):
+            index, i = divmod(index, len(values))
+            params[name] = values[i]
+        return {name: params[name] for name in self.space}
+
+    def _take(self, params: Params) -> bool:
+        """아직 제안하지 않은 유효 조합이면 제안 목록에 기록"""
+        key = params_key(params)
+        if key in self._seen:
+            return False
+        if self.constraint is not None and not self.constraint(params):
+            self._seen.add(key)
+            return False
+        self._seen.add(key)
+        return True
+
+    def _sample_unseen(self, n: int) -> list[Params]:
+        """제안하지 않은 조합 n개를 무작위로 (공간이 부족하면 더 적게)"""
+        sampled: list[Params] = []
+        attempts = 0
+        while len(sampled) < n and attempts < 50 * n and len(self._seen) < self.size:
+            attempts += 1
+            params = self._decode(self.rng.randrange(self.size))
+            if self._take(params):
+                sampled.append(params)
+
+        # 남은 조합이 적어 거절이 반복되면 나머지를 직접 나열
+        if len(sampled) < n and len(self._seen) < self.size:
+            order = list(range(self.size))
+            self.rng.shuffle(order)
+            for index in order:
+                if len(sampled) >= n:
+                    break
+                params = self._decode(index)
+                if self._take(params):
+                    sampled.append(params)
+
+        return sampled
+
+
+class GridSearch(SearchStrategy):
+    """모든 조합을 최대 budget으로 한 번에 평가"""
+
+    name = "grid"
+
+    def __init__(self, space, max_budget: int = 1, seed: int | None = None, constraint=None):
+        super().__init__(space, max_budget, seed, constraint)
+        self._done = False
+
+    def ask(self) -> list[Proposal]:
+        if self._done:
+            return []
+        self._done = True
+        proposals = []
+        for index in range(self.size):
+            params = self._decode(index)
+            if self._take(params):
+                proposals.append((params, self.max_budget))
+        return proposals
+
+
+class RandomSearch(SearchStrategy):
+    """중복 없는 무작위 탐색"""
+
+    name = "random"
+
+    def __init__(
+        self,
+        space,
+        n_trials: int = 50,
+        max_budget: int = 1,
+        batch_size: int = 1,
+        seed: int | None = None,
+        constraint=None
+    ):
+        """
+        Args:
+            n_trials: 평가할 조합 수
+            batch_size: ask() 한 번에 제안할 조합 수 (병렬 평가 단위)
+        """
+        super().__init__(space, max_budget, seed, constraint)
+        self.n_trials = n_trials
+        self.batch_size = max(1, batch_size)
+        self._proposed = 0
+
+    def ask(self) -> list[Proposal]:
+        remaining = self.n_trials - self._proposed
+        if remaining <= 0:
+            return []
+        batch = self._next(min(self.batch_size, remaining))
+        self._proposed += len(batch) if batch else remaining
+        return [(params, self.max_budget) for params in batch]
+
+    def _next(self, n: int) -> list[Params]:
+        return self._sample_unseen(n)
+
+
+class TPESearch(RandomSearch):
+    """
+    Tree-structured Parzen Estimator (이산 공간)
+
+    n_startup개를 무작위로 평가한 뒤, 상위 gamma 비율(good)과 나머지(bad)로 나누어
+    파라미터별 값 빈도 l(x), g(x)를 추정합니다 (값마다 prior 1).
+    l(x)에서 후보를 뽑아 Σ log l(x) - log g(x)가 큰 조합부터 제안합니다.
+    """
+
+    name = "tpe"
+
+    def __init__(
+        self,
+        space,
+        n_trials: int = 50,
+        max_budget: int = 1,
+        batch_size: int = 1,
+        seed: int | None = None,
+        constraint=None,
+        n_startup: int = 10,
+        gamma: float = 0.25,
+        n_candidates: int = 24
+    ):
+        super().__init__(space, n_trials, max_budget, batch_size, seed, constraint)
+        self.n_startup = n_startup
+        self.gamma = gamma
+        self.n_candidates = n_candidates
+
+    def _next(self, n: int) -> list[Params]:
+        ranked = _ranked(self.trials)
+        if len(self.trials) < self.n_startup or not ranked:
+            return self._sample_unseen(n)
+
+        n_good = max(1, math.ceil(self.gamma * len(ranked)))
+        good = ranked[:n_good]
+        good_keys = {id(t) for t in good}
+        bad = [t for t in self.trials if id(t) not in good_keys]
+
+        l_density = self._density(good)
+        g_density = self._density(bad)
+
+        scored: dict[str, tuple[float, Params]] = {}
+        for _ in range(self.n_candidates * n):
+            indices = {
+                name: self.rng.choices(range(len(values)), weights=l_density[name])[0]
+                for name, values in self.space.items()
+            }
+            params = {name: self.space[name][i] for name, i in indices.items()}
+            key = params_key(params)
+            if key in scored or key in self._seen:
+                continue
+            if self.constraint is not None and not self.constraint(params):
+                continue
+            score = sum(
+                math.log(l_density[name][i]) - math.log(g_density[name][i])
+                for name, i in indices.items()
+            )
+            scored[key] = (score, params)
+
+        best = sorted(scored.values(), key=lambda item: -item[0])[:n]
+        chosen = [params for _, params in best if self._take(params)]
+        if len(chosen) < n:
+            chosen += self._sample_unseen(n - len(chosen))
+        return chosen
+
+    def _density(self, trials: Sequence[Trial]) -> dict[str, list[float]]:
+        """파라미터별 값 확률 (prior 1 + 관측 빈도)"""
+        density = {}
+        for name, values in self.space.items():
+            counts = [1.0] * len(values)
+            for trial in trials:
+                try:
+                    counts[values.index(trial.params[name])] += 1.0
+                except (KeyError, ValueError):
+                    continue
+            total = sum(counts)
+            density[name] = [c / total for c in counts]
+        return density
+
+
+class SuccessiveHalving(SearchStrategy):
+    """
+    Successive Halving
+
+    n_trials개 조합을 가장 작은 budget으로 평가하고, 각 단계에서 상위 1/eta만
+    다음 budget으로 승격합니다. 예: budget 2 -> 6 -> 10 (eta=3, 데이터셋 10개)
+    """
+
+    name = "successive_halving"
+
+    def __init__(
+        self,
+        space,
+        n_trials: int | None = None,
+        min_budget: int = 1,
+        max_budget: int = 1,
+        eta: int = 3,
+        seed: int | None = None,
+        constraint=None,
+        budgets: Sequence[int] | None = None
+    ):
+        """
+        Args:
+            n_trials: 첫 단계에서 평가할 조합 수 (기본: eta^단계 수, 공간 크기 이하)
+            min_budget: 첫 단계 budget
+            eta: 단계마다 남기는 비율의 역수
+            budgets: budget 단계 직접 지정 (Hyperband 괄호용)
+        """
+        super().__init__(space, max_budget, seed, constraint)
+        self.eta = eta
+        self.budgets = list(budgets) if budgets else budget_rungs(min_budget, max_budget, eta)
+        self.n_trials = n_trials if n_trials is not None else eta ** len(self.budgets)
+        self._rung = 0
+        self._configs: list[Params] | None = None
+        self._rung_trials: list[Trial] = []
+
+    @property
+    def finished(self) -> bool:
+        return self._rung >= len(self.budgets)
+
+    def ask(self) -> list[Proposal]:
+        if self.finished:
+            return []
+        if self._configs is None:
+            self._configs = self._sample_unseen(self.n_trials)
+            if not self._configs:
+                self._rung = len(self.budgets)
+                return []
+        budget = self.budgets[self._rung]
+        return [(params, budget) for params in self._configs]
+
+    def tell(self, trials: Sequence[Trial]) -> None:
+        super().tell(trials)
+        self._rung_trials.extend(trials)
+        if self._configs is None or len(self._rung_trials) < len(self._configs):
+            return
+
+        ranked = _ranked(self._rung_trials)
+        keep = max(1, len(self._configs) // self.eta)
+        self._configs = [t.params for t in ranked[:keep]]
+        self._rung_trials = []
+        self._rung += 1
+        if not self._configs:
+            self._rung = len(self.budgets)
+
+
+class Hyperband(SearchStrategy):
+    """
+    Hyperband
+
+    budget 단계 [b0, b1, ..., bmax]에 대해 시작 단계가 다른 SuccessiveHalving 괄호를
+    공격적인 것(작은 budget, 많은 조합)부터 차례로 실행합니다.
+    괄호끼리 같은 조합은 다시 뽑지 않습니다.
+    """
+
+    name = "hyperband"
+
+    def __init__(
+        self,
+        space,
+        min_budget: int = 1,
+        max_budget: int = 1,
+        eta: int = 3,
+        seed: int | None = None,
+        constraint=None,
+        n_iterations: int = 1
+    ):
+        """
+        Args:
+            n_iterations: 괄호 전체를 반복할 횟수
+        """
+        super().__init__(space, max_budget, seed, constraint)
+        self.eta = eta
+        self.rungs = budget_rungs(min_budget, max_budget, eta)
+
+        s_max = len(self.rungs) - 1
+        self.brackets: list[tuple[int, list[int]]] = [
+            (math.ceil((s_max + 1) / (s + 1) * eta ** s), self.rungs[s_max - s:])
+            for _ in range(n_iterations)
+            for s in range(s_max, -1, -1)
+        ]
+        self._bracket_idx = -1
+        self._current: SuccessiveHalving | None = None
+
+    def ask(self) -> list[Proposal]:
+        while True:
+            if self._current is not None:
+                proposals = self._current.ask()
+                if proposals:
+                    return proposals
+
+            self._bracket_idx += 1
+            if self._bracket_idx >= len(self.brackets):
+                return []
+
+            n, budgets = self.brackets[self._bracket_idx]
+            bracket = SuccessiveHalving(
+                self.space,
+                n_trials=n,
+                max_budget=self.max_budget,
+                eta=self.eta,
+                constraint=self.constraint,
+                budgets=budgets
+            )
+            # 난수와 제안 기록을 공유하여 괄호끼리 조합이 겹치지 않게 함
+            bracket.rng = self.rng
+            bracket._seen = self._seen
+            self._current = bracket
+
+    def tell(self, trials: Sequence[Trial]) -> None:
+        super().tell(trials)
+        if self._current is not None:
+            self._current.tell(trials)
+
+
+SEARCH_STRATEGIES: dict[str, type[SearchStrategy]] = {
+    cls.name: cls
+    for cls in (GridSearch, RandomSearch, TPESearch, SuccessiveHalving, Hyperband)
+}
+
+
+def make_searcher(
+    name: str,
+    space: Mapping[str, Sequence[Any]],
+    max_budget: int = 1,
+    n_trials: int | None = None,
+    min_budget: int | None = None,
+    eta: int = 3,
+    batch_size: int = 1,
+    seed: int | None = None,
+    constraint: Callable[[Params], bool] | None = None
+) -> SearchStrategy:
+    """
+    이름으로 탐색 전략 생성
+
+    Args:
+        name: grid | random | tpe | successive_halving | hyperband
+        max_budget: 최종 평가 budget (데이터셋 수)
+        n_trials: random/tpe는 평가할 조합 수 (기본 50),
+            successive_halving은 첫 단계 조합 수 (hyperband, grid는 사용하지 않음)
+        min_budget: successive_halving/hyperband 첫 단계 budget (기본: max_budget)
+        eta: successive_halving/hyperband 승격 비율의 역수
+        batch_size: random/tpe가 한 번에 제안할 조합 수
+    """
+    if name not in SEARCH_STRATEGIES:
+        raise ValueError(f"Unknown search strategy: {name} (choose from {sorted(SEARCH_STRATEGIES)})")
+
+    min_budget = min(min_budget or max_budget, max_budget)
+    size = space_size(space)
+
+    if name == "grid":
+        return GridSearch(space, max_budget, seed, constraint)
+    if name in ("random", "tpe"):
+        cls = SEARCH_STRATEGIES[name]
+        return cls(space, min(n_trials or 50, size), max_budget, batch_size, seed, constraint)
+    if name == "successive_halving":
+        n = min(n_trials, size) if n_trials else None
+        searcher = SuccessiveHalving(space, n, min_budget, max_budget, eta, seed, constraint)
+        searcher.n_trials = min(searcher.n_trials, size)
+        return searcher
+    return Hyperband(space, min_budget, max_budget, eta, seed, constraint)
+
+
+# ============================================================
+# Trial 저장소 / Study
+# ============================================================
+
+class TrialStore:
+    """
+    완료된 trial을 JSONL로 기록 (한 줄 = trial 하나)
+
+    평가가 끝날 때마다 추가하므로 중단되어도 완료된 trial은 남습니다.
+    fingerprint가 주어지면 첫 줄에 기록하고, 첫 줄이 다르거나 없는 기록은 지웁니다.
+    """
+
+    def __init__(self, path: str | Path, fingerprint: str | None = None):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+
+    def load(self) -> dict[str, Outcome]:
+        """{params_key(params, budget): (value, attrs)}"""
+        records: dict[str, Outcome] = {}
+        if not self.path.exists():
+            return records
+
+        header = None
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시점에 잘린 마지막 줄
+                if "fingerprint" in record:
+                    header = record["fingerprint"]
+                    continue
+                value = record.get("value")
+                if isinstance(value, list):
+                    value = tuple(value)
+                key = params_key(record["params"], record["budget"])
+                records[key] = (value, record.get("attrs") or {})
+
+        if self.fingerprint is not None and header != self.fingerprint:
+            # 다른 데이터셋/전략 코드로 만든 trial은 현재 결과가 아님
+            self.clear()
+            return {}
+        return records
+
+    def append(self, trial: Trial) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "number": trial.number,
+            "params": trial.params,
+            "budget": trial.budget,
+            "value": trial.value,
+            "attrs": trial.attrs,
+        }
+        new_file = not self.path.exists()
+        with open(self.path, "a", encoding="utf-8") as f:
+            if new_file and self.fingerprint is not None:
+                f.write(json.dumps({"fingerprint": self.fingerprint}) + "\n")
+            f.write(json.dumps(record, ensure_ascii=False, default=_json_default) + "\n")
+            f.flush()
+
+    def clear(self) -> None:
+        if self.path.exists():
+            self.path.unlink()
+
+
+class Study:
+    """탐색 전략 실행기 (ask -> evaluate -> tell 반복)"""
+
+    def __init__(self, searcher: SearchStrategy, store: TrialStore | None = None):
+        self.searcher = searcher
+        self.store = store
+        self.trials: list[Trial] = []
+        self.n_evaluated = 0  # 이번 실행에서 새로 평가한 trial 수
+        self.n_replayed = 0  # 저장소에서 재생한 trial 수
+        self.budget_used = 0  # 새로 평가한 trial의 budget 합계
+
+    def optimize(
+        self,
+        evaluate: Callable[[list[Proposal]], list[Outcome]],
+        callback: Callable[[Trial], None] | None = None
+    ) -> Trial | None:
+        """
+        탐색 실행
+
+        Args:
+            evaluate: [(params, budget), ...] -> [(value, attrs), ...] (같은 순서)
+            callback: trial이 완료될 때마다 호출 (재생된 trial 포함)
+
+        Returns:
+            최대 budget에서 가장 좋은 trial
+        """
+        stored = self.store.load() if self.store else {}
+
+        while True:
+            proposals = self.searcher.ask()
+            if not proposals:
+                break
+
+            pending = [p for p in proposals if params_key(*p) not in stored]
+            outcomes = dict(zip(
+                (params_key(*p) for p in pending),
+                evaluate(pending) if pending else []
+            ))
+
+            trials = []
+            for params, budget in proposals:
+                key = params_key(params, budget)
+                if key in outcomes:
+                    value, attrs = outcomes[key]
+                    self.n_evaluated += 1
+                    self.budget_used += budget
+                else:
+                    value, attrs = stored[key]
+                    self.n_replayed += 1
+
+                trial = Trial(len(self.trials) + len(trials), params, budget, value, attrs)
+                if key in outcomes and self.store:
+                    self.store.append(trial)
+                trials.append(trial)
+                if callback:
+                    callback(trial)
+
+            self.trials.extend(trials)
+            self.searcher.tell(trials)
+
+        return self.best_trial
+
+    @property
+    def best_trial(self) -> Trial | None:
+        ranked = _ranked([t for t in self.trials if t.budget == self.searcher.max_budget])
+        return ranked[0] if ranked else None
@@ -0,0 +1,146 @@
+"""
+Shared-memory Datasets
+
+OHLCV DataFrame을 multiprocessing.shared_memory 블록에 한 번만 적재하고
+프로세스 풀 워커가 작업마다 pickle 없이 같은 메모리를 읽도록 하는 유틸리티
+
+메모리 레이아웃 (블록 하나):
+    [int64 index × rows][float64 column 0 × rows][float64 column 1 × rows]...
+"""
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedDatasetHandle:
+    """워커에 전달하는 경량 디스크립터 (데이터 없이 위치 정보만 포함)"""
+    name: str
+    symbol: str
+    rows: int
+    columns: tuple[str, ...]
+    index_name: str | None = None
+    index_unit: str | None = None  # DatetimeIndex 해상도 (None이면 정수 인덱스)
+    index_tz: str | None = None
+
+
+class SharedDataset:
+    """공유 메모리에 적재된 OHLCV 데이터셋"""
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        handle: SharedDatasetHandle,
+        owner: bool = False
+    ):
+        self._shm = shm
+        self.handle = handle
+        self.owner = owner
+
+    @property
+    def symbol(self) -> str:
+        return self.handle.symbol
+
+    @classmethod
+    def create(cls, symbol: str, data: pd.DataFrame) -> "SharedDataset":
+        """
+        DataFrame을 새 공유 메모리 블록에 복사
+
+        Args:
+            symbol: 심볼명
+            data: OHLCV DataFrame (DatetimeIndex 또는 정수 인덱스)
+
+        Returns:
+            블록 소유자 SharedDataset (사용 후 unlink 필요)
+        """
+        index = data.index
+        if isinstance(index, pd.DatetimeIndex):
+            index_values = index.asi8
+            index_unit = index.unit
+            index_tz = str(index.tz) if index.tz is not None else None
+        elif pd.api.types.is_integer_dtype(index.dtype):
+            index_values = np.asarray(index, dtype=np.int64)
+            index_unit = None
+            index_tz = None
+        else:
+            raise ValueError(f"Unsupported index type for shared dataset: {type(index).__name__}")
+
+        rows = len(data)
+        columns = tuple(str(col) for col in data.columns)
+        nbytes = max(8 * rows * (len(columns) + 1), 1)
+
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        handle = SharedDatasetHandle(
+            name=shm.name,
+            symbol=symbol,
+            rows=rows,
+            columns=columns,
+            index_name=index.name,
+            index_unit=index_unit,
+            index_tz=index_tz,
+        )
+
+        dataset = cls(shm, handle, owner=True)
+        index_view, values_view = dataset._views()
+        index_view[:] = index_values
+        for i, col in enumerate(data.columns):
+            values_view[i, :] = data[col].to_numpy(dtype=np.float64)
+
+        return dataset
+
+    @classmethod
+    def attach(cls, handle: SharedDatasetHandle) -> "SharedDataset":
+        """다른 프로세스가 만든 블록에 연결 (워커용)"""
+        shm = shared_memory.SharedMemory(name=handle.name)
+        return cls(shm, handle, owner=False)
+
+    def _views(self) -> tuple[np.ndarray, np.ndarray]:
+        """(index, values[column, row]) ndarray 뷰"""
+        rows = self.handle.rows
+        index_view = np.ndarray((rows,), dtype=np.int64, buffer=self._shm.buf)
+        values_view = np.ndarray(
+            (len(self.handle.columns), rows),
+            dtype=np.float64,
+            buffer=self._shm.buf,
+            offset=8 * rows
+        )
+        return index_view, values_view
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        공유 메모리를 복사 없이 감싼 읽기 전용 DataFrame
+
+        반환된 DataFrame은 이 객체가 close()되기 전까지만 유효합니다.
+        """
+        index_view, values_view = self._views()
+        values_view.flags.writeable = False
+
+        if self.handle.index_unit is not None:
+            index = pd.DatetimeIndex(
+                index_view.view(f"datetime64[{self.handle.index_unit}]"),
+                name=self.handle.index_name
+            )
+            if self.handle.index_tz is not None:
+                index = index.tz_localize("UTC").tz_convert(self.handle.index_tz)
+        else:
+            index = pd.Index(index_view, name=self.handle.index_name)
+
+        # (column, row) C-order 블록의 전치 = 컬럼별로 연속인 (row, column) 뷰
+        return pd.DataFrame(
+            values_view.T,
+            index=index,
+            columns=list(self.handle.columns),
+            copy=False
+        )
+
+    def close(self) -> None:
+        """현재 프로세스의 매핑 해제"""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """블록 삭제 (소유자만)"""
+        if self.owner:
+            self._shm.unlink()
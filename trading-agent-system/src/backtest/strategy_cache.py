@@ -0,0 +1,164 @@
+"""
+Compiled Strategy Cache
+
+전략 코드 문자열 -> 실행된 모듈 / 탐지된 Strategy 클래스 캐시 (내용 주소 기반)
+
+- 키: 코드의 SHA-256 (같은 코드는 몇 번을 실행해도 컴파일/임포트 1회)
+- LRU: maxsize개를 넘으면 가장 오래 쓰지 않은 모듈부터 제거
+- 선택적 디스크 바이트코드 저장소: {bytecode_dir}/{sha256}.bin
+  (importlib MAGIC_NUMBER + marshal 코드 객체, 인터프리터 버전이 다르면 다시 컴파일)
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import threading
+import types
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Mapping
+
+
+def code_hash(code: str) -> str:
+    """전략 코드의 내용 주소 (SHA-256 hex)"""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+class CompiledStrategy:
+    """캐시 항목 - 실행된 모듈과 모듈에서 찾은 객체들"""
+
+    def __init__(self, key: str, module: types.ModuleType):
+        self.key = key
+        self.module = module
+        self._resolved: dict[Hashable, Any] = {}
+
+    @property
+    def namespace(self) -> dict[str, Any]:
+        return self.module.__dict__
+
+    def resolve(self, name: Hashable, resolver: Callable[[types.ModuleType], Any]) -> Any:
+        """resolver(module) 결과를 항목에 기억 (예외는 기억하지 않음)"""
+        if name not in self._resolved:
+            self._resolved[name] = resolver(self.module)
+        return self._resolved[name]
+
+
+class StrategyCache:
+    """전략 코드 컴파일 캐시 (스레드 안전)"""
+
+    def __init__(self, maxsize: int = 128, bytecode_dir: str | Path | None = None):
+        """
+        Args:
+            maxsize: 메모리에 유지할 모듈 수
+            bytecode_dir: 바이트코드 저장 디렉토리 (None이면 디스크 저장 안 함)
+        """
+        self.maxsize = maxsize
+        self.bytecode_dir = Path(bytecode_dir) if bytecode_dir else None
+        if self.bytecode_dir:
+            self.bytecode_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: OrderedDict[tuple[str, str], CompiledStrategy] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def load(
+        self,
+        code: str,
+        name: str | None = None,
+        filename: str | None = None,
+        preset: Mapping[str, Any] | None = None,
+        tag: str = ""
+    ) -> CompiledStrategy:
+        """
+        코드를 모듈로 실행하여 반환 (캐시에 있으면 실행하지 않음)
+
+        Args:
+            code: Python 전략 코드
+            name: 모듈 이름 (기본: strategy_{hash 앞 12자})
+            filename: 트레이스백에 표시할 파일명
+            preset: 실행 전에 모듈 네임스페이스에 넣을 전역 변수
+            tag: preset이 다른 호출자끼리 항목을 구분하는 값
+
+        Returns:
+            CompiledStrategy
+        """
+        key = code_hash(code)
+        with self._lock:
+            entry = self._entries.get((key, tag))
+            if entry is not None:
+                self._entries.move_to_end((key, tag))
+                self.hits += 1
+                return entry
+
+        # 컴파일/실행은 락 밖에서 (같은 코드가 동시에 들어오면 먼저 끝난 쪽이 남음)
+        code_obj = self._compile(key, code, filename or f"<strategy {key[:12]}>")
+        module = types.ModuleType(name or f"strategy_{key[:12]}")
+        module.__code_hash__ = key  # 결과 저장소 키 (소스 파일이 없는 모듈)
+        if filename:
+            module.__file__ = filename
+        if preset:
+            module.__dict__.update(preset)
+        exec(code_obj, module.__dict__)  # noqa: S102 - 의도적인 동적 코드 실행
+
+        with self._lock:
+            self.misses += 1
+            entry = self._entries.setdefault((key, tag), CompiledStrategy(key, module))
+            self._entries.move_to_end((key, tag))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return entry
+
+    def _compile(self, key: str, code: str, filename: str) -> types.CodeType:
+        """코드 객체 (디스크 저장소에 있으면 재사용)"""
+        path = self.bytecode_dir / f"{key}.bin" if self.bytecode_dir else None
+
+        if path is not None and path.exists():
+            try:
+                raw = path.read_bytes()
+                magic = importlib.util.MAGIC_NUMBER
+                if raw[:len(magic)] == magic:
+                    code_obj = marshal.loads(raw[len(magic):])
+                    with self._lock:
+                        self.disk_hits += 1
+                    return code_obj
+            except (OSError, ValueError, EOFError, TypeError):
+                pass
+
+        code_obj = compile(code, filename, "exec")
+
+        if path is not None:
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            try:
+                tmp.write_bytes(importlib.util.MAGIC_NUMBER + marshal.dumps(code_obj))
+                os.replace(tmp, path)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+
+        return code_obj
+
+    def clear(self) -> None:
+        """메모리 캐시 비우기 (디스크 바이트코드는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+        }
+
+
+_shared_cache = StrategyCache()
+
+
+def get_strategy_cache() -> StrategyCache:
+    """프로세스 공용 캐시 (BacktestEngine, MCP 도구, 매트릭스 워커가 함께 사용)"""
+    return _shared_cache
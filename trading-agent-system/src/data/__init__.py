@@ -4,6 +4,15 @@ Data Module
 Binance 등 데이터 수집기
 """
 
-from .binance_collector import BinanceDataCollector
+from .binance_collector import BinanceDataCollector, DatasetInfo
+from .ohlcv_store import OHLCVStore
+from .rate_limiter import WeightRateLimiter
+from .replay_exchange import ReplayExchange
 
-__all__ = ["BinanceDataCollector"]
+__all__ = [
+    "BinanceDataCollector",
+    "DatasetInfo",
+    "OHLCVStore",
+    "WeightRateLimiter",
+    "ReplayExchange",
+]
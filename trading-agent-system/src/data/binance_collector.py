@@ -2,17 +2,24 @@
 Binance Data Collector
 
 Binance API를 통해 히스토리컬 OHLCV 데이터를 수집하는 모듈
+- 수집한 캔들은 OHLCVStore(월별 컬럼형 파티션)에 누적 저장
+- 이미 받은 구간은 다시 요청하지 않고 누락 구간(보통 최근 tail)만 다운로드
+- 여러 심볼을 동시에 수집하되 REQUEST_WEIGHT 리미터 하나를 공유
+- exchange로 ReplayExchange를 주입하면 네트워크 없이 동작
 """
 
 import os
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass
 
 import pandas as pd
 
+from .ohlcv_store import OHLCVStore, timeframe_to_ms
+from .rate_limiter import WeightRateLimiter
+
 
 @dataclass
 class DatasetInfo:
@@ -47,22 +54,107 @@ class BinanceDataCollector:
         "1w": "1 week",
     }
 
+    OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+    # GET /api/v3/klines 요청 한도 및 가중치
+    KLINES_LIMIT = 1000
+    KLINES_WEIGHT = 2
+
     def __init__(
         self,
         api_key: str | None = None,
         api_secret: str | None = None,
-        data_dir: str = "data/datasets"
+        data_dir: str = "data/datasets",
+        exchange: Any = None,
+        rate_limiter: WeightRateLimiter | None = None,
+        max_concurrency: int = 8
     ):
         """
         Args:
             api_key: Binance API 키 (공개 데이터는 불필요)
             api_secret: Binance API 시크릿
-            data_dir: 데이터 저장 디렉토리
+            data_dir: 데이터 저장 디렉토리 (저장소는 data_dir/store)
+            exchange: get_klines()를 제공하는 클라이언트 (기본: python-binance Client,
+                오프라인 테스트는 ReplayExchange)
+            rate_limiter: 공유 가중치 리미터 (기본: 1200 weight/분)
+            max_concurrency: 동시에 수집할 데이터셋 수
         """
         self.api_key = api_key or os.getenv("BINANCE_API_KEY", "")
         self.api_secret = api_secret or os.getenv("BINANCE_API_SECRET", "")
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.store = OHLCVStore(self.data_dir / "store")
+        self.rate_limiter = rate_limiter or WeightRateLimiter()
+        self.max_concurrency = max_concurrency
+        self._client = exchange
+
+    def _get_client(self):
+        """python-binance 클라이언트 (최초 1회 생성)"""
+        if self._client is None:
+            try:
+                from binance.client import Client
+            except ImportError:
+                raise ImportError("python-binance 패키지를 설치하세요: pip install python-binance")
+
+            self._client = Client(self.api_key, self.api_secret)
+        return self._client
+
+    async def _fetch_range(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int
+    ) -> list[list]:
+        """
+        [start_ms, end_ms] 구간의 캔들 수집
+
+        Returns:
+            [timestamp_ms, open, high, low, close, volume] 행 목록
+        """
+        if interval not in self.INTERVALS:
+            raise ValueError(f"지원하지 않는 타임프레임: {interval}")
+
+        client = self._get_client()
+        rows = []
+        cursor = start_ms
+
+        while cursor <= end_ms:
+            await self.rate_limiter.acquire(self.KLINES_WEIGHT)
+
+            # 데이터 수집 (동기 API를 비동기로 실행)
+            klines = await asyncio.to_thread(
+                client.get_klines,
+                symbol=symbol,
+                interval=interval,
+                startTime=cursor,
+                endTime=end_ms,
+                limit=self.KLINES_LIMIT
+            )
+            self._sync_server_weight(client)
+
+            if not klines:
+                break
+
+            rows.extend(
+                [int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5])]
+                for k in klines
+                if start_ms <= int(k[0]) <= end_ms
+            )
+
+            if len(klines) < self.KLINES_LIMIT:
+                break
+            cursor = int(klines[-1][0]) + 1
+
+        return rows
+
+    def _sync_server_weight(self, client: Any):
+        """python-binance 응답 헤더의 사용 가중치로 리미터 보정"""
+        response = getattr(client, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        used = headers.get("x-mbx-used-weight-1m") or headers.get("X-MBX-USED-WEIGHT-1M")
+        if used is not None:
+            self.rate_limiter.sync_used_weight(int(used))
 
     async def fetch_klines(
         self,
@@ -72,7 +164,7 @@ class BinanceDataCollector:
         end_date: str | None = None
     ) -> pd.DataFrame:
         """
-        Binance에서 캔들 데이터 수집
+        Binance에서 캔들 데이터 수집 (저장소를 거치지 않음)
 
         Args:
             symbol: 심볼 (예: BTCUSDT)
@@ -83,88 +175,93 @@ class BinanceDataCollector:
         Returns:
             OHLCV DataFrame
         """
-        try:
-            from binance.client import Client
-        except ImportError:
-            raise ImportError("python-binance 패키지를 설치하세요: pip install python-binance")
-
-        client = Client(self.api_key, self.api_secret)
-
-        # 타임프레임 매핑
-        interval_map = {
-            "1m": Client.KLINE_INTERVAL_1MINUTE,
-            "5m": Client.KLINE_INTERVAL_5MINUTE,
-            "15m": Client.KLINE_INTERVAL_15MINUTE,
-            "30m": Client.KLINE_INTERVAL_30MINUTE,
-            "1h": Client.KLINE_INTERVAL_1HOUR,
-            "4h": Client.KLINE_INTERVAL_4HOUR,
-            "1d": Client.KLINE_INTERVAL_1DAY,
-            "1w": Client.KLINE_INTERVAL_1WEEK,
-        }
-
-        binance_interval = interval_map.get(interval, Client.KLINE_INTERVAL_1HOUR)
-        end_date = end_date or datetime.now().strftime("%Y-%m-%d")
-
-        # 데이터 수집 (동기 API를 비동기로 실행)
-        klines = await asyncio.to_thread(
-            client.get_historical_klines,
-            symbol,
-            binance_interval,
-            start_date,
-            end_date
-        )
+        start_ms, end_ms = self._date_range_ms(start_date, end_date)
+        klines = await self._fetch_range(symbol, interval, start_ms, end_ms)
 
         if not klines:
             return pd.DataFrame()
 
-        # DataFrame 변환
-        df = pd.DataFrame(klines, columns=[
-            "timestamp", "Open", "High", "Low", "Close", "Volume",
-            "close_time", "quote_volume", "trades", "taker_buy_base",
-            "taker_buy_quote", "ignore"
-        ])
-
-        # 타입 변환
+        df = pd.DataFrame(klines, columns=["timestamp"] + self.OHLCV_COLUMNS)
         df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-        df = df[["timestamp", "Open", "High", "Low", "Close", "Volume"]]
-
-        for col in ["Open", "High", "Low", "Close", "Volume"]:
-            df[col] = df[col].astype(float)
-
         df.set_index("timestamp", inplace=True)
 
         return df
 
+    async def sync_range(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: str,
+        end_date: str | None = None
+    ) -> int:
+        """
+        구간 중 저장소에 없는 부분만 다운로드하여 추가
+
+        한 번 전체를 받은 뒤에는 마지막 마감 봉 이후의 tail(미완성 봉 포함)만
+        누락 구간으로 남으므로 야간 갱신은 데이터셋당 요청 1회로 끝납니다.
+
+        Returns:
+            새로 저장한 캔들 수
+        """
+        start_ms, end_ms = self._date_range_ms(start_date, end_date)
+        fetched = 0
+
+        for range_start, range_end in self.store.missing_ranges(symbol, interval, start_ms, end_ms):
+            klines = await self._fetch_range(symbol, interval, range_start, range_end)
+            fetched += self.store.append(
+                symbol, interval, klines,
+                covered=self._closed_range(interval, range_start, range_end)
+            )
+
+        return fetched
+
     async def download_dataset(
         self,
         symbol: str,
         interval: str,
         start_date: str,
         end_date: str | None = None,
-        save_format: str = "parquet"
+        save_format: str | None = "parquet"
     ) -> DatasetInfo:
         """
         데이터셋 다운로드 및 저장
 
+        누락 구간만 받아 저장소에 추가한 뒤, 기존 스크립트(최적화/백테스트)가
+        읽는 {symbol}_{interval}.{save_format} 스냅샷을 다시 씁니다.
+
         Args:
             symbol: 심볼
             interval: 타임프레임
             start_date: 시작일
             end_date: 종료일
-            save_format: 저장 형식 (parquet 또는 csv)
+            save_format: 스냅샷 형식 (parquet, csv, None이면 저장소만 갱신)
 
         Returns:
             DatasetInfo
         """
-        df = await self.fetch_klines(symbol, interval, start_date, end_date)
+        await self.sync_range(symbol, interval, start_date, end_date)
+
+        if save_format is None:
+            # 매니페스트만으로 정보 구성 (데이터를 읽지 않음)
+            summary = self.store.summary(symbol, interval)
+            if summary is None:
+                raise ValueError(f"No data found for {symbol}")
+
+            return DatasetInfo(
+                symbol=symbol,
+                interval=interval,
+                start_date=str(pd.Timestamp(summary["start_ts"], unit="ms")),
+                end_date=str(pd.Timestamp(summary["end_ts"], unit="ms")),
+                rows=summary["rows"],
+                file_path=summary["path"]
+            )
+
+        df = self.load_dataset(symbol, interval, start_date, end_date)
 
         if df.empty:
             raise ValueError(f"No data found for {symbol}")
 
-        # 파일 저장
-        filename = f"{symbol}_{interval}.{save_format}"
-        file_path = self.data_dir / filename
-
+        file_path = self.data_dir / f"{symbol}_{interval}.{save_format}"
         if save_format == "parquet":
             df.to_parquet(file_path)
         else:
@@ -184,16 +281,23 @@ class BinanceDataCollector:
         symbols: list[str] | None = None,
         intervals: list[str] | None = None,
         start_date: str = "2023-01-01",
-        end_date: str | None = None
+        end_date: str | None = None,
+        max_concurrency: int | None = None,
+        save_format: str | None = "parquet"
     ) -> list[DatasetInfo]:
         """
-        여러 심볼/타임프레임 조합 다운로드
+        여러 심볼/타임프레임 조합을 동시에 다운로드 (증분)
+
+        각 데이터셋은 저장소에 없는 구간만 받으며, 모든 요청은
+        self.rate_limiter 하나로 REQUEST_WEIGHT 한도를 지킵니다.
 
         Args:
             symbols: 심볼 목록 (기본: DEFAULT_SYMBOLS)
             intervals: 타임프레임 목록 (기본: ["1h", "4h", "1d"])
             start_date: 시작일
             end_date: 종료일
+            max_concurrency: 동시 수집 수 (기본: self.max_concurrency)
+            save_format: 동기화 후 다시 쓸 스냅샷 형식 (None이면 저장소만 갱신)
 
         Returns:
             DatasetInfo 목록
@@ -201,44 +305,70 @@ class BinanceDataCollector:
         symbols = symbols or self.DEFAULT_SYMBOLS[:5]  # 기본 5개
         intervals = intervals or ["1h", "4h", "1d"]
 
-        results = []
-        total = len(symbols) * len(intervals)
-        count = 0
-
-        for symbol in symbols:
-            for interval in intervals:
-                count += 1
-                print(f"[{count}/{total}] Downloading {symbol} {interval}...")
+        jobs = [(symbol, interval) for symbol in symbols for interval in intervals]
+        total = len(jobs)
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        results: list[DatasetInfo | None] = [None] * total
+        done = 0
 
+        async def download(idx: int, symbol: str, interval: str):
+            nonlocal done
+            async with semaphore:
                 try:
                     info = await self.download_dataset(
                         symbol=symbol,
                         interval=interval,
                         start_date=start_date,
-                        end_date=end_date
+                        end_date=end_date,
+                        save_format=save_format
                     )
-                    results.append(info)
-                    print(f"  ✓ {info.rows} rows saved to {info.file_path}")
-
-                    # Rate limiting
-                    await asyncio.sleep(0.5)
-
+                    results[idx] = info
+                    done += 1
+                    print(f"[{done}/{total}] ✓ {symbol} {interval}: {info.rows} rows")
                 except Exception as e:
-                    print(f"  ✗ Error: {e}")
+                    done += 1
+                    print(f"[{done}/{total}] ✗ {symbol} {interval}: {e}")
+
+        # Rate limiting은 공유 리미터가 요청 단위로 처리
+        await asyncio.gather(*(
+            download(idx, symbol, interval) for idx, (symbol, interval) in enumerate(jobs)
+        ))
 
-        return results
+        return [info for info in results if info is not None]
 
-    def load_dataset(self, symbol: str, interval: str) -> pd.DataFrame:
+    def load_dataset(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: str | None = None,
+        end_date: str | None = None
+    ) -> pd.DataFrame:
         """
         저장된 데이터셋 로드
 
+        저장소에 있으면 필요한 월 파티션만 memory-map하여 읽고,
+        없으면 기존 {symbol}_{interval}.parquet/csv 파일을 읽습니다.
+
         Args:
             symbol: 심볼
             interval: 타임프레임
+            start_date: 시작일 (None이면 처음부터)
+            end_date: 종료일 (None이면 끝까지)
 
         Returns:
             OHLCV DataFrame
         """
+        if self.store.load_manifest(symbol, interval)["months"]:
+            start_ms = self._date_to_ms(start_date) if start_date else None
+            end_ms = self._date_to_ms(end_date) if end_date else None
+            columns = self.store.read_arrays(symbol, interval, start_ms, end_ms)
+
+            index = pd.DatetimeIndex(pd.to_datetime(columns["timestamp"], unit="ms"), name="timestamp")
+            return pd.DataFrame(
+                {col: columns[col.lower()] for col in self.OHLCV_COLUMNS},
+                index=index
+            )
+
         # parquet 먼저 시도
         parquet_path = self.data_dir / f"{symbol}_{interval}.parquet"
         if parquet_path.exists():
@@ -252,10 +382,26 @@ class BinanceDataCollector:
 
         raise FileNotFoundError(f"Dataset not found: {symbol}_{interval}")
 
+    def find_gaps(self, symbol: str, interval: str) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """저장소에서 빠진 봉 구간 탐지 ((첫 누락 시각, 마지막 누락 시각) 목록)"""
+        return [
+            (pd.Timestamp(start, unit="ms"), pd.Timestamp(end, unit="ms"))
+            for start, end in self.store.find_gaps(symbol, interval)
+        ]
+
     def list_datasets(self) -> list[dict[str, Any]]:
         """저장된 데이터셋 목록 반환"""
         datasets = []
 
+        for partition in self.store.list_partitions():
+            datasets.append({
+                "symbol": partition["symbol"],
+                "interval": partition["timeframe"],
+                "format": "store",
+                "rows": partition["rows"],
+                "path": partition["path"]
+            })
+
         for file_path in self.data_dir.glob("*.parquet"):
             name = file_path.stem
             parts = name.rsplit("_", 1)
@@ -279,3 +425,28 @@ class BinanceDataCollector:
                 })
 
         return datasets
+
+    # ============================================================
+    # 시간 변환
+    # ============================================================
+
+    @staticmethod
+    def _date_to_ms(date_str: str) -> int:
+        """YYYY-MM-DD (UTC) -> epoch ms"""
+        dt = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        return int(dt.timestamp() * 1000)
+
+    def _date_range_ms(self, start_date: str, end_date: str | None) -> tuple[int, int]:
+        """(시작일, 종료일) -> epoch ms 구간 (종료일 없으면 현재 시각)"""
+        start_ms = self._date_to_ms(start_date)
+        if end_date:
+            end_ms = self._date_to_ms(end_date)
+        else:
+            end_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+        return start_ms, end_ms
+
+    @staticmethod
+    def _closed_range(interval: str, start_ms: int, end_ms: int) -> tuple[int, int]:
+        """수집 구간 중 이미 마감된 봉까지만 coverage로 인정"""
+        now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+        return start_ms, min(end_ms, now_ms - timeframe_to_ms(interval))
@@ -0,0 +1,405 @@
+"""
+OHLCV Store
+
+심볼/타임프레임별로 파티션된 컬럼형 OHLCV 저장소
+
+디렉토리 구조:
+    {root}/{SYMBOL}/{interval}/_manifest.json
+    {root}/{SYMBOL}/{interval}/2024-01.arrow
+    {root}/{SYMBOL}/{interval}/2024-02.arrow
+    ...
+
+- 월별 파티션: 비압축 Arrow IPC 파일 (레코드 배치 1개)
+- 컬럼: timestamp (int64 epoch ms, 정렬/중복 없음), open/high/low/close/volume (float64)
+- 읽기: 필요한 월 파티션만 memory-map 후 슬라이스 (재파싱 없음)
+- 쓰기: append-only - 새 캔들이 속한 월 파티션만 다시 씀 (보통 마지막 달)
+- 매니페스트의 coverage로 이미 수집한 구간을 기록하여 누락 구간만 다운로드
+- 새 캔들을 쓰면 on_append에 등록된 함수 호출 (indicators.cache가 공용 지표 캐시 무효화를 등록)
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# append()가 새 캔들을 쓴 뒤 (symbol, timeframe)으로 호출할 함수들
+on_append: list[Callable[[str, str], Any]] = []
+
+TIMEFRAME_MS = {
+    "1m": 60_000,
+    "3m": 180_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "2h": 7_200_000,
+    "4h": 14_400_000,
+    "6h": 21_600_000,
+    "8h": 28_800_000,
+    "12h": 43_200_000,
+    "1d": 86_400_000,
+    "3d": 259_200_000,
+    "1w": 604_800_000,
+}
+
+Range = tuple[int, int]
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """타임프레임의 봉 길이 (ms)"""
+    try:
+        return TIMEFRAME_MS[timeframe]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 타임프레임: {timeframe}")
+
+
+def merge_ranges(ranges: list[Range], step: int = 1) -> list[Range]:
+    """겹치거나 step 이내로 인접한 (start, end) 구간 병합 (양 끝 포함)"""
+    merged: list[list[int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + step:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+class OHLCVStore:
+    """파티션 기반 append-only 컬럼형 OHLCV 저장소"""
+
+    COLUMNS = ("open", "high", "low", "close", "volume")
+    MANIFEST = "_manifest.json"
+    SCHEMA = pa.schema(
+        [("timestamp", pa.int64())] + [(col, pa.float64()) for col in COLUMNS]
+    )
+
+    def __init__(self, root: str | Path = "data/datasets/store"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # ============================================================
+    # 경로 / 매니페스트
+    # ============================================================
+
+    def partition_dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / symbol.replace('/', '_') / timeframe
+
+    def _month_path(self, symbol: str, timeframe: str, month: str) -> Path:
+        return self.partition_dir(symbol, timeframe) / f"{month}.arrow"
+
+    def load_manifest(self, symbol: str, timeframe: str) -> dict:
+        path = self.partition_dir(symbol, timeframe) / self.MANIFEST
+        if not path.exists():
+            return {
+                'symbol': symbol,
+                'timeframe': timeframe,
+                'interval_ms': timeframe_to_ms(timeframe),
+                'months': {},
+                'coverage': [],
+            }
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _save_manifest(self, symbol: str, timeframe: str, manifest: dict) -> None:
+        path = self.partition_dir(symbol, timeframe) / self.MANIFEST
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, path)
+
+    # ============================================================
+    # 쓰기
+    # ============================================================
+
+    def append(
+        self,
+        symbol: str,
+        timeframe: str,
+        candles: pd.DataFrame | np.ndarray | list[list],
+        covered: Range | None = None,
+    ) -> int:
+        """
+        캔들을 저장소에 병합
+
+        Args:
+            candles: [ts_ms, open, high, low, close, volume] 행 목록 또는
+                timestamp 컬럼/DatetimeIndex와 OHLCV 컬럼(대소문자 무관)을 가진 DataFrame
+            covered: 이 캔들이 완전히 설명하는 (start_ms, end_ms) 구간.
+                거래소가 일부 구간에 데이터를 주지 않아도 coverage에 기록됨
+
+        Returns:
+            저장한 행 수
+        """
+        timestamps, values = self._to_arrays(candles)
+        manifest = self.load_manifest(symbol, timeframe)
+        part_dir = self.partition_dir(symbol, timeframe)
+        part_dir.mkdir(parents=True, exist_ok=True)
+
+        if len(timestamps):
+            # 정렬 후 중복 제거 (마지막 값 유지)
+            order = np.argsort(timestamps, kind='stable')
+            timestamps, values = timestamps[order], values[order]
+            keep = np.append(timestamps[1:] != timestamps[:-1], True)
+            timestamps, values = timestamps[keep], values[keep]
+
+            months = timestamps.astype('datetime64[ms]').astype('datetime64[M]')
+            bounds = np.flatnonzero(months[1:] != months[:-1]) + 1
+            for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(timestamps)]):
+                month = str(months[start])
+                self._write_month(
+                    symbol, timeframe, month, manifest,
+                    timestamps[start:end], values[start:end]
+                )
+
+        if covered is not None and covered[0] <= covered[1]:
+            coverage = [tuple(r) for r in manifest['coverage']] + [tuple(covered)]
+            manifest['coverage'] = [
+                list(r) for r in merge_ranges(coverage, manifest['interval_ms'])
+            ]
+
+        self._save_manifest(symbol, timeframe, manifest)
+        if len(timestamps):
+            for callback in on_append:
+                callback(symbol, timeframe)
+        return len(timestamps)
+
+    def _write_month(
+        self,
+        symbol: str,
+        timeframe: str,
+        month: str,
+        manifest: dict,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+    ) -> None:
+        path = self._month_path(symbol, timeframe, month)
+
+        if path.exists():
+            old_ts, old_values = self._read_month(path)
+            # 같은 timestamp는 새 캔들로 교체
+            stale = np.isin(old_ts, timestamps)
+            if not stale.any() and old_ts[-1] < timestamps[0]:
+                timestamps = np.concatenate([old_ts, timestamps])
+                values = np.concatenate([old_values, values])
+            else:
+                timestamps = np.concatenate([old_ts[~stale], timestamps])
+                values = np.concatenate([old_values[~stale], values])
+                order = np.argsort(timestamps, kind='stable')
+                timestamps, values = timestamps[order], values[order]
+
+        arrays = [pa.array(timestamps, type=pa.int64())]
+        arrays += [pa.array(np.ascontiguousarray(values[:, i])) for i in range(len(self.COLUMNS))]
+        batch = pa.record_batch(arrays, schema=self.SCHEMA)
+
+        tmp = path.with_suffix('.tmp')
+        with pa.OSFile(str(tmp), 'wb') as sink:
+            with pa.ipc.new_file(sink, self.SCHEMA) as writer:
+                writer.write_batch(batch)
+        os.replace(tmp, path)
+
+        manifest['months'][month] = {
+            'rows': int(len(timestamps)),
+            'first': int(timestamps[0]),
+            'last': int(timestamps[-1]),
+        }
+        manifest['months'] = dict(sorted(manifest['months'].items()))
+
+    def _to_arrays(self, candles) -> tuple[np.ndarray, np.ndarray]:
+        if isinstance(candles, pd.DataFrame):
+            df = candles.rename(columns=str.lower)
+            if 'timestamp' in df.columns:
+                ts = df['timestamp']
+            else:
+                ts = df.index.to_series()
+            if pd.api.types.is_datetime64_any_dtype(ts):
+                ts = pd.DatetimeIndex(ts).as_unit('ms').asi8
+            timestamps = np.asarray(ts, dtype=np.int64)
+            values = df[list(self.COLUMNS)].to_numpy(dtype=np.float64)
+        else:
+            rows = np.asarray(candles, dtype=np.float64).reshape(-1, len(self.COLUMNS) + 1)
+            timestamps = rows[:, 0].astype(np.int64)
+            values = rows[:, 1:]
+        return timestamps, np.ascontiguousarray(values)
+
+    # ============================================================
+    # 읽기
+    # ============================================================
+
+    def _read_month(self, path: Path) -> tuple[np.ndarray, np.ndarray]:
+        """파티션을 메모리로 읽기 (재작성용)"""
+        with pa.memory_map(str(path), 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        timestamps = table.column('timestamp').to_numpy().copy()
+        values = np.column_stack([table.column(col).to_numpy() for col in self.COLUMNS])
+        return timestamps, values
+
+    def _map_month(self, path: Path) -> dict[str, np.ndarray]:
+        """
+        memory-map된 파티션의 zero-copy numpy 뷰
+
+        파일 핸들은 반환 전에 닫고, 매핑 영역은 반환한 배열이 참조하는 동안 유지됩니다.
+        """
+        with pa.memory_map(str(path), 'r') as source:
+            batch = pa.ipc.open_file(source).get_batch(0)
+            return {
+                name: batch.column(i).to_numpy(zero_copy_only=True)
+                for i, name in enumerate(batch.schema.names)
+            }
+
+    def read_arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ms: int | None = None,
+        end_ms: int | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        [start_ms, end_ms] 구간을 numpy 배열로 읽기
+
+        구간과 겹치는 파티션만 매핑하며, 한 달 안의 구간이면
+        매핑된 파일의 읽기 전용 뷰를 그대로 반환
+        """
+        manifest = self.load_manifest(symbol, timeframe)
+        lo = -np.inf if start_ms is None else start_ms
+        hi = np.inf if end_ms is None else end_ms
+
+        pieces = []
+        for month, info in manifest['months'].items():
+            if info['last'] < lo or info['first'] > hi:
+                continue
+            columns = self._map_month(self._month_path(symbol, timeframe, month))
+            ts = columns['timestamp']
+            left = 0 if start_ms is None else np.searchsorted(ts, start_ms, side='left')
+            right = len(ts) if end_ms is None else np.searchsorted(ts, end_ms, side='right')
+            pieces.append({name: col[left:right] for name, col in columns.items()})
+
+        names = ('timestamp',) + self.COLUMNS
+        if not pieces:
+            return {
+                name: np.empty(0, dtype=np.int64 if name == 'timestamp' else np.float64)
+                for name in names
+            }
+        if len(pieces) == 1:
+            return pieces[0]
+        return {name: np.concatenate([p[name] for p in pieces]) for name in names}
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ms: int | None = None,
+        end_ms: int | None = None,
+    ) -> pd.DataFrame:
+        """구간을 int64 timestamp 컬럼을 가진 DataFrame으로 읽기"""
+        return pd.DataFrame(self.read_arrays(symbol, timeframe, start_ms, end_ms))
+
+    # ============================================================
+    # 커버리지 / 갭 탐지
+    # ============================================================
+
+    def coverage(self, symbol: str, timeframe: str) -> list[Range]:
+        """이미 수집한 구간 목록"""
+        return [tuple(r) for r in self.load_manifest(symbol, timeframe)['coverage']]
+
+    def missing_ranges(
+        self, symbol: str, timeframe: str, start_ms: int, end_ms: int
+    ) -> list[Range]:
+        """[start_ms, end_ms] 중 아직 수집하지 않은 구간"""
+        missing = []
+        cursor = start_ms
+        for cov_start, cov_end in self.coverage(symbol, timeframe):
+            if cov_end < cursor:
+                continue
+            if cov_start > end_ms:
+                break
+            if cov_start > cursor:
+                missing.append((cursor, cov_start - 1))
+            cursor = max(cursor, cov_end + 1)
+            if cursor > end_ms:
+                break
+        if cursor <= end_ms:
+            missing.append((cursor, end_ms))
+        return missing
+
+    def find_gaps(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ms: int | None = None,
+        end_ms: int | None = None,
+    ) -> list[Range]:
+        """
+        저장된 캔들 사이의 빠진 봉 탐지
+
+        Returns:
+            연속된 timestamp 간격이 봉 길이보다 큰 곳의
+            (첫 누락 ts, 마지막 누락 ts) 목록
+        """
+        step = timeframe_to_ms(timeframe)
+        ts = self.read_arrays(symbol, timeframe, start_ms, end_ms)['timestamp']
+        if len(ts) < 2:
+            return []
+        holes = np.flatnonzero(np.diff(ts) > step)
+        return [(int(ts[i] + step), int(ts[i + 1] - step)) for i in holes]
+
+    # ============================================================
+    # 관리
+    # ============================================================
+
+    def summary(self, symbol: str, timeframe: str) -> dict | None:
+        """심볼/타임프레임 요약 (파일을 읽지 않고 매니페스트만 사용)"""
+        return self._summarize(self.load_manifest(symbol, timeframe),
+                               self.partition_dir(symbol, timeframe))
+
+    def last_timestamp(self, symbol: str, timeframe: str) -> int | None:
+        """마지막으로 저장된 캔들의 timestamp (없으면 None)"""
+        summary = self.summary(symbol, timeframe)
+        return summary['end_ts'] if summary else None
+
+    def list_partitions(self) -> list[dict]:
+        """저장된 심볼/타임프레임 요약"""
+        summaries = []
+        for manifest_path in sorted(self.root.glob(f"*/*/{self.MANIFEST}")):
+            with open(manifest_path, 'r') as f:
+                summary = self._summarize(json.load(f), manifest_path.parent)
+            if summary:
+                summaries.append(summary)
+        return summaries
+
+    @staticmethod
+    def _summarize(manifest: dict, part_dir: Path) -> dict | None:
+        months = manifest['months']
+        if not months:
+            return None
+        return {
+            'symbol': manifest['symbol'],
+            'timeframe': manifest['timeframe'],
+            'rows': sum(m['rows'] for m in months.values()),
+            'months': len(months),
+            'start_ts': min(m['first'] for m in months.values()),
+            'end_ts': max(m['last'] for m in months.values()),
+            'path': str(part_dir),
+        }
+
+    def delete(self, symbol: str | None = None, timeframe: str | None = None) -> int:
+        """조건에 맞는 파티션 삭제 (삭제한 파일 수 반환)"""
+        deleted = 0
+        for manifest_path in list(self.root.glob(f"*/*/{self.MANIFEST}")):
+            part_dir = manifest_path.parent
+            if symbol and part_dir.parent.name != symbol.replace('/', '_'):
+                continue
+            if timeframe and part_dir.name != timeframe:
+                continue
+            for f in part_dir.glob("*.arrow"):
+                f.unlink()
+                deleted += 1
+            manifest_path.unlink()
+            try:
+                part_dir.rmdir()
+            except OSError:
+                pass
+        return deleted
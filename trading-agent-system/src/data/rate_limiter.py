@@ -0,0 +1,75 @@
+"""
+Weight Rate Limiter
+
+Binance REQUEST_WEIGHT 한도(1분 슬라이딩 윈도우)를 여러 코루틴이 공유하는 리미터
+- 요청마다 가중치를 예약하고, 한도를 넘으면 윈도우가 비워질 때까지 대기
+- 서버가 알려준 사용량(X-MBX-USED-WEIGHT-1M)으로 보정 가능
+"""
+
+import asyncio
+import time
+from collections import deque
+
+
+class WeightRateLimiter:
+    """가중치 기반 슬라이딩 윈도우 Rate Limiter"""
+
+    def __init__(self, max_weight: int = 1200, window: float = 60.0):
+        """
+        Args:
+            max_weight: 윈도우당 허용 가중치 (Binance 기본 1200/분)
+            window: 윈도우 길이 (초)
+        """
+        self.max_weight = max_weight
+        self.window = window
+
+        self._events: deque[tuple[float, int]] = deque()
+        self._used = 0
+        self._lock = asyncio.Lock()
+        self.total_weight = 0
+        self.total_wait = 0.0
+
+    @property
+    def used_weight(self) -> int:
+        """현재 윈도우에서 사용한 가중치"""
+        self._expire(time.monotonic())
+        return self._used
+
+    def _expire(self, now: float):
+        while self._events and now - self._events[0][0] >= self.window:
+            _, weight = self._events.popleft()
+            self._used -= weight
+
+    async def acquire(self, weight: int = 1):
+        """가중치 예약 (한도 초과 시 대기)"""
+        if weight > self.max_weight:
+            raise ValueError(f"Request weight {weight} exceeds limit {self.max_weight}")
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                if self._used + weight <= self.max_weight:
+                    break
+
+                # 가장 오래된 요청이 윈도우를 벗어날 때까지 대기
+                wait = self.window - (now - self._events[0][0])
+                self.total_wait += wait
+                await asyncio.sleep(wait)
+
+            self._events.append((now, weight))
+            self._used += weight
+            self.total_weight += weight
+
+    def sync_used_weight(self, server_used: int):
+        """
+        서버가 보고한 사용량이 로컬 집계보다 크면 차이만큼 예약
+
+        같은 IP의 다른 프로세스가 사용한 가중치까지 반영하기 위함
+        """
+        now = time.monotonic()
+        self._expire(now)
+        extra = server_used - self._used
+        if extra > 0:
+            self._events.append((now, extra))
+            self._used += extra
@@ -0,0 +1,82 @@
+"""
+Replay Exchange
+
+python-binance Client.get_klines()를 로컬 데이터로 대체하는 오프라인 거래소
+- OHLCVStore 스냅샷 또는 DataFrame에서 캔들을 재생
+- 네트워크 없이 수집기 동기화 로직을 테스트/리허설할 때 사용
+- 요청 횟수와 요청 구간을 기록하여 증분 동기화 검증 가능
+"""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from .ohlcv_store import OHLCVStore
+
+
+class ReplayExchange:
+    """로컬 캔들을 재생하는 Binance 클라이언트 대체물"""
+
+    def __init__(self, store: OHLCVStore | None = None, latency: float = 0.0):
+        """
+        Args:
+            store: 재생할 캔들이 저장된 OHLCVStore
+            latency: 요청당 인위적 지연 (초) - 네트워크 지연 흉내
+        """
+        self.store = store
+        self.latency = latency
+        self._series: dict[tuple[str, str], dict[str, np.ndarray]] = {}
+        self._lock = threading.Lock()
+        self.requests: list[tuple[str, str, int, int | None]] = []
+
+    def add_series(self, symbol: str, interval: str, data: pd.DataFrame):
+        """DataFrame(DatetimeIndex + Open/High/Low/Close/Volume)을 재생 데이터로 등록"""
+        df = data.rename(columns=str.lower)
+        self._series[(symbol, interval)] = {
+            "timestamp": pd.DatetimeIndex(df.index).as_unit("ms").asi8,
+            **{col: df[col].to_numpy(dtype=np.float64) for col in OHLCVStore.COLUMNS}
+        }
+
+    def _columns(self, symbol: str, interval: str) -> dict[str, np.ndarray]:
+        if (symbol, interval) not in self._series and self.store is not None:
+            self._series[(symbol, interval)] = self.store.read_arrays(symbol, interval)
+        if (symbol, interval) not in self._series:
+            raise ValueError(f"Invalid symbol: {symbol}")
+        return self._series[(symbol, interval)]
+
+    def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        startTime: int | None = None,
+        endTime: int | None = None,
+        limit: int = 500,
+        **kwargs
+    ) -> list[list]:
+        """Client.get_klines()와 같은 형식의 kline 목록 반환"""
+        with self._lock:
+            self.requests.append((symbol, interval, startTime, endTime))
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        columns = self._columns(symbol, interval)
+        ts = columns["timestamp"]
+        left = 0 if startTime is None else int(np.searchsorted(ts, startTime, side="left"))
+        right = len(ts) if endTime is None else int(np.searchsorted(ts, endTime, side="right"))
+        right = min(right, left + limit)
+
+        return [
+            [
+                int(ts[i]),
+                str(columns["open"][i]),
+                str(columns["high"][i]),
+                str(columns["low"][i]),
+                str(columns["close"][i]),
+                str(columns["volume"][i]),
+                0, "0", 0, "0", "0", "0"
+            ]
+            for i in range(left, right)
+        ]
@@ -3,11 +3,14 @@ Technical Indicators Library
 
 트렌드, 모멘텀, 변동성, 볼륨 지표 20개 이상 구현
 backtesting.py와 호환되는 형식으로 제공
+IndicatorCache.activate() 구간에서는 (데이터셋 지문, 지표, 파라미터)가 같은 결과를 재사용
 """
 
+from .cache import IndicatorCache, get_indicator_cache
+
 from .trend import (
     ADX, Supertrend, Ichimoku, ParabolicSAR,
-    EMA, SMA, WMA, HullMA, TEMA, ALMA
+    EMA, SMA, WMA, HullMA, TEMA, ALMA, KAMA
 )
 from .momentum import (
     RSI, MACD, Stochastic, CCI, MFI,
@@ -24,7 +27,7 @@ from .volume import (
 __all__ = [
     # Trend
     "ADX", "Supertrend", "Ichimoku", "ParabolicSAR",
-    "EMA", "SMA", "WMA", "HullMA", "TEMA", "ALMA",
+    "EMA", "SMA", "WMA", "HullMA", "TEMA", "ALMA", "KAMA",
     # Momentum
     "RSI", "MACD", "Stochastic", "CCI", "MFI",
     "WilliamsR", "ROC", "Momentum",
@@ -33,11 +36,13 @@ __all__ = [
     "StandardDeviation",
     # Volume
     "VWAP", "OBV", "VolumeProfile", "CMF", "ADLine",
+    # Cache
+    "IndicatorCache", "get_indicator_cache",
 ]
 
 # 지표 카테고리별 목록
 INDICATORS = {
-    "trend": ["ADX", "Supertrend", "Ichimoku", "ParabolicSAR", "EMA", "SMA", "WMA", "HullMA", "TEMA", "ALMA"],
+    "trend": ["ADX", "Supertrend", "Ichimoku", "ParabolicSAR", "EMA", "SMA", "WMA", "HullMA", "TEMA", "ALMA", "KAMA"],
     "momentum": ["RSI", "MACD", "Stochastic", "CCI", "MFI", "WilliamsR", "ROC", "Momentum"],
     "volatility": ["ATR", "BollingerBands", "KeltnerChannel", "DonchianChannel", "StandardDeviation"],
     "volume": ["VWAP", "OBV", "VolumeProfile", "CMF", "ADLine"],
@@ -0,0 +1,214 @@
+"""
+Adaptive MA Kernels
+
+Efficiency Ratio 기반 적응형 지표 커널 (Adaptive ML Trailing Stop 전략 공용)
+- efficiency_ratio_kernel: 이동 합으로 O(n) ER (length봉마다 정확한 합으로 재설정)
+- kama_from_er_kernel: ER이 주어진 KAMA 재귀
+- adaptive_trailing_stop_kernel: ER/ATR/KNN 기반 적응형 트레일링 스탑과 추세
+
+AdaptiveMA는 한 백테스트(전략 인스턴스) 안에서 같은 (시리즈, length)의 ER과 KAMA를
+한 번만 계산하도록 결과를 보관합니다.
+
+ER의 이동 합은 np.sum 창 합과 마지막 몇 비트까지 같지는 않지만 (상대 오차 ~1e-15),
+재설정 봉에서는 np.sum과 같은 pairwise 순서로 다시 더하므로 오차가 누적되지 않습니다.
+"""
+
+from typing import Any
+
+import numpy as np
+
+from .kernels import _pairwise_sum, as_float_array, njit
+
+
+@njit(cache=True)
+def efficiency_ratio_kernel(close: np.ndarray, length: int) -> np.ndarray:
+    """
+    Efficiency Ratio = |close[i] - close[i-length]| / Σ|close[j] - close[j-1]| (창 length)
+
+    Args:
+        close: 종가
+        length: ER 기간
+
+    Returns:
+        ER (0~1, i < length 구간과 변동이 없는 창은 0)
+    """
+    n = len(close)
+    er = np.zeros(n)
+    if length < 1 or n <= length:
+        return er
+
+    abs_diff = np.empty(n - 1)
+    for i in range(n - 1):
+        abs_diff[i] = abs(close[i + 1] - close[i])
+
+    volatility = 0.0
+    for i in range(length, n):
+        # 창 = abs_diff[i-length:i]
+        if (i - length) % length == 0:
+            volatility = _pairwise_sum(abs_diff, i - length, length)
+        else:
+            volatility += abs_diff[i - 1] - abs_diff[i - length - 1]
+
+        change = abs(close[i] - close[i - length])
+        er[i] = change / volatility if volatility > 0 else 0.0
+
+    return er
+
+
+@njit(cache=True)
+def kama_from_er_kernel(close: np.ndarray, er: np.ndarray, fast_length: int,
+                        slow_length: int) -> np.ndarray:
+    """
+    KAMA 재귀
+
+    KAMA = KAMA[prev] + SC * (Price - KAMA[prev]), SC = [ER * (FastSC - SlowSC) + SlowSC]^2
+
+    Args:
+        close: 종가
+        er: Efficiency Ratio
+        fast_length: 빠른 평활 기간
+        slow_length: 느린 평활 기간
+
+    Returns:
+        KAMA 값
+    """
+    n = len(close)
+    kama = np.zeros(n)
+    if n == 0:
+        return kama
+    kama[0] = close[0]
+
+    fast_sc = 2.0 / (fast_length + 1)
+    slow_sc = 2.0 / (slow_length + 1)
+
+    for i in range(1, n):
+        sc = (er[i] * (fast_sc - slow_sc) + slow_sc) ** 2
+        kama[i] = kama[i - 1] + sc * (close[i] - kama[i - 1])
+
+    return kama
+
+
+@njit(cache=True)
+def adaptive_trailing_stop_kernel(close: np.ndarray, atr: np.ndarray, er: np.ndarray,
+                                  knn_pred: np.ndarray, base_mult: float,
+                                  adaptive_str: float, knn_enabled: bool,
+                                  knn_weight: float, fast_length: int,
+                                  slow_length: int):
+    """
+    적응형 트레일링 스탑
+
+    1. 스탑 거리 = ATR × base_mult × (1 + (1 - ER) × adaptive_str)  (횡보장일수록 넓게)
+    2. KNN 예측으로 롱/숏 스탑 거리 조정 (상승 예측 → 롱 스탑 좁게, 숏 스탑 넓게)
+    3. 스탑 자체를 KAMA 방식(ER 기반 SC)으로 평활
+    4. 롱 스탑은 올라가기만, 숏 스탑은 내려가기만 (가격이 뚫으면 재설정)
+    5. 종가가 이전 숏 스탑 위 → 추세 1, 이전 롱 스탑 아래 → -1
+
+    Returns:
+        (long_stop, short_stop, trend)
+    """
+    n = len(close)
+    long_stop = np.zeros(n)
+    short_stop = np.zeros(n)
+    trend = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return long_stop, short_stop, trend
+
+    fast_sc = 2.0 / (fast_length + 1)
+    slow_sc = 2.0 / (slow_length + 1)
+
+    stop_distance = atr[0] * (base_mult * (1 + (1 - er[0]) * adaptive_str))
+    smooth_long = close[0] - stop_distance
+    smooth_short = close[0] + stop_distance
+    long_stop[0] = smooth_long
+    short_stop[0] = smooth_short
+    trend[0] = 1
+
+    for i in range(1, n):
+        knn_adjustment = (knn_pred[i] - 0.5) * knn_weight if knn_enabled else 0.0
+        stop_distance = atr[i] * (base_mult * (1 + (1 - er[i]) * adaptive_str))
+
+        raw_long = close[i] - (stop_distance * (1 - knn_adjustment))
+        raw_short = close[i] + (stop_distance * (1 + knn_adjustment))
+
+        er_val = er[i] if er[i] > 0 else 0.0
+        sc = (er_val * (fast_sc - slow_sc) + slow_sc) ** 2
+        smooth_long = smooth_long + sc * (raw_long - smooth_long)
+        smooth_short = smooth_short + sc * (raw_short - smooth_short)
+
+        if close[i - 1] > long_stop[i - 1]:
+            long_stop[i] = max(smooth_long, long_stop[i - 1])
+        else:
+            long_stop[i] = smooth_long
+
+        if close[i - 1] < short_stop[i - 1]:
+            short_stop[i] = min(smooth_short, short_stop[i - 1])
+        else:
+            short_stop[i] = smooth_short
+
+        if close[i] > short_stop[i - 1]:
+            trend[i] = 1
+        elif close[i] < long_stop[i - 1]:
+            trend[i] = -1
+        else:
+            trend[i] = trend[i - 1]
+
+    return long_stop, short_stop, trend
+
+
+class AdaptiveMA:
+    """
+    ER / KAMA 결과 보관 (한 백테스트 범위)
+
+    키는 (입력 시리즈 id, 길이, 파라미터)이며, 보관하는 동안 id가 재사용되지 않도록
+    입력 시리즈 참조도 함께 유지합니다. 전략 인스턴스마다 하나씩 만들어 씁니다.
+    """
+
+    def __init__(self):
+        self._results: dict[tuple, np.ndarray] = {}
+        self._series: dict[int, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _memo(self, kind: str, series, params: tuple, compute) -> np.ndarray:
+        key = (kind, id(series), len(series), params)
+        result = self._results.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = compute(as_float_array(series))
+        result.flags.writeable = False
+        self._series[id(series)] = series
+        self._results[key] = result
+        return result
+
+    def efficiency_ratio(self, close, length: int) -> np.ndarray:
+        """ER (i < length는 0, 읽기 전용)"""
+        return self._memo(
+            "er", close, (length,),
+            lambda values: efficiency_ratio_kernel(values, length)
+        )
+
+    def kama(self, close, length: int, fast_length: int, slow_length: int) -> np.ndarray:
+        """KAMA (같은 close/length의 ER 재사용, 읽기 전용)"""
+        er = self.efficiency_ratio(close, length)
+        return self._memo(
+            "kama", close, (length, fast_length, slow_length),
+            lambda values: kama_from_er_kernel(values, er, fast_length, slow_length)
+        )
+
+    @staticmethod
+    def trailing_stop(close, atr, er, knn_pred, base_mult: float, adaptive_str: float,
+                      knn_enabled: bool, knn_weight: float, fast_length: int,
+                      slow_length: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """adaptive_trailing_stop_kernel 래퍼 (입력을 float64 배열로 변환)"""
+        return adaptive_trailing_stop_kernel(
+            as_float_array(close), as_float_array(atr), as_float_array(er),
+            as_float_array(knn_pred), float(base_mult), float(adaptive_str),
+            bool(knn_enabled), float(knn_weight), int(fast_length), int(slow_length)
+        )
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._series.clear()
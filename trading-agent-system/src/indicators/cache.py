@@ -0,0 +1,601 @@
+"""
+Indicator Cache
+
+(데이터셋 지문, 지표, 파라미터) -> 지표 결과 메모이제이션
+
+- 키: 입력 시리즈 내용 해시(BLAKE2b) + 지표 식별자(이름 또는 함수 코드 해시) + 파라미터의 SHA-256
+- 메모리 LRU: maxsize 항목 또는 max_bytes 바이트를 넘으면 가장 오래 쓰지 않은 결과부터 제거
+- 선택적 디스크 저장: {spill_dir}/{dataset}/{key}.json + {key}.{i}.npy (읽을 때 memory-map)
+- 데이터셋 태그(예: BTCUSDT_1h) 단위 무효화 - OHLCVStore.append가 새 캔들을 쓰면 호출
+- @memoized 지표 함수는 activate() 구간 안에서만 캐시를 사용 (밖에서는 그대로 계산)
+
+캐시에 보관한 결과는 읽기 전용이며 호출자에게는 복사본을 돌려줍니다.
+"""
+
+import contextvars
+import hashlib
+import json
+import marshal
+import os
+import shutil
+import threading
+import types
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping
+
+import numpy as np
+import pandas as pd
+
+try:
+    from ..data import ohlcv_store
+except ImportError:  # scripts/*가 src/를 path에 넣고 indicators.*로 임포트한 경우
+    from data import ohlcv_store
+
+SCALAR_TYPES = (bool, int, float, str, type(None))
+
+# 현재 활성화된 (캐시, 데이터셋 태그) - @memoized 함수가 참조
+_active: contextvars.ContextVar[tuple["IndicatorCache", str | None] | None] = \
+    contextvars.ContextVar("indicator_cache", default=None)
+
+
+class Uncacheable(Exception):
+    """키를 만들 수 없는 입력 (또는 디스크에 저장할 수 없는 결과)"""
+
+
+def dataset_tag(symbol: str, interval: str) -> str:
+    """데이터셋 태그 (BTC/USDT, 1h -> BTCUSDT_1h)"""
+    return f"{symbol.replace('/', '').upper()}_{interval}"
+
+
+# ============================================================
+# 지문 / 키
+# ============================================================
+
+def _update_array(h: Any, values: np.ndarray) -> None:
+    if values.dtype == object:
+        try:
+            values = pd.util.hash_array(values)
+        except TypeError:
+            raise Uncacheable("hash할 수 없는 object 배열")
+    h.update(f"{values.dtype.str}{values.shape}".encode())
+    h.update(np.ascontiguousarray(values).data)
+
+
+def _update_index(h: Any, index: pd.Index) -> None:
+    if isinstance(index, pd.RangeIndex):
+        h.update(f"range{index.start},{index.stop},{index.step}".encode())
+        return
+    if isinstance(index, pd.DatetimeIndex):
+        h.update(f"datetime{index.dtype}{index.freqstr}".encode())
+        _update_array(h, index.asi8)
+        return
+    _update_array(h, index.to_numpy())
+
+
+def fingerprint(values: Any) -> str:
+    """
+    배열 / Series / DataFrame 내용 해시
+
+    값, dtype, shape와 (pandas는) 인덱스와 이름까지 포함하므로
+    같은 지문이면 같은 지표 결과를 만듭니다.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(values, pd.DataFrame):
+        h.update(b"frame" + repr(list(values.columns)).encode())
+        for i in range(values.shape[1]):
+            _update_array(h, values.iloc[:, i].to_numpy())
+        _update_index(h, values.index)
+    elif isinstance(values, pd.Series):
+        h.update(b"series" + repr(values.name).encode())
+        _update_array(h, values.to_numpy())
+        _update_index(h, values.index)
+    else:
+        _update_array(h, np.asarray(values))
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _code_digest(code: Any) -> str:
+    return hashlib.blake2b(marshal.dumps(code), digest_size=12).hexdigest()
+
+
+def instance_state(obj: Any) -> dict[str, Any]:
+    """
+    인스턴스의 스칼라 상태 (클래스 속성 + 인스턴스 속성)
+
+    backtesting.py Strategy의 파라미터처럼 메서드 결과를 바꾸는 값들입니다.
+    """
+    names = {
+        name
+        for cls in type(obj).__mro__
+        for name, value in vars(cls).items()
+        if not name.startswith("__") and isinstance(value, SCALAR_TYPES + (np.generic,))
+    }
+    names.update(getattr(obj, "__dict__", {}))
+
+    state = {}
+    for name in sorted(names):
+        value = getattr(obj, name, None)
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, SCALAR_TYPES):
+            state[name] = value
+    return state
+
+
+def function_token(func: Callable, owner: Any = None) -> list:
+    """
+    함수 식별자 - 모듈.qualname, 코드 해시, 기본값, 클로저 값
+
+    바운드 메서드는 인스턴스의 스칼라 상태를 포함합니다. 클로저가 owner를
+    참조하면 (예: init 안의 lambda가 self를 참조) owner의 스칼라 상태로 대신합니다.
+    """
+    bound = getattr(func, "__self__", None)
+    target = getattr(func, "__func__", func)
+    target = getattr(target, "py_func", target)  # numba 디스패처
+    name = f"{getattr(target, '__module__', '')}.{getattr(target, '__qualname__', repr(target))}"
+
+    code = getattr(target, "__code__", None)
+    if code is None:
+        # 내장 함수 / ufunc는 이름으로 식별
+        if isinstance(target, np.ufunc):
+            return [f"numpy.{target.__name__}"]
+        if isinstance(target, types.BuiltinFunctionType) and (
+            bound is None or isinstance(bound, types.ModuleType)
+        ):
+            return [name]
+        raise Uncacheable(f"식별할 수 없는 함수: {name}")
+
+    try:
+        closure = [cell.cell_contents for cell in target.__closure__ or ()]
+    except ValueError:  # 아직 값이 없는 셀
+        raise Uncacheable(f"클로저를 읽을 수 없는 함수: {name}")
+
+    token = [
+        name,
+        _code_digest(code),
+        value_token(target.__defaults__ or ()),
+        value_token(target.__kwdefaults__ or {}),
+        [
+            {"owner": value_token(instance_state(value))} if owner is not None and value is owner
+            else value_token(value)
+            for value in closure
+        ],
+    ]
+    if bound is not None:
+        token.append(value_token(instance_state(bound)))
+    return token
+
+
+def value_token(value: Any) -> Any:
+    """키에 넣을 JSON 직렬화 가능한 값 (배열은 지문, 함수는 function_token)"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, SCALAR_TYPES):
+        return value
+    if isinstance(value, (np.ndarray, pd.Series, pd.DataFrame)):
+        return {"data": fingerprint(value)}
+    if isinstance(value, (tuple, list)):
+        return [value_token(v) for v in value]
+    if isinstance(value, Mapping):
+        return {"dict": sorted([str(k), value_token(v)] for k, v in value.items())}
+    if callable(value):
+        return {"func": function_token(value)}
+    raise Uncacheable(f"키로 쓸 수 없는 값: {type(value).__name__}")
+
+
+def make_key(name: str, args: tuple = (), params: Mapping[str, Any] | None = None,
+             extra: Any = None) -> str:
+    """캐시 키 (SHA-256 hex)"""
+    payload = json.dumps(
+        [name, value_token(args), value_token(dict(params or {})), value_token(extra)],
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# 결과 인코딩 (디스크 저장 형식)
+# ============================================================
+
+def _check_array(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype == object:
+        raise Uncacheable("object 배열은 .npy로 저장하지 않음")
+    return values
+
+
+def _check_label(label: Any) -> Any:
+    if isinstance(label, np.generic):
+        label = label.item()
+    if not isinstance(label, SCALAR_TYPES):
+        raise Uncacheable(f"JSON으로 저장할 수 없는 이름: {label!r}")
+    return label
+
+
+def _encode_index(index: pd.Index) -> tuple[np.ndarray, dict]:
+    meta = {"name": _check_label(index.name)}
+    if isinstance(index, pd.DatetimeIndex):
+        # tz가 있으면 UTC 기준 naive 값으로 저장
+        naive = index.tz_convert(None) if index.tz is not None else index
+        meta.update(
+            kind="datetime",
+            tz=str(index.tz) if index.tz is not None else None,
+            freq=index.freqstr
+        )
+        return naive.to_numpy(), meta
+    meta["kind"] = "plain"
+    return _check_array(index.to_numpy()), meta
+
+
+def _decode_index(values: np.ndarray, meta: dict) -> pd.Index:
+    if meta["kind"] == "datetime":
+        index = pd.DatetimeIndex(np.asarray(values), name=meta["name"], freq=meta["freq"])
+        if meta["tz"]:
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+        return index
+    return pd.Index(values, name=meta["name"])
+
+
+def encode_result(result: Any) -> tuple[list[np.ndarray], dict]:
+    """결과 -> (배열 목록, 메타)"""
+    if isinstance(result, np.ndarray):
+        return [_check_array(result)], {"kind": "array"}
+    if isinstance(result, pd.Series):
+        index, index_meta = _encode_index(result.index)
+        return [_check_array(result.to_numpy()), index], {
+            "kind": "series", "name": _check_label(result.name), "index": index_meta
+        }
+    if isinstance(result, pd.DataFrame):
+        index, index_meta = _encode_index(result.index)
+        columns = [_check_array(result.iloc[:, i].to_numpy()) for i in range(result.shape[1])]
+        return columns + [index], {
+            "kind": "frame",
+            "columns": [_check_label(c) for c in result.columns],
+            "index": index_meta,
+        }
+    if isinstance(result, tuple):
+        arrays, parts = [], []
+        for item in result:
+            item_arrays, item_meta = encode_result(item)
+            arrays.extend(item_arrays)
+            parts.append((len(item_arrays), item_meta))
+        return arrays, {"kind": "tuple", "parts": parts}
+    raise Uncacheable(f"저장할 수 없는 결과 타입: {type(result).__name__}")
+
+
+def decode_result(arrays: list[np.ndarray], meta: dict) -> Any:
+    """(배열 목록, 메타) -> 결과"""
+    kind = meta["kind"]
+    if kind == "array":
+        return arrays[0]
+    if kind == "series":
+        return pd.Series(arrays[0], index=_decode_index(arrays[1], meta["index"]), name=meta["name"])
+    if kind == "frame":
+        frame = pd.DataFrame(
+            {i: values for i, values in enumerate(arrays[:-1])},
+            index=_decode_index(arrays[-1], meta["index"])
+        )
+        frame.columns = meta["columns"]
+        return frame
+    items, offset = [], 0
+    for count, item_meta in meta["parts"]:
+        items.append(decode_result(arrays[offset:offset + count], item_meta))
+        offset += count
+    return tuple(items)
+
+
+def _is_cacheable_result(result: Any) -> bool:
+    if isinstance(result, tuple):
+        return all(_is_cacheable_result(item) for item in result)
+    return isinstance(result, (np.ndarray, pd.Series, pd.DataFrame))
+
+
+def _freeze(result: Any) -> Any:
+    """보관용 읽기 전용 결과"""
+    if isinstance(result, np.ndarray):
+        result = result.copy()
+        result.flags.writeable = False
+        return result
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_freeze(item) for item in result)
+    return result
+
+
+def _thaw(result: Any) -> Any:
+    """호출자에게 줄 복사본"""
+    if isinstance(result, np.ndarray):
+        return np.array(result)
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_thaw(item) for item in result)
+    return result
+
+
+def _nbytes(result: Any) -> int:
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        return int(np.sum(result.memory_usage(index=True)))
+    return sum(_nbytes(item) for item in result)
+
+
+# ============================================================
+# 캐시
+# ============================================================
+
+class _Entry:
+    __slots__ = ("value", "dataset", "nbytes")
+
+    def __init__(self, value: Any, dataset: str | None, nbytes: int):
+        self.value = value
+        self.dataset = dataset
+        self.nbytes = nbytes
+
+
+class IndicatorCache:
+    """지표 결과 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        max_bytes: int = 512 * 1024 * 1024,
+        spill_dir: str | Path | None = None
+    ):
+        """
+        Args:
+            maxsize: 메모리에 유지할 결과 수
+            max_bytes: 메모리에 유지할 결과 크기 합 (바이트)
+            spill_dir: .npy 저장 디렉토리 (None이면 디스크 저장 안 함)
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.bypassed = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------
+    # 조회 / 계산
+    # ------------------------------------------------------------
+
+    def get_or_compute(
+        self,
+        name: str,
+        args: tuple,
+        params: Mapping[str, Any] | None,
+        compute: Callable[[], Any],
+        dataset: str | None = None,
+        extra: Any = None
+    ) -> Any:
+        """
+        캐시된 결과 또는 compute() 결과
+
+        Args:
+            name: 지표 식별자 (예: 'ta.ema')
+            args: 입력 시리즈 등 위치 인자 (배열은 내용 지문으로 키에 포함)
+            params: 지표 파라미터
+            compute: 캐시에 없을 때 호출할 함수
+            dataset: 무효화 단위 데이터셋 태그
+            extra: 키에 추가할 값 (예: 전략 코드 해시)
+        """
+        try:
+            key = make_key(name, args, params, [dataset, extra])
+        except Uncacheable:
+            return self.bypass(compute)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _thaw(entry.value)
+
+        value = self._load(key, dataset)
+        if value is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._store(key, value, dataset)
+            return _thaw(value)
+
+        result = self._compute(compute)
+        if not _is_cacheable_result(result):
+            with self._lock:
+                self.bypassed += 1
+            return result
+
+        value = _freeze(result)
+        with self._lock:
+            self.misses += 1
+        self._store(key, value, dataset)
+        self._spill(key, value, dataset)
+        return _thaw(value)
+
+    def bypass(self, compute: Callable[[], Any]) -> Any:
+        """캐시 없이 계산 (키를 만들 수 없는 호출)"""
+        with self._lock:
+            self.bypassed += 1
+        return self._compute(compute)
+
+    def call(self, func: Callable, *args, dataset: str | None = None, **kwargs) -> Any:
+        """func(*args, **kwargs)를 캐시를 거쳐 호출 (dataset 인자는 캐시가 사용)"""
+        try:
+            name = json.dumps(function_token(func))
+        except Uncacheable:
+            return self.bypass(lambda: func(*args, **kwargs))
+        return self.get_or_compute(name, args, kwargs, lambda: func(*args, **kwargs), dataset)
+
+    @staticmethod
+    def _compute(compute: Callable[[], Any]) -> Any:
+        # 계산 중에 호출되는 다른 @memoized 지표는 따로 저장하지 않음
+        token = _active.set(None)
+        try:
+            return compute()
+        finally:
+            _active.reset(token)
+
+    def _store(self, key: str, value: Any, dataset: str | None) -> None:
+        nbytes = _nbytes(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._entries[key] = _Entry(value, dataset, nbytes)
+            self._bytes += nbytes
+            while self._entries and (
+                len(self._entries) > self.maxsize or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+
+    # ------------------------------------------------------------
+    # 디스크 저장
+    # ------------------------------------------------------------
+
+    def _spill_path(self, key: str, dataset: str | None) -> Path:
+        return self.spill_dir / (dataset or "_") / key
+
+    def _spill(self, key: str, value: Any, dataset: str | None) -> None:
+        if self.spill_dir is None:
+            return
+        try:
+            arrays, meta = encode_result(value)
+        except Uncacheable:
+            return
+
+        base = self._spill_path(key, dataset)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f"{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            for i, values in enumerate(arrays):
+                tmp = base.with_name(f"{key}.{i}.npy.{suffix}")
+                with open(tmp, "wb") as f:
+                    np.save(f, values, allow_pickle=False)
+                os.replace(tmp, base.with_name(f"{key}.{i}.npy"))
+            # 메타 파일이 마지막 - 메타가 있으면 배열 파일이 모두 있음
+            tmp = base.with_name(f"{key}.json.{suffix}")
+            tmp.write_text(json.dumps({"arrays": len(arrays), "meta": meta}))
+            os.replace(tmp, base.with_name(f"{key}.json"))
+        except OSError:
+            for leftover in base.parent.glob(f"{key}.*.{suffix}"):
+                leftover.unlink(missing_ok=True)
+
+    def _load(self, key: str, dataset: str | None) -> Any:
+        if self.spill_dir is None:
+            return None
+        base = self._spill_path(key, dataset)
+        try:
+            header = json.loads(base.with_name(f"{key}.json").read_text())
+            arrays = [
+                np.asarray(np.load(base.with_name(f"{key}.{i}.npy"), mmap_mode="r", allow_pickle=False))
+                for i in range(header["arrays"])
+            ]
+            # memory-map 그대로 보관 (mmap_mode="r"이라 읽기 전용)
+            return decode_result(arrays, header["meta"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    # ------------------------------------------------------------
+    # 활성화 / 무효화
+    # ------------------------------------------------------------
+
+    @contextmanager
+    def activate(self, dataset: str | None = None) -> Iterator["IndicatorCache"]:
+        """이 구간에서 호출되는 @memoized 지표가 이 캐시를 사용"""
+        token = _active.set((self, dataset))
+        try:
+            yield self
+        finally:
+            _active.reset(token)
+
+    def invalidate(self, dataset: str | None = None) -> int:
+        """
+        데이터셋 태그의 결과 제거 (None이면 전부)
+
+        Returns:
+            제거한 메모리 항목 수
+        """
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if dataset is None or entry.dataset == dataset
+            ]
+            for key in keys:
+                self._bytes -= self._entries.pop(key).nbytes
+
+        if self.spill_dir is not None:
+            target = self.spill_dir if dataset is None else self.spill_dir / dataset
+            if target.is_dir():
+                shutil.rmtree(target, ignore_errors=True)
+                self.spill_dir.mkdir(parents=True, exist_ok=True)
+        return len(keys)
+
+    def clear(self) -> None:
+        """메모리 캐시 비우기 (디스크 파일은 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+def active_cache() -> tuple[IndicatorCache, str | None] | None:
+    """현재 활성화된 (캐시, 데이터셋 태그)"""
+    return _active.get()
+
+
+def memoized(func: Callable) -> Callable:
+    """activate()된 캐시가 있으면 그 캐시로 계산하는 지표 함수 데코레이터"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        active = _active.get()
+        if active is None:
+            return func(*args, **kwargs)
+        cache, dataset = active
+        return cache.call(func, *args, dataset=dataset, **kwargs)
+    return wrapper
+
+
+_shared_cache = IndicatorCache()
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """프로세스 공용 캐시 (BacktestEngine 기본값)"""
+    return _shared_cache
+
+
+def invalidate_dataset(symbol: str, interval: str) -> int:
+    """프로세스 공용 캐시에서 데이터셋 결과 제거 (OHLCVStore.append가 호출)"""
+    return _shared_cache.invalidate(dataset_tag(symbol, interval))
+
+
+ohlcv_store.on_append.append(invalidate_dataset)
@@ -0,0 +1,284 @@
+"""
+Indicator Kernels
+
+재귀(경로 의존) 지표를 위한 배열 기반 커널
+- Supertrend, Parabolic SAR, EWM 평활화(ADX), KAMA
+- float64 ndarray 입력 → ndarray 출력 (pandas 의존 없음)
+- numba 설치 시 JIT 컴파일, 미설치 시 동일 로직을 순수 Python으로 실행
+
+pandas 래퍼(trend.py)의 기존 `.iloc` 루프와 비트 단위로 동일한 결과를 내도록
+연산 순서와 NaN 비교 규칙을 그대로 따른다.
+"""
+
+import numpy as np
+
+# numba 임포트 시도
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 무시"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def as_float_array(values) -> np.ndarray:
+    """커널 입력용 연속 float64 배열로 변환"""
+    return np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+
+
+@njit
+def ewm_mean_kernel(values: np.ndarray, com: float) -> np.ndarray:
+    """
+    지수 가중 이동평균 (adjust=False)
+
+    `pd.Series.ewm(com=com, adjust=False).mean()`과 동일한 알고리즘.
+    NaN 구간은 가중치만 감쇠시키고 값은 유지한다 (ignore_na=False).
+
+    Args:
+        values: 입력 시계열
+        com: center of mass (span이면 (span - 1) / 2)
+
+    Returns:
+        EWM 값
+    """
+    n = len(values)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+
+    alpha = 1.0 / (1.0 + com)
+    old_wt_factor = 1.0 - alpha
+    new_wt = alpha
+
+    weighted = values[0]
+    nobs = 1 if weighted == weighted else 0
+    out[0] = weighted if nobs >= 1 else np.nan
+    old_wt = 1.0
+
+    for i in range(1, n):
+        cur = values[i]
+        is_observation = cur == cur
+        if is_observation:
+            nobs += 1
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != cur:
+                    weighted = old_wt * weighted + new_wt * cur
+                    weighted /= (old_wt + new_wt)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted if nobs >= 1 else np.nan
+
+    return out
+
+
+@njit
+def supertrend_kernel(close: np.ndarray, upper_band: np.ndarray,
+                      lower_band: np.ndarray):
+    """
+    Supertrend 재귀 계산
+
+    Args:
+        close: 종가
+        upper_band: hl2 + multiplier * ATR
+        lower_band: hl2 - multiplier * ATR
+
+    Returns:
+        (supertrend, direction) - direction은 1.0(상승) / -1.0(하락)
+    """
+    n = len(close)
+    supertrend = np.full(n, np.nan)
+    direction = np.full(n, np.nan)
+    if n == 0:
+        return supertrend, direction
+
+    supertrend[0] = upper_band[0]
+    direction[0] = -1.0
+
+    for i in range(1, n):
+        if close[i] > supertrend[i - 1]:
+            supertrend[i] = lower_band[i]
+            direction[i] = 1.0
+        elif close[i] < supertrend[i - 1]:
+            supertrend[i] = upper_band[i]
+            direction[i] = -1.0
+        else:
+            supertrend[i] = supertrend[i - 1]
+            direction[i] = direction[i - 1]
+
+            if direction[i] == 1 and lower_band[i] > supertrend[i]:
+                supertrend[i] = lower_band[i]
+            elif direction[i] == -1 and upper_band[i] < supertrend[i]:
+                supertrend[i] = upper_band[i]
+
+    return supertrend, direction
+
+
+@njit
+def psar_kernel(high: np.ndarray, low: np.ndarray, af_start: float,
+                af_increment: float, af_max: float):
+    """
+    Parabolic SAR 재귀 계산
+
+    min()/max()는 Python 내장 함수와 같은 순서로 비교하여
+    NaN이 섞여도 기존 결과와 동일하게 유지한다.
+
+    Args:
+        high: 고가
+        low: 저가
+        af_start: 초기 가속 계수
+        af_increment: 가속 계수 증가분
+        af_max: 최대 가속 계수
+
+    Returns:
+        (sar, trend) - trend는 1.0(상승) / -1.0(하락)
+    """
+    n = len(high)
+    sar = np.full(n, np.nan)
+    trend = np.full(n, np.nan)
+    if n == 0:
+        return sar, trend
+
+    af = af_start
+    ep = low[0]
+
+    sar[0] = high[0]
+    trend[0] = -1.0
+
+    for i in range(1, n):
+        if trend[i - 1] == 1:  # 상승 추세
+            value = sar[i - 1] + af * (ep - sar[i - 1])
+            prev_low = low[i - 2] if i > 1 else low[i - 1]
+            if low[i - 1] < value:
+                value = low[i - 1]
+            if prev_low < value:
+                value = prev_low
+            sar[i] = value
+
+            if low[i] < sar[i]:
+                trend[i] = -1.0
+                sar[i] = ep
+                ep = low[i]
+                af = af_start
+            else:
+                trend[i] = 1.0
+                if high[i] > ep:
+                    ep = high[i]
+                    af = af + af_increment
+                    if af_max < af:
+                        af = af_max
+        else:  # 하락 추세
+            value = sar[i - 1] + af * (ep - sar[i - 1])
+            prev_high = high[i - 2] if i > 1 else high[i - 1]
+            if high[i - 1] > value:
+                value = high[i - 1]
+            if prev_high > value:
+                value = prev_high
+            sar[i] = value
+
+            if high[i] > sar[i]:
+                trend[i] = 1.0
+                sar[i] = ep
+                ep = high[i]
+                af = af_start
+            else:
+                trend[i] = -1.0
+                if low[i] < ep:
+                    ep = low[i]
+                    af = af + af_increment
+                    if af_max < af:
+                        af = af_max
+
+    return sar, trend
+
+
+@njit
+def _pairwise_sum(values: np.ndarray, start: int, count: int) -> float:
+    """numpy의 pairwise 합산과 동일한 순서로 values[start:start+count] 합계"""
+    if count < 8:
+        res = -0.0
+        for i in range(count):
+            res += values[start + i]
+        return res
+    elif count <= 128:
+        r0 = values[start]
+        r1 = values[start + 1]
+        r2 = values[start + 2]
+        r3 = values[start + 3]
+        r4 = values[start + 4]
+        r5 = values[start + 5]
+        r6 = values[start + 6]
+        r7 = values[start + 7]
+        i = 8
+        limit = count - (count % 8)
+        while i < limit:
+            r0 += values[start + i]
+            r1 += values[start + i + 1]
+            r2 += values[start + i + 2]
+            r3 += values[start + i + 3]
+            r4 += values[start + i + 4]
+            r5 += values[start + i + 5]
+            r6 += values[start + i + 6]
+            r7 += values[start + i + 7]
+            i += 8
+        res = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+        while i < count:
+            res += values[start + i]
+            i += 1
+        return res
+    half = count // 2
+    half -= half % 8
+    return _pairwise_sum(values, start, half) + \
+        _pairwise_sum(values, start + half, count - half)
+
+
+@njit
+def kama_kernel(close: np.ndarray, length: int, fast_length: int,
+                slow_length: int) -> np.ndarray:
+    """
+    Kaufman's Adaptive Moving Average
+
+    KAMA = KAMA[prev] + SC * (Price - KAMA[prev])
+    SC = [ER * (FastSC - SlowSC) + SlowSC]^2
+
+    Args:
+        close: 종가
+        length: Efficiency Ratio 기간
+        fast_length: 빠른 평활 기간
+        slow_length: 느린 평활 기간
+
+    Returns:
+        KAMA 값
+    """
+    n = len(close)
+    kama = np.zeros(n)
+    if n == 0:
+        return kama
+    kama[0] = close[0]
+
+    fast_sc = 2.0 / (fast_length + 1)
+    slow_sc = 2.0 / (slow_length + 1)
+
+    abs_diff = np.empty(max(n - 1, 0))
+    for i in range(n - 1):
+        abs_diff[i] = abs(close[i + 1] - close[i])
+
+    for i in range(1, n):
+        if i >= length:
+            change = abs(close[i] - close[i - length])
+            volatility = _pairwise_sum(abs_diff, i - length, length)
+            er = change / volatility if volatility != 0 else 0.0
+        else:
+            er = 0.0
+
+        sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
+        kama[i] = kama[i - 1] + sc * (close[i] - kama[i - 1])
+
+    return kama
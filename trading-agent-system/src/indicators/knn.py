@@ -0,0 +1,229 @@
+"""
+KNN Pattern Matching
+
+Adaptive ML Trailing Stop [BOSWaves]의 KNN 패턴 매칭을 배열 연산으로 구현
+- 최근 feature_length개 종가 윈도우를 정규화하여 과거 윈도우와 유클리드 거리 비교
+- 후보는 offset = feature_length..lookback 봉 전에 끝난 윈도우 (결과가 이미 확정된 과거만)
+- 가까운 K개의 "이후 feature_length봉 상승 여부"를 역거리 가중 평균 → 예측 (0~1)
+- 이웃의 상승/하락 일치도 → 신뢰도 (0~1)
+
+knn_pattern_prediction(): 전체 시계열 일괄 계산 (stride tricks 윈도우 + 봉 청크 × offset 열 단위 거리)
+KNNPatternMatcher: 실시간용 스트리밍 계산 (봉마다 update, 일괄 계산과 같은 값)
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+NORMALIZATIONS = ("zscore", "minmax")
+
+# 청크 하나에서 만드는 (봉 × 후보) 거리 배열의 최대 원소 수 (~32MB)
+_CHUNK_ELEMENTS = 1 << 22
+
+
+def normalize_windows(windows: np.ndarray, method: str = "zscore") -> np.ndarray:
+    """
+    윈도우별 정규화 (가격 수준과 무관한 모양만 비교)
+
+    Args:
+        windows: (윈도우 수, feature_length) 배열
+        method: zscore (평균 0, 표준편차 1) | minmax (0~1, Pine normalize와 같은 범위)
+
+    Returns:
+        같은 모양의 정규화 배열 (변동이 없는 윈도우는 zscore 0, minmax 0.5)
+    """
+    if method == "zscore":
+        center = windows.mean(axis=-1, keepdims=True)
+        scale = windows.std(axis=-1, keepdims=True)
+        flat = 0.0
+    elif method == "minmax":
+        center = windows.min(axis=-1, keepdims=True)
+        scale = windows.max(axis=-1, keepdims=True) - center
+        flat = 0.5
+    else:
+        raise ValueError(f"Unknown normalization: {method} (choose from {NORMALIZATIONS})")
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        normalized = (windows - center) / scale
+    return np.where(scale > 0, normalized, flat)
+
+
+def _validate(k: int, lookback: int, feature_length: int) -> None:
+    if feature_length < 2:
+        raise ValueError("feature_length must be >= 2")
+    if lookback < feature_length:
+        raise ValueError("lookback must be >= feature_length")
+    if k < 1:
+        raise ValueError("k must be >= 1")
+
+
+def _distance(windows: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """행별 유클리드 거리 (현재 윈도우는 브로드캐스트)"""
+    diff = windows - current
+    return np.sqrt((diff * diff).sum(axis=-1))
+
+
+def _vote(distances: np.ndarray, outcomes: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    가까운 K개 이웃의 역거리 가중 예측과 신뢰도 (행 = 봉, 열 = 후보)
+
+    정렬 대신 K번째 거리로 선택하고, 거리가 같으면 앞 열(offset이 작은 최근 패턴)을 먼저 고릅니다.
+    """
+    kth = np.partition(distances, k - 1, axis=1)[:, k - 1:k]
+    closer = distances < kth
+    tied = distances == kth
+    needed = k - closer.sum(axis=1, keepdims=True)
+    chosen = closer | (tied & (np.cumsum(tied, axis=1) <= needed))
+
+    with np.errstate(divide="ignore"):
+        weights = np.where(distances > 0, 1.0 / (distances + 0.001), 1.0)
+    weights = np.where(chosen, weights, 0.0)
+
+    prediction = (weights * outcomes).sum(axis=1) / weights.sum(axis=1)
+    confidence = np.abs(np.where(chosen, outcomes, 0.0).sum(axis=1) / k - 0.5) * 2
+    return prediction, confidence
+
+
+def _outcomes(close: np.ndarray, feature_length: int) -> np.ndarray:
+    """봉 t에서 끝난 패턴 이후 feature_length봉 수익률이 양수면 1 (미확정은 0)"""
+    up = np.zeros(len(close))
+    if len(close) > feature_length:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            future = (close[feature_length:] - close[:-feature_length]) / close[:-feature_length]
+        up[:-feature_length] = future > 0
+    return up
+
+
+def knn_pattern_prediction(
+    close,
+    k: int = 7,
+    lookback: int = 100,
+    feature_length: int = 5,
+    normalization: str = "zscore"
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    봉마다 KNN 패턴 예측 (미래 데이터 사용 없음)
+
+    봉 i에서 현재 패턴은 close[i-L+1..i], 후보는 봉 i-offset에서 끝난 패턴
+    (offset = L..lookback)이고 후보의 결과 close[i-offset+L]은 봉 i 이전에 확정되어 있습니다.
+    모든 후보가 갖춰지는 봉(lookback + L - 1)부터 계산하고 그 전은 (0.5, 0.0)입니다.
+
+    Args:
+        close: 종가
+        k: 이웃 수
+        lookback: 탐색할 과거 봉 수
+        feature_length: 패턴 길이 (L)
+        normalization: zscore | minmax
+
+    Returns:
+        (prediction, confidence) - prediction은 0(하락)~1(상승), 0.5는 중립
+    """
+    _validate(k, lookback, feature_length)
+    close = np.ascontiguousarray(np.asarray(close, dtype=np.float64))
+    n = len(close)
+    prediction = np.full(n, 0.5)
+    confidence = np.zeros(n)
+
+    n_candidates = lookback - feature_length + 1
+    first = lookback + feature_length - 1
+    if n_candidates < k or n <= first:
+        return prediction, confidence
+
+    windows = normalize_windows(sliding_window_view(close, feature_length), normalization)
+    up = _outcomes(close, feature_length)
+
+    # 윈도우 j는 봉 j+L-1에서 끝남 -> 봉 i의 현재 윈도우 i-L+1, 후보 윈도우 i-L+1-offset
+    # 청크 안의 봉은 연속이므로 offset마다 윈도우 배열의 슬라이스 하나로 후보 열을 채움
+    offsets = range(feature_length, lookback + 1)
+    chunk = max(1, _CHUNK_ELEMENTS // n_candidates)
+
+    for start in range(first, n, chunk):
+        stop = min(start + chunk, n)
+        lo, hi = start - feature_length + 1, stop - feature_length + 1
+        current = windows[lo:hi]
+
+        # offset별 행으로 채운 뒤 전치 (열 단위 쓰기보다 캐시 친화적)
+        distances = np.empty((n_candidates, stop - start))
+        outcomes = np.empty((n_candidates, stop - start))
+        for row, offset in enumerate(offsets):
+            distances[row] = _distance(windows[lo - offset:hi - offset], current)
+            outcomes[row] = up[start - offset:stop - offset]
+
+        prediction[start:stop], confidence[start:stop] = _vote(
+            np.ascontiguousarray(distances.T), np.ascontiguousarray(outcomes.T), k
+        )
+
+    return prediction, confidence
+
+
+class KNNPatternMatcher:
+    """
+    스트리밍 KNN 패턴 매칭 (실시간용)
+
+    봉마다 update()로 종가를 넣으면 knn_pattern_prediction()과 같은 값을 반환합니다.
+    정규화된 윈도우는 봉이 들어올 때 한 번만 계산해 최근 lookback + 1개를 버퍼에 보관하므로
+    봉당 비용은 O(lookback × feature_length)입니다.
+    """
+
+    def __init__(
+        self,
+        k: int = 7,
+        lookback: int = 100,
+        feature_length: int = 5,
+        normalization: str = "zscore"
+    ):
+        _validate(k, lookback, feature_length)
+        if normalization not in NORMALIZATIONS:
+            raise ValueError(f"Unknown normalization: {normalization} (choose from {NORMALIZATIONS})")
+
+        self.k = k
+        self.lookback = lookback
+        self.feature_length = feature_length
+        self.normalization = normalization
+
+        # 최근 종가 / 정규화 윈도우 버퍼 (마지막 행이 현재 봉)
+        self._closes = np.zeros(lookback + feature_length)
+        self._windows = np.zeros((lookback + 1, feature_length))
+        self._count = 0
+        # 후보 offset 오름차순
+        self._offsets = np.arange(feature_length, lookback + 1)
+        self.prediction = 0.5
+        self.confidence = 0.0
+
+    def update(self, close: float) -> tuple[float, float]:
+        """
+        새 봉의 종가 반영
+
+        Returns:
+            (prediction, confidence)
+        """
+        self._closes[:-1] = self._closes[1:]
+        self._closes[-1] = close
+        self._count += 1
+
+        if self._count >= self.feature_length:
+            recent = self._closes[None, -self.feature_length:]
+            self._windows[:-1] = self._windows[1:]
+            self._windows[-1] = normalize_windows(recent, self.normalization)[0]
+
+        if self._count < len(self._closes) or self.lookback - self.feature_length + 1 < self.k:
+            return self.prediction, self.confidence
+
+        closes = self._closes
+        candidates = self._windows[self.lookback - self._offsets]
+
+        # 후보 봉 t = i - offset의 결과: close[t + L] vs close[t]
+        past = closes[-1 - self._offsets]
+        future = closes[-1 - self._offsets + self.feature_length]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            outcomes = ((future - past) / past > 0).astype(np.float64)
+
+        distances = _distance(candidates, self._windows[-1])[None, :]
+        prediction, confidence = _vote(distances, outcomes[None, :], self.k)
+        self.prediction = float(prediction[0])
+        self.confidence = float(confidence[0])
+        return self.prediction, self.confidence
+
+    def reset(self) -> None:
+        self._count = 0
+        self.prediction = 0.5
+        self.confidence = 0.0
@@ -10,7 +10,10 @@ import numpy as np
 import pandas as pd
 from typing import Union
 
+from .cache import memoized
 
+
+@memoized
 def RSI(data: pd.Series, period: int = 14) -> pd.Series:
     """
     Relative Strength Index (상대강도지수)
@@ -40,6 +43,7 @@ def RSI(data: pd.Series, period: int = 14) -> pd.Series:
     return rsi
 
 
+@memoized
 def MACD(
     data: pd.Series,
     fast_period: int = 12,
@@ -76,6 +80,7 @@ def MACD(
     })
 
 
+@memoized
 def Stochastic(
     high: pd.Series,
     low: pd.Series,
@@ -120,6 +125,7 @@ def Stochastic(
     })
 
 
+@memoized
 def CCI(
     high: pd.Series,
     low: pd.Series,
@@ -153,6 +159,7 @@ def CCI(
     return cci
 
 
+@memoized
 def MFI(
     high: pd.Series,
     low: pd.Series,
@@ -192,6 +199,7 @@ def MFI(
     return mfi
 
 
+@memoized
 def WilliamsR(
     high: pd.Series,
     low: pd.Series,
@@ -221,6 +229,7 @@ def WilliamsR(
     return williams_r
 
 
+@memoized
 def ROC(data: pd.Series, period: int = 12) -> pd.Series:
     """
     Rate of Change (변화율)
@@ -237,6 +246,7 @@ def ROC(data: pd.Series, period: int = 12) -> pd.Series:
     return ((data - data.shift(period)) / data.shift(period)) * 100
 
 
+@memoized
 def Momentum(data: pd.Series, period: int = 10) -> pd.Series:
     """
     Momentum Indicator
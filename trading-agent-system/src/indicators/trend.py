@@ -3,14 +3,31 @@ Trend Indicators
 
 트렌드 방향과 강도를 측정하는 지표들
 - ADX, Supertrend, Ichimoku, Parabolic SAR
-- 이동평균: EMA, SMA, WMA, Hull MA, TEMA, ALMA
+- 이동평균: EMA, SMA, WMA, Hull MA, TEMA, ALMA, KAMA
+
+재귀 계산은 kernels 모듈의 배열 커널로 처리
 """
 
 import numpy as np
 import pandas as pd
 from typing import Union
 
+from .cache import memoized
+from .kernels import (
+    as_float_array, ewm_mean_kernel, supertrend_kernel, psar_kernel, kama_kernel
+)
+
+
+def _ewm_mean(data: pd.Series, period: int) -> pd.Series:
+    """`data.ewm(span=period, adjust=False).mean()`의 커널 버전"""
+    com = (period - 1) / 2
+    return pd.Series(
+        ewm_mean_kernel(as_float_array(data), float(com)),
+        index=data.index
+    )
+
 
+@memoized
 def SMA(data: pd.Series, period: int = 20) -> pd.Series:
     """
     Simple Moving Average (단순 이동평균)
@@ -25,6 +42,7 @@ def SMA(data: pd.Series, period: int = 20) -> pd.Series:
     return data.rolling(window=period).mean()
 
 
+@memoized
 def EMA(data: pd.Series, period: int = 20) -> pd.Series:
     """
     Exponential Moving Average (지수 이동평균)
@@ -41,6 +59,7 @@ def EMA(data: pd.Series, period: int = 20) -> pd.Series:
     return data.ewm(span=period, adjust=False).mean()
 
 
+@memoized
 def WMA(data: pd.Series, period: int = 20) -> pd.Series:
     """
     Weighted Moving Average (가중 이동평균)
@@ -61,6 +80,7 @@ def WMA(data: pd.Series, period: int = 20) -> pd.Series:
     )
 
 
+@memoized
 def HullMA(data: pd.Series, period: int = 20) -> pd.Series:
     """
     Hull Moving Average
@@ -84,6 +104,7 @@ def HullMA(data: pd.Series, period: int = 20) -> pd.Series:
     return WMA(2 * wma_half - wma_full, sqrt_period)
 
 
+@memoized
 def TEMA(data: pd.Series, period: int = 20) -> pd.Series:
     """
     Triple Exponential Moving Average
@@ -105,6 +126,7 @@ def TEMA(data: pd.Series, period: int = 20) -> pd.Series:
     return 3 * ema1 - 3 * ema2 + ema3
 
 
+@memoized
 def ALMA(
     data: pd.Series,
     period: int = 20,
@@ -137,6 +159,7 @@ def ALMA(
     )
 
 
+@memoized
 def ADX(
     high: pd.Series,
     low: pd.Series,
@@ -173,13 +196,13 @@ def ADX(
     minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
 
     # Smoothed values
-    atr = pd.Series(tr).ewm(span=period, adjust=False).mean()
-    plus_di = 100 * pd.Series(plus_dm).ewm(span=period, adjust=False).mean() / atr
-    minus_di = 100 * pd.Series(minus_dm).ewm(span=period, adjust=False).mean() / atr
+    atr = _ewm_mean(pd.Series(tr), period)
+    plus_di = 100 * _ewm_mean(pd.Series(plus_dm), period) / atr
+    minus_di = 100 * _ewm_mean(pd.Series(minus_dm), period) / atr
 
     # ADX
     dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-    adx = dx.ewm(span=period, adjust=False).mean()
+    adx = _ewm_mean(dx, period)
 
     return pd.DataFrame({
         "ADX": adx,
@@ -188,6 +211,7 @@ def ADX(
     })
 
 
+@memoized
 def Supertrend(
     high: pd.Series,
     low: pd.Series,
@@ -226,34 +250,19 @@ def Supertrend(
     lower_band = hl2 - (multiplier * atr)
 
     # Supertrend calculation
-    supertrend = pd.Series(index=close.index, dtype=float)
-    direction = pd.Series(index=close.index, dtype=int)
-
-    supertrend.iloc[0] = upper_band.iloc[0]
-    direction.iloc[0] = -1
-
-    for i in range(1, len(close)):
-        if close.iloc[i] > supertrend.iloc[i-1]:
-            supertrend.iloc[i] = lower_band.iloc[i]
-            direction.iloc[i] = 1
-        elif close.iloc[i] < supertrend.iloc[i-1]:
-            supertrend.iloc[i] = upper_band.iloc[i]
-            direction.iloc[i] = -1
-        else:
-            supertrend.iloc[i] = supertrend.iloc[i-1]
-            direction.iloc[i] = direction.iloc[i-1]
-
-            if direction.iloc[i] == 1 and lower_band.iloc[i] > supertrend.iloc[i]:
-                supertrend.iloc[i] = lower_band.iloc[i]
-            elif direction.iloc[i] == -1 and upper_band.iloc[i] < supertrend.iloc[i]:
-                supertrend.iloc[i] = upper_band.iloc[i]
+    supertrend, direction = supertrend_kernel(
+        as_float_array(close),
+        as_float_array(upper_band),
+        as_float_array(lower_band)
+    )
 
     return pd.DataFrame({
         "Supertrend": supertrend,
         "Direction": direction
-    })
+    }, index=close.index)
 
 
+@memoized
 def Ichimoku(
     high: pd.Series,
     low: pd.Series,
@@ -311,6 +320,7 @@ def Ichimoku(
     })
 
 
+@memoized
 def ParabolicSAR(
     high: pd.Series,
     low: pd.Series,
@@ -333,47 +343,44 @@ def ParabolicSAR(
     Returns:
         DataFrame with SAR, Trend (1: 상승, -1: 하락)
     """
-    length = len(high)
-    sar = pd.Series(index=high.index, dtype=float)
-    trend = pd.Series(index=high.index, dtype=int)
-    af = af_start
-    ep = low.iloc[0]
-
-    # 초기화
-    sar.iloc[0] = high.iloc[0]
-    trend.iloc[0] = -1
-
-    for i in range(1, length):
-        if trend.iloc[i-1] == 1:  # 상승 추세
-            sar.iloc[i] = sar.iloc[i-1] + af * (ep - sar.iloc[i-1])
-            sar.iloc[i] = min(sar.iloc[i], low.iloc[i-1], low.iloc[i-2] if i > 1 else low.iloc[i-1])
-
-            if low.iloc[i] < sar.iloc[i]:
-                trend.iloc[i] = -1
-                sar.iloc[i] = ep
-                ep = low.iloc[i]
-                af = af_start
-            else:
-                trend.iloc[i] = 1
-                if high.iloc[i] > ep:
-                    ep = high.iloc[i]
-                    af = min(af + af_increment, af_max)
-        else:  # 하락 추세
-            sar.iloc[i] = sar.iloc[i-1] + af * (ep - sar.iloc[i-1])
-            sar.iloc[i] = max(sar.iloc[i], high.iloc[i-1], high.iloc[i-2] if i > 1 else high.iloc[i-1])
-
-            if high.iloc[i] > sar.iloc[i]:
-                trend.iloc[i] = 1
-                sar.iloc[i] = ep
-                ep = high.iloc[i]
-                af = af_start
-            else:
-                trend.iloc[i] = -1
-                if low.iloc[i] < ep:
-                    ep = low.iloc[i]
-                    af = min(af + af_increment, af_max)
+    sar, trend = psar_kernel(
+        as_float_array(high),
+        as_float_array(low),
+        float(af_start),
+        float(af_increment),
+        float(af_max)
+    )
 
     return pd.DataFrame({
         "SAR": sar,
         "Trend": trend
-    })
+    }, index=high.index)
+
+
+@memoized
+def KAMA(
+    data: pd.Series,
+    period: int = 20,
+    fast_period: int = 15,
+    slow_period: int = 50
+) -> pd.Series:
+    """
+    Kaufman's Adaptive Moving Average
+
+    Efficiency Ratio에 따라 평활 속도가 변하는 이동평균
+    - 추세장 (ER 높음): 가격을 빠르게 추종
+    - 횡보장 (ER 낮음): 노이즈 평활화
+
+    Args:
+        data: 가격 데이터
+        period: Efficiency Ratio 기간
+        fast_period: 빠른 평활 기간
+        slow_period: 느린 평활 기간
+
+    Returns:
+        KAMA 값
+    """
+    return pd.Series(
+        kama_kernel(as_float_array(data), period, fast_period, slow_period),
+        index=data.index
+    )
@@ -10,7 +10,10 @@ import numpy as np
 import pandas as pd
 from typing import Union
 
+from .cache import memoized
 
+
+@memoized
 def ATR(
     high: pd.Series,
     low: pd.Series,
@@ -42,6 +45,7 @@ def ATR(
     return atr
 
 
+@memoized
 def BollingerBands(
     data: pd.Series,
     period: int = 20,
@@ -84,6 +88,7 @@ def BollingerBands(
     })
 
 
+@memoized
 def KeltnerChannel(
     high: pd.Series,
     low: pd.Series,
@@ -130,6 +135,7 @@ def KeltnerChannel(
     })
 
 
+@memoized
 def DonchianChannel(
     high: pd.Series,
     low: pd.Series,
@@ -160,6 +166,7 @@ def DonchianChannel(
     })
 
 
+@memoized
 def StandardDeviation(
     data: pd.Series,
     period: int = 20
@@ -9,7 +9,10 @@ import numpy as np
 import pandas as pd
 from typing import Union
 
+from .cache import memoized
 
+
+@memoized
 def VWAP(
     high: pd.Series,
     low: pd.Series,
@@ -37,6 +40,7 @@ def VWAP(
     return vwap
 
 
+@memoized
 def OBV(close: pd.Series, volume: pd.Series) -> pd.Series:
     """
     On Balance Volume (균형 거래량)
@@ -58,6 +62,7 @@ def OBV(close: pd.Series, volume: pd.Series) -> pd.Series:
     return obv
 
 
+@memoized
 def VolumeProfile(
     close: pd.Series,
     volume: pd.Series,
@@ -100,6 +105,7 @@ def VolumeProfile(
     return df
 
 
+@memoized
 def CMF(
     high: pd.Series,
     low: pd.Series,
@@ -136,6 +142,7 @@ def CMF(
     return cmf
 
 
+@memoized
 def ADLine(
     high: pd.Series,
     low: pd.Series,
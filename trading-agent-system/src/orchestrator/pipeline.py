@@ -8,12 +8,14 @@ strategy-research-lab과 trading-agent-system을 통합하여
 import asyncio
 import logging
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+import pandas as pd
+
 # strategy-research-lab imports
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent.parent / "strategy-research-lab" / "src"))
@@ -36,7 +38,14 @@ from agents import (
     BacktestRunnerAgent,
     ResultAnalyzerAgent,
 )
-from backtest import BacktestEngine, BacktestMetrics
+from backtest import (
+    DEFAULT_RESULT_STORE,
+    BacktestEngine,
+    BacktestMetrics,
+    MatrixBacktestExecutor,
+    ResultsTable,
+)
+from data import BinanceDataCollector
 
 
 logger = logging.getLogger(__name__)
@@ -72,6 +81,10 @@ class PipelineConfig:
     intervals: list[str] = field(default_factory=lambda: ["1h", "4h"])
     initial_cash: float = 100_000.0
     commission: float = 0.001
+    data_dir: str = "data/datasets"
+    start_date: str = "2023-01-01"
+    end_date: Optional[str] = None
+    result_store: Optional[str] = DEFAULT_RESULT_STORE  # None이면 결과 재사용 안 함
 
     # 최적화 단계
     variation_count: int = 3
@@ -102,7 +115,7 @@ class PipelineResult:
         return {
             "stage": self.stage.value,
             "success": self.success,
-            "data": self.data,
+            "data": self.data.to_dict() if isinstance(self.data, ResultsTable) else self.data,
             "errors": self.errors,
             "warnings": self.warnings,
             "duration": self.duration,
@@ -155,8 +168,14 @@ class TradingPipeline:
         self.backtest_engine = BacktestEngine(
             initial_cash=self.config.initial_cash,
             commission=self.config.commission,
-            results_dir=str(self.output_dir / "backtest_results")
+            results_dir=str(self.output_dir / "backtest_results"),
+            result_store=self.config.result_store
+        )
+        self.matrix_executor = MatrixBacktestExecutor(
+            self.backtest_engine,
+            max_workers=self.config.parallel_backtests
         )
+        self.data_collector = BinanceDataCollector(data_dir=self.config.data_dir)
 
     async def run_full_pipeline(self) -> list[PipelineResult]:
         """
@@ -577,88 +596,85 @@ class TradingPipeline:
         """
         5단계: 백테스트 실행
 
+        데이터셋을 (심볼, 타임프레임)마다 한 번만 로드하고 모든 전략 × 데이터셋
+        셀을 MatrixBacktestExecutor 프로세스 풀(parallel_backtests)에서 실행합니다.
+
         Args:
             optimized_strategies: _optimize_strategies의 결과
 
         Returns:
-            PipelineResult with list[dict] containing backtest results
+            PipelineResult with ResultsTable (전략 × 데이터셋 × 메트릭)
         """
         logger.info(f"Running backtests for {len(optimized_strategies)} strategies...")
         logger.info(f"Symbols: {self.config.symbols}, Intervals: {self.config.intervals}")
 
-        backtest_results = []
         errors = []
         warnings = []
 
-        # 백테스트 태스크 생성
-        tasks = []
+        # 전략 이름 -> 코드 (변형은 인덱스로 구분)
+        strategies: dict[str, str] = {}
         for strategy in optimized_strategies:
-            for symbol in self.config.symbols:
-                for interval in self.config.intervals:
-                    tasks.append((strategy, symbol, interval))
-
-        logger.info(f"Total backtest tasks: {len(tasks)}")
+            name = strategy["meta"].title
+            if strategy.get("variation_index"):
+                name = f"{name} (v{strategy['variation_index']})"
+            strategies[name] = strategy["python_code"]
 
-        # 병렬 실행 (세마포어로 제어)
+        # 데이터셋 로드 (셀마다가 아니라 데이터셋마다 한 번)
+        matrix = [(symbol, interval) for symbol in self.config.symbols for interval in self.config.intervals]
         semaphore = asyncio.Semaphore(self.config.parallel_backtests)
 
-        async def run_single_backtest(strategy_data: dict, symbol: str, interval: str):
+        async def load(symbol: str, interval: str):
             async with semaphore:
                 try:
-                    # TODO: 실제 데이터 로드 및 백테스트 실행
-                    # data = await self._load_market_data(symbol, interval)
-                    # metrics = await asyncio.to_thread(
-                    #     self.backtest_engine.run_from_code,
-                    #     strategy_data["python_code"],
-                    #     data,
-                    #     symbol,
-                    #     interval
-                    # )
-
-                    # Placeholder
-                    warnings.append(f"Backtest data loading not implemented for {symbol}/{interval}")
-                    return None
-
+                    return await self._load_market_data(symbol, interval)
                 except Exception as e:
-                    errors.append(
-                        f"Backtest failed for {strategy_data.get('meta', {}).get('title', 'Unknown')} "
-                        f"on {symbol}/{interval}: {str(e)}"
-                    )
-                    logger.error(f"Backtest error: {e}")
+                    warnings.append(f"Data loading failed for {symbol}/{interval}: {str(e)}")
+                    logger.warning(f"Data loading error: {e}")
                     return None
 
-        # 모든 백테스트 실행
-        results = await asyncio.gather(
-            *[run_single_backtest(s, sym, intvl) for s, sym, intvl in tasks],
-            return_exceptions=True
-        )
+        frames = await asyncio.gather(*[load(symbol, interval) for symbol, interval in matrix])
+        datasets = {key: df for key, df in zip(matrix, frames) if df is not None and not df.empty}
 
-        # 결과 수집
-        for (strategy, symbol, interval), result in zip(tasks, results):
-            if result and not isinstance(result, Exception):
-                backtest_results.append({
-                    "strategy": strategy,
-                    "symbol": symbol,
-                    "interval": interval,
-                    "metrics": result
-                })
+        logger.info(f"Total backtest tasks: {len(strategies) * len(datasets)}")
+
+        table = await asyncio.to_thread(self.matrix_executor.run, strategies, datasets)
 
-        logger.info(f"Backtests complete: {len(backtest_results)} successful")
+        for (s, d), error in table.errors.items():
+            symbol, interval = table.datasets[d]
+            errors.append(f"Backtest failed for {table.strategies[s]} on {symbol}/{interval}: {error}")
+
+        logger.info(f"Backtests complete: {int(table.succeeded.sum())} successful")
 
         return PipelineResult(
             stage=PipelineStage.BACKTEST,
-            success=True,  # 부분 성공도 허용
-            data=backtest_results,
+            success=bool(datasets),  # 부분 성공도 허용
+            data=table,
             errors=errors,
             warnings=warnings
         )
 
-    async def _generate_report(self, backtest_results: list[dict]) -> PipelineResult:
+    async def _load_market_data(self, symbol: str, interval: str) -> pd.DataFrame:
+        """저장된 OHLCV 로드 (없으면 다운로드 후 로드)"""
+        try:
+            return await asyncio.to_thread(
+                self.data_collector.load_dataset,
+                symbol, interval, self.config.start_date, self.config.end_date
+            )
+        except FileNotFoundError:
+            await self.data_collector.download_dataset(
+                symbol, interval, self.config.start_date, self.config.end_date
+            )
+            return await asyncio.to_thread(
+                self.data_collector.load_dataset,
+                symbol, interval, self.config.start_date, self.config.end_date
+            )
+
+    async def _generate_report(self, backtest_results: ResultsTable) -> PipelineResult:
         """
         6단계: 결과 리포트 생성
 
         Args:
-            backtest_results: _run_backtests의 결과
+            backtest_results: _run_backtests의 결과 (ResultsTable)
 
         Returns:
             PipelineResult with report data
@@ -669,13 +685,17 @@ class TradingPipeline:
             # 리포트 데이터 생성
             report_data = {
                 "summary": {
-                    "total_strategies": len(set(r["strategy"]["meta"].title for r in backtest_results if r.get("metrics"))),
-                    "total_backtests": len(backtest_results),
+                    "total_strategies": int(backtest_results.succeeded.any(axis=1).sum()),
+                    "total_backtests": int(backtest_results.succeeded.sum()),
                     "symbols": self.config.symbols,
                     "intervals": self.config.intervals,
                     "timestamp": datetime.now().isoformat()
                 },
                 "pipeline_results": [r.to_dict() for r in self._results],
+                "aggregated": {
+                    name: asdict(self.backtest_runner.aggregate_results(backtest_results, name))
+                    for name in backtest_results.strategies
+                },
                 "top_strategies": self._rank_strategies(backtest_results)
             }
 
@@ -706,19 +726,9 @@ class TradingPipeline:
                 errors=[str(e)]
             )
 
-    def _rank_strategies(self, backtest_results: list[dict]) -> list[dict]:
-        """백테스트 결과를 랭킹"""
-        # Metrics가 있는 결과만 필터링
-        valid_results = [r for r in backtest_results if r.get("metrics")]
-
-        # Sharpe ratio 기준 정렬
-        sorted_results = sorted(
-            valid_results,
-            key=lambda x: x["metrics"].sharpe_ratio if hasattr(x["metrics"], "sharpe_ratio") else 0,
-            reverse=True
-        )
-
-        return sorted_results[:10]  # Top 10
+    def _rank_strategies(self, backtest_results: ResultsTable) -> list[dict]:
+        """백테스트 결과를 랭킹 (성공한 셀 중 Sharpe ratio 상위 10개)"""
+        return backtest_results.top_cells("sharpe_ratio", n=10)
 
     def _get_previous_data(self, stage: PipelineStage) -> Any:
         """이전 단계의 결과 데이터 가져오기"""
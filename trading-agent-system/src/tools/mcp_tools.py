@@ -269,13 +269,11 @@ def _execute_strategy_code(strategy_code: str) -> dict[str, Any]:
     Note: 이것은 Python의 내장 함수를 사용한 코드 실행이며,
     shell command가 아닙니다. 사용자가 제공한 전략 코드를
     Python 인터프리터에서 실행합니다.
+    같은 코드는 공용 StrategyCache에서 실행된 네임스페이스를 재사용합니다.
     """
-    local_namespace: dict[str, Any] = {}
-    # Python 내장 함수로 전략 코드 실행 (shell command 아님)
-    compiled_code = compile(strategy_code, "<strategy>", "exec")
-    # pylint: disable=exec-used
-    exec(compiled_code, local_namespace)  # noqa: S102 - 의도적인 동적 코드 실행
-    return local_namespace
+    from ..backtest.strategy_cache import get_strategy_cache
+
+    return get_strategy_cache().load(strategy_code).namespace
 
 
 @tool(
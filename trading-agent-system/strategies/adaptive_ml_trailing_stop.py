@@ -6,7 +6,7 @@ using the backtesting.py framework.
 
 Key Components:
 1. KAMA (Kaufman's Adaptive Moving Average) - adapts to market efficiency
-2. KNN Machine Learning - pattern matching for enhanced predictions (simplified)
+2. KNN Machine Learning - pattern matching for enhanced predictions
 3. ATR-based Adaptive Trailing Stop - dynamic stop placement
 4. Trend detection based on price vs trailing stop levels
 
@@ -22,6 +22,9 @@ from backtesting import Strategy
 import pandas as pd
 import numpy as np
 
+from src.indicators.adaptive import AdaptiveMA
+from src.indicators.knn import knn_pattern_prediction
+
 
 class AdaptiveMLTrailingStop(Strategy):
     """
@@ -30,7 +33,7 @@ class AdaptiveMLTrailingStop(Strategy):
     This implementation closely follows the Pine Script logic with:
     - KAMA for adaptive moving average
     - Efficiency Ratio for market condition detection
-    - KNN-inspired pattern matching (simplified for performance)
+    - KNN pattern matching over normalised price windows (see src.indicators.knn)
     - ATR-based adaptive trailing stops with KAMA smoothing
     - Dynamic stop adjustment based on trend strength
 
@@ -47,7 +50,7 @@ class AdaptiveMLTrailingStop(Strategy):
     base_multiplier = 2.5  # Base ATR multiplier for stop distance
     adaptive_strength = 1.0  # Controls stop adaptation (higher = more adaptive)
 
-    # KNN Machine Learning Settings (simplified)
+    # KNN Machine Learning Settings
     knn_enabled = True  # Enable KNN-based adjustments
     knn_k = 7  # Number of nearest neighbors
     knn_lookback = 100  # Historical bars to search
@@ -59,6 +62,9 @@ class AdaptiveMLTrailingStop(Strategy):
 
     def init(self):
         """Initialize indicators."""
+        # ER/KAMA computed once per (series, length) for this backtest
+        self.adaptive_ma = AdaptiveMA()
+
         close = self.data.Close
         high = self.data.High
         low = self.data.Low
@@ -73,7 +79,7 @@ class AdaptiveMLTrailingStop(Strategy):
         # Calculate Efficiency Ratio (for adaptive multiplier)
         self.er = self.I(self._calculate_efficiency_ratio, close, self.kama_length)
 
-        # Calculate KNN prediction (simplified)
+        # Calculate KNN prediction
         self.knn_prediction = self.I(self._calculate_knn_prediction, close)
 
         # Calculate adaptive trailing stop with KAMA smoothing
@@ -118,21 +124,12 @@ class AdaptiveMLTrailingStop(Strategy):
         - ER close to 0 = ranging market (choppy/sideways)
 
         This is used to adapt both KAMA and the stop multiplier.
+        The rolling-sum kernel lives in src.indicators.adaptive and is shared with _calculate_kama.
         """
-        n = len(close)
-        er = np.zeros(n)
-
-        for i in range(length, n):
-            # Net change over the period
-            change = abs(close[i] - close[i - length])
-
-            # Sum of absolute daily changes (volatility)
-            volatility = np.sum(np.abs(np.diff(close[i - length:i + 1])))
-
-            er[i] = change / volatility if volatility != 0 else 0
+        er = self.adaptive_ma.efficiency_ratio(close, length).copy()
 
         # Fill initial values with first calculated ER
-        er[:length] = er[length] if length < n else 0
+        er[:length] = er[length] if length < len(er) else 0
 
         return er
 
@@ -150,76 +147,35 @@ class AdaptiveMLTrailingStop(Strategy):
         where SC (Smoothing Constant) = [ER × (FastSC - SlowSC) + SlowSC]²
         FastSC = 2/(fast_length + 1)
         SlowSC = 2/(slow_length + 1)
-        """
-        n = len(close)
-        kama = np.zeros(n)
-        kama[0] = close[0]
-
-        # Smoothing constants
-        fast_sc = 2.0 / (fast_length + 1)
-        slow_sc = 2.0 / (slow_length + 1)
-
-        for i in range(1, n):
-            # Calculate efficiency ratio for this bar
-            if i >= kama_length:
-                change = abs(close[i] - close[i - kama_length])
-                volatility = np.sum(np.abs(np.diff(close[i - kama_length:i + 1])))
-                er = change / volatility if volatility != 0 else 0
-            else:
-                er = 0
 
-            # Calculate adaptive smoothing constant
-            sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
-
-            # Update KAMA
-            kama[i] = kama[i - 1] + sc * (close[i] - kama[i - 1])
-
-        return kama
+        ER is 0 for the first kama_length bars (no backfill, unlike _calculate_efficiency_ratio).
+        """
+        return self.adaptive_ma.kama(close, kama_length, fast_length, slow_length)
 
     def _calculate_knn_prediction(self, close):
         """
-        Calculate KNN-based prediction (simplified version).
-
-        Full KNN implementation:
-        - Normalize current pattern (last knn_feature_length bars)
-        - Search knn_lookback bars for similar patterns
-        - Find K nearest neighbors using Euclidean distance
-        - Predict outcome based on what happened after similar patterns
-        - Weight predictions by inverse distance
-
-        Simplified implementation for backtesting performance:
-        - Uses momentum-based prediction as proxy for KNN
-        - Calculates normalized returns over pattern length
-        - Returns 0.5 (neutral), >0.5 (bullish), <0.5 (bearish)
-
-        This simplified version captures the essence of pattern-based prediction
-        without the computational overhead of full KNN search.
+        Calculate KNN-based prediction.
+
+        Follows the Pine Script KNN:
+        - Normalize the current pattern (last knn_feature_length bars)
+        - Compare it with every pattern that ended knn_feature_length..knn_lookback
+          bars ago (only patterns whose outcome is already known - no lookahead)
+        - Take the K nearest neighbors by Euclidean distance
+        - Predict with the inverse-distance weighted share of neighbors that rose
+        - Confidence = how strongly the neighbors agree
+
+        Pine scales the stop adjustment by confidence, so the returned value is
+        0.5 + (prediction - 0.5) * confidence: 0.5 (neutral), >0.5 (bullish), <0.5 (bearish).
+        The search itself is vectorised in src.indicators.knn.
         """
         n = len(close)
-        prediction = np.full(n, 0.5)
-
         if not self.knn_enabled:
-            return prediction
-
-        # Use rolling momentum as proxy for KNN pattern matching
-        for i in range(self.knn_feature_length, n):
-            # Calculate recent price momentum
-            recent_returns = []
-            for j in range(self.knn_feature_length):
-                if close[i - j - 1] != 0:
-                    ret = (close[i - j] - close[i - j - 1]) / close[i - j - 1]
-                    recent_returns.append(ret)
-
-            if recent_returns:
-                # Average momentum over pattern length
-                avg_momentum = np.mean(recent_returns)
-
-                # Normalize to 0-1 range using tanh (0.5 = neutral)
-                # Positive momentum -> >0.5 (bullish)
-                # Negative momentum -> <0.5 (bearish)
-                prediction[i] = 0.5 + np.tanh(avg_momentum * 100) * 0.5
+            return np.full(n, 0.5)
 
-        return prediction
+        prediction, confidence = knn_pattern_prediction(
+            close, self.knn_k, self.knn_lookback, self.knn_feature_length
+        )
+        return 0.5 + (prediction - 0.5) * confidence
 
     def _calculate_adaptive_stop_with_knn(self, close, atr, er, knn_pred,
                                           base_mult, adaptive_str,
@@ -234,6 +190,8 @@ class AdaptiveMLTrailingStop(Strategy):
         3. KAMA smoothing applied to the stops themselves
         4. Trailing logic (stops can only move in favorable direction)
 
+        The bar loop is the compiled adaptive_trailing_stop_kernel in src.indicators.adaptive.
+
         Args:
             close: Close prices
             atr: Average True Range
@@ -244,87 +202,15 @@ class AdaptiveMLTrailingStop(Strategy):
             knn_enabled: Whether to use KNN adjustments
             knn_weight: Weight of KNN influence
             fast_length, slow_length, kama_length: For KAMA smoothing of stops
+                (kama_length is unused - ER is already computed with it)
 
         Returns:
             Tuple of (long_stop, short_stop, trend)
         """
-        n = len(close)
-
-        # Initialize arrays
-        raw_long_stop = np.zeros(n)
-        raw_short_stop = np.zeros(n)
-        smooth_long_stop = np.zeros(n)
-        smooth_short_stop = np.zeros(n)
-        long_stop = np.zeros(n)
-        short_stop = np.zeros(n)
-        trend = np.zeros(n, dtype=int)
-
-        # Smoothing constants for KAMA
-        fast_sc = 2.0 / (fast_length + 1)
-        slow_sc = 2.0 / (slow_length + 1)
-
-        # Calculate adaptive multiplier
-        # High ER (trending) = tighter stops
-        # Low ER (ranging) = wider stops
-        adaptive_mult = base_mult * (1 + (1 - er) * adaptive_str)
-
-        # Initialize first bar
-        stop_distance = atr[0] * adaptive_mult[0]
-        raw_long_stop[0] = close[0] - stop_distance
-        raw_short_stop[0] = close[0] + stop_distance
-        smooth_long_stop[0] = raw_long_stop[0]
-        smooth_short_stop[0] = raw_short_stop[0]
-        long_stop[0] = smooth_long_stop[0]
-        short_stop[0] = smooth_short_stop[0]
-        trend[0] = 1  # Start with uptrend
-
-        for i in range(1, n):
-            # KNN adjustment
-            # Bullish KNN (>0.5) = tighter long stops, wider short stops
-            # Bearish KNN (<0.5) = wider long stops, tighter short stops
-            knn_adjustment = (knn_pred[i] - 0.5) * knn_weight if knn_enabled else 0.0
-
-            # Calculate stop distance with KNN adjustment
-            stop_distance = atr[i] * adaptive_mult[i]
-
-            # Calculate raw stops with KNN influence
-            raw_long_stop[i] = close[i] - (stop_distance * (1 - knn_adjustment))
-            raw_short_stop[i] = close[i] + (stop_distance * (1 + knn_adjustment))
-
-            # Apply KAMA smoothing to the stops themselves
-            # This makes stops move more smoothly, following the same adaptive logic as KAMA
-            er_val = er[i] if er[i] > 0 else 0
-            sc = (er_val * (fast_sc - slow_sc) + slow_sc) ** 2
-
-            smooth_long_stop[i] = smooth_long_stop[i - 1] + sc * (raw_long_stop[i] - smooth_long_stop[i - 1])
-            smooth_short_stop[i] = smooth_short_stop[i - 1] + sc * (raw_short_stop[i] - smooth_short_stop[i - 1])
-
-            # Trailing logic for long stop (can only move up, never down)
-            if close[i - 1] > long_stop[i - 1]:
-                # Price is above long stop, trail the stop upward
-                long_stop[i] = max(smooth_long_stop[i], long_stop[i - 1])
-            else:
-                # Price hit the stop or is below it, reset to current level
-                long_stop[i] = smooth_long_stop[i]
-
-            # Trailing logic for short stop (can only move down, never up)
-            if close[i - 1] < short_stop[i - 1]:
-                # Price is below short stop, trail the stop downward
-                short_stop[i] = min(smooth_short_stop[i], short_stop[i - 1])
-            else:
-                # Price hit the stop or is above it, reset to current level
-                short_stop[i] = smooth_short_stop[i]
-
-            # Determine trend based on price vs trailing stops
-            # This matches the Pine Script logic exactly
-            if close[i] > short_stop[i - 1]:
-                trend[i] = 1  # Bullish - price crossed above short stop
-            elif close[i] < long_stop[i - 1]:
-                trend[i] = -1  # Bearish - price crossed below long stop
-            else:
-                trend[i] = trend[i - 1]  # Maintain previous trend
-
-        return long_stop, short_stop, trend
+        return AdaptiveMA.trailing_stop(
+            close, atr, er, knn_pred, base_mult, adaptive_str,
+            knn_enabled, knn_weight, fast_length, slow_length
+        )
 
     def next(self):
         """
@@ -424,6 +310,9 @@ class AdaptiveMLTrailingStopNoSL(Strategy):
 
     def init(self):
         """Initialize indicators."""
+        # ER/KAMA computed once per (series, length) for this backtest
+        self.adaptive_ma = AdaptiveMA()
+
         close = self.data.Close
         high = self.data.High
         low = self.data.Low
@@ -455,111 +344,34 @@ class AdaptiveMLTrailingStopNoSL(Strategy):
         return atr
 
     def _calculate_efficiency_ratio(self, close, length):
-        """Calculate Efficiency Ratio."""
-        n = len(close)
-        er = np.zeros(n)
-        for i in range(length, n):
-            change = abs(close[i] - close[i - length])
-            volatility = np.sum(np.abs(np.diff(close[i - length:i + 1])))
-            er[i] = change / volatility if volatility != 0 else 0
-        er[:length] = er[length] if length < n else 0
+        """Calculate Efficiency Ratio (shared kernel)."""
+        er = self.adaptive_ma.efficiency_ratio(close, length).copy()
+        er[:length] = er[length] if length < len(er) else 0
         return er
 
     def _calculate_kama(self, close, kama_length, fast_length, slow_length):
-        """Calculate KAMA."""
-        n = len(close)
-        kama = np.zeros(n)
-        kama[0] = close[0]
-        fast_sc = 2.0 / (fast_length + 1)
-        slow_sc = 2.0 / (slow_length + 1)
-
-        for i in range(1, n):
-            if i >= kama_length:
-                change = abs(close[i] - close[i - kama_length])
-                volatility = np.sum(np.abs(np.diff(close[i - kama_length:i + 1])))
-                er = change / volatility if volatility != 0 else 0
-            else:
-                er = 0
-            sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
-            kama[i] = kama[i - 1] + sc * (close[i] - kama[i - 1])
-        return kama
+        """Calculate KAMA (shared kernel)."""
+        return self.adaptive_ma.kama(close, kama_length, fast_length, slow_length)
 
     def _calculate_knn_prediction(self, close):
-        """Calculate simplified KNN prediction."""
-        n = len(close)
-        prediction = np.full(n, 0.5)
+        """Calculate confidence-weighted KNN prediction."""
         if not self.knn_enabled:
-            return prediction
-
-        for i in range(self.knn_feature_length, n):
-            recent_returns = []
-            for j in range(self.knn_feature_length):
-                if close[i - j - 1] != 0:
-                    ret = (close[i - j] - close[i - j - 1]) / close[i - j - 1]
-                    recent_returns.append(ret)
-            if recent_returns:
-                avg_momentum = np.mean(recent_returns)
-                prediction[i] = 0.5 + np.tanh(avg_momentum * 100) * 0.5
-        return prediction
+            return np.full(len(close), 0.5)
+
+        prediction, confidence = knn_pattern_prediction(
+            close, self.knn_k, self.knn_lookback, self.knn_feature_length
+        )
+        return 0.5 + (prediction - 0.5) * confidence
 
     def _calculate_adaptive_stop_with_knn(self, close, atr, er, knn_pred,
                                           base_mult, adaptive_str,
                                           knn_enabled, knn_weight,
                                           fast_length, slow_length, kama_length):
         """Calculate adaptive trailing stops with KNN and KAMA smoothing."""
-        n = len(close)
-        raw_long_stop = np.zeros(n)
-        raw_short_stop = np.zeros(n)
-        smooth_long_stop = np.zeros(n)
-        smooth_short_stop = np.zeros(n)
-        long_stop = np.zeros(n)
-        short_stop = np.zeros(n)
-        trend = np.zeros(n, dtype=int)
-
-        fast_sc = 2.0 / (fast_length + 1)
-        slow_sc = 2.0 / (slow_length + 1)
-        adaptive_mult = base_mult * (1 + (1 - er) * adaptive_str)
-
-        stop_distance = atr[0] * adaptive_mult[0]
-        raw_long_stop[0] = close[0] - stop_distance
-        raw_short_stop[0] = close[0] + stop_distance
-        smooth_long_stop[0] = raw_long_stop[0]
-        smooth_short_stop[0] = raw_short_stop[0]
-        long_stop[0] = smooth_long_stop[0]
-        short_stop[0] = smooth_short_stop[0]
-        trend[0] = 1
-
-        for i in range(1, n):
-            knn_adjustment = (knn_pred[i] - 0.5) * knn_weight if knn_enabled else 0.0
-            stop_distance = atr[i] * adaptive_mult[i]
-
-            raw_long_stop[i] = close[i] - (stop_distance * (1 - knn_adjustment))
-            raw_short_stop[i] = close[i] + (stop_distance * (1 + knn_adjustment))
-
-            er_val = er[i] if er[i] > 0 else 0
-            sc = (er_val * (fast_sc - slow_sc) + slow_sc) ** 2
-
-            smooth_long_stop[i] = smooth_long_stop[i - 1] + sc * (raw_long_stop[i] - smooth_long_stop[i - 1])
-            smooth_short_stop[i] = smooth_short_stop[i - 1] + sc * (raw_short_stop[i] - smooth_short_stop[i - 1])
-
-            if close[i - 1] > long_stop[i - 1]:
-                long_stop[i] = max(smooth_long_stop[i], long_stop[i - 1])
-            else:
-                long_stop[i] = smooth_long_stop[i]
-
-            if close[i - 1] < short_stop[i - 1]:
-                short_stop[i] = min(smooth_short_stop[i], short_stop[i - 1])
-            else:
-                short_stop[i] = smooth_short_stop[i]
-
-            if close[i] > short_stop[i - 1]:
-                trend[i] = 1
-            elif close[i] < long_stop[i - 1]:
-                trend[i] = -1
-            else:
-                trend[i] = trend[i - 1]
-
-        return long_stop, short_stop, trend
+        return AdaptiveMA.trailing_stop(
+            close, atr, er, knn_pred, base_mult, adaptive_str,
+            knn_enabled, knn_weight, fast_length, slow_length
+        )
 
     def next(self):
         """Execute trading logic (no fixed SL)."""
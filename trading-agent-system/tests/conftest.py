@@ -0,0 +1,31 @@
+"""
+공용 테스트 fixture
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def sample_ohlcv_data():
+    """테스트용 OHLCV 데이터 생성"""
+    np.random.seed(42)
+    n = 500  # 충분한 데이터 포인트
+
+    dates = pd.date_range(start="2023-01-01", periods=n, freq="1h")
+    close = 100 + np.cumsum(np.random.randn(n) * 0.5)
+    high = close + np.abs(np.random.randn(n) * 0.3)
+    low = close - np.abs(np.random.randn(n) * 0.3)
+    open_price = low + np.random.rand(n) * (high - low)
+    volume = np.abs(np.random.randn(n) * 1000000 + 5000000)
+
+    df = pd.DataFrame({
+        "Open": open_price,
+        "High": high,
+        "Low": low,
+        "Close": close,
+        "Volume": volume,
+    }, index=dates)
+
+    return df
@@ -4,7 +4,6 @@ Backtest Engine Tests
 백테스트 엔진 단위 테스트
 """
 
-import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
@@ -12,31 +11,7 @@ import tempfile
 
 from backtesting import Strategy
 
-from src.backtest import BacktestEngine, BacktestMetrics
-
-
-@pytest.fixture
-def sample_ohlcv_data():
-    """테스트용 OHLCV 데이터 생성"""
-    np.random.seed(42)
-    n = 500  # 충분한 데이터 포인트
-
-    dates = pd.date_range(start="2023-01-01", periods=n, freq="1h")
-    close = 100 + np.cumsum(np.random.randn(n) * 0.5)
-    high = close + np.abs(np.random.randn(n) * 0.3)
-    low = close - np.abs(np.random.randn(n) * 0.3)
-    open_price = low + np.random.rand(n) * (high - low)
-    volume = np.abs(np.random.randn(n) * 1000000 + 5000000)
-
-    df = pd.DataFrame({
-        "Open": open_price,
-        "High": high,
-        "Low": low,
-        "Close": close,
-        "Volume": volume,
-    }, index=dates)
-
-    return df
+from src.backtest import BacktestEngine, BacktestMetrics, SharedDataset
 
 
 class SimpleSMAStrategy(Strategy):
@@ -213,6 +188,65 @@ class DynamicStrategy(Strategy):
         assert "avg_sharpe" in aggregated
         assert "consistency_rate" in aggregated
 
+    def test_run_with_strategy_params(self, sample_ohlcv_data):
+        """strategy_params가 서브클래스 방식과 동일한 결과를 내는지 테스트"""
+        engine = BacktestEngine()
+
+        class CustomSMAStrategy(SimpleSMAStrategy):
+            n1 = 5
+            n2 = 30
+
+        expected = engine.run(strategy_class=CustomSMAStrategy, data=sample_ohlcv_data)
+        metrics = engine.run(
+            strategy_class=SimpleSMAStrategy,
+            data=sample_ohlcv_data,
+            strategy_params={"n1": 5, "n2": 30},
+        )
+
+        assert metrics.total_return == expected.total_return
+        assert metrics.total_trades == expected.total_trades
+
+
+class TestSharedDataset:
+    """공유 메모리 데이터셋 테스트"""
+
+    def test_round_trip(self, sample_ohlcv_data):
+        """공유 메모리 적재 후 동일한 DataFrame 복원"""
+        owner = SharedDataset.create("BTCUSDT", sample_ohlcv_data)
+        try:
+            attached = SharedDataset.attach(owner.handle)
+            frame = attached.to_frame()
+
+            assert attached.symbol == "BTCUSDT"
+            pd.testing.assert_frame_equal(frame, sample_ohlcv_data, check_freq=False)
+            assert not frame["Close"].to_numpy().flags.writeable
+
+            del frame
+            attached.close()
+        finally:
+            owner.close()
+            owner.unlink()
+
+    def test_backtest_on_shared_frame(self, sample_ohlcv_data):
+        """공유 메모리 DataFrame으로 백테스트 결과가 동일한지 테스트"""
+        engine = BacktestEngine()
+        expected = engine.run(strategy_class=SimpleSMAStrategy, data=sample_ohlcv_data)
+
+        owner = SharedDataset.create("BTCUSDT", sample_ohlcv_data)
+        try:
+            metrics = engine.run(strategy_class=SimpleSMAStrategy, data=owner.to_frame())
+            assert metrics.total_return == expected.total_return
+            assert metrics.total_trades == expected.total_trades
+        finally:
+            owner.close()
+            owner.unlink()
+
+    def test_unsupported_index(self):
+        """지원하지 않는 인덱스 타입"""
+        df = pd.DataFrame({"Close": [1.0, 2.0]}, index=["a", "b"])
+        with pytest.raises(ValueError):
+            SharedDataset.create("X", df)
+
 
 class TestBacktestMetrics:
     """BacktestMetrics 테스트"""
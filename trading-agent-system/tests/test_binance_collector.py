@@ -0,0 +1,211 @@
+"""
+Binance 수집기 테스트
+
+ReplayExchange로 네트워크 없이 증분 동기화 / 동시 수집 / Rate Limiter 검증
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import BinanceDataCollector, OHLCVStore, ReplayExchange, WeightRateLimiter
+
+
+SYMBOLS = [f"COIN{i}USDT" for i in range(10)]
+INTERVALS = ["1h", "4h", "1d"]
+
+
+def make_series(start: str, end: str, interval: str, seed: int) -> pd.DataFrame:
+    """랜덤 워크 OHLCV 생성"""
+    freq = {"1h": "h", "4h": "4h", "1d": "D"}[interval]
+    index = pd.date_range(start, end, freq=freq)
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.standard_normal(len(index)))
+    return pd.DataFrame({
+        "Open": close,
+        "High": close + 1,
+        "Low": close - 1,
+        "Close": close,
+        "Volume": rng.random(len(index)) * 1000,
+    }, index=index)
+
+
+@pytest.fixture
+def replay():
+    """2024-01-01 ~ 2024-03-10 데이터를 가진 오프라인 거래소"""
+    exchange = ReplayExchange()
+    for i, symbol in enumerate(SYMBOLS):
+        for j, interval in enumerate(INTERVALS):
+            exchange.add_series(symbol, interval, make_series("2024-01-01", "2024-03-10", interval, i * 10 + j))
+    return exchange
+
+
+class TestIncrementalSync:
+    """증분 동기화 테스트"""
+
+    def test_full_download_matches_source(self, replay, tmp_path):
+        collector = BinanceDataCollector(data_dir=str(tmp_path), exchange=replay)
+
+        results = asyncio.run(collector.download_all_datasets(
+            symbols=SYMBOLS[:2], intervals=["1h"],
+            start_date="2024-01-01", end_date="2024-03-01"
+        ))
+
+        assert [info.symbol for info in results] == SYMBOLS[:2]
+
+        expected = make_series("2024-01-01", "2024-03-10", "1h", 0).loc[:"2024-03-01 00:00"]
+        loaded = collector.load_dataset(SYMBOLS[0], "1h")
+        np.testing.assert_array_equal(loaded.index.as_unit("ms").asi8, expected.index.as_unit("ms").asi8)
+        for col in ["Open", "High", "Low", "Close", "Volume"]:
+            np.testing.assert_array_equal(loaded[col].to_numpy(), expected[col].to_numpy())
+
+    def test_refresh_fetches_only_tail(self, replay, tmp_path):
+        collector = BinanceDataCollector(data_dir=str(tmp_path), exchange=replay)
+
+        asyncio.run(collector.download_all_datasets(
+            symbols=SYMBOLS, intervals=INTERVALS,
+            start_date="2024-01-01", end_date="2024-03-01"
+        ))
+        replay.requests.clear()
+
+        # 다음날 갱신: 데이터셋당 요청 1회, 마지막 저장 시각 이후만
+        results = asyncio.run(collector.download_all_datasets(
+            symbols=SYMBOLS, intervals=INTERVALS,
+            start_date="2024-01-01", end_date="2024-03-02"
+        ))
+
+        assert len(results) == len(SYMBOLS) * len(INTERVALS)
+        assert len(replay.requests) == len(SYMBOLS) * len(INTERVALS)
+        cutoff = collector._date_to_ms("2024-03-01")
+        assert all(start > cutoff for _, _, start, _ in replay.requests)
+
+        df = collector.load_dataset(SYMBOLS[3], "1h")
+        assert df.index[-1] == pd.Timestamp("2024-03-02")
+        assert df.index.is_unique
+
+        # 스냅샷도 새 캔들까지 갱신
+        snapshot = pd.read_parquet(tmp_path / f"{SYMBOLS[3]}_1h.parquet")
+        assert snapshot.index[-1] == pd.Timestamp("2024-03-02")
+
+    def test_pagination(self, replay, tmp_path):
+        collector = BinanceDataCollector(data_dir=str(tmp_path), exchange=replay)
+        collector.KLINES_LIMIT = 100
+
+        info = asyncio.run(collector.download_dataset(
+            SYMBOLS[0], "1h", start_date="2024-01-01", end_date="2024-01-10"
+        ))
+
+        assert info.rows == 9 * 24 + 1
+        assert len(replay.requests) == 3
+        assert collector.find_gaps(SYMBOLS[0], "1h") == []
+
+    def test_download_writes_parquet_snapshot(self, replay, tmp_path):
+        """기존 로더가 읽는 {symbol}_{interval}.parquet 스냅샷을 기본으로 저장"""
+        collector = BinanceDataCollector(data_dir=str(tmp_path), exchange=replay)
+
+        info = asyncio.run(collector.download_dataset(SYMBOLS[0], "4h", "2024-01-01", "2024-02-01"))
+
+        snapshot = tmp_path / f"{SYMBOLS[0]}_4h.parquet"
+        assert info.file_path == str(snapshot)
+        pd.testing.assert_frame_equal(pd.read_parquet(snapshot), collector.load_dataset(SYMBOLS[0], "4h"))
+
+        info = asyncio.run(collector.download_dataset(SYMBOLS[1], "4h", "2024-01-01", "2024-02-01", save_format=None))
+        assert not (tmp_path / f"{SYMBOLS[1]}_4h.parquet").exists()
+        assert info.rows == len(collector.load_dataset(SYMBOLS[1], "4h"))
+
+    def test_concurrent_downloads_overlap(self, tmp_path):
+        """동시 수집 시 전체 시간이 순차 실행보다 짧은지 확인"""
+        exchange = ReplayExchange(latency=0.05)
+        for i, symbol in enumerate(SYMBOLS):
+            exchange.add_series(symbol, "1d", make_series("2024-01-01", "2024-03-10", "1d", i))
+
+        collector = BinanceDataCollector(data_dir=str(tmp_path), exchange=exchange, max_concurrency=10)
+
+        start = time.perf_counter()
+        results = asyncio.run(collector.download_all_datasets(
+            symbols=SYMBOLS, intervals=["1d"], start_date="2024-01-01", end_date="2024-03-01"
+        ))
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == len(SYMBOLS)
+        assert elapsed < 0.05 * len(SYMBOLS)
+
+    def test_replay_from_store(self, replay, tmp_path):
+        """다른 저장소 스냅샷을 재생 소스로 사용"""
+        source = BinanceDataCollector(data_dir=str(tmp_path / "source"), exchange=replay)
+        asyncio.run(source.download_dataset(SYMBOLS[0], "4h", "2024-01-01", "2024-02-01"))
+
+        collector = BinanceDataCollector(
+            data_dir=str(tmp_path / "target"),
+            exchange=ReplayExchange(OHLCVStore(tmp_path / "source" / "store"))
+        )
+        asyncio.run(collector.download_dataset(SYMBOLS[0], "4h", "2024-01-01", "2024-02-01"))
+
+        pd.testing.assert_frame_equal(
+            collector.load_dataset(SYMBOLS[0], "4h"),
+            source.load_dataset(SYMBOLS[0], "4h")
+        )
+
+
+class TestWeightRateLimiter:
+    """가중치 Rate Limiter 테스트"""
+
+    def test_waits_when_window_is_full(self):
+        limiter = WeightRateLimiter(max_weight=4, window=0.2)
+
+        async def run():
+            start = time.perf_counter()
+            for _ in range(4):
+                await limiter.acquire(2)
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+
+        assert limiter.total_weight == 8
+        assert elapsed >= 0.2
+
+    def test_sync_used_weight(self):
+        limiter = WeightRateLimiter(max_weight=10, window=60)
+        asyncio.run(limiter.acquire(2))
+
+        limiter.sync_used_weight(7)
+
+        assert limiter.used_weight == 7
+
+    def test_weight_above_limit(self):
+        limiter = WeightRateLimiter(max_weight=1)
+        with pytest.raises(ValueError):
+            asyncio.run(limiter.acquire(2))
+
+
+class TestCollectScript:
+    """수집 스크립트 (src/를 path에 넣고 data.*로 임포트)"""
+
+    def test_script_imports(self):
+        script = Path(__file__).parent.parent / "scripts" / "collect_datasets.py"
+
+        result = subprocess.run(
+            [sys.executable, str(script), "--help"], capture_output=True, text=True, timeout=60
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "--concurrency" in result.stdout
+
+    def test_cache_registers_without_package(self):
+        src = Path(__file__).parent.parent / "src"
+        code = (
+            f"import sys; sys.path.insert(0, {str(src)!r}); "
+            "from data import ohlcv_store; import indicators.cache as cache; "
+            "print(ohlcv_store.on_append == [cache.invalidate_dataset])"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "True"
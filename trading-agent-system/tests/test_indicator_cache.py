@@ -0,0 +1,177 @@
+"""
+Indicator Cache Tests
+
+지표 결과 캐시 테스트
+"""
+
+import pandas as pd
+import pytest
+from backtesting import Strategy
+
+from src.backtest import BacktestEngine
+from src.backtest.indicator_cache import cached_strategy
+from src.data import OHLCVStore
+from src.indicators import EMA, MACD, ATR
+from src.indicators.cache import (
+    IndicatorCache, dataset_tag, fingerprint, get_indicator_cache
+)
+
+from .test_backtest_engine import SimpleSMAStrategy
+
+
+CALLS: list[str] = []
+
+
+def counted_ema(values, period):
+    CALLS.append(f"ema{period}")
+    return pd.Series(values).ewm(span=period, adjust=False).mean()
+
+
+class CountingStrategy(Strategy):
+    """지표 계산 횟수를 기록하는 전략"""
+
+    fast = 10
+    slow = 30
+
+    def init(self):
+        self.fast_ema = self.I(counted_ema, self.data.Close, self.fast)
+        self.slow_ema = self.I(self._slow_ema, self.data.Close)
+
+    def _slow_ema(self, close):
+        CALLS.append("slow")
+        return pd.Series(close).ewm(span=self.slow, adjust=False).mean()
+
+    def next(self):
+        if self.fast_ema[-1] > self.slow_ema[-1]:
+            if not self.position:
+                self.buy()
+        elif self.position:
+            self.position.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    CALLS.clear()
+
+
+def test_memoized_indicator_only_inside_activate(sample_ohlcv_data):
+    close = sample_ohlcv_data["Close"]
+    cache = IndicatorCache()
+
+    EMA(close, 20)
+    assert cache.get_stats()["misses"] == 0
+
+    with cache.activate("BTCUSDT_1h"):
+        first = EMA(close, 20)
+        second = EMA(close, 20)
+        EMA(close, 21)
+
+    pd.testing.assert_series_equal(first, EMA(close, 20))
+    pd.testing.assert_series_equal(first, second)
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+    # 호출자가 바꿔도 캐시 값은 그대로
+    second.iloc[:] = 0
+    with cache.activate("BTCUSDT_1h"):
+        pd.testing.assert_series_equal(EMA(close, 20), first)
+
+
+def test_fingerprint_includes_index_and_name(sample_ohlcv_data):
+    close = sample_ohlcv_data["Close"]
+    assert fingerprint(close) == fingerprint(close.copy())
+    assert fingerprint(close) != fingerprint(close.rename("Open"))
+    assert fingerprint(close) != fingerprint(close.reset_index(drop=True))
+    assert fingerprint(close.to_numpy()) != fingerprint(close.to_numpy()[1:])
+
+
+def test_spill_round_trip(sample_ohlcv_data, tmp_path):
+    df = sample_ohlcv_data
+    with IndicatorCache(spill_dir=tmp_path).activate("BTCUSDT_1h"):
+        macd = MACD(df["Close"])
+        atr = ATR(df["High"], df["Low"], df["Close"])
+
+    # 새 프로세스처럼 빈 메모리 캐시로 .npy에서 읽음
+    cache = IndicatorCache(spill_dir=tmp_path)
+    with cache.activate("BTCUSDT_1h"):
+        pd.testing.assert_frame_equal(MACD(df["Close"]), macd)
+        pd.testing.assert_series_equal(ATR(df["High"], df["Low"], df["Close"]), atr)
+    assert cache.get_stats()["disk_hits"] == 2
+    assert cache.get_stats()["misses"] == 0
+
+
+def test_lru_eviction_by_count_and_bytes(sample_ohlcv_data):
+    close = sample_ohlcv_data["Close"]
+    cache = IndicatorCache(maxsize=2)
+    with cache.activate():
+        for period in (5, 10, 20):
+            EMA(close, period)
+    assert len(cache) == 2
+    assert cache.get_stats()["evictions"] == 1
+
+    small = IndicatorCache(max_bytes=close.nbytes * 3)
+    with small.activate():
+        for period in (5, 10, 20):
+            EMA(close, period)
+    assert len(small) == 1
+
+
+def test_invalidate_dataset(sample_ohlcv_data, tmp_path):
+    close = sample_ohlcv_data["Close"]
+    cache = IndicatorCache(spill_dir=tmp_path)
+    with cache.activate("BTCUSDT_1h"):
+        EMA(close, 20)
+    with cache.activate("ETHUSDT_1h"):
+        EMA(close, 20)
+
+    assert cache.invalidate("BTCUSDT_1h") == 1
+    assert not (tmp_path / "BTCUSDT_1h").exists()
+    assert (tmp_path / "ETHUSDT_1h").exists()
+    assert len(cache) == 1
+
+
+def test_ohlcv_append_invalidates_shared_cache(sample_ohlcv_data, tmp_path):
+    shared = get_indicator_cache()
+    with shared.activate(dataset_tag("BTC/USDT", "1h")):
+        EMA(sample_ohlcv_data["Close"], 33)
+    assert len(shared) >= 1
+
+    OHLCVStore(tmp_path).append("BTC/USDT", "1h", sample_ohlcv_data.head(5))
+    assert not any(
+        entry.dataset == "BTCUSDT_1h" for entry in shared._entries.values()
+    )
+
+
+def test_engine_reuses_strategy_indicators(sample_ohlcv_data, tmp_path):
+    engine = BacktestEngine(results_dir=str(tmp_path), indicator_cache=IndicatorCache())
+    uncached = BacktestEngine(results_dir=str(tmp_path), cache_indicators=False)
+
+    first = engine.run(CountingStrategy, sample_ohlcv_data, symbol="BTCUSDT")
+    assert CALLS == ["ema10", "slow"]
+    second = engine.run(CountingStrategy, sample_ohlcv_data, symbol="BTCUSDT")
+    assert CALLS == ["ema10", "slow"]
+    assert first == second == uncached.run(CountingStrategy, sample_ohlcv_data, symbol="BTCUSDT")
+
+    # 전략 파라미터가 바뀌면 전략 메서드는 다시 계산, 공용 함수는 인자가 같으면 재사용
+    CALLS.clear()
+    engine.run(CountingStrategy, sample_ohlcv_data, symbol="BTCUSDT", strategy_params={"slow": 40})
+    assert CALLS == ["slow"]
+    engine.run(CountingStrategy, sample_ohlcv_data, symbol="BTCUSDT", strategy_params={"fast": 12})
+    assert CALLS == ["slow", "ema12", "slow"]
+
+
+def test_closure_over_self_uses_strategy_params(sample_ohlcv_data, tmp_path):
+    cache = IndicatorCache()
+    engine = BacktestEngine(results_dir=str(tmp_path), indicator_cache=cache)
+
+    base = engine.run(SimpleSMAStrategy, sample_ohlcv_data)
+    assert engine.run(SimpleSMAStrategy, sample_ohlcv_data) == base
+    assert cache.get_stats()["hits"] == 2
+
+    changed = engine.run(SimpleSMAStrategy, sample_ohlcv_data, strategy_params={"n1": 5})
+    expected = BacktestEngine(results_dir=str(tmp_path), cache_indicators=False).run(
+        SimpleSMAStrategy, sample_ohlcv_data, strategy_params={"n1": 5}
+    )
+    assert changed == expected
+    assert cached_strategy(SimpleSMAStrategy).__name__ == "SimpleSMAStrategy"
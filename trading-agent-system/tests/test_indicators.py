@@ -19,6 +19,17 @@ from src.indicators import (
     ATR, BollingerBands, KeltnerChannel, DonchianChannel,
     # Volume
     VWAP, OBV, CMF, VolumeProfile,
+    # Adaptive
+    KAMA,
+)
+from src.indicators.kernels import (
+    ewm_mean_kernel, supertrend_kernel, psar_kernel, kama_kernel
+)
+from src.indicators.adaptive import (
+    AdaptiveMA, efficiency_ratio_kernel, kama_from_er_kernel
+)
+from src.indicators.knn import (
+    KNNPatternMatcher, knn_pattern_prediction, normalize_windows
 )
 
 
@@ -302,6 +313,273 @@ class TestVolumeIndicators:
             assert (valid_values <= 1).all()
 
 
+def _reference_supertrend(close, upper_band, lower_band):
+    """기존 .iloc 루프 기반 Supertrend (비교 기준)"""
+    supertrend = [upper_band[0]]
+    direction = [-1.0]
+    for i in range(1, len(close)):
+        if close[i] > supertrend[i-1]:
+            supertrend.append(lower_band[i])
+            direction.append(1.0)
+        elif close[i] < supertrend[i-1]:
+            supertrend.append(upper_band[i])
+            direction.append(-1.0)
+        else:
+            supertrend.append(supertrend[i-1])
+            direction.append(direction[i-1])
+            if direction[i] == 1 and lower_band[i] > supertrend[i]:
+                supertrend[i] = lower_band[i]
+            elif direction[i] == -1 and upper_band[i] < supertrend[i]:
+                supertrend[i] = upper_band[i]
+    return np.array(supertrend), np.array(direction)
+
+
+def _reference_psar(high, low, af_start=0.02, af_increment=0.02, af_max=0.2):
+    """기존 .iloc 루프 기반 Parabolic SAR (비교 기준)"""
+    sar = [high[0]]
+    trend = [-1.0]
+    af = af_start
+    ep = low[0]
+    for i in range(1, len(high)):
+        value = sar[i-1] + af * (ep - sar[i-1])
+        if trend[i-1] == 1:
+            value = min(value, low[i-1], low[i-2] if i > 1 else low[i-1])
+            if low[i] < value:
+                trend.append(-1.0)
+                value = ep
+                ep = low[i]
+                af = af_start
+            else:
+                trend.append(1.0)
+                if high[i] > ep:
+                    ep = high[i]
+                    af = min(af + af_increment, af_max)
+        else:
+            value = max(value, high[i-1], high[i-2] if i > 1 else high[i-1])
+            if high[i] > value:
+                trend.append(1.0)
+                value = ep
+                ep = high[i]
+                af = af_start
+            else:
+                trend.append(-1.0)
+                if low[i] < ep:
+                    ep = low[i]
+                    af = min(af + af_increment, af_max)
+        sar.append(value)
+    return np.array(sar), np.array(trend)
+
+
+class TestIndicatorKernels:
+    """배열 커널이 기존 구현과 비트 단위로 동일한지 검증"""
+
+    def test_ewm_kernel_matches_pandas(self, sample_ohlcv_data):
+        """EWM 커널 == pandas ewm(adjust=False)"""
+        close = sample_ohlcv_data["Close"].copy()
+        close.iloc[[0, 10, 11, 50]] = np.nan
+
+        for span in (2, 14, 21):
+            expected = close.ewm(span=span, adjust=False).mean().values
+            result = ewm_mean_kernel(close.values, (span - 1) / 2)
+            assert np.array_equal(result, expected, equal_nan=True)
+
+    def test_supertrend_kernel_matches_loop(self, sample_ohlcv_data):
+        """Supertrend 커널 == 기존 루프"""
+        close = sample_ohlcv_data["Close"].values
+        upper = close + 1.5
+        lower = close - 1.5
+
+        expected = _reference_supertrend(close, upper, lower)
+        result = supertrend_kernel(close, upper, lower)
+
+        assert np.array_equal(result[0], expected[0])
+        assert np.array_equal(result[1], expected[1])
+
+    def test_psar_kernel_matches_loop(self, sample_ohlcv_data):
+        """Parabolic SAR 커널 == 기존 루프"""
+        high = sample_ohlcv_data["High"].values
+        low = sample_ohlcv_data["Low"].values
+
+        expected = _reference_psar(high, low)
+        result = psar_kernel(high, low, 0.02, 0.02, 0.2)
+
+        assert np.array_equal(result[0], expected[0])
+        assert np.array_equal(result[1], expected[1])
+
+    def test_kama_kernel_matches_numpy_loop(self, sample_ohlcv_data):
+        """KAMA 커널 == np.sum 기반 루프"""
+        close = sample_ohlcv_data["Close"].values
+        length, fast_sc, slow_sc = 20, 2.0 / 16, 2.0 / 51
+
+        expected = np.zeros(len(close))
+        expected[0] = close[0]
+        for i in range(1, len(close)):
+            er = 0
+            if i >= length:
+                change = abs(close[i] - close[i - length])
+                volatility = np.sum(np.abs(np.diff(close[i - length:i + 1])))
+                er = change / volatility if volatility != 0 else 0
+            sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
+            expected[i] = expected[i - 1] + sc * (close[i] - expected[i - 1])
+
+        assert np.array_equal(kama_kernel(close, length, 15, 50), expected)
+
+    def test_kama_wrapper(self, sample_ohlcv_data):
+        """KAMA pandas 래퍼"""
+        result = KAMA(sample_ohlcv_data["Close"], period=20)
+
+        assert len(result) == len(sample_ohlcv_data)
+        assert result.index.equals(sample_ohlcv_data.index)
+        assert result.notna().all()
+
+    def test_empty_input(self):
+        """빈 배열 처리"""
+        empty = np.array([], dtype=np.float64)
+
+        assert len(supertrend_kernel(empty, empty, empty)[0]) == 0
+        assert len(psar_kernel(empty, empty, 0.02, 0.02, 0.2)[0]) == 0
+        assert len(kama_kernel(empty, 20, 15, 50)) == 0
+
+
+def _reference_trailing_stop(close, atr, er, knn_pred, base_mult, adaptive_str,
+                             knn_weight, fast_length, slow_length):
+    """기존 전략 메서드의 봉별 루프"""
+    n = len(close)
+    long_stop, short_stop = np.zeros(n), np.zeros(n)
+    smooth_long, smooth_short = np.zeros(n), np.zeros(n)
+    trend = np.zeros(n, dtype=int)
+    fast_sc, slow_sc = 2.0 / (fast_length + 1), 2.0 / (slow_length + 1)
+    adaptive_mult = base_mult * (1 + (1 - er) * adaptive_str)
+
+    distance = atr[0] * adaptive_mult[0]
+    smooth_long[0] = long_stop[0] = close[0] - distance
+    smooth_short[0] = short_stop[0] = close[0] + distance
+    trend[0] = 1
+    for i in range(1, n):
+        adjustment = (knn_pred[i] - 0.5) * knn_weight
+        distance = atr[i] * adaptive_mult[i]
+        sc = (max(er[i], 0) * (fast_sc - slow_sc) + slow_sc) ** 2
+        smooth_long[i] = smooth_long[i - 1] + sc * (close[i] - distance * (1 - adjustment) - smooth_long[i - 1])
+        smooth_short[i] = smooth_short[i - 1] + sc * (close[i] + distance * (1 + adjustment) - smooth_short[i - 1])
+        long_stop[i] = max(smooth_long[i], long_stop[i - 1]) if close[i - 1] > long_stop[i - 1] else smooth_long[i]
+        short_stop[i] = min(smooth_short[i], short_stop[i - 1]) if close[i - 1] < short_stop[i - 1] else smooth_short[i]
+        if close[i] > short_stop[i - 1]:
+            trend[i] = 1
+        elif close[i] < long_stop[i - 1]:
+            trend[i] = -1
+        else:
+            trend[i] = trend[i - 1]
+    return long_stop, short_stop, trend
+
+
+class TestAdaptiveKernels:
+    """적응형 ER / KAMA / 트레일링 스탑 커널 테스트"""
+
+    def test_rolling_er_matches_window_sum(self, sample_ohlcv_data):
+        close = sample_ohlcv_data["Close"].values
+        expected = np.zeros(len(close))
+        for i in range(20, len(close)):
+            volatility = np.sum(np.abs(np.diff(close[i - 20:i + 1])))
+            expected[i] = abs(close[i] - close[i - 20]) / volatility
+
+        np.testing.assert_allclose(efficiency_ratio_kernel(close, 20), expected, rtol=1e-12)
+        assert (efficiency_ratio_kernel(np.full(50, 100.0), 10) == 0).all()
+        assert len(efficiency_ratio_kernel(close[:5], 20)) == 5
+
+    def test_kama_from_er_matches_kama_kernel(self, sample_ohlcv_data):
+        close = sample_ohlcv_data["Close"].values
+        result = kama_from_er_kernel(close, efficiency_ratio_kernel(close, 20), 15, 50)
+        np.testing.assert_allclose(result, kama_kernel(close, 20, 15, 50), rtol=1e-12)
+
+    def test_trailing_stop_matches_loop(self, sample_ohlcv_data):
+        df = sample_ohlcv_data
+        close = df["Close"].values
+        atr = ATR(df["High"], df["Low"], df["Close"], period=14).bfill().values
+        er = efficiency_ratio_kernel(close, 10)
+        knn = 0.5 + 0.3 * np.sin(np.arange(len(close)))
+
+        result = AdaptiveMA.trailing_stop(close, atr, er, knn, 2.5, 1.0, True, 0.2, 15, 50)
+        expected = _reference_trailing_stop(close, atr, er, knn, 2.5, 1.0, 0.2, 15, 50)
+        for got, want in zip(result, expected):
+            assert np.array_equal(got, want)
+
+    def test_memo_reuses_er_per_series_and_length(self, sample_ohlcv_data):
+        close = sample_ohlcv_data["Close"].values
+        memo = AdaptiveMA()
+
+        er = memo.efficiency_ratio(close, 20)
+        memo.kama(close, 20, 15, 50)
+        assert memo.efficiency_ratio(close, 20) is er
+        assert (memo.hits, memo.misses) == (2, 2)
+        assert not er.flags.writeable
+
+        memo.efficiency_ratio(close, 10)
+        memo.efficiency_ratio(close.copy(), 20)
+        assert memo.misses == 4
+
+
+def _reference_knn(close, k, lookback, feature_length, normalization="zscore"):
+    """Pine 스크립트와 같은 봉별 루프 (offset 순회 + 정렬)"""
+    n = len(close)
+    prediction, confidence = np.full(n, 0.5), np.zeros(n)
+    for i in range(lookback + feature_length - 1, n):
+        current = normalize_windows(close[None, i - feature_length + 1:i + 1], normalization)[0]
+        distances, outcomes = [], []
+        for offset in range(feature_length, lookback + 1):
+            end = i - offset
+            past = normalize_windows(close[None, end - feature_length + 1:end + 1], normalization)[0]
+            distances.append(np.sqrt(np.sum((past - current) ** 2)))
+            outcomes.append(1.0 if close[end + feature_length] > close[end] else 0.0)
+
+        nearest = np.argsort(distances, kind="stable")[:k]
+        weights = [1.0 / (distances[j] + 0.001) if distances[j] > 0 else 1.0 for j in nearest]
+        prediction[i] = sum(outcomes[j] * w for j, w in zip(nearest, weights)) / sum(weights)
+        confidence[i] = abs(sum(outcomes[j] for j in nearest) / k - 0.5) * 2
+    return prediction, confidence
+
+
+class TestKNNPatternMatching:
+    """KNN 패턴 매칭 (일괄 / 스트리밍) 테스트"""
+
+    @pytest.mark.parametrize("normalization", ["zscore", "minmax"])
+    def test_matches_reference_loop(self, sample_ohlcv_data, normalization):
+        close = sample_ohlcv_data["Close"].to_numpy()
+        prediction, confidence = knn_pattern_prediction(close, 5, 40, 4, normalization)
+        expected_pred, expected_conf = _reference_knn(close, 5, 40, 4, normalization)
+
+        np.testing.assert_allclose(prediction, expected_pred, rtol=1e-12)
+        np.testing.assert_allclose(confidence, expected_conf, rtol=1e-12)
+        assert (prediction[:43] == 0.5).all() and (confidence[:43] == 0).all()
+
+    def test_streaming_matches_batch(self, sample_ohlcv_data):
+        # 반올림으로 변동 없는 윈도우와 같은 거리(동점)를 만듦
+        close = np.round(sample_ohlcv_data["Close"].to_numpy(), 0)
+        prediction, confidence = knn_pattern_prediction(close, 7, 50, 5)
+
+        matcher = KNNPatternMatcher(7, 50, 5)
+        streamed = np.array([matcher.update(price) for price in close])
+        assert (streamed[:, 0] == prediction).all()
+        assert (streamed[:, 1] == confidence).all()
+
+    def test_causal(self, sample_ohlcv_data):
+        """미래 봉을 바꿔도 과거 예측은 그대로"""
+        close = sample_ohlcv_data["Close"].to_numpy().copy()
+        before = knn_pattern_prediction(close, 7, 50, 5)[0]
+        close[80:] *= 1.5
+        after = knn_pattern_prediction(close, 7, 50, 5)[0]
+        assert (before[:80] == after[:80]).all()
+        assert (before[80:] != after[80:]).any()
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            knn_pattern_prediction(np.ones(10), k=3, lookback=4, feature_length=5)
+        with pytest.raises(ValueError):
+            KNNPatternMatcher(normalization="rank")
+        # 후보가 k개보다 적으면 중립
+        prediction, _ = knn_pattern_prediction(np.arange(1.0, 50.0), k=10, lookback=8, feature_length=3)
+        assert (prediction == 0.5).all()
+
+
 class TestEdgeCases:
     """엣지 케이스 테스트"""
 
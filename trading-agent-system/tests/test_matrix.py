@@ -0,0 +1,118 @@
+"""
+Matrix Backtest Tests
+
+전략 × 데이터셋 매트릭스 실행기 테스트
+"""
+
+import json
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest import BacktestEngine, MatrixBacktestExecutor, ResultsTable
+
+from .test_backtest_engine import SimpleSMAStrategy
+
+
+CODE_STRATEGY = '''
+import pandas as pd
+from backtesting import Strategy
+
+
+class FastSMA(Strategy):
+    n1 = 5
+    n2 = 15
+
+    def init(self):
+        close = self.data.Close
+        self.fast = self.I(lambda x: pd.Series(x).rolling(self.n1).mean(), close)
+        self.slow = self.I(lambda x: pd.Series(x).rolling(self.n2).mean(), close)
+
+    def next(self):
+        if self.fast[-1] > self.slow[-1] and not self.position:
+            self.buy()
+        elif self.fast[-1] < self.slow[-1] and self.position:
+            self.position.close()
+'''
+
+
+def make_ohlcv(seed: int, n: int = 400, freq: str = "1h") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    high = close + np.abs(rng.normal(0, 0.3, n))
+    low = close - np.abs(rng.normal(0, 0.3, n))
+    return pd.DataFrame({
+        "Open": (high + low) / 2,
+        "High": high,
+        "Low": low,
+        "Close": close,
+        "Volume": rng.uniform(1e6, 5e6, n),
+    }, index=pd.date_range("2023-01-01", periods=n, freq=freq))
+
+
+@pytest.fixture
+def datasets():
+    return {
+        ("BTCUSDT", "1h"): make_ohlcv(1),
+        ("ETHUSDT", "1h"): make_ohlcv(2),
+        ("BTCUSDT", "4h"): make_ohlcv(3, n=200, freq="4h"),
+    }
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return BacktestEngine(results_dir=str(tmp_path))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_matrix_matches_single_runs(engine, datasets, max_workers):
+    """모든 셀이 BacktestEngine.run 단건 실행과 동일"""
+    executor = MatrixBacktestExecutor(engine, max_workers=max_workers)
+    table = executor.run(
+        {"sma": SimpleSMAStrategy, "code": CODE_STRATEGY, "broken": "raise RuntimeError('boom')"},
+        datasets
+    )
+
+    assert table.values.shape == (3, 3, len(table.metrics))
+    assert table.succeeded.tolist() == [[True] * 3, [True] * 3, [False] * 3]
+    assert all("boom" in table.errors[(2, d)] for d in range(3))
+
+    for (symbol, interval), df in datasets.items():
+        expected = engine.run(SimpleSMAStrategy, df, symbol=symbol, interval=interval)
+        cell = table.get("sma", symbol, interval)
+        assert cell.total_return == expected.total_return
+        assert cell.total_trades == expected.total_trades
+        assert cell.start_date == expected.start_date
+
+    code_returns = [m.total_return for m in table.strategy_metrics("code")]
+    single = [engine.run_from_code(CODE_STRATEGY, df).total_return for df in datasets.values()]
+    assert code_returns == single
+
+
+def test_table_views_and_serialisation(engine, datasets):
+    table = MatrixBacktestExecutor(engine, max_workers=1).run(
+        {"sma": SimpleSMAStrategy, "broken": "x = 1"}, datasets
+    )
+
+    sharpe = table.metric("sharpe_ratio")
+    top = table.top_cells("sharpe_ratio", n=2)
+    assert [c["metrics"]["sharpe_ratio"] for c in top] == sorted(sharpe[0], reverse=True)[:2]
+
+    frame = table.to_frame()
+    assert len(frame) == 3 and set(frame["strategy"]) == {"sma"}
+
+    engine_summary = engine.aggregate_results(table.strategy_metrics("sma"))
+    assert engine_summary["avg_sharpe"] == pytest.approx(np.mean(sharpe[0]))
+
+    payload = json.loads(json.dumps(table.to_dict()))
+    assert payload["values"][1][0][0] is None
+    assert "No Strategy subclass" in payload["errors"][0]["error"]
+    assert asdict(table.get("sma", "BTCUSDT", "4h"))["interval"] == "4h"
+
+
+def test_empty_matrix(engine):
+    table = MatrixBacktestExecutor(engine).run({}, {})
+    assert isinstance(table, ResultsTable)
+    assert table.values.shape == (0, 0, len(table.metrics))
@@ -0,0 +1,116 @@
+"""
+Result Store Tests
+
+백테스트 결과 저장소 (코드 해시 × 파라미터 × 데이터셋 × 엔진 버전) 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from src.backtest import (
+    BacktestEngine,
+    DatasetFingerprint,
+    MatrixBacktestExecutor,
+    ResultKey,
+    ResultStore,
+    run_fingerprint,
+)
+from src.backtest.strategy_cache import code_hash
+
+from .test_backtest_engine import SimpleSMAStrategy
+from .test_matrix import CODE_STRATEGY, make_ohlcv
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResultStore(tmp_path / "results.db")
+
+
+def make_key(params=None, rows=400, engine_version="v1"):
+    df = make_ohlcv(1, n=rows)
+    return ResultKey.make("abc", params, DatasetFingerprint.of(df, "BTCUSDT", "1h"), engine_version)
+
+
+def test_key_identity():
+    assert make_key({"a": 1, "b": 2}).digest == make_key({"b": 2, "a": 1}).digest
+    assert make_key({"a": 1}).digest != make_key({"a": 2}).digest
+    assert make_key(rows=300).digest != make_key().digest
+    assert make_key(engine_version="v2").digest != make_key().digest
+
+
+class OtherStrategy(SimpleSMAStrategy):
+    """다른 모듈 소스 (코드 해시가 다름)"""
+
+
+def test_run_fingerprint():
+    datasets = [("BTCUSDT", make_ohlcv(1)), ("ETHUSDT", make_ohlcv(2))]
+    fp = run_fingerprint(SimpleSMAStrategy, datasets)
+
+    assert fp == run_fingerprint(SimpleSMAStrategy, [(s, d.copy()) for s, d in datasets])
+    assert fp != run_fingerprint(OtherStrategy, datasets)
+    assert fp != run_fingerprint(SimpleSMAStrategy, datasets[:1])
+    assert fp != run_fingerprint(SimpleSMAStrategy, [datasets[0], ("ETHUSDT", make_ohlcv(2, n=401))])
+
+
+def test_put_get_round_trip(store):
+    key = make_key({"n": 5})
+    assert store.get(key) is None
+
+    store.put(key, {"total_return": 1.5, "sharpe_ratio": float("nan"), "total_trades": 3}, "sma")
+    metrics = store.get(key)
+
+    assert metrics["total_return"] == 1.5 and metrics["total_trades"] == 3
+    assert len(store) == 1
+    assert store.get_many([key, make_key({"n": 6})]) == {key: metrics}
+    assert store.query("sma")["sharpe_ratio"].isna().all()
+
+
+def test_engine_reuses_stored_result(tmp_path):
+    df = make_ohlcv(1)
+    engine = BacktestEngine(results_dir=str(tmp_path), result_store=tmp_path / "results.db")
+
+    first = engine.run(SimpleSMAStrategy, df, symbol="BTCUSDT", interval="1h")
+    assert engine.result_store.misses == 1 and len(engine.result_store) == 1
+
+    again = engine.run(SimpleSMAStrategy, df, symbol="BTCUSDT", interval="1h")
+    assert engine.result_store.hits == 1
+    assert again == first
+
+    # 파라미터나 엔진 설정이 다르면 새로 실행
+    engine.run(SimpleSMAStrategy, df, symbol="BTCUSDT", interval="1h", strategy_params={"n1": 5})
+    BacktestEngine(commission=0.002, result_store=engine.result_store).run(
+        SimpleSMAStrategy, df, symbol="BTCUSDT", interval="1h"
+    )
+    assert len(engine.result_store) == 3
+
+
+def test_matrix_skips_stored_cells(tmp_path):
+    datasets = {("BTCUSDT", "1h"): make_ohlcv(1), ("ETHUSDT", "1h"): make_ohlcv(2)}
+    engine = BacktestEngine(results_dir=str(tmp_path), result_store=tmp_path / "results.db")
+    executor = MatrixBacktestExecutor(engine, max_workers=1)
+
+    first = executor.run({"sma": SimpleSMAStrategy, "code": CODE_STRATEGY}, datasets)
+    assert len(engine.result_store) == 4
+
+    hits = engine.result_store.hits
+    second = executor.run({"sma": SimpleSMAStrategy, "code": CODE_STRATEGY}, datasets)
+    assert engine.result_store.hits - hits == 4
+    assert (second.values == first.values).all()
+
+    # 코드 문자열 전략은 코드 해시로 저장됨
+    assert set(engine.result_store.query()["code_hash"]) >= {code_hash(CODE_STRATEGY)}
+
+
+def test_aggregate_matches_csv_columns(store):
+    df = make_ohlcv(1)
+    for n, ret in ((5, 1.0), (10, -2.0)):
+        for symbol in ("BTCUSDT", "ETHUSDT"):
+            key = ResultKey.make("abc", {"n": n}, DatasetFingerprint.of(df, symbol, "1h"), "v1")
+            store.put(key, {"total_return": ret, "sharpe_ratio": ret / 2, "total_trades": 4}, "sma")
+
+    summary = store.aggregate("sma")
+    assert list(summary["n"]) == [5, 10]
+    assert list(summary["avg_return"]) == [1.0, -2.0]
+    assert list(summary["consistency_rate"]) == [100.0, 0.0]
+    assert list(summary["total_tests"]) == [2, 2]
+    assert isinstance(summary, pd.DataFrame)
@@ -0,0 +1,197 @@
+"""
+Parameter Search Tests
+
+탐색 전략 / Study / TrialStore 테스트
+"""
+
+import math
+
+import pytest
+
+from src.backtest.search import (
+    GridSearch,
+    Hyperband,
+    RandomSearch,
+    Study,
+    SuccessiveHalving,
+    TPESearch,
+    TrialStore,
+    budget_rungs,
+    make_searcher,
+    params_key,
+    space_size,
+)
+
+
+SPACE = {
+    "a": list(range(10)),
+    "b": list(range(10)),
+    "c": list(range(5)),
+}
+
+
+def score(params):
+    return -(params["a"] - 7) ** 2 - (params["b"] - 3) ** 2 - (params["c"] - 2) ** 2
+
+
+def evaluate(proposals):
+    """budget이 작을수록 점수에 (조합마다 다른) 잡음이 섞이는 목적 함수"""
+    return [
+        (score(p) - (10 - budget) * 0.05 * ((p["a"] * 7 + p["b"] * 3) % 5), {"budget": budget})
+        for p, budget in proposals
+    ]
+
+
+def run(searcher, store=None):
+    study = Study(searcher, store)
+    best = study.optimize(evaluate)
+    return study, best
+
+
+def test_budget_rungs():
+    assert budget_rungs(2, 10, 3) == [2, 6, 10]
+    assert budget_rungs(10, 10) == [10]
+    with pytest.raises(ValueError):
+        budget_rungs(0, 10)
+
+
+def test_grid_search_evaluates_every_combination():
+    study, best = run(GridSearch(SPACE, max_budget=10))
+
+    assert len(study.trials) == space_size(SPACE) == 500
+    assert best.params == {"a": 7, "b": 3, "c": 2}
+
+
+def test_random_search_is_unique_and_respects_constraint():
+    searcher = RandomSearch(
+        SPACE, n_trials=60, max_budget=10, batch_size=7, seed=0,
+        constraint=lambda p: p["a"] != p["b"]
+    )
+    study, _ = run(searcher)
+
+    keys = [params_key(t.params) for t in study.trials]
+    assert len(keys) == len(set(keys)) == 60
+    assert all(t.params["a"] != t.params["b"] for t in study.trials)
+
+
+def test_random_search_stops_when_space_exhausted():
+    study = Study(RandomSearch({"x": [1, 2, 3]}, n_trials=10, seed=0))
+    study.optimize(lambda proposals: [(p["x"], {}) for p, _ in proposals])
+    assert sorted(t.params["x"] for t in study.trials) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_tpe_finds_optimum_with_fraction_of_grid(seed):
+    study, best = run(TPESearch(SPACE, n_trials=60, max_budget=10, seed=seed))
+
+    assert len(study.trials) == 60
+    assert best.params == {"a": 7, "b": 3, "c": 2}
+
+
+def test_successive_halving_promotes_top_fraction():
+    searcher = SuccessiveHalving(SPACE, n_trials=27, min_budget=2, max_budget=10, eta=3, seed=0)
+    study, best = run(searcher)
+
+    budgets = [t.budget for t in study.trials]
+    assert budgets.count(2) == 27
+    assert budgets.count(6) == 9
+    assert budgets.count(10) == 3
+    assert study.budget_used == 27 * 2 + 9 * 6 + 3 * 10
+
+    # 승격된 조합은 이전 단계 상위 조합
+    rung2 = sorted((t for t in study.trials if t.budget == 2), key=lambda t: t.value, reverse=True)
+    promoted = {params_key(t.params) for t in study.trials if t.budget == 6}
+    assert promoted == {params_key(t.params) for t in rung2[:9]}
+
+    assert best.budget == 10
+    assert best.value == max(t.value for t in study.trials if t.budget == 10)
+
+
+def test_hyperband_brackets():
+    searcher = Hyperband(SPACE, min_budget=2, max_budget=10, eta=3, seed=0)
+    assert searcher.brackets == [(9, [2, 6, 10]), (5, [6, 10]), (3, [10])]
+
+    study, best = run(searcher)
+    assert best is not None and best.budget == 10
+    keys = [params_key(t.params, t.budget) for t in study.trials]
+    assert len(keys) == len(set(keys))
+    assert study.budget_used < space_size(SPACE) * 10
+
+
+def test_failed_and_nan_trials_are_never_promoted():
+    def flaky(proposals):
+        return [
+            (None if p["x"] == 0 else (math.nan if p["x"] == 1 else float(p["x"])), {})
+            for p, _ in proposals
+        ]
+
+    searcher = SuccessiveHalving({"x": [0, 1, 2, 3]}, n_trials=4, min_budget=1, max_budget=2, eta=2, seed=0)
+    study = Study(searcher)
+    best = study.optimize(flaky)
+
+    assert {t.params["x"] for t in study.trials if t.budget == 2} == {3, 2}
+    assert best.params == {"x": 3}
+
+
+def test_study_resumes_from_trial_store(tmp_path):
+    path = tmp_path / "trials.jsonl"
+
+    reference, ref_best = run(make_searcher("tpe", SPACE, max_budget=10, n_trials=30, seed=5))
+
+    calls = {"n": 0}
+
+    def interrupted(proposals):
+        calls["n"] += 1
+        if calls["n"] > 12:
+            raise KeyboardInterrupt
+        return evaluate(proposals)
+
+    with pytest.raises(KeyboardInterrupt):
+        Study(make_searcher("tpe", SPACE, max_budget=10, n_trials=30, seed=5), TrialStore(path)).optimize(interrupted)
+    assert len(TrialStore(path).load()) == 12
+
+    resumed = Study(make_searcher("tpe", SPACE, max_budget=10, n_trials=30, seed=5), TrialStore(path))
+    best = resumed.optimize(evaluate)
+
+    assert resumed.n_replayed == 12
+    assert resumed.n_evaluated == 18
+    assert [t.params for t in resumed.trials] == [t.params for t in reference.trials]
+    assert best.params == ref_best.params
+    assert best.attrs == {"budget": 10}
+
+
+def test_trial_store_round_trips_tuple_scores(tmp_path):
+    store = TrialStore(tmp_path / "trials.jsonl")
+    searcher = GridSearch({"x": [1, 2]}, max_budget=3)
+    study = Study(searcher, store)
+    study.optimize(lambda proposals: [((p["x"], 0.5), {"n": p["x"]}) for p, _ in proposals])
+
+    loaded = store.load()
+    assert loaded[params_key({"x": 2}, 3)] == ((2, 0.5), {"n": 2})
+
+    replay = Study(GridSearch({"x": [1, 2]}, max_budget=3), store)
+    best = replay.optimize(lambda proposals: pytest.fail("should replay"))
+    assert best.value == (2, 0.5)
+
+
+def test_trial_store_discards_other_fingerprint(tmp_path):
+    path = tmp_path / "trials.jsonl"
+
+    def run(fingerprint):
+        study = Study(GridSearch({"x": [1, 2]}, max_budget=3), TrialStore(path, fingerprint))
+        study.optimize(lambda proposals: [(p["x"], {}) for p, _ in proposals])
+        return study
+
+    assert run("data-v1").n_evaluated == 2
+    assert run("data-v1").n_replayed == 2
+
+    # 데이터셋 / 전략 코드가 바뀌면 다시 평가
+    changed = run("data-v2")
+    assert (changed.n_replayed, changed.n_evaluated) == (0, 2)
+    assert len(TrialStore(path, "data-v2").load()) == 2
+    assert TrialStore(path, "data-v1").load() == {}
+
+
+def test_make_searcher_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        make_searcher("annealing", SPACE)
@@ -0,0 +1,91 @@
+"""
+Strategy Cache Tests
+
+전략 코드 컴파일 캐시 테스트
+"""
+
+import pytest
+
+from src.backtest import BacktestEngine, StrategyCache
+from src.backtest.strategy_cache import code_hash
+
+
+STRATEGY_CODE = '''
+import pandas as pd
+from backtesting import Strategy
+
+LOADS.append(1)
+
+
+class CachedStrategy(Strategy):
+    def init(self):
+        self.ema = self.I(lambda x: pd.Series(x).ewm(span=12, adjust=False).mean(), self.data.Close)
+
+    def next(self):
+        if self.data.Close[-1] > self.ema[-1]:
+            if not self.position:
+                self.buy()
+        elif self.position:
+            self.position.close()
+'''
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """전략 코드가 실행될 때마다 기록되는 목록 (builtins로 주입)"""
+    import builtins
+    calls: list[int] = []
+    monkeypatch.setattr(builtins, "LOADS", calls, raising=False)
+    return calls
+
+
+def test_repeated_run_from_code_skips_import(sample_ohlcv_data, loads, tmp_path):
+    """같은 코드 반복 실행 시 모듈 로드 1회, 결과 동일"""
+    engine = BacktestEngine(results_dir=str(tmp_path), strategy_cache=StrategyCache())
+
+    first = engine.run_from_code(STRATEGY_CODE, sample_ohlcv_data)
+    second = engine.run_from_code(STRATEGY_CODE, sample_ohlcv_data, symbol="ETHUSDT")
+
+    assert loads == [1]
+    assert first.strategy_name == second.strategy_name == "CachedStrategy"
+    assert first.total_return == second.total_return
+    assert engine.load_strategy_class(STRATEGY_CODE) is engine.load_strategy_class(STRATEGY_CODE)
+    assert engine.strategy_cache.get_stats()["misses"] == 1
+
+
+def test_run_from_file_shares_cache(sample_ohlcv_data, loads, tmp_path):
+    """파일 내용이 같으면 run_from_code와 같은 항목 사용"""
+    strategy_file = tmp_path / "cached.py"
+    strategy_file.write_text(STRATEGY_CODE, encoding="utf-8")
+    engine = BacktestEngine(results_dir=str(tmp_path), strategy_cache=StrategyCache())
+
+    engine.run_from_file(str(strategy_file), sample_ohlcv_data)
+    engine.run_from_code(STRATEGY_CODE, sample_ohlcv_data)
+    assert loads == [1]
+
+    # 파일이 바뀌면 새 항목
+    strategy_file.write_text(STRATEGY_CODE + "\n# v2\n", encoding="utf-8")
+    engine.run_from_file(str(strategy_file), sample_ohlcv_data)
+    assert loads == [1, 1]
+
+
+def test_lru_and_bytecode_store(loads, tmp_path):
+    """LRU 제거 후 디스크 바이트코드로 재컴파일 생략"""
+    cache = StrategyCache(maxsize=1, bytecode_dir=tmp_path)
+    cache.load(STRATEGY_CODE)
+    cache.load("x = 1")
+    assert len(cache) == 1
+    assert (tmp_path / f"{code_hash(STRATEGY_CODE)}.bin").exists()
+
+    entry = cache.load(STRATEGY_CODE)
+    assert loads == [1, 1]
+    assert cache.disk_hits == 1
+    assert entry.namespace["CachedStrategy"].__name__ == "CachedStrategy"
+
+
+def test_missing_strategy_class_is_not_remembered(tmp_path):
+    """클래스 탐지 실패는 매번 같은 예외"""
+    engine = BacktestEngine(results_dir=str(tmp_path), strategy_cache=StrategyCache())
+    for _ in range(2):
+        with pytest.raises(ValueError, match="No Strategy subclass found"):
+            engine.load_strategy_class("class NotAStrategy:\n    pass\n")
@@ -2,21 +2,27 @@
 파라미터 최적화 결과 시각화
 
 최적화 결과를 그래프로 시각화하여 파라미터별 성과를 분석합니다.
+결과 저장소(backtest_results.db)가 있으면 CSV 대신 저장소에서 파라미터별 평균을 조회합니다.
 """
 
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).parent / "trading-agent-system"))
+
+from src.backtest.result_store import ResultStore
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'AppleGothic'  # macOS
 plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
 
 
 def load_optimization_results(results_dir: Path):
-    """최적화 결과 CSV 파일 로드"""
+    """최적화 결과 로드 (결과 저장소 우선, 없으면 CSV 파일)"""
 
     strategies = {
         'AdaptiveMLTrailingStop': 'Adaptive ML',
@@ -26,7 +32,18 @@ def load_optimization_results(results_dir: Path):
 
     results = {}
 
+    store_file = results_dir / "backtest_results.db"
+    store = ResultStore(store_file) if store_file.exists() else None
+
     for strategy_name, short_name in strategies.items():
+        if store is not None:
+            # 최신 코드 버전의 파라미터 조합별 데이터셋 평균
+            df = store.aggregate(strategy_name)
+            if not df.empty:
+                results[short_name] = df
+                print(f"Loaded: {store_file.name} [{strategy_name}] ({len(df)} rows)")
+                continue
+
         csv_file = results_dir / f"optimization_results_{strategy_name}.csv"
 
         if csv_file.exists():